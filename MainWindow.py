@@ -1,22 +1,24 @@
 import sys, os
-import numpy as np
-import matlab.engine
-from pint import UnitRegistry, PintError
-from PySide2.QtWidgets import QApplication, QMainWindow, QMessageBox
-from PySide2.QtCore import QThread, Slot
-from PySide6.QtCore import Qt, QCoreApplication
-from PySide2.QtWidgets import QTableWidgetItem
+import threading
+from PySide2.QtWidgets import QApplication, QMainWindow, QMessageBox, QLabel, QProgressDialog
+from PySide2.QtCore import QThread, Slot, QTimer, Qt, QCoreApplication
 from PySide2.QtWidgets import QFileDialog
 
-from sim.SaveData import SaveMat 
-from sim.MotorOptimizer import MotorOpt
+# pymoo, pandas and scipy (MotorOpt, SaveMat, Checkpoint) and pint are imported on first use, see import_report.py
 from sim.MotorModel import MotorCalcs_Vectorized
+from sim.MotorDesign import NumpyEngine
+from sim.MatlabEngine import start_matlab_engine, start_matlab_engine_async, set_shared_engine
+from sim.EnginePool import EnginePool
+from sim.EvalCache import EvalCache
 from gui.interface import Ui_UserInterface
 from gui.optimization_worker import OptimizationWorker
+from gui.export_worker import ExportWorker
+from gui.result_plots import ResultPlots
+from gui.live_pareto import LiveParetoPlot
+from gui.results_table_model import ResultsTableView
 from utils import state_manager
 from utils import input_parser
 from utils import material_manager
-import tkinter as tk
 import traceback
 
 # Ensure icons and pixmaps are scaled correctly on large monitors
@@ -32,19 +34,29 @@ class MainWindow(QMainWindow):
 
         self.optimization_thread = None
         self.optimization_worker = None
-        self.ureg = UnitRegistry()
-
-        try:
-            print("Starting MATLAB engine...")
-            self.matlab_engine = matlab.engine.start_matlab()
-            project_root = os.path.dirname(os.path.abspath(__file__)) 
-            matlab_path = os.path.join(project_root, 'matlab')
-            self.matlab_engine.addpath(matlab_path, nargout=0)
-            print("MATLAB engine started.")
-        except Exception as e:
-            QMessageBox.critical(self, "MATLAB Error", f"Could not start MATLAB engine: {e}")
-            self.matlab_engine = None
-            self.ui.Execution.setEnabled(False)
+        self.export_thread = None # SaveMat of the finished optimization, uses the model engine until it is done
+        self.export_worker = None
+        self.export_progress = None
+        self.export_file_path = None
+        # the unit conversion factors are built in the background, before the first run needs them
+        threading.Thread(target=input_parser.get_conversion_factors, daemon=True).start()
+
+        # MATLAB boots in the background, the window is usable right away.
+        # Execution and the plot buttons are enabled once the engine is ready (see _poll_matlab_engine)
+        self.matlab_engine = None
+        self.model_engine = None # engine that evaluates the motor model: MATLAB when available, otherwise the NumPy port
+        self.engine_pool = None # extra engines for nprocesses > 1, see _update_engine_pool
+        self.eval_cache = EvalCache(None) # evaluated designs, kept between runs of this session
+        self.engine_status_label = QLabel()
+        self.ui.statusbar.addPermanentWidget(self.engine_status_label)
+        self._set_engine_buttons_enabled(False)
+
+        print("Starting MATLAB engine...")
+        self._set_engine_status("Engine: starting MATLAB...")
+        self.matlab_engine_future = start_matlab_engine_async()
+        self.matlab_engine_timer = QTimer(self)
+        self.matlab_engine_timer.timeout.connect(self._poll_matlab_engine)
+        self.matlab_engine_timer.start(250)
 
         # Initialize derived material properties on the instance
         self.MagnetBr_T = 0.0
@@ -52,11 +64,22 @@ class MainWindow(QMainWindow):
         self.PresentBLaminationBackIron_T = 0.0
         self._update_all_material_properties() # Initial update
 
-        # Table output (Simulation Tab)
+        # Table output (Simulation Tab), the rows are kept in a NumPy buffer and only the visible ones are drawn
         self.table_column_data_keys = [] 
+        self.results_view = ResultsTableView(self.ui.scrollAreaWidgetContents_tab_3)
+        self.results_view.setSizePolicy(self.ui.tableWidget.sizePolicy())
+        self.ui.tab_3_gridLayout_4.replaceWidget(self.ui.tableWidget, self.results_view)
+        self.ui.tableWidget.deleteLater()
+        self.live_front = LiveParetoPlot(self.ui.scrollAreaWidgetContents_tab_3) # non-dominated designs of the running optimization
+        self.ui.tab_3_gridLayout_4.addWidget(self.live_front, 5, 0, 1, 2)
 
         # Plotting Inputs (Results Tab)
-        self.recent_excel = None # more recent excel file generated by simulation tab (where plotting tab will source its info)
+        self.recent_excel = None # more recent excel file generated by simulation tab
+        self.results_table = None # table of the most recent results (returned by SaveMat), the plots are drawn from it
+        self.checkpoint_path = os.path.join(os.path.expanduser("~"), ".bldc_optimizer_checkpoint.pkl") # state of the running optimization, to resume it after a crash
+        self.result_plots = ResultPlots(self.ui.scrollAreaWidgetContents_tab_4)
+        self.ui.gridLayout_8.addWidget(self.result_plots, 0, 1, 1, 1)
+        self.ui.gridLayout_8.setColumnStretch(1, 1)
         self.plot_checkboxes = [
             (self.ui.MinTrqMargin_Percent, "MinTrqMargin_Percent"),
             (self.ui.MeanTrqMargin_Percent, "MeanTrqMargin_Percent"),
@@ -147,10 +170,7 @@ class MainWindow(QMainWindow):
         return num_obj
 
 
-    def _setup_results_table(self, num_objectives):
-        self.ui.tableWidget.clearContents()
-        self.ui.tableWidget.setRowCount(0)
-
+    def _setup_results_table(self, num_objectives, batch_eval=True):
         base_headers = ["Gen", "Evals", "NDS", "CV Min", "CV Avg"]
         base_data_keys = ["n_gen", "n_eval", "n_nds", "cv_min", "cv_avg"]
 
@@ -160,40 +180,27 @@ class MainWindow(QMainWindow):
             obj_headers.extend([f"F{i+1} Min", f"F{i+1} Max", f"F{i+1} Avg"])
             obj_data_keys.extend([f"obj{i+1}_min", f"obj{i+1}_max", f"obj{i+1}_avg"])
 
-        all_headers = base_headers + obj_headers
-        self.table_column_data_keys = base_data_keys + obj_data_keys # Store for use in _append_results_table_row
+        # seconds spent per generation, evaluation time is per design. A batch evaluation only gives the mean per
+        # design (see sim/Timings.py), its total is shown instead of the spread
+        if batch_eval:
+            timing_headers = ["Eval Mean (s)", "Eval (s)", "Survival (s)", "Mating (s)", "Callback (s)"]
+            timing_data_keys = ["eval_mean_s", "eval_s", "survival_s", "mating_s", "callback_s"]
+        else:
+            timing_headers = ["Eval Mean (s)", "Eval P95 (s)", "Eval Max (s)", "Survival (s)", "Mating (s)", "Callback (s)"]
+            timing_data_keys = ["eval_mean_s", "eval_p95_s", "eval_max_s", "survival_s", "mating_s", "callback_s"]
 
-        self.ui.tableWidget.setColumnCount(len(all_headers))
-        self.ui.tableWidget.setHorizontalHeaderLabels(all_headers)
-        self.ui.tableWidget.resizeColumnsToContents() # Optional: auto-resize
+        all_headers = base_headers + obj_headers + timing_headers
+        self.table_column_data_keys = base_data_keys + obj_data_keys + timing_data_keys # Store for use in _append_results_table_rows
+        self.results_view.set_columns(all_headers, self.table_column_data_keys)
+        self.live_front.set_objectives([f"F{i+1}" for i in range(num_objectives)])
 
-    @Slot(dict)
-    def _append_results_table_row(self, data_dict):
+    @Slot(list)
+    def _append_results_table_rows(self, rows):
+        """Rows of the generations since the last batch of the progress callback."""
         if not self.table_column_data_keys: # Headers not set up yet
             print("Warning: Table headers/keys not set up, skipping row append.")
             return
-
-        row_position = self.ui.tableWidget.rowCount()
-        self.ui.tableWidget.insertRow(row_position)
-
-        for col_idx, data_key in enumerate(self.table_column_data_keys):
-            value = data_dict.get(data_key)
-            item_text = ""
-            if value is None or (isinstance(value, float) and np.isnan(value)):
-                item_text = "N/A"
-            elif isinstance(value, float):
-                # Smart formatting for floats
-                if abs(value) < 1e-3 and value != 0.0 or abs(value) > 1e4:
-                    item_text = f"{value:.3e}"
-                else:
-                    item_text = f"{value:.4f}"
-            else:
-                item_text = str(value)
-            
-            table_item = QTableWidgetItem(item_text)
-            self.ui.tableWidget.setItem(row_position, col_idx, table_item)
-        
-        self.ui.tableWidget.scrollToBottom() # Keep last row visible
+        self.results_view.append_rows(rows) # Keeps the last row visible unless the user scrolled up
 
 
     def _connect_signals(self):
@@ -243,10 +250,8 @@ class MainWindow(QMainWindow):
         style_sheet = f"* {{ font-size: {size}pt; }}"
         self.setStyleSheet(style_sheet)
         print(f"Application font size forced to {size}pt using stylesheet.")
-        vertical_header = self.ui.tableWidget.verticalHeader()
-        vertical_header.setSectionResizeMode(QHeaderView.ResizeToContents)
-        self.ui.tableWidget.resizeColumnsToContents()
-        self.ui.tableWidget.resizeRowsToContents()
+        self.results_view.fit_rows_to_font()
+        self.results_view.resizeColumnsToContents()
 
 
     def _get_plot_selections(self):
@@ -265,8 +270,8 @@ class MainWindow(QMainWindow):
     @Slot()
     def _handle_parallel_plot(self):
         """Handles the Parallel Plot button click."""
-        if not self.matlab_engine:
-            QMessageBox.critical(self, "MATLAB Error", "MATLAB engine is not available.")
+        if self.results_table is None:
+            QMessageBox.warning(self, "No Results", "Run an optimization before plotting.")
             return
 
         try:
@@ -275,17 +280,15 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Selection Empty", "Please select at least one parameter to plot.")
                 return
 
-            print(f"Calling MATLAB UI_ParallelPlot_MATLAB with: {coordvars}")
-            self.matlab_engine.UI_ParallelPlot_MATLAB(coordvars, self.recent_excel, nargout=0)
-            QMessageBox.information(self, "Plotting", "Sent data to MATLAB for parallel plot.")
+            self.result_plots.show_parallel(self.results_table, coordvars)
         except Exception as e:
             QMessageBox.critical(self, "Plotting Error", f"An error occurred while generating the plot:\n{e}")
 
     @Slot()
     def _handle_3d_plot(self):
         """Handles the 3D Plot button click."""
-        if not self.matlab_engine:
-            QMessageBox.critical(self, "MATLAB Error", "MATLAB engine is not available.")
+        if self.results_table is None:
+            QMessageBox.warning(self, "No Results", "Run an optimization before plotting.")
             return
 
         try:
@@ -294,13 +297,53 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Selection Error", "For 3D plots, please select exactly 3 parameters.")
                 return
 
-            print(f"Calling MATLAB UI_3DPlot_MATLAB with: {coordvars}")
-            self.matlab_engine.UI_3DPlot_MATLAB(coordvars, self.recent_excel, nargout=0)
-            QMessageBox.information(self, "Plotting", "Sent data to MATLAB for 3D plot.")
+            self.result_plots.show_3d(self.results_table, coordvars)
         except Exception as e:
             QMessageBox.critical(self, "Plotting Error", f"An error occurred while generating the plot:\n{e}")
 
 
+    def _set_engine_status(self, text):
+        self.engine_status_label.setText(text)
+        self.ui.statusbar.showMessage(text, 5000)
+
+    def _set_engine_buttons_enabled(self, enabled):
+        """Execution needs a model engine."""
+        self.ui.Execution.setEnabled(enabled)
+
+    @Slot()
+    def _poll_matlab_engine(self):
+        """Picks up the MATLAB engine once the background start finished, or falls back to the NumPy model."""
+        if not self.matlab_engine_future.done():
+            return
+        self.matlab_engine_timer.stop()
+        try:
+            self.matlab_engine = self.matlab_engine_future.result()
+            set_shared_engine(self.matlab_engine) # plotting helpers reuse this engine instead of starting another
+            print("MATLAB engine started.")
+            self._set_engine_status("Engine: MATLAB")
+        except Exception as e:
+            QMessageBox.warning(self, "MATLAB Error", f"Could not start MATLAB engine: {e}\n\nThe NumPy motor model will be used instead.")
+            self.matlab_engine = None
+            self._set_engine_status("Engine: NumPy model (MATLAB not available)")
+
+        self.model_engine = self.matlab_engine if self.matlab_engine else NumpyEngine()
+        self.eval_cache.engine = self.engine_pool or self.model_engine
+        if not (self.optimization_thread and self.optimization_thread.isRunning()):
+            self._set_engine_buttons_enabled(True)
+
+    def _update_engine_pool(self, nprocesses):
+        """Keeps a pool of `nprocesses` engines (reusing the main engine) for the optimizer, or none for a single process."""
+        if self.engine_pool and self.engine_pool.size == nprocesses:
+            return
+        if self.engine_pool:
+            self.engine_pool.quit()
+            self.engine_pool = None
+        if nprocesses > 1:
+            engine_factory = start_matlab_engine if self.matlab_engine else NumpyEngine
+            print(f"Starting an engine pool with {nprocesses} engines...")
+            self.engine_pool = EnginePool(engine_factory, nprocesses, engines=[self.model_engine])
+        self.eval_cache.engine = self.engine_pool or self.model_engine
+
     def _update_all_material_properties(self):
         """Helper to update all material properties stored on the instance."""
         material_manager.update_magnet_br_property(self)
@@ -342,20 +385,39 @@ class MainWindow(QMainWindow):
 
     @Slot()
     def start_optimization(self):
-        if not self.matlab_engine:
-            QMessageBox.critical(self, "Error", "MATLAB engine is not running. Cannot start optimization.")
+        if not self.model_engine:
+            QMessageBox.critical(self, "Error", "Motor model engine is not available. Cannot start optimization.")
             return
 
         if self.optimization_thread and self.optimization_thread.isRunning():
             QMessageBox.warning(self, "Busy", "Optimization is already running.")
             return
 
+        if self.export_thread and self.export_thread.isRunning():
+            QMessageBox.warning(self, "Busy", "The results of the last optimization are still being exported.")
+            return
+
+        from sim.MotorOptimizer import MotorOpt
+        from sim.Checkpoint import CheckpointKey, CheckpointGeneration
+
         try:
             self._update_all_material_properties()
             parameters_pymoo = input_parser.create_pymoo_parameters_from_ui(self)
             optimization_conf = input_parser.read_opt_config_from_ui(self)
+            self._update_engine_pool(optimization_conf.get("nprocesses", 1))
             other_opt_args = input_parser.get_other_opt_args(self)
 
+            # An optimization that did not finish (crash, window closed, stopped) can be continued if the inputs are the same
+            optimization_conf["Checkpoint"] = self.checkpoint_path
+            key = CheckpointKey(parameters_pymoo, optimization_conf, self.MagnetBr_T, self.MaxBMagnetIron_T, self.PresentBLaminationBackIron_T)
+            resume_gen = CheckpointGeneration(self.checkpoint_path, key)
+            if resume_gen is not None:
+                reply = QMessageBox.question(self, "Resume Optimization",
+                                             f"An unfinished optimization with the same inputs was found (generation {resume_gen}).\n"
+                                             "Do you want to continue it?",
+                                             QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+                optimization_conf["Resume"] = reply == QMessageBox.Yes
+
             # --- Store for SaveMat ---
             self.motor_calcs_func_ref = MotorCalcs_Vectorized # Store reference to the function
             self.motor_params_pymoo_ref = parameters_pymoo  # Store the parameters
@@ -366,9 +428,9 @@ class MainWindow(QMainWindow):
             if num_objectives <= 0: # Add check based on helper
                  QMessageBox.warning(self, "Input Error", "No objectives selected for optimization. Please check optimization configuration.")
                  return
-            self._setup_results_table(num_objectives)
+            self._setup_results_table(num_objectives, optimization_conf.get("BatchEval", True))
 
-        except (ValueError, AttributeError, PintError) as e:
+        except (ValueError, AttributeError) as e:
             QMessageBox.warning(self, "Input Error", f"Error reading inputs: {e}")
             return
 
@@ -390,7 +452,8 @@ class MainWindow(QMainWindow):
         self.optimization_thread = QThread()
         self.optimization_worker.moveToThread(self.optimization_thread)
 
-        self.optimization_worker.table_update_data.connect(self._append_results_table_row)
+        self.optimization_worker.table_update_batch.connect(self._append_results_table_rows)
+        self.optimization_worker.front_update.connect(self.live_front.update_front)
         self.optimization_thread.started.connect(self.optimization_worker.run_optimization)
         self.optimization_worker.progress_signal.connect(self.update_progress)
         self.optimization_worker.finished_signal.connect(self.on_optimization_finished)
@@ -408,7 +471,7 @@ class MainWindow(QMainWindow):
     def _on_thread_finished_cleanup(self):
         """Called when the optimization thread actually finishes (either normally or due to error/stop)."""
         print("Optimization thread has finished. Performing cleanup.")
-        self.ui.Execution.setEnabled(True)
+        self.ui.Execution.setEnabled(self.export_thread is None) # enabled by the export otherwise
         self.ui.stopButton.setEnabled(False)
         # ProgressBar is handled by on_optimization_finished or on_optimization_error
         self._cleanup_optimization_references()
@@ -426,7 +489,10 @@ class MainWindow(QMainWindow):
 
     @Slot(object)
     def on_optimization_finished(self, results):
+        from sim.Checkpoint import RemoveCheckpoint
         print("Optimization finished successfully. Results received in GUI.")
+        RemoveCheckpoint(self.checkpoint_path) # nothing left to resume
+        print(f"Evaluation cache: {self.eval_cache.stats()}")
         # self.ui.progressBar.setValue(self.ui.progressBar.maximum()) # Ensure progress bar is full
 
         if results is None:
@@ -439,7 +505,7 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Result", "Optimization finished, but no design variables (results.X) were found.")
         else:
             QMessageBox.information(self, "Result", f"Optimization finished. Found {len(results.F)} solution(s).")
-            if self.matlab_engine:
+            if self.model_engine:
                 try:
                     # ------------------- NEW CODE: Use QFileDialog -------------------
                     # Define default file name and filter
@@ -449,17 +515,14 @@ class MainWindow(QMainWindow):
                         self,
                         "Save Optimization Results",
                         "optimization_results.xlsx", # Default file name
-                        "Excel Files (*.xlsx);;All Files (*)",
+                        "Excel Files (*.xlsx);;Parquet Files (*.parquet);;Feather Files (*.feather);;CSV Files (*.csv);;All Files (*)",
                         options=options
                     )
 
-                    # If the user cancels the dialog, file_path will be empty
+                    # If the user cancels the dialog, file_path will be empty (the results are still kept for plotting)
                     if not file_path:
                         print("Save operation cancelled by user.")
-                        QMessageBox.information(self, "Save Cancelled", "The results were not saved.")
-                        return
-                    else:
-                        self.recent_excel = file_path
+                        file_path = None
 
                     print("Attempting to automatically save optimization results...")
                     mag_br, max_b_mag, pres_b_lam, _, _, _, _, _ = input_parser.get_other_opt_args(self)
@@ -467,18 +530,9 @@ class MainWindow(QMainWindow):
                         print("Error: References for SaveMat (calc_function or pymoo_params_dict) are missing.")
                         QMessageBox.warning(self, "Save Error", "Could not save results: Internal data missing for SaveMat.")
                         return
-                    
-                    # Pass the new file_path variable to the function
-                    SaveMat(self.matlab_engine, results.X, results.F, results.G, self.motor_optimization_conf, self.motor_params_pymoo_ref, mag_br, max_b_mag, pres_b_lam, file_path)
-                    
-                    print(f"Optimization results successfully saved to: {file_path}")
-                    
-                    # Direct User to begin plotting in results tab
-                    QMessageBox.information(self, "Save Complete, Plotting Ready",
-                                          f"Optimization complete and results are saved to:\n{file_path}\n\n"
-                                          "You can now go to the 'Results' tab to generate plots.")
-                    if hasattr(self.ui, 'tab_4'):
-                        self.ui.tabWidget.setCurrentWidget(self.ui.tab_4)
+
+                    # SaveMat runs in a worker thread, the messages and the switch to the Results tab follow in on_export_finished
+                    self._start_export(results, (mag_br, max_b_mag, pres_b_lam), file_path)
 
                 except AttributeError as ae:
                     print(f"Error preparing data for SaveMat: Missing attribute - {ae}")
@@ -488,8 +542,91 @@ class MainWindow(QMainWindow):
                     detailed_error = traceback.format_exc()
                     QMessageBox.warning(self, "Save Error", f"Could not automatically save results to an Excel file:\n{e}\n\nDetails:\n{detailed_error}")
             else:
-                print("MATLAB engine not running. Cannot save results automatically.")
-                QMessageBox.warning(self, "Save Skipped", "MATLAB engine not available. Results not saved automatically.")
+                print("Motor model engine not available. Cannot save results automatically.")
+                QMessageBox.warning(self, "Save Skipped", "Motor model engine not available. Results not saved automatically.")
+
+    def _start_export(self, results, other_args, file_path):
+        from sim.SaveData import SaveMat
+        self.ui.Execution.setEnabled(False) # the engine is busy with the export
+        self.export_file_path = file_path
+        self.export_worker = ExportWorker(
+            SaveMat,
+            self.model_engine,
+            results,
+            self.motor_optimization_conf,
+            self.motor_params_pymoo_ref,
+            other_args,
+            file_path
+        )
+        self.export_thread = QThread()
+        self.export_worker.moveToThread(self.export_thread)
+
+        # one step per design and one for the file
+        steps = 1 if isinstance(results.X, dict) else len(results.X)
+        self.export_progress = QProgressDialog(f"Exporting {steps} design(s)...", "Cancel", 0, steps + (1 if file_path else 0), self)
+        self.export_progress.setWindowTitle("Export Results")
+        self.export_progress.setWindowModality(Qt.WindowModal)
+        self.export_progress.setMinimumDuration(500)
+        self.export_progress.setValue(0)
+        self.export_progress.canceled.connect(self.export_worker.request_cancel, Qt.DirectConnection) # the worker thread is busy, set its flag right away
+
+        self.export_thread.started.connect(self.export_worker.run_export)
+        self.export_worker.progress_signal.connect(self._update_export_progress)
+        self.export_worker.finished_signal.connect(self.on_export_finished)
+        self.export_worker.error_signal.connect(self.on_export_error)
+
+        # Graceful cleanup
+        self.export_worker.finished_signal.connect(self.export_thread.quit)
+        self.export_worker.error_signal.connect(self.export_thread.quit)
+        self.export_thread.finished.connect(self.export_worker.deleteLater)
+        self.export_thread.finished.connect(self.export_thread.deleteLater)
+        self.export_thread.finished.connect(self._on_export_thread_finished_cleanup)
+
+        self.export_thread.start()
+
+    @Slot(int, int)
+    def _update_export_progress(self, done, total):
+        if self.export_progress and not self.export_progress.wasCanceled():
+            self.export_progress.setValue(done)
+
+    @Slot(object)
+    def on_export_finished(self, table):
+        self.results_table = table
+        file_path = self.export_file_path
+        # Direct User to begin plotting in results tab
+        if file_path:
+            self.recent_excel = file_path
+            print(f"Optimization results successfully saved to: {file_path}")
+            QMessageBox.information(self, "Save Complete, Plotting Ready",
+                                  f"Optimization complete and results are saved to:\n{file_path}\n\n"
+                                  "You can now go to the 'Results' tab to generate plots.")
+        else:
+            QMessageBox.information(self, "Save Cancelled, Plotting Ready",
+                                  "The results were not saved.\n\n"
+                                  "You can still go to the 'Results' tab to generate plots.")
+        if hasattr(self.ui, 'tab_4'):
+            self.ui.tabWidget.setCurrentWidget(self.ui.tab_4)
+
+    @Slot(str)
+    def on_export_error(self, error_message):
+        print(f"Export error received in GUI: {error_message}")
+        if self.export_progress:
+            self.export_progress.reset()
+        if "cancelled by user" in error_message.lower():
+            QMessageBox.information(self, "Export Cancelled", "The export was cancelled, no file was written.")
+        else:
+            QMessageBox.warning(self, "Save Error", error_message)
+
+    def _on_export_thread_finished_cleanup(self):
+        """Called when the export thread has finished, after the table was received or the export failed."""
+        print("Export thread has finished. Performing cleanup.")
+        if self.export_progress:
+            self.export_progress.close()
+            self.export_progress.deleteLater()
+        self.export_progress = None
+        self.export_thread = None
+        self.export_worker = None
+        self.ui.Execution.setEnabled(self.optimization_thread is None)
 
     @Slot(str)
     def on_optimization_error(self, error_message):
@@ -522,6 +659,20 @@ class MainWindow(QMainWindow):
                         print("Optimization thread did not quit gracefully, terminating...")
                         self.optimization_thread.terminate()
                         self.optimization_thread.wait()
+        if self.export_thread and self.export_thread.isRunning():
+            # the engine must not be stopped during a call, wait for the design being evaluated
+            print("Cancelling the export before closing...")
+            self.export_worker.request_cancel()
+            self.export_thread.quit()
+            self.export_thread.wait()
+        if not self.matlab_engine_future.done():
+            # MATLAB is still booting, stop it as soon as it is up
+            self.matlab_engine_timer.stop()
+            self.matlab_engine_future.add_done_callback(lambda f: f.exception() is None and f.result().quit())
+        self.eval_cache.close()
+        if self.engine_pool:
+            print("Stopping engine pool...")
+            self.engine_pool.quit()
         if self.matlab_engine:
             print("Stopping MATLAB engine...")
             try:
@@ -0,0 +1,147 @@
+'''
+This script runs optimizations without the GUI (no Qt is imported), one per UI state file saved with File > Save.
+
+Usage:
+    python -m batch_run runs/*.json --backend numpy --outdir results --format parquet
+
+Inputs:
+    states,     UI state JSON files written by state_manager.save_ui_state. They are run one after the other
+    --backend,  numpy (default, no MATLAB needed) or matlab
+    --outdir,   folder for the results, one file per state named <state>_results.<format>
+    --format,   xlsx (default), parquet, feather or csv
+    --cache,    (optional) file to keep the evaluation cache in, shared by all the runs
+    --checkpoint-dir, (optional) folder for the checkpoints of the runs (<state>.ckpt), see sim/Checkpoint.py
+    --resume,   skip the states that already have results and continue the others from their checkpoint
+    --islands,  (optional) run K islands in parallel processes (see MotorOpt), with --migration-interval,
+                --migrants and --topology. Each island evaluates with its own engine and island runs are not
+                checkpointed, so --cache and --checkpoint-dir cannot be combined with it
+    --surrogate, screen the offspring with a surrogate of the motor model (see sim/Surrogate.py), with
+                --surrogate-factor candidates per evaluated design
+
+Outputs:
+    The results table of every run (see SaveMat). A run that fails is reported and the next one is started,
+    the exit code is the number of failed runs.
+'''
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+from pymoo.core.variable import Real, Integer, Choice, Binary
+
+from sim.SaveData import SaveMat
+from sim.MotorOptimizer import MotorOpt
+from sim.MotorModel import MotorCalcs_Vectorized
+from sim.MotorDesign import NumpyEngine
+from sim.MatlabEngine import start_matlab_engine
+from sim.EnginePool import EnginePool
+from sim.EvalCache import EvalCache
+from sim.Checkpoint import RemoveCheckpoint
+from utils import input_parser
+from utils import material_manager
+
+
+def run_state(state_file, cache, engine, engine_factory, out_path, checkpoint_path=None, resume=False, islands=None, surrogate=None):
+    with open(state_file, 'r') as f:
+        ui_state = json.load(f)
+
+    parameters_pymoo = input_parser.create_pymoo_parameters_from_state(ui_state)
+    optimization_conf = input_parser.read_opt_config_from_state(ui_state)
+    mag_br, max_b_mag, pres_b_lam = material_manager.get_material_properties_from_state(ui_state)
+    if checkpoint_path:
+        optimization_conf["Checkpoint"] = checkpoint_path
+        optimization_conf["Resume"] = resume
+    if islands:
+        optimization_conf.update(islands)
+    if surrogate:
+        optimization_conf.update(surrogate)
+
+    # nprocesses > 1 spreads each generation over a pool of engines, like the GUI does
+    pool = None
+    nprocesses = optimization_conf.get("nprocesses", 1)
+    if nprocesses > 1:
+        pool = EnginePool(engine_factory, nprocesses, engines=[engine])
+    cache.engine = pool or engine
+    try:
+        results = MotorOpt(MotorCalcs_Vectorized, parameters_pymoo, mag_br, max_b_mag, pres_b_lam,
+                           cache, Real, Integer, Choice, Binary, optimization_conf, engine_factory=engine_factory)
+    finally:
+        if pool:
+            pool.quit()
+        cache.engine = engine
+
+    if results.X is None:
+        print(f"{state_file}: no feasible solution, nothing saved.")
+        RemoveCheckpoint(checkpoint_path)
+        return
+    motors = results.opt.get("Motor") if results.opt is not None else None
+    SaveMat(engine, results.X, results.F, results.G, optimization_conf, parameters_pymoo, mag_br, max_b_mag, pres_b_lam, out_path, Motors=motors)
+    print(f"{state_file}: {len(results.F)} solution(s) saved to {out_path}")
+    RemoveCheckpoint(checkpoint_path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run BLDC optimizations from saved UI state files, without the GUI.")
+    parser.add_argument("states", nargs="+", help="UI state JSON files (File > Save in the GUI)")
+    parser.add_argument("--backend", choices=["numpy", "matlab"], default="numpy", help="motor model engine")
+    parser.add_argument("--outdir", default=".", help="folder for the result files")
+    parser.add_argument("--format", choices=["xlsx", "parquet", "feather", "csv"], default="xlsx", help="result file format")
+    parser.add_argument("--cache", default=None, help="file to keep the evaluation cache in between runs")
+    parser.add_argument("--checkpoint-dir", default=None, help="folder for the checkpoints of the runs")
+    parser.add_argument("--resume", action="store_true", help="skip finished states, continue the others from their checkpoint")
+    parser.add_argument("--islands", type=int, default=1, help="number of islands (parallel GAs), not with --cache or --checkpoint-dir")
+    parser.add_argument("--migration-interval", type=int, default=5, help="generations between migrations")
+    parser.add_argument("--migrants", type=int, default=2, help="designs each island sends per migration")
+    parser.add_argument("--topology", choices=["ring", "all"], default="ring", help="where the migrants go")
+    parser.add_argument("--surrogate", action="store_true", help="screen the offspring with a surrogate model")
+    parser.add_argument("--surrogate-factor", type=int, default=5, help="candidates made per evaluated design")
+    args = parser.parse_args(argv)
+    if args.islands > 1 and (args.cache or args.checkpoint_dir):
+        parser.error("--islands cannot be combined with --cache or --checkpoint-dir: each island evaluates with its own engine and island runs are not checkpointed")
+    islands = None
+    if args.islands > 1:
+        islands = {"Islands": args.islands, "MigrationInterval": args.migration_interval,
+                   "Migrants": args.migrants, "Topology": args.topology}
+    surrogate = None
+    if args.surrogate:
+        surrogate = {"Surrogate": True, "SurrogateFactor": args.surrogate_factor}
+
+    if args.backend == "matlab":
+        print("Starting MATLAB engine...")
+        engine_factory = start_matlab_engine
+    else:
+        engine_factory = NumpyEngine
+    engine = engine_factory()
+    cache = EvalCache(engine, path=args.cache)
+    os.makedirs(args.outdir, exist_ok=True)
+    if args.checkpoint_dir:
+        os.makedirs(args.checkpoint_dir, exist_ok=True)
+
+    failed = 0
+    try:
+        for state_file in args.states:
+            name = os.path.splitext(os.path.basename(state_file))[0]
+            out_path = os.path.join(args.outdir, f"{name}_results.{args.format}")
+            checkpoint_path = os.path.join(args.checkpoint_dir, f"{name}.ckpt") if args.checkpoint_dir else None
+            if args.resume and os.path.exists(out_path):
+                print(f"{state_file}: already done, skipped.")
+                continue
+            print(f"=== {state_file} ===")
+            start = time.time()
+            try:
+                run_state(state_file, cache, engine, engine_factory, out_path, checkpoint_path, args.resume, islands, surrogate)
+            except Exception as e:
+                failed += 1
+                print(f"{state_file}: failed: {e}")
+                traceback.print_exc()
+            print(f"{state_file}: {time.time() - start:.1f} s, evaluation cache: {cache.stats()}")
+    finally:
+        cache.close()
+        if args.backend == "matlab":
+            engine.quit()
+    return failed
+
+
+if __name__ == "__main__":
+    sys.exit(main())
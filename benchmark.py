@@ -0,0 +1,244 @@
+'''
+This script times the parts of a motor evaluation separately, so the cost of each part can be followed between releases.
+
+Usage:
+    python -m benchmark state.json --backend stub numpy --output bench.json
+    python -m benchmark state.json --baseline bench_previous.json
+
+Inputs:
+    state,      UI state JSON file (File > Save in the GUI), it gives the variables, bounds and requirements
+    --backend,  engines to run against: stub (replays one recorded design, no model cost), numpy and/or matlab
+    --designs,  number of designs for the vectorized parts (SolveCoilFlux, fluidDrag, MotorCalcs_Batch), default 1000
+    --format,   file format of the SaveMat export, xlsx (default), parquet, feather or csv
+    --output,   (optional) JSON file to write the results to
+    --baseline, (optional) JSON file of an earlier run. Every timing more than --tolerance (default 0.2 = 20%)
+                slower than in the baseline is reported as a regression
+    --seed,     seed of the random designs (default 0)
+
+Outputs:
+    The timings as JSON, per backend: median and minimum seconds per call of
+        marshal         argument lists MotorCalcs_Vectorized builds for the engine (one design)
+        engine          the engine call UI_MotorCalcs_MATLAB_Vectorized (one design)
+        unpack          ObjectivesAndConstraints and PlainMotor on the engine output (one design)
+        motorcalcs      MotorCalcs_Vectorized end to end (one design)
+        batch           MotorCalcs_Batch on --designs designs
+        coil_flux       SolveCoilFlux on --designs designs (Python port)
+        fluid_drag      fluidDrag on --designs designs at every speed point, solved and from a TurbFricTable
+        savemat_N       SaveMat export of N = 10, 100 and 1000 designs with their Motor records
+    The exit code is the number of regressions against --baseline.
+'''
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import timeit
+import numpy as np
+from pymoo.core.variable import Real, Integer, Choice, Binary
+
+from sim.SaveData import SaveMat
+from sim.MotorModel import MotorCalcs_Vectorized, MotorCalcs_Batch, ObjectivesAndConstraints, PlainMotor
+from sim.MotorDesign import NumpyEngine, BuildMotorParams, MagnetFlux, SolveCoilFlux, fluidDrag, TurbFricTable
+from sim.MatlabEngine import start_matlab_engine
+from utils import input_parser
+from utils import material_manager
+
+SAVEMAT_SIZES = (10, 100, 1000)
+
+
+class StubEngine:
+    # deterministic stand-in: returns the output row and Motor record of one design, whatever it is asked,
+    # so the timings only hold the Python side of an evaluation
+
+    def __init__(self, Outputs, Motor):
+        self.Outputs = np.asarray(Outputs, dtype=float).reshape(1, -1)
+        self.Motor = Motor
+
+    def UI_MotorCalcs_MATLAB_Vectorized(self, vars_name, vars_value, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess, NumObj_, nargout=1):
+        if PostProcess:
+            return self.Motor
+        if nargout > 1:
+            return self.Outputs.tolist(), self.Motor
+        return self.Outputs.tolist()
+
+    def UI_MotorCalcs_MATLAB_Batch(self, vars_name, vars_matrix, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess, NumObj_, nargout=1):
+        Outputs = np.repeat(self.Outputs, len(vars_matrix), axis=0)
+        if nargout > 1:
+            return Outputs, [self.Motor] * len(vars_matrix)
+        return Outputs
+
+    def quit(self):
+        pass
+
+
+def Requirements(conf):
+    MinTor_Nm = [float(num) for num in conf.get("MinTor").split(',')]
+    SpeedReq_rpm = [float(num) for num in conf.get("SpeedReq").split(',')]
+    return MinTor_Nm, SpeedReq_rpm
+
+
+def SampleDesigns(params, n, seed=0):
+    # n random designs within the bounds of the variables, as the dictionaries pymoo passes to the problem
+    rng = np.random.default_rng(seed)
+    columns = dict()
+    for name, var in params.items():
+        if isinstance(var, Real):
+            columns[name] = rng.uniform(*var.bounds, size=n)
+        elif isinstance(var, Integer):
+            columns[name] = rng.integers(var.bounds[0], var.bounds[1] + 1, size=n)
+        elif isinstance(var, Choice):
+            columns[name] = rng.choice(var.options, size=n)
+        elif isinstance(var, Binary):
+            columns[name] = rng.random(n) < 0.5
+    return [{name: values[i].item() for name, values in columns.items()} for i in range(n)]
+
+
+def Timing(fn, repeat=5):
+    # seconds per call, median and best of `repeat` rounds of as many calls as fit in ~0.2 s
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    times = np.array(timer.repeat(repeat=repeat, number=number)) / number
+    return {"calls": number * repeat, "median_s": float(np.median(times)), "min_s": float(np.min(times))}
+
+
+def run_backend(engine, params, conf, materials, designs, n_batch, file_format):
+    MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T = materials
+    MinTor_Nm, SpeedReq_rpm = Requirements(conf)
+    NumPts = len(SpeedReq_rpm)
+    MinEff_, MaxWeight_kg, VDC = conf.get("MinEff_"), conf.get("MaxWeight"), conf.get("VDC")
+    NumObj_ = sum(conf.get(key) == True for key in ("Efficinecy_minOpt", "Efficinecy_maxOpt", "WeightOpt", "MagWeightOpt", "VoltageOpt", "MtrLengthOpt", "MtrRadiusOpt"))
+    NumObj_ += NumPts if conf.get("TorqueOpt") == True else 0
+    x = designs[0]
+    consts = conf  # MotorOpt passes the OptimizationConf as the constants of the model
+
+    def marshal():
+        return list(x.keys()), list(x.values()), list(consts.keys()), list(consts.values())
+
+    def call_engine():
+        return engine.UI_MotorCalcs_MATLAB_Vectorized(*marshal(), MinTor_Nm, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm, False, NumObj_, nargout=2)
+
+    Mtr_res, Motor = call_engine()
+
+    def unpack():
+        ObjectivesAndConstraints(Mtr_res, consts, MinEff_, MinTor_Nm, MaxWeight_kg, VDC, NumPts)
+        return PlainMotor(Motor)
+
+    results = dict()
+    results["marshal"] = Timing(marshal)
+    results["engine"] = Timing(call_engine)
+    results["unpack"] = Timing(unpack)
+    results["motorcalcs"] = Timing(lambda: MotorCalcs_Vectorized(x, consts, MinEff_, MinTor_Nm, MaxWeight_kg, VDC, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm, engine, conf, NumObj_))
+    results["batch"] = Timing(lambda: MotorCalcs_Batch(designs[:n_batch], consts, MinEff_, MinTor_Nm, MaxWeight_kg, VDC, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm, engine, conf, NumObj_), repeat=3)
+
+    # SaveMat with the Motor records of the designs, like the export at the end of a run
+    _, _, Motors = MotorCalcs_Batch(designs[:max(SAVEMAT_SIZES)], consts, MinEff_, MinTor_Nm, MaxWeight_kg, VDC, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm, engine, conf, NumObj_)
+    with tempfile.TemporaryDirectory() as folder:
+        file_path = os.path.join(folder, f"results.{file_format}")
+        for n in SAVEMAT_SIZES:
+            X = designs[:n]
+            results[f"savemat_{n}"] = Timing(lambda: SaveMat(engine, X, None, None, conf, params, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, file_path, Motors=Motors[:n]), repeat=3)
+    return results
+
+
+def run_kernels(params, conf, materials, designs):
+    # the vectorized Python ports, they do not depend on the engine
+    MinTor_Nm, SpeedReq_rpm = Requirements(conf)
+    names = list(designs[0].keys())
+    values = list(np.array([[x[name] for name in names] for x in designs], dtype=float).T)
+    P = BuildMotorParams(names, values, list(conf.keys()), list(conf.values()), MinTor_Nm, *materials, SpeedReq_rpm)
+
+    FLUXM = MagnetFlux(P)
+
+    c = lambda v: np.asarray(v)[:, None]
+    Speed = np.maximum(P["MtrSpeed_rpm"], 1.0)
+    DynVisc = 0.000001 * P["FDENSTY"] * P["KINVSC"]
+    drag_args = (Speed, c(P["FDENSTY"]), c(DynVisc), c(P["R_MagnetOutR_m"]), c(P["R_MtrLength_m"]), c(P["FLDGAP"]))
+    FricTable = TurbFricTable()
+
+    results = dict()
+    results["coil_flux"] = Timing(lambda: SolveCoilFlux(FLUXM, P, np.zeros(len(designs), dtype=int)))
+    results["fluid_drag"] = Timing(lambda: fluidDrag(*drag_args))
+    results["fluid_drag_table"] = Timing(lambda: fluidDrag(*drag_args, FricTable=FricTable))
+    return results
+
+
+def compare(report, baseline, tolerance):
+    # timings more than `tolerance` slower than the baseline
+    regressions = 0
+    for key in ("state", "designs", "format"):
+        if baseline.get("meta", {}).get(key) != report["meta"][key]:
+            print(f"Note: the baseline was run with {key} = {baseline.get('meta', {}).get(key)}, not {report['meta'][key]}")
+    for group, timings in report["results"].items():
+        for name, timing in timings.items():
+            before = baseline.get("results", {}).get(group, {}).get(name)
+            if before is None:
+                continue
+            ratio = timing["median_s"] / before["median_s"]
+            flag = ""
+            if ratio > 1 + tolerance:
+                regressions += 1
+                flag = "  <-- regression"
+            print(f"{group:>8} {name:<18} {before['median_s']:.3e} s -> {timing['median_s']:.3e} s  x{ratio:.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the parts of a BLDC motor evaluation.")
+    parser.add_argument("state", help="UI state JSON file (File > Save in the GUI)")
+    parser.add_argument("--backend", nargs="+", choices=["stub", "numpy", "matlab"], default=["stub", "numpy"], help="engines to run against")
+    parser.add_argument("--designs", type=int, default=1000, help="designs for the vectorized parts")
+    parser.add_argument("--format", choices=["xlsx", "parquet", "feather", "csv"], default="xlsx", help="SaveMat file format")
+    parser.add_argument("--output", default=None, help="JSON file for the results")
+    parser.add_argument("--baseline", default=None, help="JSON file of an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="slowdown reported as a regression")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random designs")
+    args = parser.parse_args(argv)
+
+    with open(args.state, 'r') as f:
+        ui_state = json.load(f)
+    params = input_parser.create_pymoo_parameters_from_state(ui_state)
+    conf = input_parser.read_opt_config_from_state(ui_state)
+    materials = material_manager.get_material_properties_from_state(ui_state)
+    designs = SampleDesigns(params, max(args.designs, max(SAVEMAT_SIZES)), args.seed)
+
+    report = {"meta": {"state": os.path.basename(args.state), "designs": args.designs, "format": args.format,
+                       "seed": args.seed, "python": platform.python_version(), "numpy": np.__version__,
+                       "machine": platform.machine(), "date": time.strftime("%Y-%m-%d %H:%M:%S")},
+              "results": dict()}
+    report["results"]["kernels"] = run_kernels(params, conf, materials, designs[:args.designs])
+    for backend in args.backend:
+        print(f"Timing the {backend} backend...")
+        if backend == "matlab":
+            engine = start_matlab_engine()
+        elif backend == "numpy":
+            engine = NumpyEngine()
+        else:
+            # records the first design with the NumPy model
+            x = designs[0]
+            MinTor_Nm, SpeedReq_rpm = Requirements(conf)
+            engine = StubEngine(*NumpyEngine().UI_MotorCalcs_MATLAB_Vectorized(list(x.keys()), list(x.values()), list(conf.keys()), list(conf.values()),
+                                                                              MinTor_Nm, *materials, SpeedReq_rpm, False, None, nargout=2))
+        try:
+            report["results"][backend] = run_backend(engine, params, conf, materials, designs, args.designs, args.format)
+        finally:
+            engine.quit()
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        print(f"{regressions} regression(s) against {args.baseline}")
+        return regressions
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+import time
+import traceback
+from PySide2.QtCore import QObject, Signal, Slot
+
+# Runs SaveMat (table of the optimized designs, evaluated again when the optimizer kept no record, and the file
+# written) in a QThread, so the window stays responsive while the results are exported. The engine is only used by
+# this worker during the export: MainWindow does not start an optimization until it is finished.
+
+
+class ExportWorker(QObject):
+    progress_signal = Signal(int, int) # steps done, total (the designs and the file)
+    finished_signal = Signal(object) # table of the designs (pandas DataFrame)
+    error_signal = Signal(str)
+
+    def __init__(self, save_mat_func, eng, results, opt_conf, params, other_args, file_path):
+        super().__init__()
+        self.save_mat_func = save_mat_func
+        self.eng = eng
+        self.results = results
+        self.opt_conf = opt_conf
+        self.params = params
+        self.other_args = other_args
+        self.file_path = file_path
+        self._is_cancel_requested = False
+
+    @Slot()
+    def request_cancel(self):
+        print("ExportWorker: Cancel request received.")
+        self._is_cancel_requested = True
+
+    def get_cancel_state(self):
+        return self._is_cancel_requested
+
+    @Slot()
+    def run_export(self):
+        try:
+            start = time.perf_counter()
+            results = self.results
+            mag_br, max_b_mag, pres_b_lam = self.other_args
+            # Motor records kept by the optimizer, SaveMat only evaluates designs without one
+            motors = results.opt.get("Motor") if results.opt is not None else None
+            table = self.save_mat_func(
+                self.eng, results.X, results.F, results.G,
+                self.opt_conf, self.params,
+                mag_br, max_b_mag, pres_b_lam,
+                self.file_path, Motors=motors,
+                progress_callback=self.progress_signal.emit,
+                cancel_checker=self.get_cancel_state
+            )
+            if table is None or self._is_cancel_requested:
+                print("Worker: Export was cancelled by user.")
+                self.error_signal.emit("Export cancelled by user.")
+            else:
+                print(f"Worker: results exported in {time.perf_counter() - start:.2f} s")
+                self.finished_signal.emit(table)
+        except Exception as e:
+            print(f"Error in export thread: {e}")
+            detailed_error = traceback.format_exc()
+            self.error_signal.emit(f"Could not export the results:\n{e}\n\nDetails:\n{detailed_error}")
@@ -0,0 +1,116 @@
+import numpy as np
+from gui.result_plots import Scatter3DWidget, PEN_COLOR, POINT_SIZE  # before pyqtgraph, it picks the Qt binding
+import pyqtgraph as pg
+from PySide2.QtCore import Slot
+from PySide2.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QStackedWidget
+
+# Live plot of the non-dominated front (opt F of the algorithm) in the Simulation tab, on 2 or 3 chosen objectives.
+# The progress callback sends the front with its batches of rows (at most every FLUSH_INTERVAL_MS, and only when it
+# changed), so drawing never runs per generation. Points that are still drawn are kept: when the front only gained
+# points they are added to the plot, the plot is redrawn when points left the front (or the 3D ranges changed).
+# Fronts larger than MAX_POINTS are decimated, evenly along the first objective. The front is only drawn while visible.
+
+MAX_POINTS = 2000
+NO_OBJECTIVE = "(2D)"
+
+
+def _decimate(values, n):
+    # n points evenly spread over the values sorted by their columns
+    if len(values) <= n:
+        return values
+    order = np.lexsort(values.T[::-1])
+    return values[order[np.linspace(0, len(values) - 1, n).astype(int)]]
+
+
+class LiveParetoPlot(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.front = np.zeros((0, 0)) # latest front, one row per design, one column per objective
+        self._drawn = set() # points in the plot, as bytes of their objective values
+        self._stale = False # front changed while the plot was hidden
+
+        self.combos = [QComboBox(self) for _ in range(3)]
+        controls = QHBoxLayout()
+        self.title = QLabel("Pareto front", self)
+        controls.addWidget(self.title)
+        controls.addStretch(1)
+        for axis, combo in zip("XYZ", self.combos):
+            controls.addWidget(QLabel(f"{axis}:", self))
+            controls.addWidget(combo)
+            combo.currentIndexChanged.connect(self._on_objectives_changed)
+
+        self.plot_2d = pg.PlotWidget(self, background='w')
+        self.plot_2d.getPlotItem().setMenuEnabled(False)
+        self.plot_2d.getPlotItem().showGrid(x=True, y=True, alpha=0.3)
+        self.scatter_2d = pg.ScatterPlotItem(size=POINT_SIZE + 2, pen=None, brush=pg.mkBrush(PEN_COLOR + (200,)))
+        self.plot_2d.addItem(self.scatter_2d)
+        self.plot_3d = Scatter3DWidget(self)
+        self.stack = QStackedWidget(self)
+        self.stack.addWidget(self.plot_2d)
+        self.stack.addWidget(self.plot_3d)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 4, 0, 0)
+        layout.addLayout(controls)
+        layout.addWidget(self.stack)
+        self.setMinimumHeight(320)
+
+    def set_objectives(self, names):
+        """Starts a new run with these objectives, the first 2 are plotted until others are chosen."""
+        for i, combo in enumerate(self.combos):
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItems(list(names) if i < 2 else [NO_OBJECTIVE] + list(names))
+            combo.setCurrentIndex(min(i, len(names) - 1) if i < 2 else 0)
+            combo.blockSignals(False)
+        self.front = np.zeros((0, len(names)))
+        self._draw(full=True)
+
+    def objectives(self):
+        """Column indexes of the plotted objectives (2 or 3)."""
+        columns = [combo.currentIndex() for combo in self.combos[:2]]
+        if self.combos[2].currentIndex() > 0:
+            columns.append(self.combos[2].currentIndex() - 1)
+        return columns
+
+    @Slot(object)
+    def update_front(self, front):
+        self.front = np.asarray(front, dtype=float)
+        if self.isVisible():
+            self._draw()
+        else:
+            self._stale = True
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._stale:
+            self._draw(full=True)
+
+    @Slot()
+    def _on_objectives_changed(self):
+        self._draw(full=True)
+
+    def _draw(self, full=False):
+        self._stale = False
+        columns = self.objectives()
+        values = self.front[:, columns] if self.front.size and 0 <= min(columns) and max(columns) < self.front.shape[1] else np.zeros((0, len(columns)))
+        shown = _decimate(values, MAX_POINTS)
+        self.title.setText(f"Pareto front: {len(values)} designs" + (f" ({len(shown)} drawn)" if len(shown) < len(values) else ""))
+        keys = [row.tobytes() for row in shown]
+        new = [i for i, key in enumerate(keys) if key not in self._drawn]
+        full = full or not self._drawn.issubset(keys) # points left the front
+        names = [self.combos[0].currentText(), self.combos[1].currentText(), self.combos[2].currentText()]
+
+        if len(columns) == 2:
+            self.stack.setCurrentWidget(self.plot_2d)
+            if full:
+                self.scatter_2d.setData(shown[:, 0], shown[:, 1])
+                self.plot_2d.setLabel('bottom', names[0])
+                self.plot_2d.setLabel('left', names[1])
+            elif new:
+                self.scatter_2d.addPoints(x=shown[new, 0], y=shown[new, 1])
+        else:
+            self.stack.setCurrentWidget(self.plot_3d)
+            if full or (new and not self.plot_3d.add_values(shown[new])):
+                self.plot_3d.plot_values(shown, names)
+        self._drawn = set(keys)
@@ -1,13 +1,14 @@
+import time
 import traceback
 from PySide2.QtCore import QObject, Signal, Slot
-from gui.progress_callback import ProgressCallback #, OperationCancelledError (if using exception model)
 
 
 class OptimizationWorker(QObject):
     progress_signal = Signal(int)
     finished_signal = Signal(object)
     error_signal = Signal(str)
-    table_update_data = Signal(dict)
+    table_update_batch = Signal(list)
+    front_update = Signal(object)
 
     def __init__(self, motor_calcs_func, motor_params_pymoo, opt_conf, other_args, motor_opt_func):
         super().__init__()
@@ -29,6 +30,7 @@ class OptimizationWorker(QObject):
 
     @Slot()
     def run_optimization(self):
+        from gui.progress_callback import ProgressCallback # imports pymoo, loaded with the first optimization
         try:
             if self._is_stop_requested:
                 print("Worker: Optimization not started as stop was already requested.")
@@ -36,13 +38,15 @@ class OptimizationWorker(QObject):
                 return
 
             print("Worker thread starting optimization...")
+            start = time.perf_counter()
             # Pass a lambda to the callback that checks our internal stop flag
             callback = ProgressCallback(
                 self.progress_signal,
                 self.ngens,
                 stop_checker_func=self.get_stop_state
             )
-            callback.new_data_point.connect(self.table_update_data)
+            callback.new_data_batch.connect(self.table_update_batch)
+            callback.new_front.connect(self.front_update)
 
             mag_br, max_b_mag, pres_b_lam, eng, R, I, Ch, B = self.other_args
 
@@ -54,6 +58,8 @@ class OptimizationWorker(QObject):
                 self.opt_conf,
                 callback_instance=callback # This callback signals Pymoo via return True
             )
+            callback.flush() # rows of the last generations, before the finished or error signal
+            print(f"Worker: optimization ran for {time.perf_counter() - start:.2f} s")  # MotorOpt logs the time per stage
 
             # After motor_opt_func returns, check if it was due to a stop request
             if self._is_stop_requested:
@@ -1,29 +1,59 @@
+import time
 import numpy as np
 from pymoo.core.callback import Callback
 from PySide2.QtCore import Signal
 from PySide2.QtCore import QObject
 
+# The rows of the generations are collected and sent to the GUI at most every FLUSH_INTERVAL_MS, as one list,
+# so fast generations (cache hits, vectorized engines) do not flood the GUI event loop. Stop requests are checked
+# every generation. The non-dominated front (opt F) goes with them, when it changed since the last flush.
+FLUSH_INTERVAL_MS = 200
+
 class ProgressCallback(QObject, Callback): 
-    new_data_point = Signal(dict) 
+    new_data_batch = Signal(list) # rows (dicts) of the generations since the last flush
+    new_front = Signal(object) # objectives of the current non-dominated designs, one row per design
 
-    def __init__(self, progress_signal, total_generations_hint, stop_checker_func=None):
+    def __init__(self, progress_signal, total_generations_hint, stop_checker_func=None, flush_interval_ms=FLUSH_INTERVAL_MS):
         QObject.__init__(self)
         Callback.__init__(self)
         self.progress_signal = progress_signal 
         self._stop_checker_func = stop_checker_func
         self.current_generation = 0
+        self.flush_interval_ms = flush_interval_ms
+        self._rows = [] # rows not sent yet
+        self._last_flush = None
+        self._front = None # front of the last generation
+        self._sent_front = None
         # self.headers_sent = False # Not needed if MainWindow sets headers
 
     def notify(self, algorithm, **kwargs):
+        start = time.perf_counter()
         self.notifyProgress(algorithm)
         self.notifyTable(algorithm)
-        return self.notifyStop(algorithm)
+        if self._last_flush is None or (start - self._last_flush) * 1000 >= self.flush_interval_ms:
+            self.flush()
+        stop = self.notifyStop(algorithm)
+        # reported with the next generation, the row of this one is already sent
+        timings = getattr(algorithm, "timings", None)
+        if timings is not None:
+            timings.add("callback", time.perf_counter() - start)
+        return stop
+
+    def flush(self):
+        """Sends the rows collected since the last flush and the current generation to the GUI, also called when the run ends."""
+        if self._rows:
+            rows, self._rows = self._rows, []
+            self.new_data_batch.emit(rows)
+        if self._front is not None and (self._sent_front is None or not np.array_equal(self._front, self._sent_front)):
+            self._sent_front = self._front
+            self.new_front.emit(self._front)
+        if self.progress_signal:
+            self.progress_signal.emit(self.current_generation)
+        self._last_flush = time.perf_counter()
 
-    # update progress bar
+    # update progress bar (sent with the rows, see flush)
     def notifyProgress(self, algorithm):
         self.current_generation = algorithm.n_gen
-        if self.progress_signal:
-             self.progress_signal.emit(self.current_generation)
 
 
     # Update table 
@@ -49,6 +79,8 @@ class ProgressCallback(QObject, Callback):
         
         n_obj = algorithm.problem.n_obj
         opt_f = opt.get("F") if opt is not None and opt.size > 0 else None
+        if opt_f is not None:
+            self._front = opt_f # a new array every generation, the GUI gets it as is
 
         for i in range(n_obj):
             obj_key_min = f"obj{i+1}_min"
@@ -64,8 +96,13 @@ class ProgressCallback(QObject, Callback):
                 data_dict[obj_key_min] = np.nan 
                 data_dict[obj_key_max] = np.nan
                 data_dict[obj_key_avg] = np.nan
+
+        # time spent in the stages of the run since the last row (sim/Timings.py), not known for island runs
+        timings = getattr(algorithm, "timings", None)
+        if timings is not None:
+            data_dict.update(timings.generation())
         
-        self.new_data_point.emit(data_dict)
+        self._rows.append(data_dict)
 
     # Stop algorithm (user pressend STOP)
     def notifyStop(self, algorithm):
@@ -0,0 +1,7123 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 5.15.2
+# WARNING! All changes made in this file will be lost!
+
+from PySide2 import QtCore
+
+qt_resource_data = b"\
+\x00\x00~\x87\
+\xff\
+\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x01\x00\xdc\x00\
+\xdc\x00\x00\xff\xdb\x00C\x00\x03\x02\x02\x03\x02\x02\x03\x03\
+\x03\x03\x04\x03\x03\x04\x05\x08\x05\x05\x04\x04\x05\x0a\x07\x07\
+\x06\x08\x0c\x0a\x0c\x0c\x0b\x0a\x0b\x0b\x0d\x0e\x12\x10\x0d\x0e\
+\x11\x0e\x0b\x0b\x10\x16\x10\x11\x13\x14\x15\x15\x15\x0c\x0f\x17\
+\x18\x16\x14\x18\x12\x14\x15\x14\xff\xdb\x00C\x01\x03\x04\x04\
+\x05\x04\x05\x09\x05\x05\x09\x14\x0d\x0b\x0d\x14\x14\x14\x14\x14\
+\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
+\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
+\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\xff\xc0\x00\
+\x11\x08\x01\x09\x04\xbf\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01\
+\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\
+\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\
+\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\x04\x03\x05\x05\
+\x04\x04\x00\x00\x01}\x01\x02\x03\x00\x04\x11\x05\x12!1\
+A\x06\x13Qa\x07\x22q\x142\x81\x91\xa1\x08#B\
+\xb1\xc1\x15R\xd1\xf0$3br\x82\x09\x0a\x16\x17\x18\
+\x19\x1a%&'()*456789:C\
+DEFGHIJSTUVWXYZc\
+defghijstuvwxyz\x83\
+\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\
+\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\
+\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\
+\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf1\xf2\
+\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\x1f\x01\x00\x03\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x02\
+\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x11\x00\x02\
+\x01\x02\x04\x04\x03\x04\x07\x05\x04\x04\x00\x01\x02w\x00\x01\
+\x02\x03\x11\x04\x05!1\x06\x12AQ\x07aq\x13\x22\
+2\x81\x08\x14B\x91\xa1\xb1\xc1\x09#3R\xf0\x15b\
+r\xd1\x0a\x16$4\xe1%\xf1\x17\x18\x19\x1a&'(\
+)*56789:CDEFGHIJ\
+STUVWXYZcdefghij\
+stuvwxyz\x82\x83\x84\x85\x86\x87\x88\x89\
+\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\
+\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\
+\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe2\xe3\
+\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\
+\xff\xda\x00\x0c\x03\x01\x00\x02\x11\x03\x11\x00?\x00\xfc\xba\
+\xa2\x8a*\xcc\x82\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\
+\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\
+\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\
+\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\
+\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\
+\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\
+\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\
+\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\
+\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\
+\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\
+\x02\x8a(\xa0\x02\xbd\x1b\xf6o\xff\x00\x93\x80\xf8w\xff\
+\x00a\xdb_\xfd\x18+\xcek\xd1\xbff\xff\x00\xf98\
+\x0f\x87\x7f\xf6\x1d\xb5\xff\x00\xd1\x82\x80G\xf4\xa5E\x14\
+T\x1a\x8d=+\xe7\xaf\x8b\xd2:\xf8\xea\xe8\x06`<\
+\xa8\xf8\x07\xd8\xd7\xd0\xcd_<|^\xff\x00\x91\xea\xeb\
+\xfe\xb9G\xfc\x8d~Q\xe2Kk'\x8d\xbf\x9d~\xa7\
+\xd6p\xd7\xfb\xeb\xbfg\xfa\x1czH\xfb\x97\xf7\x8d\xd4\
+w5\xf5^\x93\xff\x00 \xbb?\xfa\xe4\x9f\xfa\x08\xaf\
+\x94\x97\xef\x0f\xa8\xaf\xab4\x9f\xf9\x05Y\xff\x00\xd7\x14\
+\xff\x00\xd0E|\xbf\x85\xcd\xb9\xe2\xaf\xda?\xa9\xeaq\
+JV\xa5o?\xd0\xbdE%-~\xfe~~\x14Q\
+E\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14Q\
+E\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14Q\
+E\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14Q\
+E\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14Q\
+E\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14Q\
+E\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14Q\
+E\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14Q\
+E\x00\x14QE\x00\x7f,\xf4QEY\x90QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00W\xa3~\
+\xcd\xff\x00\xf2p\x1f\x0e\xff\x00\xec;k\xff\x00\xa3\x05\
+y\xcdz7\xec\xdf\xff\x00'\x01\xf0\xef\xfe\xc3\xb6\xbf\
+\xfa0P\x08\xfe\x94\xa8\xa2\x8a\x83Q\xad_<\xfc_\
+\xff\x00\x91\xea\xeb\xfe\xb9G\xfc\x8d}\x0c\xd5\xf3\xcf\xc5\
+\xff\x00\xf9\x1e\xae\xbf\xeb\x94\x7f\xc8\xd7\xe4\xfe%\x7f\xc8\
+\x9e?\xe3_\xa9\xf5\x9c5\xfe\xfa\xfd\x1f\xe8q\xa9\xf7\
+\x87\xd7\xfa\xd7\xd5\xbaG\xfc\x82\xec\xff\x00\xeb\x92\x7f\xe8\
+\x22\xbeRO\xbc>\xbf\xd6\xbe\xad\xd2?\xe4\x17g\xff\
+\x00\x5c\x93\xff\x00A\x15\xf2\xde\x16\xff\x00\x13\x15\xe9\x1f\
+\xd4\xf58\xa7j_?\xd0\xbbE\x14W\xf4\x09\xf9\xf8\
+QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\x00\
+QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\x00\
+QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\x00\
+QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\x00\
+QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\x00\
+QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\x00\
+QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\x00\
+QE\x14\x00QE\x14\x01\xfc\xb3\xd1E\x15fAE\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01^\
+\x8d\xfb7\xff\x00\xc9\xc0|;\xff\x00\xb0\xed\xaf\xfe\x8c\
+\x15\xe75\xe8\xdf\xb3\x7f\xfc\x9c\x07\xc3\xbf\xfb\x0e\xda\xff\
+\x00\xe8\xc1@#\xfaR\xa2\x8a*\x0dF\xb5|\xf3\xf1\
+\x7f\xfeG\xab\xaf\xfa\xe5\x1f\xf25\xf43W\xcf?\x17\
+\xff\x00\xe4z\xba\xff\x00\xaeQ\xff\x00#_\x93\xf8\x95\
+\xff\x00\x22x\xff\x00\x8d~\xa7\xd6p\xd7\xfb\xeb\xf4\x7f\
+\xa1\xc6\xa7\xde\x1f_\xeb_V\xe9\x1f\xf2\x0b\xb3\xff\x00\
+\xaeI\xff\x00\xa0\x8a\xf9I>\xf0\xfa\xff\x00Z\xfa\xb7\
+H\xff\x00\x90]\x9f\xfdrO\xfd\x04W\xcbx[\xfc\
+LW\xa4\x7fS\xd4\xe2\x9d\xa9|\xff\x00B\xed\x14Q\
+_\xd0'\xe7\xe1E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x07\xf2\xcfE\
+\x14U\x99\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\
+\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\
+\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\
+\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\
+\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\
+\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\
+\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\
+\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\
+\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\
+\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\
+\x14Q@\x05z7\xec\xdf\xff\x00'\x01\xf0\xef\xfe\xc3\
+\xb6\xbf\xfa0W\x9c\xd7\xa3~\xcd\xff\x00\xf2p\x1f\x0e\
+\xff\x00\xec;k\xff\x00\xa3\x05\x00\x8f\xe9J\x8a(\xa8\
+5\x1a\xd5\xf3\xcf\xc5\xff\x00\xf9\x1e\xae\xbf\xeb\x94\x7f\xc8\
+\xd7\xd0\xcd_<\xfc_\xff\x00\x91\xea\xeb\xfe\xb9G\xfc\
+\x8d~O\xe2W\xfc\x89\xe3\xfe5\xfa\x9fY\xc3_\xef\
+\xaf\xd1\xfe\x87\x1a\x9fx}\x7f\xad}[\xa4\x7f\xc8.\
+\xcf\xfe\xb9'\xfe\x82+\xe5$\xfb\xc3\xeb\xfdk\xea\xdd\
+#\xfeAv\x7f\xf5\xc9?\xf4\x11_-\xe1o\xf11\
+^\x91\xfdOS\x8av\xa5\xf3\xfd\x0b\xb4QE\x7f@\
+\x9f\x9f\x85\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14\
+Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14\
+Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14\
+Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14\
+Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14\
+Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14\
+Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14\
+Q@\x05\x14Q@\x05\x14Q@\x1f\xcb=\x14QV\
+d\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\
+\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\
+\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\
+\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\
+\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\
+\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\
+\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\
+\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\
+\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\
+\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\
+\x00\x15\xe8\xdf\xb3\x7f\xfc\x9c\x07\xc3\xbf\xfb\x0e\xda\xff\x00\
+\xe8\xc1^s^\x8d\xfb7\xff\x00\xc9\xc0|;\xff\x00\
+\xb0\xed\xaf\xfe\x8c\x14\x02?\xa5*(\xa2\xa0\xd4kW\
+\xcf?\x17\xff\x00\xe4z\xba\xff\x00\xaeQ\xff\x00#_\
+C5|\xf3\xf1\x7f\xfeG\xab\xaf\xfa\xe5\x1f\xf25\xf9\
+?\x89_\xf2'\x8f\xf8\xd7\xea}g\x0d\x7f\xbe\xbfG\
+\xfa\x1cj}\xe1\xf5\xfe\xb5\xf5n\x91\xff\x00 \xbb?\
+\xfa\xe4\x9f\xfa\x08\xaf\x94\x93\xef\x0f\xaf\xf5\xaf\xabt\x8f\
+\xf9\x05\xd9\xff\x00\xd7$\xff\x00\xd0E|\xb7\x85\xbf\xc4\
+\xc5zG\xf5=N)\xda\x97\xcf\xf4.\xd1E\x15\xfd\
+\x02~~\x14QE\x00\x14QE\x00\x14QE\x00\x14\
+QE\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14\
+QE\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14\
+QE\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14\
+QE\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14\
+QE\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14\
+QE\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14\
+QE\x00\x14QE\x00\x14QE\x00\x7f,\xf4QE\
+Y\x90QE\x14\x00QE\x14\x00QE\x14\x00QE\
+\x14\x00QE\x14\x00QE\x14\x00QE\x14\x00W\xa7\
+\xfe\xce\x7f\xb3\xe7\x88\x7fi\xbf\x89Qx'\xc3\x17\xda\
+f\x9f\xaaIi-\xe0\x9bV\x92D\x87dx\xc8\xcc\
+h\xed\x9f\x98`m\xfa\xe2\xbc\xc2\xbe\xd0\xff\x00\x82G\
+\xff\x00\xc9\xe1Y\xff\x00\xd8\x12\xfb\xf9\xc7@\xd6\xe7Y\
+\xff\x00\x0e]\xf8\xd1\xff\x00C_\x80\xff\x00\xf0:\xf7\
+\xff\x00\x91(\xff\x00\x87.\xfch\xff\x00\xa1\xaf\xc0\x7f\
+\xf8\x1d{\xff\x00\xc8\x95\xfb9EIvG\xe3\x1f\xfc\
+9w\xe3G\xfd\x0d~\x03\xff\x00\xc0\xeb\xdf\xfeD\xa3\
+\xfe\x1c\xbb\xf1\xa3\xfe\x86\xbf\x01\xff\x00\xe0u\xef\xff\x00\
+\x22W\xec\xe5\x14\x05\x91\xf8\xc7\xff\x00\x0e]\xf8\xd1\xff\
+\x00C_\x80\xff\x00\xf0:\xf7\xff\x00\x91(\xff\x00\x87\
+.\xfch\xff\x00\xa1\xaf\xc0\x7f\xf8\x1d{\xff\x00\xc8\x95\
+\xfb9E\x01d~1\xff\x00\xc3\x97~4\x7f\xd0\xd7\
+\xe0?\xfc\x0e\xbd\xff\x00\xe4J?\xe1\xcb\xbf\x1a?\xe8\
+k\xf0\x1f\xfe\x07^\xff\x00\xf2%~\xceQ@Y\x1f\
+\x8c\x7f\xf0\xe5\xdf\x8c\xff\x00\xf46x\x13\xff\x00\x03\xaf\
+\x7f\xf9\x12\xb1<G\xff\x00\x04z\xf8\xf1\xa1\xd8\xcbq\
+es\xe1?\x10\xc8\x8b\x95\xb5\xd3\xb5I\x12G>\x80\
+\xcf\x0cj\x0f\xd5\x80\xf7\xaf\xdbz(\x17*?\x9b\x8f\
+\x8b\x1f\xb2\xef\xc5\x8f\x81\xbel\x9e7\xf0&\xaf\xa2Y\
+\xc5\xb4>\xa0b\x13\xd9\x02\xd8\xc2\xfd\xa6\x22\xf1d\xe7\
+\x18\x0d\x9c\xf1\x8c\xf1^]_\xd4\x94\xd0%\xc4/\x14\
+\xb1\xac\xb1:\x95x\xddAV\x04`\x82\x0f\x5c\xd7\xc3\
+\x1f\xb5w\xfc\x12\xb7\xc0\xbf\x17\xad\xaf5\xdf\x87\x11Z\
+x\x07\xc6-\xf3\xfd\x9a\x18\xf6iW\x87\x18\xc3\xc4\xa3\
+\xf7,x\xf9\xe3\x18\xeb\x94bw\x02\xe2\xe5\xec~*\
+Q]\x1f\xc4_\x87~#\xf8M\xe3-O\xc2\xbe-\
+\xd2g\xd15\xed:O.\xe6\xd2\xe0\x0c\x83\xd42\x90\
+Hda\x86WRC\x02\x08$\x1a\xe7*\x89\x0a(\
+\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\
+\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\
+\xa2\x80\x0aN\x94\xb4\xd9?\xd5\xb7\xd0\xd0\x07\xab\xe9\x7f\
+\xb2\x8f\xc6}oM\xb6\xd4,>\x15\xf8\xbe\xf6\xc6\xe6\
+1,70h\xb3\xbaJ\x84d2\xb0L\x10G \
+\x8a\xb5\xff\x00\x0c{\xf1\xcb\xfe\x89\x0f\x8d\x7f\xf0Eq\
+\xff\x00\xc4W\xef\xb7\xec\xef\xff\x00$#\xc0\x1f\xf6\x04\
+\xb4\xff\x00\xd1K^\x87Sr\xf9O\xe7\x1b\xfe\x18\xf7\
+\xe3\x97\xfd\x12\x1f\x1a\xff\x00\xe0\x8a\xe3\xff\x00\x88\xa3\xfe\
+\x18\xf7\xe3\x97\xfd\x12\x1f\x1a\xff\x00\xe0\x8a\xe3\xff\x00\x88\
+\xaf\xe8\xe6\x8a.\x1c\xa7\xf3O\xe3o\xd9\xf3\xe2w\xc3\
+]\x0c\xeb>,\xf0\x07\x89<7\xa4\x89\x16#}\xaa\
+is[\xc3\xbd\xb3\xb5w\xb2\xe3'\x07\x03<\xe2\xbc\
+\xfe\xbfp\x7f\xe0\xae\xdf7\xec\x7fu\xff\x00a\xcb\x1f\
+\xfd\xa9_\x87\xd4\xd1/p\xa2\x8a)\x88(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00+\xd1\xbff\xff\x00\xf98\
+\x0f\x87\x7f\xf6\x1d\xb5\xff\x00\xd1\x82\xbc\xe6\xbd\x1b\xf6o\
+\xff\x00\x93\x80\xf8w\xff\x00a\xdb_\xfd\x18(\x04\x7f\
+JTQEA\xa8\xd6\xaf\x9e~/\xff\x00\xc8\xf5u\
+\xff\x00\x5c\xa3\xfeF\xbe\x86j\xf9\xe7\xe2\xff\x00\xfc\x8f\
+W_\xf5\xca?\xe4k\xf2\x7f\x12\xbf\xe4O\x1f\xf1\xaf\
+\xd4\xfa\xce\x1a\xff\x00}~\x8f\xf48\xd4\xfb\xc3\xeb\xfd\
+k\xea\xdd#\xfeAv\x7f\xf5\xc9?\xf4\x11_)'\
+\xde\x1f_\xeb_V\xe9\x1f\xf2\x0b\xb3\xff\x00\xaeI\xff\
+\x00\xa0\x8a\xf9o\x0b\x7f\x89\x8a\xf4\x8f\xeaz\x9cS\xb5\
+/\x9f\xe8]\xa2\x8a+\xfa\x04\xfc\xfc(\xa2\x8a\x00(\
+\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\
+\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\
+\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\
+\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\
+\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\
+\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\
+\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\
+\xa2\x8a\x00\xfeY\xe8\xa2\x8a\xb3 \xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xaf\xb4?\xe0\x91\xff\x00\xf2xV\
+\x7f\xf6\x04\xbe\xfeq\xd7\xc5\xf5\xf6\x87\xfc\x12?\xfeO\
+\x0a\xcf\xfe\xc0\x97\xdf\xce:Lks\xf7\x22\x8a(\xa9\
+4\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\
+\x80\x0a(\xa2\x80>`\xfd\xba\xbfc]\x1b\xf6\xab\xf8\
+s4\xd6\xb6\xb1\xda\xfcC\xd1\xe0w\xd15%\xda\xad\
+/V\xfb$\xc4\xe04ns\x8c\x91\xb1\x8e\xe0@.\
+\x1b\xf0O\x5c\xd1/\xfc7\xac^\xe9:\xa5\x9c\xda~\
+\xa7c3\xdb]Z\xdc!I!\x91N\xd6F\x04\x0c\
+\x10F1\x8a\xfe\xa2\xeb\xf2'\xfe\x0b\x07\xfb4\xdbx\
+K\xc5ZG\xc5\xfd\x0e\xdd`\xb2\xd7\xa5\x1a~\xb5\x1c\
+h\x15V\xf0.c\x9b\xafYQX\x1c\x0e\xb1\x16$\
+\x97\xa6\x89h\xfc\xdd\xa2\x8a*\x88\x0a(\xa2\x80\x0a(\
+\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\
+\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0al\x9f\xea\xdb\xe8\
+i\xd4\xd9?\xd5\xb7\xd0\xd0\x07\xf4\xaf\xfb;\xff\x00\xc9\
+\x08\xf0\x07\xfd\x81-?\xf4R\xd7\xa1\xd7\x9e~\xce\xff\
+\x00\xf2B<\x01\xff\x00`KO\xfd\x14\xb5\xe8u\x06\
+\xa1E\x14P\x07\xc5\x7f\xf0WA\xbb\xf6?\xbd\xf6\xd6\
+\xacO\xea\xf5\xf8w_\xb9\x7f\xf0V\x98|\xdf\xd8\xf3\
+U8\xce\xcdV\xc9\xbag\xf8\x9a\xbf\x0d)\xa2$\x14\
+QEQ!E\x14P\x01E\x14P\x01E\x14P\x01\
+E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01\
+E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01\
+^\x8d\xfb7\xff\x00\xc9\xc0|;\xff\x00\xb0\xed\xaf\xfe\
+\x8c\x15\xe75\xe8\xdf\xb3\x7f\xfc\x9c\x07\xc3\xbf\xfb\x0e\xda\
+\xff\x00\xe8\xc1@#\xfaR\xa2\x8a*\x0dF\xb5|\xf3\
+\xf1\x7f\xfeG\xab\xaf\xfa\xe5\x1f\xf25\xf43W\xcf?\
+\x17\xff\x00\xe4z\xba\xff\x00\xaeQ\xff\x00#_\x93\xf8\
+\x95\xff\x00\x22x\xff\x00\x8d~\xa7\xd6p\xd7\xfb\xeb\xf4\
+\x7f\xa1\xc6\xa7\xde\x1f_\xeb_V\xe9\x1f\xf2\x0b\xb3\xff\
+\x00\xaeI\xff\x00\xa0\x8a\xf9I>\xf0\xfa\xff\x00Z\xfa\
+\xb7H\xff\x00\x90]\x9f\xfdrO\xfd\x04W\xcbx[\
+\xfcLW\xa4\x7fS\xd4\xe2\x9d\xa9|\xff\x00B\xed\x14\
+Q_\xd0'\xe7\xe1E\x14P\x01E\x14P\x01E\x14\
+P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14\
+P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14\
+P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14\
+P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14\
+P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14\
+P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14\
+P\x01E\x14P\x01E\x14P\x01E\x14P\x07\xf2\xcf\
+Ez\xa7\xfc2\x8f\xc6\xcf\xfa#\xde>\xff\x00\xc2b\
+\xf7\xff\x00\x8dQ\xff\x00\x0c\xa3\xf1\xb3\xfe\x88\xf7\x8f\xbf\
+\xf0\x98\xbd\xff\x00\xe3UfG\x95\xd1^\xa9\xff\x00\x0c\
+\xa3\xf1\xb3\xfe\x88\xf7\x8f\xbf\xf0\x98\xbd\xff\x00\xe3T\x7f\
+\xc3(\xfcl\xff\x00\xa2=\xe3\xef\xfc&/\x7f\xf8\xd5\
+\x00y]\x15\xea\x9f\xf0\xca?\x1b?\xe8\x8fx\xfb\xff\
+\x00\x09\x8b\xdf\xfe5G\xfc2\x8f\xc6\xcf\xfa#\xde>\
+\xff\x00\xc2b\xf7\xff\x00\x8dP\x07\x95\xd1^\xa9\xff\x00\
+\x0c\xa3\xf1\xb3\xfe\x88\xf7\x8f\xbf\xf0\x98\xbd\xff\x00\xe3T\
+\x7f\xc3(\xfcl\xff\x00\xa2=\xe3\xef\xfc&/\x7f\xf8\
+\xd5\x00y]\x15\xea\x9f\xf0\xca?\x1b?\xe8\x8fx\xfb\
+\xff\x00\x09\x8b\xdf\xfe5G\xfc2\x8f\xc6\xcf\xfa#\xde\
+>\xff\x00\xc2b\xf7\xff\x00\x8dP\x07\x95\xd1^\xa9\xff\
+\x00\x0c\xa3\xf1\xb3\xfe\x88\xf7\x8f\xbf\xf0\x98\xbd\xff\x00\xe3\
+T\x7f\xc3(\xfcl\xff\x00\xa2=\xe3\xef\xfc&/\x7f\
+\xf8\xd5\x00y]\x15\xea\x9f\xf0\xca?\x1b?\xe8\x8fx\
+\xfb\xff\x00\x09\x8b\xdf\xfe5G\xfc2\x8f\xc6\xcf\xfa#\
+\xde>\xff\x00\xc2b\xf7\xff\x00\x8dP\x07\x95\xd1^\xa9\
+\xff\x00\x0c\xa3\xf1\xb3\xfe\x88\xf7\x8f\xbf\xf0\x98\xbd\xff\x00\
+\xe3T\x7f\xc3(\xfcl\xff\x00\xa2=\xe3\xef\xfc&/\
+\x7f\xf8\xd5\x00y]}\xa1\xff\x00\x04\x8f\xff\x00\x93\xc2\
+\xb3\xff\x00\xb0%\xf7\xf3\x8e\xbc\x0f\xfe\x19G\xe3g\xfd\
+\x11\xef\x1f\x7f\xe11{\xff\x00\xc6\xaa{\x1f\xd9\x8f\xe3\
+\xbe\x978\x9e\xcf\xe1?\xc4KI\xf1\xb7\xcc\x83\xc3w\
+\xc8\xd8=FD@\xe3\x8e\x94\x0d\x1f\xd1\xde\xe1K\x91\
+_\xcel\x9f\xb3\xc7\xed\x09!\xcb\xfc3\xf8\x98\xe7\xd5\
+\xb4\x1d@\xff\x00\xed:\x8d\xbff\xff\x00\x8f\xcd\xd7\xe1\
+w\xc4\x83\xf5\xf0\xfe\xa1\xff\x00\xc6\xealU\xcf\xe8\xdb\
+4n\x15\xfc\xe2\xb7\xec\xcf\xf1\xe5\xba\xfc*\xf8\x8c~\
+\xbe\x1d\xbf\xff\x00\xe3t\xc6\xfd\x98~:\xb7_\x84\xdf\
+\x11\x0f\xd7\xc3w\xdf\xfcj\x8b\x05\xcf\xe8\xf7\x22\x93w\
+\xf2\xcd\x7f8-\xfb-\xfcqn\xbf\x08\xfe \x9f\xaf\
+\x86\xaf\xbf\xf8\xddD\xdf\xb2\xa7\xc6\xd6\xeb\xf0\x7f\xc7\xe7\
+\xeb\xe1\x8b\xdf\xfe5E\x82\xe7\xf4\x80\xd7\x11'WQ\
+\xf54\xc5\xbc\x82I\x02,\xd1\xb3\x1e\x8a\x18g\xf2\xaf\
+\xe6\xbb\xc4\xdf\xb3\xdf\xc5/\x05\xe8wZ\xd7\x88~\x1a\
+\xf8\xbfB\xd1\xadB\x99\xf5\x0dOA\xba\xb6\xb7\x883\
+\x05]\xf2<aW,\xc0rG$W\xae\xff\x00\xc1\
+4\x7f\xe4\xf7\xbe\x18\xff\x00\xd7k\xef\xfd7\xdc\xd04\
+\xcf\xdf\xca(\xa2\x90\xc2\x8a(\xa0\x02\xbc\xab\xf6\xa1\xf8\
+E\x1f\xc7O\x80~6\xf0Q\x87\xcf\xbb\xd4t\xe9\x0d\
+\x8a\xef\x09\xfe\x94\x9f\xbc\x83\xe6<.dE\x04\xfa\x13\
+^\xabH\xdd(\x03\xf9j\x9a\x17\xb6\x9aHd\x18\x92\
+6(\xc3\xdc\x1c\x1am{\x97\xed\x81\xf0\xae\xfb\xc0\xdf\
+\xb5\xc7\x8f\xfc#\xa7\xe9M\xe7\x5ck\x8f&\x99\xa7X\
+\xa3J\xef\x15\xcb\x09-\xa3E\x00\x96b\xb2 \x0a2\
+r@\xac\x1f\xf8e\x1f\x8d\x9f\xf4G\xbc}\xff\x00\x84\
+\xc5\xef\xff\x00\x1a\xab2<\xae\x8a\xf5O\xf8e\x1f\x8d\
+\x9f\xf4G\xbc}\xff\x00\x84\xc5\xef\xff\x00\x1a\xa3\xfe\x19\
+G\xe3g\xfd\x11\xef\x1f\x7f\xe11{\xff\x00\xc6\xa8\x03\
+\xca\xe8\xafT\xff\x00\x86Q\xf8\xd9\xff\x00D{\xc7\xdf\
+\xf8L^\xff\x00\xf1\xaa?\xe1\x94~6\x7f\xd1\x1e\xf1\
+\xf7\xfe\x13\x17\xbf\xfcj\x80<\xae\x8a\xf5O\xf8e\x1f\
+\x8d\x9f\xf4G\xbc}\xff\x00\x84\xc5\xef\xff\x00\x1a\xa4\xff\
+\x00\x86S\xf8\xd9\x8f\xf9#\xde>\xff\x00\xc2b\xf7\xff\
+\x00\x8d\xd0\x07\x96Q]\x17\x8c>\x1c\xf8\xb7\xe1\xed\xc2\
+\xc1\xe2\x9f\x0bk>\x1a\x9d\xbe\xecZ\xc6\x9f-\xa3\x9f\
+\xa0\x91G\xf2\xaev\x80\x0a(\xa2\x80\x0a(\xa4\xa0\x05\
+\xa2\xba\x1f\x08\xfc9\xf1g\xc4\x0b\x83\x07\x85\xfc/\xac\
+\xf8\x92e<\xc5\xa3\xe9\xf3]0\xfc#S]\x8f\xfc\
+2\x9f\xc6\xdf\xfa#\xbe>\xff\x00\xc2b\xf7\xff\x00\x8d\
+P\x07\x96\xd1^\xa5\xff\x00\x0c\xa7\xf1\xb3\xfe\x88\xf7\x8f\
+\xbf\xf0\x98\xbe\xff\x00\xe3T\x0f\xd9O\xe3n\x7f\xe4\x8f\
+x\xfb\xff\x00\x09\x8b\xdf\xfe5@\x1e[M\x93\xfd[\
+}\x0d{=\x8f\xecc\xf1\xdfR\xc7\x93\xf0\x8f\xc6\x0b\
+\xe9\xf6\x8d\x22h\x7f\xf45\x15\xe7\x7f\x11\xbe\x1c\xf8\x9b\
+\xe1O\x89.\xbc7\xe2\xdd\x1e\xe3A\xd7-\xe2Ie\
+\xb1\xba\x00H\x8a\xea\x19I\x00\x9e\xaaA\xa0v?\xa3\
+O\xd9\xdf\xfeHG\x80?\xec\x09i\xff\x00\xa2\x96\xbd\
+\x0e\xbc\xf3\xf6w\xff\x00\x92\x11\xe0\x0f\xfb\x02Z\x7f\xe8\
+\xa5\xafC\xa84\x0a(\xa2\x80>?\xff\x00\x82\xab\xc3\
+\xe7~\xc6\xfe\x228\xfb\x97\xb6\x8f\xff\x00\x8f\x9a\xfc'\
+\xaf\xde_\xf8*$^o\xecg\xe3\x13\xfd\xc9m\x9b\
+\xff\x00\x22\x8f\xf1\xaf\xc1\xaah\x89\x05\x15\xb9\xe0\x7f\x03\
+\xeb\xff\x00\x12\xbcUa\xe1\xbf\x0ciW\x1a\xd6\xb7|\
+\xc5-\xec\xad\x80/!\x00\xb1\xeaq\xc0\x04\xe4\xe2\xbd\
+\x97\xfe\x18\x07\xf6\x86\xff\x00\xa2U\xae~Q\x7f\xf1u\
+D\xd8\xf9\xfa\x8a\xfa\x07\xfe\x18\x03\xf6\x86\xff\x00\xa2U\
+\xae~Q\x7f\xf1t\x7f\xc3\x00~\xd0\xdf\xf4J\xb5\xcf\
+\xca/\xfe.\x90\xec\xcf\x9f\xa8\xaf\xa0\x7f\xe1\x80?h\
+o\xfa%Z\xe7\xe5\x17\xff\x00\x17Y\xfe \xfd\x88~\
+9\xf8OD\xbe\xd65\x8f\x87\x1a\xa6\x9b\xa5\xd8\xc2\xd3\
+\xdc\xdd\xdc<I\x1cQ\xa8\xc9bw\xf4\xa0V<:\
+\x8a@s\xcdMgg=\xfd\xd4V\xd6\xb0\xc9ss\
++\x04\x8e\x18P\xbb\xb9=\x02\x802O\xb0\x14\xc0\x8a\
+\x8a\xf6\xff\x00\x05\xfe\xc3\xff\x00\x1e\xbc}3&\x93\xf0\
+\xa7\xc4\x91\x80\xa1\xfc\xcdV\xd0\xe9\xd1\xb0=6\xbd\xc9\
+\x8d[\xfe\x02k\xb8\x87\xfe\x09\x7f\xfbLJ\xb9?\x0e\
+\x16?\xf7\xb5\xdd7\xff\x00\x92\x0d \xb1\xf2\xc5\x15\xf5\
+_\xfc:\xe7\xf6\x96\xff\x00\xa2y\x1f\xfe\x0ft\xef\xfe\
+H\xa3\xfe\x1ds\xfbK\x7f\xd1<\x8f\xff\x00\x07\xbaw\
+\xff\x00$P;3\xe5J+\xe9_\x10\x7f\xc17\x7f\
+i\x0f\x0d\xe9\xf3\xde\xdc\xfc1\xbc\xb8\x82\x15\xdc\xc2\xc3\
+P\xb3\xbb\x94\x8f\xf6c\x8afv\xfa\x05&\xbc#\xc6\
+\x1e\x01\xf1G\xc3\xdb\xf4\xb1\xf1W\x86\xf5\x7f\x0c_\xb0\
+\xde\xb6\xda\xc5\x8c\xb6\x92\x95\xf5\x0b\x22\x82E1X\xc1\
+\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\xf4/\x87\x7f\xb3\xc7\
+\xc4\xff\x00\x8bKo/\x83\xfc\x03\xe2\x1d~\xd2y<\
+\xa5\xbe\xb4\xd3\xa56\x81\xbd\x1a\xe0\x8f-\x7f\xe0L(\
+\x03\xcfh\xaf\xa9!\xff\x00\x82a\xfe\xd2\xf3r>\x1a\
+\x94_\xf6\xf5\xcd4\x1f\xcb\xed\x19\xa1\xbf\xe0\x98\x7f\xb4\
+\xc2\xff\x00\xcd4'\xe9\xae\xe9\xa7\xff\x00ni\x0e\xcc\
+\xf9n\x8a\xfa\x80\xff\x00\xc12\xff\x00iu\xeb\xf0\xca\
+_\xc3Z\xd3\x8f\xfe\xdcUk\xaf\xf8&\xdf\xed%f\
+\xbb\xa4\xf8avG\xfd3\xd4\xac\xa4?\x92\xceM\x01\
+f|\xd1^\x8d\xfb7\xff\x00\xc9\xc0|;\xff\x00\xb0\
+\xed\xaf\xfe\x8c\x15\xca\xf8\xdb\xc0\xfa\xef\xc3\x7f\x15j\x1e\
+\x1a\xf1.\x9b.\x91\xaei\xee#\xba\xb2\x98\x82\xd16\
+\x01\xc1\xc1#\xa1\x1d\x0fz\xea\xbff\xff\x00\xf98\x0f\
+\x87\x7f\xf6\x1d\xb5\xff\x00\xd1\x82\x98\x8f\xe9J\x8a(\xa8\
+5\x1a\xd5\xf3\xcf\xc5\xff\x00\xf9\x1e\xae\xbf\xeb\x94\x7f\xc8\
+\xd7\xd0\xcd_<\xfc_\xff\x00\x91\xea\xeb\xfe\xb9G\xfc\
+\x8d~O\xe2W\xfc\x89\xe3\xfe5\xfa\x9fY\xc3_\xef\
+\xaf\xd1\xfe\x87\x1a\x9fx}\x7f\xad}[\xa4\x7f\xc8.\
+\xcf\xfe\xb9'\xfe\x82+\xe5$\xfb\xc3\xeb\xfdk\xea\xdd\
+#\xfeAv\x7f\xf5\xc9?\xf4\x11_-\xe1o\xf11\
+^\x91\xfdOS\x8av\xa5\xf3\xfd\x0b\xb4QE\x7f@\
+\x9f\x9f\x85\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14\
+Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14\
+Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14\
+Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14\
+Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14\
+Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14\
+Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14\
+Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14\
+Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14\
+Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14\
+Q@\x05\x14Q@\x05\x14Q@\x1f0\xff\x00\xc1L\
+\x7f\xe4\xc7\xbe'\xff\x00\xd7\x0b/\xfd/\xb6\xaf\xca\x0f\
+\xf8&\x8f\xfc\x9f\x07\xc3\x1f\xfa\xeb}\xff\x00\xa4\x175\
+\xfa\xbf\xff\x00\x051\xff\x00\x93\x1e\xf8\x9f\xff\x00\x5c,\
+\xbf\xf4\xbe\xda\xbf(?\xe0\x9a?\xf2|\x1f\x0c\x7f\xeb\
+\xad\xf7\xfe\x90\x5c\xd3\xe8.\xa7\xef\xed\x14QHaE\
+\x14P\x01E\x14P\x07\xe3\xcf\xed\xc9\xe1\xf3\xa3\xff\x00\
+\xc1Q~\x1f\xdf\x95\xda5]S\xc3\xb7 \xfa\xec\xb8\
+\x86\x1c\xff\x00\xe4:\xfd\x85\xeek\xf2s\xfe\x0aew\
+\x15\x9f\xed\xf9\xf0F\xe1~\xfc0i29\x1e\xa3T\
+\x90\xf3\xf8b\xbfX\xa3m\xca\x0f\xa8\x06\x81!\xd4Q\
+E\x03\x0a(\xa2\x80\x0a(\xa2\x80(\xea\x9a=\x96\xbd\
+\xa7\x5c\xe9\xfa\x95\x9c\x1a\x86\x9fu\x19\x8a{K\xa8\x96\
+X\xa5B0U\x91\x81\x0c\x08\xe3\x04W\xe7\xb7\xed\x9d\
+\xff\x00\x04\xac\xf0\xd7\x8c\xb4\x8b\xdf\x16|\x1c\xd3\xe1\xf0\
+\xcf\x89m\xd1\xa5\x9b\xc3\x96\xfcYj\x18\xc9\x22\x15'\
+\x10I\x8e\x02\xae#8\x03j\x9c\xb1\xfd\x17\xa4'\x14\
+\x01\xfc\xb7\xdfX\x5c\xe9w\xd7\x16W\x90\xc9myo\
+#C4\x13)WGRAR\x0fB\x08#\x15\x05\
+~\x8b\x7f\xc1`?f\xfbo\x05\xf8\xe3H\xf8\xad\xa1\
+X-\xb5\x87\x88\xdd\xad5qo\x1e\x11oTee\
+l\x00\x01\x95?\x12\xc8\xe4\x9ek\xf3\xa1\x88PI\xe9\
+Vdv\xff\x00\x06\xfe\x0d\xf8\xaf\xe3\xdf\xc4\x0d7\xc1\
+\xbe\x0d\xd3\x9bP\xd6/NK6V\x1bh\x81\x1b\xa6\
+\x99\xc0;#\x5c\x8c\x93\xea\x00\x05\x88\x07\xf6c\xf6q\
+\xff\x00\x82_\xfc%\xf81\xa7[\xddx\xa3K\xb6\xf8\
+\x8f\xe2\x9cfk\xddn\x01%\x9cD\x80\x0a\xc3j\xc4\
+\xa6\xdc\x8c\x86\x90;g\x90Fp/\x7f\xc15\xff\x00\
+f(~\x00\xfc\x06\xb1\xd5\xb5\x1b?+\xc6^+\x8e\
+=CR\x92T\xc4\x90\xc4Fa\xb7\xe4\x02\x02)\xc9\
+\x19?31\xaf\xaf*M\x12\xb1\x0d\xbd\xac6p\xc7\
+\x0c1\xac0\xc6\xa1\x128\xc6\xd5U\x1d\x00\x155\x14\
+R\x18QE\x14\x00W\xe1\x0f\xfc\x15\x7f\xfeOO\xc5\
+\x9f\xf6\x0d\xd3\xff\x00\xf4\x95+\xf7z\xbf\x08\x7f\xe0\xab\
+\xff\x00\xf2z~,\xff\x00\xb0n\x9f\xff\x00\xa4\xa9M\
+\x09\x9f\xb3_\xb3\xbf\xfc\x90\x7f\x87\xff\x00\xf6\x03\xb4\xff\
+\x00\xd1K^\x89^w\xfb;\xff\x00\xc9\x07\xf8\x7f\xff\
+\x00`;O\xfd\x14\xb5\xe8\x94\x86\x14QE\x00|\xb3\
+\xff\x00\x055\x87\xce\xfd\x8c<z\x7f\xb8\x907\xfeF\
+O\xf1\xaf\xc0\xda\xfe\x80?\xe0\xa4P\xf9\xdf\xb1o\xc4\
+\xbe3\xb2\xd2\x16\xff\x00\xc9\x88\xff\x00\xc6\xbf\x0c\xfe\x0b\
+\xfc+\xd4\xfe6|T\xf0\xd7\x824\x8c\xad\xee\xb3v\
+\x96\xfen\x01\x10\xc7\xd6I\x0eH\xfb\xa8\x18\xf2y\xc0\
+\x1d\xe9\xad\x88\x91\xfa[\xff\x00\x04q\xfd\x9d\x7f\xb2\xfc\
+?\xad|a\xd5aSq\xa8\xef\xd2\xf4`\xc3\xe6H\
+U\xbf} 9\xe3s\x00\xbc\x8e\x89\x90y\xaf\xd3Q\
+\x5c\xf7\x80<\x15\xa6|6\xf0F\x87\xe1m\x1e\x15\x83\
+K\xd1\xec\xe2\xb3\xb7\x8dr\x00DP3\x82O^\xbd\
+{\xd7EH\xb1h\xa2\x8a\x00+\xf3\x1f\xfe\x0b\x01\xfb\
+P>\x8f\xa3\xd8\xfc\x19\xd0/\x1d.\xef\xd5o\xb5\xe6\
+\x85\xca\x95\xb7\xeb\x14\x04\x828c\xf3\x90A\x04\x05\xaf\
+\xbe\xbe8|^\xd1\xbe\x04\xfc-\xf1\x0f\x8d\xb5\xd9\x92\
+;=.\xd9\xa4H\x99\xb6\x99\xe6<G\x12\xf7%\x9b\
+\x03\x81\x9cd\xf6\xaf\xc7_\xd8\xc3\xe0\xbe\xa3\xfbu~\
+\xd5Z\xdf\x8c\xfcr\x9fn\xd0\xadn\x8e\xb3\xad\x89\x10\
+\x18\xee$f>M\xae\x06\x01S\x8ep>\xea\xe0\x8c\
+5\x026\x7fa\xff\x00\xf8&~\xad\xfbAi\xf6\xbe\
+6\xf1\xf5\xcd\xe7\x86|\x09#\x86\xb3\xb4\x86=\x97\xba\
+\xaa\x8e\xac\x85\x87\xee\xa1=\x03\x90Ks\xb4\x01\x86\xaf\
+\xd6\xbf\x84_\xb3\xef\xc3\xbf\x81:O\xd8<\x09\xe1-\
+3\xc3\xa8\xc8#\x96\xe2\xda,\xdc\xce\xa0\xe4\x09gl\
+\xc9&\x0fM\xecq\xda\xbb\xeb[Xl\xad\xe2\xb7\x82\
+$\x86\x08\x94$q\xc6\xa1U\x14\x0c\x05\x00p\x00\x1c\
+b\xa6\xa0\x04\xa5\xa2\x8a\x06\x14QE\x00\x15\x8b\xe2\xbf\
+\x07\xe8~:\xd0\xeeto\x11\xe8\xf6:\xfe\x91p1\
+5\x86\xa5n\x93\xc1'\xa6Q\xc1\x07\x1d\xb8\xe2\xb6\xa8\
+\xa0\x0f\xcb\x1f\xdbS\xfe\x09Kec\xa4\xdfx\xd7\xe0\
+\xa5\xbc\x90\x1bx\xda{\xdf\x09I+H\x19G%\xed\
+]\x89`q\x93\xe5\xb1 \xff\x00\x09\x1c-~[I\
+\x1b\xc5#\xa4\x8a\xc9\x221VV\x04\x15#\x82\x08\xec\
+k\xfa\x97\xaf\xc4\x9f\xf8*\xd7\xec\xd7i\xf0s\xe35\
+\xa7\x8ct\x0b\x04\xb2\xf0\xd7\x8b\xd5\xe6\x92\x18c\x09\x14\
+7\xcas*\xae\x0f\x1b\xc1\x0f\x80\x00\x1c\xd3D\xb4|\
+;]g\xc2\xbf\x85~'\xf8\xd5\xe3\xad3\xc1\xfe\x0f\
+\xd3$\xd5\xb5\xcdA\xf6\xc7\x0ap\xb1\xa8\xfb\xd2H\xe7\
+\x84E\x1c\x96=\x07\xbe\x05rD\xe3'\xb5~\xe3\x7f\
+\xc10\x7fe\xbb\x7f\x81\xff\x00\x04\xed\xfcY\xaa\xdaI\
+\x1f\x8c\xbc]\x0a]\x5c\x9b\x88\xf6\xbd\xb5\xa9\xe6\x18\x00\
+*\x08\xe3\xe7=rH\xc52R\xb97\xec\xb9\xff\x00\
+\x04\xc6\xf8g\xf06\xc2\xdbS\xf1U\x95\xaf\xc4?\x18\
+\xfc\xb2=\xe6\xa9\x06\xfb+W\x03\xa4\x16\xed\x958<\
+\x89\x1c3d\x026t\xaf\xb2\xe3E\x8d@^\x07L\
+\x0aZZ\x93@\xa2\x8a(\x00\xa4\xa5\xa2\x80?\x9f\x9f\
+\xf8(\xc4~_\xed\x9d\xf1'\xfd\xab\xa8\x9b\xf3\x89+\
+\xcc\xff\x00f\xff\x00\xf98\x0f\x87_\xf6\x1d\xb5\xff\x00\
+\xd1\x82\xbdw\xfe\x0aik\xf6o\xdb3\xc7<c\xcc\
+\x16\xf2~q\x0f\xf0\xaf\x22\xfd\x9b\xff\x00\xe4\xe0>\x1d\
+\xff\x00\xd8v\xd7\xff\x00F\x0a\xae\x86}O\xe9J\x8a\
+(\xa94\x1a\xd5\xf3\xcf\xc5\xff\x00\xf9\x1e\xae\xbf\xeb\x94\
+\x7f\xc8\xd7\xd0\xcd_<\xfc_\xff\x00\x91\xea\xeb\xfe\xb9\
+G\xfc\x8d~O\xe2W\xfc\x89\xe3\xfe5\xfa\x9fY\xc3\
+_\xef\xaf\xd1\xfe\x87\x1a\x9fx}\x7f\xad}[\xa4\x7f\
+\xc8.\xcf\xfe\xb9'\xfe\x82+\xe5$\xfb\xc3\xeb\xfdk\
+\xea\xdd#\xfeAv\x7f\xf5\xc9?\xf4\x11_-\xe1o\
+\xf11^\x91\xfdOS\x8av\xa5\xf3\xfd\x0b\xb4QE\
+\x7f@\x9f\x9f\x85\x14Q@\x1e=\xf1\xb3\xf6\xb6\xf8Q\
+\xfb:\xea\xdan\x99\xf1\x07\xc5\x8b\xa0_j0\xb4\xf6\
+\xd0\x8b\x0b\xab\xa2\xe8\xa4\x02\xc7\xc8\x89\xf6\xf2G\xde\xc6\
+{W\x9c\xff\x00\xc3\xcf\xff\x00fo\xfa)\x7f\xf9A\
+\xd4\xff\x00\xf9\x1a\xbf.\x7f\xe0\xa7^;\xff\x00\x84\xe7\
+\xf6\xc6\xf1xTE\x8fD\x86\xdfHFB\x08\x7f-\
+7\x93\xd7\xaee#\xf0\xaf\x95)\xd8\x9ec\xf7\xc3\xfe\
+\x1e}\xfb3\xee\xc0\xf8\x96\x07\xd7B\xd4\xff\x00\xf9\x1a\
+\xbe\x9b\xd1u\x8b?\x10\xe8\xf6:\xae\x9d8\xb9\xd3\xef\
+\xa0\x8e\xe6\xdee\x04\x09#u\x0c\x8c\x01\xe7\x90A\xe7\
+\xd6\xbf\x976\x1b\x94\x8fZ\xfe\x83\xbf\xe0\x9f\xff\x00\x13\
+\x13\xe2\x97\xec\x97\xe0\x1dE\xef\x96\xfbP\xb1\xb4:]\
+\xeb\x00G\x97,\x04\xa0C\x9e\xa4G\xe5\xf229\xa3\
+a\xa7s\xe8\xba))i\x0c(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xaf+\xff\x00\x86\xac\xf8'\xff\x00E\x8b\xc0?\
+\xf8S\xd9\x7f\xf1\xda?\xe1\xab>\x09\x7f\xd1b\xf0\x0f\
+\xfe\x14\xf6_\xfcv\x80=R\x8a\xf2\xbf\xf8j\xcf\x82\
+\x7f\xf4X|\x03\xff\x00\x85=\x97\xff\x00\x1d\xa6\xff\x00\
+\xc3X\xfc\x12\xff\x00\xa2\xc3\xe0?\xfc)l\xbf\xf8\xed\
+\x00z\xb5\x15\xe4\xdf\xf0\xd6\x9f\x04?\xe8\xb0x\x13\xff\
+\x00\x0a;?\xfe9I\xff\x00\x0ds\xf0?\xfe\x8a\xff\
+\x00\x81\xbf\xf0\xa1\xb4\xff\x00\xe3\x94\x01\xebTW\x91\x7f\
+\xc3^|\x0e\xef\xf1\x7f\xc0\xff\x00\xf8PZ\xff\x00\xf1\
+t\xc3\xfb`\xfc\x0d\x04\x8f\xf8[\xbe\x0a\xff\x00\xc1\xf5\
+\xb7\xff\x00\x17@\x1e\xc1Ex\xe9\xfd\xb1>\x06\x7f\xd1\
+]\xf0_\xfe\x0f-\xff\x00\xf8\xbao\xfc6G\xc0\xbe\
+\x9f\xf0\xb7|\x19\xf8kp\x1f\xfd\x9a\x80=\x92\x8a\xf1\
+\x93\xfbf|\x09\x1c\x7f\xc2\xdd\xf0w\xfe\x0e`?\xfb\
+50\xfe\xda?\x02U\xb0~-\xf8C\xff\x00\x06\xf0\
+\x9f\xeb@\x1e\xd3Ex\xa9\xfd\xb5>\x03\x8f\xf9\xab~\
+\x12\xff\x00\xc1\xac_\xe3L\xff\x00\x86\xd8\xf8\x0c\xa7\x07\
+\xe2\xd7\x84\xff\x00\xf0g\x19\xfe\xb4\x01\xed\xb4W\x887\
+\xed\xb9\xf0\x15\x7f\xe6\xadxW\xff\x00\x06)\xfe4\xd3\
+\xfbp|\x04\x1f\xf3V|/\xf8j\x0b@\x1e\xe3E\
+x[~\xdc\x9f\x00\xd7\xaf\xc5\x8f\x0c~\x17\xa3\xfc)\
+\x1b\xf6\xe8\xf8\x02\xbf\xf3V<2~\x97\x83\xfc(\x03\
+\xddh\xaf\x08o\xdb\xb3\xe0\x02\xff\x00\xcdW\xf0\xdf\xfe\
+\x05\x7f\xf5\xa9\x8d\xfbx~\xcf\xeb\xd7\xe2\xbf\x87\x7f\x0b\
+\x82\x7f\xa5\x00{\xd5\x15\xe0G\xf6\xf4\xfd\x9fW\xaf\xc5\
+o\x0f\xfe\x12\xb1\xfeKLo\xdb\xe7\xf6{^\xbf\x15\
+t\x1f\xc1\xe4?\xfb%\x00}\x01E|\xf8\xdf\xb7\xff\
+\x00\xec\xf4\xa3'\xe2\xa6\x89\xff\x00\x012\x9f\xfd\x92\x98\
+\xdf\xf0PO\xd9\xe5F\x7f\xe1i\xe8\xdf\x82\xcc\x7f\x92\
+P\x06?\xfc\x14\xc7\xfeL{\xe2\x7f\xfdp\xb2\xff\x00\
+\xd2\xfbj\xfc\xa0\xff\x00\x82h\xff\x00\xc9\xf0|1\xff\
+\x00\xae\xb7\xdf\xfaAs_{\xfe\xde_\xb6G\xc1\x8f\
+\x8a\x1f\xb2o\x8f\xfc1\xe1o\x1f\xe9\xba\xce\xbf\xa8E\
+h-lm\xd6]\xf2\x94\xbc\x82F\xc1(\x07\x0a\x8c\
+z\xf6\xaf\x82?\xe0\x9a?\xf2|\x1f\x0c\x7f\xeb\xad\xf7\
+\xfe\x90\x5c\xd3\xe8.\xa7\xef\xed\x14QHaE\x14P\
+\x01E\x14\x8d\xd2\x80?\x14\xff\x00\xe0\xa5>({\xaf\
+\xf8(&\x9b\x139\xc6\x88tx\x97\xdb&9\xb8\xff\
+\x00\xbf\x95\xfbMf\xdb\xedaoTS\xfaW\xf3\xb9\
+\xfbW\xfcL?\x11\xbfkO\x1dx\xa4^\xad\xed\xa7\
+\xf6\xfbGgr\x83\x00\xda\xc1 H\x7f(\xe3Q\xf8\
+W\xec\xc6\x9f\xff\x00\x05\x09\xfd\x9ec\xb0\xb6G\xf8\xa3\
+\xa4\xab\xacJ\x18\x18\xae88\x19\xff\x00\x96t\xc9G\
+\xd2TW\xce\xbf\xf0\xf0\xcf\xd9\xdb\xfe\x8a\x96\x93\xff\x00\
+~\xae?\xf8\xdd\x1f\xf0\xf0\xcf\xd9\xdb\xfe\x8a\x96\x93\xff\
+\x00~\xae?\xf8\xdd\x22\x8f\xa2\xa8\xaf\x9d\x7f\xe1\xe1\x9f\
+\xb3\xb7\xfd\x15-'\xfe\xfd\x5c\x7f\xf1\xbaF\xff\x00\x82\
+\x87~\xce\xca\xa4\x9f\x8aZO\xfd\xf9\xb8\xff\x00\xe3t\
+\x01\xf4]\x15\x9d\xa0\xebv>$\xd1\xacum2\xe1\
+n\xf4\xeb\xd8V\xe2\xdet\x04\x09#a\x95a\x90\x0e\
+\x089\xe7\xd6\xb4h\x00\xa2\x8a(\x03\xe4\xef\xf8*\x17\
+\x84\xec\xfcM\xfb\x18x\xd6\xe2\xeb>f\x8d%\xae\xa5\
+m\xb7\xfez\xac\xc9\x17?\xf0\x19Z\xbf\x18\xff\x00f\
+\x8f\x87'\xe2\xd7\xed\x01\xe0\x0f\x094\x11\xddA\xa9j\
+\xf0\x0b\x88e\xfb\x92@\x87\xcc\x99O\xb1\x8d\x1cc\xde\
+\xbfm\xff\x00\xe0\xa4\x1f\xf2d\x9f\x14\xbf\xeb\xca\xdf\xff\
+\x00J\xe0\xaf\xcb\xcf\xf8%7\x84\xad\xfcQ\xfbc\xe8\
+\x13\xdc\x16\x07F\xd3\xaf58q\xdd\xc2\xacC>\xd8\
+\x99\xa9\xf4%\xee~\xea\xdb\xc1\x1d\xad\xbcp\xc2\x828\
+\xa3P\x88\xab\xd0(\x18\x02\xa4\xa2\x8aE\x05\x14Q@\
+\x05\x15OR\xd5,\xb4{V\xb9\xbf\xbb\x82\xca\xd9N\
+\x0c\xd72\x08\xd0}K\x1cW\x1b\xa9\xfe\xd0\x1f\x0b\xf4\
+\x5c\x8dG\xe2G\x84l1\xd7\xed:\xed\xac\x7f\xceA\
+@\x1d\xf5~\x10\xff\x00\xc1W\xff\x00\xe4\xf4\xfcY\xff\
+\x00`\xdd?\xff\x00IR\xbfc\x0f\xedQ\xf0Y\x7f\
+\xe6\xaf\xf8\x0b\xff\x00\x0ak/\xfe;_\x8b\x7f\xf0S\
+O\x18h><\xfd\xae<O\xacxg[\xd3|C\
+\xa4Mab\x91\xea\x1aU\xdcwV\xee\xcbn\xa1\x80\
+\x91\x18\xa9 \xf0@<\x1ahL\xfd\xb2\xfd\x9d\xff\x00\
+\xe4\x83\xfc?\xff\x00\xb0\x1d\xa7\xfe\x8aZ\xf4J\xf3\xcf\
+\xd9\xdf\xfeH?\x80?\xec\x09i\xff\x00\xa2\x96\xbd\x0e\
+\x90\xc2\x8a(\xa0\x0f\x9c\x7f\xe0\xa2K\xbb\xf6+\xf8\xab\
+\xff\x00`\xe8\xcf\xe5q\x15|\xa9\xff\x00\x04r\xfd\x9d\
+N\x9b\xa1k\x7f\x18uh1q\xa8\xef\xd2\xf4`\xc3\
+\x95\x81O\xef\xa4\x04\x1f\xe2`\x17\x04tL\x83\xcd}\
+\xbb\xfbV\xfc1\xd4~3|\x01\xf1w\x82t\x9c\x0b\
+\xedj(-U\xc9\x03b}\xa2##\xf2@%P\
+3c#8\xc5w?\x0f\xbc\x0f\xa6|5\xf0F\x85\
+\xe1m\x16\x01o\xa5\xe8\xf6q\xd9[F3\xc2\x22\x81\
+\xdc\x9e\xb8\xcf^\xf4\x01\xd1\x0aZ(\xa0\x02\x934\xb5\
+\xe1?\xb6g\xed\x1dg\xfb1\xfc\x0d\xd6|R\xce\x92\
+k\x93\xa9\xb2\xd1\xedL\x8a\xad-\xd3\x82\x15\xb0A\xca\
+\xa7.x#\x80\x0e3@\x1f\x9d?\xf0W/\xda\x80\
+\xf8\xf3\xe2\x0d\xaf\xc2}\x0a\xf1\x8e\x89\xe1\xa9<\xedX\
+\xc6\xcc\x16{\xf28C\xce\x08\x89N9\x1c3\x1c\x1a\
+\xfb'\xfe\x09c\xf0\x95>\x1a\xfe\xca:.\xab$q\
+\xff\x00h\xf8\xaeV\xd6&\x927f\xdd\x1b|\xb0\x82\
+\x08\x18!\x00\xce8\xfa\xd7\xe1\xad\xe5\xc5\xff\x00\x89\xb5\
+\x89\xa7\x99\xde\xfbT\xd4\xae\x0b;\x9f\xbd4\xd27_\
+\xa9&\xbf\xa6\x1f\x85\x1e\x1c\xb7\xf0\x8f\xc3\x1f\x0ah\xb6\
+\x96\xa2\xce\x0b\x1d.\xda\x05\x81\x7f\x83\x11\xaeG\xe7\x9a\
+d\xa3\xac\xa2\x8a)\x14\x14QI@\x0bE~L\xfe\
+\xd3\x1f\xf0T\xaf\x8c\x1f\x08><x\xf3\xc1\x9a&\x9b\
+\xe1It\x9d\x0fS\x92\xce\xd5\xefl'y\x8a(\x18\
+.\xcb:\x82y\xec\x05~\xa7x7V\x9b^\xf0\x86\
+\x87\xa9\xdc\x84[\x8b\xdb\x18.e\x11\x82\x143\xc6\xac\
+p\x0fl\x9a\x00\xd8\xa2\x8a(\x00\xaf\x89\xff\x00\xe0\xad\
+\xde\x07\x87\xc4\xff\x00\xb2}\xd6\xad\xf6$\xb8\xbe\xd0u\
+;{\xb8\xa79\xdd\x0clJJG\xd4\x109\xaf\xb6\
++\xe7_\xf8(U\xba\x5c~\xc6\x7f\x14\xf7\x8c\xf9z\
+_\x98>\xa2T\xa0\x0f\xc2\xdf\x80\xbf\x0f\xe6\xf8\xa9\xf1\
+\xaf\xc1\x1e\x12\x868e:\xae\xado\x03\xa5\xc1\xc4m\
+\x18p\xce\x09\xc1\xe0\xaa\xb5\x7fJ\xb66pi\xb6V\
+\xf6\x96\xb1,\x16\xd6\xf1\xacQF\x83\x84E\x18P=\
+\x80\x02\xbf\x9f_\xf8'\xbd\xaa]\xfe\xd9_\x0b\x83\xf4\
+\x8fRiG\xd4D\xf8\xaf\xe8@t\x14\xd91\xd8Z\
+(\xa2\x91AE\x15\xcc\xf8\xdb\xe2W\x84\xbe\x1a\xd9\xdb\
+\xdd\xf8\xbb\xc5:/\x85mn$1C>\xb5\xa8\xc3\
+f\x928\x19*\xad+(c\x8ep(\x03\xa6\xa2\xbc\
+\xaf\xfe\x1a\xb3\xe0\x9f\xfd\x16\x1f\x00\xff\x00\xe1Oe\xff\
+\x00\xc7h\xff\x00\x86\xac\xf8'\xff\x00E\x8b\xc0?\xf8\
+S\xd9\x7f\xf1\xda\x00\xfcv\xff\x00\x82\xab[\xfd\x9b\xf6\
+\xcb\xf1\x1f\x18\xf3,,\xe4\xfc\xe3?\xe1^\x15\xfb7\
+\xff\x00\xc9\xc0|;\xff\x00\xb0\xed\xaf\xfe\x8c\x15\xed\xdf\
+\xf0T/\x19xs\xc7\x9f\xb5u\xf6\xaf\xe1m{K\
+\xf1&\x95&\x8fd\x82\xfbH\xbc\x8e\xea\x02\xea\xac\x19\
+|\xc8\xd8\xaeG\x19\x19\xef^#\xfb7\xff\x00\xc9\xc0\
+|;\xff\x00\xb0\xed\xaf\xfe\x8c\x15]\x08\xea\x7fJT\
+QEIcZ\xbey\xf8\xbf\xff\x00#\xd5\xd7\xfdr\
+\x8f\xf9\x1a\xfa\x19\xab\xe7\x9f\x8b\xff\x00\xf2=]\x7f\xd7\
+(\xff\x00\x91\xaf\xc9\xfcJ\xff\x00\x91<\x7f\xc6\xbfS\
+\xeb8k\xfd\xf5\xfa?\xd0\xe3S\xef\x0f\xaf\xf5\xaf\xab\
+t\x8f\xf9\x05\xd9\xff\x00\xd7$\xff\x00\xd0E|\xa4\x9f\
+x}\x7f\xad}[\xa4\x7f\xc8.\xcf\xfe\xb9'\xfe\x82\
++\xe5\xbc-\xfe&+\xd2?\xa9\xeaqN\xd4\xbe\x7f\
+\xa1v\x8a(\xaf\xe8\x13\xf3\xf0\xac\xcf\x11\xeb\x09\xe1\xff\
+\x00\x0f\xeaz\xa4\xbb|\xbb+in[q\xc0\xc2!\
+nO\xe1Zu\xf3\x0f\xfc\x14\x93\xc7\x9f\xf0\x80\xfe\xc7\
+~=\x94&\xf9uH\x13HL6\xd2\xa6w\x08[\
+\xf0\x04\x9e(\x03\xf0w\xc6^#\x7f\x18x\xc3^\xd7\
+\xde?)\xf5k\xfb\x8b\xf6\x8f\xfb\xbel\xac\xf8\xfc7\
+T\x1a/\x87\xb5\x1f\x115\xfa\xe9\xd6\xaftl\xad%\
+\xbe\xb8\xd8?\xd5\xc1\x1a\xeew>\xc0VwN+\xee\
+o\xf8&\x97\xc1\x11\xf1O\xc2\xff\x00\x1e\xaen\xe3_\
+\xec\xf9<+.\x8a\xb3\xa8\xfd\xecsL\x0b\xe5\x0fl\
+\xacd~5Fi\x5c\xf8f\xbfZ?\xe0\x8a\xff\x00\
+\x12\x92\xf7\xc0\xfe<\xf0\x1d\xc5\xeay\xf6\x17\x91\xea\xb6\
+vx;\xbc\xa9\x17d\xb2g\xa67\xacc\xaey\xaf\
+\xc9e\x05F\x18a\x87\x04\x1fZ\xfb\x1f\xfe\x09K\xf1\
+-<\x03\xfbY\xe9zm\xcd\xe4vv>%\xb2\x9b\
+K\x7f0\x1f\xdeK\x8d\xf0\xa0\xc7s\x22\x81\xcd\x03\x8e\
+\xe7\xee\x95\x14\x94\xb5%\x854\xad.k\xe4o\xda\xb7\
+\xfe\x0aI\xf0\xf3\xf6e\xd5n|5ok?\x8d<\
+o\x0a\x83.\x91\xa7\xcc\xb1CjH\xc8[\x8b\x82\x08\
+F#\x9d\xaa\xae\xc3\x8c\x80\x084\x01\xf5\xcd-~%\
+x\xc7\xfe\x0b\x05\xf1\xcb\xc4\x12J\xba5\xb7\x86|/\
+\x01v1\x1bM=\xa7\x95W<\x06i\x9d\xd4\x901\
+\xc8E\xcf\x5c\x0e\x95\xcd\xe8\x7f\xf0U\xcf\xda/I\xbc\
+\x13\x5c\xf8\x9bK\xd6\xa2\x07&\xde\xff\x00F\xb7X\xcf\
+\xb6aX\xdb\xf2jd\xf3#\xf7_o4\xea\xfc\xc4\
+\xfd\x9f\xff\x00\xe0\xb3\x16:\xc6\xa9k\xa4\xfc]\xf0\xbc\
+:\x1a\xcf&\xd3\xe2/\x0f\x99\x1e\xda,\x90\x01\x96\xd9\
+\xcbH\xaa9%\xd1\xdc\xf4\xc2W\xe9N\x83\xaei\xfe\
+&\xd1\xec\xb5]&\xf6\x0dGL\xbc\x89g\xb7\xbb\xb5\
+\x90I\x14\xb1\xb0\xca\xb2\xb0\xe0\x82)\x14iR\x13K\
+_\x9a\x1e?\xff\x00\x82\xcd\x7f\xc2\x0f\xe3\xdf\x12\xf8k\
+\xfe\x14\xff\x00\xdb\x7f\xb1\xb5;\xad;\xed_\xf0\x93y\
+~w\x93+G\xbfo\xd8\xce\xdc\xed\xce2q\x9cd\
+\xd0+\xd8\xfd/\xa2\xbf-m\xbf\xe0\xb7\x86\xe2\xea\x18\
+\xbf\xe1K\xe3\xccuL\xff\x00\xc2U\xd3'\x19\xff\x00\
+\x8f*\xfbC\xf6\x8c\xfd\xb1<\x15\xfb3|3\xd3|\
+Q\xe2\x7f2\xe3S\xd5\xa1G\xd3<?g\x22\x9b\xab\
+\xb7*\xac\xd8\xce\x02\xc6\x9b\x86\xe9\x0f\x03\x8e\x09!H\
+\x07\xbc\xd2\xd7\xe2\x17\xc4/\xf8+\xb7\xc7O\x15jR\
+\xc9\xe1\xd7\xd1<\x15\xa7\x89\x18\xc3oe`\x97r\xec\
+\xcf\xca\xb2I8`\xcd\x8e\x0b* >\x82\xbfT?\
+c\x1f\x89\xda\xff\x00\xc6O\xd9\x8f\xc0\x9e2\xf1E\xcc\
+w\x9a\xfe\xabk+\xddO\x0c+\x0a;-\xc4\xb1\x82\
+\x15p\x07\xca\x83\xa0\xa0/s\xdbi\x1a\xb0\xbci\xe3\
+}\x07\xe1\xcf\x86o\xfcE\xe2mZ\xd7C\xd1,S\
+\xcc\xb8\xbe\xbc\x90$h:\x0e{\x92H\x00\x0eI \
+\x0ek\xf3O\xe3\x87\xfc\x16\x81mu+\x8d?\xe17\
+\x83\xa1\xbd\x82\x19\x0a\xae\xb9\xe2c \x8eu\x04\x82R\
+\xd66F\x00\xf0\xca\xcd 8<\xa04\x05\xcf\xd4\x9a\
+Z\xfc%\xd6\xff\x00\xe0\xab\x9f\xb4^\xadte\xb4\xf1\
+>\x97\xa3FND\x16:-\xbb'\xfeFW?\xad\
+t^\x11\xff\x00\x82\xc0|u\xd0Z5\xd5\xa2\xf0\xcf\
+\x8a\x22\xdc7\x9b\xdd9\xa1\x90\x8e\xe04.\x8a\x0f\xbe\
+\xd3\xf4\xa7as#\xf6\xe2\x8a\xf9\x03\xf6W\xff\x00\x82\
+\x96\xfc9\xfd\xa4\xb5K\x7f\x0e\xea\x10I\xe0?\x19\x5c\
+H\x12\xdbJ\xd4\xae\x16X/\x18\x93\xb5`\xb8\x0a\xa1\
+\x9f\x81\xf2:\xa3\x12@P\xdc\xe3\xeb\xe1H\xa1h\xa2\
+\xbc\x0f\xf6\x9e\xfd\xb4\xbe\x1c~\xcazj\x0f\x14_I\
+\x7f\xe2\x1b\x88\xc4\xb6\x9e\x1d\xd36\xc9y2\x93\xb4H\
+\xc0\x90\xb1\xc7\x90\xdf3\x91\x9d\xad\xb41\x18\xa0\x0f|\
+\xa2\xbf\x1a\xfe \x7f\xc1f\xbe)\xebw\xf7\x0b\xe1\x1f\
+\x0a\xf8s\xc2\xfai\x03\xca\x17\x8b-\xfd\xda\x9crL\
+\x9b\xa3\x8c\xfa\xff\x00\xab\xe3\xa6Myw\xfc=?\xf6\
+\x90\x17^w\xfc&\xd6f<\xe4\xc3\xfd\x89e\xb3\xe9\
+\x9f+w\xebL\x9b\xa3\xf7\x96\x92\xbf\x1b\xfe\x1e\x7f\xc1\
+g>'\xe8w\xf0/\x8c<)\xe1\xdf\x14i\xaa\x08\
+\x97\xec\x22]>\xed\xce8\x22M\xd2F0pq\xe5\
+s\x8223\x91\xfaG\xfb4\xfe\xd7\x7f\x0e\xff\x00j\
+\x8d\x01\xef<#\xa8<\x1a\xad\xaca\xef\xf4\x1dAD\
+w\xb6\x9c\xed\xdcT\x12\x19\x09\xc6\x1d\x09\x1f2\x83\x83\
+\xc5!\xdc\xf6\xdc\x0aZL\xf6\xaf\x87\xff\x00l\x0f\xf8\
+)q\xfd\x94\xbe/\x7f\xc2\x0d\xff\x00\x0a\xe3\xfe\x12\x8f\
+\xf8\x97C\x7f\xf6\xff\x00\xed\xcf\xb1\xff\x00\xacg\x1b6\
+}\x9aN\x9e_]\xdc\xe7\xa7\x14\x0c\xfb\x86\x8a\xfc\xb2\
+\xff\x00\x87\xe1\xff\x00\xd5\x15\xff\x00\xcb\xab\xff\x00\xb8\xab\
+\xea\xbd?\xf6\xf9\xf0f\x9f\xfb)\xf8w\xe3g\x8c\xac\
+\x9f\xc3\x91k\x8b:\xd9\xf8v\xd6\xe4^]O4s\
+\xcb\x10\x8a\x22V=\xe4\xf9[\x89!UA\xe4\xe0f\
+\x81]\x1fQQ_\x8a\xbf\x13\xff\x00\xe0\xb0\x9f\x18\xbc\
+U\xa8\x5c\x0f\x08X\xe8\xbe\x07\xd2\xf7f\xdc-\xbf\xdb\
+\xee\xd5p\x07\xcf,\xbf\xbbnrx\x89p\x0e9\xeb\
+T<\x03\xff\x00\x05z\xf8\xe5\xe1{\xe8\x0f\x88WA\
+\xf1\x95\x8f\x98\xa6h\xef,\x05\xac\xe53\xc8G\x80\xaa\
+\xab\x100\x19\x91\xb1\xe8zS\x0b\xa3\xf6\xe6\x8a\xf0\x0f\
+\xd9G\xf6\xca\xf0G\xedg\xe1\xb9\xae4\x13&\x91\xe2\
++\x14\x0d\xa8\xf8z\xf2E3\xdb\xe7\x03\xccB1\xe6\
+\xc5\xb8\xed\x12\x00;nU$\x03\xef\xc2\x90\xc5\xa6\x95\
+\xa7W\xc9\x7f\xb5\x97\xfc\x14k\xe1\xef\xec\xbf\xa8\xcf\xe1\
+\xd5\xb6\x9b\xc6>7\x8d\x03\xbe\x8b\xa7L\xb1Gk\xbb\
+\x05E\xcc\xe40\x88\x95;\x82\x85f\xc1\x04\xa8\x0c\x09\
+\x00\xfa\xce\x96\xbf\x13|a\xff\x00\x05\x86\xf8\xe1\xe2\x09\
+\xa7]\x1a\xcb\xc3>\x18\xb7.L?e\xb0{\x89\xd5\
+s\xc0f\x9aGV c$ \xcf\xa0\xe9\x5c}\x8f\
+\xfc\x15K\xf6\x8f\xb4\xba\x12\xcb\xe3++\xd8\xf3\x9f&\
+}\x16\xcc!\xf6\xcaD\xad\x8f\xa1\xa6O2?x\xa9\
++\xf1\xef\xe1\xdf\xfc\x16\x8f\xe2\x1e\x95\xa9D<m\xe0\
+\xaf\x0f\xf8\x83M\xdb\xb5\xce\x90\xd3X\x5c\xe7#\xe7\xdc\
+\xcd*\x1c\x0c\xfc\xbb\x179\x1f0\xef\xfaC\xfb7\xfe\
+\xd5\x9e\x00\xfd\xa9|-6\xad\xe0\xcdBE\xba\xb5!\
+o\xf4{\xf4\x11^\xd9\xb1$.\xf4\x04\x82\xad\x8c\x87\
+B\xcazgpe\x08w\xb9\xec\x94R\x0aZ\x06\x14\
+W\xcf\xdf\xb5'\xed\xb3\xf0\xeb\xf6Q\xb1\x8e?\x12]\
+\xcb\xaax\x96\xe6/:\xcf\xc3\xbaf\xd7\xba\x953\x81\
+#\xe4\x85\x8a2r79\x19\xda\xdbC\x95 ~r\
+x\xff\x00\xfe\x0b)\xf1k^\xbe\xb9\x1e\x15\xf0\xe7\x87\
+|'\xa7><\x914r_]\xc7\xc0\x07t\x8c\xcb\
+\x1bs\x93\xfe\xa8v\x1d\xb3@\xae~\xceQ_\x83\xf6\
+?\xf0UO\xda:\xd2\xf8O/\x8b\xecob\x07?\
+f\x9fE\xb4\x11\xfd\x09H\xd5\xb1\xf4j\xfa\x0f\xe0\xaf\
+\xfc\x16\x8bR\x8fP\x8e\xd3\xe2\xbf\x83-g\xb1\x91\xc2\
+\xff\x00kx[tr@\xb89/o+\xb0\x93\x9c\
+\x12VD\xc0\xce\x15\x8d0\xba?Wh\xaes\xc0>\
+?\xf0\xf7\xc5\x1f\x08\xe9\x9e(\xf0\xae\xabo\xadh\x1a\
+\x94^u\xad\xed\xb9;]rA\x04\x1c\x15`AR\
+\xac\x03)\x04\x10\x08\x22\xba!Hb\xd3J\xd21\xc6\
+\xec\x9c\x0a\xfc\xfb\xfd\xa4?\xe0\xaf^\x09\xf8u\x7f{\
+\xa1|4\xd2G\x8f\xb5xK\xc4\xda\xbc\xb3\x18t\xb8\
+\xa4\x00\x80P\xa8/r\x03\x0ev\xecV\x1c\xac\x84s\
+@\x1f\xa0\xd4\xb5\xf8m\xe2\xaf\xf8+\x87\xed\x05\xaf\xc9\
+\xba\xc3P\xd0<2\xbd\x93L\xd2RA\xff\x00\x93\x0d\
+)\xa6\xf8_\xfe\x0a\xdb\xfbAxz]\xf7\xfa\x96\x83\
+\xe2e\xff\x00\x9ez\xa6\x92\xa8?\xf2]\xa24\xc9\xe6\
+G\xee]\x15\xf0w\xec\xb3\xff\x00\x05]\xf0_\xc6m\
+b\xcb\xc2\xfe;\xd3\x17\xc0>%\xb8\xdb\x14\x17\x8dq\
+\xe6\xe9\x97\x92\xe1F\xd0\xe4\x06\x81\x99\x8bmW\xdc\xa0\
+\x0c\x19\x0b\x15\x07\xef\x00r)\x14\x7f-\x14QEY\
+\x90QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00Wu\xf0\
+7\xe0\xee\xb5\xfb@|U\xd0|\x01\xe1\xeb\x9b\x1b-\
+gYi\x96\xde}JGKt\xf2\xe0\x92f\xdeQ\
+\x1d\x87\xcb\x1b\x0e\x14\xf2@\xe3\xa8\xe1k\xe9\xcf\xf8&\
+o\xfc\x9f\x17\xc3\x0f\xfa\xeb\xa8\x7f\xe9\xba\xea\x90-\xcf\
+\x5c\xff\x00\x87/\xfcm\xff\x00\xa1\xa3\xc0?\xf80\xbd\
+\xff\x00\xe4:?\xe1\xcb\xff\x00\x1b\x7f\xe8h\xf0\x0f\xfe\
+\x0c/\x7f\xf9\x0e\xbfh(\xa5v_*?\x17\xff\x00\
+\xe1\xcb\xff\x00\x1b\x7f\xe8h\xf0\x0f\xfe\x0c/\x7f\xf9\x0e\
+\x8f\xf8r\xff\x00\xc6\xdf\xfa\x1a<\x03\xff\x00\x83\x0b\xdf\
+\xfeC\xaf\xda\x0a(\xbb\x0eT~/\xff\x00\xc3\x97\xfe\
+6\xff\x00\xd0\xd1\xe0\x1f\xfc\x18^\xff\x00\xf2\x1d\x1f\xf0\
+\xe5\xff\x00\x8d\xbf\xf44x\x07\xff\x00\x06\x17\xbf\xfc\x87\
+_\xb4\x14Qv\x1c\xa8\xfc_\xff\x00\x87/\xfcm\xff\
+\x00\xa1\xa3\xc0?\xf80\xbd\xff\x00\xe4:\xf5\xff\x00\xd9\
+\x0f\xfe\x09\x83\xf1O\xe0\x0f\xed\x19\xe0\xef\x1fx\x87_\
+\xf0}\xe6\x8f\xa3Ir\xf7\x10i\x97\x97op\xdee\
+\xb4\xb1.\xc5{dS\xf3H:\xb0\xe0\x1f\xa5~\xa0\
+R\xd0;\x05\x14QHaE\x14P\x02\x1a\xf2_\xda\
+\xab\xe2\xf2|\x0b\xfd\x9f|o\xe3\x11q\xf6{\xeb\x1d\
+=\xe3\xb0a\xb4\xb7\xda\xe5\xfd\xdc\x04)\xe1\xb6\xbb+\
+\x11\x83\xc2\x9e+\xd6\xeb\xf2'\xfe\x0b\x0b\xfbJ[\xf8\
+\xab\xc5Z?\xc2-\x16\xe1f\xb2\xd0$\xfe\xd1\xd6d\
+\x8d\xf7+^2\xe2(\xb1\xb7\x83\x123\x12Cu\x94\
+\xa9\x00\xa5\x02g\xe6\xf4\x92\xbd\xc4\x8f,\x872HK\
+\xb7\x1d\xc9\xc95\xea?\x08\xbfe\xdf\x8a\xdf\x1d\xd4K\
+\xe0o\x03j\xba\xed\x96Y\x7f\xb4\x02,\x16[\x97\xef\
+/\xda%+\x16\xe1\xfd\xdd\xd9\xf6\xaf\xbf\x7f`?\xf8\
+&.\x9fy\xa2i\xdf\x11\xbe3i_k\x96\xe9R\
+\xe3I\xf0\x8d\xda\xe28\xe3\xea\xb3^/\xf13\x0c\x11\
+\x09\xe0/\xfa\xc0I\xda\x9f\xa7\xf6VPi\xb6\x90\xda\
+\xda\xc1\x1d\xb5\xac(#\x8a\x18P\x22F\xa0`*\xa8\
+\xe0\x008\x00S\xb9*=\xcf\xc5o\x0f\xff\x00\xc1\x1c\
+\xfe;\xebZ\x5c7wz\x8f\x83\xb4\x19\xe4\x19k\x0d\
+CS\x99\xe6\x8f\xd9\x8c6\xf2G\xff\x00|\xb1\xad?\
+\xf8r\xff\x00\xc6\xdf\xfa\x1a<\x03\xff\x00\x83\x0b\xdf\xfe\
+C\xaf\xda\x0a(\xbb\x1f*?\x17\xff\x00\xe1\xcb\xff\x00\
+\x1b\x7f\xe8i\xf0\x0f\xfe\x0c/\x7f\xf9\x0e\xbeH\xfd\xa0\
+~\x07\xeb\xdf\xb3\x97\xc4\xed_\xc0^%\xbc\xd3\xaf\xb5\
+\x8d:(e\x96}*I$\xb7a,K\x22\xedg\
+\x8d\x1b\x85q\x9c\xa8\xc1\xce3_\xd2\xbd~\x0c\xff\x00\
+\xc1U\x7f\xe4\xf5\xfcq\xff\x00^zo\xfe\x91E@\
+Y\x1f\xb4_\xb3\xaf\xfc\x90_\x87\x9f\xf6\x01\xb2\xff\x00\
+\xd1+^\x89^w\xfb:\xff\x00\xc9\x05\xf8y\xff\x00\
+`\x1b/\xfd\x12\xb5\xe8\x94\x8a\x0a(\xa2\x80>i\xff\
+\x00\x82\x90\x7f\xc9\x92|R\xff\x00\xaf+\x7f\xfd+\x82\
+\xbf7\x7f\xe0\x8f#\xfe2\xe2\xe7=\xbc3zG\xfd\
+\xfd\xb7\xaf\xd2/\xf8)\x07\xfc\x99'\xc5/\xfa\xf2\xb7\
+\xff\x00\xd2\xb8+\xf3s\xfe\x08\xf6q\xfb]L=|\
+5}\x9f\xfb\xf9oO\xa1/s\xf6\xe6\x8a(\xa4P\
+QE\x14\x01\xf9\x91\xff\x00\x05\xbc\xff\x00\x91O\xe1/\
+\xfd\x7f\xea\x1f\xfa*\x1a\xfc\x9e\xff\x00=k\xf5\x87\xfe\
+\x0by\xff\x00\x22\x97\xc2_\xfa\xff\x00\xd4?\xf4T5\
+\xf9=M\x11!6\x8f\x7f\xce\x92O\xf5m\xf44\xea\
+l\x9f\xea\xdb\xe8j\x89?\xa5\x7f\xd9\xdf\xfeHG\x80\
+?\xec\x09i\xff\x00\xa2\x96\xbd\x0e\xbc\xf3\xf6w\xff\x00\
+\x92\x11\xe0\x0f\xfb\x02Z\x7f\xe8\xa5\xafC\xa85\x0a(\
+\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x12\xbf\x08\x7f\xe0\xa5\
+\x1f\xb5\x0b~\xd0\x9f\x1c\xae4\x9d*\xeb\xcc\xf0o\x85\
+Y\xecl\x02\x16\xd9q6q4\xe4\x16\xc1%\x86\xd0\
+p\x0e\xd5\x00\xd7\xea7\xfc\x14O\xe2\x97\x89\xbe\x12\xfe\
+\xcb>(\xd5\xbc+gq6\xa1w\xb3M\x96\xfa\x04\
+\x0f\xf6\x08&\xca\xc99\x04\x11\x8c|\xb9\xc7\x05\xc1\xc8\
+8\xaf\xc0\x0d\xc5\x8eI\xdcORy\xcd4L\x99\xd6\
+\xfc \xb6\x17\x7f\x17<\x0fnFD\x9a\xed\x82\x11\xec\
+n\x10W\xf4\xd4\xaa\x15@\x03\x00p+\xf9\xa7\xfd\x9f\
+c\x13|x\xf8t\x8d\xd0\xf8\x82\xc7?\x84\xeak\xfa\
+Y\xa1\x84v\x0a(\xa2\x91AE\x14P\x07\xf3\xaf\xfb\
+v\x7f\xc9\xde|]\xff\x00\xb0\xf4\xff\x00\xc8W\xf4\x07\
+\xf0\xcb\xfeI\xbf\x84\xff\x00\xec\x13i\xff\x00\xa2R\xbf\
+\x9f\xcf\xdb\xb3\xfeN\xf3\xe2\xef\xfd\x87\xa7\xfeB\xbf\xa0\
+?\x86_\xf2M\xfc'\xff\x00`\x9bO\xfd\x12\x94\x09\
+\x1d-\x14Q@\xc2\xbe{\xff\x00\x82\x81\x7f\xc9\x99\xfc\
+W\xff\x00\xb0A\xff\x00\xd1\x89_BW\xcf\x7f\xf0P\
+/\xf93?\x8a\xff\x00\xf6\x08?\xfa1(\x03\xf1\xe7\
+\xfe\x09\xdd\xff\x00'\x95\xf0\xcf\xfe\xbf_\xff\x00E5\
+\x7fAU\xfc\xfa\xff\x00\xc1;\xbf\xe4\xf2\xbe\x19\xff\x00\
+\xd7\xeb\xff\x00\xe8\xa6\xaf\xe8*\x82b\x14QE\x05\x05\
+~q\xff\x00\xc1l9\xf8?\xf0\xf3\xfe\xc3\xd2\xff\x00\
+\xe9;W\xe8\xe5~q\xff\x00\xc1l?\xe4\x8e\xfc=\
+\xff\x00\xb0\xec\x9f\xfaN\xd4\x09\x9f\x90tQEY\x98\
+W\xa3~\xcd\xff\x00\xf2p\x1f\x0e\xff\x00\xec;k\xff\
+\x00\xa3\x05y\xcdz7\xec\xdf\xff\x00'\x01\xf0\xef\xfe\
+\xc3\xb6\xbf\xfa0P\x08\xfe\x94\xa8\xa2\x8a\x83Q\xad_\
+<\xfc_\xff\x00\x91\xea\xeb\xfe\xb9G\xfc\x8d}\x0c\xd5\
+\xf3\xcf\xc5\xff\x00\xf9\x1e\xae\xbf\xeb\x94\x7f\xc8\xd7\xe4\xfe\
+%\x7f\xc8\x9e?\xe3_\xa9\xf5\x9c5\xfe\xfa\xfd\x1f\xe8\
+q\xa9\xf7\x87\xd7\xfa\xd7\xd5\xbaG\xfc\x82\xec\xff\x00\xeb\
+\x92\x7f\xe8\x22\xbeRO\xbc>\xbf\xd6\xbe\xad\xd2?\xe4\
+\x17g\xff\x00\x5c\x93\xff\x00A\x15\xf2\xde\x16\xff\x00\x13\
+\x15\xe9\x1f\xd4\xf58\xa7j_?\xd0\xbbE\x14W\xf4\
+\x09\xf9\xf8\x98\xaf\xcb\xdf\xf8-\x97\x8f<\xbd'\xe1\xb7\
+\x82\x923\xbai\xee5w\x9068E\xf2\x82\x91\x9f\
+Y\x09\xe9\xda\xbfP\xeb\xf0g\xfe\x0a\x8d\xe3\xd1\xe3\x8f\
+\xdb\x0f\xc5\x10F\x8d\x1cZ\x0d\xbd\xbe\x8e76C2\
+/\x98\xcc9\xeed\xc7\xfc\x06\x98\x9e\xc7\xc9\xb5\xfbG\
+\xff\x00\x04y\xf8\x7f\x0e\x85\xfb4\xea\xde \x96\x09R\
+\xe7\xc4:\xc4\xbeg\x9c>I!\x85B!Q\x8eA\
+\xdc\xe3\xf0\xaf\xc5\xb6;T\x9fA_\xd1w\xeca\xe0\
+Y>\x1c~\xcb\x1f\x0d4)\x9e9f\x8fG\x8a\xe1\
+\xde!\xc3\x19\xb37\xe7\x89\x00\xfc(d\xc4\xfc\x1e\xfd\
+\xa6\xbc\x117\xc3\x9f\xda\x1b\xe2'\x87gX\x91\xac\xf5\
+\xbb\x92\xab\x0a\xe1\x169\x1c\xca\x80\x0e\xdf+\xa8\xfc+\
+\x9f\xf8I\xe3k\x9f\x86\xdf\x14\xbc'\xe2\xabY\x12\x19\
+\xf4}R\xde\xf1d\x90\x12\xab\xb5\xc1$\x81\xdb\x19\xaf\
+\xa7\xff\x00\xe0\xac~\x03\x8b\xc1\xff\x00\xb5\xce\xa1\xa9[\
+[K\x14\x1e \xd3m\xb5\x07\x95\xceVI\x801\xc9\
+\xb7\xe8\x118\xf7\xaf\x8c\xd9w)\x1e\xbcS\x0d\x99\xfd\
+Gi:\xa5\xa6\xb9\xa5\xd9\xea6\x13\xad\xcd\x8d\xe4)\
+qo2}\xd9#u\x0c\xac=\x88 \xd5\xba\xf9\xf7\
+\xf6\x0b\xf8\x94>*~\xc9\xff\x00\x0f\xf5V\xba\x8a\xe6\
+\xf6\xd6\xc4i\xb7b,\xfe\xeeH\x09\x8c#g\xbe\xc1\
+\x19\xfck\xe8*\x92\xcf\x93?\xe0\xa3\x7f\xb5E\xd7\xec\
+\xcf\xf0T\xa7\x87\xae|\x8f\x1a\xf8\x8eF\xb0\xd3$\x0a\
+\x8em\x97\x19\x96\xe3i?\xc2\xbc)\xc3\x0d\xcc\xb9\x18\
+\xaf\xc1\xeb\xab\xa9\xef\xae\xa6\xb9\xb9\x9aK\x9b\x99\x9d\xa5\
+\x96i\x9c\xbb\xc8\xecr\xcc\xccy$\x92I'\xaek\
+\xed\xaf\xf8+\xb7\xc4y|_\xfbQ'\x87\xd2\xf3\xcf\
+\xd3\xbc3\xa5\xc5n\x96\xfb@\x10\xdcJL\x92\xf2\x06\
+NG\x95\xd4\xf1\x8a\xf8\x83\xa5R!\x9d\xbf\xc2_\x82\
+\xbe8\xf8\xed\xe2c\xe1\xff\x00\x01\xf8n\xf3\xc4z\xa2\
+\xa7\x9b$v\xdbQ\x22L\xe3|\x92\xb9T\x8cg\x00\
+\x17`\x09\xe3\xadv_\x18\xbfc_\x8c\xdf\x00\xfc>\
+\xba\xef\x8d\xfc\x0bw\xa5h\xa6A\x1b_\xc1s\x05\xe4\
+118_1\xa0\x91\xc4`\x9c\x00[\x19$\x01\x9a\
+\xfd|\xff\x00\x82c|*\xd3~\x1b\xfe\xc9\x9e\x18\xbf\
+\xb7\xb5\x11j\xde%\x0f\xaa\xea\x13\xb4j$v.\xc9\
+\x1a\x96\xc6J\xaa(\xc0$\xe3sc\xad}1\xe3/\
+\x0a\xe9\xfe:\xf0\x9e\xaf\xe1\xddZ\xda+\xbd3T\xb5\
+\x92\xce\xe2\x09\x90:::\x95 \x83\xd7\xad+\x8f\x94\
+\xfe`\xeb\xf4\xb7\xfe\x09\x01\xfbNj\x16>,\xbb\xf8\
+1\xad\xdeIq\xa4\xde\xc3-\xf6\x84$\x1b\x8d\xb4\xc8\
+7M\x10=\x91\x90\x16\xc1\xc8\x0c\xbc\x01\xb8\xe7\xf3\xbb\
+\xc7\x9e\x17\xff\x00\x84\x1f\xc7^$\xf0\xdf\x9f\xf6\xa1\xa3\
+jW:w\xda\x0al2y2\xb4{\xb1\x93\x8c\xed\
+\xce=\xeb\xa3\xfd\x9f\xfcy'\xc3\x1f\x8e\x1e\x04\xf1T\
+q4\xe7J\xd6m\xae\x1a\x15m\xa6E\x12\x00W>\
+\x84\x1cS%n\x7fK\x02\xbf\x9aO\x8f\xdf\xf2^\xbe\
+%\x7f\xd8\xcf\xa9\xff\x00\xe9\x5c\xb5\xfd.W\xf3G\xf1\
+\xfb\xfeK\xd7\xc4\xaf\xfb\x19\xf5?\xfd+\x96\x92*G\
+\x13g2\xdb\xde[\xca\xe0\x94\x8eEc\xb7\xae\x03\x02\
+q\x9f\xa5zg\xed\x1f\xf1\xebX\xfd\xa1\xfe%\x5cx\
+\x97Ry#\xb2\x82\x18\xect\xbb&#\x16\xb6\xb1\xa8\
+T\x5c\x0f\xe2l\x16nI\xcb\x11\x92\x00\xaf-\xaf\xa8\
+\xff\x00b\xff\x00\xd8/\xc4\xff\x00\xb5\xc5\xe5\xd6\xa8\xd7\
+\xdf\xf0\x8c\xf8\x1e\xc2_&\xe7Zx\x0c\xaf<\xc0\x02\
+`\x81276\x08\xdc\xc4\xe1A\x1dI\x0ah\x9f#\
+\xe5\xca\xfe\x80\xbf\xe0\x9b\xbf\xf2d\x9f\x0b\x7f\xeb\xce\xe7\
+\xff\x00K'\xaf1\xd2\x7f\xe0\x8f?\x01\xb4\xfbo.\
+{\x8f\x16jrg>u\xd6\xa9\x1a\xb7\xfeC\x85\x07\
+\xe9^\xef\xadi\x1a\x1f\xec\x83\xfb(\xeb\xb6\xde\x19\x82\
+\xe2M\x17\xc1\xda%\xe5\xc5\xa473\xee\x95\xb0$\x97\
+\x05\xf0\x0ew9\xfd*JJ\xc7\xe5o\xfc\x15\x0b\xf6\
+\xae\xbd\xf8\xcf\xf1\x8e\xf7\xc0z=\xee<\x15\xe1+\x86\
+\xb71\xc6N\xdb\xbb\xf5\xca\xcb#\x0c\x0c\xec9\x8dF\
+8!\xceNF>%\xed\x9a\x96\xe2\xee\xe2\xfe\xe2[\
+\xab\xb9\xe4\xb9\xba\x9d\xdaY\xa6\x99\xcb\xbc\x8e\xc7,\xcc\
+\xc7\x92I$\x92z\xe6\xbd\x1b\xf6i\xf8g\x0f\xc6O\
+\x8f~\x04\xf0u\xd2\xccl5]Z\x08n\xcc\x1bC\
+\xac\x1b\x81\x95\x86\xe0FB\x06\xea\x08\xa6N\xec\xea~\
+\x15~\xc3\xff\x00\x1b\xfe5xV/\x12\xf8G\xc0W\
+Z\x86\x871\x22\x1b\xdb\x8b\xbbk4\x9b\x07\x05\xa3\x13\
+\xca\x85\xd7 \x8d\xca\x08\xc8#9\x04W\x96\xf8\xfb\xe1\
+\xef\x89>\x16\xf8\xa2\xf3\xc3\x9e,\xd1o4\x0dj\xd4\
+\xfe\xf6\xce\xf6=\xaf\x83\xd1\x81\xe8\xcaq\xc3\x02T\xf6\
+&\xbf\xa6\xdd;O\xb5\xd1\xf4\xfbk\x1b+x\xad,\
+\xad\xa2X`\xb7\x81\x02G\x14j\x02\xaa*\x8e\x00\x00\
+\x00\x00\xe8\x05~|\x7f\xc1d\xbe\x0e\xdax\x83\xe0\xde\
+\x85\xf1\x1a\xda\xd65\xd5\xbc9~\x96\x9779*\xcd\
+g9\xd9\xb7\x81\xf3\x11/\x94Fz\x02\xd8\xebHm\
+\x1f\x8fv\xf7\x12\xda\xdcGq\x04\x8f\x0c\xf1\xb0t\x92\
+2U\x95\x87 \x82:\x11\xeb_\xbd\xdf\xf0N\xbf\xda\
+f\x7f\xdaK\xe0\x15\xac\xda\xcd\xc8\xb8\xf1w\x87]t\
+\xbdU\x99\xc9y\xf0\xb9\x86\xe5\xb3\x93\x99\x14\x10I9\
+-\x1b\x9e\xf8\xaf\xc0\xea\xfb\xef\xfe\x08\xdd\xf1\x16O\x0e\
+\xfe\xd0\x9a\xef\x84\xe6\xbd\x95,\xbcE\xa4;Ef\x1b\
+\xf7os\x03\x09\x15\xc8\xeeD~p\x1f\xef\x1a\x18D\
+\xfdU\xfd\xa1\xbe1\xe9\xff\x00\x00~\x0dx\xab\xc7z\
+\x8a,\xd1\xe96m$6\xec\xfb>\xd1p\xc7l1\
+n\xc1\xc1y\x19W8\xef_\xce\x7f\xc4\x1f\x1f\xeb\xdf\
+\x14\xbci\xacx\xb3\xc4\xd7\xf2\xeaz\xe6\xab;\x5c\x5c\
+\xdcJ\xc5\xbec\xd1W$\xedE\x18U^\x8a\xaa\x00\
+\xe9_\xb0\xbf\xf0Y\x0f\x10^i?\xb3\x0e\x8fao\
++Gm\xaax\x8a\xde\xde\xe9\x14\xf0\xe8\x91K0\x07\
+\xdb|h\x7f\x0a\xfcY\xa1\x04\x99wE\xd1\xb5\x0f\x11\
+\xeb\x16zN\x93as\xa9\xea\x97\xb3,\x16\xd6Vp\
+\xb4\xb3O#\x1c*\x22(,\xccI\xc6\x06M}\x0d\
+{\xff\x00\x04\xe4\xfd\xa3t\xff\x00\x0e\xc9\xac\xcb\xf0\xc6\
+\xf4\xd9\xc7\x0f\x9e\xd1C\x7fg-\xce\xdcg\x1fgI\
+\x8c\xa5\xb1\xfc!s\xed^\xf3\xff\x00\x04_\xf0\xde\x89\
+\xa9\xfcq\xf1\x86\xadz\x96\xf3\xebzf\x89\x9d=&\
+Eg\x85d\x95\x12Yc$eN\x08B\xc0\x8e$\
+a\xd0\xd7\xec^h\xb8[C\xf9l\xb8\xb7\x96\xd6\xe2\
+X'\x89\xe0\x9a7)$r)VV\x07\x04\x10y\
+\x04\x1e0k\xd0\x7fg\xff\x00\x8dZ\xef\xec\xf9\xf1k\
+\xc3\xfe7\xd0&\x11\xdc\xe9\xf3\x8f\xb4@\xdf\xea\xeem\
+\xdb\x89aq\x83\xf2\xb2\x1229\x07\x91\x82\x01\xaf|\
+\xff\x00\x82\xa9|8\xd3\xfc\x03\xfb]\xea\xd2\xe9q\x88\
+\xe2\xf1\x0e\x9bm\xad\xcd\x0cQ\x85X\xe6v\x92\x17\xc0\
+\x1f\xde0o'\xbb95\xf2\x03D\xdbO\xc8\xdf\x95\
+P\xb6g\xf5\x0b\xe1\xcd~\xc3\xc5~\x1f\xd35\xbd*\
+\xe0]\xe9z\x95\xacW\xb6\x97\x01J\x89!\x91\x03\xa3\
+`\x80FU\x81\xe4g\x9a\xfcT\xff\x00\x82\xbf\x7f\xc9\
+\xdd'\xfd\x8b\xb6_\xfa2z\xfd]\xfd\x8f\xf5\x09\xb5\
+/\xd9o\xe1d\xd3\x9c\xc8<;g\x17\xe0\x91\x04\x03\
+\xf2Q_\x94_\xf0W\xef\xf9;\xa4\xff\x00\xb1v\xcb\
+\xff\x00FOPS\xd8\xf8\x92\xba\x0f\x13|@\xd7<\
+Y\xe1\xff\x00\x0bh\x9a\x9d\xeb\xcb\xa4\xf8f\xce[-\
+.\xd1I\x11\xc2\x92O$\xf26\xdc\xe3{<\xa7s\
+pHT\x07\xee\x8a\xe7\xeb\xf4\x0f\xfe\x09\x0b\xfb=h\
+\x7f\x13>%x\x93\xc7~#\xb1\xb7\xd4\xed\xbc$\x90\
+%\x85\x9d\xd4>d\x7fl\x98\xb9Y\xb0r\xa4\xc6\xb1\
+6\x01\x1c3\xab\x0c\x15\xab!j\xcf\x83u\x0f\x0d\xea\
+\xfa^\x9bi\xa8^iW\xd6z}\xe0&\xda\xea{\
+g\x8e)\xb1\xd4\xa3\x11\x86\xfc\x0dg\x1a\xfe\xa1<E\
+\xe1\xdd/\xc5\xba\x1d\xee\x8f\xadi\xd6\xda\xae\x95{\x13\
+Cue{\x12\xcb\x0c\xd1\x91\x82\xac\xac\x08 \x8fZ\
+\xfev\xbfk\xaf\x83\x16\xff\x00\x00?h\xcf\x1a\xf8#\
+O,\xfaM\x8d\xda\xcd\xa7\x96\x0d\x91m2,\xb1\xa6\
+X\x92\xdb\x03\xec\xdcNX\xa1=\xeaF\xd5\x8c\xcf\xd9\
+\xbf\xe3v\xad\xfb<|f\xf0\xdf\x8d\xf4\x99e\x02\xca\
+\xe1R\xf6\xd66\x00]\xda1\xc4\xd0\xb6A\x1f2g\
+\x04\x8f\x94\xe1\x87 \x1a\xfe\x8f\xb4=j\xc7\xc4\x9a.\
+\x9f\xab\xe9wQ\xde\xe9\xba\x85\xbcwV\xb7Q\x1c\xa4\
+\xd1:\x86G_b\xa4\x1f\xc6\xbf\x97Z\xfe\x81?\xe0\
+\x9d>9\x9b\xc7\xbf\xb1\xcf\xc3\xab\xbb\xab\xb8\xee\xefl\
+m$\xd2\xe6\xd9\xd61\x04\xcf\x1cH}\x08\x85b\xfc\
+\xc5\x0cq7?m\xaf\x8f\xcd\xfb7\xfe\xce\xbe'\xf1\
+m\x9c\xb1\xa6\xbe\xc8\xb6\x1a:HW\x9b\xc9\x8e\xd4`\
+\xac\x08o,n\x90\xafu\x8c\xd7\xf3\xcf\xa8\xea7Z\
+\xbe\xa1u\x7f}u5\xed\xf5\xd4\xad=\xc5\xd5\xc4\x86\
+If\x91\x98\xb3;\xb1\xe5\x98\x92I'\x92I\xaf\xd7\
+_\xf8-n\xac\xd1|\x1b\xf8}\xa6\x03\xf2\xdcx\x81\
+\xaeO\xd6;iW\xff\x00j\x9a\xfc\x82\xa1\x04\x8e\xa7\
+\xe1\xaf\xc2\xdf\x17|b\xf1D^\x1c\xf0W\x87\xef\xbc\
+G\xac\xc8\xbb\xfe\xcde\x1ev&@.\xecp\xa8\x80\
+\xb0\xcb1\x00dd\xf3^\xb9\xe3\xef\xf8'\xef\xed\x01\
+\xf0\xd3\xc3\x17~!\xd7\xbe\x1c\xde&\x95h\xbed\xf2\
+\xd8^\xda\xde\xbch:\xb1\x8e\x09]\xf6\x81\xc98\xc0\
+\x1c\x93\x8ek\xf4\x0b\xfe\x08\xbb\xe0\xdd*\xcf\xe0g\x8c\
+\xbcW\x1d\xbf\xfcN\xf5\x0f\x106\x9b=\xc19\xfd\xc4\
+\x16\xf0\xc9\x1a\xa8\xed\xf3\x5cHN:\xfc\xbf\xdd\x15\xfa\
+\x1a\xca\x180\xc6\xe1\x8c\x10y\x06\x8b\x8dD\xfeZ\xab\
+\xd5\x7ff\x0f\x8ez\xa7\xec\xeb\xf1\xbb\xc3\x1e5\xd3\xe6\
+\x9dmmnV-J\xd6\x023wd\xec\x04\xf0\x90\
+x9L\x91\x9e\x8c\xaa\xc3\x05Eh~\xd9\x1e\x0b\xd3\
+~\x1e~\xd4\x9f\x134\x1d\x1e8\xed\xf4\xcb}bI\
+`\xb7\x85\x15#\x85e\x02o)U@UU2\x15\
+\x0a\x07\x01@\xaf\x1b\xfb\xbd3\x9fjd\x1f\xd4\xb22\
+\xc8\x8a\xc8C+\x0c\x86S\x90G\xady\x17\xedY\xf1\
+\xfa\xc3\xf6i\xf8\x1f\xe2?\x1b\xddy3\xde\xdb\xc6 \
+\xd3,\xa6`>\xd7y!\xdb\x14x\xc8,2K6\
+\xdeB#\x9c|\xb5\xb3\xfb7\xdeK\xa9~\xce\xff\x00\
+\x0b\xae\xe7\x91\xa5\x9e\x7f\x0a\xe9r\xc9#\x12K3Z\
+DI$\xfa\x93_\x9c\x9f\xf0Z\xcf\x8aR\x5cx\x93\
+\xe1\xef\xc3\x9byfHmm\xe5\xd7\xefa yr\
+4\x8c`\xb6`s\x9d\xca#\xba\x1f\xf01\xd7\xb4\x9a\
+\x1f\x9c\xbe9\xf1\xc6\xbb\xf1+\xc5\xda\xb7\x8a<M\xa9\
+M\xab\xeb\xba\xad\xc3\x5c]\xdeNr\xce\xc7\xa6\x00\xe1\
+@\x00*\xa8\xf9UT\x00\x00\x00V^\x99\xa5\xde\xeb\
+\x9a\x95\xae\x9d\xa7Y\xcf\xa8j\x17r\xac6\xf6\x96\xb1\
+\x19%\x9aF8TDPK1$\x00\x07'\xebU\
+\xab\xf5w\xfe\x08\xcd\xf0'H\xff\x00\x84[\xc4\xff\x00\
+\x16\xb5\x0bH\xeeu\xb6\xbfm\x13Ky\xa2;\xad\x22\
+H\xd1\xe7\x922N3'\x9a\xa9\x902\x04n\x01\xc3\
+\xb0\xaa!j~ux\xc3\xf6k\xf8\xaf\xf0\xff\x00\xc3\
+g\xc4\x1e%\xf8s\xe2}\x0fDP\xa6[\xfb\xed*\
+h\xe1\x841\x0a\xbec\x15\xfd\xdeK\x01\xf3c$\xe3\
+\xady\xbf\xeb_\xd4^\xa7\xa6Z\xebZ}\xd5\x85\xf5\
+\xb4W\x96W143\xdb\x5c x\xe5\x8d\x81\x0c\x8c\
+\xa4`\x82\x09\x04\x1c\x83_\xce\x1f\xed=\xf0\xae/\x82\
+_\xb4\x17\x8f|\x13j\xa6=?I\xd5$[$g\
+.\xcbj\xf8\x96\x00\xccy$E\x22d\xf74\xae\x0d\
+X\xf7\xef\xf8&/\xedU\x7f\xf0?\xe3f\x9f\xe0\xdd\
+N\xf2W\xf0G\x8cn\xa3\xb1\x9e\xd9\x98\x14\xb5\xbdr\
+\x12\x0b\x95\xcf\xdd\xc9\xdb\x1b\x90FQ\x83\x1d\xdeZ\x81\
+\xfb\x949\xe6\xbf\x96\xa8\xdd\xa2\x91]\x18\xab\xa9\x0c\x08\
+<\x83\xda\xbf\xa6\x0f\x82\xfe5\x9f\xe27\xc1\xbf\x03x\
+\xb2\xecF.\xf5\xcd\x0a\xc7R\x9cD0\xa2I\xa0I\
+\x1c\x01\xd8\x06b1\xedC*'\xe7\xff\x00\xfc\x15\xdf\
+\xf6\xb0\xd4<3kk\xf0[\xc2\xf7\xb2\xd9\xcd\xaaZ\
+\x8b\xcf\x11\xdc\xc0T\x16\xb6bDV\x81\x81\xdc\xbb\xf6\
+\xb3H>RS\xcb\x5c\xb2\xbb\xad~N\xd7\xab\xfe\xd5\
+\xff\x00\x10\xa6\xf8\xad\xfbJ\xfcH\xf1D\xb7+w\x1d\
+\xd6\xb7q\x0d\xb4\xca\xa1A\xb5\x85\xbc\x9bq\xc0\xed\x0c\
+q\x8f|d\x9c\xd7\x96\xd9\xda\xc9}u\x05\xbcJ^\
+I\x9dcU\x5c\xe4\x92@\x03\xf34\xc9g\xa9\xfc\x17\
+\xfd\x94\xfe,~\xd0\xb6\x97\x97\x9e\x00\xf0]\xe6\xbb\xa7\
+\xda?\x955\xf3M\x0d\xad\xb0\x90\x00LbY\xdd\x11\
+\x9c\x06RUIa\xb8\x120Fs>3~\xce\xff\
+\x00\x11\xff\x00g\xbdR\xce\xc3\xe2\x0f\x85/<95\
+\xe2\x96\xb6\x96F\x8eh'\x0b\x8d\xc1&\x89\x9a6a\
+\x95%Cew\x0c\x81\x91\x9f\xe8\x8b\xe1/\xc3=\x1f\
+\xe0\xdf\xc3_\x0ex+B\x85a\xd2\xb4[(\xed#\
+\xdb\x1a\xa3J\xc0|\xf2\xb0P\x06\xf7r\xee\xc7\x1c\xb3\
+\xb1\xef^Q\xfb~|-\xd3\xfe+~\xc9\x7f\x11,\
+\xefcSq\xa4\xe9\x92\xeb\xd62\xf9\x22G\x8e\xe2\xd1\
+\x1aa\xb0v.\xaa\xf1\x129\xdb+u\xe9J\xe5r\
+\x9f\xcfx\xfdk\xf6\xdb\xfe\x09S\xfbMj?\x1b\xbe\
+\x0d_xO\xc4w\x8d{\xe2_\x06<6\xc2\xea^\
+d\xb9\xb0\x91[\xec\xee\xe7?3\xa1\x8eH\xc9\xc7E\
+\x8c\xb1,\xc4\x9f\xc4\x9a\xfb'\xfe\x091\xe3\x89|'\
+\xfbbi\x1aZ\xa0h<I\xa5_i\x931l\x04\
+\x09\x11\xbb\x0d\xf5\xcd\xa8__\x98\xfb\xd0\xc9[\x9f\x1b\
+QE\x15B\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\
+\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\
+\x0a\xfas\xfe\x09\x9b\xff\x00'\xc5\xf0\xc3\xfe\xba\xea\x1f\
+\xfan\xba\xaf\x98\xeb\xe9\xcf\xf8&o\xfc\x9f\x17\xc3\x0f\
+\xfa\xeb\xa8\x7f\xe9\xba\xea\x93\x1a\xdc\xfd\xfc\xa2\x8a*M\
+\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\
+\x02\x8a+\xe4\xdf\xda\xfb\xfe\x0a\x19\xe0?\xd9\x93N\xbe\
+\xd2,.!\xf1o\xc40\x98\x83B\xb3\x93tv\xae\
+N\x03]\xc8\xbcF\x06\x091\xf3!\xe3\x85\x0d\xbc\x00\
+t\x1f\xb6\xf7\xed}\xa4~\xca?\x0c\xa6\xbaGK\xcf\
+\x1bj\x91\xbc:\x1e\x99\x90~|`\xdcH9\xc4I\
+\x9c\xf4\xf9\x9b\x0a8,W\xf2\xdf\xfe\x09\xe7\xf0J\x7f\
+\xda\x9f\xf6\xa7}{\xc5\xed6\xb1\xa6h\xce\xde \xd6\
+f\xba\x06Q{r\xd2f\x18\xe4m\xc0\xe5\xe4\xdd!\
+\xce\xe0DL\xa4\x10\xd5\xf3\xa7\xc5\xef\x8c\x1e*\xf8\xe9\
+\xe3\xcb\xff\x00\x17x\xc3T\x93S\xd5\xaf\x0e>o\x96\
+8P}\xd8\xe3N\x88\x8b\xd8\x0f\xe6I\xaf\xd4o\xf8\
+\x22\x9f\x85\xf4\xfbo\x84>?\xf1\x22\xdb\x95\xd5\xaf5\
+\xd5\xd3\xe4\x9fq\xf9\xa0\x8a\xde9#\x5ct\xe1\xa7\x94\
+\xe7\xa9\xdd\xec)\xec\x89\xdd\x9f\xa3\xa8\x825UP\x02\
+\xa8\xc0\x00p)\xd4QH\xa0\xa2\x8a(\x00\xaf\xc1\x9f\
+\xf8*\xaf\xfc\x9e\xc7\x8e?\xeb\xcfM\xff\x00\xd2(\xab\
+\xf7\x9a\xbf\x06\x7f\xe0\xaa\x9f\xf2{\x1e7\xff\x00\xaf=\
+7\xff\x00H\xa2\xa6\x84\xcf\xda/\xd9\xd7\xfeH/\xc3\
+\xcf\xfb\x00\xd9\x7f\xe8\x95\xafD\xaf;\xfd\x9d\x7f\xe4\x82\
+\xfc<\xff\x00\xb0\x0d\x97\xfe\x89Z\xf4JC\x0a(\xa2\
+\x80>i\xff\x00\x82\x90\x7f\xc9\x92|R\xff\x00\xaf+\
+\x7f\xfd+\x82\xbf7?\xe0\x8f\xbf\xf2wR\xff\x00\xd8\
+\xb7}\xff\x00\xa3 \xaf\xd2?\xf8)\x07\xfc\x99'\xc5\
+/\xfa\xf2\xb7\xff\x00\xd2\xb8+\xf3s\xfe\x08\xfb\xff\x00\
+'u/\xfd\x8bw\xdf\xfa2\x0a}\x09{\x9f\xb74\
+QE\x22\x82\x8a(\xa0\x0f\xcc\x8f\xf8-\xe7\xfc\x8a_\
+\x09\x7f\xeb\xff\x00P\xff\x00\xd1P\xd7\xe4\xf5~\xb0\xff\
+\x00\xc1o?\xe4R\xf8K\xff\x00_\xfa\x87\xfe\x8a\x86\
+\xbf'\xa9\xa2$\x14\xd9?\xd5\xb7\xd0\xd3\xa9\xb2\x7f\xab\
+o\xa1\xaa$\xfe\x95\xff\x00g\x7f\xf9!\x1e\x00\xff\x00\
+\xb0%\xa7\xfe\x8aZ\xf4:\xf3\xcf\xd9\xdf\xfeHG\x80\
+?\xec\x09i\xff\x00\xa2\x96\xbd\x0e\xa0\xd4(\xa2\x8a\x00\
+(\xae{\xc7^2\xd3~\x1d\xf8OR\xf1\x1e\xb1!\
+\x8bK\xd3\xa3\x13\x5c\xcc0\x04q\xee\x00\xb9\xc9\x03\x0a\
+\x0e\xe3\xec\x0dm\xd9\xdd\xc3\x7fi\x0d\xcd\xbc\x8b4\x13\
+\x22\xc9\x1c\x88r\x19H\xc8#\xd8\x83@\x13QE\x14\
+\x01\x89\xe3/\x08\xe9^<\xf0\xbe\xab\xe1\xddn\xce=\
+CH\xd4\xed\xde\xd6\xea\xdaU\x05]\x18`\xf5\x07\x91\
+\xd4\x1e\xc4\x03\xda\xbf\x9d\xbf\xda\x93\xe0\x0e\xa9\xfb4\xfc\
+i\xd7\xbc\x13~d\x9a\xd2\xdeO;N\xbdd\xda.\
+\xad\x5c\xe67\x1f3`\xe3\x823\x90G\xad\x7fG\xf5\
+\xf1\x87\xfc\x14\xe7\xf6T\xff\x00\x85\xf9\xf0m\xfcO\xa1\
+\xda\x89<g\xe18\xe4\xba\xb7\xd9\xb5Z\xea\xd3\x1b\xa6\
+\x84\x929\xc0\x05\xd4d\x0c\x83\xd4\x91LOS\xf1\xbb\
+\xe0U\xc8\xb4\xf8\xdd\xf0\xfab>\xef\x88,?[\x84\
+\x1f\xd6\xbf\xa6\x0a\xfe_|\x1b\xae/\x86|_\xa0\xeb\
+2+2i\xda\x85\xbd\xe3\xaa\xf5\x229U\xcf\x1f\xf0\
+\x1a\xfe\x9d4-Q5\xbd\x13O\xd4c\x04Gyo\
+\x1d\xc2\xe7\xd1\xd40\xfet1D\xbdE\x14R((\
+\xa2\x8a\x00\xfev?n\xcf\xf9;\xcf\x8b\xbf\xf6\x1e\x9f\
+\xf9\x0a\xfd\xf0\xf8m\xe2]\x22?\x87>\x15W\xd5,\
+\x95\x86\x93i\x957\x08\x08\xfd\xca{\xd7\xe4\xa7\xed]\
+\xfb\x00\xfc|\xf8\x91\xfbI|E\xf1?\x87|\x01&\
+\xa3\xa1\xea\xba\xbc\xb76w\x83T\xb1\x8f\xcd\x8c\xe3\x0d\
+\xb5\xe7V\x1d;\x80k\xca?\xe1\xd9\xbf\xb4\xaf\xfd\x13\
+9\x7f\xf0s\xa7\xff\x00\xf2E;\x11s\xf7\x97\xfe\x12\
+\x8d\x1f\xfe\x82\xd6?\xf8\x12\x9f\xe3G\xfc%\x1a?\xfd\
+\x05\xac\x7f\xf0%?\xc6\xbf\x06\xbf\xe1\xd9\x9f\xb4\xaf\xfd\
+\x13)\x7f\xf0s\xa7\xff\x00\xf2E\x1f\xf0\xec\xcf\xdaW\
+\xfe\x89\x94\xbf\xf89\xd3\xff\x00\xf9\x22\x8b\x0f\x9b\xc8\xfd\
+\xe4\xff\x00\x84\xa3F\xff\x00\xa0\xb5\x8f\xfe\x04\xa7\xf8\xd7\
+\xcf\xff\x00\xb7\xd7\x884\xbb\xaf\xd8\xe7\xe2\xacPjV\
+\x92\xca\xdaA\x0b\x1aN\x8c\xc7\xf7\xa9\xd0\x03_\x93\x7f\
+\xf0\xec\xdf\xdaW\xfe\x89\x9c\xbf\xf89\xd3\xff\x00\xf9\x22\
+\xb9\xff\x00\x1f~\xc1?\x1d\xfe\x17\xf87U\xf1W\x89\
+\xfc\x03&\x99\xa0iqy\xf7\x97\x87T\xb2\x94D\x99\
+\x03v\xc4\x98\xb1\xe4\x8e\x80\x9a,.b\xff\x00\xfc\x13\
+\xbb\xfeO+\xe1\x9f\xfd~\xbf\xfe\x8aj\xfe\x82\xab\xf9\
+\xf5\xff\x00\x82v\xff\x00\xc9\xe5|3\xff\x00\xaf\xd7\xff\
+\x00\xd1M_\xd0U\x0cq\xd8(\xa2\x8aE\x05~q\
+\xff\x00\xc1l?\xe4\x8e\xfc=\xff\x00\xb0\xec\x9f\xfaN\
+\xd5\xfa9_\x9c\x7f\xf0[\x0f\xf9#\xbf\x0f\x7f\xec;\
+'\xfe\x93\xb5\x02g\xe4\x1d\x14QVf\x15\xe8\xdf\xb3\
+\x7f\xfc\x9c\x07\xc3\xbf\xfb\x0e\xda\xff\x00\xe8\xc1^s^\
+\x8d\xfb7\xff\x00\xc9\xc0|;\xff\x00\xb0\xed\xaf\xfe\x8c\
+\x14\x02?\xa5*(\xa2\xa0\xd4kW\xcf?\x17\xff\x00\
+\xe4z\xba\xff\x00\xaeQ\xff\x00#_C5|\xf3\xf1\
+\x7f\xfeG\xab\xaf\xfa\xe5\x1f\xf25\xf9?\x89_\xf2'\
+\x8f\xf8\xd7\xea}g\x0d\x7f\xbe\xbfG\xfa\x1cj}\xe1\
+\xf5\xfe\xb5\xf5n\x91\xff\x00 \xbb?\xfa\xe4\x9f\xfa\x08\
+\xaf\x94\x93\xef\x0f\xaf\xf5\xaf\xabt\x8f\xf9\x05\xd9\xff\x00\
+\xd7$\xff\x00\xd0E|\xb7\x85\xbf\xc4\xc5zG\xf5=\
+N)\xda\x97\xcf\xf4.\xd1E\x15\xfd\x02~~g\xeb\
+\xda\xb4z\x0e\x89\xa8jR\x8c\xc5go%\xc3\x0e\x9c\
+\x22\x96?\xca\xbf\x99O\x1ex\xa9\xfcs\xe3\x9f\x11x\
+\x8d\xc3\xabj\xda\x8d\xc5\xfe\xd9\x0e\xe6Q$\x8c\xe1O\
+\xd0\x10?\x0a\xfd\xe5\xff\x00\x82\x8b\xfc@\x1f\x0e\xff\x00\
+c\xff\x00\x1f]\x01'\x9d\xa8\xdb.\x93\x0bDpQ\
+\xee\x18 l\xe7\xb6I\xaf\xe7\xf3\xa7\x14\xd12:O\
+\x86\xfe\x17\xba\xf1\xb7\xc4/\x0c\xe8\x166\xad{u\xa9\
+jV\xf6\xc9n\x83&M\xd2\x00@\x1fL\xd7\xf4\xd7\
+\xa5\xe9\xb6\xfa6\x9biai\x18\x8a\xd2\xd6\x14\x82\x18\
+\xd7\xa2\xa2\xa8U\x1f\x80\x02\xbf\x9c\xaf\xd9O\xe2\x07\x85\
+\xfe\x14\xfe\xd0^\x0d\xf1\x8f\x8c~\xdet=\x0e\xef\xed\
+\xcc4\xd8\x84\xb34\x88\xa4\xc6\x02\x96PF\xecg\x9a\
+\xfdX\xff\x00\x87\xc5\xfc\x09\xff\x00\x9f\x0f\x18\x7f\xe0\xb2\
+\x1f\xfe?C\x05d\x8f \xff\x00\x82\xd9x\x15\x9e\xc7\
+\xe1\x9f\x8c\x96h\xd5#\x9a\xe7Gxv\xfc\xcc]D\
+\xaa\xd9\xf4\x1e[\x0f\xc6\xbf+k\xf4\x8f\xf6\xf4\xfd\xbf\
+>\x10\xfe\xd3\xbf\x01g\xf0\xaf\x87,<@\x9e\x22\x8b\
+P\xb7\xbc\xb3\x97R\xb1\x8a(\x93k\xe2O\x98J\xc4\
+\x12\x85\x87\x02\xbf7)\xa1H\xfdq\xff\x00\x82-\xfc\
+J]C\xe1\xcf\x8e<\x09=\xcc>n\x97~\x9a\x9d\
+\xad\xb8\xcf\x98c\x99v\xc8\xdf@\xc8\x83\xea\xd5\xfaM\
+_\x86\xff\x00\xf0I\x9f\x89\x1f\xf0\x83\xfe\xd5\xd6\x9aL\
+\xd3\xc3oe\xe2m:m:F\x98\x91\x99\x14y\x91\
+*\xff\x00\xb4]\x00\xfck\xf7\x22\x91H\xfex?n\
+\xfdr\x0f\x11~\xd8?\x14\xef\xad\xff\x00\xd4\xb6\xad\xe5\
+\x0f\xacqG\x19\xe7\xea\x86\xbc\x15\x81d u\xc5z\
+\x17\xed\x0b+\xcd\xf1\xf7\xe2K\xc9\xf7\xff\x00\xe1$\xd4\
+\x01\xfc.\x1c\x0f\xd2\xbc\xfe\xa8\xcc\xfd\xae\xf8\x1d\xff\x00\
+\x05 \xfd\x9d\xfc\x0f\xf0o\xc1\x1e\x1f\xd4\xbci5\xa6\
+\xa3\xa6h\xd6\xb6\xb7P&\x8bz\xe1%H\x94:\xe5\
+a \xe1\xb3\xc85\xdc\xff\x00\xc3\xd2\xbff\xbf\xfa\x1f\
+.?\xf0G\x7f\xff\x00\xc6k\xf0b\x8a\x9b\x15\xccz\
+'\xed\x15\xe2M\x0f\xc6\x7f\x1d\xfcw\xaf\xf8j\xe4\xde\
+h:\xa6\xad5\xdd\xa4\xe6'\x8c\xba9\xdd\x9d\xae\x03\
+\x0eI\xe0\x80k\xcf\xed\xa6k[\xa8gS\x86\x8aE\
+\x90\x1c\xf7\x04\x11\x8a\x8e\x9b&|\xb6\xc7\xa5Q'\xf4\
+\xe5\xf0\xb7V\x97^\xf8c\xe1\x1dNw2\xcf{\xa3\
+\xd9\xdc\xc8\xe7\xab3\xc2\x8cO\xe6k\xf9\xcb\xf8\xfd\xff\
+\x00%\xeb\xe2W\xfd\x8c\xfa\x9f\xfe\x95\xcb_\xd1\x07\xc0\
+6\xdd\xf0'\xe1\xc9=O\x86\xf4\xd3\xff\x00\x92\xb1\xd7\
+\xf3\xbf\xf1\xfb\xfeK\xd7\xc4\xaf\xfb\x19\xf5?\xfd+\x96\
+\xa5\x16\xf68&l)>\x82\xbf\xa2\xff\x00\xd8\xcf\xc0\
+\xb6\xbf\x0e\xbfe\xbf\x86\x9a=\xa9\x0c\xad\xa2\xc1z\xf2\
+\x05\xc1g\xb8_=\x89\xf5#\xcc\xc6}\x85\x7f9\xf2\
+\x7f\xabo\xa1\xaf\xe9k\xf6{\xff\x00\x92\x07\xf0\xd7\xfe\
+\xc5\x9d3\xff\x00Ib\xa1\x8a'\x7f_)\x7f\xc1P\
+\xb5\xab\xcd\x0f\xf6+\xf1\xd4\xb6S4\x0fp\xf6v\x92\
+\x15\xea\xd1Ku\x1aH\xbf\x8a\xb1\x1f\x8d}]_\x1c\
+\x7f\xc1Y\xa6h\xff\x00c\x1f\x11\x22\xf4\x93R\xd3\xd5\
+\xbe\x9fiC\xfc\xc0\xa4Q\xf8[_Y\x7f\xc1,\xe1\
+I\xbfm\xbf\x04\x89\x108[mE\xc6FpE\x9c\
+\xa4\x1a\xf9:\xbe\xb6\xff\x00\x82V*\x9f\xdbg\xc1\xc4\
+\x9eE\x9e\xa2G\xfe\x01\xcbTB\xdc\xfd\xe1\xaf\x99\xff\
+\x00\xe0\xa4^\x1bo\x14~\xc6?\x12-\xd7\xad\xb5\xa4\
+w\xfd?\xe7\x84\xc9)\xff\x00\xd0+\xe9\x9a\xf1\x8f\xdb\
+AC\xfe\xc9\x7f\x17\xc3\x0e?\xe1\x16\xd4\x0f\xe5\x03\x11\
+Rh\x7f9\xb5\xf4\xb7\xfc\x13\x87\xc5\x11xG\xf6\xce\
+\xf8qu*\x06[\xab\x99\xb4\xe1\x93\x8f\x9a\xe2\x17\x84\
+\x1f\xcd\xc5|\xd3^\xcb\xfb\x19\x7f\xc9\xd9|\x22\xff\x00\
+\xb1\x9e\xc3\xff\x00G-WC%\xb9\xfa\xed\xff\x00\x05\
+L\xf8_?\xc4\x8f\xd9'_\xba\xb2\x82K\x8b\xef\x0d\
+\x5cE\xad\xc6\x88\xca\x00\x8e2Vv9\xec\xb0\xbc\x8d\
+\x81\xce@\xaf\xc2Z\xfe\xa3\xef\xac\xe1\xbf\xb5\x9a\xda\xe2\
+%\x9a\xdedh\xe4\x8aA\x95u#\x04\x11\xe8E~\
+'\xfe\xdc_\xf0M\xdf\x13\xfc\x0b\xd7\xb5/\x15\xfc>\
+\xd3n\xbcG\xf0\xdevk\x83\x0d\xb2\x99\xae\xb4`N\
+Z9Tr\xf0\x8c\x9d\xb2\x8c\xe1F\x1f\x18\xdc\xe9\x17\
+$|\xc3\xf0'\xe3\x97\x8a\xff\x00g_\x89\x1a\x7f\x8d\
+<\x1fx\xb6\xfa\x95\xaeR[y\x81k{\xc8O\xdf\
+\x86d\x04nC\x8fPA\xc3\x02\xac\x01\x1f\xac?\x04\
+\xff\x00\xe0\xaf\xdf\x0a|u\x04\x16\x9e=\xb3\xd4>\x1e\
+\xea\xe5q$\xcf\x1b^\xd8;p\x06\xd9\x22\x06E'\
+\x93\x86\x8c\x05\x1f\xc4k\xf1w9\xe6\x8av&\xed\x1f\
+\xd3\xcf\x83\xfcu\xe1\xbf\x88Z:j\xbe\x17\xd7\xb4\xcf\
+\x11\xe9nv\xad\xe6\x95w\x1d\xcc%\x87Q\xb9\x18\x8c\
+\x8fN\xa2\xb7\xb1_\xcc?\x81\xfe x\x9f\xe1\x9e\xbd\
+\x16\xb7\xe1\x1f\x10\xea^\x1b\xd5\xa3\x1bV\xf3K\xbax\
+$+\x9eU\x8a\x9f\x99Ou9\x07\xb8\xaf\xd3\xdf\xd8\
+\x9f\xfe\x0a\xb1u\xe2\xcd\x7fM\xf07\xc6v\xb5\x86\xf2\
+\xf1\x85\xbd\x97\x8b\xa1\x8c@\x8f+6\x11.\xe3P\x11\
+3\x9d\xbej\x05Q\x85\xdc\xa0np\x8aN\xe7\xe9\xdf\
+J\xfcC\xff\x00\x82\xbf\x7f\xc9\xdd'\xfd\x8b\xb6_\xfa\
+2z\xfd\xbc\x15\xf8\x87\xff\x00\x05~\xff\x00\x93\xbaO\
+\xfb\x17l\xbf\xf4d\xf4\x86\xf6>$\xaf\xda\x7f\xf8#\
+m\x90\xb7\xfd\x95\xf5\x99\xcc*\x8f?\x8an\xcf\x99\x8f\
+\x99\xd4[\xdb\x01\x93\xe8\x0e\xec~>\xb5\xf8\xb1_\xb8\
+_\xf0H\xb8\xd5?d+r\xbd[\x5c\xbc'\xeb\x88\
+\xff\x00\xc0Sd\xc7s\xedQ_\x8a\x9f\xf0Y+U\
+\x87\xf6\xad\xd1\xe5X\xc2\x09\xbc)hK*\xe3s\x0b\
+\x9b\xb0~\xa7\x1bG\xe4+\xf6\xae\xbf\x1b\x7f\xe0\xb4q\
+\xaa\xfe\xd0^\x0ep>v\xf0\xe0\x07\xf0\xb8\x97\x1f\xcc\
+\xd0\x8a{\x1f\x9fU\xfbK\xff\x00\x04i\xba\xf3\xbfe\
+\x8dv\x22\xd9h|Wt\x00\xf4\x06\xda\xd4\x8f\xeb_\
+\x8bU\xfb%\xff\x00\x04]\x91\x8f\xec\xf3\xe2\xf4\xfe\x15\
+\xf1$\x84}M\xbc9\xfeB\x86DO\xbd5]\x03\
+K\xd7\x964\xd4\xf4\xebMEc;\x91n\xe0YB\
+\x9fQ\xb8\x1cV\x7f\xfc+\xaf\x0a\x7f\xd0\xb1\xa3\x7f\xe0\
+\xbe/\xfe&\x93\xe2\x07\x8f\xfc?\xf0\xb7\xc1\xba\xb7\x8a\
+\xbcS\xa9\xc3\xa3\xe8:\x5c\x06\xe2\xea\xf2l\x90\x8a:\
+\x00\xa3%\x98\x92\x15UAf$\x00\x09 W\xe4\x17\
+\xed+\xff\x00\x05l\xf8\x83\xf1\x0a\xfa\xefJ\xf8\x5c\xad\
+\xe0/\x0d\x06d]A\x95%\xd5.\x97\xe6\x19,r\
+\x90)\x05N#\x05\xc1\x5c\x89\x0eqH\xb6\xec~\xbb\
+k:\xef\x83~\x12\xe8r^\xea\x9a\x86\x87\xe0\xdd\x19\
+_s\xdc]\xcd\x0d\x8d\xb6\xf3\x81\x92X\xaa\xe4\xf0?\
+*\xf9+\xe3\xc7\xfc\x15\x7f\xe0\xff\x00\xc3}\x1e\xfe\xdf\
+\xc1W\xd2\xfcA\xf1:o\x86\x18l\x22x\xacRA\
+\xfcR\x5c:\x80\xc9\xd4\x83\x10}\xdc\x0e\x01\xdc?\x16\
+\xfcO\xe2\xcds\xc6\xda\xc4\xfa\xbf\x88\xf5\x9dC_\xd5\
+\xa7\xdb\xe6\xea\x1a\xa5\xd4\x973\xc9\x80\x14nw%\x8e\
+\x00\x03\x93\xc0\x14\xdf\x0c\xf8_X\xf1\x9e\xb5m\xa3h\
+\x1aM\xee\xb7\xab]6\xd8,4\xebw\x9eyN3\
+\x85D\x05\x8f\xaf\x1e\x94\xecO7b_\x19x\xb7T\
+\xf1\xf7\x8b\xb5\xaf\x12\xebw\x1fk\xd5\xf5\x8b\xc9o\xae\
+\xe6U\xda\x1eY\x18\xbb\x90\x07A\x92@\x03\x808\x15\
+\x8f\xda\xbaO\x88\xff\x00\x0e\xf5\xdf\x84\xde6\xd5<%\
+\xe2{E\xb0\xd7\xb4\xc7H\xee\xedVd\x94F\xcd\x1a\
+\xbe\xdd\xe8J\x9c\x07\x5c\xe0\x91\x9e\x84\xd75\xda\xa8\x93\
+\xfaL\xfd\x98?\xe4\xda~\x12\xff\x00\xd8\xa3\xa4\xff\x00\
+\xe9\x1cU\xf8\xdd\xff\x00\x05V\xf1D\xfe!\xfd\xb4\xbc\
+Ug(\x22=\x16\xca\xc3N\x8b\xfd\xc3n\xb7\x1f\xfa\
+\x15\xc3W\xec\x8f\xec\xc1\xff\x00&\xd3\xf0\x97\xfe\xc5\x1d\
+'\xff\x00H\xe2\xaf\xc5O\xf8)\xa7\xfc\x9f'\xc4\xff\
+\x00\xfa\xe9\xa7\x7f\xe9\xb6\xd2\xa5\x16\xf6>_\xaf\xde\xaf\
+\xf8%\xde\x9b\x1d\x8f\xecI\xe0\x19Pa\xef$\xd4'\
+\x93\x8f\xe2\xfbt\xe8?DZ\xfc\x15\xaf\xdf\xaf\xf8&\
+\x7f\xfc\x99\x0f\xc3/\xfa\xe5}\xff\x00\xa7\x0b\x9a\x18\xa2\
+}:+\xe0\x1f\xda{\xfe\x09V\xff\x00\xb4o\xc7?\
+\x13\xfcE\xff\x00\x85\x9c<>5\xa3n\x7f\xb3\x7f\xb0\
+~\xd3\xe4\xf9V\xd1A\xfe\xb7\xed)\xbb>V\xef\xba\
+1\x9cs\x8c\xd7\xdf\xf4\x8c)\x16~X\x7f\xc3\x8fd\
+\xff\x00\xa2\xd0\xbf\xf8K\xff\x00\xf7e~\x85|5\xf0\
+l\x7f\x01\xfe\x04\xe8~\x1b\xbb\xd4\xbf\xb5\xa0\xf0\xae\x88\
+\xb6\xd2_\x88|\x8f9`\x8b\x05\xf6nm\xb9\x0b\xd3\
+q\xfa\xd7\xa2\xe2\xb8/\x8f\xd2\xbc\x1f\x02~#I\x1f\
+\xdfO\x0ej,\xbfQm%\x02\xb5\x8f\xe6\x91s\xb4\
+g\xadu_\x0a\xf5\x8d7\xc3\xdf\x13\xfc!\xaak/\
+\xe5i\x16:\xbd\x9d\xcd\xe4\x9eY}\xb0\xa4\xe8\xd2\x1d\
+\xa0d\xe1A\xe3\x04\x9a\xe5GAKTf~\xf3/\
+\xfc\x15/\xf6k\x03\xfeG\xcb\x8f\xfc\x11\xdf\xff\x00\xf1\
+\x9a\xc2\xf1\xd7\xfc\x14\xbb\xf6l\xf1?\x82|A\xa3\xaf\
+\x8eg\x94\xea\x1a}\xc5\xa0\x8d\xb4;\xe0\x1b\xcc\x8d\x93\
+\x190c\x9c\xd7\xe1\xb5\x14\xac>f\x22\xe4\x8c\x9e\xb5\
+\xd4\xfc2\xf1u\xef\x80\xfcq\xa6\xeb\xba}\xc3Z^\
+Z\xf9\x9b&S\x82\xbb\xa2t8\xfa\x865\xcb\xd0\x09\
+\x1d*\x84\x14QE\x00\x14QE\x00\x14QE\x00\x14\
+QE\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14\
+QE\x00\x15\xf4\xe7\xfc\x137\xfeO\x8b\xe1\x87\xfdu\
+\xd4?\xf4\xddu_1\xd7\xd3\x9f\xf0L\xdf\xf9>/\
+\x86\x1f\xf5\xd7P\xff\x00\xd3u\xd5&5\xb9\xfb\xf9E\
+\x14T\x9a\x05\x14Q@\x05\x14Q@\x1f1\xfe\xd3\xff\
+\x00\xb7\xef\xc3\xff\x00\xd9;\xc6\xbag\x85\xfcY\xa3x\
+\x97Q\xbf\xd44\xf1\xa9E&\x8bmo,K\x19\x96\
+H\xc0c$\xf1\x9d\xdb\xa3c\x80\x0f\x18\xe6\xbc\x7f\xfe\
+\x1fC\xf0_\xfe\x85_\x1e\x7f\xe0\x05\x97\xff\x00&W\
+\xcc\x9f\xf0ZO\xf99/\x07\x7f\xd8\xa5\x0f\xfe\x96]\
+\xd7\xe7\xf52[\xd4\xfd\x9b?\xf0Z\x0f\x82\xff\x00\xf4\
++x\xf0\x9f\xfa\xf0\xb2\xff\x00\xe4\xba\xe1\xbco\xff\x00\
+\x05\xb4\xd0mfh\xbc\x1f\xf0\xc7R\xd5\x22d;n\
+u\xcdJ;6G\xed\x98\xa2I\x83\x0f\xfbh\x0d~\
+N\xd1N\xc4\xf33\xea\xef\x8d\x9f\xf0S_\x8e_\x19\
+\xad\xe4\xb0Mz\x1f\x04\xe8\xd2(G\xb2\xf0\xb2=\xab\
+\xc9\xc99i\xd9\x9al\x90v\x90\xae\xaa@\xe5z\xe7\
+\xe5&b\xecX\x9c\x92rI\xeaM%\x14\xc5p\xaf\
+\xd8\x8f\xf8\x22\xbe\xa9\x04\xdf\x01\xbco\xa7\x0b\x98\xda\xee\
+\xdf\xc4\xad3[\x86\x1b\xd27\xb5\x80+\x15\xeb\x82\xca\
+\xe3=2\xa6\xbf\x1d\xeb\xee?\xf8$\x7f\xc6\xdb_\x86\
+\x7f\xb4=\xef\x8559V\xdbO\xf1\xa5\xa2\xdaE3\
+\x01\x81y\x09g\x84\x16$m\x0c\xad0\xef\x96(;\
+\xd2cG\xed\xad\x14\x94\xb5&\x81E\x14P\x01^3\
+\xf1S\xf6=\xf87\xf1\xaf\x5c\xba\xd6\xbci\xe0-?\
+Z\xd6n\x95\x12k\xf2\xf3C;\xaa\xa8E\x05\xe2u\
+<(\x00s\xc6+\xd9\xa8\xa0\x0c\xbf\x0e\xf8\x7fO\xf0\
+\x9e\x83\xa7h\xbaT\x1fe\xd34\xf8\x12\xd6\xda\x0d\xec\
+\xfe\x5ch6\xaa\xeebI\xc0\x03\x92I\xadJ(\xa0\
+\x02\x8a(\xa0\x0f\x9a\x7f\xe0\xa4\x1f\xf2d\x9f\x14\xbf\xeb\
+\xca\xdf\xff\x00J\xe0\xaf\xcd\xcf\xf8#\xef\xfc\x9d\xd4\xbf\
+\xf6-\xdf\x7f\xe8\xc8+\xf4\x8f\xfe\x0aA\xff\x00&I\
+\xf1K\xfe\xbc\xad\xff\x00\xf4\xae\x0a\xfc\xdc\xff\x00\x82>\
+\xff\x00\xc9\xddK\xff\x00b\xdd\xf7\xfe\x8c\x82\x9fB^\
+\xe7\xed\xcd\x14QH\xa0\xa2\x8a(\x03\xf3#\xfe\x0by\
+\xff\x00\x22\x97\xc2_\xfa\xff\x00\xd4?\xf4T5\xf9=\
+_\xac?\xf0[\xcf\xf9\x14\xbe\x12\xff\x00\xd7\xfe\xa1\xff\
+\x00\xa2\xa1\xaf\xc9\xeah\x89\x056O\xf5m\xf44\xea\
+l\x9f\xea\xdb\xe8j\x89?\xa5\x7f\xd9\xdf\xfeHG\x80\
+?\xec\x09i\xff\x00\xa2\x96\xbd\x0e\xbc\xf3\xf6w\xff\x00\
+\x92\x11\xe0\x0f\xfb\x02Z\x7f\xe8\xa5\xafC\xa85\x0a(\
+\xa2\x80<k\xf6\xc8\xf9\xbfe\x9f\x89\xc0\xf3\xff\x00\x12\
+I\xff\x00\x95|\xfd\xff\x00\x04\xa2\xfd\xa4\x7f\xe1o|\
+\x0e\xff\x00\x84'V\xb9\xf3<K\xe0\xd5Ko\x9b%\
+\xa6\xb1o\xf5\x12g\x18\xe3\x05\x0f$\x9d\xb9=k\xe8\
+\x1f\xdb\x1b\xfeMk\xe2o\xfd\x81'\xfeU\xf8a\xfb\
+ |\x7f\xb9\xfd\x9b~:\xf8o\xc5\xeb3\xa6\x91\xe6\
+}\x8fW\x89Ww\x99g!\x02L\xfc\xac~^\x1c\
+m\x1b\xbeL\x0e\xb4\xfa\x0b\xa9\xfd\x1aQT\xb4\xbdR\
+\xdbZ\xd3m5\x0b)\x96\xe2\xca\xea%\x9e\x19\x978\
+ta\x95o\xc4\x1e\xf5v\x90\xc2\x92\x96\x8a\x00\xfc#\
+\xff\x00\x82\x97~\xcb'\xf6}\xf8\xd9>\xb1\xa3\xda\xf9\
+~\x0d\xf1cIyc\xe5\x83\xb6\xda|\xe6h\x09*\
+\x00\xc1;\x80\xc9;[\x93\xda\xbfY\xbfb\x1f\x89\x83\
+\xe2\xd7\xec\xb7\xf0\xff\x00]{\xdf\xb7_.\x9c\x96W\
+\xb2c\x04\x5cC\xfb\xb7S\xee6\x8a\xd3\xfd\xab\xff\x00\
+g\xfd;\xf6\x96\xf8%\xafx2\xf0,w\xb2'\xda\
+t\xcb\xa2O\xfa=\xda\x02cn\x08\xe0\xf2\xa7<a\
+\x8f\x1cW\xc2\x9f\xf0I\x7f\x8cW\x9f\x0e|m\xe3/\
+\x80\x9e0\x12i\xba\xacwR]\xd8[\xdd\xb3)K\
+\x84\xf9n U`1\x9c\x07\x1d\xceO\x14\x08\xfdN\
+\xa2\x8a(\x18QE\x14\x00QE\x14\x00QE\x14\x00\
+W\xcf\x7f\xf0P/\xf93?\x8a\xff\x00\xf6\x08?\xfa\
+1+\xe8J\xf9\xef\xfe\x0a\x05\xff\x00&g\xf1_\xfe\
+\xc1\x07\xff\x00F%\x00~<\xff\x00\xc1;\xbf\xe4\xf2\
+\xbe\x19\xff\x00\xd7\xeb\xff\x00\xe8\xa6\xaf\xe8*\xbf\x9f_\
+\xf8'w\xfc\x9eW\xc3?\xfa\xfd\x7f\xfd\x14\xd5\xfd\x05\
+PLB\x8a(\xa0\xa0\xaf\xce?\xf8-\x87\xfc\x91\xdf\
+\x87\xbf\xf6\x1d\x93\xff\x00I\xda\xbfG+\xf3\x8f\xfe\x0b\
+a\xff\x00$w\xe1\xef\xfd\x87d\xff\x00\xd2v\xa0L\
+\xfc\x83\xa2\x8a*\xcc\xc2\xbd\x1b\xf6o\xff\x00\x93\x80\xf8\
+w\xff\x00a\xdb_\xfd\x18+\xcek\xd1\xbff\xff\x00\
+\xf98\x0f\x87\x7f\xf6\x1d\xb5\xff\x00\xd1\x82\x80G\xf4\xa5\
+E\x14T\x1a\x8dj\xf9\xe7\xe2\xff\x00\xfc\x8fW_\xf5\
+\xca?\xe4k\xe8f\xaf\x9e~/\xff\x00\xc8\xf5u\xff\
+\x00\x5c\xa3\xfeF\xbf'\xf1+\xfeD\xf1\xff\x00\x1a\xfd\
+O\xac\xe1\xaf\xf7\xd7\xe8\xff\x00C\x8dO\xbc>\xbf\xd6\
+\xbe\xad\xd2?\xe4\x17g\xff\x00\x5c\x93\xff\x00A\x15\xf2\
+\x92}\xe1\xf5\xfe\xb5\xf5n\x91\xff\x00 \xbb?\xfa\xe4\
+\x9f\xfa\x08\xaf\x96\xf0\xb7\xf8\x98\xafH\xfe\xa7\xa9\xc5;\
+R\xf9\xfe\x85\xda(\xa2\xbf\xa0O\xcf\xcf\xcc_\xf8-\
+\x7f\xc4\x01o\xe1\xaf\x87~\x09\x8cH$\xbb\xba\x9fV\
+\x95\x81\xc24q\xaf\x96\x14\x8f]\xcf\x91\xf4\xaf\xca\x1a\
+\xfa\xef\xfe\x0a\x9f\xf1\x09|q\xfb_\xeb\xf6Qy\xcb\
+\x07\x87\xad \xd2\xb6\xc8~_1W\xccv^z\x1f\
+1G\xe1_\x22U\x22$\x14W\xdc\x7f\xb2G\xfc\x13\
+\x16\x7f\xda\x8b\xe0\xfd\xbf\x8e\xe6\xf8\x82\xde\x11[\x8b\xc9\
+\xad\xa2\xb1m\x0b\xed{\xd2=\xa0J$\xfbL|\x12\
+H\xc6\xde\xddk\xda\x7f\xe1\xc7\x7f\xf5Z\xbf\xf2\xd5\xff\
+\x00\xee\xda\x05\xca\xcf\xcb:+\xf5/\xfe\x1c{\xff\x00\
+U\xab\xff\x00-O\xfe\xed\xaf\xce\x7f\x8c\xdf\x0co~\
+\x0c|T\xf1?\x81\xef\xe7\x17WZ\x1d\xeb\xda5\xc0\
+\x8f\xcb\xf3\x94\x00\xca\xfbrv\xeeR\x0e2z\xf54\
+\x05\x98\x9f\x05\xfcuq\xf0\xc7\xe2\xe7\x83\xbcYj#\
+3\xe8\xfa\xad\xbd\xda\xf9\xbfs\xe5\x90gw\xb63_\
+\xd2\xee\x9f\xa8[\xea\x966\xf7\x96\x92\xad\xc5\xa5\xc4k\
+43!\xca\xba0\x05X{\x10A\xaf\xe5\xbd\x86\xe5\
+#\xa6\x7f\x0a\xfe\x88?a\x9f\x89\x1f\xf0\xb5?e_\
+\x87\x9a\xcc\x92B\xd7\x90\xe9\xab\xa7\xdc\xa4\x04\x91\x1b\xc0\
+|\xa0\xa7\xfd\xad\xaa\x84\xff\x00\xbdI\x8e'\xe2'\xed\
+\x95\xe1\xb7\xf0\x8f\xedQ\xf1CLq\xb5\x93\x5c\x9al\
+\x0fIq(?\x93\xd7\x8c\xc9\xfe\xad\xbe\x95\xf5O\xfc\
+\x14\xe3\xc2w^\x16\xfd\xb3<o-\xc7)\xab\xad\xb6\
+\xa5\x0f\xfb\x8d\x0a\xc6?X\x9a\xbeW?04\xc9\xea\
+\x7fI\xff\x00\xb3L\x8b/\xec\xf3\xf0\xd5\x94\xe4\x7f\xc2\
+;a\xff\x00\xa2\x10W\xa5W\xce\x7f\xf0O\x7f\x18E\
+\xe3O\xd8\xff\x00\xe1\xc5\xda\xdd\xc7uqkb\xd6W\
+\x1b\x18\x13\x1c\x91H\xcb\xb1\xbd\x08]\x87\x1e\x84W\xd0\
+w\x97\x91XZ\xcfu;\xec\x82\x04i$l\x13\x85\
+Q\x92\x7f!RjY\xa2\xbf\x99\xdf\x8e\x1e4O\x88\
+\xdf\x19<o\xe2xn>\xd5k\xabk\x17W6\xf3\
+\xed*^\x16\x95\xbc\xa3\x83\xc8\xf9\x02\xf0y\xa8~\x0d\
+\xf8N\xeb\xc7\x9f\x16\xbc\x1b\xe1\xdb\x22\x05\xde\xa7\xab\xda\
+\xdbDOfiW\x14\xecO1\xfd4W\xf3G\xf1\
+\xfb\xfeK\xd7\xc4\xaf\xfb\x19\xf5?\xfd+\x96\xbf\xa5\xca\
+\xfeh\xfe?\x7f\xc9z\xf8\x95\xff\x00c>\xa7\xff\x00\
+\xa5r\xd0\x82G\x03'\xfa\xb6\xfa\x1a\xfe\x96\xbfg\xbf\
+\xf9 \x7f\x0d\x7f\xecY\xd3?\xf4\x96*\xfeid\xff\
+\x00V\xdfC_\xd2\xd7\xec\xf7\xff\x00$\x0f\xe1\xaf\xfd\
+\x8b:g\xfe\x92\xc5C\x14O@\xaf\x90\xbf\xe0\xabq\
+\x87\xfd\x8a|\x5c\xc4d\xa5\xf6\x9a\xc3\xeb\xf6\xc8\x87\xf5\
+\xaf\xafk\xc1\xff\x00n\x8f\x06\xc7\xe3\xaf\xd9'\xe2~\
+\x9b%\xb9\xba\x96=\x1ek\xc8\x22Q\x92f\x84y\xb1\
+\xe3\xdfr\x0aE\x9f\xce\xfd}i\xff\x00\x04\xae\xff\x00\
+\x93\xdc\xf0_\xfdy\xea_\xfaG-|\x94\x0e@#\
+\x9a\xfa\x07\xf6\x05\xf1\xca|=\xfd\xaf>\x1a\xeaR:\
+\xc5\x0d\xc6\xa3\xfd\x9b$\x8e\xc1UR\xe1L,I'\
+\x00\x00\xf9\xaa\xe8f\xb7?\xa1\x8a\xf9\xfb\xf6\xf9\xf1\x04\
+~\x1d\xfd\x8f~*\x5cH\xc1E\xc6\x8d5\x90'\xfb\
+\xd3b ?6\xaf\xa0\x17\xee\x8a\xf8\xaf\xfe\x0a\xe1\xe3\
+K_\x0d\xfe\xc8\x9a\x86\x93+:\xddx\x83U\xb3\xb2\
+\xb6\xda\x0e7$\x82\xe1\xf2{\x0d\x90\xb7Z\x93C\xf0\
+\xf2\xbe\x81\xfd\x80\xfc/q\xe2\xef\xdb\x0b\xe1u\xad\xb0\
+\xf9\xedud\xd4[\xfd\xc8\x14\xcc\xff\x00\xf8\xea\x1a\xf9\
+\xfa\xbe\xd9\xff\x00\x82C\xf8-\xfcI\xfbZ&\xb0\xb2\
+lO\x0e\xe8\xd7w\xac\xbf\xde\xf3\x14[\xe3\xff\x00#\
+g\xf0\xaa3[\x9f\xb7\xf4\x98\xcd|\x15\xff\x00\x05z\
+\xf8\x81\xe2\xbf\x87\x7f\x07<\x13\x7f\xe1O\x12\xeb\x1e\x18\
+\xb9\x9f\xc4\x1eD\xd7\x1a=\xfc\xb6\x92H\x9ff\x99\x82\
+3F\xcaH\xc8\x07\x04\xe3\x81_\x95_\xf0\xd4?\x19\
+\x7f\xe8\xad\xf8\xeb\xff\x00\x0aK\xdf\xfe;H\xb6\xcf\xdb\
+\xef\x8e\x1f\xb0\x17\xc1O\x8f\x0d{u\xacxF\x1d\x1b\
+]\xb9,\xef\xaex{\x16WfFm\xcd#\x05\x06\
+9X\xf72\xa3\xf5=\xf9\x1f\x9f\xff\x00\x1d?\xe0\x8e\
+~>\xf0\x82\xdc\xea?\x0d\xb5\xebO\x1ci\xe8\x19\x86\
+\x99z\x05\x96\xa09\xe1\x14\x92b\x97\x03\x9d\xc5\xa3\xf6\
+S\x9a\xfa\xb7\xfe\x09+\xf1KW\xf8\x91\xfb<\xeb\xc3\
+\xc4\x9e*\xd4<Q\xe2+/\x10\xcc%}Z\xfeK\
+\xbb\x98m\xde\x18|\xa0ZF,\x10\xb2\xcb\x81\xd3!\
+\xbd\xeb\xed\xfe\xd4\x82\xc8\xfe\x5c\xf5\x8d\x22\xfb\xc3\xfa\xa5\
+\xde\x9b\xaaY\x5ci\xba\x8d\xa4\xad\x0d\xc5\xa5\xd4M\x14\
+\xd0\xc8\xa7\x0c\x8c\xad\xf3)\x04t5T3#\x02\x0e\
+\xd6\x1d\x19z\x8fq\xf8\xd7\xdd\xff\x00\xf0X\xcf\x0dh\
+\xda/\xed1\xa3j\x1az\xc3\x1e\xa7\xaa\xe81M\xa8\
+\xc5\x14`\x16e\x96D\x8eW\xc0\xcb3(\xdb\x93\xce\
+\x22P:W\xc1\xf5Du?\xa1\x7f\xd8?\xe2\xc5\xd7\
+\xc6o\xd9S\xc0\x9a\xfe\xa5x\xb7\xda\xccV\xad\xa7_\
+\xc9\xe63\xb9\x96\x071\x83#\x13\x92\xed\x1a\xc6\xecI\
+9/\x9a\xfc\xc3\xff\x00\x82\xbf\x7f\xc9\xdd'\xfd\x8b\xb6\
+_\xfa2z\xfbS\xfe\x08\xe9\x0c\xb0\xfe\xc9\xd7\xed\x22\
+2\xac\x9e'\xbcx\xcb\x03\x86_&\xd8dz\x8c\x82\
+?\x03_\x15\xff\x00\xc1_\xbf\xe4\xee\x93\xfe\xc5\xdb/\
+\xfd\x19=IOc\xe2J\xfd\xb2\xff\x00\x82;\xdf\x9b\
+\xcf\xd92\xf628\xb5\xf15\xe4#\xfe\xfc\xdb\xbf\xfe\
+\xcf_\x89\xb5\xfa\xbd\xff\x00\x04S\xf8\x9c\xb7\x1e\x19\xf8\
+\x85\xf0\xf6\xe2\xe6\x15{K\xa8u\xbb+\x5c~\xf5\xd6\
+E\xf2\xae\x1f=\xd4\x14\xb6\x1e\xc5\xfd\xe9\xb1Gs\xf4\
+\xe6\xbf\x17\x7f\xe0\xb3W\xaf/\xedA\xe1\xdbR1\x1c\
+>\x15\xb7\x90\x1fw\xba\xb9\xcf\xfe\x80+\xf6\x8b\xd2\xbf\
+\x04\x7f\xe0\xa6\xdf\x13#\xf8\x95\xfbax\xb3\xec\xd7P\
+\xdeXx~(4+y\xad\xc8#\xf7J^U'\
+\xbb,\xd2\xcc\xa7\xddqB\x1c\xb6>V\xaf\xd9\xcf\xf8\
+#\x1d\xaf\x97\xfb1\xf8\x9a\xe7\xfez\xf8\xaa\xe1?\xef\
+\x9bko\xfe*\xbf\x18\xeb\xf7_\xfe\x09M\xe0\xd4\xf0\
+\xa7\xeck\xe1\xdb\xd5\x91\x9d\xf5\xfb\xfb\xddU\xd5\x866\
+\x1f4\xdb\x80=\xb1n\xa7\xfe\x05C&'\xcc\xff\x00\
+\xf0ZO\x8c\xd7\x7f\xda\xde\x0a\xf8Yg4\xb0\xda\x0b\
+s\xaf\xeaH\xa3\x02bY\xa2\xb6\x19\x078]\x97\x04\
+\x83\xc6J\x1e\xa2\xbf/\xfaq_m\x7f\xc1_.$\
+\x9b\xf6\xbc\x0a\xf9\xdb\x17\x87\xac\x91>\x9ed\xe7\xf9\xb1\
+\xaf\x89\xa9\xa1\xbd\xcf\xbe\xbf\xe0\x9b\xbf\xb0\x0e\x8d\xfbC\
+i\xf7\x9f\x10~!\xad\xc4\xbe\x0f\xb4\xb9k;\x0d\x1e\
+\x17x\x7f\xb4fP\x0c\x8f$\x8aC\x08\x97*\x00B\
+\x0b6F\xe1\xb0\x86\xfdq\xf8\x7f\xf0\xa7\xc1\xbf\x0at\
+\xd9,<\x1b\xe1]\x1f\xc2\xb6\x92\xed3G\xa4X\xc7\
+l&*0\x1aB\x80\x17l\x7f\x13d\xf5\xe6\xbc#\
+\xfe\x09\x96\xd1\x9f\xd8\x7f\xe1\xb7\x96T\xb0\x8e\xfc6\xde\
+\xb9\xfe\xd0\xb9\xeb\xef\xd3\xf4\xaf\xa83\xc6zT\x94\x8f\
+\xe7\xcf\xfe\x0a\x19\xff\x00'\xa1\xf1S\xfe\xbf\xe1\xff\x00\
+\xd2Xk\xe7z\xf6\xdf\xdbk\xc5\x96^6\xfd\xac\xbe\
+(\xea\xdas\xf9\x96m\xac\xc9j\x92\x0ca\xcc\x0a\xb0\
+3)\xf4-\x11 \xf7\x15\xe2UDu?\xa4\xbf\xd9\
+\x83\xfeM\xa7\xe1/\xfd\x8a:O\xfe\x91\xc5_\x8a\xdf\
+\xf0S\x88d\x87\xf6\xe2\xf8\x96\xce\x85\x04\x8d\xa7\xba\x12\
+>\xf0\xfe\xce\xb5\x19\x1e\xd9\x04}E~\xd4\xfe\xcc\x1f\
+\xf2m?\x09\x7f\xecQ\xd2\x7f\xf4\x8e*\xfc\xa4\xff\x00\
+\x82\xc7\xf8Nm\x17\xf6\x9d\xd1\xb5\xb5\xb5x\xec\xf5\x9f\
+\x0f@E\xc1L$\xb3\xc34\xc8\xea\x0fr\xa8a\xcf\
+\xfb\xc3\xda\x92)\xec|\x1f_\xbe\xbf\xf0L\x99D\x9f\
+\xb0\xff\x00\xc3<vM@\x1e}5\x1b\x9a\xfc\x0a\xaf\
+\xdb\x7f\xf8$\x1f\x8d#\xf1\x17\xec\x9at\x83$b\xe3\
+\xc3\xfa\xdd\xdd\x9f\x94\x1c\x17\xf2\xe4\x09:\xb9^\xa0\x16\
+\x9aE\x1e\xbb\x0e:\x1a\x18\xa2}\xc3_#|s\xff\
+\x00\x82\x9a|+\xfd\x9f\xfe)\xeb\x9e\x00\xf1&\x8f\xe2\
+\xbb\xadgH0\xf9\xf3i\xb6V\xf2[\xb7\x9b\x0aL\
+\xbbY\xae\x15\x8f\xcb*\x83\x95\x1c\xe7\xb75\xf5\xc6x\
+\xc9\xfc\xeb\xf9\xe4\xfd\xbd<e\x0f\x8e\xbflO\x8a\xba\
+\xa5\xbe|\xb8\xb5\x7f\xec\xeeF2m#KV#\xdb\
+0\x1f\xad\x22\x9b\xb1\xfaS\xff\x00\x0f\x9a\xf8\x1f\xff\x00\
+B\xff\x00\x8e\xbf\xf0[i\xff\x00\xc9U\xf5]\x8f\x89\
+4\xff\x00\xda\x03\xe0\x1bk\x1a<\x170i\x9e,\xd0\
+d{X\xaf\x91Re\x8exX(p\xac\xc0\x1c7\
+8c_\xcd\x7f\xb7|\xd7\xf4\x91\xfb3\xf8~\x7f\x0c\
+\xfe\xcd\xff\x00\x0c4\x8b\xa8Z\xde\xee\xd7\xc3\x1alS\
+\xc3\x22\x95d\x93\xec\xb1\xefR\x0fB\x1b4\xc4\x9d\xcf\
+\xe6\xd5~\xe8\xfaW{\xf0\x12E\x87\xe3\xa7\xc3\xa9\x1c\
+\xedD\xf1\x1e\x9c\xc5\xbd1s\x19\xcf\xe1X\x9f\x10\xbc\
+#/\xc3\xff\x00\x1f\xf8\x9b\xc2\xf36\xe9\xb4MR\xeb\
+Lv=\xda\x19\x9a2\x7f5\xac\xbd\x17S\x9bD\xd6\
+,u\x1bv)qi<w\x11\xb2\xf1\x86F\x0c\xa7\
+\xf3\x02\x99\x07\xf5\x17KT4=j\xcb\xc4z.\x9f\
+\xaa\xe9\xb7\x09w\xa7\xdf[\xc7umq\x19\x05e\x89\
+\xd428#\xa8*A\xfck\xcd\x7fj\xef\x88V\xff\
+\x00\x0a\xff\x00f\xef\x89\x1e&\x9e\xe9l\xe4\xb3\xd1.\
+\x12\xd6VR\xc3\xedR\xa1\x8a\xd9p\x01\xfb\xd3<k\
+\x9e\xdb\xb2p9\xa95=f\x8a\xfeY\xab\xeb\xdf\xf8\
+%?\x86\xae\xb5\xdf\xdbS\xc2\x97\xb0`\xc3\xa2\xd8\xea\
+\x17\xf7?\xf5\xcd\xadd\xb7\x1f\xf8\xfd\xc4t\xecM\xcf\
+\x90\xe8\xa2\x8a\xa2\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\
+\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\
+\xa0\x02\xbe\x9c\xff\x00\x82f\xff\x00\xc9\xf1|0\xff\x00\
+\xae\xba\x87\xfe\x9b\xae\xab\xe6:\xf7\x1f\xd8\x8f\xe2\x87\x87\
+~\x0b\xfe\xd4\x9e\x06\xf1\x9f\x8b/\x1bO\xf0\xf6\x97%\
+\xdb]\x5c\xa4\x0f3 {)\xe2L\x22\x02\xc7\xe7\x91\
+G\x03\xbe{Rc[\x9f\xd1=\x15\xf2?\xfc=K\
+\xf6p\xff\x00\xa1\xd2\xf3\xff\x00\x04\x97\xbf\xfcj\x8f\xf8\
+z\x97\xec\xe1\xff\x00C\xa5\xe7\xfe\x09/\x7f\xf8\xd5I\
+g\xd7\x14W\xc8\xff\x00\xf0\xf5/\xd9\xc3\xfe\x87K\xcf\
+\xfc\x12^\xff\x00\xf1\xaa?\xe1\xea_\xb3\x87\xfd\x0e\x97\
+\x9f\xf8$\xbd\xff\x00\xe3T\x01\xf5\xc5\x15\xf2?\xfc=\
+K\xf6p\xff\x00\xa1\xd2\xf3\xff\x00\x04\x97\xbf\xfcj\x8f\
+\xf8z\x97\xec\xe1\xff\x00C\xa5\xe7\xfe\x09/\x7f\xf8\xd5\
+\x00|A\xff\x00\x05\xa5\xff\x00\x93\x92\xf0w\xfd\x8aP\
+\xff\x00\xe9e\xdd~\x7fW\xd7_\xf0S/\xda\x0b\xc0\
+\xff\x00\xb4w\xc6\x8f\x0dx\x87\xc0Z\xa4\xba\xb6\x97g\
+\xe1\xf8\xec'\x9a[Im\xca\xcc.g\x90\xae\xd9\x15\
+I\x1bdS\x91\xc78\xcd|\x8bM\x10\xf7\x0a(\xa2\
+\xa8AE\x14P\x01V4\xfdF\xefG\xd4-\xaf\xec\
+.\xa6\xb1\xbf\xb5\x95g\xb7\xba\xb7r\x92C\x22\xb6Q\
+\xd5\x81\x05YH\x04\x10F\x08\x06\xab\xd1@\x1f\xbc_\
+\xb0_\xed\xc5\xa2\xfe\xd4^\x0a\x83G\xd5\xae\xa2\xb0\xf8\
+\x95\xa5[\x85\xd4t\xd9\x1b\x1flE\xc0\xfb\x5c\x1c|\
+\xc8\xc4\x8d\xca2Q\x8e\x0eAVo\xadk\xf9v\xd0\
+\xf5\xedK\xc3\x1a\xbd\xae\xab\xa3\xea\x17ZN\xa9h\xe2\
+[{\xdb)\x9a\x19\xe1q\xfcH\xe8C)\xf7\x04W\
+\xe8?\xc0\x7f\xf8,\x87\x8c\xbc'ko\xa6|P\xf0\
+\xe4>4\xb6M\xa85\x9d5\xd6\xce\xf9TgsI\
+\x1e\xdf*c\xf7@\x0a\x22\xe8rI56)K\xb9\
+\xfb\x07E|W\xe1_\xf8+\x97\xec\xff\x00\xe2\x1b9\
+&\xbf\xbe\xf1\x07\x86$F\xda-\xf5M%\xa4w\xf7\
+\x06\xdd\xa6\x5c}H>\xd5\xb9\xff\x00\x0fR\xfd\x9c?\
+\xe8t\xbc\xff\x00\xc1%\xef\xff\x00\x1a\xa4U\xd1\xf5\xc5\
+\x15\xf2?\xfc=K\xf6p\xff\x00\xa1\xd2\xf3\xff\x00\x04\
+\x97\xbf\xfcj\x8f\xf8z\x97\xec\xe1\xff\x00C\xa5\xe7\xfe\
+\x09/\x7f\xf8\xd5\x00}qE|\x8f\xff\x00\x0fR\xfd\
+\x9c?\xe8t\xbc\xff\x00\xc1%\xef\xff\x00\x1a\xa3\xfe\x1e\
+\xa5\xfb8\x7f\xd0\xe9y\xff\x00\x82K\xdf\xfe5@\x1f\
+\x5cQ_#\xff\x00\xc3\xd4\xbfg\x0f\xfa\x1d/?\xf0\
+I{\xff\x00\xc6\xa8\xff\x00\x87\xa9~\xce\x1f\xf4:^\
+\x7f\xe0\x92\xf7\xff\x00\x8dP\x07G\xff\x00\x05 \xff\x00\
+\x93$\xf8\xa5\xff\x00^V\xff\x00\xfaW\x05~m\xff\
+\x00\xc1\x1f\x7f\xe4\xee\xe5\xff\x00\xb1j\xfb\xff\x00F\xc1\
+_K~\xd9\xff\x00\xf0Po\x82\x1f\x18\xbff\x1f\x1e\
+x;\xc2\xde)\xb9\xbf\xd7\xf5KXc\xb4\xb6\x93J\
+\xba\x88H\xcbq\x13\x91\xbd\xe3\x0a>Uc\xc9\x1d+\
+\xe2\xaf\xf8'?\xc7/\x07\xfe\xcf\x9f\xb4;\xf8\xab\xc7\
+\x1a\x8b\xe9z!\xd1.\xac\xc5\xc4V\xd2\xce|\xd7x\
+\x8a\x8d\xb1\xab6\x08V\xe7\x18\xa7\xd0]O\xdf\x8a+\
+\xe4\x7f\xf8z\x97\xec\xe1\xff\x00C\xa5\xe7\xfe\x09/\x7f\
+\xf8\xd5\x1f\xf0\xf5/\xd9\xc3\xfe\x87K\xcf\xfc\x12^\xff\
+\x00\xf1\xaaC>\xb8\xa2\xbeG\xff\x00\x87\xa9~\xce\x1f\
+\xf4:^\x7f\xe0\x92\xf7\xff\x00\x8dQ\xff\x00\x0fR\xfd\
+\x9c?\xe8t\xbc\xff\x00\xc1%\xef\xff\x00\x1a\xa0\x0f\x00\
+\xff\x00\x82\xde\x7f\xc8\xa5\xf0\x97\xfe\xbf\xf5\x0f\xfd\x15\x0d\
+~OW\xe8\x07\xfc\x15\x07\xf6\xb3\xf8e\xfbKxw\
+\xe1\xed\xb7\xc3\xfdv]b}&\xf2\xf2[\xc5\x96\xc2\
+{\x7f-d\x8e \x872\x22\xee\xc9V\xe9\x9e\x95\xf9\
+\xff\x00M\x13 \xa6\xc9\xfe\xad\xbe\x86\x9dM\x93\x94`\
+:\xe2\xa8\x93\xfaV\xfd\x9d\xcf\xfcX\x8f\x00\x7f\xd8\x12\
+\xd3\xff\x00E-z\x1eE|g\xf0_\xfe\x0a\x11\xfb\
+>\xf8_\xe1\x1f\x83\xb4}O\xe2=\xad\xa6\xa3c\xa5\
+[\xdb\xdc@t\xfb\xc61\xc8\xb1\x80\xcb\x95\x84\x83\x83\
+\xe8H\xae\xd7\xfe\x1eM\xfb7\x7f\xd1N\xb4\xff\x00\xc1\
+u\xef\xff\x00\x18\xa85>\x97\xc8\xa3\x22\xbeh\xff\x00\
+\x87\x93~\xcd\xdf\xf4S\xad?\xf0]{\xff\x00\xc6(\
+\xff\x00\x87\x93~\xcd\xdf\xf4S\xad?\xf0]{\xff\x00\
+\xc6(\x03\xb4\xfd\xb2?\xe4\xd6\xfe&\xff\x00\xd8\x12\x7f\
+\xe5_\xceL\x7f\xea\xd7\xe9_\xb6\x9f\xb4\xcf\xed\xf1\xf0\
+\x17\xc7\x7f\x00<{\xe1\xfd\x0b\xe2\x1d\xad\xfe\xb1\xa8\xe9\
+S[\xda\xda\xad\x85\xda\x19d#\x85\x0c\xd0\x80>\xa4\
+\x81_\x89i\xc2\x80x8\xa6\x88\x91\xfb;\xff\x00\x04\
+\x92\xfd\xa5\x0f\xc4\xaf\x84\x97\x1f\x0d\xb5\x8b\x90\xfa\xef\x84\
+\x15V\xcfp\x00\xcb\xa7\xb7\xfa\xb1\xc0\x19(r\x9d\xce\
+\x00$\xf3_}\xee\xaf\xe6\xf3\xf6b\xf8\xe9}\xfb8\
+\xfcl\xf0\xe7\x8em\x16i\xad\xec\xa5\xf2\xaf\xeda \
+\x1b\x9bW\xc0\x96>\xa0\x13\x8c0\x04\x8f\x99FH\xaf\
+\xd4\xa1\xff\x00\x05\xa0\xf8%\x81\xff\x00\x14\xb7\x8f\xbf\xf0\
+_e\xff\x00\xc9\x94X\xa4\xf4>\xfb\xa2\xbe\x05\xff\x00\
+\x87\xd0\xfc\x13\xff\x00\xa1_\xc7\xdf\xf8/\xb2\xff\x00\xe4\
+\xca?\xe1\xf4?\x04\xff\x00\xe8W\xf1\xf7\xfe\x0b\xec\xbf\
+\xf92\x90]\x1f}W\xe5\xbf\xfc\x153\xe0\x1e\xab\xf0\
+\xcf\xc6\x9a\x0f\xed\x15\xf0\xf9\xa4\xd2u+[\xa8\x93V\
+\x9a\xc5v47\x0a\x7fstH<\x86\x03c\xfc\xbc\
+\xff\x00\x11;\xb1^\x9d\xff\x00\x0f\xa1\xf8'\xff\x00B\
+\xbf\x8f\xbf\xf0_e\xff\x00\xc9\x95\x83\xe3\xcf\xf8+O\
+\xec\xf9\xf1'\xc1\xba\xd7\x85\xf5\xff\x00\x06\xf8\xf2\xf3G\
+\xd5\xad^\xd2\xe6\x16\xd3l\x0eQ\x8627]\x91\xb8\
+\x1c\x10H\xe0\x80h\x0d\x0fv\xfd\x8a\xff\x00n/\x0a\
+\xfe\xd5\x1e\x16\xb7\xb2\x9e\xea\x0d+\xe2\x1d\x9c\x19\xd4t\
+I\x18)\x97h\x01\xa7\x80\x7f\x1cd\xf2q\xca\xe7\x90\
+8\xaf\xa8\xab\xf9~}Q|7\xe2\xa9/\xfc)\xa8\
+\xeavq\xda\xdd4\xbam\xf9o\xb3\xdeF\xa0\xfc\x8e\
+Lnv8\x18\xc9V\xeb\xd0\xd7\xd9\xdf\x05\xff\x00\xe0\
+\xae\xbf\x17~\x1d\xc3ic\xe2\xfb=;\xe26\x97\x08\
+\xda\xd2^\x83i\xa8\x15\x03\x0a>\xd1\x18*}\xcb\xc4\
+\xec{\x9av\x15\xcf\xdb:+\xf3\xa3\xc3\x1f\xf0Z\xcf\
+\x86\xf7V\x8a\xde\x22\xf0\x0f\x8a\xb4\xbb\xa2>h\xf4\xb7\
+\xb6\xbd@}\x9d\xe4\x87?\xf7\xc8\xad\xdf\xf8}\x17\xc1\
+?\xfa\x15\xbc}\xff\x00\x82\xfb/\xfeL\xa4;\xa3\xef\
+\xaa+\xe0_\xf8}\x0f\xc1?\xfa\x15\xfc}\xff\x00\x82\
+\xfb/\xfeL\xa3\xfe\x1fC\xf0O\xfe\x85\x7f\x1f\x7f\xe0\
+\xbe\xcb\xff\x00\x93(\x0b\xa3\xef\xaa+\xe0_\xf8}\x0f\
+\xc1?\xfa\x15\xfc}\xff\x00\x82\xfb/\xfeL\xa3\xfe\x1f\
+C\xf0O\xfe\x85\x7f\x1f\x7f\xe0\xbe\xcb\xff\x00\x93(\x0b\
+\xa3\xef\xaa\xf9\xef\xfe\x0a\x05\xff\x00&g\xf1_\xfe\xc1\
+\x07\xff\x00F%xO\xfc>\x87\xe0\x9f\xfd\x0a\xfe>\
+\xff\x00\xc1}\x97\xff\x00&W\x96~\xd4_\xf0T\xef\
+\x85?\x1a\xff\x00g\xff\x00\x1b\xf8\x1bC\xf0\xf7\x8c\xad\
+umn\xc3\xec\xd6\xd3j\x16v\x89\x02\xb1u9v\
+K\xa6`0\x0fE4\x05\xd1\xf2\x0f\xfc\x13\xb7\xfeO\
+/\xe1\xa7\xfd~\xbf\xfe\x8aj\xfe\x82\xeb\xf9\xbf\xfd\x95\
+>,i\x1f\x03~?x?\xc7:\xf5\xb5\xed\xde\x93\
+\xa4\x5c\xb4\xd3\xc3\xa7F\x8f;\x02\x8c\xbf(wU<\
+\x9e\xec\x05~\xa3\x7f\xc3\xe8~\x09\xff\x00\xd0\xaf\xe3\xef\
+\xfc\x17\xd9\x7f\xf2e1&\x8f\xbe\xa8\xaf\x81\x7f\xe1\xf4\
+?\x04\xff\x00\xe8W\xf1\xf7\xfe\x0b\xec\xbf\xf92\x8f\xf8\
+}\x0f\xc1?\xfa\x15\xfc}\xff\x00\x82\xfb/\xfeL\xa4\
+;\xa3\xef\xaa\xfc\xe4\xff\x00\x82\xd8\x7f\xc9\x1d\xf8{\xff\
+\x00a\xd9?\xf4\x9d\xab\xa1\xff\x00\x87\xd0\xfc\x13\xff\x00\
+\xa1_\xc7\xdf\xf8/\xb2\xff\x00\xe4\xca\xf9;\xfe\x0a\x1b\
+\xfbw\xf8\x07\xf6\xb4\xf0\x17\x85\xb4?\x08h\xfe$\xd3\
+\xae\xb4\xadM\xef&}j\xda\x08\xa3d1\x14\xc2\x98\
+\xa7\x90\x93\x93\xdc\x0a\x04\xd9\xf0\x95\x14QV@W\xa3\
+~\xcd\xff\x00\xf2p\x1f\x0e\xff\x00\xec;k\xff\x00\xa3\
+\x05y\xcdz7\xec\xdf\xff\x00'\x01\xf0\xef\xfe\xc3\xb6\
+\xbf\xfa0P\x08\xfe\x94\xa8\xa2\x8a\x83Q\xad_<\xfc\
+_\xff\x00\x91\xea\xeb\xfe\xb9G\xfc\x8d}\x0c\xd5\xf3\xcf\
+\xc5\xff\x00\xf9\x1e\xae\xbf\xeb\x94\x7f\xc8\xd7\xe4\xfe%\x7f\
+\xc8\x9e?\xe3_\xa9\xf5\x9c5\xfe\xfa\xfd\x1f\xe8q\xa9\
+\xf7\x87\xd7\xfa\xd7\xd5\xbaG\xfc\x82\xec\xff\x00\xeb\x92\x7f\
+\xe8\x22\xbeRO\xbc>\xbf\xd6\xbe\xad\xd2?\xe4\x17g\
+\xff\x00\x5c\x93\xff\x00A\x15\xf2\xde\x16\xff\x00\x13\x15\xe9\
+\x1f\xd4\xf58\xa7j_?\xd0\xbbTu\xadR-\x13\
+H\xbe\xd4g\x04\xc3i\x04\x97\x0e\x17\xa9TR\xc7\xf4\
+\x15z\xbc?\xf6\xd2\xb9\xf1\x12\xfe\xcc\xde;\xb3\xf0\x9e\
+\x8d\xabk\xbe!\xd4\xac[O\xb3\xb4\xd1m\xdak\x80\
+\xf2\x90\x9b\xf6\x8ev\xa8$\x93\xd8W\xf4\x09\xf9\xf9\xfc\
+\xfd|I\xf1sx\xff\x00\xe2'\x89\xbcL\xef+\x7f\
+kjW\x17\xaaf9p\x8f#2\xa9\xf7\x0aT~\
+\x15\xcd\xb3mR}\xb3^\xca\xbf\xb1\x8f\xc7`\xbc|\
+#\xf1\x80\x1f\xf6\x07\x9b\xff\x00\x89\xado\x09~\xc5\x1f\
+\x1b\xaf\xbcW\xa2\xdb\xdd\xfc'\xf1T6\x92\xde\xc2\xb3\
+Kq\xa6I\x1cj\x9b\xc6\xe2\xcc\xc0\x05\x00g\x93\xc5\
+Q\x99\xfbi\xfb\x19\xf8\x0d\xfe\x1a~\xcb\x7f\x0dt\x19\
+\xa6\x8a\xe2h\xb4\x88\xae\x1eXSj\xb1\x9b3t\xf5\
+\x02@\x09\xf6\xafj\xaa\xdan\x9f\x06\x93\xa6\xda\xd8\xda\
+\xa0\x8a\xd6\xd6%\x82$\x1d\x15\x14\x05Q\xf9\x01Vj\
+M\x02\xbf\x0c?\xe0\xac\x1e\x01\xb7\xf0g\xedq\xa9j\
+\x16\xb0M\x1c\x1e\x22\xd3\xad\xf5)$\x91\xb2\xb2O\x83\
+\x1c\x9b=\x00\x09\x1f\x1e\xf5\xfb\x9f_\x9c\x7f\xf0W/\
+\xd9\xbf\xc6_\x16\xdb\xe1\xef\x89<\x17\xa0j\x1e&\xbb\
+\xb17:u\xd6\x9f\xa5Y=\xc4\xca\x92m\x91eb\
+\xbd\x14\x18\xca\xf3\xdd\x85\x02g\xe4\x1d~\xbd\x7f\xc1\x17\
+>$\x7fj\xfc+\xf1\xa7\x82&xVM\x1fS]\
+B\xdd7~\xf5\xd2t\xc3\x9c\x7ft4j8\xee\xd5\
+\xf9\xd5\xff\x00\x0ce\xf1\xdb\xfe\x89\x1f\x8c?\xf0Q7\
+\xff\x00\x13_`\xff\x00\xc1.\xbe\x12\xfc^\xf8'\xfb\
+F\x5c\x1f\x12\xfc7\xf1\x06\x87\xe1\xddoJ\x9a\xce\xef\
+R\xd4\xb4\xe9\xa2\x8a\x16LK\x1f\xccF2Y\x02\xf3\
+\xebM\x92\xaeu\xff\x00\xf0Y\x8f\x80\xf3]\xd8\xf8_\
+\xe2\xd6\x9bd\xac\xb6C\xfb#X\x99\x07\xce\x11\x9b6\
+\xee\xc4\x9cm\x0cY8\x1dd\x15\xf9U_\xd3\xf7\x8b\
+<'\xa5x\xeb\xc3:\x96\x81\xae\xd9C\xa9i\x1a\x95\
+\xbb\xdb]ZN\x81\x92X\xd8`\x82\x0d~4~\xd5\
+\x7f\xf0J\xff\x00\x88?\x0au\x9b\xdd_\xe1\xae\x9fu\
+\xe3\xdf\x05\xb12Gmj<\xcdR\xcc\x13\xfe\xad\xa1\
+\x03t\xc0q\x86\x8c\x12GU\x18\xc9\x06\xd7S\x91\xfd\
+\x85\xff\x00o\xedO\xf6I\xfe\xd1\xd05m\x22o\x12\
+\xf8#R\x9c\x5c\xbd\xac\x13\xf9w\x16Sc\x0d,;\
+\xbeF\xdc1\x958\xc9U\xf9\x869\xf5\xcf\xda\xdf\xfe\
+\x0a\xc9'\xc5\xef\x87\xb7\xfe\x0c\xf8k\xe1\xfdC\xc3v\
+\x9a\xb4f\x0dGX\xd5\x9e?\xb5y\x04a\xe2\x864\
+,\xa9\xb8pd.H\x19\x00\x03\x86\x1f\x9e\xba\xb6\x93\
+}\xa0jW:v\xa7eq\xa6\xea\x16\xb2\x18\xa7\xb4\
+\xbb\x89\xa2\x96'\x1dU\xd1\xb9V\x1e\x86\xaa~g\xbf\
+\xd6\x8d\x09\xbb\x13\xa7\x03\x81_j\xff\x00\xc1(\xfe\x04\
+\xdc|P\xfd\xa4-\xbcWuj\xcf\xa0x5>\xdf\
+$\xcc\xad\xb0\xdd\x90V\xdd\x03\x0e7\x86\xf9\xf0z\x84\
+5\xe7\xdf\xb3\xdf\xfc\x13\xef\xe3\x07\xed\x01\xa9\xd9=\xb7\
+\x87.|+\xe1\x99\x80\x92O\x11k\xf0=\xb4\x1eQ\
+\x19\x0d\x0a0\x0f>GM\x80\xaeq\x96Q\xcd~\xd8\
+~\xcd\xff\x00\xb3\xcf\x86\x7ff_\x866>\x0d\xf0\xca\
+\xbc\x89\x193^_\xcc?{{p\xc0o\x95\xfd3\
+\x8e\x14p\x00\x03\x93\x92A\xa5\xd4\xf5J\xfei>?\
+\x7f\xc9z\xf8\x95\xff\x00c>\xa7\xff\x00\xa5r\xd7\xf4\
+\xb7_\xcf\xff\x00\xc6\xaf\xd9\x1b\xe3V\xb7\xf1\x9b\xc7\xfa\
+\x8d\x87\xc2\xbf\x15\xdeX\xdex\x87Q\xb8\xb7\xb8\x87J\
+\x99\x92X\xde\xe6FGR\x17\x90A\x04\x1e\xe0\xd0\x87\
+#\xe6i?\xd5\xb7\xd0\xd7\xf4\xb5\xfb=\xff\x00\xc9\x03\
+\xf8k\xff\x00b\xce\x99\xff\x00\xa4\xb1W\xe0T\x9f\xb1\
+\x8f\xc7o-\x87\xfc*?\x18t\xff\x00\xa0D\xdf\xfc\
+M~\xff\x00|\x0e\xd3.\xf4_\x82\xbe\x00\xd3\xaf\xed\
+\xa4\xb3\xbf\xb3\xf0\xfe\x9foqo2\x95x\xa4Kh\
+\xd5\x91\x81\xe8A\x04\x11\xedC\x08\x9d\xbdU\xd4,\xe2\
+\xd4l\xae-f\x1b\xa1\x9e6\x89\xc7\xfb,\x08?\xa1\
+\xabTR(\xfel\xbfi\x1f\x83\x1a\x87\xec\xff\x00\xf1\
+\xb3\xc5^\x08\xbe\x82X\xa0\xd3\xee\xdc\xd8I(?\xbf\
+\xb3rZ\x09\x15\x88\x1b\xb2\x84\x02G\x1b\x95\x87j\xf3\
+xf{y\xa3\x966\xd9,l\x1d[\x1d\x089\x1d\
+}\xc5~\xf7~\xdc\x1f\xb0\xce\x85\xfb[\xf8n\x0b\xbb\
+[\x88\xf4\x1f\x1fihWN\xd6\x19\x09\x8eX\xc9\xc9\
+\xb7\xb8Q\xcbFO!\x86Y\x0f \x10Y[\xf1\x9f\
+\xe3O\xec\xa7\xf1W\xf6\x7f\xbd\xbbO\x19\xf87R\xb1\
+\xd3\xe0\x93\xcb\x1a\xd5\xbcMq\xa7\xcb\x96!\x0a\xdc \
+\xd87c!X\x87\xc1\x19Px\xa7s6\x8f\xbd\xbe\
+\x0c\xff\x00\xc1f\xb4\xdd3\xc0\xf6Z\x7f\xc4\x9f\x07\xea\
+\xb7\xde!\xb3\xb7X[T\xd0\xde'K\xe6Q\x8f2\
+H\xe4d\xf2\xd8\xe0n\xdaX\x12I\x01G\xca>7\
+\xfd\xb3\x7fl\x8d{\xf6\xbd\xf1\xc5\x9d\xfd\xd5\x8a\xe8>\
+\x19\xd2Q\xa2\xd2\xb4t\x97\xcdh\xf7c|\xb2I\x81\
+\xbeF\xda;\x00\xa0\x003\xf33|\xef\xb8z\xd6\xcf\
+\x84\xfc\x1b\xaf\xf8\xf7X\x87H\xf0\xd6\x89\xa9x\x87U\
+\x97&;\x1d*\xd2K\x99\xdc\x01\x93\x84@I\xc0\xe4\
+\xf1\xc5\x1a\x05\xd9\x8d\x9c\x0a\xfd\xa9\xff\x00\x82H\xfc\x01\
+\xbb\xf8c\xf07P\xf1\xa6\xb1l\xd6\xba\xb7\x8c\xe6I\
+\xed\xe3\x96<<v1\x02\x22<\x80\xcb\xe63;c\
+\xa1P\x8c:\xd7\xcf?\xb1\xdf\xfc\x12\x7f\xc4:\xe6\xb7\
+\xa7\xf8\xaf\xe3E\xb0\xd14+yVh\xbc.\x92\x86\
+\xbb\xbd\xc0\x05D\xec\x84\x88\xa3$\xf2\xa0\xf9\x87k\x02\
+\x13\x83_\xae\x16v\x90i\xf6\x90\xda\xda\xc3\x1d\xbd\xb4\
+(\xb1\xc5\x0cH\x11\x11T`*\xa8\xe0\x00\x00\x00\x0a\
+\x0aH\xf9\x0b\xfe\x0a\xa1\xf0\x9e\xe3\xe2o\xec\x9f\xac^\
+\xd9G$\xf7\xde\x16\xb9\x8f]H\xd0\xa8\x068\xc3$\
+\xe4\xe7\xb2\xc2\xf27\x1c\xe5E~\x14\xfe\xb5\xfdI]\
+[Gwo,\x13\xa8\x92\x19\x14\xa3\xa3\x0c\x86R0\
+A\xfa\x8a\xfc\x82\xfd\xaf\xff\x00\xe0\x94~+\xf0\xb7\x88\
+5\x0f\x14|\x1d\xb3\xff\x00\x84\x93\xc3WR\xb4\xef\xe1\
+\xd4u[\xdd; \xb1X\x83\x10&\x8c\x1c\x80\xaaw\
+\x8c\xa8\xda\xd8-B\x06\x8f\x9b?c\xbf\xdb\x1b\xc4_\
+\xb2\x0f\x8c\xb5\x0dKM\xd3\xe2\xd7\xb4-Z4\x8bS\
+\xd1f\x98\xc2\xb3l$\xa4\x89 \x0d\xb2E\xcb\x00J\
+\xb0\xc3\xb0\xc79\x1f}j\xdf\xf0Z\xcf\x00E\xa1\xbc\
+\x9ag\xc3\xff\x00\x13]k>^V\xd6\xeekx-\
+\xcb\xfa\x19\x95\x9d\x80\xcf\x7f,\xfd+\xf2k\xc5^\x0f\
+\xd7\xfc\x0b\xacI\xa4\xf8\x97C\xd4|;\xaa\xc6\xa1\x9e\
+\xc7V\xb4\x92\xd6t\x04d\x12\x92\x00\xc0\x11\xea+&\
+\x9e\x84\xdd\x9e\x93\xfbC|y\xf1\x17\xed%\xf1SS\
+\xf1\xc7\x89\x9a8\xee\xaeU`\xb6\xb3\x80\x9f*\xce\xd9\
+3\xb2\x18\xf7\x13\xc0\xcb1\xf5gc\x81\x9cW\x9eY\
+\xd9\x5cjWp\xdaZ\xc2\xf7\x17S\xba\xc7\x141\x02\
+Y\xd8\x9c\x00\x07\xaek\xb6\xf8[\xf0\x17\xe2/\xc6\xcb\
+\xef\xb2\xf8\x17\xc1\xba\xbf\x89\x08\x91b{\x8b;f\xfb\
+4.A K;b8\xb8\x07\x97`+\xf5g\xf6\
+\x15\xff\x00\x82c\xdb|\x0e\xd6,|\x7f\xf12[M\
+o\xc6\xd6\xea\xb3i\xdaL\x03\xcc\xb4\xd2\xa4#>c\
+1\xff\x00[:\xf4\x04|\x88A*\x5c\xeduW\x0b\
+6}E\xfb\x22\xfc#\xba\xf8\x17\xfb7\xf8\x13\xc1Z\
+\x80)\xaai\xf6\x1b\xef\x90\x94&;\x99]\xa6\x962\
+P\x95m\x8d!M\xc0\x90B\x83\x9a\xfc\xa3\xff\x00\x82\
+\xbf\x7f\xc9\xdd'\xfd\x8b\xb6_\xfa2z\xfd\xbd\xaf\xc4\
+/\xf8+\xf7\xfc\x9d\xd2\x7f\xd8\xbbe\xff\x00\xa3'\xa4\
+[\xd8\xf8\x92\xba\xcf\x85\x7f\x15|S\xf0W\xc7\x1aw\
+\x8b\xbc\x1d\xaa\xbe\x91\xaeX\x92b\x9dU]YH\xc3\
+#\xa3|\xac\xac2\x08\x22\xb9:\xfb\xd3\xe1\x07\xec#\
+\xff\x00\x0d=\xfb\x11i^+\xf0x\x82\xd7\xe2>\x8f\
+\xa9\xdfD\x91\xc8Dq\xea\xd6\xe3c}\x9d\x9c\xe0$\
+\x8arQ\xcf\xcb\x96el\x06\xde\x96f\xbc\x8c\xbf\x19\
+\x7f\xc1_\xbe8x\xab\xc2\xf7ZE\xa5\x97\x85\xfc;\
+=\xc4~[j\x9a]\x8c\xdfiA\xdc\xa7\x9b3\xa2\
+\x92;\xed=x\xc7\x04|Eqq-\xdc\xf2O<\
+\x8f4\xf2\xb1y$\x91\x8b3\xb19,I\xe4\x92y\
+\xc9\xad\xdf\x1e|=\xf1?\xc2\xff\x00\x11O\xa0\xf8\xbb\
+A\xd4<7\xacC\xcbY\xeaV\xed\x0b\x95\xc9\x01\xd7\
+p\xf9\x90\x90p\xcb\x90\xd8\xc8$U\x1f\x0d\xf8kW\
+\xf1\x96\xb5m\xa3h\x1aU\xf6\xb7\xab\xdd6\xd8,4\
+\xfbw\xb8\x9eS\xd7\x0a\x88\x09c\x81\x9e\x07AHz\
+\x89\xe1\xaf\x0d\xea>0\xf1\x16\x97\xa1i\x16\xb2_j\
+\xba\x9d\xccvv\xb6\xb0\x8c\xbc\xb2\xc8\xc1Q@\xf5$\
+\x81\xf8\xd7\xf4\xad\xf0\x87\xe1\xec\x1f\x09\xfe\x16\xf8O\xc1\
+\xd6\xcf\x1c\xf1\xe8z]\xbd\x81\x9e8\xfc\xb5\x99\xe3\x8d\
+C\xc9\xb7<o`\xcd\xd7\xabW\xc2\x9f\xf0N\x7f\xf8\
+'E\xff\x00\xc2mR\xcf\xe2\x87\xc5\x1b8\xe2\xf1R\
+!m\x1f@\xde\x1f\xfb;p \xcf>>_8\xae\
+6\xa8$ l\x9f\x9f\x84\xfd\x1b\x1d\x05\x22\xd2\xb1\xf8\
+\xf1\xff\x00\x05\xa2\xf8y{\xa5\xfci\xf0g\x8dv)\
+\xd35}\x1b\xfb7p\x04\xed\x9e\xdeWs\xb8\xe3\x03\
+r\xdc.9\xc9\xf2\xdb\x8e+\xf3\xbe\xbf\xa3/\xda\xc3\
+\xf6m\xd1\xbfjo\x83\xfa\x8f\x83uI\x8d\x8d\xe0q\
+y\xa5jJ\xbb\x8d\x9d\xda\x02\x12M\xbf\xc4\xa43#\
+\x0e\xea\xec\x01\x07\x04~\x09|m\xfd\x9e|\x7f\xfb;\
+\xf8\x9aM\x13\xc7>\x1e\xba\xd2\x9f\xcdx\xado\xf6\x16\
+\xb3\xbe\x0b\x8f\x9e\xdelm\x90`\xa9#\xef.\xe0\x19\
+T\xe4\x01\x13%\xa9\xf4\xb7\xec!\xff\x00\x05\x16\x1f\xb2\
+\xc7\x86o\xbc\x19\xe2\x9d\x06\xf3\xc4\x1e\x13\x9a\xe9\xaf\xad\
+f\xd3\xe5_\xb5YH\xca\x04\x8a\x12B\x15\xe3b\xaa\
+q\xb9v\x92\xc7\xe6\xdd\xc7\xa2\xfe\xd2\x9f\xf0X\x0dW\
+\xc7^\x16\xbf\xf0\xe7\xc2\xcf\x0f^xMo\xa3\xf2\xa6\
+\xf1\x06\xa5:\x9b\xd8\xe3`C\xac1\xc7\x95\x89\xb1\x8f\
+\xdeob\x018\x0a\xd8a\xf9\xbd\x90\xd8\x1ds\xd3\xd6\
+\xbe\xb7\xfd\x8f\x7f\xe0\x9e>;\xfd\xa2\xfcM\xa6j^\
+\x22\xd2u\x0f\x09|8R\x977:\xc5\xe4F\x09o\
+\xa1$\x11\x1d\x9a\xb8\xcb\x97\x1d%\xc1\x8d@$\x96 \
+#\x1a\x05\xd9\xf2M!\xe9_~\xff\x00\xc1B?a\
+\xbf\x19\xd9\xfe\xd0_o\xf8_\xe0\x0dg[\xf0\x9e\xa1\
+\xa3\xd8\x88\xd3F\xb0y\xa1\xb2x\x22\x16\xbfg\xf9r\
+x\x8e\x08[-\xc9\xf3\x0f^M|\xd1\xff\x00\x0cc\
+\xf1\xdc\xff\x00\xcd#\xf1\x87\xfe\x0a&\xff\x00\xe2i\x8a\
+\xcc\xfd\xe1\xfd\x96fK\x8f\xd9\x97\xe1$\x88C\x0f\xf8\
+D\xb4\x91\xc7\xa8\xb3\x88\x11\xf9\x83_0\xff\x00\xc1]\
+\xfe\x05\xdc|H\xf8\x07\xa7\xf8\xd3K\xb7k\x9dS\xc1\
+7/u2.\xf6ca0U\xb8*\xaa1\xf2\xb2\
+A!,@T\x8eC\x9f_g\xfd\x80\xd7\xc4\xf6?\
+\xb2\xc7\x83tO\x19hz\xae\x81\xe2-\x0d&\xd3.\
+-u{F\xb7r\x89+\x18Y\x15\xb9d\xf2\x9a5\
+\xdd\xea\xac;W\xbf\xea\x166\xda\xa5\x8d\xc5\x95\xe4\x11\
+\xddZ\x5cF\xd1Mo:\x07\x8eDa\x86VS\xc1\
+\x04\x13\x91\xd2\xa4\xb3\xf9p\x07#\xda\xbe\x87\xfd\x8c\x7f\
+l}{\xf6A\xf1\xc6\xa1\xa8\xd9\xe9\xc9\xafxsW\
+\x89!\xd5tf\x97\xc92\x94\xdcb\x969v\x9d\x8e\
+\x85\x9b\xa8 \xab\xb0<\x95e\xfa\x0f\xf6\xbf\xff\x00\x82\
+Sx\xb7\xc0\xfa\xe6\xa7\xe2o\x83\xf6Rx\xa7\xc2S\
+H\xd3\x7f\xc2?\x1b\xee\xd44\xf0A%#\x0csq\
+\x10<.\xdc\xcb\xf3*\x95l\x19\x0f\xc0\xde!\xf0\xde\
+\xad\xe1\x1db\xe7I\xd7t\xbb\xdd\x17U\xb5m\x93\xd8\
+\xea6\xef\x04\xf17\x07\x0e\x8e\x03)\xe4pGpj\
+\x88\xd53\xf4\xfb\xe3O\xfc\x16gM\xd5<\x07}\xa7\
+\xfc5\xf0\x8e\xab\xa7\xf8\x96\xf2\x16\x855Mt\xc2\x22\
+\xb1,0dH\xd1\x9f\xcdq\xce\xd0\xc5@8$0\
+\x05O\xe5\x933;3;\x17v9,\xc7$\x9f\x5c\
+\xd3W\x9e\x9c\xe2\xbd\xc3\xe0\x7f\xec]\xf1\x83\xf6\x80\xba\
+\xb0o\x0b\xf86\xfa\x1d\x16\xe8\xa9\xff\x00\x84\x83U\x89\
+\xad4\xe5\x8c\xbe\xd6\x90J\xe3\x12\x859\xca\xc4\x1d\xb8\
+8Rh\x0dYS\xf6B\xf8\x13s\xfbF~\xd0\x1e\
+\x17\xf0z\xdb\xbc\xbaQ\x9c^\xeb\x12\xa9`\xb0\xd8D\
+CLK(%K\x02#S\xc7\xcf\x22\x0c\x8c\xd7\xf4\
+g\x8e+\xe7\xaf\xd8\xe7\xf69\xf0\xdf\xec\x8d\xe0y\xec\
+l':\xcf\x8a5-\xaf\xabkrF\x11\xa6#\xee\
+\xc5\x1a\xff\x00\x04K\x93\x81\xc9$\x92O@\xbfCT\
+\x96\xb4?\x0d\xbf\xe0\xab\x1f\x02f\xf8S\xfbK^x\
+\x9e\xd2\xd1a\xf0\xf7\x8d#\xfe\xd3\x81\xe2\x5c\x22\xdd\xa8\
+T\xbaC\xceK\x17\xdb1<\x03\xe7\xe0g\x07\x1f\x18\
+W\xf4\x99\xfbA\xfc\x01\xf0\xaf\xed%\xf0\xdbP\xf0g\
+\x8bmZ[9\xc8\x96\xda\xee\x10\xa2{+\x85\xfb\x93\
+D\xc4\x1d\xac2GL\x15fS\x90\xc4W\xe2\x87\xed\
+\x07\xff\x00\x04\xed\xf8\xc9\xf0\x1fU\xbbt\xf0\xed\xd7\x8c\
+\xfc2\x85\xda\x1dw\xc3\xd05\xc0\xf2\x86[|\xd0\xae\
+d\x83\x0a2\xc5\x81@r\x03\xbfZd\xb5\xd4\xf6\xef\
+\xd8\xef\xfe\x0a\xaa~\x08\xfc9\xd3\xbc\x09\xf1\x0b\xc3\xda\
+\x87\x88\xf4\xbd\x22#\x06\x99\xabi\x93+]\xc7\x00\xfb\
+\x90<r\x90\x19P|\xaa\xc1\xc6\xd5U]\xb8\x19\xaf\
+7\xfd\xb9\x7f\xe0\xa1\x9a\xbf\xedaig\xe1}\x0fJ\
+\x9b\xc2\xfe\x04\xb3\x9c]5\xb4\xd2\x89.u\x09\x86B\
+<\xc5F\x15\x14\x1e#RF\xec\xb1,B\x84\xf8\xf0\
+\xe5x\xc6\x08\xed\x8e\x95=\x8d\x8d\xce\xa9}oge\
+o5\xe5\xdd\xc4\x8b\x146\xf6\xe8^I\x1d\x88\x0a\xaa\
+\xa0\x12I8\x00u\xcd=\x05vA_\xab\xbf\xf0F\
+/\x81wZV\x8b\xe2\xdf\x8b:\x95\xa4\x90\x8dP\x0d\
+\x13F\x91\xc3/\x99\x028{\xa9\x06F\x1d\x0c\x8b\x0a\
+\x06\x07\x86\x82A\xd6\xbe~\xfd\x96\x7f\xe0\x96\x7f\x11\xfe\
+/k\x16\xba\xaf\xc4\x1b\x1b\xaf\x87\xbe\x0d\x86X\xdax\
+\xef\xe21jw\x8b\xb8\xee\x8e\x18\x18n\x8b\x85\xc1y\
+\x82\xe3z\x95Y0@\xfd\xa0\xf0_\x83to\x87\x9e\
+\x15\xd2\xbc7\xe1\xdb\x08\xf4\xbd\x0fK\xb7KK;8\
+\x89+\x14h0\xa3,K1\xc7V$\x92I$\x93\
+I\x8d.\xa7\xf3\x07E\x14U\x12\x14QE\x00\x14Q\
+E\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14Q\
+E\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14Q\
+E\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14Q\
+E\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14Q\
+E\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14Q\
+E\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14Q\
+E\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14Q\
+E\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14Q\
+E\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14Q\
+E\x00\x14QE\x00\x14QE\x00\x15\xe8\xdf\xb3\x7f\xfc\
+\x9c\x07\xc3\xbf\xfb\x0e\xda\xff\x00\xe8\xc1^s^\x8d\xfb\
+7\xff\x00\xc9\xc0|;\xff\x00\xb0\xed\xaf\xfe\x8c\x14\x02\
+?\xa5*(\xa2\xa0\xd4kW\xcf?\x17\xff\x00\xe4z\
+\xba\xff\x00\xaeQ\xff\x00#_C5|\xf3\xf1\x7f\xfe\
+G\xab\xaf\xfa\xe5\x1f\xf25\xf9?\x89_\xf2'\x8f\xf8\
+\xd7\xea}g\x0d\x7f\xbe\xbfG\xfa\x1cj}\xe1\xf5\xfe\
+\xb5\xf5n\x91\xff\x00 \xbb?\xfa\xe4\x9f\xfa\x08\xaf\x94\
+\x93\xef\x0f\xaf\xf5\xaf\xabt\x8f\xf9\x05\xd9\xff\x00\xd7$\
+\xff\x00\xd0E|\xb7\x85\xbf\xc4\xc5zG\xf5=N)\
+\xda\x97\xcf\xf4.\xd1E\x15\xfd\x02~~\x14\x94\xb4P\
+\x02t\xa5\xa2\x8a\x00))h\xa0\x02\x8a(\xa0\x02\x90\
+\x8c\xd2\xd1@\x14\xb5-\x1e\xc3X\x84C\xa8X\xdb\xdf\
+E\xff\x00<\xeebY\x17\xf2`j\xae\x97\xe1=\x13\
+C\x90\xc9\xa6\xe8\xd6\x1a{\x9e\xadkl\x91\x93\xff\x00\
+|\x81Z\xf4P\x02*\xed\xa5\xa2\x8a\x00))h\xa0\
+\x02\x92\x96\x8a\x00(\xa2\x8a\x00)6\x8c\xfb\xd2\xd1@\
+\x18w\xbe\x09\xf0\xee\xa7pn/4\x1d2\xeerr\
+e\x9e\xce7c\xf8\x95\xadK;\x1b}>\xdd \xb6\
+\xb7\x8e\xda\x05\xfb\xb1\xc2\x81\x14}\x00\xab\x14P\x02\x0e\
+\x9cR\xd1E\x00\x14\x84f\x96\x8a\x00\x82\xe2\xd2\x0b\xc8\
+Z\x19\xe1\x8eh[\x86\x8eE\x0c\xa7\xea\x0dcC\xe0\
+\x1f\x0c\xdb\xce'\x8b\xc3\xbaLS\x03\x91$vQ+\
+g\xd8\x85\xcdt\x14P\x03UB\xa8\x00`\x0e\x00\xa5\
+\xa5\xa2\x80\x0a\xfcB\xff\x00\x82\xbf\x7f\xc9\xdd'\xfd\x8b\
+\xb6_\xfa2z\xfd\xbd\xaf\xc4/\xf8+\xf7\xfc\x9d\xd2\
+\x7f\xd8\xbbe\xff\x00\xa3'\xa0Oc\xe2J\xfd\xc6\xff\
+\x00\x82G\xff\x00\xc9\x9f\xd9\xff\x00\xd8f\xf7\xff\x00d\
+\xaf\xc3\x9a\xfd\xc6\xff\x00\x82G\x7f\xc9\x9f\xd9\xff\x00\xd8\
+j\xf7\xff\x00d\xa6\xc9\x8e\xe7\xd8\xba\x96\x93c\xac\xda\
+\x9b}B\xce\xde\xfa\xdd\xb91\x5c\xc4\xb2!\xfa\x82\x08\
+\xa6\xe9z&\x9f\xa1\xc2a\xd3\xac-l!'&;\
+XV%\xfc\x94\x0a\xbdKH\xb1\x07JZ(\xa0\x02\
+\xa0\xb8\xb5\x82\xf2\x19!\x9e\x14\x9e)\x06\x1e9\x142\
+\xb0\xf4 \xf5\xa9\xe8\xa0\x0cm7\xc1\xfa\x0e\x8b7\x9d\
+\xa7\xe8\x9au\x8c\xdf\xf3\xd2\xda\xd28\xdb\xf3U\x15\xb0\
+\x00\x14\xb4P\x02b\x96\x8a(\x00\xa2\x8a(\x00\xaa\x97\
+\xfa]\x9e\xa9n`\xbd\xb4\x82\xf2\x13\xd6;\x88\xc3\xaf\
+\xe4E[\xa2\x801\xb4\xdf\x07h\x1a4\xfe~\x9f\xa2\
+i\xd63\x7f\xcfKkH\xe3o\xcd@\xad\x8d\xa2\x96\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\xcc\xd5|3\xa3\xeb\
+\x8c\x0e\xa5\xa4\xd8\xea$t7V\xc9.?\xef\xa0j\
+M3C\xd3\xb4XLZv\x9fka\x1bu[X\
+V \x7f\x05\x02\xaf\xd1@\x088\xa5\xa2\x8a\x00\xfeY\
+\xe8\xa2\x8a\xb3 \xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xafF\xfd\x9b\xff\x00\xe4\xe0>\x1d\xff\
+\x00\xd8v\xd7\xff\x00F\x0a\xf3\x9a\xf4o\xd9\xbf\xfeN\
+\x03\xe1\xdf\xfd\x87m\x7f\xf4`\xa0\x11\xfd)QE\x15\
+\x06\xa3Z\xbey\xf8\xbf\xff\x00#\xd5\xd7\xfdr\x8f\xf9\
+\x1a\xfa\x19\xab\xe7\x9f\x8b\xff\x00\xf2=]\x7f\xd7(\xff\
+\x00\x91\xaf\xc9\xfcJ\xff\x00\x91<\x7f\xc6\xbfS\xeb8\
+k\xfd\xf5\xfa?\xd0\xe3S\xef\x0f\xaf\xf5\xaf\xabt\x8f\
+\xf9\x05\xd9\xff\x00\xd7$\xff\x00\xd0E|\xa4\x9fx}\
+\x7f\xad}[\xa4\x7f\xc8.\xcf\xfe\xb9'\xfe\x82+\xe5\
+\xbc-\xfe&+\xd2?\xa9\xeaqN\xd4\xbe\x7f\xa1v\
+\x8a(\xaf\xe8\x13\xf3\xf0\xa2\x8a(\x00\xa2\x8a(\x00\xa2\
+\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\
+\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\
+\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\
+\x8a(\x00\xa2\x8a(\x00\xaf\xcf\xaf\xdb\x7f\xfe\x09\xc3\xe3\
+\x0f\xda\x97\xe3p\xf1\xb6\x89\xe2\xad\x0fF\xb1\x1a]\xbd\
+\x87\xd9\xef\xd6c.\xe8\xdaF-\xf2\xa9\x18;\xc69\
+\xeck\xf4\x16\x8a\x00\xfc{\xff\x00\x87)|H\xff\x00\
+\xa1\xff\x00\xc2\xdf\xf7\xc5\xcf\xff\x00\x1b\xaf\xd0\x8f\xd8\xa7\
+\xf6y\xd5\xff\x00f\x0f\x82\x10x#[\xd5,\xb5{\
+\xd8\xef\xe7\xbb76\x01\xc4[d\xdb\x81\xf3\x80r6\
+\x9e\xdd\xeb\xdf(\xa0V\x0a(\xa2\x81\x85\x14Q@\x05\
+\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\
+\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\
+\x14Q@\x05\x14Q@\x1f\xcb=\x155\xf7\xfc~O\
+\xff\x00]\x1b\xf9\x9a\x86\xac\xc8(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00+\xd1\xbff\xff\x00\xf9\
+8\x0f\x87\x7f\xf6\x1d\xb5\xff\x00\xd1\x82\xbc\xe6\xbd\x1b\xf6\
+o\xff\x00\x93\x80\xf8w\xff\x00a\xdb_\xfd\x18(\x04\
+\x7fJTQEA\xa8\xd6\xaf\x9e~/\xff\x00\xc8\xf5\
+u\xff\x00\x5c\xa3\xfeF\xbe\x86j\xf9\xe7\xe2\xff\x00\xfc\
+\x8fW_\xf5\xca?\xe4k\xf2\x7f\x12\xbf\xe4O\x1f\xf1\
+\xaf\xd4\xfa\xce\x1a\xff\x00}~\x8f\xf48\xd4\xfb\xc3\xeb\
+\xfdk\xea\xdd#\xfeAv\x7f\xf5\xc9?\xf4\x11_)\
+'\xde\x1f_\xeb_V\xe9\x1f\xf2\x0b\xb3\xff\x00\xaeI\
+\xff\x00\xa0\x8a\xf9o\x0b\x7f\x89\x8a\xf4\x8f\xeaz\x9cS\
+\xb5/\x9f\xe8]\xa2\x8a+\xfa\x04\xfc\xfc(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00\xff\xd9\
+\x00\x00\xbb{\
+\xff\
+\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x01\x00\xdc\x00\
+\xdc\x00\x00\xff\xe1\x00\x22Exif\x00\x00MM\x00\
+*\x00\x00\x00\x08\x00\x01\x01\x12\x00\x03\x00\x00\x00\x01\x00\
+\x01\x00\x00\x00\x00\x00\x00\xff\xdb\x00C\x00\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\xff\xdb\x00C\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\xff\xc0\x00\x11\x08\x00\xd4\x03\xcc\x03\x01\x22\x00\x02\x11\
+\x01\x03\x11\x01\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\
+\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\
+\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\
+\x04\x03\x05\x05\x04\x04\x00\x00\x01}\x01\x02\x03\x00\x04\x11\
+\x05\x12!1A\x06\x13Qa\x07\x22q\x142\x81\x91\
+\xa1\x08#B\xb1\xc1\x15R\xd1\xf0$3br\x82\x09\
+\x0a\x16\x17\x18\x19\x1a%&'()*4567\
+89:CDEFGHIJSTUVW\
+XYZcdefghijstuvw\
+xyz\x83\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\
+\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\
+\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\
+\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\
+\xe9\xea\xf1\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\x1f\
+\x01\x00\x03\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\
+\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\
+\xb5\x11\x00\x02\x01\x02\x04\x04\x03\x04\x07\x05\x04\x04\x00\x01\
+\x02w\x00\x01\x02\x03\x11\x04\x05!1\x06\x12AQ\x07\
+aq\x13\x222\x81\x08\x14B\x91\xa1\xb1\xc1\x09#3\
+R\xf0\x15br\xd1\x0a\x16$4\xe1%\xf1\x17\x18\x19\
+\x1a&'()*56789:CDEF\
+GHIJSTUVWXYZcdef\
+ghijstuvwxyz\x82\x83\x84\x85\
+\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\
+\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\
+\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\
+\xd9\xda\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\xf6\
+\xf7\xf8\xf9\xfa\xff\xda\x00\x0c\x03\x01\x00\x02\x11\x03\x11\x00\
+?\x00\xfe\x0b\xe8\xa2\x8a\xe8<\xf0\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x13\xdb\xe6\xbf4E?\
+\xfa\x89?\xeb\x94\xdf\xfa\x00\xaf\xf6\xf7\xff\x00\x82n\xff\
+\x00\xc9\x80~\xc6_\xf6m?\x07?\xf5\x06\xd1\xab\xfc\
+B'\xff\x00Q'\xfdr\x9b\xff\x00@\x15\xfe\xde\xff\
+\x00\xf0M\xdf\xf90\x0f\xd8\xcb\xfe\xcd\xa7\xe0\xe7\xfe\xa0\
+\xda5D\xf6^\xbf\xd7\xf5\x7f\xbf\xa7M\x0e\xbf?\xd0\
+\xfbQ\x86F=\xc7\xf3\x15\xe0\xff\x00\xb4\x91e\xf8%\
+\xf1\x15\x95\x8a\x9f\xf8Gn\x80*J\x91\xf3' \x82\
+1\xd6\xbd\xe1\xf3\xb7\xf2\xfe\x7f\xe3^\x0f\xfbJ\x7f\xc9\
+\x13\xf8\x8c?\xea^\xba\xc7\xa6K.?\x0e\x99\xf6\xe9\
+_\x9a\xf8\xbc\xe4\xbc,\xf1\x0d\xab&\xb83\x88\xec\xdf\
+O\xf8N\xab\x7f\xe9\x7f\x91\xf4\xfc)\xff\x00%G\x0e\
+_o\xed\xac\xbbO\xfb\x9c\xc3\xaf\xd4\xfcL\xf3\xee\x09\
+%\xa7\x9c\x13\x90\x00\x95\xd8\x13\x86\xe4\xe5\x94\x83\xdb\x18\
+ }k\xf6\xa7\xf6cb~\x0b\xf8\x1c\x96/\x9d>\
+BY\xb2X\xff\x00\xa6\xded\x92I9\xe0\x03\x92k\
+\xf1L\xf2\xc0s\xcb7?\xee\xfc\xbf\xcd\x81\xf7\x19\xe9\
+_\xb5_\xb3\x07?\x05<\x10;\xff\x00g\xca=\xb9\
+\xbe\xbb#\xf2\xcf5\xfeC\xfe\xcd\x1a\x95%\xe2\xef\x18\
+*\x959\xff\x00\xe3\x0d\xc4Y/\xfb\x19\xe0\xff\x00O\
+\xebS\xfa\xff\x00\xe98\xa1\xfe\xa9\xe4.1\xe5o9\
+\x8aw\xdb\xfd\xce\xbf\x9d\xee\xb6\xbb[\x1fCQE\x15\
+\xfe\xde\x9f\xc4!E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x07\xf8\x1b\xd1E\x15\xd0y\xe1E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\
+\x01E\x14P\x01E\x14P\x01E\x14P'\xb7\xcd~\
+h\x8a\x7f\xf5\x12\x7f\xd7)\xbf\xf4\x01_\xed\xef\xff\x00\
+\x04\xdd\xff\x00\x93\x00\xfd\x8c\xbf\xec\xda~\x0e\x7f\xea\x0d\
+\xa3W\xf8\x84O\xfe\xa2O\xfa\xe57\xfe\x80+\xfd\xbd\
+\xff\x00\xe0\x9b\xbf\xf2`\x1f\xb1\x97\xfd\x9bO\xc1\xcf\xfd\
+A\xb4j\x89\xec\xbd\x7f\xaf\xea\xff\x00\x7fN\x9a\x1d~\
+\x7f\xa1\xf6\xa3\xfd\xd3\xf8\x7f1^\x0f\xfbJ\x7f\xc9\x14\
+\xf8\x8b\xff\x00b\xfd\xcf\xfe\x86\xb5\xef\x0f\xf7O\xe1\xfc\
+\xc5x?\xed)\xff\x00$S\xe2/\xfd\x8b\xf7?\xfa\
+\x1a\xd7\xe6\xbe/\xff\x00\xc9\xab\xf1\x13\xfe\xc8\xce#\xff\
+\x00\xd5mS\xe9\xf8W\xfeJ~\x1c\xff\x00\xb1\xde[\
+\xff\x00\xa9\xb8c\xf1(\xff\x00\xac_\xac\x9f\xfa\x14u\
+\xfbS\xfb0\x7f\xc9\x16\xf0G\xfd\x83\xdf\xff\x00Kn\
+\xeb\xf1W\xa4\x8b\xfe\xf4\x9f\xabFk\xf6\xab\xf6`\xff\
+\x00\x92-\xe0\x8f\xfb\x07\xbf\xfe\x96\xdd\xd7\xf9\x03\xfb3\
+\xff\x00\xe4\xf0\xf1\x7f\xfd\x91\xb8\x8f\xfdY\xe0\xff\x00\xe0\
+\x9f\xd7\xff\x00I\xcf\xf9$\xb2\x1f\xfb\x1d/\xfdC\xae\
+}\x0dE\x14W\xfb\x86\x7f\x10\x85\x14Q@\x05\x14Q\
+@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q\
+@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q\
+@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q\
+@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q\
+@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q\
+@\x05\x14Q@\x05\x14Q@\x1f\xe0oE\x14WA\
+\xe7\x85\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q\
+@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q\
+@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q\
+@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q\
+@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q\
+@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q\
+@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q\
+@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q\
+@\x9e\xdf5\xf9\xa2)\xff\x00\xd4I\xff\x00\x5c\xa6\xff\
+\x00\xd0\x05\x7f\xb7\xbf\xfc\x13w\xfeL\x03\xf62\xff\x00\
+\xb3i\xf89\xff\x00\xa86\x8d_\xe2\x11?\xfa\x89?\
+\xeb\x94\xdf\xfa\x00\xaf\xf6\xf7\xff\x00\x82n\xff\x00\xc9\x80\
+~\xc6_\xf6m?\x07?\xf5\x06\xd1\xaa'\xb2\xf5\xfe\
+\xbf\xab\xfd\xfd:hu\xf9\xfe\x87\xda\x8f\xf7O\xe1\xfc\
+\xc5x?\xed)\xff\x00$S\xe2/\xfd\x8b\xf7?\xfa\
+\x1a\xd7\xbc?\xdd?\x87\xf3\x15\xe0\xff\x00\xb4\xa7\xfc\x91\
+O\x88\xbf\xf6/\xdc\xff\x00\xe8k_\x9a\xf8\xbf\xff\x00\
+&\xaf\xc4O\xfb#8\x8f\xff\x00U\xb5O\xa7\xe1_\
+\xf9)\xf8s\xfe\xc7yo\xfe\xa6\xe1\x8f\xc4\x9c\xfe\xf1\
+\x7f\xde\x93\xf4h\xc5~\xd5~\xcc\x1f\xf2E\xbc\x11\xff\
+\x00`\xf7\xff\x00\xd2\xdb\xba\xfcV\xff\x00\x96\x8b\xf5\x93\
+\xff\x00B\x8f?\xad~\xd4\xfe\xcc\x1f\xf2E\xbc\x11\xff\
+\x00`\xf7\xff\x00\xd2\xdb\xba\xff\x00 \x7ff\x7f\xfc\x9e\
+\x1e/\xff\x00\xb27\x11\xd3\xfe\xa6x?\xf8'\xf5\xff\
+\x00\xd2s\xfeI<\x87\xfe\xc7K\xff\x00P\xeb\x9fC\
+QE\x15\xfe\xe1\x9f\xc4!E\x14P\x01E\x14P\x01\
+E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01\
+E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01\
+E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01\
+E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01\
+E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01\
+E\x14P\x01E\x14P\x07\xf8\x1b\xd1E\x15\xd0y\xe1\
+E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01\
+E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01\
+E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01\
+E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01\
+E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01\
+E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01\
+E\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01\
+E\x14P\x01E\x14P\x01E\x14P\x01E\x14P'\
+\xb7\xcd~h\x8a\x7f\xf5\x12\x7f\xd7)\xbf\xf4\x01_\xed\
+\xef\xff\x00\x04\xdd\xff\x00\x93\x00\xfd\x8c\xbf\xec\xda~\x0e\
+\x7f\xea\x0d\xa3W\xf8\x84O\xfe\xa2O\xfa\xe57\xfe\x80\
++\xfd\xbd\xff\x00\xe0\x9b\xbf\xf2`\x1f\xb1\x97\xfd\x9bO\
+\xc1\xcf\xfdA\xb4j\x89\xec\xbd\x7f\xaf\xea\xff\x00\x7fN\
+\x9a\x1d~\x7f\xa1\xf6\xa3\xfd\xd3\xf8\x7f1^\x0f\xfbJ\
+\x7f\xc9\x14\xf8\x8b\xff\x00b\xfd\xcf\xfe\x86\xb5\xef\x0f\xf7\
+O\xe1\xfc\xc5x?\xed)\xff\x00$S\xe2/\xfd\x8b\
+\xf7?\xfa\x1a\xd7\xe6\xbe/\xff\x00\xc9\xab\xf1\x13\xfe\xc8\
+\xce#\xff\x00\xd5mS\xe9\xf8W\xfeJ~\x1c\xff\x00\
+\xb1\xde[\xff\x00\xa9\xb8c\xf1'\xf8\xd7\xfd\xe9\x7f\xf4\
+4\xaf\xda\xaf\xd9\x83\xfeH\xb7\x82?\xec\x1e\xff\x00\xfa\
+[w_\x8a\xd9\xcc\x8b\xfe\xf4\x9f\xa3F+\xf6\xa7\xf6\
+`\xff\x00\x92-\xe0\x8f\xfb\x07\xbf\xfe\x96\xdd\xd7\xf9\x05\
+\xfb3\xef\xff\x00\x11\x87\x8b\xff\x00\xec\x8d\xc4\x7f\xea\xcf\
+\x07\xff\x00\x00\xfe\xbf\xfaN\x7f\xc9'\x90\xff\x00\xd8\xe9\
+\x7f\xea\x1ds\xe8j(\xa2\xbf\xdc#\xf8\x84(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\xff\x00\x03\
+z(\xa2\xba\x0f<(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00)F\x08ps\xca\
+0\x03\x00\x86\xc8#\x0c\x0eA^\xe5J\x95n\x84\xa8\
+\xe6\x92\x94\x1f\xe4\x7fQ\x8a\x0a_g\xfc_\xfc\x89\xfd\
+\xaf~\xc8_\xf0g\xe5\xa7\xedU\xfb.\xfc\x02\xfd\xa4\
+_\xfe\x0a\x19s\xe0V\xf8\xe1\xf0\xa7\xc1\x7f\x13\x8f\x83\
+\xbf\xe1\x94\xe2\xf18\xf0\xd1\xf1\x86\x89i\xad\x1d\x18x\
+\x80~\xd1\xbe\x1d\xfe\xd8\xfb\x01\xbb\xfb1\xd4N\x85\xa4\
+\x9b\xb3\x19\x9f\xec\x16\xa2A\x0a}\x19\xff\x00\x10?X\
+\xff\x00\xd2M\xee\x7f\xf1\x0dc\xff\x00\xe8\xa7\xaf\xeb\x13\
+\xfe\x09\x0d\xc7\xfc\x12\xf7\xf6\x07\x1e\x9f\xb2\xa7\xc1\x7f\xfd\
+B4\x8a\xfd\x19\xac$\xee\xd9\xd8\xa3\x1d/\x15}:\
+u\xd3\xfc\x91\xfc\x11\x7f\xc4\x0f\xd6?\xf4\x93{\x9f\xfc\
+CX\xff\x00\xfa)\xe8\xff\x00\x88\x1f\xac\x7f\xe9&\xf7\
+?\xf8\x86\xb1\xff\x00\xf4S\xd7\xf7\xbbE \xe4\x8f\xf2\
+\xaf\xbb\xd3\xfc\x91\xfc\x11\x7f\xc4\x0f\xd6?\xf4\x93{\x9f\
+\xfcCX\xff\x00\xfa)\xe8\xff\x00\x88\x1f\xac\x7f\xe9&\
+\xf7?\xf8\x86\xb1\xff\x00\xf4S\xd7\xf7\xbbE\x01\xc9\x1f\
+\xe5_w\xa7\xf9#\xf8\x22\x1f\xf0c\xed\x89\xe3\xfe\x1e\
+mt}\x87\xecm\x18'\x1c\xf5\xff\x00\x86\xa7\xe2\xa1\
+\xbb\xff\x00\x83\x1f#\x109\xb1\xff\x00\x82\x98\xcan\x02\
+\x9f-n\x7fc\xc0\x90\xb3c\xe5V\x92/\xda\x96G\
+\x88\x13\x80eX\xa51\x8c\xb7\x95.6\x1f\xef\x8e\x8a\
+\x04\xe9\xc1\xef\x15\xff\x00\x0do\xf2G\xf9\x96\xfc}\xff\
+\x00\x836\xbf\xe0\xa0\xbf\x0e\xe2\xd4\xf5\x1f\x82\x1f\x19\xbf\
+g\xff\x00\xda\x03L\xb4\xb8O\xec\xed%\xee\xfcM\xf0\
+\xab\xc6\x9a\x95\x92D\xf2\xcd-\xce\x91\xe2-?_\xf0\
+\xa5\x9d\xc4\x93\x22\xdb[[C\xe3\xdb\x934\xb2\x89\x99\
+\x91\x04\x82\xdf\xf9\x87\xfd\xa4\x7fe\xaf\xda#\xf6C\xf8\
+\x95\x7f\xf0\x8b\xf6\x98\xf8A\xe3\x9f\x83\x7f\x11,m\xfe\
+\xdb\xfd\x81\xe3]\x1ak\x06\xd5t\xdf:{a\xaex\
+{T\x8d\xeeto\x14\xe8s\xdc\xda\xddC\x16\xbf\xe1\
+\xcdGT\xd2..`\x9e(o\x0c\xb1\xbcI\xfe\xe8\
+\x92B%\xce\xee\x84`\xf0\x09\xe3<\x8d\xc1\x97\xa30\
+ \xa9\xe0\x9eA\xc5|\xa9\xfb]~\xc4_\xb3'\xed\
+\xd7\xf0\xba\xef\xe1\x07\xedI\xf0\x9b\xc3?\x14\xfc\x1d;\
+M>\x9cuX\x1e\xdb\xc4^\x15\xbf\x9e1\x0b\xea\xde\
+\x0c\xf1U\x89\xb7\xd7\xbc+\xab\x08\x82\xab_\xe8\x97\xb6\
+R\xdc\x08\xe3\x8e\xe7\xcd\x8dT-)4C\xa3\x1f\xb3\
+\xee\xbd\xf4\xd7\xf5\xfcO\xf0\xe8\xea\x09\x1c\x85`\xa4\x8e\
+@f\x0cT\x13\xd3,\x11\xd9F~eR\xc3*3\
+E~\xdf\x7f\xc1i?\xe0\x8a\xbf\x1b\xff\x00\xe0\x93\xdf\
+\x18\x12r\xba\xaf\xc4?\xd9O\xe2O\x88\xb5k\x7f\x82\
+_\x19\xc4\x22\xeaP\xb1o\xbf\x83\xe1\xe7\xc4h\xf4\xeb\
+\x1bh4O\x89:^\x90\xa6W\xff\x00D\xb3\xd2\xbc\
+mm\xa7\xea:\xff\x00\x86\xe2\xdba\xac\xe9^\x1f\xfc\
+A\xfe`\x90\xd8\xc3\x05#o\xcaYr\xa1\xb9?.\
+\xed\xc3\x07#\x15\xaaw\xd8\xe6i\xad\xd5\x82\x8a(\xa6\
+ \xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00=9\xe9\xd7\xf2\xe6\xbe\
+\xda\xfd\x81\x7f`?\x8f_\xf0R\x0f\x8e\xff\x00\xf0\xce\
+\xdf\xb3\xa2\xf88\xfcA>\x12\xd7<g\xff\x00\x15\xc6\
+\xbe\xde\x1c\xd1\x86\x8d\xe1\xf9la\xbfa~,\xef\x95\
+\xee\x96MB\xdb\xca\xb6x6\xce\xbe`\xde\x85C\x0f\
+\x89\x0fC\xf4?\xca\xbf\xa9O\xf84??\xf0\xf6e\
+\xc7\xfd\x1b\xb7\xc5_\xcf\xfbG\xc2\x98\xa5'd\xd9P\
+\x5c\xd2I\xec\xd8\x83\xfe\x0d\x07\xff\x00\x82\xb6\xff\x00\xcf\
+\xaf\xec\xdb\xc7s\xf1\x92a\xef\xc0\xff\x00\x84O\xa0\xce\
+\xd1\xdc\x81\xb9\xb2\xc5\x98\xaf\xfcB\x0d\xff\x00\x05m\xff\
+\x00\x9f_\xd9\xb3\xff\x00\x0f$\xdf\xfc\xc9\xd7\xfa\x99\xfc\
+\xff\x00\xec\xfe\xb4|\xff\x00\xec\xfe\xb5\x9f<\xbf\xaf\xeb\
+\xfa\xbf\xa1\xd3\xeca\xfd\xef\xbf\xfe\x07\xf5\x7fK\x7f\x96\
+a\xff\x00\x83A\xff\x00\xe0\xad\xd88\xb6\xfd\x9b\x81\xc7\
+\x1b>3H\x8d\xcf\x18\x0e|!(L\x8e7yo\
+\xb7\xa8\x19\xe4~\x1f~\xde\xdf\xb0w\xc7O\xf8''\
+\xc7\xdb\xbf\xd9\xb7\xf6\x89O\x09'\xc4{/\x0a\xf8w\
+\xc63/\x82u\xe6\xf1\x1e\x824\x7f\x13\xc1,\xda_\
+\x97\xa9\xb5\xad\x89{\x82\x96\xf2y\xf0}\x8e3n\xdc\
+\x19&\xf32\x9f\xed\xe6w\x91\x8f\x94~u\xfeW?\
+\xf0wR\x15\xff\x00\x82\xbdk\xa4\xf5\x7f\xd9\xf7\xe0\xcb\
+\x029\xe3\xec\x1a\xba\x1eO|\xa1\xe3\xa7\xe3N2\xbc\
+\xb5\xedb*C\x96\x16\x8av\xdd\xf5\xfe_\xf2?\x98\
+\x0a(\xa2\xb40\x7f\xa2\xfc\x90QE\x14\x08(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x04\xf6\xf9\xaf\
+\xcd\x11O\xfe\xa2O\xfa\xe57\xfe\x80+\xfd\xbd\xff\x00\
+\xe0\x9b\xbf\xf2`\x1f\xb1\x97\xfd\x9bO\xc1\xcf\xfdA\xb4\
+j\xff\x00\x10\x89\xff\x00\xd4I\xff\x00\x5c\xa6\xff\x00\xd0\
+\x05\x7f\xb7\xbf\xfc\x13w\xfeL\x03\xf62\xff\x00\xb3i\
+\xf89\xff\x00\xa86\x8dQ=\x97\xaf\xf5\xfd_\xef\xe9\
+\xd3C\xaf\xcf\xf4>\xd4\x7f\xba\x7f\x0f\xe6+\xc1\xff\x00\
+iO\xf9\x22\x9f\x11\x7f\xec_\xb9\xff\x00\xd0\xd6\xbd\xe1\
+\xfe\xe9\xfc?\x98\xaf\x07\xfd\xa5?\xe4\x8a|E\xff\x00\
+\xb1~\xe7\xff\x00CZ\xfc\xd7\xc5\xff\x00\xf95~\x22\
+\x7f\xd9\x19\xc4\x7f\xfa\xad\xaa}?\x0a\xff\x00\xc9O\xc3\
+\x9f\xf6;\xcb\x7f\xf57\x0c~%t\x91\x7f\xde\x93\xf5\
+h\xcd~\xd4\xfe\xcc\x1f\xf2E\xbc\x11\xff\x00`\xf7\xff\
+\x00\xd2\xdb\xba\xfcU\xfe5\xff\x00z_\xfd\x0d+\xf6\
+\xab\xf6`\xff\x00\x92-\xe0\x8f\xfb\x07\xbf\xfe\x96\xdd\xd7\
+\xf9\x05\xfb3\xef\xff\x00\x11\x87\x8b\xff\x00\xec\x8d\xc4\xff\
+\x00\xea\xcf\x04\x7f_\xfd'?\xe4\x93\xc8\x7f\xect\xbf\
+\xf5\x0e\xb9\xf45\x14Q_\xee\x11\xfcB\x14QE\x00\
+\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\x00\
+\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\x00\
+\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\x00\
+\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\x00\
+\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\x00\
+\x14QE\x00\x14QE\x00\x14QE\x00\x7f\x81\xbd\x14\
+Q]\x07\x9e\x14QE\x00\x14QE\x00\x14QE\x00\
+\x14QE\x00\x14QE\x00\x14QE\x0fT\xd7r\x93\
+\xf8W\xf7\xbf\xcb\xfc\x8f\xf6\xb0\xff\x00\x82C\xff\x00\xca\
+/\x7f`\x8f\xfb5_\x82\xff\x00\xfa\x84i\x15\xfa1\
+_\x9c\x9f\xf0H\x87\x0b\xff\x00\x04\xbd\xfd\x81\xf2y?\
+\xb2\xa7\xc1c\xdb\xfe\x84\x8d\x22\xbfFw\xaf\xaf\xf3\xac\
+\x1a\xb3\xb1\xdb\xcc\xbb\xa1\xd4Sw/\xaf\xf3\xff\x00\x0a\
+7/\xaf\xf3\xff\x00\x0aA\xcc\xbb\xaf\xbcu\x15\x19\x91\
+A\xc7^P\x7f\xdfd\x81\xfc\xaa\xbc\xb7\xb6\x90\x93\xe6\
+\xdc\xc5\x19\x04\x8c<\xa1\x00 \xfe\x14\x05\xd7u\xae\xc5\
+\xca+.\xd7S\xb1\xbb\x9d\xa1\xb5\xbf\xb4\xb9\x95\x06\xf6\
+\x8a\x0b\x98\xa5\x91S\x91\xb9\xe2I\x0b\xa78\x19e\xc0\
+=\xabR\x81\x85\x14Q@\x1f\x1e\xfe\xdd?\xb1O\xc1\
+\xdf\xdb\xf7\xf6c\xf8\x97\xfb1|h\xd3#\xba\xf0\xc7\
+\x8fti\xe3\xd1\xb5\xb5\xb6\x17:\x97\x81|eo\x0c\
+\xa7\xc2\xbe<\xd0\x90\x5cX\xc8\xfa\xb7\x85\xf5W\x8fQ\
+\x8e\xd4\xdf[C\xaaB.\xb4\xbb\xd9~\xc9}6?\
+\xc5\xe3\xf6\xa7\xfd\x9c~ \xfe\xc8\xbf\xb4G\xc6\x0f\xd9\
+\xaf\xe2\xa5\xb5\xbc\x1e<\xf87\xe3}_\xc1z\xec\xb6\
+ne\xb0\xd4\xbf\xb3\xaed]?Z\xd3%m\xb2\xcb\
+\xa6kZo\xd95K\x16\x9a+y\x12\xd2\xee\xde\x17\
+\xb7\x86\xe2+\xa8\xd3\xfd\xd1dP\xd1\xba\xe0\x10\xc3i\
+S\xc0l\xf0W\xb67\x0e\x01\xe7\x04\xe7\x0d\xf7O\xf9\
+\xe3\xff\x00\xc1\xe6\x1f\xb0\xee\x9f\xe1\x1f\x89\x7f\xb3\xef\xed\
+\xf1\xe0\xcd.\x0bX>*\xc1y\xf03\xe3\x1b\xdb\xc7\
+\x04\x02o\x1b\xf8V\xc2Ms\xe1\xbe\xbbx\xc6qq\
+yy\xaexJ?\x10h.\xf0Y\x8b{[_\x04\
+Z5\xcd\xc7\xda/\xe1Y4\x83\xe9\xdf\xfa\xfe\xb42\
+\xab\x1b\xc5\xbe\xdf\x8e\xab\xf1\xff\x00\x86?\x87:)\x01\
+\xc8\x04t<\x8fB;\x11\xf5\x1c\xfds\xf4\xa5\xad\x0e\
+@\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x01\x0fC\xf4?\xca\xbf\xa9\
+_\xf84;\xfeR\xcc\xbf\xf6n\xff\x00\x15?\xf4\xe1\
+\xe1J\xfeZ\x8fC\xf4?\xca\xbf\xa9_\xf84;\xfe\
+R\xcc\xbf\xf6n\xff\x00\x15?\xf4\xe3\xe1J\x99\xfc/\
+\xe5\xf9\xa2\xe9\xfcq\xf5?\xd4\xd2\x8a(\xacN\xd1\x0f\
+O\xc4\x7f?\xc6\xbf\xcb\x1b\xfe\x0e\xf3\xb6x\xbf\xe0\xad\
+\xb73\xb7\xdd\xba\xfd\x9e>\x122q\xd7\xc9]v#\
+\xf3o9\xe0\x0c\xfc\xa3\x92y\xe8+\xfdN\x18\xfc\xa7\
+\xaf`1\xc7$\x80?S_\xe5\xdd\xff\x00\x07\x85Y\
+\x88?\xe0\xa9~\x1a\xbc\x0b\x81\x7f\xfb9x\x00\xe7\x00\
+\x13\xf6]G[\x84\xe4\x81\x9f\xe2\x18\xe7\xa0\xa6\xb7^\
+\xab\xf3\x22\xa7\xc1/C\xf9J\xa2\x8a+s\x85^\xcb\
+K\xad5\xfb\xb5\xfc\xfe\xef0\xa2\x8a(+N\xff\x00\
+\x87\xa7\xfc\x1f\xbb\xcc(\xa2\x8a\x04\xaf\xda\xc1E\x14P\
+\x1a\xf6\xfe\xb4\xfe\xbeAE\x14P\x1d<\xfb}\xdd~\
+\xff\x00\xb8(\xa2\x8a\x03^\xdf\xd6\x9f\xf0~\xef0\xa2\
+\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x1e\x9d\xed\xf2\xf4\xff\
+\x00\x83\xf7\x05\x14Q@\x9aV\xdf\xb3\xdb\xb3O\xfc\xfe\
+\xe2)\xff\x00\xd4I\xff\x00\x5c\xa6\xff\x00\xd0\x05\x7f\xb7\
+\xbf\xfc\x13w\xfeL\x03\xf62\xff\x00\xb3i\xf89\xff\
+\x00\xa86\x8d_\xe2\x137\xfa\xa7\xff\x00\xaes\x7f\xe8\
++_\xed\xed\xff\x00\x04\xdc\xff\x00\x93\x00\xfd\x8c\xbf\xec\
+\xda\xbe\x0e\xff\x00\xea\x0f\xa3TOe\xeb\xfd\x7fW\xfb\
+\xfatP{\xaf_\xfd\xb7\xfc\xcf\xb5\x1f\xee\x9f\xc3\xf9\
+\x8a\xf0\x7f\xdaS\xfeH\xa7\xc4_\xfb\x17\xee\x7f\xf45\
+\xafx\x7f\xba\x7f\x0f\xe6+\xc1\xff\x00iO\xf9\x22\x9f\
+\x11\x7f\xec_\xb9\xff\x00\xd0\xd6\xbf5\xf1\x7f\xfeM_\
+\x88\x9f\xf6Fq\x1f\xfe\xabj\x9fO\xc2\xbf\xf2S\xf0\
+\xe7\xfd\x8e\xf2\xdf\xfdM\xc3\x1f\x89G\xfdb\xfdd\xff\
+\x00\xd0\xa3\xaf\xda\x9f\xd9\x83\xfeH\xb7\x82?\xec\x1e\xff\
+\x00\xfa[w_\x8a\xbd$_\xf7\xa4\xfdZ3_\xb5\
+_\xb3\x07\xfc\x91o\x04\x7f\xd8=\xff\x00\xf4\xb6\xee\xbf\
+\xc8\x1f\xd9\x9f\xff\x00'\x87\x8b\xff\x00\xec\x8d\xc4\x7f\xea\
+\xcf\x07\xff\x00\x04\xfe\xbf\xfaN\x7f\xc9%\x90\xff\x00\xd8\
+\xe9\x7f\xea\x1ds\xe8j(\xa2\xbf\xdc3\xf8\x84(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\xff\x00\
++_\xf8\x84[\xfe\x0a\xff\x00\xff\x00B\xe7\xec\xef\xff\
+\x00\x87\xc2\xd3\xff\x00\x99\xee\xff\x00\xfe\xbcQ\xff\x00\x10\
+\x8b\x7f\xc1_\xff\x00\xe8\x5c\xfd\x9d\xff\x00\xf0\xf8Z\x7f\
+\xf3=\xdf\xff\x00\xd7\x8a\xff\x00T\xaa*\xf9\xdf\x97\xf5\
+\xf31\xf6\x11\xef/\xbd\x7f\x91\xfeV\xbf\xf1\x08\xb7\xfc\
+\x15\xff\x00\xfe\x85\xcf\xd9\xdf\xff\x00\x0f\x85\xa7\xff\x003\
+\xdd\xff\x00\xfdx\xa3\xfe!\x16\xff\x00\x82\xbf\xff\x00\xd0\
+\xb9\xfb;\xff\x00\xe1\xf0\xb4\xff\x00\xe6{\xbf\xff\x00\xaf\
+\x15\xfe\xa9TQ\xce\xfc\xbf\xaf\x98{\x08\xf7\x97\xde\xbf\
+\xc8\xff\x00+_\xf8\x84[\xfe\x0a\xff\x00\xff\x00B\xe7\
+\xec\xef\xff\x00\x87\xc2\xd3\xff\x00\x99\xee\xff\x00\xfe\xbcQ\
+\xff\x00\x10\x8b\x7f\xc1_\xff\x00\xe8\x5c\xfd\x9d\xff\x00\xf0\
+\xf8Z\x7f\xf3=\xdf\xff\x00\xd7\x8a\xff\x00T\xaa(\xe7\
+~_\xd7\xcc=\x84{\xcb\xef_\xe4\x7f\x95\xaf\xfcB\
+-\xff\x00\x05\x7f\xff\x00\xa1s\xf6w\xff\x00\xc3\xe1i\
+\xff\x00\xcc\xf7\x7f\xff\x00^(\xff\x00\x88E\xbf\xe0\xaf\
+\xff\x00\xf4.~\xce\xff\x00\xf8|-?\xf9\x9e\xef\xff\
+\x00\xeb\xc5\x7f\xaaU\x14s\xbf/\xeb\xe6\x1e\xc2=\xe5\
+\xf7\xaf\xf2?\xca\xd7\xfe!\x16\xff\x00\x82\xbf\xff\x00\xd0\
+\xb9\xfb;\xff\x00\xe1\xf0\xb4\xff\x00\xe6{\xbf\xff\x00\xaf\
+\x14\x7f\xc4\x22\xdf\xf0W\xff\x00\xfa\x17?g\x7f\xfc>\
+\x16\x9f\xfc\xcfw\xff\x00\xf5\xe2\xbf\xd5*\x8a9\xdf\x97\
+\xf5\xf3\x0fa\x1e\xf2\xfb\xd7\xf9\x1f\xe5k\xff\x00\x10\x8b\
+\x7f\xc1_\xff\x00\xe8\x5c\xfd\x9d\xff\x00\xf0\xf8Z\x7f\xf3\
+=\xdf\xff\x00\xd7\x8a?\xe2\x11o\xf8+\xff\x00\xfd\x0b\
+\x9f\xb3\xbf\xfe\x1f\x0bO\xfeg\xbb\xff\x00\xfa\xf1_\xea\
+\x95E\x1c\xef\xcb\xfa\xf9\x87\xb0\x8fy}\xeb\xfc\x8f\xf2\
+\xb5\xff\x00\x88E\xbf\xe0\xaf\xff\x00\xf4.~\xce\xff\x00\
+\xf8|-?\xf9\x9e\xef\xff\x00\xeb\xc5#\x7f\xc1\xa2\xdf\
+\xf0X\x102\xbe\x1c\xfd\x9d\xb2\x03p~7\xda\x10\xc4\
+\x0c\xa8?\xf1 \x03\x04\x8c\x10\xcb\x22\x9c\xe1\xe3*M\
+\x7f\xaa]\x14s\xbf/\xeb\xe65F)\xde\xf2\xfb\xd7\
+\xf9\x1f\xe5\xba\x9f\xf0j\x87\xfc\x16\xe2+K}>+\
+\xff\x00\x84)ag\x12[ZY\x0f\xdaN\xf5mm\
+\xada\xca[\xc1\x05\xbai\x09\x0cQ\xc5\x10UH\x92\
+5D\x03b\x05@\xaa+\xbf\xfc\x1a\x8b\xff\x00\x05\xae\
+\x94\x0d\xf3|\x18c\xfe\xdf\xed\x133\xff\x00=\x1c\x7f\
+_\xc6\xbf\xd4\xaa\x8a9\xdf\x97\xf5\xf3+\x91y\xff\x00\
+_#\xfc\xb2\xdf\xfe\x0d6\xff\x00\x82\xcf\xc8~{\x7f\
+\x81\xee;\x87\xfd\xa1\x0bg\x8f_\xec,\xfb\xf1\xe9U\
+\x8f\xfc\x1aU\xff\x00\x05\x93bw\xe9\x9f\x01\x5c\x11\xdf\
+\xe3\xecd\xfeo\xa0H\x0f\xfd\xf2=s\xda\xbf\xd4\xf6\
+\x8a9\xdf\x97\xf5\xf3\x0eE\xe7\xfd|\x8f\xf2\xb7\x97\xfe\
+\x0d\x1d\xff\x00\x82\xc3\xcb\xf7\xf4\x1f\xd9\xf1\xf3\xd7\x7f\xc7\
+[V\xfd\x0f\x87\x07\xf3\xaf\x9c\xbfk\x0f\xf86\xd3\xfe\
+\x0a]\xfb\x18~\xcf\x1f\x13\xff\x00i\xdf\x8d\x9a'\xc1\
+;O\x85\x7f\x08\xf4k\x1ds\xc5\xf3\xf8o\xe2\xbd\xb7\
+\x88u\xb8l\xf5\x1dwI\xf0\xdd\xbbXh\xf1h\xb6\
+o\x7f$\xba\x96\xaf\xa7\x09\x14O\x98\xad\xc4\x8c\x14\x98\
+\x97?\xeb\xab_\x8a\x7f\xf0qg\xfc\xa1[\xf6\xf8\xff\
+\x00\xb2g\xe1\x1f\xfd[\xdf\x0e\xa9s9Y>\xfd\x01\
+\xc1$\xde\xba\x1f\xc7o\xfc\x19x\xc0\xff\x00\xc1D\xff\
+\x00h\x80\x0f#\xf6>\xf1\x1eG\xa6~/\xfc$\xc7\
+\xe7_\xe9}_\xe6{\xff\x00\x06]\x7f\xcaE\xff\x00\
+h\xcf\xfb3\xdd\x7f\xff\x00V\xf7\xc2j\xff\x00L*\
+RVm\x14\xb6^\x88(\xa2\x8aC\x0a\xfew\xbf\xe0\
+\xe8\xff\x00\x82Q\xfc_\xff\x00\x82=\xfc{\xd6\xc1\xd3\
+b\xbd\xf8'\xe2?\x87?\x18-'\xbe\xb1k\xdb\x8f\
+#G\xf1M\x9f\x86u+]3c\xa3[]^X\
+\xf8\xaah\xe4\x9c\xb0Af\xb7(\xc0\xef\x18\xfe\x88k\
+\xf3\xc3\xfe\x0a\xd9\xe0KO\x89?\xf0L\x8f\xdb\xbf\xc2\
+\x97\xc8\xafl\xff\x00\xb2\xef\xc6\x1f\x102\xbe\xdd\xa6O\
+\x05\xf8;S\xf1\x9d\xbb|\xc0\x8c\xa5\xce\x81\x14\x8b\xd0\
+\xefU\xc1\x1dhN\xda\x935x\xb5\xdf\xca\xe7\xf9\x83\
+\xfe\xc3\x7f\xf0o\x8f\xfc\x14;\xfe\x0a\x11\xfb=xs\
+\xf6\x99\xfd\x9e4\x8f\x83\xd7\xdf\x0c<M\xadx\xa3\xc3\
+\xdaU\xc7\x8c>'\xc1\xe1}q\xb5\x0f\x07kWZ\
+\x06\xb2\xb7\x1a<\x9aM\xf3A\x12\xeaVW\x02\xde_\
+\xb40\xb8\x8bl\xc1Q\x5c\x0a\xfa\xf7\xfe!\x16\xff\x00\
+\x82\xbf\xff\x00\xd0\xb9\xfb;\xff\x00\xe1\xf0\xb4\xff\x00\xe6\
+{\xbf\xff\x00\xaf\x15\xfdx\xff\x00\xc1\xa67q\xcf\xff\
+\x00\x04f\xf8A\x02\xe4Kc\xf1o\xe3\xcd\xbd\xc2\x9c\
+ee\x93\xe26\xaft\x01\x19\xc8\xccw\x08F@\xc8\
+\xc1\x03\x07'\xfaY\x07<\xd5\xf3\xbf/\xeb\xe6d\xa8\
+\xc5\xa4\xef-Wu\xfeG\xf9Z\xff\x00\xc4\x22\xdf\xf0\
+W\xff\x00\xfa\x17?g\x7f\xfc>\x16\x9f\xfc\xcfw\xff\
+\x00\xf5\xe2\x8f\xf8\x84[\xfe\x0a\xff\x00\xff\x00B\xe7\xec\
+\xef\xff\x00\x87\xc2\xd3\xff\x00\x99\xee\xff\x00\xfe\xbcW\xfa\
+\xa5QG;\xf2\xfe\xbec\xf6\x11\xef/\xbd\x7f\x91\xfe\
+V\xbf\xf1\x08\xb7\xfc\x15\xff\x00\xfe\x85\xcf\xd9\xdf\xff\x00\
+\x0f\x85\xa7\xff\x003\xdd\xff\x00\xfdx\xa4\xff\x00\x88E\
+\xff\x00\xe0\xb0\x00\x10<9\xfb<c=\xbe9Y\x01\
+\xf8\x03\xe1\x86>\x9f\xc4NGQ_\xea\x97E\x1c\xef\
+\xcb\xfa\xf9\x87\xb0\x8fy}\xeb\xfc\x8f\xf1\xd9\xfd\xa9\xff\
+\x00\xe0\xdf\x8f\xf8*\xff\x00\xec\x93\xe1\xbd_\xc6\xfe>\
+\xfd\x97u\xcf\x1bx\x13@\x8d\xa7\xd7<]\xf0[T\
+\xd2\xfe,X\xe96I\x1c\xb3O\xa9\xde\xe8\xde\x17\x95\
+\xfcie\xa3YC\x04\xd7\x1a\x96\xb5y\xe1\x8f\xec]\
+.\xda7\xb8\xd4/\xedcQ \xfc\x5c,\xa1Y\x8b\
+(U\x19$\x90\x07*\x18`\x9cn\xdc\xa4\x14\xdb\x9d\
+\xe3;3\x83\x8f\xf7\xc0\xf2\x0f\xde\xc8i\x06y<\x0d\
+\xc50J\x90\x0bF\xc4\xe0o\xf9\xc8Q\x93\xbd\x89\xaf\
+\xe2\xfb\xfe\x0eY\xff\x00\x82\x0b|:\xf8\xab\xf0\x8f\xc7\
+\xbf\xb7\xf7\xec\x87\xf0\xf7K\xf0\x8f\xc7\x9f\x87i\xad\xf8\
+\xf7\xe3\xf7\x84\xbc-l\x9av\x93\xf1{\xc1Q\xc1>\
+\xab\xe2\x9f\x1d\x7fd[D\xb6\xd6\xde?\xf0\xdb\xa5\xd6\
+\xbf\xac\xea6\xadh\xbe%\xd1\x9fW\xb8\xd6M\xce\xa3\
+gkrZ\x9bm'o\xc4\x99\xd2\x8cb\xe4\x9c\xb4\
+\xf3_\xfc\x89\xfepD\x10H=A#\xf28\xfa\x1a\
+N\x83'\x81\x90\xb9\xcf\x01\x98\xe1T\x9e\x8a\xces\xb1\
+N\x19\xc0b\xa0\x85b\x17\xe58\xda\xbbz.\xc3\xc1\
+B\x00\x1bHo\x9dN0v\xbeJ\xe7hg@\xae\
+\xdf\xbf_\xf0@\xdf\xf8#\x1e\xad\xff\x00\x05[\xf8\xf7\
+\xaa\xeb\x9f\x12\xa6\xd6<3\xfb#\xfc\x0f\xd4t{\xaf\
+\x8c^!\xd3\x96\xe6\xcbP\xf1\xde\xb5|\xc6\xebK\xf8\
+C\xe1\x0dv#\x0czf\xb1\xabYA\x1d\xff\x00\x8a\
+5x.g\xbe\xf0\xf7\x87\xe5\xb6\x92\xda\x1b}OV\
+\xd1n-jM\xa5u\xdc\xc6\x11sv\xf9\x9f\x92\x7f\
+\xb3?\xec\x83\xfbO~\xd9>7?\x0e\xbfe\xdf\x81\
+\xbf\x10\xfe6\xf8\xb2(\xad\xa7\xd4m|\x13\xa0O\x7f\
+\xa5h\x16\xb7\xafq\x0d\x95\xff\x00\x8a\xfcMpm<\
+/\xe1\x1d:\xf2\xe2\xdakKMK\xc5\x1a\xd6\x91a\
+q|\xa9e\x05\xcb\xdeK\x0c\x0f\xfbo\xe0o\xf85\
+\x13\xfe\x0b\x1b\xe3=\x12-b\xef\xe1_\xc2_\x03\x5c\
+M\xb4\xbe\x85\xe3\x7f\x8d>\x15\xb5\xd6\xed\xf0\x19J\xdc\
+C\xe1\xc4\xf16\x9c\x0a\xb2\x90Lz\xac\x80\x11\x80\xa7\
+\xad\x7f\xa8\xbf\xc0\x7f\xd9\xe3\xe0\xcf\xec\xc7\xf0\xdfB\xf8\
+C\xf0\x13\xe1\xb7\x84~\x14\xfc7\xf0\xdcm\x1e\x93\xe1\
+?\x06i6\xfa>\x97\x1c\xb2\xc7\x1a\xdc\xeaWio\
+\x1a\x5cjZ\xd5\xf3F\xaf\xa9kZ\x95\xcd\xde\xa9\xa9\
+K\x9b\x8b\xcb\xb9d;W\xda\x15v\xf4\x00\x0fo\xf3\
+\xc0\x1c\xe0d\xe7$\xf0z\xc7;\xf2\xfe\xbegG\xb0\
+\x8fy}\xeb\xfc\x8f\xf2\xb4\xff\x00\x88E\xbf\xe0\xb0}\
+\xfc;\xfb;~\x1f\x1b\xac\xcf\xf3\xf0\xfa\x9c\xfe\x14\x83\
+\xfe\x0d\x16\xff\x00\x82\xc2\x06\xcf\xfc#\x9f\xb3\xb6?\xec\
+\xb8Z\x0f\xd0xx\xfd8=\xeb\xfdS\xe8\xa3\x9d\xf9\
+\x7f_0\xf6\x10\xef/\xbd\x7f\x91\xfe\x5c\x1a?\xfc\x19\
+\xef\xff\x00\x05^\xd4\x1a3\xa9\xeb\x1f\xb3'\x87\xc1 \
+3]\xfcT\xd5\xf5\x13\x1a\x9fQ\xa7x2\xe5d\xda\
+pJ\xed\x22O\xbaJ\xe7r\xc7\xff\x00\x06\x93\xe97\
+Z\x17\xfc\x16\x03V\xd1/^6\xbb\xd1~\x06|f\
+\xd1\xae\xbc\x96i\x227ZN\xbb\xe1\xbb+\x97\x8aF\
+\x8e\x12\xd13B\xbe[yQ\xeePX\xaa\x9e+\xfd\
+H\x8fO\xc4\x7f1_\xe6\x05\xff\x00\x06\xab\xff\x00\xca\
+k~ \x7f\xd93\xfd\xa2\x7f\xf50\xd0\xa9\xf37\x17\
+\x7f/\xcd\x17\xcb\xcb(\xda\xfa\xdf\xf2?\xd3\xf8\x1c\xf4\
+\xa2\x9a\xbd?/\xfd\x04S\xab2\xc6\xbf(\xc3\xb1\x04\
+\x1f\xa1\xe0\x9f\xc0d\xff\x00*\xff\x001\xbf\xf8<\x9a\
+\xd3\xc9\xff\x00\x82\x93|$\xba\xc6>\xdd\xfb3\xf8y\
+\xcf\xfb\xd6\xfe+\xf1\x04$\x0e\xfcp?\xc6\xbf\xd3\x95\
+\x8e\x14\x9cg\x038\xf5\xc7Q\xf8\x8e+\xfc\xd1\x7f\xe0\
+\xf3\xdb\x03\x07\xfc\x14\x0b\xf6s\xbb\xdb\xf3_\xfe\xcb\xf1\
+7\xca\x09iZ\xdf\xe2\x1f\x89 \xc2\xa8\x05\x9d\xbe\x5c\
+(Ps\x8cqN\x1a\xce\xdd\x977\xdc\xd1\x15>\x09\
+z\x1f\xc8\xf7\x80\xbc\x11\xe2\xef\x89\xde9\xf0\x87\xc3o\
+\x00h\x97~%\xf1\xc7\x8f<I\xa2xK\xc2z\x06\
+\x9eG\xdbu\x7f\x10x\x87R\xb7\xd2\xf4\x9d>\x1d\xe3\
+j\x1b\xcb\xeb\x88`3\xb4\xd6\xd0\xdb\xa3I5\xd4\xad\
+\x02\x1f/\xfa\xa0\xb3\xff\x00\x839\x7f\xe0\xa7\xd7V\xb6\
+\xd7\x12|A\xfd\x96-%\x9e\xde\x19\xa5\xb4\x97\xe2\x07\
+\x8c\xbc\xdbYd\x8dZ[i|\x9f\x87\x93C\xe6\xc1\
+!h\xa4\x10\xcb,A\xd0\x88\xe4t\xc3\x1f@\xff\x00\
+\x83C\x7f\xe0\x9e\xd3|q\xfd\xab<c\xfbpx\xeb\
+A\xb3\xbc\xf8m\xfb1ZI\xe1\xdf\x87s\xde\xba4\
+\x97\xff\x00\x1c|Qg\x1c\x91^\xe9\xf6\xa672E\
+\xe0\xdf\x0a=\xd5\xcd\xd5\xd6\xf8\x0cZ\x96\xb9\xa5\x0bi\
+\x9aKK\xd8\x87\xfa[B\xb8U9\x04m\xe0\x8ct\
+\xed\x80\x00\x00c\xa0\x1d\x07\x15nn\xefm\xc8\xa7M\
+rG}\x97m\xfe\xe3\xfc\xc4\xbf\xe2\x0d\xdf\xf8)\xe7\
+\xfd\x14\x8f\xd9S\xff\x00\x0e\x07\x8d\xbf\xf9\xdcQ\xff\x00\
+\x10n\xff\x00\xc1O?\xe8\xa4~\xca\x9f\xf8p<m\
+\xff\x00\xce\xe2\xbf\xd3\xce\x99$\x8b\x1a\xeen\x99\xeb\xc0\
+\x03\xeaN\x00\xfa\x92\x06x\xcf4\xb9\xdf\x97\xf5\xf3/\
+\xd9\xc7\xb7\xf5\xa7\xf9\x7fZ[\xfc\xbf\xf5O\xf83\xcb\
+\xfe\x0aS\xa1i\xda\x86\xb5\xac|Z\xfd\x91\xb4}/\
+I\xb2\xb9\xd4\xf5M[T\xf8\x8f\xe3\x0b-/J\xd3\
+t\xf8%\xba\xbd\xd4\xf5\x1b\xfb\x9f\x87\xb0[\xda\xd8X\
+\xda\xa4\xf7W\x977\x13C\x05\xa4\x114\xf2\xca\x91\x87\
+e\xfeW|a\xa0\xc3\xe1o\x16x\x9f\xc3v\xba\xfe\
+\x8b\xe2\xabO\x0ek\xba\xae\x89\x07\x8a|9<\xf7\x1e\
+\x1e\xd7\xa2\xd3/g\xb4McF\xbb\xba\x86\xday\xb4\
+\xadE`\xfbf\x9d<\xf0@\xf7\x16\x92\xc58\x8fl\
+\x8aO\xfaf\x7f\xc1\xd7\x7f\xf0Sa\xfb0~\xcaZ\
+O\xecu\xf0\x9f\xc5\x17\xbaw\xc7\x9f\xda\xba\xda\xee\xcf\
+^:\x1c\x92\xc5\xaa\xf8c\xe0}\xa3\xfd\x9f\xc4\xd7-\
+w\x03,\xd6\xd7>8\xbdx\xfc1\xa7\xdbY\xef\xbc\
+\xbc\xd3\xd3[\x99\xcd\xbc\x09l\xd7\xbe_\xff\x00\x04\x03\
+\xff\x00\x83p\xbe\x17~\xcf\x9e\x00\xf0\xaf\xedk\xfbs\
+\xf8\x1b\xc3?\x16?ho\x1ci\x9a\x0f\x89>\x1e|\
+(\xf1\x86\x85g\xadx?\xe0>\x87w\x04Z\xce\x9b\
+s\xaa\xe9Z\x9f\xda\xf4\xef\x13\xfcS\xbfim/\xf5\
++\xdb\xdbG\xd2\xfc\x1e!\x83L\xd1m\x0e\xa0u=\
+f\xe8\xe7~_\xd7\xcc\x97J/MW\xa5\xbf\xc8\xfe\
+2\xff\x00c\x8f\xf8!\xb7\xfc\x14\xe3\xf6\xe5\xd14\xaf\
+\x19|\x13\xfd\x99<S\xa6\xfc7\xd7\x16\x09t\xbf\x89\
+\xff\x00\x14\xe7\xb2\xf8W\xe0\x8db\xc2\xea\xdb\xedV:\
+\xb7\x86\xee<]=\x96\xb7\xe2\x8d\x16\xe2\x1f2;}\
+s\xc2\xfaW\x88\xf4I.!05\xfc3#D?\
+`\xfc\x19\xff\x00\x06f\xff\x00\xc1Ju\xed\x1e\xd3P\
+\xf17\xc6\xaf\xd9+\xc0z\x94\xf9k\xad\x0bR\xf1o\
+\xc4mr\xee\xcdw\x10\xb1\xc9y\xe1\xbf\x85\xfa\x96\x97\
+;\xe0o\xcd\xb5\xef\x97\xf3r\x0bs_\xe9\xa5\x0d\xba\
+\xc2\x11cTH\xe3]\x89\x1a\x02\xaa\x80\x02\x06\x14|\
+\xb8\xdb\x80\x17\x19^p\xc4\x1d\xa2\xc5\x1c\xef\xcb\xfa\xf9\
+\x82\xa5\x15\xdd\xfa\xdb\xfc\x8f\xf3`\x1f\xf0e_\xed\xe7\
+\x8e\x7fj\xbf\xd9\x14\x1e\xe1n>2\xe0\x1e\xe0\x16\xf8\
+`\xc4\xf3\xdf\x0b\xe9\xb4c%\x7f\xe2\x0a\xbf\xdb\xcb\xfe\
+\x8e\xaf\xf6G\xff\x00\xc0\x8f\x8c\x7f\xfc\xeb\xab\xfd'\xa8\
+\xa3\x9e_\xd7\xf5\xfd_\xd0\xafg\x1e\xdf\xd6\x9f\xe5\xfd\
+io\xf3\x14\xf8\x8d\xff\x00\x06m\x7f\xc1L|%\xa4\
+6\xa5\xe0\xbf\x8b\x1f\xb2\x8f\xc4\xcb\xd5\x9c#h\xfaW\
+\x8d\xbc{\xe1\x8b\xc5\xb6\xd8I\xbb7~-\xf8q\xa6\
+\xe9\xca\xb1\x9e\x1e6\xbf\x95\xa3'tI\xe5\x82\xc3\xf0\
+O\xf6\xcf\xff\x00\x82e\xfe\xdc\xdf\xf0O\xfdF\xde\xdf\
+\xf6\xaa\xfd\x9e|o\xf0\xe3@\xd4\xef\x8e\x9f\xa1\xfc@\
+\x8e\xd6\x1f\x11\xfc2\xd7o@\x9c\xc5g\xa7x\xff\x00\
+\xc3wZ\xb7\x85\x9bV\xbb\x86\xda{\xbbm\x12\xfa\xfb\
+L\xf1\x1b\xd9C%\xd4\xfa4Q\xab2\xff\x00\xb6\xab\
+(e*FA\xc0 \xf4#<\x83\xea\x08\xc8#\xa1\
+\x07\x07\x22\xb8_\x88?\x0d<\x0b\xf1[\xc1\xba\xf7\xc3\
+\xcf\x89\x9e\x0f\xf0\xbf\xc4\x1f\x02x\xaa\xc2}+\xc4\xde\
+\x0f\xf1\x8e\x89\xa7\xeb\xde\x1c\xd7\xb4\xeb\x90\x0c\xd6\x9a\x9e\
+\x93\xa9[]\xd9\x5c\xc6]c\x91\x0c\xb0\xc9$R\xc7\
+\x1c\xf1\xba\xcb\x1cl\x87;\xf2\xfe\xbed\xbaQi\xa5\
+\xa3\xf9t\xf9y\x1f\xe0\xe4HPY\x8a\x80\x09\x07$\
+\x02\x18rW\x19\xce\xfc\x0c\xec\xc6\xecs\x8a__b\
+G\xaf \xe0\xf4\xf7\xaf\xeaG\xfe\x0e>\xff\x00\x82\x1c\
+\xe9\xdf\xf0M\xdf\x88zG\xed)\xfb9\xda\x18\x7fd\
+O\x8c\x9e#m\x09|9-\xd4\x977?\x06\xbe\x22\
+]A=\xfaxI^\xe2O\xb4\xdexC]\xb1\xb5\
+\xd4.\xbc+4\x93M6\x9am\xaft\x99\xddV\xde\
+\xcaK\x9f\xe5\xb7\xa6\x01\x188\x07\x19\xcf\x07\x91\xce\xe6\
+\xcf\x18\xea\xc4\xfa\x9c\xe6\xb4N\xea\xe7<\xa0\xe2\xff\x00\
+\x0e\xef\xa7\xf9\xe8(\xe4\x06\xe3k\x1c\x06\xc8\xdaI\xda\
+@\xcfNw.\xde~b@\x5c\x93_\xa2\xdf\xb1?\
+\xfc\x12\x7f\xf6\xfc\xff\x00\x82\x83Ho\x7ff\x1f\xd9\xdb\
+\xc6^/\xf0L7\x8bc\xa8|U\xd6\xd6\xdb\xc1\x7f\
+\x0al\xaeD\xab\x15\xcd\xa4~>\xf1G\xd8\xf4-o\
+S\xd3\x8b\xc5&\xab\xa1\xf8e\xf5\xcdwL\xb7\x9a\x0b\
+\x9b\xed6\xda\xdexf\x7f\xdf\xcf\xf86\xd3\xfe\x08\x17\
+\xa4\xfe\xd9wV_\xb7\x07\xed\x91\xe1E\xd4?fm\
+\x0e\xfa\xfa\xcb\xe1\x0f\xc2}b\xdbS\xb6_\x8d^+\
+\xd2\xae\x8d\xa5\xef\x8a\xbcD\xb2-\xb9\x9f\xe1\x97\x86\xee\
+\x92{xl\xed\xe6d\xf1^\xbc\x1a\xd5\xe5M/N\
+\xd4\x93R\xff\x00H\xdf\x06\xf8/\xc2\xdf\x0f|3\xa0\
+x+\xc1\x1e\x1d\xd0\xbc%\xe0\xff\x00\x0bi6\x9a\x0f\
+\x86\xfc/\xe1\xad*\xcfD\xf0\xfe\x81\xa3i\xf0\xa5\xbd\
+\x8e\x95\xa2\xe9\x1a|p\xd8\xe9\xda}\xa4\x11\xacPZ\
+\xdb\xc2\x89\x1cj\xa8\x09\x0a\x0dL\xa4\xd3\xb2\xb6\xc6\xb0\
+\xa2\x9a\xbc\xae\x9d\xfa[k.\xeb\xfe\x01\xfei~\x0b\
+\xff\x00\x833\x7f\xe0\xa5>\x22\xd1-5\x0f\x14\xfch\
+\xfd\x92\xbc\x01\xaa\xccd\x17:\x16\xab\xe2\xef\x89Z\xf5\
+\xe5\xa2\xaba\x03\xde\xf8_\xe1\xb6\xa7\xa5M\xe6/\xce\
+\xa6\x1b\xd6U\x07k  g\xb0\x93\xfe\x0c\xb1\xff\x00\
+\x82\x82)>W\xed=\xfb\x1eH3\xc6\xed[\xe3<\
+D\x8cw\x1f\xf0\xa8\xa6Q\xcf\xa1<c\xbd\x7f\xa5h\
+\xff\x008\xf4\xed\xfaQS\xce\xfc\xbf\xaf\x99\xa2\xa7\x05\
+\xd2\xfe}O\xf3Ho\xf82\xe7\xfe\x0a\x22\xbd?i\
+\x1f\xd8\xeeOu\xd7\xfe2'?I>\x11\xb8\xfc\xff\
+\x00\x0eq_\x12~\xde\xff\x00\xf0l\xcf\xed\xb9\xff\x00\
+\x04\xf8\xfd\x9a\xbc\x7f\xfbR\xfcT\xf8\xa9\xfb;x\xbb\
+\xe1\xf7\xc3\x96\xd1\x06\xb5c\xe0\x1f\x10x\xe6\xeb\xc4\x13\
+\x0d{X\xb3\xd1-d\xb2\xb3\xf1\x07\x80\xb4\x18%\x11\
+]\xdfC%\xc7\x99}lD\x0a\xfb76\x14\xff\x00\
+\xac\x95~\x10\xff\x00\xc1\xcb\x16\x0f\xa8\x7f\xc1\x19\xbfk\
+\xe4E\xdcm\xb4o\x06_\x1e\xbf*\xd9\xf8\xe7\xc3\xf3\
+3t=\x15O\xf8\x8a9\xdf\x97\xf5\xf3\x14\xe1\x1eW\
+\xa5\xbd=W\xafo\xebK\x7f\x90\x94\xe4y.y\xff\
+\x00S+\x1c\xf5\x1b\x94\x11\x9e\xa7<\xf2\x0b9\x07\x8d\
+\xc4\x01_\xed\xeb\xff\x00\x04\xdc\xe3\xf6\x00\xfd\x8c\xbf\xec\
+\xda~\x0e\x9f\xcf\xc0\xfa1\xff\x00?\xd6\xbf\xc4\x22\xe0\
+\xe6\x19z\xff\x00\xa9\x90s\xec\x15\xbf\x96\x07\xaek\xfd\
+\xbd\xff\x00\xe0\x9b\xbf\xf2`\x1f\xb1\x97\xfd\x9bO\xc1\xcf\
+\xfdA\xb4ju7K\xc9?=Q\x14;\xf5\xd7\xee\
+\xf7O\xb5\x1f\xee\x9f\xc3\xf9\x8a\xf0\x7f\xdaS\xfeH\xa7\
+\xc4_\xfb\x17\xee\x7f\xf45\xafx\x7f\xba\x7f\x0f\xe6+\
+\xc1\xff\x00iO\xf9\x22\x9f\x11\x7f\xec_\xb9\xff\x00\xd0\
+\xd6\xbf6\xf1\x7f\xfeM_\x88\x9f\xf6Fq\x1f\xfe\xab\
+j\x9fO\xc2\xbf\xf2S\xf0\xe7\xfd\x8e\xf2\xdf\xfdM\xc3\
+\x1f\x899\xfd\xe2\xff\x00\xbd'\xe8\xd1\x8a\xfd\xaa\xfd\x98\
+?\xe4\x8bx#\xfe\xc1\xef\xff\x00\xa5\xb7u\xf8\xad\xff\
+\x00-\x17\xeb'\xfe\x85\x1e\x7fZ\xfd\xa9\xfd\x98?\xe4\
+\x8bx#\xfe\xc1\xef\xff\x00\xa5\xb7u\xfe@\xfe\xcc\xff\
+\x00\xf9<<_\xff\x00dn#\xa7\xfdL\xf0\x7f\xf0\
+O\xeb\xff\x00\xa4\xe7\xfc\x92y\x0f\xfd\x8e\x97\xfe\xa1\xd7\
+>\x86\xa2\x8a+\xfd\xc3?\x88B\x98]A \x9e\x84\
+\x0e\x87\xa9\xf48\xc1\xf7\xc7N\xf8\xa7\xd7\xf2\xe9\xff\x00\
+\x07\x0d\x7f\xc1u\xbe0\xff\x00\xc1%\xfcI\xfb:\xfc\
+9\xfd\x9c\xfc\x01\xf0o\xc7\xbf\x11~-i\x9e4\xf1\
+\x87\x8c\x1f\xe3\x06\x9d\xe2\xbd{C\xd0<!\xa0\x5c\xe9\
+:N\x95\x05\x9e\x9b\xe0\x7f\x88\x7f\x0f\xb5\xbb-kX\
+\xd65\x19\xee\x22\xbb\xbd\xbc\xbd\xd3nl4\xeb\xa8\x92\
+\xd5.Qg\x0d&\xf6Bm-d\xec\xbdm\xfd\x7f\
+L\xfe\xa2w\xaf\xaf\xf3\xa3r\xf1\xc8\xf9\xba{\xf1\x9e\
+=N9\xaf\xf30\xff\x00\x88\xd1\x7f\xe0\xa6\xa7\x83\xfb\
+>\xfe\xc2}\x0fO\x87\xbf\xb4\x00==\x7f\xe1\xa5M\
+~\xbf\xff\x00\xc1\x0f\x7f\xe0\xe5\x1f\xda\x93\xfe\x0aC\xfb\
+q\xe9?\xb2\xbf\xed-\xf0\xdb\xf6f\xf0\x0f\x87|W\
+\xf0\xeb\xc6\x9a\xff\x00\x84u?\x84\xbe\x1b\xf8\xa3\xa2\xf8\
+\x97R\xf1\x9f\x86c\xb1\xd5-\xf4v\x9b\xc6\xdf\x16\xbc\
+{\xa4\xcde.\x86\x9a\xe5\xec\xb0&\x93\x0d\xc9{\x18\
+\x9e;\xd5D\x92)K5\xbav\xfe\xbf\xcf\xf4\xf4J\
+qn\xc9\xa6\xff\x00\xaf\xeb\xfe\x09\xfd\xa8\x82\x08\xc8\xe4\
+z\xd2\xd4Q0e$t\xdeG\xd3\x18\x18''$\
+c\x07\x93\xb4\xe5N\x0a\xe0KK\xd0\xa0\xa2\x8a(\x00\
+\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\
+\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\
+\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\
+\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\
+\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\
+\xa2\xbe\x10?\xf0T\x7f\xf8&o9\xff\x00\x82\x8a\xfe\
+\xc2\xa3\xfe\xee\xe3\xe0\x07\x1f\x9f\x8f\xa8\x1f\xf0T\x8f\xf8\
+&g\xfd$[\xf6\x15=\xff\x00\xe4\xee\x7fg\xfe?\
+/\x1e\xd0\x07\xdd\xf4W\xc1\xad\xff\x00\x05L\xff\x00\x82\
+e\xa1\xc3\x7f\xc1E?abq\x9e?ko\x80g\
+\x8c\xe3\xaa\xf8\xf7\x1dEWo\xf8*\xa7\xfc\x13\x14\x12\
+\x0f\xfc\x14O\xf6\x1d\xc88;\x7fj\xdf\x81\x8c?\x06\
+_\x1em?Q\xc1\xa0\x0f\xbe\xa8\xaf\xcf\xf6\xff\x00\x82\
+\xaf\x7f\xc10UK\x1f\xf8(\x8f\xecI\xc7'\x1f\xb5\
+\x17\xc1G=\x7f\xba\xbe5,\x7f\x01\xef\xd0\x1a\xac\xff\
+\x00\xf0Vo\xf8%\xea)c\xff\x00\x05\x10\xfd\x8a\xce\
+0H\x8f\xf6\x99\xf8:\xec\x07\xae\x17\xc6-\x85=3\
+\xc0\xce\x07\xb1\x00\xfd\x09\xa2\xbf;\xdb\xfe\x0a\xdf\xff\x00\
+\x04\xba\x5c\xff\x00\xc6\xc3\xbfc\x1e\x99\xe3\xf6\x91\xf8H\
+\xd8\xfa\x94\xf1K\x81\xcf\xa9\xcf\xa8\xc7X?\xe1\xee\xdf\
+\xf0K`J\x9f\xf8(o\xecn[\xa7\x1f\xb4W\xc2\
+\xc91\xf8\xc5\xe2C\xd3\xd6\x80?E\xe8\xaf\xce\x16\xff\
+\x00\x82\xbf\xff\x00\xc1,\x87\x03\xfe\x0a\x1d\xfb\x1d\xb3\x0e\
+~_\xda\x03\xe1\xa3\x9f\xc9<DA\xff\x00'\xb5W\
+\x1f\xf0X\x9f\xf8%n\x09?\xf0P\xbf\xd9\x0b\x8e\x0e\
+\xdf\x8e\x9f\x0f\xdf\x1f\x8ak\xae?\x1f\xd7\xa5\x00~\x93\
+Q_\x9a\x8f\xff\x00\x05\x8f\xff\x00\x82T\xc6\x037\xfc\
+\x14'\xf6I \xf1\xf2\xfco\xf0+\x0e\xdf\xdc\xd5\xdd\
+\xb3\xcf\xafNqU\xdf\xfe\x0b1\xff\x00\x04\xa6N\xbf\
+\xf0P\x7f\xd9?\x1e\xdf\x19\xfc\x1c\x7f\x22/\xd8\x11\x8e\
+\xf9\xa0\x0f\xd3:+\xf3\x15\xff\x00\xe0\xb4\x1f\xf0J\x15\
+\xe9\xff\x00\x05\x06\xfd\x96\x18\x8e\xaa\xbf\x16\xfc.\xf9\xed\
+\xfc\x17\x85\xbd\xf8\xfa\xf4\xaa\xe7\xfe\x0bS\xff\x00\x04\x9d\
+V*\xdf\xf0P_\xd9mp3\xff\x00%OB<\
+\xfad\x5cr\x7f\xfdd\xd0\x07\xea\x15\x15\xf9r\x7f\xe0\
+\xb6_\xf0Iu\x04\x9f\xf8('\xec\xc2pq\xf2\xfc\
+K\xd1\xdb\xf5I\x18~d}1\x82kI\xff\x00\x05\
+\xbb\xff\x00\x82JF2\x7f\xe0\xa0\x7f\xb31\xcfM\xbf\
+\x114\xf9?\xf4R7\xf34\x05\xff\x00\xaf\xeb\xd5\x1f\
+\xa9\xf4W\xe53\x7f\xc1q?\xe0\x92\x11\xf0\xdf\xf0P\
+/\xd9\xbd\x8f\xfd2\xf1\xb2I\xeb\xd3\xcb\xb7\x9c\x7f\xe3\
+\xc2\xab\x1f\xf8.\x7f\xfc\x12%N\x0f\xed\xff\x00\xfb=\
+\x13\xdc/\x8a\xae_\xf5\x1a{)<\x7f\x0f=\xf8\x14\
+\x05\xcf\xd6*\xfcS\xff\x00\x83\x8b?\xe5\x0a\xff\x00\xb7\
+\xc7\xfd\x93?\x08\xff\x00\xea\xde\xf8u^\x82\xdf\xf0]\
+\xbf\xf8$\x22\xef\xff\x00\x8c\xfd\xf8\x04J\xf5\x0b\xafj\
+L\xdf\x82\xa6\x90\xec~\xa23\x9e\xc7\x15\xf91\xff\x00\
+\x05\xc5\xff\x00\x82\xbe\x7f\xc15\x7fh\x7f\xf8%G\xed\
+\x8f\xf0g\xe0\xb7\xed\x8b\xf0\x8b\xe27\xc5\x0f\x1ex\x0b\
+\xc3\x1aw\x84|\x15\xe1\xcdGU\xb8\xd65\xfb\xeb\x0f\
+\x89\xbe\x07\xd6\xee\xed,Rm\x22\x1bv\x9a-/L\
+\xbd\xbb\x969\x8cD\xc1\x0c\x83\x8c\x8aku\xea\xbf1\
+I\xfb\xaf\xd0\xfc\x0f\xff\x00\x83.\xbf\xe5\x22\xff\x00\xb4\
+g\xfd\x99\xee\xbf\xff\x00\xab{\xe15\x7f\xa6\x15\x7f\x99\
+\xef\xfc\x19u\xff\x00)\x17\xfd\xa3?\xec\xcfu\xff\x00\
+\xfd[\xdf\x09\xab\xfd0\xa9\xcf\xe2\x7f/\xc9\x02\xd9z\
+/\xc8(\xa2\x8a\x91\x85~q\x7f\xc1_\xbe \xdb|\
+0\xff\x00\x82^\xfe\xde\x1e.\xbb C\x1f\xec\xc7\xf1\
+W\xc3\x87$(i<q\xe1\xab\xcf\x03\xc0\x9b\x98\x80\
+\x0c\x93\xf8\x8a8\xd7=]\x94`\xe7\x07\xf4v\xbf\x9c\
+\x9f\xf8:\x87\xe3\x92\xfc\x1e\xff\x00\x82A|g\xf0\xec\
+S\xe9\xeb\xa8|t\xf1\x8f\xc3\xaf\x83\xf6\xb6\xd7\xae\xe9\
+5\xcd\xad\xfe\xbc\x9e/\xd5[N\xd8\xa7u\xed\xa5\x8f\
+\x84\x1e\xe7k`\x1bT\xb8\x1e\xd4\x0a[?\xd4\xf1/\
+\xf84\x07Y7\xff\x00\xf0Ix\xf4\xd2\xe5\x9f@\xfd\
+\xa1\xbe-Y2\xb1\xce\xcf\xb56\x8f\xab(#\xaag\
+\xed\xe0\x90z\x96,0\x18\x01\xfdQ\xd7\xf0U\xff\x00\
+\x06\xb6\x7f\xc1O\xbfa_\xd8\xfb\xf6\x0b\xf8\x97\xf0\xaf\
+\xf6\xa4\xfd\xa6\xbe\x1d\xfc\x17\xf1\xa5\xc7\xed\x1f\xe2\x9f\x12\
+h^\x1b\xf1\x8d\xc6\xab\x0e\xa1\xa8xcV\xf0\x7f\x81\
+\xe1\x87W\x81l4\xab\xf8\xbe\xcb>\xa7e\xaaZ\xa1\
+y\x92O6\xdaq\xe5\xaa\x84v\xfe\x96\xff\x00\xe1\xfd\
+\xbf\xf0G\xce\xff\x00\xb7\xdf\xc0\xd0{\x81}\xe23\x8f\
+Q\x9f\xf8F\xf9\xc5\x02\x8b\xf7u\x7f\xd5\xcf\xd7\xaa+\
+\xf2\x17\xfe\x1f\xdb\xff\x00\x04{\xff\x00\xa3\xfb\xf8\x1b\xff\
+\x00\x81\xbe#\xff\x00\xe6n\x97\xfe\x1f\xd9\xff\x00\x04|\
+\xff\x00\xa3\xfa\xf8\x1b\xdb9\xbd\xf1'\x03=x\xf0\xdf\
+\xe1AW?^h\xaf\x90\xbfe\xdf\xdb\xb7\xf6H\xfd\
+\xb6\xed\xfc]\x7f\xfb(\xfcy\xf0_\xc6\xdb/\x00\xdd\
+i\xb6>2\xb8\xf0d\xba\x9c\xb0\xf8~\xebY\x86\xe2\
+m.\x0b\xd7\xd44\xed;d\xf7\xd1[\x5c\xcbj\x00\
+\xb8\x12-\xac\xa0\x22\x9c\xb5}x\x0e@<\xfe=\x7f\
+\x1cw\xa0\x05\xac\xedN\xc2\xcfQ\xb3\xb8\xb1\xd4,\xed\
+\xb5\x0b\x1b\xd8\xa5\xb4\xbd\xb2\xbd\xb6\x8a\xf2\xd2\xea\xd2\xe6\
+6\x82\xea\xda\xe2\xd6ex\xae \xb8\xb6\x92X&\x86\
+Tx\xa4\x8aGI\x11\xe3,\xa7F\x98\xfc\x94\xff\x00\
+x\x1f\xc4c\xfc~\x87\xbd\x00\xd5\xd5\x9a\xbag\xf8\x94\
+\xff\x00\xc1P~\x00\xe9\x9f\xb2\xd7\xfc\x14\x1f\xf6\xc1\xf8\
+\x0f\xa1\xd8\xdb\xe9>\x1b\xf8}\xf1\xd3\xc7\xb6^\x14\xd3\
+mne\xbb\xb5\xd2\xfc%\xa9\xea\x93\xeb\xfe\x16\xb0K\
+\x99\x99\xe6\x9b\xec:\x06\xa9\xa7Ap\xd21\x95^&\
+\xe6gs\xb3\xfdT\x7f\xe0\x84\x9f\xb2V\x89\xfb \x7f\
+\xc1/\xbfe\x7f\x03Z\xe8\xb0i>-\xf1\xaf\xc3\xcd\
+\x1f\xe3\x07\xc4{\x94\xb0\x96\xc3R\xd4<i\xf1:\xca\
+\xdf\xc5w\x9f\xdb\x22\xe5\x9e\xe6]CH\xb2\xbb\xd3\xf4\
+I#\x91\x84qG\xa6\xc5\x0c\x11\xc3\x02\x88G\xf9\xcd\
+\xff\x00\xc1f\xbe\x1c\xff\x00\xc2\xe0\xff\x00\x82\xfa~\xd2\
+\xbf\x08\xc5\xe3i\xc3\xe2\x9f\xede\xf0\xe3\xe1\xb1\xbfH\
+\xbc\xc3\xa7\x1f\x1c\xc9\xe0/\x0b\xc7|\xb1\xf4\x91\xedF\
+\xa9$\xd1\xc49s\x1f\x18\xc5\x7f\xae\x87\x86tx\xfc\
+=\xe1\xbf\x0f\xe8\x110h\xb4=\x13J\xd2#p\x9e\
+Pd\xd3lm\xec\xd5\x84c\x88\xc3,\x00\xf9c\x01\
+~\xee8\xab\x9bwK\xc8\xc6\x92\xb3\x95\x97]\xfeQ\
+v\xfc\x7f\xcb\xa9\xb9E\x14T\x1b\x05\x15V\xea\xe2+\
+X\xe4\xb8\xb8\x9e;kh\x22\x92y\xe7\x9aD\x8a\x18\
+b\x85K\xc9,\xb2J\x9eZF\xaa2\xef$\xb1\xaa\
+\xa8\xceG&\xbed\xf1w\xed\xbd\xfb\x18\xfc>\x12\xa7\
+\x8f?k\xcf\xd9\x87\xc12@\xec\x93\x8f\x17|}\xf8\
+S\xe1\xa6\x85\xd0\x90\xf1\xca\xba\xdf\x8bm\xccr\xa3\x02\
+\xac\x8e\x03\x020@\x22\x80>\xa4=?\x11\xfc\xc5\x7f\
+\x98\x17\xfc\x1a\xaf\xff\x00)\xad\xf8\x81\xff\x00d\xcf\xf6\
+\x89\xff\x00\xd4\xc3B\xaf\xf4\x11\x9b\xfe\x0a\x83\xff\x00\x04\
+\xd4\x8d\x1b\xfe6\x1d\xfb\x0c\xe7o_\xf8k\x7f\x80 \
+\x83\xdb\x1b\xbc|\x009\xc6\x18\xe7\x07\x9c66\x9f\xf3\
+\xe8\xff\x00\x83T.m\xaf?\xe0\xb4\xde;\xbd\xb2\xb9\
+\x82\xee\xca\xef\xe1o\xc7\xfb\xab+\xaby\xe1\x9e\x1b\xab\
+K\xaf\x16\xe8S[\xddA$\x0c\xd1Omq\x0bG\
+,70\xfe\xead|\xc7\x98\xbc\xa6k_\x04\xbdW\
+\xe8K\xf8\xa3\xf3\xfc\xbf\xe0\x1f\xea\x04\xbd?/\xfd\x04\
+S\xa8\xa2\xa0\xa1\x09\xc0'\xd3\x9f\xc3\xbf\xe9_\xe73\
+\xff\x00\x07\x8d\xfc?\xf1O\xc4\x8f\xf8(\x97\xec+\xe0\
+\x0f\x03h\xb7>!\xf1\xc7\xc4\x8f\xd9\xfe/\x06\xf8W\
+D\xb3\xf2\xfe\xd3\xacx\x93Z\xf8\xd1\xafi\x1aM\x84\
+FY\x22\x86?>\xee\xf2\xdd\x1ek\x89a\x82\xd9s\
+q<\xd0C\x14\x92\xa7\xfa2\xbf\xdd=\x00\xfe,\x8c\
+\x8d\xa3\xef\x0eJ\x81\x95\xc8\xc98Rrr\x06\x0f\xe3\
+\xd7\xc6?\xf8'\xfb\xfcx\xff\x00\x82\xc0\xfe\xcd\xff\x00\
+\xb6\xbf\x8e4K[\xff\x00\x87\x1f\xb2\xcf\xec\xaf\xae\xf8\
+\x7f\xc0\xf2^Oi(\xbc\xf8\xe3\xe2\xef\x89:\xec\xb6\
+\xd2\xc1c%\xbc\xd7C\xfe\x11\x1f\x07\xc9s\xa85\xe4\
+\xa2\xd1\x1e\xf7^\xd1\xda\xc6C$\x17\xea\xa2\xd1\xddo\
+\xdcM]Y\xad\x19\xf4\x17\xfc\x13\x03\xf6(\xd0?`\
+\x1f\xd8\x87\xe0?\xec\xc3\xa6Clu\x8f\x04\xf8J\xca\
+\xfb\xe2\x0e\xa5j\x221\xf8\x83\xe2n\xbb\x1cZ\xa7\x8e\
+\xb5\xa3\x22\xda\xdb\xb4\xc9s\xae\xcdqmg$\xaa\xf3\
+&\x9big\x11\x9eR\x86W\xfd\x04Q\xb4\x05\x19\xc0\
+\xe0g\xd3\xf4\xe9\xd2\xa2\x80m@1\xd3\x038\xe5\x80\
+Q\x82\xdd\xf7vn\x9c\x8e\x98\xa9\xa8\x04\xac\xac\x96\x88\
++\xca\xbe8|b\xf8{\xfb>|#\xf8\x87\xf1\xbf\
+\xe2\xbe\xbfk\xe1\x7f\x87_\x0b|'\xadx\xd3\xc5\xfa\
+\xfd\xdc\xa9\x14zv\x8b\xa2\xd9Kur\xd1y\x8f\x1a\
+\xcdypU,\xec-L\x88o/\xae-\xadP\xef\
+\x95A\xf5)\x0e\x11\x8f`\x09=3\x81\xc9\xc6\xe2\x17\
+v>\xe9c\xb4\x1c\x13\xc5\x7f\x04\xff\x00\xf0w\xcf\xfc\
+\x15\x13L\xfe\xc9\xf0\xb7\xfc\x133\xe1'\x88e\x97Z\
+\x97P\xd2~%~\xd2\xf7\xbat\xb1\x9b;M2\x1b\
+t\xba\xf8\x7f\xf0\xd9\xee-\xb5\x06y\xaf./\x9a_\
+\x15\xf8\xa3M\xbc\xb1\x22\xde\x1b\x7f\x0d\xc2'\x86f\xba\
+\x81\xc0\x93i6|\x1f\xff\x00\x04\xab\x8fZ\xff\x00\x82\
+\xe4\xff\x00\xc1\x7f|k\xfb[|l\xf0\xe6\xa7\xae\xfc\
+-\xf8Us\xab|j\xb2\xf0\xae\xb6\x93\xea\xbaO\x85\
+|/\xe1M^-\x17\xe0\x0f\x805\x09\xd3HM5\
+\x9fM\xbe\x9e\xd3WK;\xb8\xb4\xe1\xa9_h\x9a\xc6\
+\xa3n\x16D\xb9A\xfe\x98\x91((\xae\x09\x1b\x95H\
+\xc3e@\xc6p\xa7\x1f2\x92r\x09\xc8=W\x0b\x81\
+_\xc3\xcf\xfc\x19K\xf0B\xc7K\xf8\x1f\xfbd\xfe\xd0\
+\xd7\x9aU\xf5\xbe\xb7\xe3?\x89~\x08\xf8U\xa5\xea\x93\
+2\x8b\x0b\xdf\x0c\xf8'\xc3\xf7^ \xbb\x8a\xc9yb\
+\xf0x\x8b\xc4\xd7\xd1\xdd\x90@b#B\x18\xa6\xe1\xfd\
+\xc5\xaf\x0a\xa3\x18\xc2\x81\x800\x07\x1d\x00\xed\x8e\x98\xed\
+@\xa2\xdbJ\xe3\xa8\xa2\x8a\x0a\x0a+\xf0\x83\xfe\x0b\x97\
+\xff\x00\x05\x99\xd6\xbf\xe0\x8e\xde\x0a\xfd\x9f<_\xa4~\
+\xcf\xba\x7f\xc7\xe3\xf1\xcf\xc5>;\xf0\xc4\xba~\xa1\xf1\
+*\xeb\xe1\xb2\xf8k\xfe\x10\xcd\x1fA\xd5\x12\xf6\x1b\xab\
+_\x03\xf8\xdc\xea\xcf\xa8\x9dw\xc86\xb2[i\xc9n\
+-V_\xb5I\xe6yk\xf7\x7f\xfc\x13[\xf6\xc9\xbd\
+\xfd\xbf\xbfb\xbf\x82?\xb5\xc5\xf7\x80\xa1\xf8_s\xf1\
+\x87D\xd4\xf5\x89<\x09o\xe2I<]m\xa0\x7fg\
+\xf8\x83V\xd0\xc4\x11\xf8\x92]\x07\xc3O\xaay\xa3L\
+\x13\xbc\xe3G\xb2\x09\xe6\xe3\xc8\x1bw\xb8\x07\xde\x14\x84\
+g\xd4})h\xa0\x0f\xcd?\xf8+\xef\xec\xb7\xa4~\
+\xd8\x9f\xf0No\xda\xb7\xe0\x9e\xa3\x0e\x9d\xfd\xa5}\xf0\
+\x9f\xc4\x9e-\xf0v\xa3\xa9\xda\xdd\xde\xc3\xa2\xf8\xd7\xc0\
+v7\x1e.\xf0\xee\xa9\x15\xad\x93\xc7q-\xc47z\
+G\x93\x1aF\xcf\xe6\x9b\x81\x1b\xc4\xd1\xb3\x06\xff\x00\x1a\
+\xbf\x83\xdf\x0b<G\xf1\xaf\xe2\xdf\xc3_\x83^\x16\xb6\
+\xbe\x93\xc5?\x13\xbc{\xe1O\x00iqZiwz\
+\xb5\xe5\xae\xa3\xe2\x9dz\xd3FY\x9bK\xb3\xdb{?\
+\xf6r\x5cK}uo\x182<pH\xa1\xa3!\x8d\
+\x7f\xbbn\xaf\xa7Z\xea\xfav\xa1\xa5^\xc6\x92\xda\xea\
+\xba}\xe6\x9bs\x14\x88\x1e9m\xefa{i\xa3\x95\
+\x18\x15\x927IYY\x18\x15ef\x04\x10k\xfc\x7f\
+?\xe0\x90\xbe\x1c\xb4\x7f\xf8.\xdf\xec\xb5\xa3D\x12\x1b\
+m\x17\xf6\xc8\xd7\xde\xd9B\xa8U\x8b@\xd6<V\xf0\
+B\x80\x0f\x95w\xdb\xc4\x88\x17\x1b\x02.\xdc\x01\x8a\xb8\
+7\xaa\xf2z\x19T\xde\x9f\xf8\xd1\xfe\xb3\xff\x00\xb3W\
+\xc0\x7f\x06~\xcc\xdf\x01\xbe\x0f\xfc\x02\xf0\x05\x85\xae\x99\
+\xe1?\x84>\x00\xf0\xc7\x81\xb4\x8bk(\xe4\x8a\x09\x13\
+@\xd2-\xac.oO\xda\x1e[\x99$\xd4/\x12\xe3\
+Q\x9d\xe7\x96I\xde{\xb9$\x9aI$fs\xee\xf4\
+\xd5Q\x858\xe4\x01\xcf\xe1\x8f\xcc\x8e\xbe\xbcg\xa0\xa7\
+T]\xbd\xcdB\x8a+\xc8\xbe0|w\xf8/\xfb>\
+xi|m\xf1\xe3\xe3\x07\xc2\xef\x82^\x0c\x97S\xb5\
+\xd1\xa0\xf1w\xc5\xdf\x1f\xf8O\xe1\xbf\x85\xa6\xd6/\xa2\
+\xb8\x9a\xcbJ\x8b^\xf1\x96\xaf\xa2i\x12\xea7p\xda\
+\xddI\x05\x92_\x9b\xb9V\xd6f\x8a\xdc\xaa\xb3\x00\x0f\
+]\xaf\xc6O\xf88GJ\x1a\xb7\xfc\x11\xdb\xf6\xe3\x89\
+\x97p\xb4\xf8P\xfa\x99\xff\x00g\xfb;[\xd2\xae\xb7\
+\x0e\x0f+\xb3=3\xee:\xd7\xd5\xbf\xf0\xf4\x7f\xf8&\
+o\xfd$W\xf6\x15\xff\x00\xc4\xb8\xf8\x01\xff\x00\xcd\xf5\
+~e\xff\x00\xc1e\xff\x00\xe0\xa0\x9f\xf0O\xef\x8a\xff\
+\x00\xf0K_\xdb\x93\xe1\xe7\xc3\xdf\xdb\x97\xf6;\xf8\x81\
+\xe3\x9f\x13\xfc\x01\xf1\x85\x87\x85|\x17\xe0\xcf\xdag\xe0\
+\xb7\x8a|U\xe2=o\xcb\xb7\x9a\xcbK\xd0|=\xa1\
+\xf8\xd6\xf7W\xd5\xf5+\x99\x22\xd9mg\xa7\xda\x5c\x5c\
+\xca\xfc$d\x8c\x80?\x0f3\xfc\x95'\xff\x00S/\
+\x00~\xeal\xe38\xfb\x8b\xd3\xda\xbf\xdb\xdf\xfe\x09\xbb\
+\xff\x00&\x01\xfb\x19\x7f\xd9\xb4\xfc\x1c\xff\x00\xd4\x1bF\
+\xaf\xf1\x08\x9f\x1eC\xe3\xbc2\x93\xf3n\xea\x8aG\x1b\
+#d\x18#\x0a\xea\x1c\xae\x1d\xbe\xfd\x7f\xb7\xbf\xfc\x13\
+w\xfeL\x03\xf62\xff\x00\xb3i\xf89\xff\x00\xa86\
+\x8dZU\xf8\x97\xf8c\xf9\x18\xd1\xd3\x9b\xcaV>\xd4\
+\x7f\xba\x7f\x0f\xe6+\xc1\xff\x00iO\xf9\x22\x9f\x11\x7f\
+\xec_\xb9\xff\x00\xd0\xd6\xbd\xe1\xfe\xe9\xfc?\x98\xaf\x07\
+\xfd\xa5?\xe4\x8a|E\xff\x00\xb1~\xe7\xff\x00CZ\
+\xfc\xdb\xc5\xff\x00\xf95~\x22\x7f\xd9\x19\xc4\x7f\xfa\xad\
+\xaa}/\x0a\xff\x00\xc9O\xc3\x9f\xf6;\xcb\x7f\xf57\
+\x0c~$\xff\x00\x1a\xff\x00\xbd/\xfe\x86\x95\xfbU\xfb\
+0\x7f\xc9\x16\xf0G\xfd\x83\xdf\xff\x00Kn\xeb\xf1[\
+9\x91\x7f\xde\x93\xf4h\xc5~\xd4\xfe\xcc\x1f\xf2E\xbc\
+\x11\xff\x00`\xf7\xff\x00\xd2\xdb\xba\xff\x00 \xbff}\
+\xff\x00\xe20\xf1\x7f\xfd\x91\xb8\x8f\xfdY\xe0\xff\x00\xe0\
+\x1f\xd7\xff\x00I\xcf\xf9$\xf2\x1f\xfb\x1d/\xfdC\xae\
+}\x0dE\x14W\xfb\x84\x7f\x10\x91\xbc\x9b?\x05,}\
+8\xcfS\xd1rq\x83\xf3\x13\xc8\x03\xd7\xfc\x90?\xe0\
+\xe6\xcf\xda6\xe7\xf6\x81\xff\x00\x82\xba\xfc\x7f\xb5K\xeb\
++\xbd\x03\xe0v\x9d\xe1o\x80\xde\x1c60\xde[\xf9\
+C\xc2Zi\xd5<E\x15\xea\x5c\xdd\x5c#\xea\x09\xe3\
+\x0f\x12k\x96\x977V\xb1\xd9\xc7%\xbd\xbe\x9c<\x81\
+%\xbc\x93O\xfe\xb3\x1e7\xf1M\x87\x81\xfc%\xe2\x9f\
+\x19\xea\xf9\x1aG\x84|7\xad\xf8\x9bR\xc1@~\xc3\
+\xa1i\xd7Z\xa5\xe0\x1ek$FC\x05\xa9X\x83<\
+xs\xf7\x88<\x7f\x86O\xed\x17\xf1\x7fT\xf8\xff\x00\
+\xf1\xf7\xe3O\xc7\x0df\xee\xfe\xfbP\xf8\xb5\xf1G\xc7\
+\x7f\x10d\xb8\xd5$Yu\x1f'\xc5~$\xd45{\
+Hn\xe4O\x91\xae-\xac\xae-\xadd+\x95\xcc\x03\
+i \x03W\x0d\xfe_\xaa1\xad\xaa\x8f\xf8\xad\xf7\x9e\
+4\x15\x8a\xb3\x05r\x14\x8d\xcc\x14\x95@IA\xbd\x86\
+\xe5]\xce\x0a\xa9f]\xcc\x0a\xaa\x92\xa4\xd7\xdf\x9f\xf0\
+K\x1f\xdaJ\xf3\xf6I\xff\x00\x82\x85\xfe\xc9\x1f\x1e!\
+\xbb\xd4\xedt\xdf\x08\xfci\xf0m\x9f\x8a\xe2\xd1\xfc\x93\
+\xa8\xea\x9e\x0b\xf1>\xa7\x17\x86<[\xa2B\xb3\xab\xa3\
+.\xad\xa1\xea\xf7\xb6R\x807\xf9r\xb1O\x98`\xfd\
+\xa7\xfb:~\xc3\xaf\xe2\xef\xf8!/\xed\xf3\xfbe\xdf\
+h\xb6Pj\x1e\x16\xfd\xa5?g\xbd\x03\xc1\x9e\x22\xf2\
+\xc5\xd5\xfd\xee\x81\xe1\x19\xb5=7\xe2\x06\x85n\x8d\x8f\
+\xec\xd8N\xa9\xf17\xc2w\xcdy\x1b\x96\xbbK\x11\x0c\
+\xc9\x80\xad_\x86\x19lf\x17d\x93k2H\xac\xca\
+\xd1\x92\x09\x8eE\xd8\xc8\xcb$c2\xa1\x0c\x0e\xe8\xc6\
+\x01l\x0a\xd7}\x19\x8f,\xa1(\xeb\xbd\xbfO\xeb\xf4\
+?\xde\xfa\xdf\x1b\x18\x03\x90\x1f\x1b\xb2\x0e\xef\x919$\
+\x01\xcfo|g\x80@\x16+\xf3\xcf\xfe\x09?\xf1\xee\
+\xcb\xf6\x99\xff\x00\x82q\xfe\xc7_\x18\xad/\xad5\x0b\
+\x8f\x11|\x0a\xf0&\x9b\xad\xc9gs%\xda[\xf8\x97\
+\xc2\x9a5\xb7\x85<Ec5\xc4\xb1C#\xdeYk\
+\x1a5\xdd\xbd\xe1d\xdcnRBY\x89,\x7fC+\
+\x09h\xdaH\xed\x7f\xa2\xfc\x80\xe7\xb7_zb\x96\xce\
+\x08\x03\x8fC\xeb\xeb\x9e\x9f\xe75OR\xd4\xact\xad\
+:\xfbT\xd4o-\xac4\xfd6\xd2\xe2\xfe\xfe\xfa\xf6\
+\xe2\x1b;;+\x1bH\x9a\xe2\xee\xee\xee\xf2\xe6Hm\
+\xad-\xad\xad\xe3\x92i\xeeg\x968m\xe2G\x96F\
+\x08\x86\xbf\x91\x0f\xdbS\xfe\x0f\x07\xfd\x8c>\x02\xf8\x8f\
+X\xf0/\xec\xb9\xf0\x93\xc6\x7f\xb5\xff\x00\x88\xf4-f\
+\xe7G\xbc\xf1t>-\xd3\xbe\x12|!\xbbk&\x96\
+\x0b\xab\xaf\x0fx\xc2\xf7\xc3\xfe:\xf1\x1f\x89bk\x94\
+\x85\xb4\xd9m<\x13\x06\x8b\xab\xdaK$\xf6\xbe\x22P\
+m\x1e\xe5\x12\xdaJ\xefE\xdc\xfe\xbf\xa9\x84\xbe\xec\x00\
+1\xf8\xff\x00\x9f\xad\x7f\x9b\x86\xa1\xff\x00\x07\xaa~\xdc\
+Rx\x88\xddi\x1f\xb2_\xec\xadg\xe13;:h\
+Z\x8d\xdf\xc5\xcdS\xc4_cf\xca\xc7'\x8a`\xf1\
+\xce\x93\xa7\xa4\xab\x1f\x06\xf5\xbc\x1f\x1c[\xbe\x7f\xb1\x1f\
+\xf5\x09\xfa\xb7\xfb\x19\xff\x00\xc1\xe4\x9f\xb2\xb7\xc5\xef\x12\
+\xe9\x9e\x0a\xfd\xaf\xbe\x03\xf8\xc7\xf6X\xb9\xd5o4\xfd\
+:\xdf\xe2O\x86<]\x1f\xc6_\x866\xcd1\x11]\
+j\x9e&H|#\xe0\xcf\x19xN\xca)\xa4\x8aE\
+]?\xc3\xde9\x81m\x96\xe1\xef/\xe1hR)\x81\
+Fq\x97\xc2\xef\xfd/\xf3\xb7\xa9\xfd\x9b\xd2\x1c\xe3\x8e\
+\xbe\xf5\xcc\xf8G\xc5\x9e\x1d\xf1\xd7\x87t\x0f\x18\xf8?\
+^\xd2\xbcQ\xe1?\x13\xe9\x1a~\xbd\xe1\xdf\x11\xe8W\
+\xd6\xda\xa6\x89\xae\xe8\xba\xb5\xa4W\xfaf\xa9\xa5\xea6\
+\x92Mk{e{eqoukuo<\xb1O\
+\x0c\xa1\x861\x91\xf0\xaf\xfc\x14\xdf\xfe\x0aA\xf0\xa7\xfe\
+\x09o\xfb8\xdb\xfe\xd2\xdf\x18\xfc\x11\xf1\x17\xc7\xfe\x12\
+\xb8\xf8\x81\xe1\x9f\x87\x89\xa1|1\xb7\xf0\xdd\xcf\x89?\
+\xb5<O\x0e\xa9qgvc\xf1O\x88|3\xa6\x0b\
+\x08SJ\x9dn\x18j&\xe1ZH\x8cV\xf2\xae\xfd\
+\xa1W?C\xd4\x929\xf5\xc7\x14\xea\xfe7\x07\xfc\x1e\
+\x9d\xff\x00\x04\xff\x00\x0a1\xfb0~\xd8\xcc\x18\x06\xf9\
+t\x7f\x82\x99+\xb4\x9c\x02>0\xf0\xce6\xec'\xdc\
+\xf2\x0a\x9a\xfd\x94\xf1\xb7\xfc\x16\xeb\xf6;\xf8a\xff\x00\
+\x04\xef\xf8Y\xff\x00\x05 \xf8\xa7/\x8d\xbc\x03\xf0\xb7\
+\xe3E\x8d\xac\xbf\x0d>\x1cjV:\x0d\xf7\xc5\xaf\x15\
+\xeb\x97w:\x82\xc7\xe1}+B\xd2\xfcAw\xa3\xdd\
+\xeapZiW\xba\xa6\xa7s\x1e\xbc\xbaF\x95\xa4\xc2\
+\xd7z\x86\xa3j\x0a\x92\x094\xd5\xfa[\xaf\xf5\xff\x00\
+\x0c~\xc6\xa9c\xd4\x0cS\xab\xfc\xf3\xbci\xff\x00\x07\
+\xa3~\xd0^*\xf8\xc5\xe1\xfd\x1f\xe0w\xecs\xf0\x8b\
+\xc2\xff\x00\x0au/\x16\xe9\xba\x1e\xdf\x8a\xbe/\xf1\x9f\
+\x8c\xbe \xea\x9aN\xa1\xadE\xa7C\xa9}\xa3\xc2\x17\
+\xde\x0a\xf0\xef\x86u\x19\xad%\x8a\xeeM\x19\xec\xfc]\
+ogt\xf2X\xc3\xad\xea\xb6\xf1\x8b\xe7\xff\x00BA\
+,\x9bH\xf9\xb7\x02\x17\xa8rY\x8e\x06\x14mp\x14\
+\x00\xc3v2\xaeK\x903*\x82RRM\xadK\x84\
+\xe0\x13\xed@9\x00\xfbW\xf3\xe7\xff\x00\x053\xff\x00\
+\x83\x8e?aO\xf8&\xf7\x8a5\x8f\x84w\xf7\x9e%\
+\xfd\xa1?h-\x1d.b\xd5~\x15|\x22\x93I6\
+\x9e\x0d\xd4\xfc\x94{\x1d+\xe2G\x8euf}\x0f\xc2\
+w7S:\xc7saci\xe2\x8f\x11\xe9v\xebq\
+yw\xe1\xd5)\x05\x95\xcf\xf3=\xf1/\xfe\x0f^\xfd\
+\xac5MP\xcb\xf0k\xf6.\xfd\x9f|\x0f\xa3y\x84\
+\x0b\x0f\x89\xbe:\xf8\x8d\xf1WP(\x09\x02#\xabx\
+\x5c|\x19\xb5\x12\xa8\x1f4\x8b\xa6\x14o\xe1\x8c}\xe2\
+\xe2\xb9\x9d\x84\xeaE+\xb7mm\xa9\xfe\x8d\xd4W\xf0\
+)\xfb=\xff\x00\xc1\xec7rj\xbaN\x97\xfbT\xfe\
+\xc4V\xd0\xe9\x13\x0b\x81\xacx\xdf\xe0\x17\xc4\xb9\x9e\xf6\
+\xcd\x96\x03\xf6f\xd3\xfe\x1a|B\xd2\x92\xde\xfa).\
+\xf6Gz\xf3|V\xb5:|&Y\xa3\x17\xed\x12\xc3\
+'\xf6\x19\xfb\x09\xff\x00\xc1B\xbfe\x7f\xf8(\xcf\xc2\
+\x96\xf8\xbf\xfb-\xfcM\xd3\xfcm\xa4\xe9\xd2i\xf6\x1e\
+2\xf0\xad\xd2\x0d'\xc7\x9f\x0eu\x9dB\xde\xe2\xe6\xd3\
+G\xf1\xcf\x84\xa7\x9aMCD\xb9\xbdK{\xd6\xd3o\
+\xf3s\xa2\xeb\xb1\xd8\xddI\xa1\xea\x9a\x8aX^<C\
+Mh\xc7\x19)+\xadl\xed\xf3\xb2\x7f\xa9\xf6\xfd\x14\
+W\xe7\x9f\xfc\x14+\xfe\x0aw\xfb#\xff\x00\xc12>\
+\x1ci\x9f\x11\x7fj_\x88M\xa0\xcb\xe2\x99\xae\xed<\
+\x01\xf0\xfb\xc3\xb6q\xeb\xdf\x11~ \xdei\x8fl\xba\
+\xa8\xf0\xaf\x86\x12\xea\xde{\x8d;E\xfe\xd2\xd2\xdb_\
+\xd7/n4\xed\x17H\xfbv\x9f\x0d\xd6\xa0\x97\x9a\x85\
+\x95\xa5\xc2(\xfd\x0c\xa2\xbf\x80/\x8f_\xf0{'\x88\
+\x0e\xa1\xab\xe9\xdf\xb3\x17\xec9\xa4[iV\xf7L\x9a\
+/\x8d><|X\xbb\xbc\xbc\xd4lJ\xc6\xc2\xebR\
+\xf8m\xe0\x1f\x0e\xd8A\xa2K\xe64\x91y6\xff\x00\
+\x15\xf5\xd8\xd8,rE*\xed\xb8\x85|\x1f\xe1\xbf\xfc\
+\x1e\xbd\xfb\x5c\xe9z\xca\xcb\xf1{\xf65\xfd\x9c\xfco\
+\xa0\x07\x05\xb4\xcf\x87\x1e0\xf8\x97\xf0\xb3Y\x92\x22\xea\
+\x17f\xbd\xe2\x8b\xef\x8cv0\x96\x04\xa9\x99\xfc;*\
+\x85&Q\x12\xec\xf2\xd8#\xdaC\xbd\xff\x00\xaf\xeb\xee\
+\xf4?\xd1\xd6\x9b\xf3v\xdb\x8f\xc6\xbf\x9c\xaf\xf8&\x7f\
+\xfc\x1c\xb9\xfb\x0d\xff\x00\xc1E<o\xe1\xaf\x82\x97\xf6\
+^+\xfd\x9a?h\x0f\x15\xa5\xad\xa7\x87\xbc\x01\xf1F\
+\xff\x00G\xd4|/\xe2\xff\x00\x12\xce\x22C\xe1\x8f\x01\
+|F\xd3\x0d\x8d\x9f\x88\xb5{\x8b\x89\xbc\x9d\x17M\xd6\
+4\x1f\x05\xebZ\xdc\x91<\x16:A\xba0[M\xfd\
+\x19\xa3\x06U\xc3\x16\xdc\xb9\x0c\x08 \x83\x92\x08 .\
+G\xf7[\x1c\x8c\x1e\xf4\x14\x9d\xf6\xfe\xbf\xaf\xf8bJ\
++\xf9\x9c\xfd\xbc\xbf\xe0\xe8/\xd8\xfb\xfe\x09\xfd\xfbT\
+\xfcN\xfd\x93\xfe(|\x06\xfd\xa5\xfcc\xe3O\x85\xb2\
+\xf8~\xdfZ\xf1\x07\x80\xf4\xcf\x86\x13xWP}{\
+\xc3\x9a_\x8a-\xdbK\x9b\xc4_\x12\xf4\x1dVA\x0d\
+\x9e\xb7g\x05\xc0\x9fJ\xb5t\xb9\x86m\xbem\xbb[\
+\xc8\xd0~\xc2\xdf\xf0tW\xeco\xfb}~\xd4\xff\x00\
+\x0a\xff\x00d\xdf\x86_\x01\xbfi\x8f\x06x\xdf\xe2\xc5\
+\xd7\x89-tO\x12x\xf7M\xf8[o\xe1-5\xbc\
+3\xe1\x0d\x7f\xc67\x8f\xacM\xa0\xfcJ\xd7uT\x8e\
+k\x0f\x0f\xdd[\xdb\x9b]2\xe3\xfd.[q1\x8a\
+\x03$\x8a\x03\x92[\xb4\xbf\xe1\xed\xf9\x9f\xd3U\x15\xfc\
+}\xff\x00\xc1I\xbf\xe0\xed\xaf\xd9\xdb\xf6T\xf8\x85\xe2\
+\xff\x00\x81\xbf\xb2\x7f\xc2;\xbf\xda\x97\xe27\x83u\x9b\
+\xcf\x0cx\x9f\xc7\xfa\xbf\x8b\xa2\xf0O\xc1}\x0f\x5c\xb0\
+\x96\xe6\xcbP\xb7\xd15\x1d/J\xf1/\x89> \xcd\
+\xa6j\x90\x7ff\xdd&\x9dm\xe1\x9d\x12o\xf4\x99l\
+|[w=\xb0\x82O\xcb\xcf\x82?\xf0z\xc7\xc7\xab\
+\x1f\x14[\x7f\xc3H~\xc6?\x09\xfcS\xe0\xab\xdb\xfb\
+X\xa6\xb9\xf8#\xe3o\x18x\x07\xc5:.\x98n\xa3\
+[\xbb\xd8\xf4\xaf\x1d\xcb\xf1\x1bK\xf1E\xfd\xb5\xb4\xb2\
+\x1bm(\xea~\x0d\xb7\xbf\xbeXm\xae5\x9b8\x5c\
+I\x10.h\xf7_\xd7\xf5\xfdj\x7f\xa2=\x15\xf0\x17\
+\xfc\x13\xdf\xfe\x0aA\xfb2\x7f\xc1K\xfe\x0c\xa7\xc6\x8f\
+\xd9\xa3\xc6/\xaaY\xe9\x976\xbaW\x8e\xfc\x05\xaf\xc7\
+g\xa6|D\xf8g\xaf\xdeA=\xc5\xb6\x8d\xe3\x7f\x0f\
+C\xa8j\x12Y5\xfcV\xd7\x12\xe8z\xbd\x9c\xd7:\
+\x06\xbd\x05\x95\xfc\xda6\xa7\xa8}\x8e\xf6;?\xbfh\
+(k\x16\x1d\x06G\xebJ\x09\xc0\xcf_j\xf8\xa7\xf6\
+\xee\xfd\xbf\xbffO\xf8'G\xc1\xbf\xf8^\x1f\xb5\x17\
+\x8f\x1b\xc1\xde\x14\xb9\xd5\xa2\xf0\xef\x87t\xbd2\xc2m\
+s\xc5\xde4\xf1-\xc4\x13]\xc5\xe1\xff\x00\x09xj\
+\xd1\x92\xefX\xbf[\x0b[\xcb\xfb\xc7Y-\xed4\xeb\
+\x1bYo/\xae\xed\xe2U\xdf\xfct|~\xff\x00\x83\
+\xd8\xae\xff\x00\xb55\x9d'\xf6Z\xfd\x88-\xe6\xd2`\
+\xb8\x0b\xa0\xf8\xeb\xe3\xbf\xc59\x8d\xee\xa5o\xb5Y\x9b\
+R\xf8U\xf0\xff\x00\xc3\xb0\xae\x94\xe6O8B\x96\xdf\
+\x16\xb5Id\xb4\x8f\xed\x13Eo9[X\x81JJ\
+:\xc9\xdb[\x1f\xdfk\x1c\x02i\x06\xee\xe0W\xf9\xbc\
+\xf8'\xfe\x0fY\xfd\xb4\xb4\xfddM\xf1\x17\xf6C\xfd\
+\x98\xbcY\xa0\xe7w\xf6g\x82\xb5o\x8a\xbe\x00\xd6$\
+Fo\x94G\xadk\x9e*\xf8\x99g\xf2\xa1\xda\x19|\
+?\xb6g\xc1\x0f\xd4W\xed\x9f\xec?\xff\x00\x07w\xfe\
+\xc2\xff\x00\xb4\x97\x8a<5\xf0\xf3\xf6\x8b\xf8{\xe3\x7f\
+\xd8\xe7\xc6\x1e%\xbf\x1am\xb7\x89<K\xe2M#\xe2\
+_\xc1k[\xcb\x8b\x97\x83MMS\xe2V\x9b\xa4x\
+;W\xd1-\xee?s\xf6\xfdW\xc4\x1e\x00\xd2\xbc9\
+\xa3\xb4\xdb\xef\xf5\xf5\xb1\x86\xebT\xb7\x09S\x8b\xd9\xff\
+\x00\xc0\xf5?\xadZ*\x8e\x9f{\x06\xa1o\x0d\xe5\xa5\
+\xc4\x17v\x971Gqkuk4w6\xb7\x16\xf3\
+\xc6\x93A=\xb5\xc4E\xa2\xb8\x82H\xa4V\x8eh\xd9\
+\x92E!\x95\x88 \xd5\xea\x0b\x0a+\xf0\xff\x00\xfe\x0a\
+e\xff\x00\x05\xf6\xfd\x85?\xe0\x98:\xfb\xfc9\xf8\x9f\
+\xe2\x1f\x11|V\xf8\xec-,u\x0b\x8f\x81\xff\x00\x07\
+\xed\xf4\x9dk\xc5^\x1e\xd3\xb58M\xce\x9b{\xe3}\
+WU\xd4\xb4\xcf\x0ex7\xed\xf6\x81u\x1bM7U\
+\xd5\x0f\x88\xa6\xd2.m5\x94\xd0\xa6\xd3/\xf4\xdb\x8b\
+\x8f\xe5\x8b\xe2\xb7\xfc\x1e\xbf\xfbMj\x97c\xfe\x14\x87\
+\xecQ\xf0?\xc0\xbaz?\xcd\x0f\xc5\x7f\x1f\xf8\xf7\xe2\
+\xcd\xf4\xd1\xa9(\x19.|\x1fm\xf0b\x18\x0c\xa5$\
+g\x87\xec\x97\x8djY\x13\xedS\x9d\xcf\x18O2\xbd\
+\xbf\xe1\xbe\xf3\xfd\x17h\xaf\xe0/\xf6r\xff\x00\x83\xd7\
+o\xdbU\xd2\xf4\xaf\xda\xdf\xf6+\xb1\x87E\x90Lu\
+\x9f\x1d\xfe\xcf\x9f\x10n\x97P\xd3\xf6BZ&\xb5\xf8\
+[\xf1\x0a\xce\xe55\x08d\xb8\x09\x1c\xe6_\x8a\xd6s\
+Z[\x17\xb9\x8a-N\x5cZI\xfd\x99~\xc5\x9f\xb7\
+\x17\xec\xe9\xff\x00\x05\x01\xf8!\xa3~\xd0\x1f\xb3\x0f\x8f\
+\xa0\xf1\xbf\x80\xf5\x1b\xfb\xad\x13T\x82h\x9bJ\xf17\
+\x83|Oa\x05\xa4\xfa\xa7\x84|i\xe1\xeb\x9f2\xf3\
+\xc3\xfe#\xd3\xe0\xbf\xb4\xbb6w9\x8e\xee\xd2\xf7N\
+\xd44\xfb\x9b\xed&\xf6\xd2\xfa\xe4\x1a\x92{4\xfd\x0f\
+\xb0\xa9\x0eq\xc7_z\x06v\xfb\xe3\xf5\xc5|k\xfb\
+p~\xde\x7f\xb3?\xfc\x13\xcb\xe0\xb5\xc7\xc7\x8f\xda\x97\
+\xe2\x0c~\x06\xf0_\xf6\xad\xbf\x874;K;\x0b\x9d\
+g\xc4\xfe0\xf1M\xdd\xa5\xe6\xa3m\xe1\x9f\x09\xe86\
+jnumf};L\xd4\xaf\xb6\x17\xb7\xb1\xb4\xb3\
+\xb2\xb9\xbb\xd4/-\xad\xa2g \xcf\xb2T\x92\x0e}\
+q\xfa\x0e\xbe\xf9\xcd:\xbf\x82\x0f\xda'\xfe\x0fa\x8e\
+\xdbU\xd6\xf4\x7f\xd9O\xf6#\x1a\x86\x8fm2\xa6\x87\
+\xf1\x0b\xe3\xe7\xc5\x09,'\xd4b\xf2\xc0\x9a[\xef\x85\
+~\x07\xf0\xf3\x1d=\x16\xe3x\xb5\xf2\xbe,\xde\x5c\x5c\
+Z\x88\xe5\xbb\xb5\xd3\xae\x9a[8>n\xf8i\xff\x00\
+\x07\xb0~\xd6:^\xaen>1\xfe\xc6\x1f\xb3\xef\x8e\
+\xbc>\xc0\x95\xd2\xfe\x19x\xdf\xe2'\xc2\x8dd\x02\xdf\
+.5\x7f\x14\xaf\xc6\x8by@^\x0b.\x84\xbb\x8f\xcc\
+6\x8e(!\xd4\x84]\x9c\x92w\xb5\xbe\xef\xf3G\xfa\
+8Q_\x84\xdf\xf0K_\xf88\x13\xf6+\xff\x00\x82\
+\xa2\xeb\xe9\xf0\xbf\xc1M\xe2\x8f\x83_\xb4\x14Z\x0a\xeb\
+3|\x17\xf8\x9e4\xf5\xbc\xd6\xfe\xc9\x1c\xed\xaf\x1f\x87\
+\x9e.\xd2\xaeg\xd1\xfcsk\xa2,\x1fh\x99$\xb5\
+\xf0\xe7\x88d\xd2\xe4M[\xfe\x11\xc4H\xf5{m\x0f\
+\xf7f\x82\xcf\xf07\xa2\x8a+\xa0\xf3\xc2\x8a(\xa0\x02\
+\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\
+\x94\x1ct\xc6}\x186\x18\x7f\x12\x12\xa4:\x06\x5c\x82\
+\xe8C(\xce\xdf\x9b\x14\x94\x87\xa8\xfa\xff\x00C@\x9a\
+\x93q\xb6\xd7\xb7\xe5\xfe~\x87\xf6M\xfb\x03\x7f\xc1\xa4\
+\xc7\xf6\xe2\xfd\x8e\xfe\x00~\xd6C\xfe\x0a\x00>\x18\x0f\
+\x8e~\x02\xb2\xf1\xbf\xfc ?\xf0\xca\xa7\xc6\xbf\xf0\x8b\
+\x8b\xbb\xab\xcbA\xa6\x7f\xc2R\x7fi\x0f\x09\x9dh\xa0\
+\xb4\x12\x1b\xb3\xe1\xdd+sHPZ\xaa\xa0f\xfa\xfb\
+\xfe y?\xf4\x93\xc1\xff\x00\x88Y\xff\x00\xe5e_\
+\xd3G\xfc\x103\xfeP\xed\xfb\x00\xff\x00\xd9\x06\xd1\xbf\
+\xf4\xeb\xab\xd7\xeb\xedd\xe7;\xbeY\xbbt\xdf\xcb\xcd\
+u\xf2\xfc\xdd\xfb}\x9c%\xef8\xea\xec\xff\x00\xf4\x9f\
+\xfeE\x1f\xc0\xd7\xfc@\xf2\x7f\xe9'\x83\xff\x00\x10\xb3\
+\xff\x00\xca\xca\x8f\xf8\x81\xe4\xff\x00\xd2O\x07\xfe!g\
+\xff\x00\x95\x95\x7f|\xb4R\xe7\xa9\xfc\xef\xf1\xff\x00\xe4\
+\xbf\xaf\x9b\x0fcO\xf9\x7f\xa5o\xfeE\x1f\xc0\xd7\xfc\
+@\xf2\x7f\xe9'\x83\xff\x00\x10\xb3\xff\x00\xca\xca\x8f\xf8\
+\x81\xe4\xff\x00\xd2O\x07\xfe!g\xff\x00\x95\x95\x7f|\
+\xb4Rr\x9b\xf8\xa5\x7f\xbf\xfc\xd8*P[+\x7fI\
+~\x87\xf33\xff\x00\x04\x5c\xff\x00\x83v%\xff\x00\x82\
+B\xfe\xd1\xdf\x11>?\x1f\xda\xff\x00\xfe\x1a\x11|{\
+\xf0\x7fP\xf8O\xff\x00\x08\x9f\xfc3\xfa\xfc&\x1aI\
+\xd4<]\xe1o\x16?\x88\x17\x5c_\x8d\x9f\x12\xfe\xdc\
+\xa8|0\x96?\xd9_\xd8\xd6E\x9a\xf7\xed\x07Q\x0b\
+h\xb0\xdc\x7fL\xd4QH\xb4\xad\xa2\x0a(\xa2\x81\x91\
+M\xfe\xad\x89;B\xfc\xc5\xf2\x06\xc09\xdf\x93\xc0\xdb\
+\xd7'\xe5\x18\xcbq\x9a\xff\x00:_\xf8<\xa3\xf6\xe1\
+\xb4\xf8\x81\xf1\xbb\xe0O\xec!\xe0\xedN\xe1\xb4\xef\x81\
+\xba}\xf7\xc6\x0f\x8b\xb1\xdb\xcc\xc2\xca\x7f\x1f\xf8\xfbL\
+\xb5\xb1\xf0>\x95<O\x08\x81\xee<\x17\xe0\xb8/\xf5\
+X\xaf\xad\xee&\x8e#\xf1\x0a\xfe\xca\xf0Z\xcfb\xc8\
+\x7f\xb9_\xdb\xc3\xf6\xdb\xf8G\xff\x00\x04\xff\x00\xfd\x97\
+~'~\xd4?\x18\xa6\x9eO\x0d\xf8\x07I#I\xf0\
+\xed\x9c\xa9o\xabx\xe7\xc6z\x81\xfb7\x85\xbc\x07\xa2\
+\xcc\xe9,v\xda\xaf\x89u'\x86\xd5/'\x86X4\
+\xcb&\xb9\xd5\xee \x9e\xda\xcah[\xfc\xf8\x7f\xe0\x89\
+\x7f\xf0N\xaf\x13\x7f\xc1u?o?\xda\x03\xf6\xfc\xfd\
+\xb5\xac\x0f\x88\xfe\x01\xf8k\xe2v\xa7\xe2\xaf\x88\x1a\x1a\
+\x5c\xcfe\xa6\xfcN\xf8\xbf\xe2\x1d\x9a\xee\x83\xf0\xa9#\
+]BMj\xdb\xc0\xbe\x0e\xf0\xd5\xde\x8d\xa9k\xd6\xcb\
+-\xbb]i\x07\xc3>\x1e\x8a\xfa\xee\x1dO[kv\
+\xaf\xf1-\xbb\xff\x00^\xa6s\x5c\xcf\x92\xf6\xbe\xfd\xd5\
+\x9f\xe7\xbf\xebt~D\xff\x00\xc1?\x7f\xe0\x89\x1f\xf0\
+P\x8f\xf8)\x06\x9d\xff\x00\x09o\xc0O\x84\x0f\xa1\xfc\
+$\x173Y\xb7\xc6\x8f\x8a\x97\xd2\xf8\x0f\xe1\xcd\xdd\xcd\
+\x94\xe6\xde\xfa\xd7\xc3\xb7\xf7Vw\x1a\xc7\x8c\xee,\xa4\
+K\x88\xaf[\xc2z>\xafecyc{\xa7\xdf^\
+[\xdf\xec\xb7o\xe8\xbb\xe1\x97\xfc\x19\x1b\xf1{Y\xd0\
+Z\xef\xe3\x1f\xfc\x14\x13\xe1\xcf\x80|JgdM\x17\
+\xe1\x9f\xec\xf9\xe2_\x8a\xfa\x01\xb5\x1fvy|C\xe2\
+\x9f\x8b\x1f\x07/\xd6va\xfb\xcb(\xbc2a\xc0\x05\
+o\xc9\x00W\xfa\x03xW\xc1\xde\x1a\xf0O\x86\xf4?\
+\x08\xf87@\xd1|%\xe1o\x0ciVZ\x17\x86\xfc\
+5\xe1\xbd6\xcbF\xd0t\x0d\x1bN\x86;}?J\
+\xd24\x8d>\xde\xde\xc7M\xb1\xb4\xb6\x8e\x18m\xec\xed\
+aKXc\x8a%\x8e\x15T\x0b]B\x02\xa8\xaaq\
+\x90;g\x1f\x99\xe4\xfdO-\xd4\xe0\x9anr\xe8\xed\
+\xf2\xff\x00\x86\x05J\x09mw\xdd\xfc\xbb\x7f_\x89\xfc\
+\x0e\x7f\xc4\x0f'\xfe\x92x?\xf1\x0bH\xff\x00\xdf\xb2\
+\xaf\x8b\xff\x00\xe0\xa1\x9f\xf0i\x99\xfd\x82\xff\x00c\x1f\
+\x8f\x9f\xb5\xe1\xfd\xbe\x8f\xc5U\xf8\x1d\xe1;/\x147\
+\xc3\xef\xf8e\x9f\xf8A\xff\x00\xe1'\x17\x9e%\xd0\xfc\
+=\xf6#\xe2\xb3\xfbGx\xc8h\xa2\x13\xad\x0b\xd3p\
+|/\xad,\xa2\xd7\xec\xadg\xb6\xe0\xcb\x1f\xfaZ\xd7\
+\xe3\x17\xfc\x1c5\xff\x00(_\xfd\xbf?\xec\x92h\xdf\
+\xfa\xb2\xbc\x0dJ\xf2\x93\xd5\xdd\xed\xfd]\xb0T\xa0\xb6\
+\x8f\xf4\xad\xfeH\xfex\xff\x00\xe0\xc92\x0f\x81?o\
+\xb0\x0b\x1cx\xcf\xe0\xb8;\x97i\xdd\xfd\x81\xe32x\
+\x12K\x8c\xe7$ol1a\xb9\xf1\xe67\xf7s_\
+\xc2/\xfc\x19$\x7f\xe2\x85\xfd\xbf\x7f\xecu\xf80\x7f\
+?\x0f\xf8\xc8\xff\x00^\xb5\xfd\xddR-l\xad\xb5\x95\
+\x82\x98\xddW\xeb\xfe\x14\xfacu_\xaf\xf5\x14\x0c\xff\
+\x00'\x1f\xf8(\xe0\x1f\xf1\x13\x7f\x89w\x1c)\xff\x00\
+\x82\x89~\xcd\xc1\xc1\x1dS\xfe\x13o\x859?\x87\x7f\
+\x5c\xd7\xfa\xc8\x8e8\x1d\x07\x15\xfeM_\xf0R>?\
+\xe0\xe6o\x177\xfdd3\xf6s\xce:\x80\xbe4\xf8\
+Pr=\xf9\xaf\xf5\x95\xab\x9e\xff\x00/\xd5\x99\xd3\xfb\
+_\xe2\xff\x00\xdbW\xe7\xfa\x05\x14QPh~9\xff\
+\x00\xc1\xc0\xb9\xff\x00\x875\xfe\xdf\xff\x00\xf6D\xd4\xff\
+\x00\xe5\xe5\xe1o\xf0\xaf\xf1\xc5$\xe4\xe3\x1dN>\xf7\
+\xf4ls\xec\x05\x7f\xb1\xdf\xfc\x1c\x09\xff\x00(l\xfd\
+\xbf\xff\x00\xec\x89\x0f\xfdL|/_\xe3\x85W\x0d\xfe\
+_\xaa0\xaf\xf0?G\xfa\x08@\xc1\xc0\xc1\xc1\xe7-\
+\xe9\xcfV\xc7#\xf3\xaf\xeaW\xfe\x0d\x0e\xff\x00\x94\xb3\
+/\xfd\x9b\xbf\xc5O\xfd8\xf8R\xbf\x96\xa3\xd0\xfd\x0f\
+\xf2\xaf\xeaW\xfe\x0d\x0e\xff\x00\x94\xb3/\xfd\x9b\xbf\xc5\
+O\xfd8xR\xae\x7f\x0b\xf9~h\xc6\x9f\xc7\x1fS\
+\xfdM(\xa2\x8a\xc4\xed\x0a(\xa2\x80\x0a(\xa2\x80>\
+.\xfd\xbe\xff\x00m\x1f\x86\xff\x00\xb0\x0f\xec\x9d\xf1\x83\
+\xf6\xa5\xf8\x95\xe6^\xe9_\x0d\xb4\x0f3G\xf0\xf5\xbb\
+2]\xf8\xb3\xc6Z\xac\xa3N\xf0\x8f\x85-\xa5\x00\xad\
+\xb3\xebZ\xdc\x96\xf6\xf77R\x1d\x966\x02\xe6\xf1\xd5\
+\xc4I\x1c\xbf\xe2\xd7\xfbB|t\xf8\x89\xfbM|h\
+\xf8\xa1\xfb@\xfcY\xd6.|A\xf1\x0b\xe2\xb7\x8b\xb5\
+\xdf\x1bx\x9bS\xb8\x91Y\x0d\xe6\xabs-\xc2\xe9\xd6\
+H\xb6\xf1Go\xa7i\x96\xc9\x05\x86\x99g\x0a\xc3\x05\
+\xa6\x9fooo\x0c\x22\x18\xa2H\x7f\xd27\xfe\x0e\xf4\
+\xfd\x98\xfe4\xfcn\xff\x00\x82\x7f\xf8'\xe2\xb7\xc3m\
+\x7fP\xb8\xf0/\xec\xd3\xf1\x12\xf3\xc7\xbf\x17\xbe\x1c\xdb\
+[\x83e\xaexs_\xd3m\xbc;\xa6x\xe2K\xb0\
+\xea~\xd9\xf0\xf6\xf5\xee![b\x92\xc5.\x9b\xe2\xbd\
+B\xe5R\xd6K\x22o?\xccD\x00A`\xcb \xc9\
+\x0d\xb7\x90F$Bw\x83\xe5\xb6\xed\xae\x14\xa6A \
+\xe5\x94\x05\xdd\xa4\x1f\x9f]\xbf\xaf\xebC\x9b\x10\xe5\xa2\
+\xb6\x9av\xee\x9b\xf4\xdbU\xff\x00\x04\xff\x00T\x9f\xf8\
+4cIM?\xfe\x09\x07\xe1\xbb\xaf)VM[\xe3\
+\xf7\xc6\xdb\xd9\x18u\x90G\xadi\xd61\x93\xeb\x84\xb2\
+U\xe4\xf5Z\xfe\x9fk\xf9\xa8\xff\x00\x83M\x9d\x1b\xfe\
+\x08\xeb\xf0\xc0&3\x1f\xc5\xbf\x8c\xe9)\x1c\xe6_\xf8\
+J\xd9\xdc\x9cw%\x87^q\x8a\xfe\x95\xc1\xcf52\
+\xf8\x99\xd1\x1d\x97\xa2\xfc\x82\x8a(\xa9\x19\xfc4\x7f\xc1\
+\xee\x9f\xf2E\x7f`\x0f\xfb*?\x1e?\xf5\x0d\xf0\x0d\
+~\xea\xff\x00\xc1\xb8\xbf\xf2\x86_\xd8\x9f\xfe\xc4\x9f\x12\
+\xfe\xbf\x10\xbcW_\x85\x7f\xf0{\x98\xcf\xc1_\xd8\x03\
+\xfe\xca\x8f\xc7\x8f\xd7\xc1\xde\x00\x1f\xd6\xbfu?\xe0\xdc\
+^?\xe0\x8c\xdf\xb1@\xea\x7f\xe1\x09\xf17\x1d\xf0>\
+!x\xaf\x9f\xf2h!|o\xd1u\xf4\xe8~\xe1Q\
+I\xb8z\x8aM\xc3\xb7?Nh,S\xd0\xfd\x0f\xf2\
+\xaf\xf2\x11\xff\x00\x82@\x7f\xca|\xbfg\x8f\xfb<?\
+\x1e\xff\x00\xe9\xe3\xc6\xf5\xfe\xbdm \x1c\x10\xc3#\xa9\
+\x18_\xc5\x8f\x03\xf1<\xf6\xaf\xf2\x14\xff\x00\x82?\x9c\
+\xff\x00\xc1|\x7fgb\x0eC~\xd8^< \x8e\xe3\
+\xfbc\xc6\xf84\xd2odgSx\x7f\x89[\xef_\
+\xa1\xfe\xbd\xc7\xa8\xfa\xff\x00CKI\xe9\xec\x7f\xa1\x1f\
+\xd6\x96\x91\xa0W\xf2\x81\xff\x00\x07\x8a\xf3\xff\x00\x04\xb0\
+\xf0\x9ex\x1f\xf0\xd4\x7f\x0c\x8f\xe1\xff\x00\x08\xd7\x8f3\
+\xfa\x90?\xc9\xaf\xea\xfe\xbf\x94\x0f\xf8<W\xfeQ_\
+\xe1?\xfb:\x1f\x86\x7f\xfa\x8ex\xea\x82g\xf0\xbf\x91\
+\xfe^\xd4QEt\x1c\x0f\xf5_\x9a\x22\x9f\xfdD\x9f\
+\xf5\xcao\xfd\x00W\xfb{\xff\x00\xc17\x7f\xe4\xc0?\
+c/\xfb6\x9f\x83\x9f\xfa\x83h\xd5\xfe!\x13\xff\x00\
+\xa8\x93\xfe\xb9M\xff\x00\xa0\x0a\xff\x00o\x7f\xf8&\xef\
+\xfc\x98\x07\xece\xff\x00f\xd3\xf0s\xff\x00Pm\x1a\
+\xa2{/_\xeb\xfa\xbf\xdf\xd3\xa6\x87_\x9f\xe8}\xa8\
+\xff\x00t\xfe\x1f\xccW\x83\xfe\xd2\x9f\xf2E>\x22\xff\
+\x00\xd8\xbfs\xff\x00\xa1\xad{\xc3\xfd\xd3\xf8\x7f1^\
+\x0f\xfbJ\x7f\xc9\x14\xf8\x8b\xff\x00b\xfd\xcf\xfe\x86\xb5\
+\xf9\xaf\x8b\xff\x00\xf2j\xfcD\xff\x00\xb23\x88\xff\x00\
+\xf5[T\xfa~\x15\xff\x00\x92\x9f\x87?\xecw\x96\xff\
+\x00\xean\x18\xfcJ\xe9\x22\xff\x00\xbd'\xea\xd1\x9a\xfd\
+\xa9\xfd\x98?\xe4\x8bx#\xfe\xc1\xef\xff\x00\xa5\xb7u\
+\xf8\xab\xfck\xfe\xf4\xbf\xfa\x1aW\xedW\xec\xc1\xff\x00\
+$[\xc1\x1f\xf6\x0f\x7f\xfd-\xbb\xaf\xf2\x0b\xf6g\xdf\
+\xfe#\x0f\x17\xff\x00\xd9\x1b\x89\xff\x00\xd5\x9e\x08\xfe\xbf\
+\xfaN\x7f\xc9'\x90\xff\x00\xd8\xe9\x7f\xea\x1ds\xe8j\
+:\xf5\x14SY\x82\x8c\x9e\x9d\xcf\xa7\x04\xff\x00L~\
+5\xfe\xe1\x1f\xc4'\xe1\x0f\xfc\x1c\x8d\xfbC\xc3\xfb=\
+\x7f\xc1\x22\xff\x00j\x19\xe1\xbc\xb5\xb6\xd7~/\xe8\xda\
+_\xc0\x9f\x0f\xc1q$\xd1Iy7\xc4\xdb\xf5\xd25\
+\x84\xb3x`\x9c\xc7wm\xe1\x94\xd6\xef\xe0y\x0d\xbc\
+L\xd6e\x0c\xea\xe5\x15\xbf\xc8\x5cr\x01\xf9Nrr\
+\xb9+\xeav\x96%\x88\x1d\x01<\x9c~\x15\xfe\x85\x7f\
+\xf0z\xaf\xed\x1a4\x7f\x85\x1f\xb2\x07\xec\xad\xa6\xde\xea\
+P^x\xd7\xc6~5\xf8\xd5\xe2kx>\xcb\xfd\x9b\
+q\xa3x#L\xb4\xf0\xbe\x81\x1d\xdc\x9ec\xdd\xc7x\
+\x9a\xbf\x8a/.m\x91m\xfc\xa7\x869\x9f\xcc2F\
+\xa8\xdf\xe7\xcd\xa4\xe9\x17\xfa\xf6\xa5\xa5hZTB]\
+C\x5c\xd4t\xfd\x17L\x8fw\xc9&\xa1\xab^Cg\
+e\x09\x93\x1dL\xf7\x11!\xf9r3\xd2\xb4\x82k^\
+\xebO\xc0\xe7\xac\xd7<\x17T\xff\x00;;}\xda\x9f\
+\xe9\xeb\xff\x00\x04\xc1\xfd\x85,\xbcO\xff\x00\x06\xcbj\
+\xdf\x02.lm<;\xad\xfe\xd3\xff\x00\xb3\xef\xc6\xef\
+\x89:\x86\xa3$+\xab+k\xfe:\xb5\xd5\xee\xfc%\
+\xe2U\xb7\xbc\xdd\x14\x17QhZ'\x85\x9a(\xa3\x1b\
+\xadnm\xfc\xd8e\x0c\x81\x8f\xf9{\x8f3c;)\
+\x8eU8te\xc7\x94\xe3>b\x94\xc0\x93\xcc\x12\x19\
+wD\xec\x06\x11P0PT\x7f\xb9\xa7\xec\x93\xf0n\
+\xcb\xe07\xec\xad\xfb=\xfc\x0d\x83H\x87H\xb7\xf8c\
+\xf0W\xe1\xd7\x81\xaf\xb4]\xe6\xf2\x0b[\xfd\x13\xc2z\
+n\x9b\xadY\xf9\xb2\x0c\x5c\xa1\xd4\x22\xbcF\xde\x9f2\
+pT\xab\x95\xaf\xf1\x9b\xff\x00\x82\x8a\xfc&O\x81\x7f\
+\xb7\x97\xed\x81\xf0\x969#\x92\x0f\x04~\xd1\x9f\x15\xf4\
+\x9bS\x0d\xbaZ[\x8b\x07\xf1~\xa7\xa8\xe9\xf1\xda\xda\
+\xc6\x91Go\x04VW\xf0\xc4\x89\x12\xf9o\x12B\xe9\
+\xb4`\x17\x07\xa5\xba\xde\xff\x00\x91UW\xba\x9a\xfb/\
+\xb7\xa6\xfeG\xfa\x0a\x7f\xc1\x9e?\xb4\xdc\x7f\x15\xbf\xe0\
+\x9e\x7f\x11\xbfg\xedSP\xbf\xbd\xf1\x0f\xec\xc7\xf1\x8a\
+\xfa\xd6\xd4\x5c\xc5i\x05\x95\xa7\x81~)\xd9\xcd\xe2\x8f\
+\x0e\xdaiO\x14\xcdsp-\xfcA\xa6x\xc6\xe2\xfa\
+K\xa8\xa2[yom\x129d\xc9\x11\xff\x00\x5c\x83\
+\xa7\xf9\xeb\xdf\xd3\xf3\xef\xd6\xbf\xcc\x87\xfe\x0c\xe5\xf8\xfe\
+~\x1e\x7f\xc1B\xbe*\xfc\x0e\xbf\xbd\x86\x1d\x13\xe3\xf7\
+\xc0\xcdM\xac\xedn\xf5\x19\xe1\x8eo\x15\xfc9\xd6\xac\
+5\xcb\x14\xb0\xd3\xc4\x82\xd6\xf7P\xb9\xd0\xef\xf5\xb8K\
+\xc9\x1f\x9d\x15\xa4R\xf9nAe\x1f\xe9\xba\x9fuq\
+\xd3\x1cw\xfdGQ\xe9\xedQ?\x89\xfc\xbf$k\x19\
+s$\xef}\x11\xfc%\xff\x00\xc1\xe0?\xf0SO\x15\
+x\x0fN\xf8w\xff\x00\x04\xde\xf8M\xaek^\x1c\x9f\
+\xe2\x07\x87\xa3\xf8\xa7\xfbEj\x9af\xa75\x8aj\xfe\
+\x02\xbd\x9e\xefK\xf0O\xc3I\xa2\x82\xda)\xae\xf4\xef\
+\x10_Y\xeb:\xff\x00\x88\xd2=V\xda\x09-4\xcd\
+#N\xbe\xd3/\xed5\x07q\xfc\x0b\xf8\x13\xc0\xde3\
+\xf8\x9d\xe3O\x09\xfc9\xf8w\xe1\x9dg\xc6\xbe<\xf1\
+\xd6\xbf\xa5\xf8_\xc1\xfe\x11\xf0\xfe\x9fq\xabk\xde$\
+\xf1.\xb9y\x0e\x9f\xa5i\x1aF\x99h\x0d\xc5\xe5\xfd\
+\xed\xd3\xdb\xc5\x0c1!v\x91\xb2\xec\x90\xc0\xaf\x1f\xea\
+\x9f\xfc\x17\xb3\xe2n\xa3\xf1S\xfe\x0a\xed\xfbsk\x9a\
+\x8cQ\xc3&\x87\xf1\x8e\xf3\xc06\xf1\xc4\xe5\xb1\xa6\xfc\
+>\xd2\xf4\xcf\x07\xe9\xcep\xc1G\x9d\x0e\x90\xb3\xc8\x9b\
+[\xf7\xb2\xb18r\xee\xff\x00R\x7f\xc1\xad\xdf\x0at\
+\xdf\x89\xff\x00\xf0XO\x82WZ\xad\x96\x99\xa8\xdb|\
+/\xf0w\xc4\xaf\x89\xb1Zj\x96\xb1]\xc4u-\x1f\
+\xc3sh\xda=\xdd\xb4S+\x22_\xe9\xda\xae\xbbi\
+\xa8\xd8\x5c\x0d\x92[\x5c\xda\xa4\xf1H\x93$l)^\
+0\xbf\xcdz;\x1c\xf2\xb4\xe7\x15{\xa7'\xfa?\xeb\
+\xbf\xa9\xf5m\xb7\xfc\x19\xd7\xff\x00\x054\xb8\xf8]\x07\
+\x8e\x9b\xe2\x17\xec\xcde\xe3i|<5\xa9>\x0e\xcf\
+\xe3_\x19\xb7\x8b\xa0\xbe\x92\x0f\xb4/\x85\xe7\xd7\xe2\xf0\
+\x14\xbe\x06\x8fY\x1f=\x9c\xb7P\xf8\x82\xebG[\xa0\
+\xf2\xc5}*\x96W\xfeW\xbc}\xe0?\x18\xfc-\xf1\
+\xc7\x8b\xbe\x1b|C\xf0\xf6\xa3\xe1/\x1d\xf8\x0b\xc4z\
+\xc7\x84|_\xe1\x8dZ\x11\x0e\xa5\xa0x\x87\xc3\xf7\xf3\
+iZ\xae\x97x\x8aZ?2\xd2\xf6\xdeX\x16h\x9d\
+\xed\xae\x82\x09\xadd\x96\x17G?\xef\x1a\xb1\xeeB:\
++\x12J\xb0\x09\xc9\x00g\xcbe\xf9r\x09\xfb\xca\xcf\
+\xc2\x92\xc4\xf3_\xe4[\xff\x00\x070\xfc3\xb0\xf8e\
+\xff\x00\x05\x90\xfd\xa9\xad\xf4\xad\x1e\xcbF\xd3|k\x1f\
+\x80>#Ak\xa7\xaf\x95oyy\xe2\x9f\x04h\xd2\
+\xeb\xfa\xac\xe8@\xddu\xa8x\x92\xd7Y\xbf\xbc\x9b>\
+[<\xee\x5c\xc2\xe6\x9cd\xdb\xb3\xed\xfeC\xa9N0\
+\x8bj\xf7v\xeb}4?\xa2\x7f\xf83\xcb\xfe\x0a;\
+\xe3O\x1c\xd9|S\xff\x00\x82v\xfcV\xf1\x16\xa1\xaf\
+Y\xfc>\xf0\xcc_\x15\xbfgk\x8dR\xed\xee\xa7\xd0\
+\xfc)m\xa9\x0d3\xe2\x07\xc3\xfbye\x89\xee&\xd2\
+l/u\x8d\x13\xc4:\x1c-s\x15\xb6\x92\xb2k6\
+\xd0\xc2\xe2\xf25\x87\xf4K\xfe\x0f\x08\xff\x00\x94M\xe9\
+\xde\xdf\xb4\xe7\xc2_\xfd5x\xd4\x7fZ\xfe0\x7f\xe0\
+\xdao\x8bR|'\xff\x00\x82\xc6\xfe\xca\xf2K\xad\xde\
+h\xdaW\xc4+\x9f\x1b|.\xd6\x12\xd8\x06Mj\x1f\
+\x18\xf8GW\xb7\xd14\x9b\xa8\xcf&\xde\xe7\xc56\x9e\
+\x1f`\xf1\xe0\xb4\xb6\xa9#\x02T)\xfe\xcf?\xe0\xf0\
+s\x9f\xf8$\xe6\x9c0\x7f\xe4\xe7>\x12\xf3\xc7_\xec\
+\xaf\x1b\x028=z\x1fpx\xefJ_\x1c~_\x99\
+q|\xd4\x9aZ\xb5\x19}\xed\x1f\xe5\xc8X\xa9R1\
+\xc3\x06\xc1@FR@\xcb\xc999`\x1b\x18\xc2\xec\
+\xdd\xc98\xaf\xa8>?~\xd7_\x16?hO\x00\xfe\
+\xcf\x1f\x0b|]\xac\x5c\xdb|3\xfd\x98\xfe\x16\xe9\xff\
+\x00\x0c~\x16\xf8.\xde\xfeyt]$\x0b\x9b\xadG\
+\xc4\xde'x\xccp\xda\xcb\xe2\x1f\x15j\xb7E\xef\xa7\
+\x92\xd9\xa6\x8bI\xb5\xd2\xb4S+\x8ba=\xdf\xcb\xc4\
+d\xfe8\xfc\xd9\xab\xfbU\xff\x00\x83]\xbf\xe0\x88\xdf\
+\x04\xff\x00kO\x09x\xc7\xf6\xeb\xfd\xae|+\xa3\xfc\
+K\xf8u\xe1\xff\x00\x15_|8\xf8/\xf0\x7f_\xb3\
+\xbb\xb9\xf0\xf6\xb5\xe2=\x12\xde\xd2\xfb\xc4\xfe?\xf1\x95\
+\xa3Im\x0e\xb1\xa6\xe92j:~\x93\xe1\x1d\x15Z\
+\xe2\xc6\xf3T\x1a\xcd\xee\xa4\xb1\xcd\xa6i\xa9%\xb6\x96\
+\xfa\x18F\xf2\xf7c\xb3\xb73\xed\xb5\xff\x00%\xdf\xe7\
+\xb1\xfck|;;\xbe \xf8\x00.Io\x1cxI\
+T`\xe5\x98x\x8bN\x04(\xc7\xccs\xd9s\xeb\xd2\
+\xbf\xd7\x8f\xfe\x0b\xf7\xff\x00\x05\x17\xd6?\xe0\x9b\xdf\xf0\
+Oo\x1e\xfcK\xf8y\xaa\xdai\x9f\x1d>%\xeav\
+\xdf\x08\xbe\x09O8\xb4\x9a\xe3J\xf1w\x89,o\xee\
+5\x0f\x17\xdbX^\x5cD/$\xf0g\x87lu=\
+v\xddZ\xdbP\xb5]J\x0d4j\x16SX\xbd\xc0\
+\x1f\xa5z\x0f\xec\x8b\xfb)\xf8KO\x83N\xf0\xbf\xec\
+\xc9\xfb=\xf8oO\xb1\x22[K\x0f\x0f\xfc\x17\xf8s\
+\xa3Y\xdb:\x10\xe1\xad\xed\xb4\xef\x0e\xdbE\x0c\x81\x86\
+cx\xd5\x0a8W\x1c\xad\x7f\x09\xbf\xf0z\xaf\xc7\xd5\
+\xd4\xbe1\xfe\xc6_\xb3\x06\x97\xae\xdey>\x0a\xf0/\
+\x8f>3x\xd7\xc3\x0a\x0f\xf6\x7f\xdb\xfce\xaci^\
+\x13\xf0\x0e\xb6\xcc\xd1yr\xde\xa5\x97\x85\xfc}g\x19\
+p\xe0C$\x81\xe3\xc4\x99\x18\xc7u\xea\x8d\xd4}\x94\
+%g\xb5\xbf\x0f\xbc\xfe#<G\xe2\x1d{\xc5\x9a\xf6\
+\xbb\xe2\xbf\x15\xeb\x1a\x97\x88|G\xe2\x0dKP\xf1\x07\
+\x88\xbcA\xac\xddO\x7f\xaa\xea\xfa\xce\xa7s-\xf6\xab\
+\xa9\xeaw\xf7\x0f-\xcd\xe5\xf5\xed\xec\xf3\xdc\x5c\xdd\x5c\
+\xc8\xd7\x13\xdcH\xed)\xf3X\xa0\xfe\x84\x7f\xe0\x9f\x1f\
+\xf0l\xcf\xed\xfb\xff\x00\x05\x04\xf8\x15\xa2\xfe\xd1\x9e\x1f\
+\xd6\xfe\x11|\x0d\xf8k\xe3\x04k\xaf\x87\xb3\xfcf\xd5\
+\xbcYc\xafx\xebF\x86ia\xff\x00\x84\x93G\xd0\
+|%\xe0\xff\x00\x13\xdd\xdahSM\x14\xd1i\xb7\xda\
+\xcb\xe9\xad\xaa\xc1\x0c\x97\x961\xcbd\xf6\xf7R\x7f=\
+\x1a.\x9b&\xb1\xad\xe8z<N#}[V\xd2\xf4\
+\xb8\x9f\x81\xe5\xcf}}\x05\xa4N\xaf!`\x02=\xc2\
+\x1c\x1c\xb0\xf2\xc3#\xc5\xbd\xab\xfd\xd2\x7fgo\x84\x1a\
+W\xc0O\x80\x9f\x05\xfe\x0a\xf8~\xda\xc2\xc3J\xf8S\
+\xf0\xc3\xc0\xbf\x0f\xed\xed\xf4\xebH,\xec\x9f\xfe\x11?\
+\x0di\x9a,\xd70\xdbZEo\x04owqg5\
+\xe4\xc5b\x0d-\xc4\xed#\xbeK\x06\xd2{|\xff\x00\
+FgJ*JM\xef{\x7f\xc3\xae\xdf\x99\xfe-\xff\
+\x00\xb7\x87\xec%\xf1\xfb\xfe\x09\xcf\xfbC\xeb\xff\x00\xb3\
+o\xed\x1b\xa1\xe9\xfaO\x8d\xb4\xbd2\xc3\xc4z>\xa9\
+\xa0\xdf\xbe\xa5\xe1\x8f\x18\xf8;W\xb8\xd4-\xf4\xaf\x17\
+\xf8_S\xba\xb5\xb6\xb8\xbf\xd3n\xae\xac\xb5K<]\
+\xd9Y\xdd\xdb\xea\x167v\xb7\x96\xd6\xf2\xc2\xf0\xaf\xd1\
+\x7f\xf0F\xaf\xf8(\x87\x8a\xbf\xe0\x9a\xff\x00\xb7/\xc2\
+\xaf\x8d6\xba\x9e\xaa\x9f\x0a\xfcI\xacXx\x03\xe3\xd7\
+\x85\xac&\x22\x0f\x10\xfc/\xf1\x1d\xed\xb5\xa6\xafr\x96\
+Mumiw\xac\xf8M\x9e?\x13xd\xdc\xbc\x1b\
+5}&\x1bf\xbb\xb7\xb0\xba\xb9Y?\xae?\xf8=\
+k\xe0\xdf\x87.\xfe\x04~\xc6?\x1fb\xd3\x93\xfe\x13\
+\x1f\x0e\xfcZ\xf1\xaf\xc2\x89\xb5[th\xcc\x9e\x13\xf1\
+\x7f\x84\x1b\xc5F\xce\xfd\x91\xb1t-\xb5\x9f\x07YI\
+\xa6\xb5\xc6\xe3dou%\xb7\x0a/\xee\x01\xff\x00<\
+R\xa1\xc1F]\xca\xdfyI\xda\xa5G-\xb8\xf2@\
+\xc6y\x00\xb2\xfd\xe5V`\x05(\xa6\xe2\xd2\xd5\xde\xf6\
+\xf2\xd3QiN\xa2\xe6\xf7SJ\xd7\xf5\xefw\xff\x00\
+\x00\xff\x00y=O\xc5\xde\x1b\xd2<\x1d\x7f\xe3\xfb\xad\
+gK\x9b\xc2zg\x87.\xfcU&\xbfkyj\xfa\
+L\xbe\x1d\xb4\xd3\xdfV\x9bT\xb7\xd4\x9a\xe6[)\xec\
+g\xb0As\x0d\xd2]\x0bY\xa20\xcb\xe7\xb4{d\
+\xaf\xf1T\xff\x00\x82\x8f~\xdc\x1f\x11\xbf\xe0\xa1\x9f\xb5\
+\xf7\xc6\x0f\xdac\xc7\xfa\xce\xaf}e\xe2\x9f\x12\xea\xf6\
+_\x0c\xf4\x0dR\xee\xe1\xed\xfc\x0d\xf0\xae\xcbR\xbd_\
+\x03xKL\xd3\xe6\xb9\xbc\x87I\x8bN\xd2\x1e\xde\xf3\
+Q\xb5\xd3\xeeV\xde\xeb\xc4\x17\xba\xc6\xa4\xe6k\xadB\
+{\xb6\xff\x00N?\x87\x1e$\xf1\xe7\xed\x07\xff\x00\x06\
+\xdbZ\xeaz\x0d\xb5\xde\xa9\xf1\x13\xc7\x1f\xf0K\xcf\x13\
+\xf8wE\xb1\xd0RK\xadB\xef^\xb1\xf8\x1f\xacx\
+WJ\xb2\xd3\xe0\xb3V\x95\xf59\x9e\xc2\x08\x22\xb6\x81\
+<\xe6\xbaq\x12\x07u\x0c\x7f\xc8\xd06\xe0\x0f\x04\x1e\
+\x84\x02\x06;`\x1001\x8c.\x06\x07\x03\x81J\x1b\
+\xfc\xbfTV\x22mA[\xcb\xf1\xbf\xf5\xe7s\xf4\xaf\
+\xfe\x09\xa5\xff\x00\x04\xa8\xfd\xab?\xe0\xaa\x9f\x14\xbcI\
+\xf0\xe3\xf6n\xd14\x0b\x1d+\xc0\xba]\x96\xb5\xf1\x13\
+\xe2\x7f\x8e\xae\xf5-\x1f\xe1\xe7\x82 \xd6n\xe6\xb5\xd1\
+-umgM\xd2\xf5i\xee<A\xad\xbd\x8d\xf4\xba\
+7\x87\xb4\xcd6\xe7S\xd4\xad\xf4m_PK4\xb1\
+\xd3on \xfbk\xfe\x0aS\xff\x00\x06\xe3~\xdc\xbf\
+\xf0M\x1f\x81\xe7\xf6\x89\xf8\x89\xe2?\x83\xdf\x17\xbe\x14\
+i\xba\xb6\x97\xa3\xf8\xc3Z\xf8I\xaa\xf8\xb6\xea\x7f\x03\
+K\xad\xdeE\xa7h\xb7\xde\x22\xd2\xfc]\xe1\x0f\x0d]\
+\xa6\x91\x7f\xa8\xcdo\xa6\x9dONk\xab[MF\xe3\
+O\x86\xe1\x14\x5c\xa1\xaf\xd9\xbf\xf83W\xf6\xd0\xf8\x07\
+\xf0\xcfZ\xfd\xa5?d/\x88\x1a\xdf\x87<\x09\xf1s\
+\xe3'\x88\xbc\x05\xe3\xdf\x85z\x9e\xb3um\xa67\xc5\
+\x15\xf0\xe6\x97\xe2\x1d\x0fX\xf0\x1d\xa6\xa3y$0\xdc\
+\xf8\x97CmB\xd3U\xf0\xd6\x81\x1c\x93^j\xd6z\
+\x8f\x89'\xb4\x8a#b\xd1\xcf\xfd\xb0~\xdf\x9f\xb3t\
+\xbf\xb6?\xecW\xfbN\xfe\xccvG\xc2\xf0\xeb_\x1a\
+\xbe\x0b\xf8\xfb\xc0\xfe\x15\xd4\xbcl.[\xc2\xda\x17\x8d\
+5M\x06\xf5<\x13\xe2ma\xec,\xb5K\xf8-|\
+3\xe2\xc4\xd2<@\xb7\x96\x1am\xfd\xe5\xac\x9aX\xba\
+\xb3\xb5\x9a\xe2\x18\xd0\x8an\xfa\xff\x00[k\xfdw+\
+\xd9\xa7\x18\xad\xedk\xbb\xf9v\xdf\xee\xeb\xbb?\xc4?\
+K\xd4\xf5\x1d\x0bQ\xb1\xd6t\x9b\xeb\xed+Z\xd2o\
+m\xb5\x1d/R\xb1\xb8\x9a\xcbS\xd3\xb5+;\x85\xba\
+\xb4\xbd\xb6\xbb\xb71\x5cZ_Y\xcd\x0cr[\xdcC\
+(x\xaeq2\xc6\xbd\x07\xfb3\x7f\xc1\x16\xff\x00k\
+_\x12\xfe\xdb\xbf\xf0M\x1f\xd9o\xf6\x84\xf1\xb5\xfd\xf6\
+\xad\xe3\xfdo\xc0\xf3\xf8S\xe2\x06\xb9\xa9Co\x05\xde\
+\xbf\xe3\x7f\x87:\xbe\xa5\xe0_\x11x\x86K{[\xbb\
+\xa5-\xaf_\xf8~MX\xca\xefoqs\xf6\xb5\x9e\
+H`i\x0ck\xfcT\xa7\xfc\x19e\xfb\x7f2\x82?\
+j?\xd8\xfb\x81\x82>\xdf\xf1\x94\x1c\xf5\x19?\xf0\xa9\
+\x9b'\x9c\x96\xe3?\xdd\xee\x7f\xb3\xef\xf8\x22\xb7\xec\x05\
+\xf1O\xfe\x09\xa5\xfb\x0axG\xf6W\xf8\xc1\xe3o\x03\
+\xf8\xfb\xc5\xfe\x1a\xf1\xb7\x8f|H\xda\xff\x00\xc3\xc9\xfc\
+Aq\xe1\x9f\xec\xef\x16\xeb?\xda\xb6v\x96\x8d\xe2m\
+\x0f\xc3\xda\x9aOl\xef;\x5c+i\xa9\x0f\x9b3\x98\
+\xa4\x901jsi\xa5m\x7f\xaf\xeb\xfaAIN7\
+MY^\xfe\xba[\xd7\xa1\xfep\x9f\xf0r\xef\xfc\xa6\
+\x87\xf6\xc2\xff\x00\xaf\xcf\x85\xdf\xfa\xa8\xfc\x0b_\x8c?\
+\x0b>+|F\xf8+\xe3\x1b\x7f\x88\x1f\x0a<]\xab\
+\xf8\x13\xc6\xf6\x9a/\x8a\xfc=\xa7\xf8\xa7@\xba\x93O\
+\xd6\xb4\xdd?\xc7\x1e\x16\xd6<\x13\xe2%\xd2\xf5(6\
+\xdd\xe9\x97\xd7\xde\x1c\xf1\x06\xadao\xa9i\xf3[j\
+vR]\x0b\x8d6\xee\xd6\xf68'\x8f\xf6{\xfe\x0e\
+]\xff\x00\x94\xd0\xfe\xd8_\xf5\xf9\xf0\xbf\xff\x00U\x17\
+\x81{\x7f^\xd5\xf9\x1f\xfb1|\x18\xd5\x7fh\xef\xda\
+;\xe07\xec\xfd\xa1^\xd9i\xba\xcf\xc6\xef\x8b\xff\x00\
+\x0e\xfe\x14\xe9\x9a\x86\xa7#\xc5\xa6X\xdex\xfb\xc5Z\
+_\x86`\xbb\xd4\xa4\x8e)\xe5K\x1bw\xd4\x84\x97&\
+8d\x90D\xacU$lF\xee\x0f\xdd~\xbf\xe4s\
+\xd5\xe6u9R\xd1\xc9t\xf4\xfe\xbc\xfau>\xfc\xfd\
+\x99\x7f\xe0\x85\x7f\xf0T\x9f\xda\xdb\xe0\xb5\x97\xc7\xdf\x81\
+\xdf\xb2\xaf\x88\xf5\xcf\x86\x1a\xd6\x98uo\x06k\x9e \
+\xf1O\x82|\x1b?\x8f\xec\x12\xe1\xedZ\xe3\xc1\xfa7\
+\x8a\xbcA\xa2j\xfa\x8e\x9ft\xe9,\xd6\x9a\xa5\xc8\xb2\
+\xd15H\xa02\xe9Z\x95\xf2`\x0f\xcc?\x88\xbf\x0e\
+\xbcu\xf0\x87\xc7\x9e/\xf8]\xf1;\xc2\xba\xef\x81\xbe\
+!\xf8\x07\xc4\x1a\x97\x85|e\xe1\x1f\x12\xd8M\xa6\xeb\
+\x9e\x1e\xd7\xf4\x8b\x97\xb5\xd44\xddF\xceeV\x8aX\
+%F\xda\xea^\x09\xa1\xdb=\xbc\xd3@\xcb+\x7f\xba\
+\xf7\x81<\x0b\xe1\x7f\x87>\x0a\xf0\xa7\xc3\xbf\x03h\xf6\
+\x1e\x1c\xf0_\x81\xbc7\xa3xG\xc2\xda\x06\x9f\x03G\
+\xa7\xe8\xfe\x1e\xf0\xf6\x9fk\xa4\xe9\x1am\xbcO#\xcb\
+\xe5Yi\xf6p\xda\xa1y\xdaG@L\xcf#\xe4\xb7\
+\xf9\xbe\xff\x00\xc1\xe5\x7f\xb3\x16\x89\xf0\xbb\xf6\xdf\xfd\x9f\
+\xbfh\xfd\x02\xcfG\xd2\xe2\xfd\xa6~\x0e\xeb\xda?\x89\
+\xed\xb4\xd8\xdd5-K\xc6\xff\x00\x02\xf5\xbd\x17O\xbe\
+\xf1F\xb2\xa5\xbc\x89\xa7\xd4|#\xf1\x13\xc1\x1a\x15\xb4\
+\xa8\xaad\x83\xc32\xc2\xf1\xc5 \x92\xf6\xe6\x1f\xbc\xdd\
+\xb5\xdb\xf4F\xd5)Y]tW\x7fr\xfd6]\x0f\
+\xce?\xf86\xf7\xf6\xe3\xd6\x7fc\x1f\xf8)\xe7\xc1\x8d\
+&\xe7X\xd4->\x15\xfe\xd3Z\xd6\x95\xfb?|I\
+\xd2b\xb9\x7f\xec\xb9n\xfcm\xa8[i\x9f\x0e\xbcE\
+}g-\xe5\x96\x9e\x1b\xc2\xfe:\xbb\xd2\xe4\x97S\xbb\
+i\x1fM\xd0u\x0f\x11L\x920+o'\xfa\xe5\xb6\
+B\x90\x09\x1brB\x92@`\xbb\xb7rv\xb1\x00\x10\
+\x0b\xee\x04\x1c1\x0d\xc2\xb7\xf8*h\xba\xb5\xd6\x83\xac\
+\xe9\x1a\xed\x94\xf3\xda\xdd\xe8\xba\xa6\x9f\xab[\x5c\xda\xcf\
+-\xad\xcd\xbc\xdau\xdc7\x91\xcdou\x01\x13[\xcf\
+\x1bB\x1e)\xe2>dR\x05\x91>e\x02\xbf\xddS\
+\xe0\x8f\xc4q\xf1\x9b\xe0o\xc2?\x8b\xd0\xd8\x7ff\x8f\
+\x8b\x7f\x09\xfc\x05\xf1\x22\x0d/\xce3\x0d9|y\xe0\
+\xfd3\xc5\x09c\xe6\x12L\xbfb:\xa8\x80\xcc\xb8.\
+\xa8\x09\x04 js\xdf\xe4<;n\x1e\x96\xef\xd8\xff\
+\x00$_\xf8/\xcf\xed\xc9\xe3\xaf\xdbg\xfe\x0aW\xfb\
+@\xdd\xeb>!\xd6.\xfe\x19\xfc\x07\xf1\xf7\x8b\xbe\x06\
+|\x1b\xf0\xa5\xcd\xc5\xe7\xf6?\x85\xbc?\xe0-]\xbc\
+3\xe2;\xfd3L\x96\xeek;-K\xc6>'\xd0\
+\xaf\xf5\xadz\xfe\x08\x85\xce\xab\xbe\xc2)\xee%\xb1\xd2\
+\xf4\x9b;\x1f\x94\xff\x00\xe0\x9c\xdf\xf0M\xbf\xda?\xfe\
+\x0a\x7f\xf1\xd6\xeb\xe0'\xec\xe1k\xe1\x8b}cB\xf0\
+\xb4\xde4\xf1\x97\x8a\xfco\xab\xddh\x9e\x12\xf0w\x84\
+\xa1\xd4\xb4\xfd\x1amgV\xb9\xb2\xb2\xd5\xb59\xcc\xb7\
+\xba\xa6\x9digg\xa7iwWWO$@\xc6\xca\
+ZH\xbf\xa1\xef\x8b\xdf\xf0hw\xfc\x14\xcb\xe2O\xc5\
+\x9f\x8a?\x11c\xf8\xa9\xfb-\x18\xfc\x7f\xf1\x1b\xc7>\
+6C{\xe3\x9f\x1d%\xe3'\x8a\xfcQ\xaa\xeb\xc8\xd7\
+J\xbf\x0e\xe5U\xb9d\xbfS8YdQ)`\x1d\
+\xb1\x93\xfd\x16\x7f\xc1\xb9\xff\x00\xf0F\xaf\xda;\xfe\x09\
+.\x9f\xb5\xcc\x9f\xb4o\x88>\x11x\x9bQ\xf8\xe9'\
+\xc0\xd8\xbc\x11\x7f\xf0\xcfV\xd6\xb5\xd9\xb4\xbbO\x87\x9f\
+\xf0\xb7\x1b\xc5\x16\xba\xc5\xc6\xb7\xe1\xaf\x0fOim\xa8\
+\xddx\xd7\xc32\xda\xdbX\xb4\xc9w6\x9f4\xb7&\
+7\xb3\xb6\x91\xdf5\xa2\xac\xf5\xf4\xdb\xfa\xdb\xccN\x93\
+\x95G\xcd~^\x9ez\xa7\xfd7\xaf\x9e\x87\xf2\x07\xfb\
+v\x7f\xc1\xae\x9f\xf0P/\xd8o\xf6}\xf1\x97\xed#\
+\x7f\xe2\x8f\x83?\x1d\xfc\x0d\xf0\xe2\xc2\xeb\xc4?\x114\
+\xef\x83Z\x87\x8e\xaf|Y\xe1/\x08X\xc3\xe7\xea\xbe\
+/\xba\xd1|M\xe0\xaf\x0f\x7fh\xf8\x7fA\xb5F\xbf\
+\xd7\xa7\xd3d\x9em\x1bH\x82\xf3Y\xbb\x8e\xdfJ\xb1\
+\xbd\x96\xdf\xf9\xb2?/9\x1e\x9b\x81,\x15\xb2\xc0n\
+\xd8x%\x95\xb0\xa5\x91\x9bc\x158RG\xfbo\x7f\
+\xc1G~6|\x1a\xf8\x05\xfb\x0c\xfe\xd4\xbf\x12\xfe>\
+\x5ci\xeb\xf0\xc7M\xf81\xe3\xed']\xd1\xf58\xad\
+\xa7O\x19K\xe2O\x0ej>\x1d\xd2|\x05ckv\
+\x1a\xdfQ\xd5|g\xaajV\xbe\x1a\xb0\xb1\x99\x1a6\
+\xbb\xd4\xa37K\x1d\xaa\xcb2\xff\x00\x89\x02}\xc5$\
+);\x14n\x07 \x806\xaa\xf2K6\xcd\x8e\x15\xb2\
+\xea\xc8Q\x80Dt2T[k^\xff\x00\xa2&\xb4\
+\x14$\x94{k\xda\xff\x00#\xfdP\xff\x00\xe0\xd3\xdf\
+\xdbO\x5c\xfd\xa8?\xe0\x9b-\xf0\xa7\xc7Z\xf9\xd7~\
+!~\xc9\x1e?\x9f\xe1\x22=\xee\xa3s\xa8\xebW?\
+\x0a\xf5]\x1fN\xf1\x1f\xc2\xcdB\xf9\xe7Q\xf6k;\
+\x18\xae<K\xe0M&\xda\x19.\x16=7\xc0P\xc9\
+#C\xe6$U\xfa?\xff\x00\x05\xa1\xff\x00\x82\x82\x1f\
+\xf8&\xa7\xec\x0f\xf1\x83\xf6\x87\xd0\xd2\xde\xef\xe2}\xec\
+6\x9f\x0d\xfe\x0a\xd9^\xc7\x05\xc6\x9c~*x\xd0\x5c\
+\xd8\xe8:\xce\xa9kq\x1c\xb1\xdeh\xde\x12\xb7\x82\xff\
+\x00\xc5\x1a\xb6\x9d*\xf9\x1a\x8d\xb6\x8a\xba[M\xa7\x7f\
+i5\xda\x7f2\x7f\xf0d\x03\xc8\xda'\xfc\x14\xae-\
+\xff\x00\x22\xea\xdf\xb2,\x81H8\x05\xec\xff\x00iD\
+\x93\x0a\x1c&J\xc6\x83qRO\x05\xb2\x11V\xb3\xff\
+\x00\xe0\xf6_\x8e\xb7\x90\xc5\xfb\x0a~\xcd\x1af\xb2\x8b\
+cyq\xf1s\xe3\x97\x8c\xf4(\xe2\xb7i\xd2\xff\x00\
+K\x8b\xc2\xbe\x03\xf8k\xa9\xfd\xa0\xa7\xda\x16\xd5\xed\xb5\
+\xaf\x8a\xd6\xa6\xd4\xf9p]\xbc\x0a\x5c\x97\x88<Q$\
+\xdc\x9d\xbc\xbf$m\x06\x958\xb6\xec\x92\xd4\xfe\x13\xbe\
+!|C\xf1\x9f\xc5o\x1cx\xaf\xe2g\xc4\x8f\x13k\
+^5\xf1\xf7\x8e\xf5\xfdW\xc5\x1e2\xf1_\x88\xaf\xe4\
+\xd4u\xad\x7f^\xd6.\xde\xf3P\xd4\xf5\x1dB\xe5%\
+g\x9ef\x9eRdH\x12\x05\xe21i\x14\x16v\xeb\
+'\xeb_\xfc\x13\xeb\xfe\x08%\xff\x00\x05\x0e\xff\x00\x82\
+\x92|3\xba\xf8\xd9\xf07\xc0~\x11\xf0\xd7\xc1\xf1\xa9\
+\xdei\x1a7\xc4\x1f\x8a\xbe*\xff\x00\x843H\xf1\xae\
+\xa1\xa6\xcb=\xb6\xaf\x17\x83ma\xb4\xd6u\x9dsO\
+\xd1\xafm\x9bO\xd4\xf5\xa8l,\xf4h\xb5\x16\xb8\xd2\
+l\xaf\xefo\xac5(\xb4\xef\xc6(\xd0\xca\xeb\x18m\
+\x85\xd8(|gk\x1e\x01\xc0e$\x83\x8c\x00\xcas\
+\xd1\x94\xe1\x87\xfb\x8c\xfe\xc5\xdf\x02\xec?gO\xd9\x13\
+\xf6j\xf8\x0d\xa7\xd9i\xfa|\x7f\x0b~\x07|2\xf0\
+^\xa1k\xa7\xdb\xbd\xbd\x94\xfa\xde\x89\xe1\x1d2\x0f\x11\
+\xdf%\xbc\x8c\xf2\xc2\xfa\x9e\xbe\xfa\x9e\xa3p\x92\xbc\xa5\
+\xa5\xbdb\xfd\x1a3r\x95\x97\x9fo\x99\x958\xfbE\
+y}\xfe\xb6\xea\xbf?\xf3?\xc6{\xf6\xda\xfd\x86\xff\
+\x00h\xdf\xf8'\xbf\xc7mO\xf6w\xfd\xa7<\x1a\xbe\
+\x12\xf8\x85g\xa3X\xf8\xa7L\x92\xc2\xfa\x1dg\xc3~\
+-\xf0\x8e\xa7=\xfd\x96\x9b\xe2\xdf\x09k\x96\xcb\x1c\x1a\
+\xd6\x83uy\xa4\xea\x9a{],\x16\xb2\xdajZ^\
+\xa7\xa5\xde\xdaZ^i\xd70G\xf6\xe7\xfc\x10\xbb\xfe\
+\x0aY\xae\xff\x00\xc14\xff\x00n\xcf\x87~<\xd5|\
+A\xa8Z\xfc\x00\xf8\xa9\xaa\xe8\xdf\x0d\x7fh\xcd\x02\x1b\
+\xdb\xd1\xa4\xcf\xe0]b\xf5\xec\xf4\xef\x1d\x5c\xe9\xd6\xa9\
+r\x97\xda\xaf\xc2\xfdOP\x9b\xc5zj\xc5as\xa9\
+\xcd\xa5\x7f\xc2K\xa0\xe9\x92\xda\xcd\xe2g\xb8\xb6\xfe\xad\
+\xff\x00\xe0\xf5\xff\x00\x84\xfe\x16\xba\xfd\x9b?b\xff\x00\
+\x8e\x12X\xc0<g\xe1\x7f\x8e~2\xf8Ym\xa8,\
+#\xcf\xb8\xf0\xc7\x8f|\x01y\xe2\xfb\xeb+\xc7\x0a^\
+\xf2\xde\xcbU\xf8k\xa7\xddX\xdb\xddH\xe9l\xd7z\
+\x99\xb60-\xf5\xebI\xfevD\x85;HpW!\
+\x99\x81g,\xad\xb4\x13\xc0\x0cDcpl\xf3!\xc8\
+\x01qR\xa4\xdd\xd3ii\xbf\x9e\x8b\xfe\x0f\xfc\x02e\
+M\xc6KM\x1b\xd1\xfc\xef\xdf\xb7~\x87\xfb\xde\x5c\xdc\
+Co\x04\xd7\x13:\xc4\x90\xc4\xd2K#\xb7\x97\x1ch\
+\x8aY\xd9\xe4#b*\x04%\xdf?\xbbQ\xb9\x8a\xf0\
+k\xfcc\xbf\xe0\xb0\x7f\xf0Q\xdf\x1e\xff\x00\xc1K\x7f\
+m\x1f\x89\xbf\x19u\x7f\x12\xeb\x97\x7f\x07\xbc7\xe2/\
+\x10xG\xf6t\xf0]\xf6\xa1v\xda'\x83>\x14\xe9\
+\xf7\xcbo\xa4\xdd\xe9:-\xc5\xad\x94zn\xaf\xe3k\
+k\x0b/\x14x\xa6\xe4Y\xc3\xa8\xdf^\x5cYX\xdf\
+\xbd\xd4:.\x9d\x22\x7f\xa2g\xed\x8b\xfbG\xf8\x93\xc1\
+?\xf0l\xd7\x88\xbe7\xbd\xd6\xa1\xabx\xaf\xc5\x9f\xf0\
+N\x1f\x84>\x11\xd4\xf5Y\xef]\xf59\xf5o\x8d\xdf\
+\x0f\xfc\x07\xf0\x8fZ\xf1\x0c\xb7\xb2K\xe7\xb5\xf4sx\
+\xe2\xfb[3\xf9\x92\x5c=\xc4n\xe5\xa5\x9b9\xff\x00\
+&\xb4RJ\x84E\x0c6\xbc\x825\x94\x16\xf2\xc1\x90\
+\xe3k\xb30R\x5c\x86`\x80F331fp\xe1\
+\xb7\xcf\xf4F\x95\x9a\xb2]w\xfcQ\xfa7\xff\x00\x04\
+\xd2\xff\x00\x82[\xfe\xd4\x7f\xf0T\xff\x00\x8b\xde \xf8\
+U\xfb7i~\x1f\xb3\xb5\xf0F\x8bk\xe2\x1f\x88\xbf\
+\x12\xbcsw\xaai\x7f\x0e\xfc\x07\xa6jWRXi\
+0\xeb\xba\xc6\x91\xa5kW\xaf\xac\xeb\xd7\x11^\xae\x85\
+\xe1\xfd+O\xbd\xd65h4\xcdb\xf6\x1bo\xb2h\
+\xb7\x97\x10}\xbb\xff\x00\x05,\xff\x00\x83s\xbfnO\
+\xf8&g\xc1h\x7fh_\x88Z\xf7\xc2O\x8b\xff\x00\
+\x09\xec5\x8d3D\xf1v\xbb\xf0kV\xf1m\xe5\xe7\
+\x81\xa4\xd6o\x16\xcfG\xbf\xf1\x1e\x91\xe2\xdf\x07\xf8b\
+\xf8h\xd7\xfa\xa4\xb6\xfaC\xebZ\x5cZ\x85\x9d\xa6\xa3\
+\x7f\xa3\xdb]Gi%\xd4\x05\xbf\xafO\xf83\xab\xe0\
+\xde\x93\xe0\x9f\xf8&_\x8e\xfe)\xff\x00fi\x03\xc4\
+\x9f\x1a\xbfi?\x1a\xea\x17z\xfc\x16\x90\xa6\xb5\x7f\xe1\
+o\x00x{\xc2\xde\x0e\xf0\xe6\x87\xa8\xeaa~\xd3u\
+\xa7\xe8z\xec>7\xd4\xf4\xab6\x9aK{9\xbcQ\
+\xaa\xcf\x07\x95.\xa3z\xb2~\xf7\x7f\xc1J\xbe\x0eX\
+\xfc~\xff\x00\x82}\xfe\xda_\x07\xef\xb4\x8d;Z\xb9\
+\xf1\xc7\xec\xc9\xf1\xa3N\xd0\xadu+\x13\x7fe\x07\x8c\
+\xad\xbc\x07\xaej\xbe\x05\xd6\x96\xd1\x0a3\xdex{\xc6\
+\xba~\x87\xafi\xd2\xa3\xac\xd6\xfa\x8e\x9dis\x14\x89\
+$Q\xba\xa9I\xa9={i\xf2\x1c(\xc5\xc5I\xf5\
+Z\xea\xba\xf9o\xa6\xc7\xf8\xaa|;\xf8\x85\xe3\x8f\x84\
+\xde8\xf0\x9f\xc4\xbf\x86~*\xd7|\x0f\xf1\x07\xc0\xfa\
+\xf6\x9b\xe2_\x08x\xbb\xc3:\x85\xce\x97\xafh:\xfe\
+\x97r\x97\x1a~\xa3\xa6^\xda2\xcf\x15\xcc3\xa2\xe2\
+4$\x5c\xa1{Y\x12H\xe6h\xdb\xfd\x9f\xbf\xe0\x96\
+?\xb6\x17\xfc7\xc7\xec\x0b\xfb5\xfe\xd4wW6\x8f\
+\xe2o\x88\x1e\x00\xb3\xb4\xf8\x82-\xad-\xed\xad\x13\xe2\
+w\x84'\x9f\xc2?\x11\x85\x9d\xb7\xd9\xedb\xb5\xb3\x93\
+\xc6Z.\xb3=\xad\xa5\xb4f\xd6\xd2\x09\xa3\xb5\x86Y\
+\x84&W\xff\x00\x14\xe5\xda\xe4\x03\xf3#\x90\xb8\x0d\xb7\
+\xcc\x0cv\xec\x0f\x86\xd9\xbf;\x03\xb28]\xdb\x8cr\
+\x00Q\xbf\xb9\x1f\xf87\x13\xfe\x0b\x0b\xf0\x1b\xf61\xfd\
+\x82|a\xf0G\xe3\xe7\x89<U&\xb3c\xfbJ\xfc\
+A\xf1'\x82\xacl\xe3\xb6\x9a\xcfH\xf0/\x88\xfc\x05\
+\xf0\xa6\xedlm\x96ych\x16\x7f\x1a\xa7\x8duy\
+a\x1b\x97\xedZ\xa5\xc4\xd9S+F\x84\xd3ok\xe9\
+\xfd~\x7f\xd5\x8c\xe9I&\xf9\x9d\xaf\xfek\xfa\xbf\xf9\
+\x1f\xc3u\x14QZ\x18\x85\x14Q@\x05\x14Q@\x05\
+\x14Q@\x05\x14Q@\x05\x14Q@\x05!\xea>\xbf\
+\xd0\xd2\xd2\x1e\xa3\xeb\xfd\x0d'\xb3\xf4\x7f\x91K\xec\xff\
+\x00\x8b\xff\x00\x91?\xd93\xfe\x08\x19\xff\x00(v\xfd\
+\x80\x7f\xec\x83h\xdf\xfau\xd5\xeb\xf5\xf6\xbf \xbf\xe0\
+\x81\x9f\xf2\x87o\xd8\x07\xfe\xc86\x8d\xff\x00\xa7]^\
+\xbf_k\x03\xb5l\xbd\x17\xe4\x14QE\x03\x0a(\xaf\
+\xcb\xdf\xf8(\xff\x00\xfc\x15\xb7\xf6J\xff\x00\x82X[\
+\xfc$\xbd\xfd\xaa\xb5\x1f\x88v0|n\xbc\xf1\xcd\x9f\
+\x81\x17\xc0^\x0b\x9b\xc6\x06i\xbe\x1e[\xf8B\x7f\x10\
+\x8dS\xca\xbe\xb3:r \xf1\x9e\x88,\xf8\x9d\xee\xfc\
+\xdb\xd1\x1c'\xec\xa4\x90;\xf9+\xfe)~\xa7\xea\x15\
+\x15\xfc\xbe\xff\x00\xc4]\x7f\xf0H^\xda\xef\xed\x10=\
+\xff\x00\xe1J\xdc\x1c\x0e\xfc\x0f\x10\x03\xd3\xd0\xd6>\xb9\
+\xff\x00\x07{\x7f\xc1%\xb4\xfd2\xee\xf3I\x9f\xf6\x90\
+\xd7\xef\xad\xe2i-\xf4\x8bo\x83\xd1XO\xa8J\xa3\
++m\x0d\xde\xa7\xe2\xcbK($\x94\xe1Q\xee'H\
+\xd7;\x9bp\x05i\xd9\xbd\x93\xfb\x89\xe7\x8f\xf3%u\
+uv\x8f\xeaj\xbem\xfd\xaa\xbfk_\x80\xdf\xb1W\
+\xc1\xaf\x16||\xfd\xa4\xbe \xe8\x9f\x0d\xbe\x18\xf8F\
+8\xbe\xd7\xacj\xb33_j\xda\x8d\xd2\xb8\xd3\xbc7\
+\xe1}\x1a\x15}K\xc4\xfe(\xd5\xa5\x8d\xa2\xd34=\
+\x22\x09\xee\xe7\xc4\xd3\xc8\xb0\xd9\xd9\xdd\xdd\xc5\xfcQ~\
+\xd5\xdf\xf0z\x9c\xd7\xbe\x1d\xbf\xd0\xbfbo\xd9\x12\xfb\
+E\xd7\xefa\x8d-\xbe%~\xd2\xbe%\xb2\xbb\x87E\
+\x0c\xb2\xad\xf7\xd9\xbe\x15|<\xbah5+\xd8\xd0\x09\
+t\xfdJ\xfb\xe2\xbd\xb5\x95\xa5\xc4`\xea\x1e\x1d\xbf\xb7\
+-\x0c\x9f\xc77\xed\x85\xfb{~\xd7\x1f\xb7\xb7\x8eb\
+\xf1\xf7\xed[\xf1\xbf\xc6?\x16\xb5k\x1b\x8b\xd9\xf4\x0d\
+\x1fW\xbc[\x1f\x05\xf8?\xfbT\xdb5\xfc>\x0b\xf0\
+6\x99\x15\x8f\x85\xbc0\x9a\x80\xb2\xb1K\xb3\xa3i\x16\
+R]\xc5cb\xb7m(\xb5\x81c\xa5\x06\xfc\x89\xf6\
+\x90\xef\xf9\x7f\x99\xfa\x15\xff\x00\x05\xbc\xff\x00\x82\xcf\xfc\
+M\xff\x00\x82\xad\xfcox\xb4\x97\xd7\xbc\x11\xfb(\xfc\
+4\xd4\xee\x17\xe0\xbf\xc2\xbb\xdb\xb1\x11\xd4.\x04\x13Y\
+\x5c\xfcE\xf1\xbd\x9d\xac\xafe}\xe3=j\xdeYV\
+\x08\x8c\xf7\xb6\xbe\x17\xd2/_A\xd3\xee\xe2\xfb^\xa1\
+}\xa9\xff\x00\xa4\x0f\xfc\x10w\xf6~\xd2\xbfg\x0f\xf8\
+%\x0f\xece\xe0\xbb\x084\xe8\xef|W\xf0\x87A\xf8\
+\xc1\xaf\xdc\xe9\xadr\xd1j\x1a\xdf\xc5\xf8G\x8f\xeeo\
+\xa6\xfbR$\xc2\xeaK}r\xda\xde\xe4\x0c\xc0\x93Z\
+\xbcvl\xd6\xe9\x1e\xdf\xf1\xb4\x03\x1c\x0c\x01\x8c\x1c\xe5\
+QP6\xf6\xdd\x80\xdb#\x07/#\x04m\xa0\x17(\
+\xfbv\x9f\xf6\xd2\xff\x00\x82Z\xebZo\x88?\xe0\x9c\
+?\xb0\xae\xad\xa4\xdd\xd8_Y\xcf\xfb&|\x03\x87\xcf\
+\xd3^9m\x16\xe6\xcb\xe1\x97\x86l/\xadRHd\
+\x96?6\xca\xfa\xce\xe6\xd2\xea\x22\xfel7\x10\xbcR\
+\xa4L\x9bI=\x14R\xd9yv&\x93\xe6r\x97W\
+\xe7\xd1[K\x7fV>\xf6\x1cQE\x15\x06\xc1_\x8c\
+?\xf0p\xd9\xff\x00\x8d/\xfe\xdf~\xff\x00\x09to\
+\xfdY>\x075\xfb=_<~\xd5\xff\x00\xb3?\xc3\
+\x1f\xdb\x1b\xf6z\xf8\xa1\xfb3|g\xb5\xd6\xaf>\x17\
+\xfc]\xd0\xa1\xf0\xef\x8cm\xfc;\xabK\xa1kRi\
+\xb6\xba\xae\x9d\xaeF4\xfdV\x08\xa7\x9a\xcao\xb7i\
+V\x84\xcb\x1c27\x96\x1d6\x90\xe6\x9avi\xf9\x81\
+\xfcf\x7f\xc1\x92_\xf2\x22~\xdf\x9e\xfe4\xf8/\xff\
+\x00\xa8\xff\x00\x8c\x87\xf4\xaf\xee\xea\xbf'?\xe0\x99\x7f\
+\xf0H?\xd9\x8b\xfe\x09A\x0f\xc6{?\xd9\xa3\xc4\x9f\
+\x185}3\xe3\x8e\xad\xe1\xbdc\xc4:_\xc5O\x12\
+\xf8o\xc4\xb0\xe8\xb3\xf8B\xcfR\xb1\xd3\xa2\xf0\xec\xfa\
+7\x82\xfc-\xa8\xdb\xda\xcf\x1e\xaf;_\x8db\xebZ\
+r\xe2/\x22xB\xe5\xbfXS\xee\xafS\xc0\xeb\xc9\
+\xfcH''\xdf<\xd1'v\xd8\x96\x89.\xc8u1\
+\xba\xaf\xd7\xfc)\xf4\xc6\xea\xbf_\xf0\xa43\xfc\x9b\x7f\
+\xe0\xa4\xbf\xf2\xb3\x1f\x8b\xbf\xed!\x7f\xb3\xaf\xfe\xa6\x7f\
+\x09\xeb\xfdek\xfc\x9a\xbf\xe0\xa4\xbf\xf2\xb3\x1f\x8b\xbf\
+\xed!\x7f\xb3\xaf\xfe\xa6\x7f\x09\xeb\xfdej\xe7\xbf\xcb\
+\xf5fT\xf7\x9f\xaa\xfc\x82\x8a(\xa85?\x1d?\xe0\
+\xe0O\xf9Cg\xed\xff\x00\xff\x00dH\x7f\xeac\xe1\
+z\xff\x00\x1c*\xff\x00c\xdf\xf88\x13\xfeP\xd9\xfb\
+\x7f\xff\x00\xd9\x12\x1f\xfa\x98\xf8^\xbf\xc7\x0a\xae\x1b\xfc\
+\xbfTa_\xe0~\x8f\xf4\x10\xf4?C\xfc\xab\xfa\x95\
+\xff\x00\x83C\xbf\xe5,\xcb\xff\x00f\xef\xf1S\xff\x00\
+N\x1e\x14\xaf\xe5\xa8\xf4?C\xfc\xab\xfa\x95\xff\x00\x83\
+C\xbf\xe5,\xcb\xff\x00f\xef\xf1S\xff\x00N\x1e\x14\
+\xab\x9f\xc2\xfe_\x9a1\xa7\xf1\xc7\xd4\xff\x00SJ(\
+\xa2\xb1;F\xbb\x15Fe\x05\x88\x19\xc0\x19'\x1d@\
+\x19\x198\xce\x06z\xfa\xf4\xacd\xd7\xf4\xc95\x9b\x8f\
+\x0e\xae\xa3\xa76\xbbm\xa6[\xeb2\xe8\xcby\x09\xd4\
+\xe3\xd2\xee\xae\xee\xec-u)l\xf7\xfd\xa1,no\
+,\xaem!\xba\xf2\x8c-um<\x05\xc3\xaa\x86\xda\
+l\xe0\xe3\xb7<\xfbs_\xcb\x0f\xfc\x16\x9b\xfe\x0a\x22\
+\x7f\xe0\x9a\x9f\xf0T/\xf8&?\xc6?\x11jZ\x8d\
+\x9f\xc1_\x1ax/\xe2\xdf\xc3\x0f\x8f\x16\xb6r\x5c=\
+\xbax\x03\xc4~&\xf0\x9a\xaf\x89\xe6\xd3\xa2\x91R\xfa\
+o\x04\xeb\x09e\xe2\x08\xff\x00uqq\x15\x94Z\xaa\
+Y\xc5$\xd7M\x0c\xcd+\xe8&\xec\xae\x7fS\xaaI\
+\x19>\xa7\x1cc\x8e\xd9\x04\x92\x09\x1c\xe0\xe0\x8c\xe3\x14\
+\xea\xca\xd15;\x1doI\xd3\xb5\xad.\xf2=CK\
+\xd6,\xad5M6\xfa\x12\xc6\x0b\xbd>\xfe\xda+\xab\
+;\x98\x19\xd5]\xe1\xb8\xb7\x969\xa2wUvGR\
+\xc3vI\xd5\xa43\x03\xc4\xbe\x19\xd0|[\xe1\xfds\
+\xc3\x1e%\xd2\xac\xf5\xdf\x0fx\x8fG\xd54\x0d{F\
+\xd4\xa0K\xad?X\xd1u\xab)\xf4\xddSJ\xbe\xb7\
+\x93\x0b=\x95\xfd\x8d\xd5\xc5\xa5\xcc\x04\xaa\xcd\x0c\xcf\x1b\
+gu\x7f\x8e\x1f\xfc\x16\xb7\xfe\x09\xc9\xe2\x0f\xf8&\x7f\
+\xed\xcf\xf1\x0b\xe0\xf0\xd3n\xe2\xf8E\xe3k\x9dK\xe2\
+W\xc0-nX\xa5\xfb.\xa7\xf0\xcb[\xd5.\xda\xd3\
+H\x8e\xed\xb7\x09\xb5O\x07]\x19|3\xab\xaa\x17\xdb\
+-\x8d\xb5\xd3El\xb7\xa9n\x9f\xec\xb4@a\x822\
+\x0fPz\x1fc\xea=GC\xd0\xd7\xe1'\xfc\x1c\x1d\
+\xff\x00\x04\xc5\x7f\xf8)_\xec/\xae\xe8>\x02\xd1\xed\
+/?h\x7f\x82\x17w\xff\x00\x13\xfe\x08\xccm\xd8\xea\
+\x1a\xc5\xf5\xb6\x9ab\xf1_\x80-.!\x1fhG\xf1\
+\xbe\x8bi\x0d\xb5\x8cH\x97\x0b&\xbf\xa6\xe8D\xda\x5c\
+\xec\x113N\xcd?2'\x1ex\xb5\xd7\xa3\xed\xaa\xff\
+\x00#\xe3\x8f\xf84\x07\xc6\x9a6\xbd\xff\x00\x04\xa0o\
+\x0a\xd9_\xc1q\xab\xf8\x17\xf6\x86\xf8\xafe\xaeX\xa4\
+\xa2I\xf4\xe3\xafK\xa3\xeb\xbaZL\xb9\xca}\xa6\xd6\
+\xeaI\xa3\xdc\xab\x98\xc0!O,\x7f\xaa%\xe8>\x95\
+\xfe\x7f\x9f\xf0e\x97\xc7\xe9\xbc;\xe3_\xdbc\xf6@\
+\xf1\x17\xd9t}R\xfe/\x06\xfck\xd0\xb4\xbb\xdby\
+\xad\xb5\xd9\xb5_\x0fIu\xf0\xfb\xc7\xd6\x93B\xec\xc2\
+8\xf4X\xdb\xc2\xdfj\x86a\x1c\xf1\xcdy\xe6\xb2\x85\
+p\x07\xfa\x01 \xc2\xa8\xf4\x00\x7f\x9cg?^\xf4=\
+\xdd\xaf\xf3)+$\xbb$\xbe\xe4:\x8a(\xa43\xf8\
+h\xff\x00\x83\xdc\x98\x7f\xc2\x99\xff\x00\x82\x7f\xab\x1d\xa0\
+\xfcR\xf8\xe9\x93\xc6\x02\xb7\x84|\x00\x1c\x92J\x80B\
+\x82\xcb\x93\x86\xc3\x06d\x03'\xf9\xf7\xfd\x8d?\xe0\xe6\
+\xbf\xf8(/\xec7\xfb5\xfc0\xfd\x96\xbe\x0f\xf8'\
+\xf6i\xd4\xfe\x1d\xfc(\xd2\xaf\xb4\x9f\x0e_\xf8\xd3\xc0\
+^7\xd6|Muo\xa8\xeb\x1a\x86\xb94\xba\xae\xa3\
+\xa5|M\xd1t\xeb\x89\x96\xefR\x9d!kM.\xd1\
+\x16\xddbGY\xa4W\x9aO\xf5\x97\xb8\xb4\xb5\xba\xdb\
+\xf6\xabh.6n\xd9\xe7\xc3\x1c\xbb7m\xdd\xb7\xcc\
+V\xdb\xbbj\xe7\x18\xce\x06zUc\xa4i$\xe4\xe9\
+\x9ay$\x92I\xb3\xb79'\xd71\xf3V\x9c\x7f\x97\
+\xfa\xd3\xfa\xb7\xcb\xab2\x94&\xdbjI^\xdf\xa7\xf9\
+_\xfa\xd3\xfc\xc3\xbf\xe21\xdf\xf8*\x7f\xfd\x13\xef\xd8\
+\xf3\xff\x00\x0do\xc4\x8f\xfe|_\xd3\xd3\xf1?\xe21\
+\xdf\xf8*\x7f\xfd\x13\xdf\xd8\xf8\xfd>\x17|G\xcf\xeb\
+\xf1\x87\xfc;}k\xfd<\xbf\xb2t\xaf\xfa\x06i\xff\
+\x00\xf8\x05m\xff\x00\xc6\xa9\x0e\x91\xa5\x1e\xbaf\x9f\xff\
+\x00\x80V\xff\x00\xfcn\x8eh\xff\x00/\xf5\xa7\xdf\xfd\
+wa\xcbW\xfe~\xb7\xe4\xf6{o\xf8\xff\x00[\x7f\
+\x98w\xfcF9\xff\x00\x05P\x0c\xaf\xff\x00\x0a\xf3\xf6\
+@\x0a=~\x16|I!\xf0Ae\x0c\xbf\x18\x0a\x82\
+\x06\x06\xdf\x95\x9b\xcc\x5cK\x0e\x03\x1f\xcd\xbf\xf8!\x9f\
+\x88\xaf\xfc_\xff\x00\x05\xa8\xfd\x8c\xfcY\xaa\x8be\xd4\
+\xfcQ\xfbC\xde\xf8\x8fR\x16H\xd1\xd9\x8b\xfdv\xdb\
+\xc4\xda\xad\xe0\xb4\x8d\xe5\x9d\xe3\xb6\x17\x17r\x0bx\xde\
+y\xdd\x22\x08\xaf4\xac\x0b\xb7\xfb\x09\x9d\x1fI\x00\x91\
+\xa5\xe9\xe0\xe0\x8c\xfd\x8e\xdf\xa6\x0f\x1f\xea\xfarx\xf7\
+>\xb5\xfeD_\xf0G\xf0\x17\xfe\x0b\xe3\xfb;*\x80\
+\x15\x7fl/\x1e(\x00`\x005\x7f\x1b\x00\x00\xec\x00\
+\x18\x03\xb0\xa6\xa5\x15\xd2\xdf\xf0\xdd\xf7\xfe\xaf\xb9\x0e3\
+N\x1c\xcd4\xa4\xb6\xbft\xbb\x1f\xeb\xe1E!\xed\xf5\
+\xfe\x86\x96\xb3:\x02\xbf\x94\x0f\xf8<W\xfeQ_\xe1\
+?\xfb:\x1f\x86\x7f\xfa\x8ex\xea\xbf\xab\xfa\xfeP?\
+\xe0\xf1_\xf9E\x7f\x84\xff\x00\xec\xe8~\x1a\x7f\xea9\
+\xe3\xaa\x09\x9f\xc2\xfe_\x9a?\xcb\xda\x8a(\xae\x83\x81\
+\xed\xf3_\x9a\x22\x9f\xfdD\x9f\xf5\xcao\xfd\x00W\xfb\
+{\xff\x00\xc17\x7f\xe4\xc0?c/\xfb6\x9f\x83\x9f\
+\xfa\x83h\xd5\xfe!\x13\xff\x00\xa8\x93\xfe\xb9M\xff\x00\
+\xa0\x0a\xff\x00o\x7f\xf8&\xef\xfc\x98\x07\xece\xff\x00\
+f\xd3\xf0s\xff\x00Pm\x1a\xa2{/_\xeb\xfa\xbf\
+\xdf\xd3\xa6\x87_\x9f\xe8}\xa8\xff\x00t\xfe\x1f\xccW\
+\x83\xfe\xd2\x9f\xf2E>\x22\xff\x00\xd8\xbfs\xff\x00\xa1\
+\xad{\xc3\xfd\xd3\xf8\x7f1^\x0f\xfbJ\x7f\xc9\x14\xf8\
+\x8b\xff\x00b\xfd\xcf\xfe\x86\xb5\xf9\xaf\x8b\xff\x00\xf2j\
+\xfcD\xff\x00\xb23\x88\xff\x00\xf5[T\xfa~\x15\xff\
+\x00\x92\x9f\x87?\xecw\x96\xff\x00\xean\x18\xfcJ?\
+\xeb\x17\xeb'\xfe\x85\x1d~\xd4\xfe\xcc\x1f\xf2E\xbc\x11\
+\xff\x00`\xf7\xff\x00\xd2\xdb\xba\xfcU\xe9\x22\xff\x00\xbd\
+'\xea\xd1\x9a\xfd\xaa\xfd\x98?\xe4\x8bx#\xfe\xc1\xef\
+\xff\x00\xa5\xb7u\xfe@\xfe\xcc\xff\x00\xf9<<_\xff\
+\x00dn#\xff\x00Vx?\xf8'\xf5\xff\x00\xd2s\
+\xfeI,\x87\xfe\xc7K\xff\x00P\xeb\x9fCTR\x92\
+\x02\x9e\x00\xdc3\x9fB\x08\xee@\xc0$\x16\xc9\xfb\xa0\
+\xf7\xa9k\x9b\xf1\x87\x894\xef\x06\xf8W\xc4~/\xd6\
+\x0c\x83H\xf0\xae\x83\xac\xf8\x93T0\xae\xf9WM\xd0\
+\xf4\xdb\xadR\xf9\xa3BB\xb4\x8bkk+\x22\xb9\x0a\
+\xce\x15\x09\x1b\xb3_\xee\x19\xfcB\x7f\x93\xa7\xfc\x1d\x09\
+\xfbF?\xc7\xff\x00\xf8+\x87\xc6}\x22\xda\xfa\xd2\xef\
+\xc3\xbf\x00\xfc=\xe1\x1f\x82\x1a'\xd8/'\xb8\xb6[\
+\xad\x06\xc2M\x7f\xc4\xd2K\x14\xb2\xc9\x05\xae\xaa\x9e%\
+\xf1\x1e\xa5\xa7j&\xcd YF\x97k\xbd7G\x9a\
+\xfc\xea\xff\x00\x82V|=\xf8y\xf1G\xfe\x0a)\xfb\
+ \xf8[\xe2\xee\xb3\xe0\xcd\x03\xe1`\xf8\xdd\xe1\x1f\x12\
+|E\xd5>!x\xafN\xf0_\x85!\xf0o\x85/\
+\xd3\xc4\xfa\xe4w\xfe$\xd6.\xf4\xfb\x1b\x13%\xa6\x8e\
+\xf0\xda,\xb7\xf0=\xcd\xec\x91\xdb+\x92\xd9\xaf\x9b\xbf\
+i\xef\x8cW\xff\x00\xb4/\xed\x1b\xf1\xdb\xe3\x9e\xa7w\
+w\x7fs\xf1k\xe2\xdf\x8f\xfe -\xd5\xfcq\xc5y\
+-\x9f\x89\xfcM\xa8\xea\x9ao\xdaa\x8c\x98\xe1\xb8M\
+:\xe2\xd29\xe1BDR\xa3\xc7\x93\xb7'\xc2\xd8\x06\
+\xfb\xc07\x18\xe4g\xe5\xc1\x1by\xea\xbc\x9f\x94\xfc\xb9\
+$\xe3'5\xbc~\x15\xbe\xab\xfa\xf49%QF\xab\
+\x93\xb6\xea\xdf+.\xaa\xc7\xfb\x86\x1f\xdb\xf7\xf6\x10T\
+c\xff\x00\x0d\xaf\xfb%\x16\xc1a\x8f\xda?\xe0\xefP\
+8\xe3\xfe\x13 \x09\xe9\xc7\x5c\xe3\x1f6+\xfc\xbb\x7f\
+\xe0\xe5\xfb_\x85\x17\x9f\xf0U\xff\x00\x8b\xdf\x10\xfe\x0d\
+|R\xf8q\xf1g\xc1\xbf\x18\xfc\x15\xf0\xdb\xe21\xd7\
+>\x17\xf8\xa3\xc3\x1e/\xf0\xee\x95\xad\xbe\x85'\x84u\
+\x8d\x12mc\xc2z\x86\xa5\xa7>\xaa\xb7>\x14\xfe\xd5\
+\xbfY\xa7\x8e\xf5\xbf\xb5!\x92x\xdc\x9d\xf5\xf8\x0cy\
+\x04\x1e\x84\x10~\x86\x94\x92z\x92}\x89$\x0e\xa7\x81\
+\xd0\x0c\x92p02I\xeaMLb\xe2\xef\xe5\xfeE\
+:\xd1\x9cd\xb5\xd7E\xa6\xcbM\xf5\xdf}\xbbw?\
+D\x7f\xe0\x93?\xb4\xaf\xfc2?\xfc\x14g\xf6E\xf8\
+\xebw\xa8\xdfi\x9e\x1e\xf0\xb7\xc6_\x0a\xe9~4\x9f\
+N\xb4\x8e\xf2\xf2_\x03\xf8\xc2\xe2O\x0ax\xb6\xca\x18\
+dG\xdc\xd7\x9a\x1e\xady\x0e\xd8\xcaJC\x17\x89\xd2\
+H\x91\xc7\xfbZ !\x14\x1c\xe4\x01\x9c\xfa\xf7\xe3\xb7\
+\xd0p:\x0e1_\xe0y\x14\xb3A47\x16\xd2K\
+ou\x04\x895\xb5\xcd\xb9e\xb9\xb7\x9a\x19#\x969\
+\xe0(VA4.\xab$E\x1d]X\x16FR\xa4\
+\x9f\xf6\xd0\xff\x00\x82a\xfc\x7f\xb7\xfd\xa7?\xe0\x9f\x9f\
+\xb2\x1f\xc6\xd8\xeeV\xea\xeb\xc6_\x02>\x1e\x1di\x97\
+P\xfe\xd5t\xf1&\x8b\xa1[x\x7f\xc4Iy\xa8\x12\
+e\x9e\xf9u\x9d2\xf3\xfbD\xcb\xb9\xe3\xba\x12\x87%\
+\xb7\x133Z\xdf\xbf\xf9!\xd0zr\xebx\xaf\xeb\xfa\
+\xe9\xaf\x99\xfe<\x9f\xb7\xef\x8a/\xfck\xfbs~\xd8\
+^(\xd4\xe6\x92{\xed[\xf6\x97\xf8\xd7=\xcc\xb2\x16\
+%\xcc?\x115\xfb8\xb8vb\x0a-\xa3\x03\x83\x90\
+<\xbcc\x9a\xf3\x7f\xd9\xfb\xf6\x94\xf8\xf3\xfb*x\xf9\
+~)~\xce\x7f\x14\xfc]\xf0{\xe2\x1a\xe8\xf7\xfe\x1f\
+\xff\x00\x84\xbf\xc1:\x89\xd2\xf5\xa6\xd0\xf5W\xb7}K\
+K7A$\xff\x00C\xbd6\xb0y\xf1\x85\x05\x84k\
+\x86\x04\x03^\xd1\xff\x00\x05%\xf0M\xd7\xc3\x7f\xf8(\
+\x1f\xed\xa5\xe0\x9b\xd4\x09s\xa1\xfe\xd3\x9f\x1a\x22\x91\x00\
+\xdcT\xdd\xf8\xebY\xd4\xd7-\xd0\x07\x86\xfe\x07O\xf7\
+\x9f\xf0\xfd8\xff\x00\x83f\xff\x00f\x9f\xd9\xf7\xf6\xb0\
+\xff\x00\x82\x97\xd9|%\xfd\xa5~\x16xK\xe3\x0f\xc3\
+\x89\xfe\x07|L\xd7\xff\x00\xe1\x0e\xf1\xa5\x94\x97\xfa3\
+\xeb\xbaD\xda\x01\xd3\xb5/\x22)\xa0o\xb5Y\xc75\
+\xc8\x85\xfc\xcc(\x95\xfeRMh\xdd\x96\xabC\x18\xa6\
+\xe6\xd2\xb2i\xef\xb2\xfc6\xf4\xfb\x8f\x91\x17\xfe\x0b\x89\
+\xff\x00\x05rP\x00\xff\x00\x82\x81~\xd2\x18\x00\x0f\xf9\
+\x1d\x9b\xb0\x03\x81\xf6L\x0e\x99\xc0\xc0\xc98\x00q_\
+\x09\xfcz\xfd\xa2\xfe8\xfe\xd4_\x10\xae~,~\xd0\
+\xbf\x13\xbcW\xf1w\xe2E\xe6\x9d\xa6\xe9\x17^2\xf1\
+\x9e\xa0u-r}7HY\x97M\xb3\x92\xefdd\
+\xc5f\xb7\x13,\x1f.\xe8\xc3\x90\xac+\xfd}\x17\xfe\
+\x08G\xff\x00\x04|##\xfe\x09\xf5\xfb;\x11\x93\xff\
+\x002\xbd\xe7\xff\x00,\xfazR\xff\x00\xc3\x88\xbf\xe0\
+\x8f\xdf\xf4\x8f\xaf\xd9\xdf\xff\x00\x09k\xbf\xfeYT)\
+El\x9f\xdc\xbf\xcc\xd9\xd3\xa9-%%\xa7\xaf\xf9\x7f\
+_\x97\xf9g\x7f\xc1\x1a\xafd\xb1\xff\x00\x82\xae\xff\x00\
+\xc1<\xe4\x84\x94y\x7fkO\x836\x8c\xca\x00\xccw\
+~.\xb1\xb6\x91s\x8c\xe1\x92\xe1\xc1U!9?/\
+\xa7\xf7\xe3\xff\x00\x07\x83\x8c\x7f\xc1't\xe2{\xfe\xd3\
+\x7f\x09\x069\xed\xa4\xf8\xdb>\xd9\xe7\x19\xeb\x80+\xf5\
+\xd3\xe1\xcf\xfc\x11\xa3\xfe\x09m\xf0\x83\xc7\xbe\x0e\xf8\xa5\
+\xf0\xcf\xf6!\xf8\x17\xe0\xcf\x88_\x0f\xbcG\xa5x\xbb\
+\xc1^-\xd1|9so\xab\xf8o\xc4\xba\x1d\xdcw\
+\xbaN\xb3\xa6N\xd7\xf2,7\xb6\x17qGqo!\
+F\x0b\x22)*q\x8a\xfc\x8d\xff\x00\x83\xc2\x07\xfcj\
+sN>\x9f\xb4\xe7\xc2_\xd7J\xf1\xaf\xff\x00Z\x95\
+\xd3\x92z\xf4\xfc\xcb\x8c9!+\xbb\xe8\xde\x9e\x8b\xfc\
+\xbc\xaf\xd4\xff\x00.#\xd4\x1fB?Y1\xfdO\xe3\
+\x8a\xff\x00\x5c\x0f\xf86\x12\xda\x18\xff\x00\xe0\x8b?\xb2\
+s\xc6\x826\x96\xef\xe2\xfc\xb2\x94US$\xad\xf1\x97\
+\xc71\x99d\xc0\x1b\xe5\xd8\x91\xa8\x91\xf70X\xa3\x5c\
+\xedP+\xfc\x8f\xcf_\xc4\x7f\xe8\xd1_\xeb\x8f\xff\x00\
+\x06\xc3\xff\x00\xca\x15\xff\x00d\xaf\xfa\xf8\xf8\xbb\xff\x00\
+\xab\xa3\xc7US\xd9z\x99\xd0\xde^\x88\xfd\xfdl\x90\
+@\xeb\x8e3\x9cg\xb6q\x83\x8c\xf5\xf5\x1cW\xf9t\
+\x7f\xc1\xe2Z\x82^\x7f\xc1X|)l\x8aA\xd2\xbf\
+d_\x84\xb62\x1eB\xb3\xcb\xe3\xbf\x8b\x9a\x92\x90:\
+\x1cG~\x8b\x9cp\xc1\x80\xc6[?\xea0z\x7f?\
+\xa7z\xff\x00.\xff\x00\xf8<Z\xce+_\xf8*\xdf\
+\x83\xa6\x8d0\xda\x87\xec\x85\xf0\x92\xeeV\xc7Y#\xf1\
+\xff\x00\xc6K\x1c\x93\xdc\xb2Z&\x7f\xdd\x03\xb5f\x9d\
+\x9af\xd5>\x09z\x1f\xcb\xaf\xc3\xf8\x9a\x7f\x1fx\x0e\
+\x14\x03t\x9e5\xf0\xa2\x02I\x18\x07]\xb0\xdc2\x08\
+#v\x14\xf5\x1c\xa8\xc1\x04\x1c\xff\x00\xbc\xca\xe7\x03=\
+{\xfd{\xfe\xbd=\xab\xfc\x19<\x00J\xf8\xff\x00\xc0\
+l\xa4\x86\x1e6\xf0\x99\x04v#^\xb0\xc7\xf35\xfe\
+\xf3c\xa7\xe2\x7f\x99\xab\xa9\xba^W\xfb\xd1\x14>\x17\
+\xfe/\xd1\x1f\xca7\xfc\x1e\x19\xa2\xd9\xdf\xff\x00\xc1+\
+|=\xabM\x1a\xcbw\xa0\xfe\xd3\x7f\x0b\xa4\xb2\x95\x80\
+&\x11\xa9\xe8\xbe5\xb1\xb8(H$4\x89\x94b\x08\
+\xca\x05\x07<\xe7\xfc\xbcI\xf6\xcfl\x1e\x9c\xf1\xc8\xef\
+\xd78<g\xa85\xfe\x9f\x1f\xf0x\xb7\x8b,\xb4\x8f\
+\xf8%\xff\x00\x81\xfc7<\x8a.\xfcc\xfbO\xfc=\
+\x87NL\xe0\xc9\xfd\x83\xe1\xdf\x1b\xea\xb7AW\xbf\x95\
+\x08\x1b\x8f\xafB@\xaf\xf3\x08\x18\xc8$\x16\xc1_\x97\
+\xd4\xee\x00\x0f\xc4\xe0UR\xd2\xf2}\x9a\xb7\xdc\xcc\xf1\
+\x11\xe6\x94<\xbf\xcd\x1f\xeb\x99\xff\x00\x06\xd5\xdf\x5c\xf8\
+\x97\xfe\x08\xaf\xfb$E\xad\xcau\x04];\xe2\xae\x81\
+\xe5\xce\xccC\xe8\xf6\x1f\x15\xbcg\xa4\xc1dH\xc9X\
+c\xb0\x8a+E\x0a\x11cB\xbbq\x85\xdb\xfe}\xdf\
+\xf0\x5co\xf8$\x8f\xc5\xbf\xf8&G\xedG\xe3;\xf4\
+\xf0]\xf1\xfd\x94>-\xf8\xe7\xc4\xda\xcf\xec\xf9\xf1\x1b\
+J\x81\xae\xbc)e\xa6\xeaW\x97\x1a\xbc?\x0bu\xcb\
+\xe8\xa0\x86\x1f\x0f\xf8\xc7\xc1\xf6\xb3\xc9km\xa0\xeaK\
+o&\xb5\xe1\xfd0jz%\xde\xa9\x15\xb6\xad>\x9d\
+\xfe\x88?\xf0n\x07\x80\xf5\xaf\x01\xff\x00\xc1\x1a\x7fc\
+-3\x5c\x89c\xb8\xd6\xfc-\xe3/\x19\xd9\xf4;\xf4\
+\x7f\x1a|D\xf1_\x894\x89\x1b\xd4\xcb\xa7\xea\x16\xee\
+\xdcu5\xfa\xfb\xf1w\xe0\xbf\xc2_\x8f\x9e\x03\xd6\xfe\
+\x17\xfcj\xf8s\xe0\xdf\x8a_\x0f<G\x1a\xc7\xadx\
+;\xc7^\x1f\xd3\xbcI\xa0_\xf9l$\x82i4\xfd\
+N\x09\xe1\x8e\xee\xd6P\xb3Y_@\x22\xbc\xb1\x9d\x12\
+{I\xe1\x99U\xc6q|\xad\xdf\xd3OSyEN\
+\x09u\xb2\xd7\xa2\xdb\xfc\x8f\xf0\x8aI\xa4\x8aE\x9a\x17\
+x\xa4G\x12E$N\xd1\xc9\x1b\x83\x19WI#*\
+\xea\xc0E\x18\x05Xm\x08\xbbprO\xec\xe7\xec\x83\
+\xff\x00\x07\x01\x7f\xc1T\xbfc[\xad\x1a\xdb\xc1?\xb4\
+\xaf\x89>*\xf8/G\x82\x1b(\xbe\x18\xfc}{\xcf\
+\x8b\x1e\x10\xba\xd3\xa1u\x914\xb8\xe6\xd6/\xa2\xf1\x96\
+\x93\x01\xf2\xe3\x829<1\xe2\xad\x17P\xb6\xb3\x8dl\
+\xac\xae\xedmB\xc4\xbf\xd8G\xed\xdb\xff\x00\x06}~\
+\xc8_\x1a#\xd7<c\xfb\x15\xfcG\xf1/\xec\xa7\xf1\
+\x06\xe2\xee\xe3Q\x8f\xc1\x1e\x22\x8a\xfb\xe2\x7f\xc0\xedA\
+\xa4K\xe9\xe5\xd3\xad4\xbb\x8b\x8b_\x1fx \xcb\x7f\
+=\xa2\xdb\xeaZg\x88<G\xa2i\x9am\x9b\xd8Y\
+x\x0a\xee[\xa8.4\xff\x00\xe3?\xfe\x0a+\xff\x00\
+\x04C\xfd\xbe?\xe0\x99zzx\xcb\xe3\xdf\xc3\xbd#\
+\xc4?\x08.\xf5\xc8\xfc?\xa7\xfcg\xf8]\xaf/\x8a\
+\xbe\x1fI\xa9^4\xcd\xa6i\xfa\xd3Mg\xa5\xf8\x8b\
+\xc3r\xeb\x10Z\x5c5\x84\x9a\xfe\x8b\xa4\xdbM$\xf6\
+\xd6b\xf5/\xccvsU\xd4\xb4Z_\xad\x97\x97\x9f\
+\x92_q\x83\xa78\xbb\xa6\xd2Z\xea\xd6\xfe{\xdf_\
+\xf8'\xf6\xd5\xff\x00\x04\xd3\xff\x00\x83\xb4\xbfeO\xda\
+\xab[\xf0W\xc1\xff\x00\xda\xe3\xc1\xa7\xf6J\xf8\xc3\xe2\
+\x19t\xfd\x0e?\x1c\xcd\xad&\xbb\xfb=x\x8b\xc47\
+oke\x04\xcb\xe2\x8b\xf6\xb2\xd7>\x1b[\xea\xfa\x84\
+\xb3\xc9\x0d\x97\x8c!\xd5<?\xe1\xfbHv\xea_\x11\
+/B\xcdw\x1f\xf5\xc0\x1f|e\x87C\x8cc<\x8e\
+\x08?\x88\xaf\xf0<\x00p\xc17\x95a\xb3\x07c\xe4\
+`\xaa\x07#\x7f\xdf\xd8\xb1\xbb\x92\xfb\x99\xd0\x9f\x97'\
+\xfd\x5c\xff\x00\xe0\xd6\xcf\xdbc\xc4\x7f\xb5\xcf\xfc\x13#\
+@\xf0\x8f\x8f<Bu\xdf\x88\x7f\xb2\xc7\x8d/>\x06\
+j\x17\x17z\x94wZ\xe5\xef\xc3\xfb-#M\xd6\xfe\
+\x17\xea\xba\x94&\xd9^\xd2\xd6\x1d\x02\xfe\xf7\xc1\x9ao\
+\xda\x1a\xe2{\xb5\xf0$\xf72^\x86f\x8a)q\xe5\
+\xeb\xfd\x7f_\xa1\xb59\xf3%}\xff\x00\xe0\x1f\xc3w\
+\xfc\x1c\xbb\xff\x00)\xa1\xfd\xb0\xbf\xeb\xf3\xe1w\xfe\xaa\
+?\x02\xd7\xca\x1f\xf0FM\x16\xdf^\xff\x00\x82\xad\xff\
+\x00\xc1>\xec\xaePI\x14\x1f\xb5_\xc1\xed_k\x1c\
+\x0f;A\xf1v\x9d\xad[7pJ\x5c\xd8D\xe1X\
+\x10J\x8e3\x82>\xaf\xff\x00\x83\x97\x7f\xe54?\xb6\
+\x17\xfd~|.\xff\x00\xd5G\xe0Z\xf9\x13\xfe\x08\xe5\
+\xae\xaf\x87\xbf\xe0\xaa\xdf\xf0Ok\xf6R\xc2\xe3\xf6\xb8\
+\xf8\x1d\xa2\x80?\xbd\xe2/\x1eh\xda\x0a\x13\xec\x1fR\
+R}\x855\xf0?_\xf20\x9e\xb5_\xf8\x92\xfc\x91\
+\xfe\xd3\x91.\x01\xef\xf30\xe0\x1cu\xcf|\xb7\xe6O\
+\xe9_\xc1?\xfc\x1e\xef\xa4F\xd6?\xf0N\x7f\x11\x96\
+\xcc\xb6\x17\xbf\xb4\xde\x8e\x80\xb3\x00\x22\xd5m~\x08\xdf\
+\xcc\x02\x02>f:,\x1bd\x5cH\x85T\xa3\x02\x10\
+\xaf\xf7\xb4\x9cn\x03\xb3\xb7\xeb\x83\xfdk\xf8\x1a\xff\x00\
+\x83\xde\xf5\xa7\x89\xbf\xe0\x9c~\x1c\x11\x9f.\xf8\xfe\xd4\
+Z\xeb\xcc~\xecm\xa5\x0f\x80\xdarG\x8fG\x1a\xbb\
+\xb1\xf6_Bh\x86\xff\x00/\xd5\x1d\x15]\xa9\xc9\xd9\
+\xfc?\xe5\xaf\xeb\xe8\x7f\x03\xaf\x9d\x8f\x8cgkc=\
+\x09\xc1\xc0?\xec\x9e\x8d\xed\x9a\xff\x00o\x0f\xf8'N\
+\xa3%\xff\x00\xfc\x13\xeb\xf6\x22\xbd%\xe5\x92_\xd9C\
+\xe0\x0cJ[\x82\xe6\xdb\xe1_\x85\xed\xa3\xce\x15\x8a\xef\
+0\xaeX#\x80\x0e\xe0\x84\x0d\xb5\xfe!\xd2\x9cE!\
+\xec#r~\x9bNk\xfd\xa8\xff\x00f_\x89\xfe\x17\
+\xfd\x9a\x7f\xe0\x92\xff\x00\xb3\xff\x00\xc6_\x1dKu\x17\
+\x83>\x0a~\xc0\x7f\x0c\xbe)\xf8\xbek\x08M\xcd\xec\
+~\x1c\xf0_\xc0m\x1b\xc5\xba\xcbY\xdb\xf9\x90\x9b\x8b\
+\x91aaq\xe4\xc0'\x80\xc9)T\x13F[p'\
+\xbf\xc8\xc7\x0f\xb7\xcb\xf4G)\xff\x00\x05$\xff\x00\x82\
+\xc3\xfe\xc5\x9f\xf0KO\x0e\xe9W?\xb4W\x8e.\xf5\
+/\x88^(\xd3.\xb5\x7f\x06|\x14\xf8\x7fog\xe2\
+/\x8a\x9e)\xd3\xa0y\xed\xe1\xd5\xd7E\x97Q\xb0\xb2\
+\xf0\xff\x00\x87\xae\xef\xednt\xab_\x13x\xa7R\xd1\
+\xb4k\xcb\xfb[\xf8,.\xae\xe5\xd2u\x1b{o\xe2\
+\xdf\xf6\xc5\xff\x00\x83\xc9\xff\x00l/\x89:\x8e\xab\xa1\
+~\xc6\x7f\x04~\x1c\xfe\xcd\x9e\x0f\xf2\x96\x0b\x0f\x18\xfc\
+@\x03\xe3?\xc5\xcb\xb7\x83S\xbd1\xeb6\xc9u\x06\
+\x8f\xf0\xbb\xc3\xb6\xba\x9e\x98\xd6\x10M\xe1\xbb\xbf\x08x\
+\xfd\xec\xae\xd6\xf2KO\x18\xde\xa5\xd5\xa7\x95\xfc\xaa\xfe\
+\xd5\x9f\xb4\xcf\xc4\xff\x00\xdb\x0f\xf6\x86\xf8\xb1\xfbK|\
+a\xd6.\xf5_\x1d\xfc[\xf1~\xad\xe2\x8dI'\xbd\
+\xb8\xbe\xb7\xd1,o&\x03C\xf0\xae\x8f5\xc8YW\
+\xc3\xfe\x15\xd0\xa2\xd3<;\xa1BT,zF\x97c\
+\x1a\x92\x88\x98\xfdx\xff\x00\x82\x0f\xff\x00\xc1\x135\xbf\
+\xf8+\x8f\xc5O\x1dj\xfe=\xf1\x87\x88\xbe\x19~\xcc\
+?\x05e\xd1W\xe2_\x8b\xbc3ij\xde0\xf1g\
+\x89|E\x1d\xec\xfa/\x80>\x1f\xdfj\xfaf\xa9\xa1\
+i\xfa\xa4\xb6\xba}\xc6\xb1\xe2?\x10\xdf\xe9\xda\xe2x\
+z\xcci\x91M\xa1]\xdc\xeb\x9aC\xc8$\x95\x9b\xd5\
+>\x9fs\xff\x00\x81\xff\x00\x0eW<\xe5~V\x97\xbd\
+mz-/\xff\x00\x0f\xdbS\xf3k\xf6\x9e\xfd\xbf\xff\
+\x00n\x1f\xdb\xb7R\xd3m\xff\x00iO\xda#\xe2\xcf\
+\xc6\xd4Mt\xea\x1e\x1f\xf0N\xa9\xab\xdd\xbf\x84l5\
+\xab\xd9g\x82\xd6_\x0e\xf8\x0bE\x8a\xd7\xc3QjX\
+\xbe\xb9\xd3\xb4\x7f\xb0h\xeb{ik5\xc6\x9bg(\
+\x82\xe7\xec\xed\xf1W\x00\x00\x14\x0e\x8c:\x9c\xc6\xf1\xa7\
+\x96P\xf7\x88\x05dR\xd9gdw\x1br\xd1\xa7\xfb\
+\x15|\x15\xff\x00\x823\x7f\xc18\xbf`\x7f\x86~>\
+\xf1?\xec\xf1\xfb5xOH\xf8\x8d\xa2\xfc6\xf1\xfa\
+\xd8|X\xf1\x94\xfa\x8f\xc4\x1f\x89\x96\xcf\xa9xCQ\
+\xb1\xd4\xa4\xd2\xfc[\xe2\xfb\x9dWP\xd0\xde\xfa\xdf\xcf\
+\x8ax\xf4\x16\xd2\xe0\x8a\xda\xf6\xee\xd2\xd2(,\xaf\xae\
+m\x9b\xfct!$\xc1\x01\xee\xd1\x82}\xc8\x0a\x01>\
+\xa7\x1cg\xae\x00\x19\xc0\x18\xb8\xda\xda+k\xfa#*\
+\x90q\xd5\xca\xed\xff\x00\xc1\xff\x00#\xfb\xf8\xff\x00\x83\
+\x1f\x8f\xfcJ\x7f\xe0\xa5\xbe\xda\x97\xec\x89\xff\x00\xa4\xbf\
+\xb4\xb1\xaf\xcf\x7f\xf8<\xe9\x9d\xbf\xe0\xa7\xff\x00\x03b\
+i$h\xa3\xfd\x87>\x1a\xcd\x1cE\xd8\xc7\x1c\xb3\xfc\
+t\xfd\xa2\xe3\x9aDL\xedW\x95-\xe1W`\x01a\
+\x1a\x06$\x22\x81\xfa\x13\xff\x00\x06?\x7f\xc8'\xfe\x0a\
+[\xff\x00a\x1f\xd9\x13\xff\x00I\xbfiz\xfc\xfa\xff\
+\x00\x83\xcfm.\xe2\xff\x00\x82\x9b\xfc\x09\xbf{y\x16\
+\xd2\xeb\xf6 \xf8ymkp\xc8\xe2\x19\xae,~8\
+\xfe\xd0\xd2\xdc\xdb\xc4\xe0m\x96XV\xfa\xd1\xe6\x8cs\
+\x10\xba\xb5\xce~\xd0\x00K\xe3~\x9f\xe4j\xf4\xa2\xfe\
+W\xfb\xe2\x7f$Z$Iq\xac\xe9\x10H\x09\x8em\
+SO\x89\xc0\xe0\x95{\xb8U\xbfC_\xefd\x17\x0d\
+\xd4\x9c\x05\xe0\xfa\xfc\xc0\x9e\x9dH\xc6{|\xa3\x00s\
+\x9f\xf0J\xd2&\x16\xfa\xb6\x97;\x12\x04:\x8d\x8c\xa4\
+\x8e\x08\x11\xdc\xc4\xe7\xaf\x1d\x05\x7f\xbd\x9cN$\x1b\xd4\
+\xe5X\x0d\xbd9\x19'<s\xd1\x94~^\xb53\xdf\
+\xe4,?\xc2\xfe_\x90\x92\xc3\x1c\xa0oEr\xbc\xae\
+\xe5V\xe7*\xdd\xc1<\x15\x04\x01\xc6\xe0\x09\x04\x80D\
++mo\x80\xa2\x08\x068\x00\xc3\x1f@=v\x1f\xd4\
+\xd7\xc1\x9f\xf0P\xcf\xf8)?\xec\xcb\xff\x00\x04\xc8\xf8\
+g\xe0\xaf\x8b\x7f\xb5&\xa7\xe3=/\xc1\xbe>\xf1\xd2\
+|6\xd0&\xf0O\x85\xa7\xf1f\xa2\xfe'\x9f@\xd6\
+\xbcK\x0cW:|\x176\x8doh\xfag\x87\xf5#\
+\xf6\xd7\x94\xa4s\xa40\xec\xc4\xec\xe9\xf9\x1e\xbf\xf0v\
+\xcf\xfc\x11\xed@S\xe3/\x8fLG\x05\xbf\xe1Gj\
+\xc47\xfb@\xff\x00l\x0e\x0fP01\xd3\x03\xa5A\
+\xbbkf\xd7\xf5\xa9\xde\x7f\xc1\xd4>\x22\xba\xf0\xdf\xfc\
+\x11\xab\xe3\xdd\xa5\x9c\x8d\x14~(\xf1\xb7\xc1\xdf\x0c_\
+*\x83\xb6[)|{\xa5\xeb&&\xdaT\x08\xcd\xc6\
+\x8dn\xc79\x1b\xa1\x8c\x11\xf2\x8c\x7f\x93Q\xc1\xc8e\
+\x0c\x0f\x040\xc8\xc7\xa7\xf9\xe4pA\x04\x03_\xea\xc1\
+\xff\x00\x07\x11\xf8\xab\xc3_\xb5\x1f\xfc\x10#\xe2o\xc7\
+\x8f\x87\x8f\xa8O\xe0_\x11\xe8\xdf\xb3\xdf\xc7\x0f\x0b\xcf\
+\xab\xd9\x9d/S\x9b\xc2\xbe$\xf1\xbf\x83\x93G\x9e\xf7\
+Nv\x90\xda^Ii\xe2\xdbY.m\xb7f\x09%\
+x7\x1f-\xb7\x7f\x94\xf0\xcb\x10>c\x92T\x05\xfb\
+\xc4\xb3\x84P\xbe\xe0\x90~\x80\xf7\xada\xb7\xcf\xf4G\
+={\xf3.\xd6\xd3\xef>\xee\xf8\x09\xff\x00\x05;\xff\
+\x00\x82\x82~\xcb\xbf\x0f,\xbe\x13~\xcf\x7f\xb5\xbf\xc6\
+\x8f\x84\xbf\x0d\xb4\xedGT\xd5\xac|\x19\xe0\xef\x14>\
+\x9b\xa1\xda\xeaz\xdd\xd1\xbd\xd5\xafa\xb5\xf2$\xdbq\
+\xa8^3\x5c\xdd>\xf3\xe6L\xec\xfcf\xbdcR\xff\
+\x00\x82\xd8\x7f\xc1X\xb5\x8d:\xff\x00H\xd5?o\x8f\
+\xda.\xff\x00L\xd5m.l5\x1b+\x9f\x1a4\x96\
+\xf7\xb6W\x90\x1bk\xabi\xe36\x9b^)\xad\xcb\xc2\
+\xe3\x00\x94w\xe7q\x0c?\xb2\x8f\xf86\xbf\xfe\x09s\
+\xff\x00\x04\xed\xfd\xac\x7f\xe0\x97^\x04\xf8\xb7\xfbD~\
+\xc9\x9f\x07~0\xfcQ\xba\xf8\xab\xf1wB\xd5\xfcg\
+\xe2\xfd\x0a\xe2\xfb\x5c\x9a\xc7G\xf1K\xc7\xa4i\xf3\xdc\
+G}\x024\x16:|\xd0\xc7f\xbeX)j\xd1)\
+$\x8a\xfd\xf2\xff\x00\x87\x11\x7f\xc1\x1f\x7f\xe9\x1f?\xb3\
+\xb7\xfe\x12\xf7\x9f\xfc\xb3\xa1\xb8\xdfU\xaf\xfc7\x9f\xf5\
+\xf3&4\xa7$\x9a\x9bI\xea\x95\xf6\xdb\xcb\xcb\xfa\xe9\
+\xfe4\x00\x00\xa1\x00\x1bGny\x1d\x08\xc8 \x8c\x8e\
+2\x08#\xa8\xc1\xae\xa3E\xf1\x86\xb3\xe1\xfbY,\xf4\
+\xd9\xda\x18f\xb8{\xb9\x14 `g\x928\xa2f\xce\
+A9Hc\xcerr:\xe3\x00\x7f\xb1\xbf\xfc8\x8b\
+\xfe\x08\xfb\xff\x00H\xf9\xfd\x9d\xbf\xf0\x97\xbc\xff\x00\xe5\
+\x9d\x1f\xf0\xe2/\xf8#\xef\xfd#\xe7\xf6v\xff\x00\xc2\
+^\xf3\xff\x00\x96ts\xaf?\xeb\xe6W\xb0\x97\xf3/\
+\xc7\xfc\x8f\xf1\xa0\xa2\x8a*\xcc\x02\x8a(\xa0\x02\x8a(\
+\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x90\xf5\
+\x1f_\xe8ii\x0ex\xc0\xc9\xdc\x02\xae@,\xcd\xf2\
+\xaa\x82\xc4(,\xc4\x01\x92\x07\xbd'\xb3\xf4\x7f\x91K\
+\xec\xff\x00\x8b\xff\x00\x91?\xd93\xfe\x08\x19\xff\x00(\
+v\xfd\x80\x7f\xec\x83h\xdf\xfau\xd5\xeb\xf5\xf6\xbf \
+\x7f\xe0\x81\xa5G\xfc\x11\xdf\xf6\x02\x01\x95\xc0\xf8\x0f\xa3\
+\x00\xc8\xc0\xab\x0f\xed]_\x04d\x83\x83\xd7\x90\x0f\xb5\
+~\xben\x1f\xe4\xaf\xf8\xd6\x07j\xd9z/\xc8u\x14\
+\xdd\xc3\xfc\x95\xff\x00\x1a7\x0f\xf2W\xfch\x18\xea\xfe\
+\x0b\xff\x00\xe0\xf7\xff\x00\xf9\x02\x7f\xc14\xbf\xec-\xfb\
+_\x7f\xe9\x17\xec\xd7_\xdev\xe1\xfeJ\xff\x00\x8d\x7f\
+\x05\xff\x00\xf0{\xf3gD\xff\x00\x82j\x10>T\xd6\
+\x7fk\xb4f$\x05\x06K/\xd9\xaf\x0cI8T\x04\
+0wb\x116\x12\xc4\x02\x09\x08\xa9\xf0K\xd0\xfe\x02\
+h\xa2\x8a\xdd+-/\xdfS\x89\xebk\xebm\xbf\xaf\
+\xeb\xb6\xc1E\x14S\x15\xbf\xaf\xeb\xd3\xf1\xf4\x0cg\x8e\
+:\x1f\xbc2\x87\x83\xc3\x8c\x8c\xc6zH\x09\x00\xa1l\
+\x91\xd4\x7f\xa7w\xfc\x1aO\xff\x00\x05\x0a\xf0o\xc7\xdf\
+\xd8\x88\xfe\xc6^\x22\xd6m\xec\xbe5~\xc9mw\x16\
+\x9f\xa3^_ZGq\xe2\xcf\x82\xfe%\xd6\xae\xf5\x1f\
+\x0cx\x9f\xc3\xfa\x7f\x93mu=\x9f\x85u\x0b\xf9<\
+\x1f\xe2 \x8d\xaaK\xa7\x5c\x8d\x07P\xd4\xaf\xa1O\x15\
+i6\xe7\xfc\xc4O!\x87\xaa\xb0\xe9\x9e\xaaF:\x8e\
+\xb9\xc6A\xc8\xea9\x02\xbe\xaf\xfd\x8c\x7fm/\x8f\x7f\
+\xb0O\xed\x05\xe0\xcf\xdaK\xf6v\xf14Z\x0f\x8e\xfc\
+\x1fx\xe6}?V\xb7\x97P\xf0\xb7\x8c|9}4\
+\x07\xc4\x1e\x0b\xf1\xae\x91o5\x94\xda\xd7\x86\xfcIo\
+ook\xa9Gm}\xa7jp40\xdf\xe9w\xd6\
+\x9a\xa5\x9e\x9fyg2W^kcZs\xe5j\xfb\
+k{o\xb7\xf5\xd1\x9f\xee0\x180\xc8\xe4~?\x97\
+=\xc7q\xda\x96\xbf\x0c\x7f\xe0\x97\x1f\xf0_?\xd8\x8b\
+\xfe\x0aY\xa3\xf8o\xc1\xfaO\x8c\xf4\xff\x00\x83\x1f\xb4\
+\xee\xa3im\x0e\xaf\xfb=\xfcC\xd5-\xb4\xedgS\
+\xd7\xa1\xd3\xad\xe7\xd6 \xf8[\xe2\x1b\xb3i\xa5\xfcJ\
+\xd3\xa0\x98^Kek\xa5\x0bO\x18\x0d2\xd2k\xfd\
+O\xc2Z|\x10K9\xfd\xc7Y\x81\xe8A8\x07o\
+,\xf8\xe9\x92\x8b\x96\x1c\xe4\x12@\x00\x82\x0e+&\x9a\
+\xdd\x1djI\xab\xa7\xfd\x7fM\x13\xd1L\x0c{\xe3\x1e\
+\xc4\x7f\x8d.\xe1\xfeJ\xff\x00\x8d!\x8e\xa2\x9b\xb8\x7f\
+\x92\xbf\xe3F\xe1\xfeJ\xff\x00\x8d\x00:\x9a\xd9\xca\xfa\
+g\x9f\xccQ\xb8\x7f\x92\xbf\xe3Mg\x00d\xf4\xe0\x93\
+\x95\xc0\xc1\xcf'8\x1e\x83=I\x02\x80?\xc9\xbf\xfe\
+\x0aJ\x0f\xfcD\xc7\xe2\xdf\x7f\xf8(g\xec\xe8\x07\xb9\
+>4\xf8N?\x9d\x7f\xac\xa5\x7f\x93_\xfc\x14\x95\xbf\
+\xe3\xa6O\x15\x85\xf9\x9b\xfe\x1e\x19\xfb:2\xa0e\x0c\
+\xe7\xfe\x13o\x85\x18U\x0cA\xcb\x14 7\xdc\x04\xae\
+\xe6PA?\xeb%\xb8\x1f\xff\x00Z\xff\x00\x8d\x5c\xf7\
+\xf9~\xac\xce\x9f\xda\x7f\xde\xb7\xdc\x90\xea)\xbb\x87\xf9\
++\xfe4n\x1f\xe4\xaf\xf8\xd4\x1a\x1f\x8e\xdf\xf0p'\
+\xfc\xa1\xb3\xf6\xff\x00\xff\x00\xb2$?\xf51\xf0\xbd\x7f\
+\x8e\x15\x7f\xb1\xdf\xfc\x1c\x08\xc3\xfe\x1c\xdb\xfb\x7f\x0f_\
+\x82@\x03\xc63\xff\x00\x09\x8f\x85\x863\x9cg\x9e\xe7\
+\xf5\x22\xbf\xc7\x13\xdb\xd0\xe3\xf2\xab\x86\xff\x00/\xd5\x18\
+W\xf8\x1f\xa3\xfd\x04=\x0f\xd0\xff\x00*\xfe\xa5\x7f\xe0\
+\xd0\xef\xf9K2\xff\x00\xd9\xbb\xfcT\xff\x00\xd3\x87\x85\
++\xf9k\xc6x\xf5\xe3\xf3\xaf\xeaK\xfe\x0d\x0fl\x7f\
+\xc1YG\x07#\xf6v\xf8\xa8q\xdf\x9dC\xc2\xc4`\
+w\xe9\x8e3\xd4v\xe6\xae\x7f\x0b\xf9~h\xc6\x9f\xc7\
+\x1fS\xfdM\xa8\xa8\x95\xcb\x0e9\xc1 \xe5[\xaf^\
+01\x8c\x11\xd3\xa7C\x82\x08\x0e\xcb{~M\xfe\x15\
+\x89\xda9\x81 \x81\xfey\xaf\xf3\xe5\xff\x00\x83\xda\x88\
+\xff\x00\x85\x91\xfb\x08\x06\xce\xd6\xf0w\xc5\xb5b\x02\xb1\
+\x0au\x9f\x0ed\x84pcr\x00\xfb\x8e6\x9fc\x82\
+?\xd0`\xb1PK`(\x04\x93\x86\x18\x03\xbeN\x00\
+\x03\xa9\xc9\xe9_\xe7\xc7\xff\x00\x07\xb58o\x88\xff\x00\
+\xb0\x863\xff\x00\x22w\xc5\xce\xa0\x8e\x9a\xcf\x87\x00\x1c\
+\xe3\xaeAR>V\x1c\xa98\xaa\x8b\xb3^z~$\
+T\xf8[\xed\xa9\xfa\xff\x00\xff\x00\x06\xae\xff\x00\xc1H\
+\xed\xbfl\x0f\xd8\x81\x7ff\x7f\x1a\xea\xb7\xd7_\x1c\x7f\
+c\xbd?C\xf0~\xaa\xd7\xeb,\xdf\xf0\x90|%\xd5\
+\xa4\xbe\xb5\xf8i\xae\xda\xdfKwpn\xdbN\xb5\xd3\
+/|%\xa8F\xff\x00c\x9e\x19\xb4\xab3\xf6W\x86\
+kk\xab\xaf\xeau\x18\x10\x07\x7fB=?\x00+\xfc\
+^\xff\x00\xe0\x8f_\xf0P=K\xfe\x09\xb1\xfbw\xfc\
+%\xfd\xa2f\x93P\x9b\xe1\xcb]\x9f\x01\xfch\xd24\
+\xe8\xdek\xbdW\xe1g\x8bf\xb6\x87\xc4&\xd6\xd82\
+\xa5\xd5\xe6\x8fsk\xa6\xf8\x86\xd2\x06Y\xa4\x92m!\
+\x12\xd6\x17\xb8\x92<\x7f\xb3\x07\x84\xfcO\xa1\xf8\xd7\xc2\
+\xfe\x1d\xf1\x8f\x85\xb5+mg\xc3~*\xd1t\xcf\x10\
+h\x1a\xbd\x8c\xd1Mi\xa9\xe8\xfa\xc5\x9c:\x86\x9d{\
+m4r:I\x0d\xcd\xa4\xf1J\x8c\xae\xd9\x0c9'\
+48\xd9\xf9w\x7f/\xf3\xfe\xac\xc2\x9c\xb9\xe3wd\
+\xfb#\xa7\xa8gW)\x98\xfe\xfa\xe4\x8e\xbe\x87\x8e\xa3\
+\xafN9=\x14\xa1\xc3\xab\xb77\xfb?\x98\xff\x00\x1a\
+P\xc7\xbe?\x02?\xc6\xa4\xb3\xf88\xff\x00\x82\x9a|\
+ \xd6\xbf\xe0\x86\x1f\xf0Y?\x83_\xf0V\x7f\x86\xfa\
+\x15\xf5\xc7\xec\x97\xfbMx\xdbS\xf0\xb7\xed\x05\xe1\xed\
+\x02\xd6y\x1f\xc2\xfe!\xf1\x8d\xae~\x22\xda<\x16\x8f\
+\x0d\x9b'\x8b\x22\x85~ xV\x1b\xb8\xe63k\x9e\
+\x1d\xd6ma\x82\xfah\xb1\x0f\xf71\xf0\xff\x00\xc7\xde\
+\x0f\xf8\x9f\xe0o\x07\xfcF\xf0\x16\xbf\xa7x\xa3\xc1^\
+<\xf0\xde\x8d\xe2\xdf\x09x\x8bH\xb9\x86\xfbM\xd7<\
+=\xe2\x0d>\x0dSH\xd4\xecn\xad^X.-\xef\
+,\xaea\x99$\x86GO\x98\xaeAR\x07\xcb\xdf\xf0\
+P\x1f\xd8\xbb\xe1\xa7\xfc\x14\x0b\xf6T\xf8\xb1\xfb.\xfc\
+P\x8a8\xf4\xaf\x88^\x1d\xb9\x83\xc3\xba\xf7\x95\x14\xf7\
+\xbe\x0d\xf1\xc5\x92=\xd7\x84\xbcc\xa6\xab\xac\x84\xdc\xe8\
+\x1a\xc4v\xd7W1\xc6\x16K\xbd4\xde\xd8\x87Ct\
+\xb3C\xfc\x0b\x7f\xc10\xff\x00\xe0\xb7_\x1e\xbf\xe0\x88\
+?\x1b>%\x7f\xc19?o\xef\x0dx\xa3\xe2\x0f\xc0\
+O\x83\xfe0\xd6|\x13k.\x85o\xf6\x8f\x1e\xfc\x1c\
+\xd5t\xeb\xfb\xa9b\xd5|\x1do\xac\xcd\xa5\xff\x00\xc2\
+M\xf0\xc7\xc4\xb6\xf2\xff\x00mA\xa1\xdc\xdd\xda\x5ci\
+\xf6\x9a\x85\xae\xb1\xe1\xbb\xa7\xb7it\xcb\xa6\x93{!\
+7m\xfb\xd9\x1f\xe9yE|I\xfb!\x7f\xc1F\xff\
+\x00b\x9f\xdb\xbfA\x87Z\xfd\x95\xff\x00h\x7f\x87\x1f\
+\x15/\x86\x95\x16\xb3\xabx\x1fK\xf1\x0d\x8d\x9f\xc4\xff\
+\x00\x0b\xd8H\xf1\xc1\xf6\x8f\x16|2\xd4\xa5\xb4\xf1\xbf\
+\x87\xedR\xeeO\xb1\x7fh\xdf\xe8\x91\xe9W\x17)\x22\
+\xd9_\xddF\x04\x8d\xf6\xaa\xcb\xbc\x02\xa5Hl\x90A\
+\x04|\xa7\x07\xe6\x0cW \xf1\x8c\xe6\x86\x9a\xddy\x82\
+i\xecMEG\xb9\xbf\xd9\xfc\xc7\xf8\xd1\xb9\xbf\xd9\xfc\
+\xc7\xf8\xd2\x19%\x15\x1e\xe6\xff\x00g\xf3\x1f\xe3F\xe6\
+\xff\x00g\xf3\x1f\xe3@\x0f=\x0f\xd0\xff\x00*\xff\x00\
+!\x1f\xf8$\x01\xff\x00\x8d\xf9\xfe\xcf\x03\xbf\xfc6\x1f\
+\x8fO\xfeV<o_\xeb\xd2\xce@9\xdb\xcf\x03\x9f\
+\xbc\xc7\x80\xa0\xe7\x1b\x98\xf0\x06s\xf8W\xf9\x09\x7f\xc1\
+ X\x0f\xf8/\xa7\xec\xf2AW#\xf6\xc0\xf1\xe1!\
+\x19\x19\xb1\xfd\xaf\xe3f,UX\xb2\x8c\x9d\xa3p\x0c\
+\xc7\xee\x06\x06\x82$\xaf\xcb\xd2\xd2_\x86\xbf\xa1\xfe\xbe\
+G\xb7\xd7\xfa\x1aZ\x8c\x93\x9c\x821\xe9\x91\xfa\xf3F\
+\xe6\xff\x00g\xf3\x1f\xe3Ac\xf23\x8e\xf5\xfc\xa0\xff\
+\x00\xc1\xe2\xbf\xf2\x8a\xff\x00\x0a\x1e\xc3\xf6\xa1\xf8g\xff\
+\x00\xa8\xe7\x8e\x87\xff\x00[\xda\xbf\xab\xc0\xde\xb8\xcf\xb1\
+^\x9f\x9d\x7f(_\xf0x\x91\x0d\xff\x00\x04\xb0\xf0\xaa\
+\x0f\xbc?j\x0f\x86gnW8\x7f\x0fx\xe8!$\
+\x90\xa0;)U\xe7\x93\x8a\x09\x9b\xf7\x7f\xae\xe8\xff\x00\
+/z(\xa2\xba\x0e\x07\xb7\xcd~h\x8a\x7f\xf5\x12\x7f\
+\xd7)\xbf\xf4\x01_\xed\xef\xff\x00\x04\xdd\xff\x00\x93\x00\
+\xfd\x8c\xbf\xec\xda~\x0e\x7f\xea\x0d\xa3W\xf8\x84O\xfe\
+\xa2O\xfa\xe57\xfe\x80+\xfd\xbd\xff\x00\xe0\x9b\xbf\xf2\
+`\x1f\xb1\x97\xfd\x9bO\xc1\xcf\xfdA\xb4j\x89\xec\xbd\
+\x7f\xaf\xea\xff\x00\x7fN\x9a\x1d~\x7f\xa1\xf6\xa3\xfd\xd3\
+\xf8\x7f1^\x0f\xfbJ\x7f\xc9\x14\xf8\x8b\xff\x00b\xfd\
+\xcf\xfe\x86\xb5\xef\x0f\xf7O\xe1\xfc\xc5x?\xed)\xff\
+\x00$S\xe2/\xfd\x8b\xf7?\xfa\x1a\xd7\xe6\xbe/\xff\
+\x00\xc9\xab\xf1\x13\xfe\xc8\xce#\xff\x00\xd5mS\xe9\xf8\
+W\xfeJ~\x1c\xff\x00\xb1\xde[\xff\x00\xa9\xb8c\xf1\
+'?\xbc_\xf7\xa4\xfd\x1a1_\xb5_\xb3\x07\xfc\x91\
+o\x04\x7f\xd8=\xff\x00\xf4\xb6\xee\xbf\x15\xbf\xe5\xa2\xfd\
+d\xff\x00\xd0\xa3\xcf\xeb_\xb5?\xb3\x07\xfc\x91o\x04\
+\x7f\xd8=\xff\x00\xf4\xb6\xee\xbf\xc8\x1f\xd9\x9f\xff\x00'\
+\x87\x8b\xff\x00\xec\x8d\xc4t\xff\x00\xa9\x9e\x0f\xfe\x09\xfd\
+\x7f\xf4\x9c\xff\x00\x92O!\xff\x00\xb1\xd2\xff\x00\xd4:\
+\xe7\xd0\xd5\xf8\x85\xff\x00\x07\x13\xfe\xd1\xf0\xfe\xcd\x9f\xf0\
+I\x0f\xda\xaf\x5c\x82\xee+o\x10|J\xf0\xb5\xaf\xc1\
+O\x0c\x83\xa8M\xa6^\x0dK\xe2}\xdax~\xf2\xef\
+O\x9e\x18\xa5\x93\xed\xbaV\x83.\xaf\xab\xc7\x16#\x12\
+-\x8b\xa9\x91{\xfe\xdd\xbf\xdcn\xbd\x08\xe3\xaf<|\
+\xb9\xc0\xdd\xe9\xcf'\x02\xbf\x87o\xf8=G\xf6\x8bM\
+\x13\xe0w\xec\x8d\xfb.X^\x5cGy\xf1\x1f\xe2\x07\
+\x8b~/x\x86\xc9-\xa2{[\x8f\x0fx\x03H\x83\
+\xc3ZD\x86\xf9\x98\xc9\x15\xccZ\xdf\x8bn^8V\
+2\x93D\xa4\x99\x17f+\xfd\xc4J\xed/\xeb\xf5?\
+\x88$\xec\x9b\xed\xe4\x7f\x9e\x12\xe4\xa4x\x04e\x17\x00\
+\xb0l|\xa1\x88\xce\xd4\xe8I\xed\xcfPH\x22\xbf\xad\
+\x1f\xf87\xe7\xfe\x0d\xf7\xf8\x05\xff\x00\x05R\xfd\x9f~\
+1\xfcz\xfd\xa6\xbcq\xf1\xff\x00\xe1\xf6\x8b\xe1\x9f\x89\
+\xd6\x1f\x0e\xfe\x17O\xf0_\xc4\xbf\x0e\xf4+mx\xe9\
+z\x13j\xde7\x9b]\x87\xc7?\x0b> \xcd4\xda\
+]\xe6\xaf\xe1\xd8\xf4\xe9\xf4\xdb\xab\x08\x15n.\x92\xea\
+\x1b\x86d\xdb\xfc\x97\x16#,H\x00a\x8bch\x07\
+$\xc8Y\x98*\xfc\xee\xc3\x078P\xc0\x1d\xa8\xb9\xaf\
+\xf5\xdc\xff\x00\x83k~\x04\xc1\xf07\xfe\x09\x01\xfb/\
+\xc6\xba%\xb6\x8b\xad|T\xb3\xf1\x1f\xc6\x7f\x12<S\
+M1\xd6o\xbcu\xae\x5c\xcd\xa4k3\xb4\x84\xac3\
+]xGN\xf0\xdd\xaf\x97\x02\xac(\xb6\xe9(\x12\xb1\
+\x0c\xda\xc9\xf2\xa5oM}\x0ci\xa4\xe6\xe4\xd5\xdd\xbe\
+\xd2\xf3OO\xbb\xfa\xd1\x9f\x9eg\xfe\x0c\xbb\xff\x00\x82\
+ev\xfd\xa0\x7fn\xef\xfc8\x7f\xb3\xef\xff\x00CQ\
+\xfeU\xf9E\xff\x00\x05\xa3\xff\x00\x83d\xff\x00d\x0f\
+\xf8'\x8f\xec\x15\xf1\x13\xf6\xb1\xfd\x9f\xfe1~\xd2\xfe\
+)\xf1\x87\xc3\x8f\x12\xf8\x16\x0dKC\xf8\xc5\xe2\xcf\x85\
+Z\xdf\x85\xaf<9\xe2\x8f\x12\xd9xf\xfc\xdb\xdbx\
+7\xe0\xe7\x81uX\xf5{{\x9dV\xca\xe2\xd6\xe2M\
+i\xac\xe3\x86+\x91=\x95\xc6\xe5\xd9\xfe\x8a\xb5\xf1W\
+\xfc\x14s\xe0\x5c_\xb4\xbf\xec#\xfbX\xfc\x0b\x91\xed\
+-\xe6\xf8\x8d\xf0'\xe26\x85\xa7\xdf^ZC{\x1e\
+\x9b\xaa\xb7\x86\xaf\xeet\xbdJ8'\x8ad\x17V7\
+\xd6\xf0\x5cZ\xcc\xa9\xe6\xc1p\x91\xcd\x0b$\x88\xac3\
+Sk\xcf\xd4\xd1\xc6)?um\xfe_\xe4\x91\xfe!\
+\xa3+\xc7R1\x93\xc0<\xa8\xe1\x80\x03iPB\x80\
+0\x00\x00m\x07\x9a\xff\x00O\xaf\xf84\x03\xf6\x98_\
+\x8b\x9f\xf0M\xef\x15\xfc\x0a\xd4u\x19\xae\xbcC\xfb/\
+|_\xd5t(\xed\x85\x9a[[\xe9\xde\x07\xf8\x99o\
+/\x8c|)\x1a\xdc\xf9\xad%\xec\xf3kV\xfe7\x96\
+y\xa5D\x10\xa4v\xf6\xf1\xef\x00\xed\xff\x000%s\
+\x22\xab`r\xab\xc2|\xea\x0e9\x5c\xaeq\xb4\xe5v\
+\xb1\xdc\xb8\xdaz\x02\x7f\xb0_\xf83c\xe3\xf4\xfe\x04\
+\xfd\xbc\xbe6\xfc\x04\xbb\xd4\x9a-\x17\xe3\x9f\xc0\xe9\xf5\
+\x8b\x1d:}]-\xac\xdb\xc5\xff\x00\x0c\xf5\xdbMB\
+\xd6\xe2\x0d%\xd8&\xa5\xab\xcb\xa0k\x9a\xccq\x18\xd5\
+n\xad\xec\xa2\xb9er\x8f>\xda\x9e\xaa/\xaf\xfc\x03\
+\x1an1\x9c\x95\x9a\xbb\xed\xa6\xcbn\xb6\xfe\x96\xe8\xfc\
+\x90\xff\x00\x83\x81~\x14\xea_\x08\x7f\xe0\xaf\xbf\xb6\xce\
+\x89xn%\x8f\xc4\xff\x00\x13G\xc4\xbd>ym\xa7\
+\x869\xb4\xff\x00\x88z.\x97\xe2u{Y&\x8dR\
+x`\xb8\xd4\xa5\xd3\x9ahY\xe3\x17\x16\x17\x11n\xdf\
+\x19Q\xd0\xff\x00\xc1\xbb\xbf\xb4/\x85?f\xdf\xf8+\
+o\xec\xb3\xe2\xef\x1d\xf8\x86/\x0cxC\xc6\x1a\xc6\xbf\
+\xf0\xa7Y\xd5\xee\xee \xb4\xd2\xedn>\x22h\x17\xda\
+\x07\x87\x9bY\xbb\xba\xb8\xb6\xb5\xb3\xd2\x07\x89\xa6\xd1\x9b\
+P\xbe\xb8\x9d \xb1\xb7\x0dw&D8?\xd6w\xfc\
+\x1d\x89\xff\x00\x04\x97\xf1\x9f\xed1\xe0?\x05\xfe\xde\x1f\
+\xb3\xc7\x84\xb5?\x18|P\xf8!\xe1\x9b\xbf\x09\xfch\
+\xf0\x97\x87\xad.\xb5={\xc5?\x07\xad\xa7\xb8\xd5\xb4\
+_\x13h\xba=\x9d\xa5\xe5\xd6\xa5\xa8|<\xbf\x9bX\
+}J\xd6\xc5\xa1\x96_\x0f\xebw\xb7\x869F\x93\x14\
+G\xfc\xe0\xa1ya\x9a\xde{yZ)\xa2\x9a9\xad\
+n\x22\x95\xa2x\xee!e\x96&\xb7\x969m\xe5Y\
+\xd1\xb6I\x1c\x96\xd3$\xd1\x1d\x92\xc4\xc4\x81K\x9aR\
+\xf7t\xd49=\x9c\xdc\xf5\xe5v\xf5\xbf\xf5\xe9\xfa\x9f\
+\xefi\xb8\x00\x00\x04rx\x18b\xac\xb8 d\x8cw\
+p\xdc\x15\xf48\x00\xd7\xf8\xee\x7f\xc1\xc0_\xb4\x8e\x83\
+\xfbR\x7f\xc1Y?k\x0f\x1exKU\x9fW\xf0\x87\
+\x85\xbcWc\xf0\x87\xc3\xf7\x92\xcd\x04\xf1=\xbf\xc2\xdd\
+\x22\xc7\xc1\xfa\xb4\xdad\xf6\xf8\x8f\xfb2\xe3\xc4\xb6:\
+\xfe\xa1f?\xd7\x13p\xdfiPqX\x9a\xc7\xfc\x17\
+\xa7\xfe\x0a\xd1\xaf|\x0c?\xb3\xd6\xa3\xfbf\xfcK\x93\
+\xc0\x12hO\xe1\xcb\x9dF\x18\xb4;?\x88\xf7z#\
+\xdb\x9b'\xb0\xbd\xf8\xa9a\xa4Z\xfcC\xb9\x13Y1\
+\xb5\x96Y<FoZ\x01\xe4=\xd0$4\x7f\x90[\
+\x0f@\x09D\xf9Al\x00\xc4\x0c\x85;\x14\x0f1\x87\
+>Z\xe6NGQ\xf3\xb1g\x0dt}?P\x9dN\
+t\x94SR\xbe\x9f\xf0\xda~\x7f\x86\xff\x00\xd2O\xfc\
+\x1a\x8f\xf0\xbe\xe7\xe2\x1f\xfc\x16\x0f\xe1g\x88b\xb9h\
+ \xf8G\xf0\xcf\xe2\xc7\xc4K\xbd\xb1\xb4\x9ez\xc9\xe1\
+\x87\xf0\x5cV\x92\xc8\xa0\x88\x92i<d\x93Bd\xda\
+\xb2\x9bo\x93=k\xfa\xd8\xff\x00\x83\xc2?\xe5\x13\x9a\
+w\xfd\x9c\xe7\xc2_\xfd5x\xd6\xb8\xcf\xf85W\xfe\
+\x09K\xe2\xaf\xd8\xc3\xf6{\xf1g\xedk\xf1\xc7D\x9b\
+C\xf8\xd5\xfbTh\xbe\x1d_\x09\xf8SS\xb0\xb8\xb3\
+\xd6\xbc\x01\xf0Z\xcd\xa4\xd6t\xa8\xb5\x7f:e\x11\xeb\
+~>\xbf\x96\xc3\xc4W\x9al\x96\x10\x5c\xe8\xdaf\x9d\
+\xa3\xc2\xf72O}}ii\xda\xff\x00\xc1\xe0\xca[\
+\xfe\x099\xa6\x802\xc7\xf6\x9d\xf8F\x14z\xb3i\x9e\
+4EQ\xee\xc5\x80\x1e\xe4r\x074\xae\xe5%\xea\xb6\
+\xf5-.ZRN\xfbK~\x9e\xed\xad\xfeG\xf9p\
+\x1e\xa3\xea?\xf4h\xff\x00\xebW\xfa\xe3\xff\x00\xc1\xb0\
+\xff\x00\xf2\x85o\xd9/\xfe\xbe>.\xff\x00\xea\xe8\xf1\
+\xd5\x7f\x91\xbf%\xc7\x0c8\x07\xa6xf\x12/+\x9c\
+\x12\xb8\xca\x9c0'\x04\x02+\xfdq?\xe0\xd8\x87\xff\
+\x00\x8d+~\xc9\x7f)\xff\x00_\xf1w\xd3\xa9\xf8\xcf\
+\xe3\xa3\x82\x01$\x10\x08'#\x01N\xec\xe0\x1c\x5c\xf6\
+^\xa4\xe1\xfe'\xf2\xfc\xcf\xe8\x01\xf3\xb5\xb0@\xe3\xa9\
+\x19\x03\xea23\xf4\xce\x0f~+\xfc\xfb?\xe0\xf5\xef\
+\x80\x8fi\xe3\x8f\xd8\x97\xf6\x9b\xd3t;x\xed\xf5\x9d\
+\x0f\xe2o\xc1\x1f\x18\xf8\x8d^\x08\xee\xaeu\x0d*}\
+\x0b\xc6\xfe\x03\xd2\xa5\x8fp\x9aXm\xac.|\x7ft\
+\x92\x90c\x84\xca\xd1\x06\xcb\xe0\xff\x00\xa0\xa3\x0d\xc0\x8f\
+^\x0f^\x87\x83\xf8\xe38\xf7\xaf\xc8?\xf8-\xd7\xfc\
+\x13\x92o\xf8)\xa7\xec\x15\xf1\x17\xe07\x86\xe7\xd1\xec\
+~.hw\xbaw\xc4\x8f\x82z\x96\xb5\x19:t\x7f\
+\x10\xfc.\x97-\x0e\x83wt\xb3[\xc9aa\xe3=\
+&\xebS\xf0\xbd\xde\xa2\x1eT\xd3[Q\xb6\xd4\xa6\xb3\
+\xbeK\x13m&j\xd7\xd7ci\xab\xc5\xae\xeb\xfa\x7f\
+-\xcf\xf1\xc0\xd3o\xaet\xadOO\xd4mU\xbe\xdb\
+\xa6_\xd9\xdf\xdb\xa28\x8aQ=\x8d\xe4\x17P'\xcd\
+\x13<r\x09\xa3R]\xb3\xe5\xf3\x84V\xdcO\xfb\x8c\
+~\xc5?\x1ft_\xda{\xf6H\xfd\x9c\xfe?\xe8\xfa\
+\xac:\xb4\x1f\x15\xbe\x0fx\x0f\xc5\xd7\xb7\x91,\xb1\xab\
+k\xda\x8f\x87\xac?\xe1%\xb7\xf2\xa7H\xe7I,\xfc\
+B\xba\x8d\xa3\xc7$i h\xc6Po\x5c\xff\x00\x88\
+\x8f\xc4o\x87\x1e<\xf8A\xe3\xcf\x18\xfc,\xf8\x9b\xe1\
+]o\xc0\xbe?\xf8{\xe2=[\xc1\xfe6\xf0\x8f\x88\
+l\xda\xd7W\xf0\xd7\x884K\xb6\xd3\xf5\x0d7Q\x1b\
+\xfe\xce\xb2Cs\x1e#\x9635\xb5\xd4&+\x8b\x1b\
+\x9b\x8b9`\x90\xfe\x81\xfe\xc7\xff\x00\xf0X\xff\x00\xf8\
+(\xdf\xec)\xe0;\x9f\x85\xff\x00\xb3G\xed/\xe2\x9f\
+\x06|6\x9a]F\xe2\xc7\xc0Z\xc6\x99\xe1\xcf\x1dx\
+OA\xb9\xd5f7z\x85\xd7\x86t\x7f\x19i:\xdd\
+\x9f\x87.o/\x1e[\x99\xe4\xd0\xe2\xb0\x12]K5\
+\xec\x8b%\xd4\xf2\xbb\x5c\xad7\xa3\xd5$\xac\xfc\xad\xfd\
+\x7fW9\xe9\xcf\xd9\xf3&\xb4\xfd\x7f\xca\xce\xe7\xf5i\
+\xff\x00\x07\xa9\xfe\xd3\x1e\x0e\xb9\xd0\xbfc\xbf\xd9\x13I\
+\xd4 \xbe\xf1\xc5\xaf\x88<Y\xfb@\xf8\xbe\xd6\xde\xec\
+4\xba\x07\x87\x7f\xb2&\xf0\x1f\x82\x93P\xb6TQ\x8f\
+\x15\xde\xea>-\xbb\xd3\x1cM \x0b\xe1{\xed\xd1\xa2\
+\xbc\x0f'\xf01\x05\xad\xd5\xf4\xf0Y\xd8\xc15\xcd\xed\
+\xe4\xd0\xda\xd9\xdb\xdb\xa9{\x89\xee\xeeeHm\xa1\x81\
+\x17\xe6y\xa6\x99\xd2(\xa3_\x9aGuE\x04\xb0\x07\
+\xd4\xbe8\xfcu\xf8\xb9\xfbI\xfcP\xf1W\xc6o\x8e\
+\xbf\x10<E\xf1?\xe2\x87\x8d\xef\x86\xa1\xe2o\x18\xf8\
+\xafRmGW\xbc\x92\x08\xa1\xb6\x82\x09\x19\xf6\xc7c\
+a\xa7[G\x0d\xad\x8d\x8d\xbd\xbd\xad\x9e\x9dg\x04V\
+\xd6\xb1\xa5\xbcQ\xc5\x07\xf4\x17\xff\x00\x06\xd6\xff\x00\xc1\
+#\xfcc\xfbt~\xd6~\x10\xfd\xa3\xfe(x\x12\xe9\
+\xff\x00d\x1f\xd9\xd7\xc4\xf6>(\xf1\x06\xb3\xe2\x1d-\
+\xc7\x86>)|H\xd1\x04\x1a\xb7\x85\xfe\x1ah\xd2]\
+\xb4v~ \x82\xc2\xfc\xe9\xfe \xf1\xe4pC\xaaX\
+XhV\xf0\xe8\xda\xc4V\xf3\xf8\x92\xc3r\xbb\x86\x9a\
+k\xaf_\xf8\x03m\xd5\x92iY/\x9e\xb7\xbf\xeb\xb9\
+\xfd\xc2|S\xf8]\xe3\xcf\xd9;\xfe\x0d\xde\xf1\xc7\xc3\
+\x1f\x0d\xea^)\xf0/\xc4\xcf\x82_\xf0MMv$\
+\xd4t\x9dN\xff\x00@\xf1\x97\x84<m\xa1\xfc\x18\x9f\
+\x5c\xd5\xd6\xc3R\xd2.\xed\xf5\x0d+\x5c\xf0\xfe\xaeo\
+\xe0\x86{;\xa8\xee-\xa7\xb5\x0f\x14\xab\xb5Y\xbf\xcb\
+M\xbf\xe0\xa0_\xb7\x8eO\xfcf\xc7\xedx\xb88*\
+\xdf\xb4\x87\xc6\x1d\xcaG\x05X\x7f\xc2\x5c\x08*F\x0a\
+\x91\x95#\x07$\x13_\xed\xaf\xe3\x8f\x06xw\xe2\x07\
+\x83|S\xe0/\x17ivZ\xef\x86<g\xe1\xddk\
+\xc3\x1e%\xd2\xf5\x1bK{\xcb\x0d[G\xd7\xb4\xe9\xf4\
+\xcdV\xc6\xf2\xca\xf2+\x9bK\x9b{\xcbI\xa7[\x9b\
+Y\xe2\x96\x09\x11\xc4SA*;\x01\xfe,\x7f\xf0R\
+\xbf\xd8'\xe2\x87\xfc\x13\x87\xf6\xb7\xf8\x9f\xfb7\xfcF\
+\xd1\xb5K=\x1bG\xd6\xb5-_\xe1O\x8bo\xa1\x9b\
+\xfb?\xe2\x0f\xc2k\xfdJ\xef\xfe\x10\xcf\x16iz\x9b\
+ZZZ\xea/6\x99\x1a\xd8kf\xd20\x96>!\
+\xd3\xf5}5\x94Kf\xe0\x0b\xde\x93\xbfn\x9f$]\
+Nk$\xba[_\xc3\xd1\x7f_/\xf4\x9c\xff\x00\x83\
+^\x7fjY\xff\x00i\x8f\xf8%\x9f\x81-\xfcY\xf1\
++\xc6\x1f\x13\xbe-\xfc\x1e\xf8\x8b\xf1+\xc0\xbf\x15\xb5\
+\xaf\x88^)\xd4\xbcW\xe3#\xa8\xea^&\xbe\xf1\xb7\
+\x85\xee/5M{T\xd5\xfcC}\xa3K\xe1?\x12\
+\xe9\xda~\x91\xa8j7)\x03\x5ch\xfa\xa6\x97\xa7+\
+&\x91r\xb1~\x92\x7f\xc1Z\x22\xf8?7\xfc\x13S\
+\xf6\xe0_\x8e\x96\xfae\xdf\xc3K\x7f\xd9\xa7\xe2\xcd\xde\
+\xbbm\xa8\xbe\x99\x14\x92^\xdbxGT\x9f\xc3cE\
+\x93V\x22\xda/\x15\x9f\x12\xc3\xa5\x7f\xc2\x1e\xf1\x7f\xc4\
+\xc7\xfe\x12a\xa5\x7fc\x91\xaa\x1b&\x1f\xe4\x09\xfb!\
+~\xde\x9f\xb5\xc7\xec\x1d\xe3-S\xc7?\xb2\x7f\xc6\xff\
+\x00\x16\xfc#\xd65\xe8\xac\xa0\xf1E\xa6\x8bqg\xa8\
+x{\xc5qi\xbet\x9aT^+\xf0\xc6\xa7\x05\xf7\
+\x87\xfcC\x1e\x9en\xae\xce\x99.\xa5\xa6\xdc\xbd\x81\xbc\
+\xbc\x16W(.%\x8c\xfb\xf7\xed\x83\xff\x00\x05\x8d\xff\
+\x00\x82\x8e\xfe\xdd\xde\x0d\x1f\x0d\xff\x00i_\xda_\xc5\
+>1\xf8v\xf7\x16\xf7W^\x02\xd14\xaf\x0dx\x13\
+\xc2:\xbd\xd5\x95\xc2]\xd8\x5ck\xbe\x1f\xf0^\x95\xa0\
+\xd8\xf8\x82[\x0b\x98a\xba\xb2\x8fPI\x96+\xb8\xd2\
+dQ4QH\xb5\xec\xdcur\x8e\x9a\xe8\xef\xdb\xfa\
+\xf9\x09\xd6\x8bVi\xec\xbdz[\xa5\xbfC\xf3\x1f\xf8\
+c$\xa8.\xa3\xf8Dj[,\x00R\xc7.X.\
+y;\x83f0\x0e\xc1_\xe8s\xff\x00\x06L\xfc?\
+\xf1n\x95\xf0\x1b\xf6\xee\xf8\xa1\x7f\xa7I\x07\x81\xfcu\
+\xf1S\xe0\xb7\x83\xbc-\xab\x99c\xd9\xa9x\x8f\xe1\xc7\
+\x85\xfc\x7f\xa9\xf8\xc6\xc6\x182\x5c6\x93e\xf1\x17\xc1\
+\xf2\xc9#\xa9\x8ef\xd5\x0am-\x14\x81\x7f\x81\xbf\x82\
+\x1f\x04\xfe,~\xd2_\x15\xbc\x15\xf0G\xe0W\x80\xf5\
+\xdf\x89\x7f\x14\xfe\x22\xeb0\xe8^\x12\xf0g\x86\xed\xda\
+\xf7P\xd4\xefe,\xd3\xdcM(6\xf6\xf6\x1aF\x9d\
+l\xb7Z\x96\xb5\xae\xea\xafg\xa5\xf8\x7fI\xb3\xbc\xd4\
+\xf5\x8dJ\xd2\xc6\xc6\xf2{\x7f\xf6+\xff\x00\x82@\x7f\
+\xc1>l\x7f\xe0\x9a\x9f\xb0w\xc2O\xd9\xad\xe6\xd3\xef\
+\xfc{\x047\x9e:\xf8\xc9\xae\xd8=\xa4\xf6\xba\xff\x00\
+\xc5\x9f\x18\x1bk\xaf\x14\xcf\x05\xdd\xa6\x9b\xa6}\xba\xc3\
+E\x86\xd3K\xf0\xa6\x85ws\x14\xd7\x9f\xd8\x9a\x06\x9c\
+\xb77w\xc6\x08\xe43)&\x95\xaf\xfd~\xbf\xf0E\
+C\xe2\xd55\x1d\xef\xeb\xa7n\xde\x9f3\xfc\xd8?\xe0\
+\xe5\xdf\xf9M\x0f\xed\x85\xff\x00_\x9f\x0b\xff\x00\xf5Q\
+\xf8\x16\xbf\x19~\x0e|Q\xf1_\xc1\x0f\x8b\x7f\x0c>\
+3x\x17R}\x1b\xc6\x7f\x09\xfe xC\xe27\x85\
+u\x88\xe2\x86y4\xad\x7f\xc1\xda\xfd\x86\xbd\xa4\xea1\
+\xc5r\xafi+\xda^\xd8\xc32\xc5v\xadm)O\
+*Q\xb5\xeb\xf6k\xfe\x0e]\xff\x00\x94\xd0\xfe\xd8_\
+\xf5\xf9\xf0\xbf\xff\x00U\x1f\x81\x7f\xcf\xb5~>|\x02\
+\xf8\x19\xf1\x0b\xf6\x96\xf8\xc5\xe0\x0f\x81?\x0a4\xcbm\
+g\xe2O\xc4\xddz\x0f\x0cx+G\xba\xbe\x87L\x87\
+V\xf1\x15\xe4r>\x9b\xa5\xff\x00h]b\xd6\xd2M\
+B\xe2%\xb4\x8a[\x97\x8a\x01$\xab\xe6M\x12\xe6E\
+qW\x8b^\x7f\xe4gSJ\x8d\xf4\xba~}\x1f\xeb\
+\xf8\x1f\xed\xef\xfb8\xfc~\xf8m\xfbR\xfc\x0d\xf8c\
+\xfbA\xfc#\xd6\xa2\xd7\xbe\x1e|\x5c\xf0\x8e\x8b\xe3?\
+\x0c^\xab\xc4\xd3\xc7k\xab\xda%\xc4\xda^\xa0\x91<\
+\x89m\xach\xd7F\xe3J\xd6,\xc4\x8el\xf5\x1b;\
+\x98\x0b\xb8@\xed\xfej?\xf0v\xe7\xed\xa3\xe1\xbf\xda\
+W\xfe\x0a%\xe1O\x82\xbe\x00\xf1<~'\xf0/\xec\
+\x89\xf0\xea\xef\xc0\xba\xa1\xb6\x16\xff\x00\xd9\xd6?\x19\xbc\
+q\xad\x8dg\xe2\x85\xae\x9d\xa8@\xd2\xbd\xf1\xb4\xd1\xb4\
+_\x87\x1a&\xa4\xd3\x18\xff\x00\xb3\xf5\x9d\x13P\x81`\
+h!3\x5c\x7f=\xde\x11\xfd\xa3\xbfk\xef\xd9\xb2\xdb\
+\xc5\x1f\x08<\x09\xf1\xe3\xf6\x8b\xf8\x0fkc\xe2\x1dc\
+M\xf1\x97\xc3\x8f\x0a\xfcN\xf8\x89\xf0\xee\xd6\xdb\xc5v\
+S\xb6\x8d\xe2\x0bo\x10\xf8KC\xd64Ha\xf1\x05\
+\xad\xdd\x83\xe9:\xb4W\xd6\x0f~n\xe1{+\x96I\
+!h\x9b\xe6\xeb\x99\xae.f\x96\xe2\xeei\xa6\xb9\x96\
+W\x9ain\xdeI.d3\xc8d\x96I\x1efi\
+\xa7i\x9d\xdai.\x18\x88\xe6\x95\xe5%%\xd8MR\
+\x8a\x8b\xba\xbe\xddK\x95U$\xd5\x9aO\xf4\xb3:\xaf\
+\x87~\x09\xd7\xfe&\xf8\xff\x00\xc1?\x0e<'\xa5^\
+k\xde(\xf1\xef\x8b|;\xe0\xdf\x0fhzr\xf9\x9a\
+\x86\xab\xad\xf8\x9bW\xb5\xd1\xf4\xbd:\xd10O\xdao\
+o.\xa3\x82\x0e2]\xb7)\xf9r?\xd8\x8b\xfe\x0a\
+\xa1\xe0K\x7f\x85\xbf\xf0E\x9f\xdb/\xe1o\x81\xfe\xd2\
+to\x87?\xb0\xa7\xc4\x0f\x00\xe8\x9es\x17\xb9\xff\x00\
+\x84W\xc1\xff\x00\x0a\xa6\xf0\xd8k\x898\xde\xe3@\xd3\
+%7\x12\x11\x82\x1c\xbb\x11_\xc1\xa7\xfc\x1a\xc5\xff\x00\
+\x04\xe0\xf1g\xedY\xfby\xf8O\xf6\xa3\xf1W\x83\xaf\
+\xa4\xfd\x9f\x7fdMN\x1f\x1cO\xe2\xbdJ\xc2E\xf0\
+\xe7\x88\xbe6\xd9\xc0.~\x1bxOH\xbb\x98\xc0\xb7\
+\xfa\xe7\x85o\xe7\xb7\xf8\x89\x7f\x0e\x9b%\xcc\x9e\x1eM\
+7@\x1a\xb8\xb5]oM\x8e\xf3\xfd:~4|#\
+\xf0\x9f\xc7\x1f\x84_\x14>\x0b\xf8\xfa\xd1\xf5_\x03|\
+[\xf8\x7f\xe2\xff\x00\x86\x9e/\xd2\xd2i\xad\x8d\xff\x00\
+\x86<m\xe1\xfb\xdf\x0ekvBh\x08\xb8\x83\xce\xb0\
+\xd4n\xe3[\x9by#\x9a\x016\xe8\xd9Z\x18\x9d2\
+m\xbdY\xa5\x188\xc6\xce\xf7\xd1~]:\xf6\xfdz\
+\x1f\xe1\x1f\x96\xfe%enw+\x06V\x0d\xb8\xee\xc8\
+p\x08\xf9\xb2q\x81\x8f\xaek\xfd+\x7f\xe0\xcb\xff\x00\
+\x1a\xf8KQ\xff\x00\x82z\xfe\xd2?\x0f\xec5k\x1b\
+\x8f\x1b\xf8S\xf6\xb9\xd6\xbcO\xe2=\x0e9\x11\xb5-\
+/\xc3\xfe8\xf8I\xf0\xbbM\xf0\x86\xa7v\x8b\x99R\
+\xd3[\xd4<\x09\xe3+]1\xd8a\xa7\xd0u$\x88\
+\x16\x89\xb3\xfe{\x9f\xb5\xbf\xec\xc5\xf1'\xf61\xfd\xa4\
+~0~\xcc_\x16\xf4\xf9\xec<m\xf0\x7f\xc6z\xa7\
+\x85\xefnf\xb3\xb8\xd3\xad<A\xa5\xc5;M\xe1\xff\
+\x00\x17i0\xde\x12\xcb\xa1x\xabA\x9bM\xf1\x16\x95\
+/\x9f<f\xc3S\xb6\xcd\xd4\xd2\x96f\xef?cO\
+\xdb\xeb\xf6\xb5\xff\x00\x82~\xf8\xf3Y\xf8\x8b\xfb'\xfc\
+`\xf1\x07\xc2\xbf\x11x\x87J\x87E\xf1E\xa5\xa5\xa6\
+\x99\xacx\x7f\xc5\x1ae\x9c\xd3\x5c\xe9\xf6\xde$\xf0\xaf\
+\x88\xec\xb5M\x03Y:m\xcd\xcd\xcc\xba]\xd5\xe6\x9b\
+-\xce\x97%\xd4\xefd\xe9\xe7\xdc\x09\xf4\xb74c\xd2\
+\xdf\xd7\xf5\xfa\x18\xc6\x5c\xb3\x92\x96\x8a\xf7V\xde\xee\xde\
+\xbd6\xeb~\xc7\xfb\x04\xff\x00\xc1L\xff\x00j\xaf\x87\
+\xbf\xb1\x97\xec+\xfbI|}\xf8\x8f\xaaX\xd9\xd8\xf8\
+g\xe1w\x8b4\xdf\x0di77Io?\x8c~ \
+\xf8\x83F\xbe\xd1\xfc\x0f\xe0}0\x1d\xd2K\xa8\xf8\x97\
+\xc4w6V\x04\xc5\x0c\xe7O\xb17\xda\xbd\xd4b\xc3\
+N\xbb\x91?\xc4\xb9\x17b*pv\xa8RC1\xc9\
+\x03\x1e\x8a\xac\xa3\x19Ve\x0e72\x83\xe5\x85\x03\xf6\
+B\x0f\x8c\xbf\xf0T\xef\xf8/W\xed%\xf0\xbf\xf6n\
+\xf1\x87\xc6_\x1b|p\xf16\xbb\xad^\xeb\x1a'\x87\
+\xf5i\x97\xc3\xdf\x08\xfe\x1b\xe9\xd6v1G\xe2\x7f\x88\
+\xba\xbf\x86\xbc\x1f\xa6\xdbxoC\xd2\xb4\x0d*).\
+/\xb5xt;\xbdJS~4\x8d\x19'\xbe\xd6\x22\
+\xb3\xd4\x7f\x1e\xeflot\xcb\xdb\xcd7R\xb4\xb9\xb0\
+\xd4\xb4\xeb\xa9\xecu\x0d>\xee\x17\x82\xf2\xc6\xf6\xd6g\
+\xb7\xb9\xb4\xbb\xb7p%\x82\xe6\xdex\xa4\x8axdU\
+x\x9dv\xb8\x04\x8aq\x5c\xaa\xde\x7f\xa2\x1dI)\xda\
+\xcaN\xdd\xbb\xf6\xdb\xf1\xfc\x8f\xef\xab\xfe\x0c\x7f i\
+\x1f\xf0R\xd2z\x0dK\xf6C\x04\xf3\xc16\xbf\xb4\xbf\
+\x1f\xa1\xfaw\xa5\xff\x00\x83\xda>\x09\xdf\xdch\x7f\xb0\
+\x9f\xed%\xa7\xd9\xd8\xa6\x97\xa2k\x7f\x18>\x09x\xaf\
+Si\xa2[\xf9/\xbcS\xa7\xf87\xc7\x9f\x0e\xed\x05\
+\xbf\x92\x1aM>\xde?\x06\xfcK\xb8\x96yg\xfd\xdd\
+\xcd\xd41${%w\xaf9\xff\x00\x83#~ \xe8\
+\x9a\x7f\x8f\x7f\xe0\xa1_\x0a\xe6\xb8C\xe2O\x15\xf8K\
+\xf6x\xf8\x81\xa5\xd8\xf3\xe6\xcb\xa2x\x07X\xf8\xb5\xe1\
+\xbdv\xeb\x04\xe1a\xb7\xbf\xf8\x97\xe1\xd8]\x99p\xc6\
+\xe4m9B+\xfa\xc6\xff\x00\x82\xc5\xff\x00\xc1?!\
+\xff\x00\x82\x95\xfe\xc1\xdf\x17?f\xfd2\xf3J\xd1~\
+#H\xbaw\x8e\xfe\x0ex\x8b\x5c\xfbRi\x9aW\xc4\
+\xef\x07L\xf7\xda\x0c\x1a\x85\xcd\xad\xc5\xbb\xd8\xe9\x9e#\
+\xb6\xfe\xd1\xf0\x86\xa5\xa8O\x0e\xa5\x06\x93i\xae\xbe\xb4\
+\xba6\xab6\x9b\x1d\x9c\xf0\xdbRm\x7fZ#e\x1e\
+hY\xddsj\xfb\xf4\xf2\xf2\xec\x7f\x8cX\xca\xb26\
+\x18\x9d\xe8T'\xdfb\x18\x10\xa9\x8c\x90\xe7\xa2\xe0n\
+\xdd\x8d\xbf6+\xfd\xbf?\xe0\x9f\xbf\x1e4\xef\xdac\
+\xf6(\xfd\x95\xbe:i\xfa\x95\xbe\xa8\xff\x00\x12\xbe\x04\
+|5\xd7\xf5\x8b\xbbu1@\xde+\x7f\x0biv^\
+0\xb4H\x1f3E\xfd\x9f\xe2\x8bM^\xc8F\xe4\xba\
+\xc7\x02\x19@\xf9q\xfe(?\x14\xfe\x16|B\xf8\x1d\
+\xf1'\xc7\x1f\x08>,xWV\xf0?\xc4\xbf\x86\xfe\
+%\xd6<%\xe3_\x08\xeb\x90y\x1a\xa6\x85\xafh\x97\
+oc}is\x1aH\xd1K\x09\x9d\x0bZ]\xc14\
+\xb6\x1a\x9d\xa3Eycqucq\x0c\xf2}\xe5\xfb\
+\x1d\xff\x00\xc1`\xbf\xe0\xa2\x9f\xb0O\x83/~\x1a\xfe\
+\xcc?\xb4\x8f\x8a|\x0d\xf0\xee\xee\xea\xfe\xfe/\x01j\
+\x9ag\x87<m\xe0\xfd\x1bT\xd4\xe5\x12\xeaz\x8e\x81\
+\xa1\xf8\xd3H\xd7\xac\xf4+\xbb\xeb\xcbc=\xcc\x9a:\
+i\xd1Mr\xd7\xb7M\x14\xb7\x97\xd7\xb7/n<\xda\
+\xeacJq\x874Zk\xb7]\x92\xfb\xcf\xeb#\xfe\
+\x0fY\xfd\xa6<#7\x87\x7fc/\xd9\x07H\xd5 \
+\xd4<h\x9e\x22\xf1\x97\xed\x15\xe3]\x22\xdcHn|\
+=\xe1\xebm\x12\xe3\xe1\xe7\xc3\x8b\xdb\x9f2\xdc[\xdc\
+E\xe2\xcb\xcdW\xe2J[%\xbd\xc4\xb3\xd9\xc7\xe1K\
+\x89\xae\xed\xa1]CI\x96\xe7\xf8\x08@\xf22\xa2\xfc\
+\xee\xec\x802n \x15\x0a\x1b\xa9\xdc\xa0\x06RL\x9c\
+\xaa\xb0.G$\xfa\xe7\xc7_\x8f_\x18?i\xbf\x8a\
+\xbe*\xf8\xd9\xf1\xe3\xe2\x0f\x88\xbe'\xfcS\xf1\xad\xdc\
+W~\x22\xf1\x87\x8a\xf5\x0f\xb6\xea\x97\x9ff\x86+=\
+>\xda0\xde\x5c6:n\x99g\x12[i\x9a]\x80\
+\x8bO\xd2\xec \x8e\xd6\xde\x08\xed\xa0V?\xd0\xbf\xfc\
+\x1b9\xff\x00\x04\x9a\xf1\xdf\xed\xa7\xfbax'\xf6\xa1\
+\xf8\x89\xe0\xab\xd8\xbfe\x1f\xd9\x93\xc56>3\xbe\xd7\
+\xbcG\xa5j\x11x\x7f\xe2o\xc5\xcf\x0f7\xf6\x9f\x82\
+<\x07\xe1\xc9d\x16\x0b\xafG\xe1\xedut\x7f\x16x\
+\xda;)/\xb4\xed>\xc3N\xb1\xd1\xb5\xf8V?\x14\
+ZC,J)-/\xb8kVj\xd7J\xf7\xfc\xbc\
+\xbc\xfe\xef\x9d\xff\x00\xb7\xaf\xdb\xa7\xf6?\xf1F\xb3\xff\
+\x00\x06\xfa\xfcQ\xfd\x92\xf5;\x1b\x89\xfcy\xf0\xd3\xfe\
+\x09\xff\x00\xe0\xed>\xe7F\xd0\x90\xea\x97:\x97\x8f\x7f\
+g\x8f\x87\xde\x13\xf1\xb9\xd0\xb4\x85\xb1\x0e\xda\x85\xc6\xad\
+\xe2\xaf\x87\x8f\xa4\xd8\x0bE?m7\xb1\x88\xd1\x99\x90\
+\x1f\xf2\x11o\x9b\xef\x1c\x02\x01)\x81\x96W.x\xdc\
+\xbb\x86\xd6\x0cbl\x01\xf30\xc8!\x80\xff\x00|\x19\
+\x904m\xc6~\x5c\x01\x82\xdfO\x94\x10\xc4\x83\xc8\x01\
+\x94\x9cp\xca~a\xfe?\xdf\xf0]/\xf8$\xf7\xc4\
+\xff\x00\xf8&w\xedg\xe3[\x8b?\x06\xdc\xc5\xfb(\
+\xfcc\xf1\x9f\x8a<W\xfb<\xf8\xe7G\x86\xe2\xef\xc2\
+V:V\xa5\xa8^\xea\xad\xf0\xb3Q\xbf\x16\x90E\xa3\
+\xf8\xb3\xc0\xf6DY&\x93|\xcd%\xff\x00\x86\xad,\
+uk\x0b\xbdF\x18u+\x98R\x93Z+\x17Z\x0d\
+\xa4\xe3\xbaV\xda\xea\xda\x7f[\x9f\xd5\xd7\xfc\x19\x85\xfb\
+Ix?\xc4\xbf\xb2\x17\xed#\xfb,\x5c\xeb\x80\xfcJ\
+\xf8U\xf1\xcc\xfc[\xb6\xf0\xf5\xdd\xdc+<\xdf\x0c\xbe\
+*xO\xc3\x1a\x0d\x8d\xf7\x87\xec\xe4\x98\xde\xdf[i\
+>8\xf0/\x8a\x93\xc53\xdbZ\x9bm\x1e\x7f\x14\xf8\
+U.\xae#\x9b]\xb2\x8ao\xe8\x13\xfe\x0b/\xfbV\
+\xe8?\xb1\xaf\xfc\x13W\xf6\xb6\xf8\xc1\xabj\xf2h\xfa\
+\xfd\xcf\xc1\xef\x17|7\xf8g5\x9c\xb6\xa3S\x97\xe2\
+\xdf\xc5\x1d\x1e\xff\x00\xc1\x1f\x0e\xde\xc2+\xab\x8bX\xe7\
+\x1a>\xbb\xaaG\xe2\x8dJ1#\xdc>\x83\xe1\xfd^\
+[U\x92\xee\xde\x1bk\x8f\xf2\x09\xfd\x98?k?\xda\
+'\xf63\xf8\xa1e\xf1\x97\xf6d\xf8\xad\xe2\x7f\x84\x9f\
+\x11,\xec\xa6\xd2\xdf[\xf0\xdd\xd2F\x9a\xae\x91s5\
+\xb5\xcd\xde\x85\xaei\xd7\x91^i:\xee\x8bs5\xad\
+\xb4\xb7z^\xb1\xa6\xde\xd9<\xd6\xc8$\x87\xcd@\xd0\
+\xfb\xb7\xed\xa7\xff\x00\x05?\xfd\xb9\xff\x00\xe0\xa1c\xc3\
+\xb6\xdf\xb5\x7f\xc7\xdf\x14|O\xd0|#}.\xa9\xe1\
+\xcf\x07\xc7\xa7\xe9^\x1c\xf06\x95\xab\xcd\x0a\xd9M\xae\
+\xdb\xf8G\xc26:>\x88\xda\xebX\xff\x00\xa1\x9dV\
+{y\xf5\x1b(\xae\xa7\x86\x1b\xc5:\x9d\xc1\x17\xc8\xe5\
+\xef^*\xfd/n\xdf\xd7\xcb\xcd\x0a5Tb\x93N\
+\xebO\xf3\xe9\xeb\xe6|\x00:\x80[fH\x1b\xb8\xe0\
+\x93\x81\xd7\x8e\xa7\x18\xef\xd0s_\xea\x13\xff\x00\x06\x90\
+|\x16\xd4\xbc\x17\xff\x00\x04\x97O\x18_L\xf3C\xf1\
+\xbf\xf6\x98\xf8\xc5\xf1GK\x80\xc2CXi\xbav\x93\
+\xe0\x1f\x83\xebn\xc0\xf2\x05\xc5\xe7\xc2\x8b\xcdR3\x80\
+\x1e\x1dB)\x17*\xea\xc7\xfc\xe4\xff\x00c\xaf\xd9\x07\
+\xe3\x8f\xed\xd9\xfbAx\x17\xf6k\xfd\x9e|,\xfe)\
+\xf8\x81\xe3\x8b\xe0\x92M$\xa6\xd7@\xf0\x97\x86\xed\x99\
+\x1f\xc4\x1e7\xf1\x86\xad\xb2H\xb4\x8f\x09xoOi\
+o\xb5[\xfd\xb3M:F\xba~\x97m\x7f\xab^\xe9\
+\xf6\x17\x7f\xec\xfb\xfb\x1f~\xcc\x9e\x0c\xfd\x8e\xff\x00e\
+\xff\x00\x81\x7f\xb3\x17\x83\xb5\x03u\xa0\xfc\x15\xf8o\xe1\
+\xaf\x02\xc5\xac\x7fe\xc1\xa5\xcb\xe2mGH\xb1\x8e=\
+{\xc5\x97Zu\xc4\xfa\xb4\x967^(\xd7\xdbS\xd7\
+g\xb2\xfe\xd2\xbeK'\xbe\xfb\x22^]\xac\x02\xeab\
+R\xb6\x9f>\xbf\xf0\x07K\x99\xdd\xbd\x17M=7\xbe\
+\x9b\xedc\xfc9h\xa2\x8a\xb3\x98(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xff\
+\x00\xeb~\x84\x11\xf5\xc1\x00\xe0\xe4z\x8a(\xa0w\x7f\
+s\xb9\xfa\x15\xf0\xbb\xfe\x0a\xc5\xff\x00\x05$\xf8'\xf0\
+\xff\x00\xc2\xbf\x0a\xbe\x13\xfe\xda\x1f\x1e|\x03\xf0\xe7\xc1\
+\x1a\x5cZ'\x84\xbc\x1d\xe1\xbf\x19\xdc\xd8h~\x1f\xd2\
+ay$\x8a\xc3L\xb3H\xca\xdb\xdb$\x92\xc8\xe25\
+8\xdc\xecz\x93]\xf7\xfc>\xd3\xfe\x0a\xd1\xff\x00G\
+\xff\x00\xfbJ\x7f\xe1}w\xff\x00\xc6\xab\xf2\xde\x8a\x5c\
+\xab\xb7\xf5\xfd/\xea\xec\xaey\xff\x003?R?\xe1\
+\xf6\x9f\xf0V\x8f\xfa?\xff\x00\xdaS\xff\x00\x0b\xeb\xbf\
+\xfe5G\xfc>\xd3\xfe\x0a\xd1\xff\x00G\xff\x00\xfbJ\
+\x7f\xe1}w\xff\x00\xc6\xab\xf2\xde\x8a9Wo\xeb\xfa\
+_\xd5\xd8{I\xff\x003?R?\xe1\xf6\x9f\xf0V\
+\x8f\xfa?\xff\x00\xdaS\xff\x00\x0b\xeb\xbf\xfe5_0\
+~\xd2\x7f\xb7\x07\xeds\xfba\xc5\xe0\xd8?j\x1f\xda\
+\x0f\xe2g\xc7(\xbe\x1eM\xae\xdcx!~ \xf8\x82\
+mlxb\x7f\x13\x0d\x1d|A6\x91\xe6*}\x96\
+MY|?\xa1-\xe9_\xf5\xa3I\xb2\xc8\xccD\xb7\
+\xca\xd4Q\xca\xbb\x7f_\xd2\xfe\xae\xc1\xceoy0\xa2\
+\x8a)\x90\x14QE\x00\x14z\xfb\x82?\x03\xd4\x1e\xc4\
+\x11\xc1\x07 \x8e\xa2\x8a(\x00\x18\x1d\xbbm\xcf \xed\
+8\x05A\x18*\x08\x0c\xb8M\xbcI&0H#\xef\
+/\x86\x1f\xf0T\x7f\xf8(\xdf\xc1\xad8\xe8\xff\x00\x0d\
+\xbfm\xef\xdas\xc3z2\xd9\xd9\xe9\xd6\xda8\xf8\xc1\
+\xe3=[H\xd3\xf4\xfb\x05\x11\xdaXi:f\xb9\xaa\
+\xeav:E\x9c1\x81\x12[\xe9\x90Z\xc4\x22U\x8c\
+(E\x0a>\x0d\xa2\x86\xaf\xba\x1ammu\xe8~\xa4\
+\x7f\xc3\xed?\xe0\xad\x1f\xf4\x7f\xff\x00\xb4\xa7\xfe\x17\xd7\
+\x7f\xfcj\x8f\xf8}\xa7\xfc\x15\xa3\xfe\x8f\xff\x00\xf6\x94\
+\xff\x00\xc2\xfa\xef\xff\x00\x8dW\xe5\xbd\x14\xb9Wo\xeb\
+\xfa_\xd5\xd8\xd4\xe4\xb6\x93?R?\xe1\xf6\x9f\xf0V\
+\x8f\xfa?\xff\x00\xdaS\xff\x00\x0b\xeb\xbf\xfe5G\xfc\
+>\xd3\xfe\x0a\xd1\xff\x00G\xff\x00\xfbJ\x7f\xe1}w\
+\xff\x00\xc6\xab\xf2\xde\x8a9Wo\xeb\xfa_\xd5\xd8\xfd\
+\xa4\xff\x00\x99\x9f\xa9\x1f\xf0\xfbO\xf8+G\xfd\x1f\xff\
+\x00\xed)\xff\x00\x85\xf5\xdf\xff\x00\x1a\xa3\xfe\x1fi\xff\
+\x00\x05g\xe0\xff\x00\xc3\x7f\xfe\xd2\x99\x07 \xff\x00\xc2\
+}x\x08\xfa\x11\x16G\xa7\x18\xaf\xcbz(\xe5]\xbf\
+\xaf\xe9\x7fWa\xed'\xfc\xcc\xf5\xef\x19||\xf8\xcb\
+\xf1\x0b\xe3,\xff\x00\xb4/\x8d\xbe#x\xa3\xc4\xbf\x1b\
+n|W\xa3x\xe6\x7f\x89\xba\xa6\xa0\xf3\xf8\xb2_\x17\
+xz\xe2\xc6\xefE\xf1\x03\xea{VC\xa9\xe9\xd7:\
+f\x9f5\xad\xc1\x1b\xa1\x92\xce&L\x1f3\x7f\xddC\
+\xfe\x0bg\xff\x00\x05g\x1c\x0f\xdb\xfb\xf6\x93\x03\xd0x\
+\xfa\xec\x0ey\xe8\x22\xaf\xcbz(i=\xd0\x94\xe4\xb6\
+\x93Z\xdc\xfdH\xff\x00\x87\xda\x7f\xc1Z?\xe8\xff\x00\
+\xff\x00iO\xfc/\xae\xff\x00\xf8\xd5\x1f\xf0\xfbO\xf8\
++G\xfd\x1f\xff\x00\xed)\xff\x00\x85\xf5\xdf\xff\x00\x1a\
+\xaf\xcbz(\xe5]\xbf\xaf\xe9\x7fWc\xf6\x93\xfef\
+~\x84|S\xff\x00\x82\xaf\xff\x00\xc1H~7\xfc<\
+\xf1g\xc2\x7f\x8b\xbf\xb6g\xc7o\x88_\x0d\xbcu\xa5\
+\x8d\x17\xc5\xfe\x0c\xf1?\x8cn5\x0d\x0b_\xd2\xc5\xc4\
+Wb\xcbQ\xb4h\x97\xce\x80][\xdb\xdc\x05,1\
+$\x11\x91\x81\xbc?\xe7\xbd\x14P\x92[!9JZ\
+6\xda\x0a\xfa\x07\xf6k\xfd\xaa?h/\xd8\xfb\xe27\
+\xfc-\xaf\xd9\xaf\xe2\x87\x88\xfe\x12|E\xfe\xc3\xd4<\
+6\xde*\xf0\xc3\xda\xc7\xa9>\x85\xaa\xcbm6\xa3\xa6\
+3\xdd\xdb]G\xf6k\xb7\xb4\xb72\x81\x18\x7f\xdd\x0d\
+\xae\xbc\xe7\xe7\xea)\x896\x9d\xd6\x8c\xfd\x88\xff\x00\x87\
+\xfe\xff\x00\xc1b?\xe8\xfc~3\x9fRn<>I\
+\xf7\xff\x00\x90\x1e\x06}\x00\x03\xda\x8f\xf8\x7f\xf7\xfc\x16\
+\x1f\xfe\x8f\xc3\xe37\xfe\x04x\x7f\xff\x00\x94u\xf8\xef\
+E.U\xdb\xfa\xfe\x97\xf5vW\xb4\x9f\xf33\xf6#\
+\xfe\x1f\xfb\xff\x00\x05\x87\xff\x00\xa3\xf0\xf8\xcd\xff\x00\x81\
+\x1e\x1f\xe0\xf6#\xfe$|\x10yS\xd4\x10\x08\xe4W\
+\xc5\xff\x00\xb5o\xed\xdf\xfb\x5c~\xdc\x17\xde\x0f\xd4\xbf\
+j\xcf\x8e>0\xf8\xd5}\xe0\x1b]R\xcb\xc1\xf7>\
+-\x92\xc2It+]jKY\xb58l\xda\xc6\xca\
+\xcf\x0bw5\x9c\x12\xcb\xe6o-\x22n\xcfL|\x8f\
+E\x1c\xa9t\xfe\xbf\xa4'9\xb5g&\xd0\xa0\x901\
+\xd7\xa6I\xceN\x06\x008\xc0#\x05\xb7.6\xbe\xef\
+\x9c6\xd4\xdb\xf5_\x86\xff\x00n\xef\xdb\x8b\xc1\xda\x06\
+\x8d\xe1O\x08\xfe\xd9\x9f\xb5w\x85\xfc/\xe1\xcd:\xcf\
+G\xf0\xff\x00\x86\xfc;\xfbD\xfc^\xd14\x1d\x0bH\
+\xd3\xa0K]?J\xd1\xf4}3\xc6\x16\xba~\x99\xa6\
+\xd8\xdbG\x1d\xbd\x9d\x8d\x95\xbc6\xb6\xd0\x22E\x0cI\
+\x1a\xaa\x8f\x94\xe8\xa6%&\x95\x93\xb2>\xc6\xff\x00\x87\
+\x89\xff\x00\xc1@\xff\x00\xe8\xfa\x7flo\xfcI\xbf\x8d\
+\x7f\xfc\xdb\xd1\xff\x00\x0f\x13\xff\x00\x82\x81\xff\x00\xd1\xf4\
+\xfe\xd8\xdf\xf8\x93\x7f\x1a\xff\x00\xf9\xb7\xaf\x8eh\xa5\xca\
+\xbb\x7f_\xd2\xfe\xae\xc3\x9a]\xd9\xf68\xff\x00\x82\x89\
+\xff\x00\xc1@\xb23\xfbs\xfe\xd8\xa7\x91\x90\x7fi\xbf\
+\x8d\x98a\xfd\xd6\x1f\xf0\x9b\xfc\xcaA \x83\xc6\x18\xe3\
+\x9ek\xe6\xef\x88\x1f\x12\xbe#|Y\xf1E\xef\x8e>\
+*\xf8\xff\x00\xc6\xbf\x13|k\xa9\xa5\xb4z\x97\x8c~\
+ x\xab]\xf1\x8f\x8au\x04\xb3\x84Ah\x97\xda\xff\
+\x00\x88/\xf5\x0dV\xedm\xa2\x0b\x1c\x0bqu\x22\xc7\
+\x1a$j\x04h\xa88\x9a(I-\x97\xf5\xfd!\xf3\
+K\xb9b\xd6\xee\xea\xc6\xe6\xde\xf2\xca\xe6\xe2\xce\xf2\xd2\
+X\xe7\xb4\xbb\xb5\x9aX.mf\x89\x8b\xc75\xbc\xd1\
+\xb2\xc9\x14\xa8\xff\x00:J\x8c$W\xc3+\x06\xe6\xbe\
+\xaa\xd2?o\x8f\xdb\xab@\xb1\x83K\xd0\xbfmO\xda\
+\xd7E\xd3-cX\xadt\xed'\xf6\x8f\xf8\xc7\xa7X\
+\xdbD\x80*\xc7\x05\xa5\x9f\x8c\xa1\x82$U\x01Q\x11\
+\x02\xa2\x80\xaa\x00\xe2\xbeM\xa2\x86\x93\xdd\x0b\x9a]\xd9\
+\xf67\xfc<K\xfe\x0a\x06?\xe6\xfa\x7flo\xfcI\
+\xcf\x8d\x87\xf9\xf8\xde\x8f\xf8x\x9f\xfc\x14\x0f\xfe\x8f\xa7\
+\xf6\xc6\xff\x00\xc4\x9b\xf8\xd7\xff\x00\xcd\xbd|sE\x1c\
+\xab\xb7\xf5\xfd/\xea\xec9\x9fw\xf7\x9fc\x7f\xc3\xc4\
+\xff\x00\xe0\xa0\x7f\xf4}?\xb67\xfe$\xdf\xc6\xbf\xfe\
+m\xe8\xff\x00\x87\x89\xff\x00\xc1@\xff\x00\xe8\xfa\x7fl\
+o\xfcI\xbf\x8d\x7f\xfc\xdb\xd7\xc74Q\xca\xbb\x7f_\
+\xd2\xfe\xae\xc3\x99\xf7\x7fy\xf60\xff\x00\x82\x89\xff\x00\
+\xc1@\xc3+\x7f\xc3t~\xd8\xb9V\x0c\xb9\xfd\xa6\xfe\
+5\x9cc9\x1c\xf8\xdb\x90\xdc\x16\x07 \xec^\xdb\x81\
+\xf9\x9f\xc3\x1f\x10<{\xe0\x9f\x17\xe9\xff\x00\x10\xbc\x1b\
+\xe3\x7f\x18xO\xe2\x06\x95\xaaM\xad\xe9\x9e:\xf0\xd7\
+\x89\xb5\xad\x0b\xc6:v\xb1pY\xa7\xd5l|K\xa5\
+\xde\xda\xeb\x16\xba\x94\xcf,\xf2M}\x05\xe2]\xcf%\
+\xcc\xef4\xd23\xe4r4Q\xca\xbb\x7f_\xd2\xfe\xae\
+\xc2\xef\xbb>\xc6\xff\x00\x87\x89\xff\x00\xc1@\xff\x00\xe8\
+\xfa\x7flo\xfcI\xbf\x8d\x7f\xfc\xdb\xd1\xff\x00\x0f\x13\
+\xff\x00\x82\x81\xff\x00\xd1\xf4\xfe\xd8\xdf\xf8\x93\x7f\x1a\xff\
+\x00\xf9\xb7\xaf\x8eh\xa3\x95v\xfe\xbf\xa5\xfd]\x85\xdf\
+v}\x8d\xff\x00\x0f\x13\xff\x00\x82\x81\xff\x00\xd1\xf4\xfe\
+\xd8\xdf\xf8\x93\x7f\x1a\xff\x00\xf9\xb7\xaf9\xf8\x9d\xfbX\
+\xfe\xd4\xff\x00\x1b|<\x9e\x11\xf8\xcf\xfbK~\xd0\x1f\
+\x17|'\x16\xa3m\xab\xc5\xe1\x7f\x89\xdf\x19~#x\
+\xf7\xc3\xb1j\x96\x91\xcd\x15\xae\xa5\x1e\x89\xe2\x9f\x12j\
+\x9aj_\xdb\xc7qp\xb0\xde\x8bo\xb4\xc4.&\x11\
+\xca\xa1\xc8\xaf\x9f\xe8\xa3\x95v\xfe\xbf\xa5\xfd]\x873\
+\xee\xc2\x8a(\xa6K\xdb\xe6\xbf4E?\xfa\x89?\xeb\
+\x94\xdf\xfa\x00\xaf\xf6\xf7\xff\x00\x82n\xff\x00\xc9\x80~\
+\xc6_\xf6m?\x07?\xf5\x06\xd1\xab\xfcB'\xff\x00\
+Q'\xfdr\x9b\xff\x00@\x15\xfe\xde\xff\x00\xf0M\xdf\
+\xf90\x0f\xd8\xcb\xfe\xcd\xa7\xe0\xe7\xfe\xa0\xda5D\xf6\
+^\xbf\xd7\xf5\x7f\xbf\xa7M\x0e\xbf?\xd0\xfbQ\xfe\xe9\
+\xfc?\x98\xaf\x07\xfd\xa5?\xe4\x8a|E\xff\x00\xb1~\
+\xe7\xff\x00CZ\xf7\x87\xfb\xa7\xf0\xfeb\xbc\x1f\xf6\x94\
+\xff\x00\x92)\xf1\x17\xfe\xc5\xfb\x9f\xfd\x0dk\xf3_\x17\
+\xff\x00\xe4\xd5\xf8\x89\xff\x00dg\x11\xff\x00\xea\xb6\xa9\
+\xf4\xfc+\xff\x00%?\x0e\x7f\xd8\xef-\xff\x00\xd4\xdc\
+1\xf8\x93\xfck\xfe\xf4\xbf\xfa\x1aW\xedW\xec\xc1\xff\
+\x00$[\xc1\x1f\xf6\x0f\x7f\xfd-\xbb\xaf\xc5l\xe6E\
+\xff\x00zO\xd1\xa3\x15\xfbS\xfb0\x7f\xc9\x16\xf0G\
+\xfd\x83\xdf\xff\x00Kn\xeb\xfc\x82\xfd\x99\xf7\xff\x00\x88\
+\xc3\xc5\xff\x00\xf6F\xe2?\xf5g\x83\xff\x00\x80\x7f_\
+\xfd'?\xe4\x93\xc8\x7f\xect\xbf\xf5\x0e\xb9\xf4+(\
+e*s\x83\xc1\xc1 \xfe\x04r?\x0a\xfc\xc2\xfd\xb3\
+\xbf\xe0\x8e\xbf\xb0\x07\xfc\x14\x0b\xe2F\x8b\xf1c\xf6\xb0\
+\xf8A\xac\xfcP\xf1\x9f\x87<3\x07\x844\x1b\x99~\
+&\xfcI\xf0\xfe\x95\xa4hP^\xdd\xea\x06\xdfN\xf0\
+\xff\x00\x86\xfcQ\xa5h\x96\x93\xdd^^I6\xa1{\
+\x05\x82^j-\x1d\xa8\xbd\x9eqin#\xfd>\xa2\
+\xbf\xdc#\xf8\x84\xfc\x04?\xf0l/\xfc\x11d\xe7\xfe\
+1:\xe9I\x04e~0\xfccV\x19\x18\xdc\xac<\
+q\xb9X\x02\xc1YH`\x1d\xb0y\xaf\xdb\x1f\x84\x1f\
+\x08\xfc\x01\xf0\x1f\xe1w\x81>\x0d|,\xd0b\xf0\xaf\
+\xc3\x9f\x86\x9e\x19\xd2<\x1f\xe0\xbf\x0f[\xcfsu\x16\
+\x8f\xe1\xed\x0a\xd2;-6\xc4]_Kqws\xe4\
+\xda\xc4\x91\xbc\xf7S\xcd4\xb8/$\x8c\xe4\xb1\xf4\xaa\
+)\xb6\xde\xecI%\xb2\xfe\xbf\xa4\x15\x1c\xb1$\xd1\xbc\
+R(dudu!YY]J2\x95`\xcaA\
+\x0cA\x04\x10z\x10A \xc9E!\x9f\x84\x1e&\xff\
+\x00\x83j?\xe0\x8d\xde/\xf1'\x88<Y\xaf~\xca\
+r]k~'\xd75\x7f\x11j\xf7\x10\xfcV\xf8\xb5\
+e\x04\xba\xa6\xb9\xa8\xdc\xea\x9a\x84\x96\xf6V^3\x82\
+\xca\xca\xdd\xef.\xe6hl\xec\xe0\x82\xd6\xd62\xb0\xdb\
+\xc3\x1cH\x88=\x83\xf6c\xff\x00\x82\x10\xff\x00\xc10\
+\xbfc\xcf\x8d~\x11\xfd\xa1\x7fg\xbf\xd9\xf2\xeb\xc0\x9f\
+\x16|\x0a5e\xf0\xcf\x89G\xc4\xbf\x89z\xda\xe9\xe9\
+\xad\xe9W\xba&\xa8\x8d\xa5k\xbe+\xd4t\xab\xa5\xba\
+\xd3u\x0b\xabv\x17vsm\x12\x07\x8c\xab\xa2\x15\xfd\
+\x7f\xa2\x9d\xde\xc2I-\x91\x0b@\x8e\xa5\x1bqR\xa5\
+H\xc8\xe4\x10A'\x8eI\x07\x92s\xfc\xf3\xf8!\xfb\
+j\x7f\xc1\xb5\xdf\xf0K/\xdbS\x5c\xd6\xbci\xac\xfc\
+%\xd7\xfe\x02\xfcI\xf1\x16\xa2\xfa\xa6\xb9\xf1\x0b\xf6p\
+\xd7t\xef\x87\xfa\x86\xafy=\xe4\xba\x8e\xa3s\xaa\xf8\
+GU\xd0|U\xf0\xd3Q\xbc\xd5\xee\xa4g\xd4u;\
+\x9f\x04>\xac\xec\xcc\xf6\xda\x85\xb4\xace?\xbe\xb4R\
+\x1bW\xd1\xab\xab\xdf\xe6\x7f\x17k\xff\x00\x06V~\xc5\
+_\xdb_ho\xda\xeb\xf6\xa7\x7f\x0e\x99\xcb\x8d$i\
+\xff\x00\x0a#\xd6\x84\x05\x89\xf2\xff\x00\xe1 \xff\x00\x84\
+.[\x07\x98\xa9\xc3\xce\xde\x1c\x0a\xe7\xe60\x82M~\
+\xb4\xfe\xc3\xbf\xf0ng\xfc\x12\xf7\xf6\x19\xd74/\x1d\
+xK\xe1\x0e\xad\xf1\xa3\xe2\x9f\x87'k\xbd'\xe2w\
+\xed\x0f\xac\xd8\xfcF\xd7,/\x96v\x9a\xcfQ\xd3<\
+1o\xa3h\x1f\x0dtmSM\xca\xc7\xa7\xea\xfa7\
+\x81\xec5XV(d{\xd9n\xa2K\x81\xfb\xb4\x06\
+8\x02\x96\x81r\xc5ke\x7fOO\xf2D\x09o\x1c\
+x\x0b\xb8\x01\x90\x06x\x00\xfa\x00\x00\xe0\xe4\x8fM\xc7\
+\xb6\x00\xf9c\xf6\xc7\xfd\x89\x7ff\xff\x00\xdb\xe3\xe1,\
+_\x03\xbfj_\x01\xbf\xc4_\x86\x90\xf8\xa3H\xf1\x94\
+~\x1fO\x10x\x83\xc3dx\x87B\x8a\xf6\x0d2\xf8\
+\xea\x1e\x1b\xd4\xb4\xbdA\x85\xbcZ\x8d\xda\x9bf\xb96\
+\xd2\xf9\xbf\xbd\x89\xca\xa6>\xae\xa2\x81\xb5uf\xae\x99\
+\xf8\x08?\xe0\xd8_\xf8\x22\xc8\xff\x00\x9bM\xb8?6\
+\xec\x9f\x8b\xff\x00\x18\x89\xcf\xb9\xff\x00\x84\xe3'\xd7\x9e\
+I\xc9$\xe4\xd7\xeb\xaf\xec\xbd\xfb,\xfc\x12\xfd\x8d\xbe\
+\x0axK\xf6y\xfd\x9e|''\x81\xfe\x13x\x1c\xeb\
+\x07\xc3>\x19}gX\xd7\x9bO\xfe\xdd\xd6\xaf\xfcA\
+\xa9\xe7T\xd7\xafu\x1dV\xe4\x5cj\xba\x9d\xed\xc8\x17\
+W\x93\x08\x84\xc6(\xb6F\x02\xd7\xd0\xd4Sm\xbd\xdb\
+\x12\x8a\x8e\xc9+\x851\xd0H\xa5[8 \x83\x83\x8c\
+\x82\x08#\xf2?\x9f=@\xa7\xd1Hg\xe6\x17\xed\xcf\
+\xff\x00\x04u\xff\x00\x82{\xff\x00\xc1DO\xf6\xa7\xed\
+)\xf0\x07@\xd6<{\x1d\xac\x96\x96\x9f\x16|\x1fq\
+u\xe0?\x8aV\xe9\xf6U\xb5\xb4\xfbO\x8c|2\xf6\
+W\xda\xf4\x1ab\xc5\x03\xe9\xdaw\x89\xd7[\xd2m\x85\
+\xba[\x8b\x03g$\xf6\xf2\xfe\x01\xf8\x9f\xfe\x0c\xab\xfd\
+\x87/o\xfc\xdf\x08~\xd6_\xb5\x9e\x83\xa7\xe73[\
+\xf8\x91~\x11x\xae\xed\x98\xf2\xef\x1d\xfe\x9f\xf0\xf7\xc1\
+\xf1*\xf2O\xef,\xa5|\xe7,\xddk\xfb9\xa4\xda\
+2N\x06O|s\xf9\xf5\xa0N)\xee\xbf\xad\xff\x00\
+?\xd7\xbb?\x96\xff\x00\xd9\xb3\xfe\x0d\x1e\xff\x00\x82X\
+|\x10\xf1\x15\xa7\x8a\xbe I\xf1\xc7\xf6\x9b\xbf\xb3\x8a\
+\xd4\xc7\xe1\xff\x00\x8c\xbe7\xd0m<\x09k\xa8\xdb]\
+-\xc7\xdbc\xf0\xcf\xc3_\x09x\x1a\xe3P\x8ee\x06\
+\xda]+\xc5\x1a\xdf\x88\xf4\xa6\x89\x8c\xbfb\xfb[5\
+\xc1\xfe\x94\xfe\x1c|/\xf8w\xf0\x7f\xc1^\x1c\xf8k\
+\xf0\xb7\xc1\x9e\x1c\xf8\x7f\xf0\xff\x00\xc2:T\x1a7\x86\
+|\x1b\xe1\x1d\x1e\xc3A\xf0\xde\x89\xa5\xdb\xae\xd5\xb3\xd3\
+\xf4\xad:\x08-aG$\xc9;\xf9f[\x99\x99\xe7\
+\xb8\x92I\xa4wn\xf4\x80q\x91\x9ct\xcd-\x00\x92\
+[+\x7f_\xf0\x08\x84*:\x16\xceI\xcey\xe7\x04\
+\x8c\x81\xc0\xc8\x07\x8cd\x8es\x93\x9f\x96\xbfj\xdf\xd8\
+\x93\xf6Y\xfd\xb7|\x07\x0f\xc3\x8f\xda\x97\xe0\xbf\x83~\
+1xb\xca\xe2\xe2\xf3E_\x13X\x7f\xc4\xe7\xc37\
+\xf7P5\xbd\xc6\xa1\xe1_\x12X\xbd\x9e\xbf\xe1\xbb\xe9\
+b`\xb2\x5c\xe8\xfa\x95\xa4\x92\x84\x88J]a\x89S\
+\xea\xaa)\xa6\xd6\xc3\xdf\xfe\x18\xfeC\xfe,\xff\x00\xc1\
+\x9a\xbf\xf0M\x8f\x19\xebz\xae\xb3\xf0\xd3\xe2\xff\x00\xed\
+O\xf0i5\x0b\xa1-\x8f\x84\xb4\xdf\x17x\x0f\xc7>\
+\x0c\xd0-\xb6\xa2\x9bM./\x1ax\x0a\xf7\xc7\x93\xc5\
+\xe6+K\xe7\xeb^>\xd5\xa6V\x9aP\xb2\xacDF\
+8\xcf\x02\x7f\xc1\x97\x1f\xb0&\x95\x7f\x15\xd7\xc4\x1f\xda\
+c\xf6\xae\xf1\xbd\x94S\xc3/\xf6^\x89}\xf0\xab\xc1\
+VW\xb0\xa4\xa8\xd2\xd8\xea\x13\x1f\x87^(\xbf\x92\xde\
+\xe9\x15\xa0\x95\xf4\xcdKI\xbdX\xe4g\xb6\xba\xb7\x95\
+\x03\x8f\xec\x8b\x03\x18\x1c\x0fl\x8f\xe5\xfc\xbaQ\xb4g\
+v\x06}z\x9f\xc3\xd3\xf0\xfa\xd2'\x96?\xca\xbe\xef\
+O\xf2G\xc0\xbf\xb1\x8f\xfc\x12\xff\x00\xf6\x15\xff\x00\x82\
+\x7f\xd9\xde'\xec\xa7\xfb>x;\xe1\xb6\xbb\xa9Y\xae\
+\x9b\xacx\xe9\x96\xf7\xc4\xff\x00\x11\xb5\x8d=$y\xbf\
+\xb3\xf5/\x1fx\xa6\xe7X\xf1M\xc5\x8b\xcb\x22\xbc\xd6\
+K\xa9\xc7ipm\xec\xbe\xd1\x0c\xa2\xc2\xc8A\xf7\xc1\
+\x18L\x0e\xdf\xe3\xfeq\xe9O\xa6\xbf\xdd?\x87\xf3\x14\
+\x14\x7f\x90\xdf\xfc\x1c\xbb\xff\x00)\xa1\xfd\xb0\xbf\xeb\xf3\
+\xe1w\xfe\xaa?\x02\xd7\xcd\x9f\xf0D1\x9f\xf8+W\
+\xec\x04\x0fC\xfbIx\x03>\xb8\xfby$g\xa8\x07\
+\x18l\x10J\x92\xa4\xed$\x1f\xa4\xff\x00\xe0\xe5\xdf\xf9\
+M\x0f\xed\x85\xff\x00_\x9f\x0b\xbf\xf5Q\xf8\x16\xbem\
+\xff\x00\x82!\x7f\xca[?`\x0f\xfb9O\x87\xff\x00\
+\xfap5i\xb5\x07\xeb\xfeG$\xd5\xeby\xde+\xef\
+Q?\xd2\x7f\xfe\x0a\x1f\xff\x00\x06\xf1\x7f\xc1:?\xe0\
+\xa3^+\xd5>&x\xfb\xc2\x1e,\xf87\xf1\xbbX\
+\xbd\x1a\x86\xbf\xf1\x7f\xe0>\xab\xa2\xf8[\xc4\xbe-\x9f\
+\xec\xebn\xc7\xc6\x9a\x1e\xbb\xa0x\x9f\xc1~%\x96\xe8\
+E\x07\xda\xb5\x8b\xef\x0c\xaf\x88\xe4\x104pk\xd6\xe2\
+\xe2\xf0\x5c\xfej\xfc\x1f\xff\x00\x834?\xe0\x9e^\x08\
+\xf1^\x9d\xaf\xfcR\xf8\xdd\xfbM|i\xd1t\xeb\xf5\
+\xbb\x1e\x04\xba\xd5\xfc\x15\xf0\xf3\xc2\xfa\xe4Yo\xf4\x1f\
+\x11\xdd\xf8S\xc2\x9f\xf0\x97\xc9\x10\x1eQ3\xf8o\xc4\
+\xde\x16\xb9/\x00e\x95RI\xa3\x93\xfa\xff\x00\x0a\xa7\
+v\xe5\x07-\xc8# \xe3\x91\xc1\xe3\xf1\xc6i\xe0\x00\
+0\x00\xc7\xd2\x974\xbb\xb3\xa9\xc6=\x97G\xf3\xb2\xfd\
+z\x1e3\xf0\x0f\xf6z\xf8/\xfb0|,\xf0\xb7\xc1\
+\x7f\x80_\x0e\xfc5\xf0\xb7\xe1\x97\x83\xac\xfe\xc9\xa0\xf8\
+O\xc2zt\x1an\x9f\x01\x93k]_]\x98\x97\xcf\
+\xd4\xf5}BU\xfbN\xa9\xac\xea2\xddj\x9a\x95\xd1\
+{\x9b\xdb\xb9\xe6fs\xec\x8e\x81\xc6\x09`3\x9f\x94\
+\xe0\xfe\x7f\xe7#\x83\x90H\xa7\xd1R3\xf2\x9b\xfe\x0a\
+?\xff\x00\x04l\xfd\x86\xff\x00\xe0\xa8\x1aE\x81\xfd\xa3\
+|\x07\xa8\xe9_\x11\xf4;\x05\xd2\xfc5\xf1\xd3\xe1\x9d\
+\xf6\x9b\xe1?\x8b\xfe\x1f\xd3\x85\xc0\x9dt\xc8\xf5\xfb\xdd\
+\x1fZ\xd15\xfd%$3\x9bm\x13\xc6~\x1f\xf1>\
+\x8dc-\xe5\xdd\xee\x9d\xa7Y\xea2%\xea~\x0ei\
+\x1f\xf0e_\xec9\x0e\xb7%\xce\xb7\xfbY\xfe\xd6\x17\
+\xfe\x1aY\xdd\xa0\xd2t\xb8>\x10i\x1a\xd2\xdb\xee>\
+Tsx\x8a\xeb\xc0\x1a\xdd\x8c\xce\xab\x81,\x91xn\
+\xd5$r]a\x88a+\xfb; \x1e\xa3\x9f^\xff\
+\x00\x9fZ\x08\x07\xa8\x07\xea\x05;\xbd\x85\xca\xb7\xb2\xd7\
+_\xcb\xfc\xbf\xab\x9f\x9b\xff\x00\xf0O\xdf\xf8%\x07\xec\
+K\xff\x00\x04\xce\xf0\xc5\xfe\x8d\xfb-\xfc(\xb7\xd0\xbc\
+Q\xe2\x0d3O\xd2\xfcg\xf1_\xc5\x17\xaf\xe2\x8f\x8a\
+\xbe6\x82\xc3d\x855\xcf\x17^C\x14\x96\x96\x17W\
+\xea\xda\xad\xcf\x87\xfc7i\xa0\xf8c\xfb@\xc5-\xbe\
+\x8bo\x15\x9e\x9f\x0d\xa7\xca\xdf\x11?\xe0\xdcO\xf8$\
+\x0f\xc5_\x88\x1e8\xf8\x9f\xe3\x8f\xd9h\xea~1\xf8\
+\x8b\xe2\xdf\x11x\xe7\xc5\xba\x85\xbf\xc5\x1f\x8a\xda]\xbe\
+\xa3\xe2\x7f\x15\xeb\x17\xba\xf6\xbd\xa8\xc7\xa6\xe9\xbe1\xb4\
+\xd3\xec~\xdf\xaa\xea\x17wMoem\x05\xb4M)\
+Ha\x8d\x00Q\xfb\x95E\x09\xb5\xb3ae\xd9}\xdf\
+\xd7d~^\xfe\xc6\xbf\xf0F\xff\x00\xf8'\xd7\xec\x03\
+\xf17S\xf8\xbd\xfb(\xfc\x1a\xd4\xfe\x17\xf8\xe7[\xf0\
+\xb5\xef\x82\xf5\xadB\x0f\x89\x1f\x11u\xfb\x1d_\xc3z\
+\x85\xfe\x9b\xaaO\xa6\xea:7\x89<O\xaa\xe9Wh\
+\x9a\x86\x91\xa7\xde[K5\xa3Miqn\xb3[\xbc\
+r|\xd5\xfazaS\x93\x96\x04\xe3$\x1eI\x19\xc3\
+d\x83\xcfO\xc0\x01\xf7r\x0c\xb4R\xb8\xcf\xcd\x0f\xdb\
+\x93\xfe\x09\x0d\xff\x00\x04\xfe\xff\x00\x82\x87*\xea?\xb4\
+\xdf\xc0\x1f\x0f\xf8\x8f\xc6\xd6\xf6\xc2\xda\xc7\xe2\x8f\x85\xe7\
+\xbd\xf0?\xc4\xfbh\xe3\xb6\x16\xb6I?\x8d<-.\
+\x9d\xab\xebV\x9ab,'N\xd3<C&\xaf\xa4\xda\
+,\x0bn\x96\x22\xce[\xbbk\x8f\xe7\xd7\xc5\x1f\xf0e\
+g\xec9}}\x1c\x9e\x0e\xfd\xac\x7fk\x0f\x0f\xe9\xf8\
+\x1b\xad<I\x1f\xc2/\x15]\x03\x9eR\x1b\xdb\x0f\x87\
+\xfe\x0f\x8d\x15\x90*\x00l\xe5\xda\xb1G\xc1\xc15\xfd\
+\x9c\x91\x9e\x08\xc8\xf4#4\x98\x1e\x9d8\xfc=>\x9e\
+\xdd)\xf3K\xbb'\x96-\xdf\x95_\xbd\xbc\xee\x7f-\
+\xff\x00\xb3w\xfc\x1a5\xff\x00\x04\xaf\xf8#\xe2;\x7f\
+\x15\xfcBo\x8e_\xb4\xdd\xed\xb4V\x86?\x0d\xfcd\
+\xf1\xc6\x87c\xe0+}J\xd6u\x99\xaf\x93\xc3\x1f\x0c\
+\xbc%\xe0K\xbdJ;\xa8\xc3Z\xdci^*\xd7|\
+K\xa4\xbd\xb4\x84\x9b?<G:\x7fJ\x7f\x0d~\x16\
+\xfc:\xf89\xe0_\x0c\xfc2\xf8W\xe0\xbf\x0d\xfc=\
+\xf8}\xe0\xed&\xd3C\xf0\xc7\x83|!\xa4Yh^\
+\x1e\xd1t\xcb%\xdb\x05\xb5\x86\x99\xa7\xc3\x05\xb4#\x96\
+yd\x09\xe6\xdcM$\x97\x17\x0f-\xc4\x8f)\xef\xa8\
+\xa1\xb6\xf7cI-\x12\xb2\x10\x8c\x82=F8\xe3\xaf\
+\xbdx\xd7\xc7\x1f\xd9\xe3\xe0\x8f\xed-\xf0\xefV\xf8O\
+\xf1\xf7\xe1\x87\x83>.|:\xd6\xccr_\xf8K\xc7\
+z\x15\x87\x884\x83u\x06\xe3m\x7fm\x0d\xf42\xb5\
+\x86\xa5j\xce\xcdi\xa8X\xbd\xb5\xe5\xa9f\xfb<\xf1\
+\x87p\xde\xcdE!\x9f\xc9\xef\xc7\xaf\xf83\xd3\xfe\x09\
+\x89\xf1G\xc4\xba\x9f\x89\xfe\x18\xf8\xd3\xf6\x8e\xfd\x9d\xbf\
+\xb4#\x8f\xca\xf0\x8f\x81\xfcg\xe1o\x16x\x02\xc2\xe4\
+<\xafqsm\xa6\xfcE\xf0w\x89|_\x17\xdaZ\
+U\x02\xc6\x0f\x1c\xc1\xa5Y\xc5\x0cV\xfaf\x9fc\x02\
+yg\xc9<\x01\xff\x00\x06^~\xc0Z\x1e\xa9e\xa8\
+|C\xfd\xa4?j\xbf\x88V\x96\x17\xd6w\x8b\xa0i\
+\xb7\x9f\x0b\xfc\x0d\xa6j\x90Z\xdc\xc7<\xdaf\xafu\
+\x0f\x80<G\xad\x9b\x0b\xf8VK;\xa7\xd1um\x0f\
+R\x8e\xdey\x1a\xcbP\xb4\xb9[{\x88\x7f\xb1\xde\xbc\
+\x11\x91I\x81\xe8:\xe7\xa7\x7f\x7fZ\x09\xe5\x8f\xf2\xaf\
+\xbb\xd3\xfc\x97\xf4\xcf\x8a\x7fc\x8f\xf8'g\xecg\xfb\
+\x02\xf8J\xeb\xc2?\xb2\x8f\xc0o\x06|)\x87TU\
+M\x7f\xc4V6\xb2\xeb\x1e<\xf1<Q\xac\x0b\x05\xbf\
+\x89\xfc}\xaf\xcb\xa9\xf8\xbf^\xb3\xb66\xd1Kk\xa7\
+\xeaZ\xc4\xf6\x16\xb7&k\xa8-c\xb9\xba\xba\x96o\
+\xb4\x96%PpX\xe4\xe4\x969$\xe0\x0eX\x8c\x93\
+\x809$\x9fz\x96\x8a.\xde\xe5t\xb2\xd1.\x8bO\
+\xc8\xff\x00\x03z(\xa2\xba\x0f<(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x04\xf6\xf9\xaf\xcd\x11O\
+\xfe\xa2O\xfa\xe57\xfe\x80+\xfd\xbd\xff\x00\xe0\x9b\xbf\
+\xf2`\x1f\xb1\x97\xfd\x9bO\xc1\xcf\xfdA\xb4j\xff\x00\
+\x10\x89\xff\x00\xd4I\xff\x00\x5c\xa6\xff\x00\xd0\x05\x7f\xb7\
+\xbf\xfc\x13w\xfeL\x03\xf62\xff\x00\xb3i\xf89\xff\
+\x00\xa86\x8dQ=\x97\xaf\xf5\xfd_\xef\xe9\xd3C\xaf\
+\xcf\xf4>\xd4\x7f\xba\x7f\x0f\xe6+\xc1\xff\x00iO\xf9\
+\x22\x9f\x11\x7f\xec_\xb9\xff\x00\xd0\xd6\xbd\xe1\xfe\xe9\xfc\
+?\x98\xaf\x07\xfd\xa5?\xe4\x8a|E\xff\x00\xb1~\xe7\
+\xff\x00CZ\xfc\xd7\xc5\xff\x00\xf95~\x22\x7f\xd9\x19\
+\xc4\x7f\xfa\xad\xaa}?\x0a\xff\x00\xc9O\xc3\x9f\xf6;\
+\xcb\x7f\xf57\x0c~%t\x91\x7f\xde\x93\xf5h\xcd~\
+\xd4\xfe\xcc\x1f\xf2E\xbc\x11\xff\x00`\xf7\xff\x00\xd2\xdb\
+\xba\xfcU\xfe5\xff\x00z_\xfd\x0d+\xf6\xab\xf6`\
+\xff\x00\x92-\xe0\x8f\xfb\x07\xbf\xfe\x96\xdd\xd7\xf9\x05\xfb\
+3\xef\xff\x00\x11\x87\x8b\xff\x00\xec\x8d\xc4\xff\x00\xea\xcf\
+\x04\x7f_\xfd'?\xe4\x93\xc8\x7f\xect\xbf\xf5\x0e\xb9\
+\xf45\x14Q_\xee\x11\xfcB\x14QE\x00\x14QE\
+\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\
+\x00\x14QE\x00\x14QE\x00\x14QE\x00\x14QE\
+\x00\x14QE\x00\x14QE\x00\x14QE\x00\x7f(\x7f\
+\xf0Q_\xf85\x97\xe1\x9f\xfc\x147\xf6\xc1\xf8\xb5\xfb\
+\x5cx\x8b\xf6\xbf\xf1\xf7\xc3\x1d[\xe2\xb4\xde\x1a\x96\xe7\
+\xc1\xba?\xc2o\x0fx\x8bO\xd1\xff\x00\xe1\x1b\xf0\x9e\
+\x89\xe1hV=b\xf3\xc6\xdam\xc5\xe8\xb8\x87G\xfb\
+[\xee\xb0\xb3\xdb5\xdc\x91\x0d\xd1\xdb\xa1\x93\xcf\xbfc\
+O\xf84\x8b\xe1_\xecu\xfbR\xfc\x0c\xfd\xa84\x7f\
+\xdbS\xe2\x17\x8euO\x81\xff\x00\x10\xf4/\x886>\
+\x10\xd4~\x0e\xf8sD\xb2\xf1\x0d\xc6\x83q\xf6\x98\xf4\
+\xbb\xadZ\xdf\xc7\x9a\x84\xd6\x10]\x11\xe5\xc9q\x1d\x8d\
+\xcb\xa2\x93\xb63_\xd7\xed\x14\x09\xa4\xf5k_\x99\x1c\
+jUv\x9e\xc7\x19\xeb\x90\x00\x00\x93\xdc\x91\xcb\x1c\x0c\
+\xb6N;\x99(\xa2\x81\x85\x14Q@\x05\x14Q@\x05\
+\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\
+\x14Q@\x05\x14Q@\x05\x14Q@\x1f\xe0\x7fy\x12\
+\xdb\xde\xdd[\xa1b\x90\xdc\xdc\xc2\x85\xb0\x5c\xac2\x04\
+R\xc4\x05\x05\x88?1\x0a\x01=\x00\xe9U\xe8\xa2\xba\
+\x0f<(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x04\xf6\xf9\xaf\xcd\x11O\xfe\xa2O\xfa\xe57\xfe\x80\
++\xfd\xbd\xff\x00\xe0\x9b\xbf\xf2`\x1f\xb1\x97\xfd\x9bO\
+\xc1\xcf\xfdA\xb4j(\xa8\x9e\xcb\xd4\xe9\xa1\xd7\xe7\xfa\
+\x1fj?\xdd?\x87\xf3\x15\xe0\xff\x00\xb4\xa7\xfc\x91O\
+\x88\xbf\xf6/\xdc\xff\x00\xe8kE\x15\xf9\xaf\x8b\xff\x00\
+\xf2j\xfcD\xff\x00\xb23\x88\xff\x00\xf5[T\xfa~\
+\x15\xff\x00\x92\x9f\x87?\xecw\x96\xff\x00\xean\x18\xfc\
+J?\xeb\x17\xeb'\xfe\x85\x1d~\xd4~\xcb\xe7\xfe,\
+\xb7\x82?\xeb\xc2O\xd2\xfa\xecQE\x7f\x90\x1f\xb3;\
+\xfeO\x0f\x17\xff\x00\xd9\x1b\x89\xff\x00\xd5\xa6\x10\xfe\xbe\
+\xfaM\xff\x00\xc9%\x90\x7f\xd8\xe6?\xfa\x85\x5c\xfa\x1e\
+\x8a(\xaf\xf7\x10\xfe\x22\x0a(\xa2\x80\x0a(\xa2\x80\x0a\
+(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a\
+(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a\
+(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a\
+(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a\
+(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a\
+(\xa2\x80\x0a(\xa2\x80?\xff\xd9\
+\x00\x00\x7f\xeb\
+\xff\
+\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x01\x00\xdc\x00\
+\xdc\x00\x00\xff\xe1\x00\x22Exif\x00\x00MM\x00\
+*\x00\x00\x00\x08\x00\x01\x01\x12\x00\x03\x00\x00\x00\x01\x00\
+\x01\x00\x00\x00\x00\x00\x00\xff\xdb\x00C\x00\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\xff\xdb\x00C\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\x01\
+\x01\xff\xc0\x00\x11\x08\x00\x9f\x02\xd9\x03\x01\x22\x00\x02\x11\
+\x01\x03\x11\x01\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\
+\x01\x01\x00\x00\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\
+\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\
+\x04\x03\x05\x05\x04\x04\x00\x00\x01}\x01\x02\x03\x00\x04\x11\
+\x05\x12!1A\x06\x13Qa\x07\x22q\x142\x81\x91\
+\xa1\x08#B\xb1\xc1\x15R\xd1\xf0$3br\x82\x09\
+\x0a\x16\x17\x18\x19\x1a%&'()*4567\
+89:CDEFGHIJSTUVW\
+XYZcdefghijstuvw\
+xyz\x83\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\
+\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\
+\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\
+\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\
+\xe9\xea\xf1\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\x1f\
+\x01\x00\x03\x01\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\
+\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\
+\xb5\x11\x00\x02\x01\x02\x04\x04\x03\x04\x07\x05\x04\x04\x00\x01\
+\x02w\x00\x01\x02\x03\x11\x04\x05!1\x06\x12AQ\x07\
+aq\x13\x222\x81\x08\x14B\x91\xa1\xb1\xc1\x09#3\
+R\xf0\x15br\xd1\x0a\x16$4\xe1%\xf1\x17\x18\x19\
+\x1a&'()*56789:CDEF\
+GHIJSTUVWXYZcdef\
+ghijstuvwxyz\x82\x83\x84\x85\
+\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\
+\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\
+\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\
+\xd9\xda\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\xf6\
+\xf7\xf8\xf9\xfa\xff\xda\x00\x0c\x03\x01\x00\x02\x11\x03\x11\x00\
+?\x00\xfe\x0b\xe8\xa2\x8a\xe8<\xf0\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x00\xa3\xb1\xff\x00u\xbf\xf4\x13E\x1d\
+\x8f\xfb\xad\xff\x00\xa0\x9a\x00\xff\x00S/\xf84\x07\xfe\
+Q\x17\x1f\xfd\x9c\xd7\xc6\xbf\xfd\x17\xe1*\xfe\xa4\xdf\xa6\
+{\xff\x00\x88\xe7\xf4\xaf\xe5\xb3\xfe\x0d\x01\xff\x00\x94E\
+\xc7\xff\x00g5\xf1\xaf\xff\x00E\xf8J\xbf\xa9G\xe9\
+\xf9\xfeX9\xacg\xf1?\x97\xe4\x8e\xef\xb3\xff\x00n\
+\xfe\x87\xe4\xaf\xed\xb4\xd2\x0f\x8b\xb6\x1bduQ\xe0\xcd\
+$\xe1]\x94\x1f\xf8\x99\xeb\x1c\x80\xa4\x0c\xf5\xe4\x83\xe9\
+\xf4\xf7\xaf\xd8M\xd9\xbc\x19\xe3-\xcc\xecW\xc4\xd0\x1c\
+\xbbn\xe3\xfb6\xd4\xe0g\x9f_l\x9a\xf0O\xdbs\
+\x03\xe2\xdd\x81\xff\x00\xa9/L'\xfe\x03\xa8\xebD~\
+U\xef_\xb0\x8f\xfc\x89\xbe3\x1f\xf53[\x0f\xc3\xfb\
+.\xdb\x8f\xe9_\xe3\xdf\x85\xd5f\xff\x00i\x07\x1dB\
+U%(\xfd\x7f\x8c#\xca\xf6V\xc9)\xfe\x7f\x96\xf7\
+?\xaf\xf8\xa6\xcb\xe8\xd9\xc3\xcb\x95^\xd9J\xe6K\xde\
+\xff\x00\x7f\xad\xe9\xfdv\xd6\xff\x00y\xd1E\x15\xfe\xc1\
+\x1f\xc8AE\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x07\xf8\x1b\xd1E\x15\
+\xd0y\xe1E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01E\
+\x14P\x01E\x14P\x01E\x14P\x01E\x14P\x01G\
+c\xfe\xeb\x7f\xe8&\x8a;\x1f\xf7[\xff\x00A4\x01\
+\xfe\xa6_\xf0h\x0f\xfc\xa2.?\xfb9\xaf\x8d\x7f\xfa\
+/\xc2U\xfdJ?O\xcf\xf9\x1a\xfeZ\xff\x00\xe0\xd0\
+\x1f\xf9D\x5c\x7f\xf6s_\x1a\xff\x00\xf4_\x84\xab\xfa\
+\x94~\x9f\x9f\xf25\x8c\xfe'\xf2\xfc\x91\xdd\xf6?\xed\
+\xdf\xd0\xfc\x95\xfd\xb7?\xe4\xad\xd8\x7f\xd8\x97\xa6\xff\x00\
+\xe9\xc3Z\xafy\xfd\x84?\xe4M\xf1\x9f\xfd\x8c\xf6\xdf\
+\xfal\xb6\xaf\x06\xfd\xb7?\xe4\xad\xd8\x7f\xd8\x97\xa6\xff\
+\x00\xe9\xc3Z\xafy\xfd\x84?\xe4M\xf1\x9f\xfd\x8c\xf6\
+\xdf\xfal\xb6\xaf\xf1\xe3\xc2\xeb\xff\x00\xc5H\xb8\xe3\xb7\
+\xf6\x8f\x19[\xff\x00\x0c\xb4\xb7?\xaf\xf8\xab\xfeQ\xb3\
+\x87\xbd2\x9f\xfdN\xac}\xe7E\x14W\xfb\x0a\x7f!\
+\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\
+\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\
+\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\
+\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\
+\x05\x14Q@\x05\x14Q@\x1f\xe0oE\x14WA\xe7\
+\x85\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\
+\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\
+\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\
+\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\
+\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x14Q@\
+\x05\x14Q@\x05\x14Q@\x05\x14Q@\x05\x1d\x8f\xfb\
+\xad\xff\x00\xa0\x9a(\xec\x7f\xddo\xfd\x04\xd0\x07\xfa\x99\
+\x7f\xc1\xa0?\xf2\x88\xb8\xff\x00\xec\xe6\xbe5\xff\x00\xe8\
+\xbf\x09W\xf5(\xdd??\xfd\x04\xd7\xf2\xd7\xff\x00\x06\
+\x80\xff\x00\xca\x22\xe3\xff\x00\xb3\x9a\xf8\xd7\xff\x00\xa2\xfc\
+%_\xd4\xa3\xf4\xfc\xff\x00\x91\xacg\xf1?\x97\xe4\x8e\
+\xef\xb1\xff\x00n\xfe\x87\xe4\xaf\xed\xbb\xcf\xc5\xbb\x01\xeb\
+\xe0\xbd7\xff\x00N\x1a\xd5{\xcf\xec!\xff\x00\x22o\
+\x8c\xff\x00\xecg\xb6\xff\x00\xd3]\xb5x7\xed\xbb\xff\
+\x00%n\xc3\xfe\xc4\xbd7\xff\x00N\x1a\xd5{\xcf\xec\
+!\xff\x00\x22o\x8c\xff\x00\xecg\xb6\xff\x00\xd3]\xb5\
+\x7f\x8e\xfe\x17\x7f\xca\xc8\xb8\xe3O\xf9\x98\xf1\x96\xbd\xff\
+\x00\xe1\x16\x99\xfd\x7f\xc5_\xf2\x8d\x9c=\xe9\x94\xff\x00\
+\xeauc\xef:(\xa2\xbf\xd8c\xf9\x08(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\
+(\xa2\x8a\x00\xff\x00\x03z(\xa2\xba\x0f<(\xa2\x8a\
+\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00\xfd\xef\xff\
+\x00\x83|\x7f\xe0\x97?\xb3\xef\xfc\x15s\xf6\xa6\xf8\xb7\
+\xf0C\xf6\x8a\xf1_\xc6\x0f\x08xS\xc0_\x02\xaf~\
+&h\xf7\xff\x00\x06|C\xe0\xdf\x0e\xf8\x82\xe7_\xb6\
+\xf1\xcf\x83\xbc9\x1d\xae\xa5w\xe3_\x00|A\xd3\xa5\
+\xd2\x0e\x9f\xe2+\xd9\x0d\xbd\xae\x95gx.\xe2\xb7\x90\
+_\x88\xbe\xd3\x05\xcf\xf5\xe9\xff\x00\x10a\xff\x00\xc1-\
+\xff\x00\xe8\xb7~\xde\x7f\xf8t\xfe\x00\x7f\xf41\xd7\xe1\
+\x7f\xfc\x19s\xff\x00)\x08\xfd\xa4\xbf\xec\xd25_\xfd\
+Z\xff\x00\x0c+\xfd-k)\xbf{\xd1\x7f\xc1;)\
+\xa4\xe1\x16\xd2zuW\xfe\xb6G\xf25\xff\x00\x10a\
+\xff\x00\xc1-\xff\x00\xe8\xb7~\xde\x7f\xf8t\xfe\x00\x7f\
+\xf41\xd1\xff\x00\x10a\xff\x00\xc1-\xff\x00\xe8\xb7~\
+\xde\x7f\xf8t\xfe\x00\x7f\xf41\xd7\xf5\xcbEA|\xb1\
+\xfeU\xf7/\xeb\xa2\xfb\x8f\xe4k\xfe \xc3\xff\x00\x82\
+[\xff\x00\xd1n\xfd\xbc\xff\x00\xf0\xe9\xfc\x00\xff\x00\xe8\
+c\xa3\xfe \xc3\xff\x00\x82[\x7f\xd1n\xfd\xbc\xbf\x1f\
+\x8a\x9f\x00\x87\xfe\x83\xfb1f\xbf\xaeZ(\x17,\x7f\
+\x95}\xcb\xcb\xfc\x91\xfck|C\xff\x00\x83+\xff\x00\
+`\x9dCH\x91>\x15~\xd4\x9f\xb5\xcf\x82\xfcA\xb9\
+\x0cW\xde<\xbd\xf8=\xf1'D\xda7nI4M\
+\x03\xe1o\xc2\xdb\xf721L\xc8<@\x19T8\x0a\
+\xca\xea\x89\xfc\xd1\xff\x00\xc1J\x7f\xe0\xd8\xdf\xdb\xd7\xf6\
+\x07\xd0u\xdf\x8a\x9e\x02]?\xf6\xb9\xf8\x03\xa0Eq\
+{\xacx\xe7\xe1N\x87\xa9\xe9\xfe?\xf0\x86\x8fk\x02\
+\xcfs\xac\xf8\xef\xe1\x05\xd5\xd6\xb3\xadi\xbaE\xbe.\
+\xe4\xbb\xd5\xfc!\xad\xf8\xebH\xd3,\xad$\xd55\xeb\
+\xcd\x0a\xdeU\x8e?\xf5\x85\xeb\xc1\x19\x14\xc3\x1a6C\
+\x22\x90z\x822:`\x8cz\x1c\x9c\x8e\x87'4\xd3\
+kfK\xa5\x07\xf6m\xe9\xa7\xfc\x03\xfc\x0f\x0a\xb2\xe4\
+0\xc1\x0cT\xa9\xea\x08\xc1\xe4v<\xfd\xd3\xf3\x01\x82\
+T+!f\xd7\xf6\xff\x00\xff\x00\x07H\x7f\xc1\x0c\xfc\
+)\xf0:\xd7U\xff\x00\x82\x91~\xc8\xfe\x08\xff\x00\x84\
+\x7f\xe1\xe6\xb9\xe2\x0d\x9f\xb5/\xc3O\x0d\xdb\xb8\xd0\xbc\
+\x11\xe2?\x13\xea0\xc5\xa4\xfc^\xf0\x96\x8fkj-\
+\xb4?\x0a\xf8\x93]\xba:W\x8e\xb4\xb4\x9e\xdfO\xd2\
+\xbcM\xaahz\x8e\x8fm\x0d\x8e\xb3\xa9\xc5a\xfc@\
+\x1e\xa7\xeazt\xeb\xdb\x81\xc7\xa0\xc0\xc0\xe2\xb6N\xea\
+\xe8\xe5\x94\x1c\x1d\x9f\xde\x14QE2B\x8a(\xa0\x02\
+\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x03\xd3\xf1\xfd\x01\
+?\xc8\x1a\xfe\xba?\xe0\x98\x7f\xf0k\x19\xff\x00\x82\x8d\
+\xfe\xc5_\x08\xff\x00k\xff\x00\xf8m\xb3\xf0\x8f\xfe\x16\
+\x93\xf8\xc9\x7f\xe1\x00?\xb3\xef\xfc'\x1f\xd8\x9f\xf0\x89\
+x\xd7^\xf0\x7f\xfc\x8c\xc3\xe37\x84\xce\xa2/\x8e\x84\
+\xda\x80\x1f\xd8vB\xdb\xed+l<\xef%\xe7\x9f\xf9\
+\x17\xee?\xe0_\xfa\x03W\xfa\xe7\xff\x00\xc1\xb1\x0a\x0f\
+\xfc\x11[\xf6G\xc8\xff\x00\x96\xdf\x19=\x7f\xe8\xb5\xf8\
+\xfc\xff\x00Z\x99\xb6\x96\x9d\xcdiEJMI_K\
+\xa5\xf3^g\xe0\xaf\xfcA\x05\xff\x00Y$\x1f\xf8\x89\
+\xe7\xff\x00\xa2.\xa8j\xbf\xf0d\x7f\xf6f\x99\xa8\xea\
+?\xf0\xf2\x01/\xd8,n\xef<\xaf\xf8e&\x8c\xc9\
+\xf6[y'\xf2\xd6A\xfbE7\x96_f\xdd\xfb\x1f\
+h%\x82\x96\x00\x8f\xef\xc3b\xfa\x7f?\xf1\xac?\x13\
+\xaa\xff\x00\xc27\xe2\x0e3\xff\x00\x12MT`d\x9e\
+lg\xce\x07~2q\xcf\xd0\xd6nM\xee\xff\x00#\
+\x7fg\x15\xb2\xd7\xa5\xfd\x17\xf9~,\xff\x00\x06MR\
+\xcf\xfb;S\xd4\xb4\xef0\xcb\xf6\x0b\xfb\xcb/4\xae\
+\xc3'\xd9.d\xb7\xf36\x02Bo\xf2\xf7m\x07\x0b\
+\x9c\x0e\x06*\x85t\x1e,R\x9e*\xf12\x10AO\
+\x10\xebhA\x05NWS\xba\x1c\x83\x82\x0f\x1d\xeb\x9f\
+\xad\x93\xbe\xa7#\xd1\xb5\xdb\xfc\xaf\xfa\x85\x14Q@\x82\
+\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\x8a(\xa0\x02\
+\x8a(\xa0\x02\x8e\xc7\xfd\xd6\xff\x00\xd0M\x14v?\xee\
+\xb7\xfe\x82h\x03\xfdL\xbf\xe0\xd0\x1f\xf9D\x5c\x7f\xf6\
+s_\x1a\xff\x00\xf4_\x84\xab\xfa\x94~\x9f\x9f\xf25\
+\xfc\xb5\xff\x00\xc1\xa0?\xf2\x88\xb8\xff\x00\xec\xe6\xbe5\
+\xff\x00\xe8\xbf\x09W\xf5(\xdd??\xfd\x04\xd63\xf8\
+\x9f\xcb\xf2Gw\xd8\xff\x00\xb7\x7fC\xf2W\xf6\xdd\xff\
+\x00\x92\xb7a\xff\x00b^\x9b\xff\x00\xa7\x0dj\xbd\xe7\
+\xf6\x10\xff\x00\x917\xc6\x7f\xf63\xdb\x7f\xe9\xae\xda\xbc\
+\x1b\xf6\xdd8\xf8\xb7`\x7f\xeaK\xd3\x7f\xf4\xe1\xadW\
+\xbc\xfe\xc2\x1f\xf2&\xf8\xcf\xfe\xc6{o\xfd5\xdbW\
+\xf8\xef\xe1w\xfc\xac\x8b\x8e?\xecc\xc6Zv\xff\x00\
+\x84ZG\xf5\xff\x00\x15\x7f\xca6p\xf7\xa6S\xff\x00\
+\xa9\xd5\x8f\xbc\xe8\xa2\x8a\xff\x00a\x8f\xe4 \xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x03\xfc\x0d\xe8\xaf\xefW\xfe ~\xd5?\
+\xe9%\xbaw\xfe\x22\x0d\xd7\xff\x00D\xe5\x1f\xf1\x03\xf6\
+\xa9\xff\x00I-\xd3\xbf\xf1\x10n\xbf\xfa'+nh\
+\xf7\xfc\xce?e?\xe5\x7f\x87\xf9\xff\x00_&\x7f\x05\
+TW\xf7\xab\xff\x00\x10?j\x9f\xf4\x92\xdd;\xff\x00\
+\x11\x06\xeb\xff\x00\xa2r\x8f\xf8\x81\xfbT\xff\x00\xa4\x96\
+\xe9\xdf\xf8\x887_\xfd\x13\x94sG\xbf\xe6\x1e\xca\x7f\
+\xca\xff\x00\x0f\xf3\xfe\xbeL\xfe\x0a\xa8\xaf\xefW\xfe \
+~\xd5?\xe9%\xbaw\xfe\x22\x0d\xd7\xff\x00D\xe5\x1f\
+\xf1\x03\xf6\xa9\xff\x00I-\xd3\xbf\xf1\x10n\xbf\xfa'\
+(\xe6\x8fp\xf6S\xfeW\xf8\x7f\x9f\xf5\xf2g\xf0U\
+E\x7fz\xbf\xf1\x03\xf6\xa9\xff\x00I-\xd3\xbf\xf1\x10\
+n\xbf\xfa'(\xff\x00\x88\x1f\xb5O\xfaIn\x9d\xff\
+\x00\x88\x83u\xff\x00\xd19G4{\xfea\xec\xa7\xfc\
+\xaf\xf0\xff\x00?\xeb\xe4\xcf\xe0\xaa\x8a\xfe\xf5\x7f\xe2\x07\
+\xedS\xfe\x92[\xa7\x7f\xe2 \xdd\x7f\xf4NQ\xff\x00\
+\x10?j\x9f\xf4\x92\xdd;\xff\x00\x11\x06\xeb\xff\x00\xa2\
+r\x8eh\xf7\xfc\xc3\xd9O\xf9_\xe1\xfe\x7f\xd7\xc9\x9f\
+\x1e\x7f\xc1\x97G\x1f\xf0P\x8f\xdaK<\x0f\xf8d}\
+T\x93\xff\x00u_\xe1\x7f\xf8\xd7\xfaZ\x06S\xd0\x8a\
+\xfe\x07t\xef\xf82S\xc5z<\xb2M\xa4\xff\x00\xc1\
+P\x8e\x97$\xd1\x98f\x97N\xfd\x93\xf5K)%\x84\
+\xb0v\x82G\xb5\xfd\xa8ag\x84\xbaE'\x96\xe5\x97\
+|J\xd8\xcf5m\xff\x00\xe0\xca?\x1c\xc8\x08\x93\xfe\
+\x0a\x9dt\xf99;\xbfeMY\xf3\xf5\xdf\xfbQ6\
+\x7f\x1fZ\x96\xa2\xdd\xf9\xad\xfd\x7f\xc1_\xd5\xce\x88\xf3\
+\xc6)[o5\xe5\xff\x00\x04\xfe\xf67\x0fQ\xf9\xd1\
+\xb8z\x8e\xa0~g\x15\xfc\x0e?\xfc\x19)\xe2\xb9?\
+\xd6\x7f\xc1P\x83\xf1\x8f\x9b\xf6M\xd5\x0f\xf3\xfd\xa8\xb3\
+\xed\x8e\x9e\xd5]\xff\x00\xe0\xc8\x9f\x10H\xbbd\xff\x00\
+\x82\x9b\xda\xbf\xbb\xfe\xc8\xd7\xec\x7f\x1c\xfe\xd3\xf9\xfc\x88\
+\xf7\xa5\xca\xbf\x9b\xf0\xff\x00\x83\xe7\xfdY\x8e\xf2\xfe_\
+\xc7\xd3\xfe\x0f\xf4\x99\xfd\xf2\xc9s\x0ck\xbaI\xa2\x8c\
+`\x1f\xde:\xa6s\xd0\x8d\xcc\xbc\x7f\x81\xa8\xed\xaf \
+\xbb.-\xee-\xee\x04X\x12\x18%Iv1\xe5C\
+\x14f\x0aXd\x85l7\x07\xd0\xd7\xf9\xc3\xfe\xd8?\
+\xf0g\xfe\xa7\xfb'\xfe\xca\xff\x00\xb4?\xed7/\xfc\
+\x14\x0e\xc7\xc7\x91|\x03\xf8;\xf1\x07\xe2\xe4\x9e\x0aO\
+\xd9v\xe7\xc32x\xacx\x17\xc3Z\x87\x88N\x82<\
+C'\xed\x0b\xe2\x14\xd1\x8e\xa6\xb6\x06\xd0jM\xa2j\
+\xa2\xd7\xce2=\x85\xd8\x02:\xfb\xd3\xfe\x0c\x919\xf8\
+\x1f\xfb{\x7f\xb3\xf1[\xe0\xb2\x9f\xc7\xc2>6n?\
+\x02*Z\xed\xaa\xefb\x93w\xb3V\xd2\xeb\xf0\xbf\xcf\
+\xf4\xe8\x8f\xee>\x8a(\xa43\xcc\xbe3|'\xf0G\
+\xc7o\x84\xff\x00\x11~\x0b\xfcK\xd1\xa0\xf1\x17\xc3\xef\
+\x8a\x9e\x0b\xf1/\x80<g\xa3\x5c\x83\xe5\xea\x1e\x1c\xf1\
+^\x8fy\xa2\xeap,\x8aR[k\x81mx\xf2Z\
+^[<wvwq\xc1uk,W\x11G*\x7f\
+\x88\xd7\xed\x95\xfb6\xf8\x9b\xf6;\xfd\xaa\xfe?\xfe\xcb\
+\xfe/2K\xad\xfc\x10\xf8\xa7\xe2\xdf\x00-\xfb\xab*\
+\xebZ6\x8f\xa9M\xff\x00\x08\xcf\x89-\xf7E\x03=\
+\x9f\x89|1&\x8f\xaf\xd9\xc8`\x80\xc9k\xa9\xc0\xe6\
+\x18\xb7\x18\xd7\xfd\xcc\xab\xfc\xee\x7f\xe0\xb4_\xf0J\xcd\
+?\xf6\xd8\xff\x00\x83\x91<\x03\xfb9h_\x13\xdf\xe0\
+\xcb\xfe\xd9_\xb3\xce\x8b\xf1_T\xf1\xe4\xbe\x03\xb6\xf1\
+\xae\x9d\xe1\xdf\x10\xfc/\xf8u\xe3\xbd\x13P\xb6\xb5\xf0\
+\xbd\x97\x88\xfc\x11>\xb25\xbd;\xe0\xd6\x93%\xed\xdd\
+\xd7\x89-nm\xf5O\x11]\xde\xb1\xba\x86%\xb3\x9a\
+\xe0\xed\xbb\xd3\xf5\xd0\xca\xb4\x5c\x92\xb2\xbb\xbf\xe7\xe7\xeb\
+\xf9\x9f\xc3\xed\x15\xfd\xea\x8f\xf81\xff\x00T<\xff\x00\
+\xc3\xcbt\xef\xfcD\x1b\xaf\xfe\x89\xca?\xe2\x07\xedS\
+\xfe\x92[\xa7\x7f\xe2 \xdd\x7f\xf4NU\xf3G\xbf\xe6\
+a\xec\xa7\xfc\xaf\xf0\xff\x00?\xeb\xe4\xcf\xe0\xaa\x8a\xfe\
+\xf5\x7f\xe2\x07\xedS\xfe\x92[\xa7\x7f\xe2 \xdd\x7f\xf4\
+NQ\xff\x00\x10?\xea\xdc\xe3\xfe\x0a[\xa6\xf2;\xfe\
+\xc8\x17\x7f\xd3\xf6\x9c\xfaz\xd1\xcd\x1e\xe2\xf6s\xfeW\
+\xf8\x7f_\xd7\x93?\x82\xaa+\xfa\xb0\xfd\xb6?\xe0\xd2\
+\x1f\xf8(7\xec\xd7\xe1?\x11|C\xf8\x0d\xe2\xef\x01\
+\xfe\xd8\xde\x11\xf0\xcd\xad\xc6\xa1}\xe1\xef\x02i\xba\x9f\
+\x81>2\xcd\xa4\xda'\x9bq\xa8i\xdf\x0c\xf5\xeb\xbd\
+gM\xf1\x0d\xc4P,\xf2\xa6\x83\xe1_\x1e\xf8\x93\xc5\
+\x17\xe2\x1f#G\xd15\x1b\xb9b\xb5\x93\xf9[\xbf\xd3\
+\xf5\x0d*\xfa\xf7K\xd5l/t\xcdKM\xba\x9e\xc7\
+P\xd3\xb5\x1bY\xaco\xecomex.\xec\xefl\
+\xeeR;\x9bK\xabY\xd1\xa1\xb8\xb7\xb8\x8a9c\x99\
+^6]\xd1\xc8\x15\xa6\x9e\xccN2\x8e\xadX\xa7E\
+I\x14R\xcc\xe9\x141\xc9,\xb2:\xc7\x14Q#I\
+$\xb2\xb9\xda\x91D\x88\x0b<\xae\xc4* \x1b\x9d\x88\
+D\xdd#\x227\xf4\xa7\xfb\x13\x7f\xc1\xab\x7f\xf0S?\
+\xda\xdf\xc2\xbaO\xc4O\x1d\xe9>\x09\xfd\x92\xbc\x03\xad\
+\xac\x17zS|v\xbb\xd5\xe2\xf8\x8d\xaa\xe93y'\
+\xfbJ\xd7\xe1w\x86\xf4\xcd_]\xd1C#\xcc\xd6\xd6\
+>?\xb9\xf0F\xa1v\xb0-\xca[.\x99wg\xa8\
+N].\xbf\xd7\xf5\xfdn\x11\x8c\xa5\xb2\xbf\xf5\xe6\x7f\
+5\x14W\xf7\x9b\x0f\xfc\x18\xfd\xae<1<\xff\x00\xf0\
+R\xdd.)\xda(\xcc\xd1C\xfb\x22]\xcd\x0cr\x94\
+\x1b\xe3\x8aW\xfd\xa5\xa1icF\xca\xac\xad\x04%\xc0\
+\x0eb\x8c\x9d\x8b \xff\x00\x83\x1f5|\x83\xff\x00\x0f\
+1\xd3\xf8\xf4\xfd\x90.\x7f\xa7\xed6?\xad.h\xf7\
++\xd9O\xf9_\xe1\xfe\x7f\xd7\xc9\x9f\xc1wq\xff\x00\
+\x02\xff\x00\xd0\x1a\xbf\xd7C\xfe\x0d\x87\xff\x00\x94+~\
+\xc8\xff\x00\xf5\xdb\xe3'\xfe\xae\xbf\x1f\xd7\xf2u\xff\x00\
+\x05\x22\xff\x00\x83Tt\xff\x00\xf8'\x9f\xec-\xf1\xfb\
+\xf6\xc5\x9f\xf6\xdb\xbe\xf8\xb7\xa9\xfc\x16\xd1\xbc!\xa9A\
+\xe0X\xbe\x01A\xe0k\x0f\x10?\x8a>#\xf87\xc0\
+o\x14\xda\xe4\x9f\x17|cs\xa7-\x8c^)\x93R\
+F\x8fN\xba3\xc9f\x96\xac#\x8ew\x91?\xacO\
+\xf86\x1f\x8f\xf8\x22\xb7\xec\x90\xb9c\x89\xfe2\x8c\xb7\
+S\xb7\xe3g\x8f\xc6O\xb9\xeb\xed\xd3'\xadL\xdd\xe3\
+\xa7\x7f\xd0\xd6\x9c\x1c$\xef\xfc\xbf\xaa\xf3}\x8f\xdf\x9a\
+\xc8\xd7\xd4>\x87\xacF\x7f\xe5\xa6\x97\xa8'L\xf5\xb4\
+\x94~Y#>\xd9\xadz\xa1\xaa&\xfd>\xf5q\x9c\
+\xda\xdc\x8f\xc0\xc1\x22\x91\xf5 \x90=\xc8\xac\xcd\xcf\xf0\
+z\xf8\x91o\xf6?\x88\xbf\x10-1\x8f\xb2x\xe3\xc5\
+\xb6\xd8\xc66\xfd\x9f\xc4\x1a\x84;\x7f\x0d\x98\xfc+\x8b\
+\xafP\xf8\xdf\x0bZ|j\xf8\xc5l\x17&\xd7\xe2\xb7\
+\xc4h6\x90O\xfa\x8f\x18\xeb1\xed#!\x88\xf91\
+\xb4\x10\xc4p\xbf1\x15\xfd\x91\xfe\xc6\x1f\xf0g^\xb9\
+\xfb@~\xcc?\x06\xbe5\xfcr\xfd\xac\xbcE\xf03\
+\xe2G\xc5/\x06\xe9\xfe7\xd5\xbe\x13\xd9|\x15\xb6\xf1\
++\xf8'N\xf1\x08}O\xc3zN\xa9\xaaj_\x10\
+|5w\xfd\xbb\xff\x00\x08\xe4\xfa]\xce\xb9\xa7K\xa3\
+\xdb\x1d\x1fU\xb8\xba\xd2\xb3'\xd8\xcc\x8d\xb5\xd2I7\
+f\x92\xfd\x0e?g)\xcaMw_\x94_\xf5\x7fM\
+\x99\xfcFQ_\xe8)\xff\x00\x10D\xfc?\xff\x00\xa4\
+\x85\xf8\xc3\xff\x00\x11\xdbH\xff\x00\xe7\xc1H\xdf\xf0d\
+_\xc3\xe4\x05\x8f\xfc\x14/\xc6\x1f/?\xf2n\xda?\
+c\xc7\x07\xe2\xf3n\xe7\xf8@\xcb}\xd0T\x90\xc0\xe6\
+\x8f\x7f\xcf\xfc\x8a\xf63\xf2\xfc<\xbf\xaf\xf8v\x7f\x9f\
+e\x15\xfaS\xfbL\xfe\xc0k\xa0\xff\x00\xc1@<q\
+\xfb\x08~\xc2:\xff\x00\xc4?\xdbo\xc4^\x0b\xf1\x14\
+\x9e\x03\xb6\xd6\xbc-\xf0\xf2-7R\xf1?\x8d\xf4(\
+O\xfc'q\xe8\xda.\x87\xaex\x9e\xd2\xdb\xc2^\x0d\
+\xbe[\x9d2\xfb\xc5\xba\xb6\xb3g\xa6\xaai\x1a\x96\xaf\
+}5\x96\x96\xb0\xdc?\xf4\x0f\xfb,\xff\x00\xc1\x98\xff\
+\x00\xb5\xef\xc4\x9d\x17O\xf1\x07\xedM\xfbG\xfc.\xfd\
+\x9a\xda\xfa\xc6\xc6\xf9\xbc\x11\xe1\x1f\x0f]\xfcx\xf1\xc6\
+\x9f,\xc6).\xb4\x9f\x10]Yx\x8b\xc0\xde\x05\xd3\
+5\x1bky\x1e\xd8\xdf\xf8{\xc5~5\xb0[\xe8\x5c\
+\xc2\xb76\xc1.n\x8eh\xf7\xfe\xbf\xaf\xebr}\x94\
+\xefkv\xd7\xfe\x1e\xdf\xe6\x7f\x19\xf4W\xfa$[\x7f\
+\xc1\x92\x9f\xb3\xe0\x8dE\xef\xed\xdb\xf1\x96Y\x00\x196\
+\x9f\x09<\x13k\x16@\xc1\xfd\xdc\x9e%\xb9,3\xce\
+\x19\xc9\xeeX\x9a\xb3\xff\x00\x10K\xfe\xce?\xf4|\xff\
+\x00\x1b\x7f\xf0\xd5\xf8\x13\xff\x00\x97\x94sG\xbf\xe7\xfe\
+E*2\xfc\xb7\xf9|\xfb\xfd\xdel\xff\x00:\xea+\
+\xfb\xe4\xf8\xc7\xff\x00\x06KE\x06\x81uy\xf0\x0b\xf6\
+\xf3\x9e\xe7\xc4\xd6\xf6\x97Mg\xe1\xff\x00\x8b\x9f\x05b\
+\x83D\xd6o~V\xb4\xb7\xbb\xf1o\x83|ks\x7f\
+\xe1\xebP\xa1\xd6{\xd8\xfc\x15\xe2\xa97\x18\x96=;\
+a!\x7f\x93_\xf8(G\xfc\x12\x9f\xf6\xd5\xff\x00\x82\
+d\xf8\xce\xcf\xc3_\xb5\x07\xc2\xe9\xb4\xcf\x0b\xeb\xd7s\
+Y\xf8\x1f\xe2\xff\x00\x84n\xcf\x8a\xfe\x12\xf8\xf1\xad\xa2\
+\xf3\xa4\x87C\xf1m\xb4\x10\x1b\x1db\x18\x95\xe4\xb8\xf0\
+\xbf\x8a,<?\xe2\x98 \x89\xef\x8e\x8at\xb3\x05\xf4\
+\xcf\x99w&T\xa5\x1dm\x7fM{\x7f_\x8fV~\
+r\xd1@>\xd8\xe7\xa7\x07\xe8r\xa4\x8eF\x08\xc1<\
+\x1a\xfa3\xf6\x5c\xfd\x92\x7fh\xef\xdbK\xe2\xbe\x8f\xf0\
+O\xf6a\xf8K\xe2\xbf\x8b\xdf\x11\xb5\x81\x1c\xe7G\xf0\
+\xd5\xa4B\xcbC\xd2\xda\xf2\xde\xc6o\x10\xf8\xb3\xc4:\
+\x8c\xd6>\x1c\xf0\x8f\x86,\xeen\xed\xe2\xbe\xf1'\x89\
+5]3E\xb4\x92h\xa2\x9a\xf9%\x9a\x14\x91\xdc\x84\
+\x9bi-\xd9\xf3\x9d\x15\xfd\xc9~\xcd\x9f\xf0eO\xc5\
+\xdf\x12hVZ\xdf\xed[\xfbdx7\xe1\xa6\xaf<\
+{\xa6\xf0\x1f\xc1o\x87\x97\xdf\x12\xe5\xb6Im\xa3t\
+\x17\xbe=\xf1G\x88<\x0d\xa7%\xed\xa5\xd1xg\xb4\
+\xd3\xbc!\xabY\xcc\x8a\xb3[\xeb\x8d\xf7+\xebC\xff\
+\x00\x06J~\xcf\xdbT'\xed\xdf\xf1\x8c0\x1f3I\
+\xf0\x87\xc1\x12e\xb9\xe4c\xc4\xf1\xb69\xc7,H\xf5\
+5<\xd1\xef\xf9\x9a*Skkz\xa5\xe5\xfd|\xad\
+\xd5\x9f\xe7sGc\xfe\xeb\x7f\xe8&\xbf\xd0\xf6O\xf8\
+2K\xe0n\xc2\xb1~\xde\xdf\x16C`\xed2\xfc\x17\
+\xf0{\x80{\x12\x17\xc6\x91\xf7\xeb\x8c\x1cg\x9cq_\
+\xc8\xc7\xfc\x16?\xfe\x09\xc5\xa3\xff\x00\xc1,\xff\x00l\
+\xbdC\xf6W\xd0\xbe)j\x9f\x184\xdb_\x86\xbe\x08\
+\xf1\xec\x1e1\xd5\xfc-g\xe0\xfb\xd9[\xc6\x11j\x86\
+M:M\x22\xc3X\xd6\xe0+b\xf6\x0c\xabu\xf6\xd2\
+f\xdd\xbb\xc9\x88\x82\x0bM7d\xee\xdf\xf5\xd4R\xa7\
+(\xab\xbb[\xe5\xfd\x7fW\xea\xcf\xefw\xfe\x0d\x02\xe3\
+\xfe\x09\x17\x1f\xfd\x9c\xcf\xc6\xaf\xd6/\x08\x9a\xfe\xa4\xdf\
+\xa7\xe7\xfc\x8d\x7f-\x9f\xf0h\x1f\xfc\xa22?\xfb9\
+\x9f\x8d_\xa4~\x12\x1f\xccW\xf5&\xfd??\xe4k\
+);\xc9\xdb\xfa\xd0\xe9\x8d\xfd\x9e\xbb\xf2\xb3\xf2W\xf6\
+\xdc\xff\x00\x92\xb7a\xff\x00b^\x9b\xff\x00\xa7\x0dj\
+\xbd\xe7\xf6\x10\xff\x00\x917\xc6\x7f\xf63\xdb\x7f\xe9\xb2\
+\xda\xbc\x1b\xf6\xdc\xff\x00\x92\xb7a\xff\x00b^\x9b\xff\
+\x00\xa7\x0dj\xbd\xe7\xf6\x10\xff\x00\x917\xc6\x7f\xf63\
+\xdb\x7f\xe9\xb2\xda\xbf\xc7\x8f\x0b\xaf\xff\x00\x15\x22\xe3\x8e\
+\xdf\xda<eo\xfc2\xd2\xdc\xfe\xc0\xe2\xaf\xf9F\xce\
+\x1e\xf4\xca\x7f\xf5:\xb1\xf7\x9d\x14Q_\xec)\xfc\x84\
+\x14Tm*\xa3\x05l\xf2\x01\xce8\xe78\xfeG\xe9\
+\xc7\xa8\xa7\x16\xda2A\x03\xd7#\xfch\x01\xd4S\x15\
+\xc3\x1c\x0c\xf7\xed\x8e\x07~z\xfe\x19## S\xe8\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\xbeG?\xb7\xef\xec$?\xe6\xf5\x7fd\x9f\xc7\
+\xf6\x90\xf86?\xf7s\xa0\xfe\xdf\xdf\xb0\x88\x1b\x8f\xed\
+\xab\xfb%`rq\xfbG\xfc\x1c?\xcb\xc6y?\x95\
+\x00}qE|\x82\xdf\xf0P_\xd84\x7f\xcd\xec~\
+\xc9\x03\xd9\xbfh\xdf\x84\x19\xfd<bx\xff\x00\xeb\xd4\
+M\xff\x00\x05\x0c\xfd\x81\xd4g\xfe\x1bo\xf6H\xeb\x8e\
+\x7fh\xdf\x84\x18\xff\x00\xd4\xc2\x80>\xc3\xa2\xbe7o\
+\xf8(\x9f\xec\x04\x87\x0f\xfbo~\xc9\x19\xeb\xc7\xed\x17\
+\xf0\x88\x8f\xc0\xff\x00\xc2^A\xfc\xea\x13\xff\x00\x05\x19\
+\xff\x00\x82\x7f\x02A\xfd\xb7\xff\x00dq\xe9\x9f\xda/\
+\xe1\x0e\x7f/\xf8L3\x8c\xf7\x03\x14\x01\xf6u\x15\xf1\
+[\x7f\xc1H\x7f\xe0\x9f(\x09?\xb7\x1f\xec\x8b\x85\xfb\
+\xc4~\xd1\x7f\x098\xcf\xfd\xcd\xbf\xa7\xbf\xb50\xff\x00\
+\xc1I\xbf\xe0\x9e\x8a2\x7fno\xd9\x17\xa6q\xff\x00\
+\x0d\x17\xf0\x97\xff\x00\x9a\xbf\xeb@\x1fk\xd1_\x11\x1f\
+\xf8)w\xfc\x13\xb9F[\xf6\xe9\xfd\x91@\xff\x00\xb3\
+\x88\xf8M\xff\x00\xcda\xfcj&\xff\x00\x82\x9a\x7f\xc1\
+:\x97\xfeo\xaf\xf6D\xe3\xaf\xfcdO\xc2s\x8f\xc4\
+x\xac\x8f\xd7\xf0\xa0\x0f\xb8\xa8\xaf\x86?\xe1\xe7\x7f\xf0\
+N@@?\xb7\x7f\xec\x843\xe9\xfbD\xfc($c\
+9\xce<U\xfe\x15\x0b\xff\x00\xc1P\xff\x00\xe0\x9b\xc9\
+\x92\xdf\xb7\x97\xec\x860q\xff\x00'\x0d\xf0\xab\xaf\xfe\
+\x159\xfd(\x03\xee\xda+\xe0\xb3\xff\x00\x05J\xff\x00\
+\x82m(\xf9\xff\x00o_\xd9\x00\x1fo\xda\x1b\xe1Y\
+\x03\xeb\x9f\x14\x03\xed\xd3\xf3\xa8[\xfe\x0a\xa7\xff\x00\x04\
+\xd2@\x0b\xfe\xdf_\xb2\x00\xe7\x19\xff\x00\x86\x85\xf8\x5c\
+\xc0\xfd6\xf8\x98\x9f\xcf\x14\x01\xcc\x7f\xc1a\xff\x00\xe5\
+\x14\xff\x00\xf0QO\xfb3o\xda\x0f\xff\x00U\xa7\x88\
+k\xf9\x90\xff\x00\x83$?\xe4\x88~\xdf?\xf6V>\
+\x0a\xff\x00\xea\x1d\xe3J\xfd\x93\xff\x00\x82\xab\x7f\xc1J\
+\xbf\xe0\x9f?\x10\xff\x00\xe0\x9a\xdf\xb7\x7f\x80\xbc\x09\xfb\
+k~\xcb\xbe0\xf1\xa7\x8c?e/\x8e>\x1b\xf0\xbf\
+\x85<5\xf1\xc3\xe1\xde\xb5\xe2/\x11\xeb\xda\xcf\xc3\xed\
+r\xcbI\xd1\xb4='O\xf1\x05\xc5\xee\xa3\xaaj7\
+sGmgek\x04\xd7\x13\xcf\x22G\x1clXg\
+\xf1\xb3\xfe\x0c\x90\xff\x00\x92!\xfb|\xff\x00\xd9X\xf8\
++\xff\x00\xa8w\x8d*\xd7\xc0\xfd\x7f\xc8_iz?\
+\xcd\x1f\xdc\x85\x14QP0\xaf\xe5s\xf6\xdc\xd5t\xbd\
+;\xfe\x0e\x93\xff\x00\x82I\x08\x1a!\xa9\xdc~\xcb\x1f\
+\x1d\xacu\x10\xa5|\xc3\x16\xa3\xe1\xbf\x8e\x90i\xc2Q\
+\xf7\xbe`.|\x9e~lH\x008\xe3\xfa\xa3\xaf\xe0\
+\x9f\xf6\xed\xfd\xb0\xfe\x16\xe8\x7f\xf0v\xff\x00\xec\xbf\xad\
+\xf8\xf7\xc6\xbe\x18\xf8u\xf0\xef\xf6`\xf0\x17\x85~\x14\
+\xf8\xe7\xc7\xde1\xf1>\x91\xa2\xf8?K\xbe\xf17\xc2\
+_\x89\x9e<\xbe\xd45-cP\xb8\xb5\xb1\xd0\xa1\x82\
+\xe3\xe2\x9e\x8d\xe1\x9b\x985+\x88\xe4}R\xc0\xb2\x92\
+\xb7V\xf1\x80\x99t\xff\x00\x12?\xbde9P}\x87\
+\xe1\xc0\xe2\x9d_\x9fC\xfe\x0a\xc1\xff\x00\x04\xc7Q\x83\
+\xfb\x7f~\xc8\x03\x1e\xbf\xb4'\xc2\xe1\xff\x00\xbb7\xe1\
+\xf8zR\xff\x00\xc3\xd8\x7f\xe0\x98\xdf\xf4\x7f\xff\x00\xb1\
+\xff\x00\xfe$'\xc2\xef\xfei\xa8*\xff\x00\xd7\xf5\xea\
+\x8f\xd0J+\xe1\xef\x08\x7f\xc1L?\xe0\x9e\xbf\x10\xbc\
+S\xe1\xef\x02\xf8\x07\xf6\xd9\xfd\x96\xfce\xe3o\x17j\
+\xf6>\x1f\xf0\xa7\x85<7\xf1\xc3\xe1\xde\xb5\xe2\x0f\x11\
+\xeb\xda\x9c\xcbm\xa6\xe8\xfa6\x93\xa7\xf8\x82{\xedG\
+Q\xbe\xb8t\x82\xd6\xce\xd2\x19n'\x95\x968\xa3f\
+`\x0f\xdb\xd1\xb32\x82\xd8\xdd\xdfh8\xce\x07L\x93\
+\xc7\xa7'\x8f|\x8a\x00]\x8b\xc1\xda>^\x98\xe3\x1e\
+\xc3\x18\x1e\x9e\xd9\x0az\xaa\x91\xfeq_\xf0x\x0f\xfc\
+\x13\x83\xc1?\x04>.\xfc.\xfd\xbe\xfe\x13h\x1ao\
+\x864\x8f\xda7^\xd4\xfe\x1e\xfcr\xd1\xf4\xb4k{\
+K\x9f\x8b\xfa>\x90\xfa\xf6\x83\xe3\xc1i\xe6}\x9a\x0b\
+\xbf\x1b\xf8j\xc7V\xb5\xf1\x09\xb2\x82\x0by5\x7f\x0a\
+G\xad\xde\xf9\xda\xbf\x88\xef\xaed\xff\x00Gz\xfeQ\
+\x7f\xe0\xf1h\xa3o\xf8$\xff\x00\x84\xe6h\x91\xe5\x8f\
+\xf6\xc2\xf8?\xe53 .\x85\xbc\x0d\xf1yH\x8d\xf6\
+\x97Fq\xf2\xfc\x87'w\x19\xc2\xe2\xa0\xfd\xef_\xf8\
+s:\xb1N\x0d\xbf\xb3\xaa\xf3\xe9\xdb\xfc\x8f\xc3/\xf8\
+4g\xfe\x09y\xe0\xbf\xda\x07\xe2\x97\xc4\x1f\xdb\xf7\xe3\
+\x7f\x83\xec|U\xe0\xdf\xd9\xef\xc4\xd6\x1e\x07\xf8\x13\xa0\
+\xf8\x8a\xc2\x1b\xfd\x0a\xef\xe3g\xd8,\xfcA\xab\xf8\xfe\
+}6\xf2'\xb7\xd4.\xbe\x1a\xe8\xd7\xfa(\xf0\xab\xc8\
+\x93[\xd8\xf8\xab_\xfe\xda\xb7\x11\xeb^\x1a\xd3\xee-\
+\xbf\xd2\x14\x22\xaf\xdd\x5c~|c\xd3\xd3\xf0\xc5~\x03\
+\xff\x00\xc1\xb1\xdf\x06!\xf8;\xff\x00\x04h\xfd\x96L\
+\x96\xf6\x09\xab|S\x93\xe2G\xc6=b\xee\xc7\xcc'\
+Q>8\xf8\x83\xe2\x06\xf0\xfc\xf7\xa6N>\xddg\xe0\
+\xbd7\xc2\xfa<\xc2/\xdc\xaa\xe9q\x08\xd9\xb6\x97o\
+\xdf\xaaM\xdd\xdc\xa8\xabE%\xd9\x07J)\x18\x90\xa4\
+\x81\x9c\x0c\xfe_R?\x9dx\xef\x8e?ho\x80\xbf\
+\x0cg\xb9\xb6\xf8\x97\xf1\xbf\xe1\x07\xc3\xdb\xabM\xbfh\
+\xb5\xf1\xc7\xc4\xaf\x06xJ\xe2\xdbp\x04}\xa2\x1d\x7f\
+[\xd3\xde\x1c\x83\xb9L\x8a\xa1\xd4\x82\xa4\x8eJ(\xfc\
+\x98\xff\x00\x83\x94?\xe5\x08\xff\x00\xb7w\xfd\x8a\x7f\x09\
+\x7f\xf5\xa1\xfe\x11W!\xff\x00\x06\xc4\x7f\xca\x16?d\
+\x8f\xfa\xef\xf1\x9f\xff\x00Wo\x8f\xeb\xc8\xff\x00\xe0\xe1\
+\xaf\xdb\x03\xf6L\xf8\x93\xff\x00\x04r\xfd\xb5\xbc\x0d\xf0\
+\xf3\xf6\xa0\xfd\x9d\xfcy\xe3=\x7f\xc3\x1f\x0b\xa1\xd1|\
+%\xe0\xbf\x8d\x7f\x0d|S\xe2}b[?\x8f\x1f\x0b\
+5+\xa8\xb4\x9d\x03B\xf1=\xfe\xab\xa8Imae\
+u}r\x96v\x93\xb4\x16V\xd7\x17R\xaa\xc1\x04\xd2\
+\xc7\xeb\x9f\xf0l?\xfc\xa1[\xf6G=\xfc\xef\x8c\xa7\
+\xdb\xe6\xf8\xd9\xe3\xf3\xff\x00\xea\xe6\xab\xec\x7f\xdb\xdf\xa1\
+?o\xfe\xdd\xfdO\xdf\x9a\x8at\xf3\x22t=\x1dJ\
+\xe3\xd7p*\x07\xe6A\xfc*Z\x8af*\xbb\xb8\xe0\
+\xf5'\x00u\xe4\xe7\x1c\x01\x93\xc1\xc8\xc6@c\xf2\x99\
+\xdf\xf0\xfc5(\xff\x00'\x0f\xf8$O\xfc\x13y\xbf\
+\xe0\xa1_\xf0Y\xbf\x88^\x10\xf1V\x99\xf6\xaf\x81\xdf\
+\xb3\xf7\xc7\x1f\x89\xdf\x19\xfe74\xd1\xca\xf6Z\x9e\x87\
+\xe1_\x8b\x1a\xbc^\x14\xf0\x14\x8e\x8d\x1a4\xfe:\xf1\
+RX\xe9\xd7\x10<\x88d\xf0\xcd\x97\x89n@\x93\xec\
+~M\xcf\xfa\xc6\xdb\xc2\xb0\xc6\xb1\xaa,k\x18TE\
+@\x02\xaa**\xa8\x0a\xa1T\x00\x06\x00U\x01T\x01\
+\xda\xbf\x16\xbf\xe0\x89\xff\x00\xf0N\xbb/\xd8_\xe0\xaf\
+\xc6/\x19x\xaf\xc3\xd2\xe9\x7f\x1d\xff\x00j\xcf\x8f\xbf\
+\x15~4\xfcO\x97P\xb6\x8a-[F\xf0\xee\xa7\xe3\
+\xcf\x13I\xf0\xab\xc0\xfb\xb6y\xf6\xf6\x9e\x1f\xf0u\xe4\
+\x1a\xbd\xf5\x8c\x92K\xe4\xf8\x9b\xc4\xda\xf7\xce\x15\x22\x86\
+\x0f\xda\xcam\xdd\xdcQ\x8f-\xed}]\xf5\xf4K\xf4\
+\x0a\xfc-\xff\x00\x83\x81?\xe0\xa6C\xfe\x09\xb5\xfb\x08\
+\xf8\xb7[\xf0f\xa9o\x17\xed\x0f\xf1\xeaMK\xe0\xe7\
+\xc0\x1d5\x1e95\x1d;]\xd5\xf4\xb9?\xe1&\xf8\
+\x89\x1d\x98\x95n%\xb4\xf8{\xa0\xdc\x8b\xf8$Xd\
+\x87\xfe\x12\xcdO\xc1\xfae\xd0\x10\xea\xfea\xfd\xbf\xd6\
+5m?B\xd2\xef\xf5\x9dZ\xf6\xd7M\xd2\xb4\xab;\
+\xbdKS\xd4o\xa6K{+\x0d>\xc2\xde[\xbb\xeb\
+\xdb\xbb\x99H\x8a\xde\xd6\xd2\xd6\x19\xae'\x9eVX\xe2\
+\x8a6f5\xfe^\x9f\xb4W\xedm\xff\x00\x0f\xc6\xff\
+\x00\x83\x86\x7ff\x7f\x0a\xd8\xea2\xeb\x1f\xb3\x1f\x85\x7f\
+h\xaf\x03\xfc,\xf8;\xa3\xff\x00f\xcdw\xa6\xea?\
+\x08\xbe\x1e\xf8\xa5<]\xe3\x8f\x15_\xe93\x04f?\
+\x15%\xf0\xfe\xb3\xaaj\xb3\xdd$R[\xf8n\xe3E\
+\xd3/\x10\xc5\xa2\xc3H\x1b\xb5\xbc\xdaG\xf61\xff\x00\
+\x06\xfc\xff\x00\xc1&\xbc\x1b\xff\x00\x04\xef\xfd\x92|)\
+\xf1\x07\xc7\x1e\x1d\xd3\xb5_\xdb\x03\xf6\x87\xf0\xe6\x9b\xe3\
+\xbf\x8e_\x10u\x0bt\xbc\xf16\x87g\xe2_\xb3\xf8\
+\x8fE\xf8O\xa7j\xd7\x13]\xcdk\xa4\xf8f\x09\xed\
+&\xf18\xb1\x9a8\xfcI\xe33\xa8\xea\xf7\x86\xea\x1b\
+]\x0dl?\xa0P\xa1z\x0c}?\xcf\xe1\xf4\xe3\xa5\
+G\x0ci\x12\x95@\x02\xe4`(\xc2\xe3b\x81\xb4z\
+`\x0e\xe7\x9c\x9c\xe7\xa4\xb4\x0c(\xaf4\xf8\xd1\xf1C\
+E\xf8!\xf0{\xe2\xbf\xc6\x8f\x12X\xea\x9a\x9f\x87~\
+\x10\xfc6\xf1\xcf\xc4\xfd\x7fM\xd1\x22\xb5\x9bZ\xd44\
+O\x00\xf8cT\xf1^\xadc\xa3\xc3}wae.\
+\xabwa\xa4\xdcA\xa7Gy}eh\xf7\x92B\xb7\
+7v\xd0\x17\x99???\xe0\x95\xff\x00\xf0V\x7f\x81\
+\x1f\xf0V\xbf\x86\x7f\x13\xfe)|\x04\xf0\x0f\xc5\xbf\x00\
+\xe8_\x0a\xbcye\xf0\xfb]\xb0\xf8\xbd\xa6x7K\
+\xd6/\xb5{\xff\x00\x0fYx\x92+\xbd*\x1f\x05\xf8\
+\xdb\xc6\xf6Ri\xa9c\x7f\x0cO5\xdd\xf5\xa5\xc1\xba\
+I\x95-\x8c\x08\x97\x12\x80~\xa6\x90\x08\xc1\x19\x1e\x86\
+\xbef\xfd\xaf\xbfd\xdf\x83?\xb6\xcf\xec\xef\xf1?\xf6\
+k\xf8\xeb\xe1\x8bO\x11\xf8\x03\xe2_\x87\xaf4\x9b\x93\
+*\x0f\xed\x1f\x0fk>S>\x83\xe3\x0f\x0e\xdd\x82\xb3\
+i\xbe%\xf0\xbe\xa8-um\x22\xfa\x07V\x176\x91\
+\xc18\x9e\xceY\xed\xa5\xfaj\x9a\xe3*G\xe3\xf4\xc1\
+\xcey\xf4\xc6\x7f\x974\x01\xfe\x15\xff\x00\xb4g\xec\xfd\
+\xe3\x8f\xd9\xbb\xf6\x8d\xf8\xbd\xfb4\xf8\xb2\xd6k\xff\x00\
+\x1d|#\xf8\xa3\xe2\x9f\x85\xda\x84z~\x9fy\x1b\xeb\
+\xba\xa7\x87\xb5\xbb\x9d\x1e\xca\xff\x00I\xd3\xa4\x8d\xafd\
+\x83\xc4Q\xc3m\xa9iJ\xab+]\xc1\xa8Z\xb5\xb3\
+N\x93\xc0\xd2\x7f\xad\xa7\xfc\x10\xef\xfe\x09\x81\xf0\xfb\xfe\
+\x09\x9f\xfb\x16\xf8\x03\xc2\x09\xe1\x8b\x14\xf8\xff\x00\xf1S\
+\xc3~\x1c\xf1\xff\x00\xed\x1b\xe3k\x8bh\x1f_\xd5\xbc\
+s\xa9\xe9\xab{\x17\x83\x0d\xfe\x1ed\xf0\xbf\xc3\x88u\
+\x09\xfc9\xe1\xfd2\x19~\xc6\xb7\x11\xea\xda\xdb\xc65\
+\x1dn\xf6G\xfe,?\xe0\xa8\xff\x00\x06<#7\xfc\
+\x1dk\xe0\xbf\x03\xdc\xe9v\x97\xfe\x1f\xf8\x97\xfbP\xfe\
+\xc5\x1e$\xf1F\x97|\x1a[=P\xf8\xb3G\xf8M\
+\x7f\xaf\xdb]! \x98oc\x82uh\xd0\x8c4\x85\
+C\x00M\x7f\xa7R(\x18#?t\x0c\x7f\x87\x19\xfd\
+y\xef\xd0V\x92o\x95y\xad\x7f\x06e\x08\xa5)\xbb\
+k\xcde\xf7/\xce\xe3\x80\x03\xa0\xc79\xfcih\xae\
+'\xe2\x07\xc4\x7f\x00\xfc)\xf0\xcd\xff\x00\x8d\xbe'x\
+\xdb\xc2\x1f\x0e\xbc\x19\xa5\x1bE\xd5<]\xe3\xbf\x12\xe8\
+\xde\x11\xf0\xc6\x9a\xf7\xd7p\xd8Y\xa6\xa1\xafk\xf7\x96\
+\x1a]\x93^^\xdc\xdbY\xda\x0b\x8b\x9477\x97\x10\
+[D\x1aYQ[3S\xb6\xaf\xf2\xdf\xff\x00\x83\xc2\
+4\xb6\xb3\xff\x00\x82\xb0iw\xf8\xc7\xf6\xbf\xec\xbf\xf0\
+\x9e\xe9I\xfe/\xb2k>:\xd3\x89\x03\xfd\x9f\xb3\x91\
+\xf8\xfa\xf4\xff\x00F\x9f\xf8o\xdf\xd8K\xfe\x8fW\xf6\
+J\xff\x00\xc4\x8f\xf87\xff\x00\xcd\x9d\x7f\x9c\x7f\xfc\x1d\
+\xcb\xf1O\xe1\x0f\xc6\x0f\xf8(\xaf\xc2\x8f\x18|\x1c\xf8\
+\xa1\xf0\xef\xe2\xbf\x87\x9b\xf6R\xf0n\x97\xa8\xf8\x83\xe1\
+\x9f\x8d\xbc3\xe3\xcd\x12\xd3Z\xb1\xf8\x8f\xf1E\xa4\xd2\
+\xee\xf5_\x0bj\x9a\xa5\x95\xbe\xa3\x15\x8c\xd6S\xcbg\
+4\xcbq\x1c\x17V\xf3\x14\x11\xcf\x09\x96\xe9\xfcq\xf5\
+3\xab\xf0?+?\xc5\x1f\xd4\x8f\xfc\x1a\x02\x7f\xe3Q\
+q\xff\x00\xd9\xcd|k\xff\x00\xd1~\x12\xaf\xeaQ\xba\
+~\x7f\xfa\x09\xaf\xe5\xaf\xfe\x0d\x01\xff\x00\x94E\xc7\xff\
+\x00g5\xf1\xaf\xff\x00E\xf8J\xbf\xa9G\xe9\xf9\xff\
+\x00#PW\xd8\xff\x00\xb7\x7fC\xf2W\xf6\xdd\xe7\xe2\
+\xdd\x80\xf5\xf0^\x9b\xff\x00\xa7\x0dj\xbd\xe7\xf6\x10\xff\
+\x00\x917\xc6\x7f\xf63\xdb\x7f\xe9\xae\xda\xbc\x1b\xf6\xdd\
+\xff\x00\x92\xb7a\xff\x00b^\x9b\xff\x00\xa7\x0dj\xbd\
+\xe7\xf6\x10\xff\x00\x917\xc6\x7f\xf63\xdb\x7f\xe9\xae\xda\
+\xbf\xc7\x9f\x0b\xbf\xe5d\x5cq\xa7\xfc\xccx\xcb^\xff\
+\x00\xf0\x8bL\xfe\xbf\xe2\xaf\xf9F\xce\x1e\xf4\xca\x7f\xf5\
+:\xb1\xf7\x9d\x14S_\xee7\x19\xe3\x1d\x09\xeb\xc1\xe3\
+\xbe\x078\xe0\x1e\x84\x81\xc8\xff\x00a\x8f\xe4#\xf8\x90\
+\xff\x00\x83\xce?k\x1f\x10\xfc?\xf8=\xfb#\xfe\xcc\
+\x1e\x08\xf1n\xb1\xe1\xad[\xe2?\x8e|[\xf1\x8f\xc6\
+\x1f\xd8Z\xae\xab\xa4\xdd\xdc\xf8k\xe1\xe6\x90\xbe\x18\xf0\
+\xe5\x85\xeb\xd8\xf9\x11\xdc\xd8\xdf\xf8\x83\xc6\x17\xf7\xc8\x9f\
+k\x12\xc1y\xe1\xc8\x99\xe2)\x22\x93\xfe}\x7f\xf0\xb7\
+>+\x8e\xbf\x13~!\x8ez\x7f\xc2i\xe2Q\x9c`\
+\xff\x00\xd0K=\xc7\xe7\xc5\x7fB\xdf\xf0u\xf7\xed\x08\
+>5\x7f\xc1[\xfc}\xe0{;\xd6\xb9\xd0\xff\x00f\
+\xff\x00\x86\x1f\x0d\xbe\x0fZ[\xaa\xddG\x0c\x1a\xe5\xce\
+\x937\xc4\xbf\x14Jc\x9ay {\xa6\xd4\xbe %\
+\x84\xf7Vq[\xc5=\xbe\x93\xa7\xdb\xc8\x92Id\xd3\
+\xcb\xf9a\xf1;\xf6(\xd5>\x1f\x7f\xc15?e\x8f\
+\xdb\x8e\xe2\xda\xea\x05\xf8\xf1\xfbH~\xd1\x1f\x0a\xe6k\
+\xa9\x9b\xc9\xba\xf0\xe7\x81<?\xf0\xe5\xbc\x0f{\xa5\xdb\
+G\xe6B\xb6\xf2x\x8fN\xf8\xbfc}u9\xb7\xb9\
+{\x9b+hV)\xed\xa2\x8ed\xda)r\xad:v\
+\xef\xaf\xf5\xe8sT\xe7r\x9d\x9f\xbb\x1bzl\x9f\xe7\
+\xfdn\x7f\xa2W\xfc\x1au\xfbMj?\x1e\xff\x00\xe0\
+\x96\x1a'\x82<G\xad^\xeb~,\xfd\x9d>0|\
+E\xf8g\xa9^j\x97/w\xa9\xdc\xe8\xbe \xbd\x87\
+\xe2o\x86\xaen\xaf.o\xaf5\x0b\xe2\x22\xf1\xae\xa3\
+\xa6\xc3yv\x96\xc8#\xd2\x8e\x9fm\x1c\xb1\xe9\xe6Z\
+\xfe\x9d+\xfc\xe4\xff\x00\xe0\xcbO\xda$\xf8_\xf6\xa0\
+\xfd\xab?e\xedOX\xb6\xb6\xd3>-\xfc&\xf0\xdf\
+\xc5o\x0c\xe9w\x0d\xa6\xc1%\xff\x00\x8a\xfe\x13x\x82\
+M\x17Q\x8a\xc5\xa6\x03S\xbb\xbc\x93\xc3\x1e?\xb9\xd4\
+M\x8d\x8c\x92[.\x9f\xa3\xdf_\xdd@\x1e\x08\xe6\x1f\
+\xe8\xd9Y\xc9Y\xd9v\xb9\xbc\x1bq\x8b{\xb4! \
+u\xa5\x07=+\xc7>>~\xd0\x1f\x06\xff\x00f\x0f\
+\x85\x1e.\xf8\xe1\xf1\xf3\xe2\x1f\x86\xbe\x16\xfc*\xf0-\
+\x8a\xea\x1e(\xf1\x9f\x8a\xae\xda\xdbL\xd3\xe1\x92d\xb6\
+\xb5\xb6\x86(Rk\xedSV\xd4\xef%\x83O\xd1\xb4\
+M&\xd6\xfbX\xd6u;\x9b]7K\xb0\xbb\xbd\xb9\
+\x8a\x16\xfeV>;\x7f\xc1\xe6\x7f\xb0\x17\x80\xf5\xab\xed\
+\x0f\xe0w\xc0\x7f\xda+\xe3\xd4z}\xeb\xdb\xff\x00\xc2\
+W}g\xe1/\x84\xbe\x0b\xd6-\xbc\xa8\x9do\xb4\x19\
+\xf5\xfdg^\xf1\xbc\x91\x09$0\xcb\x1e\xbf\xe0\x1f\x0e\
+L\xae\x9b\x929\x22\x91d\xa9\x1b\x92[\xb4\xbdO\xec\
+$\xb0\x1dN)k\xf9V\xfd\x94?\xe0\xee\xcf\xf8&\
+\x9f\xc7\xff\x00\x14h>\x07\xf8\xbf\xa0\xfc_\xfd\x93\xbc\
+A\xae]Aa\x0f\x89>'\xe9>\x1f\xf17\xc2H\
+5\x1b\xcb\x98\xad\xac\xed\xaf<}\xe0\x8doR\xd6t\
+[wi\x04\x97z\xe7\x8a\xbc\x09\xe1\xbf\x0c\xe9p\x07\
+\xba\xd55\xcb+h\xa4\x99\x7f\xa9=\x13Z\xd3<E\
+\xa5i\xba\xee\x87\xa8\xe9\xfa\xc6\x89\xac\xe9\xf6z\xae\x91\
+\xab\xe97pj\x1af\xab\xa6j\x16\xf1\xdd\xd8jZ\
+m\xfd\xac\x93Z\xde\xd8^\xda\xcd\x15\xc5\xad\xd5\xbc\xb2\
+Cq\x04\xb1\xcd\x0c\x8f\x13\xa3\xb04\xee\xae\xb5F\xae\
+Fq\xdf\xd2\x96\xbf\x0d\xbfk\xaf\xf88{\xfe\x09\x9d\
+\xfb\x11~\xd0\xff\x00\x10\x7ff\x1f\x8f\xbf\x10>%h\
+\xbf\x16~\x18I\xe1\xe8\xbcY\xa6h\x1f\x08\xfc]\xe2\
+]*\xd9\xfcQ\xe1M\x07\xc6\x9a@\xb4\xd6\xf4\xc8\x1e\
+\xc6\xfb\xcc\xd0\xbcI\xa5\xcd0\x81\x89\x82\xe2W\xb6\x7f\
+\xde\xa1\x15\xea\x7f\x07\xbf\xe0\xb8\xff\x00\xf0N\x9f\x8d?\
+\xb2w\xc5\xff\x00\xdbgB\xf8\xc5\xa8\xf8_\xf6x\xf8\
+\x1d\xe2\x98\xbc\x13\xe3\xcf\x17|@\xf0g\x88\xfc)~\
+<[u\xa5\xe9\x9a\xb6\x9b\xe1\xef\x0d\xf8n\xe2\xd2}\
+{\xc5z\xc6\xaf\x06\xb1a\x06\x91\xa6\xe8\x16\x17\xf7\xda\
+\x8d\xe4\x8f\x0d\xbd\xb1\x11J\xf1\x81{\xfd\xf6?]A\
+\x07\xa7?\x9d-\x7f3\xff\x00\xb0\x8f\xfc\x1c\xd9\xfb4\
+\x7f\xc1B\xbfn\xff\x00\x06\xfe\xc5\xbf\x03\xfe\x00|f\
+\xd24\xdf\x1d\xe9\xff\x00\x10/<=\xf1w\xe2\x05\xf7\
+\x84tXn\x1f\xe1\xef\x82|C\xe3\x8b\xe7\x9b\xc0\xba\
+6\xa5\xe2;\xebm?W\xd3\xfc;q\x06\x91s7\
+\x88\x17P2\x5c\xdb\xbe\xa5\xa4i\xf2\xad\xc5\xa4\x1f\xbb\
+_\xb4\xb7\xedS\xf0\x0b\xf6=\xf8M\xaf\xfcq\xfd\xa5\
+>(x[\xe1'\xc3\x0f\x0e([\xdf\x12x\xa2\xea\
+X\x9a\xf6\xfeK[\xab\xcbM\x07\xc3\xdaE\xa4WZ\
+\xd7\x8a\xbcQ\xa8\xc3i?\xf6_\x85\xfc7a\xaak\
+\xda\x9b\xc34v6\x17\x12F\xca\x01s+^\xfaw\
+\xf9\x1fCg?\x9e(\xaf\xe3{\xe3?\xfc\x1e\x81\xfb\
+\x0ax;X\xbb\xd2\xbe\x0a~\xcd\xff\x00\xb4w\xc6\x9b\
+[+\xb7\xb7o\x12\xeb\x87\xc0\xdf\x09\xfc=\xaaD\xac\
+v\xdf\xe81\xde\xeb\xbe1\xf1T\xf6\x93&\xd6\x855\
+\xef\x0a\xf8r\xf8I\xe6G=\x9c>Pi~\x86\xfd\
+\x94\x7f\xe0\xee?\xf8&w\xed\x05\xe2\xad\x03\xc0\xbf\x15\
+t\xaf\x8c\x1f\xb2\xa7\x88u\xfb\xbd?M\x83\xc4\x1f\x15\
+\xb4_\x0f\xeb\x9f\x0ab\xd4\xf5;\xa1gmmu\xf1\
+\x03\xc0\xfe \xd6\xaf\xb4[13)\xbb\xd7\xbc]\xe0\
+\xff\x00\x0cxsL\x81\xbe\xd7\xaa\xea\xf66\xb1\x5cK\
+\x05r\xbb_\xa7\xfc0\xb9\xa3{]_\xb1\xfdM\xd1\
+Y\x1a\x06\xbb\xa3\xf8\xa3B\xd1\xbcK\xe1\xdd[L\xd7\
+\xfc?\xe2\x1d+N\xd74-wD\xbe\xb6\xd4\xf4m\
+oF\xd5\xac\xe1\xbf\xd2\xf5}'R\xb2\x9a\xe2\xcfP\
+\xd35++\x88/,/m'\x9e\xda\xea\xd6h\xa7\
+\x82ibuv\xf0O\xda\xab\xf6\xbb\xfd\x9d?bo\
+\x84\xda\xb7\xc7\x1f\xda\x83\xe2\xb7\x86>\x11|3\xd2%\
+K#\xae\xf8\x8a[\xa9n\xb5}jh.n\xad<\
+9\xe1}\x0bL\xb6\xbe\xd7\xbcW\xe2[\xfbk+\xc9\
+\xec|=\xe1\xdd7S\xd6.\xa0\xb4\xbb\xba\x8e\xcc\xda\
+Y]\xcf\x0c\x94}%E\x7f\x1b\x9f\x19?\xe0\xf4?\
+\xd8[\xc2:\xbd\xd6\x97\xf0c\xf6k\xfd\xa3\xfe1[\
+Y\xdd\xdc[\x1f\x11x\x82O\x01\xfc)\xd05Ha\
+\x94\xacw\xfa\x0cs\xf8\x83\xc6\xbe(\x9e\xd6\xea\x22\xb2\
+C\x16\xbd\xe1\x7f\x0dj)\x92'\xd3\xe1 \x81\xec\xff\
+\x00\xb3/\xfc\x1e\x01\xff\x00\x04\xd1\xf8\xd3\xae\xe9\x1e\x14\
+\xf8\xc5\xe1_\x8e\x1f\xb2\xde\xad\xaaK\x14-\xe2o\x1d\
+xwC\xf1\xc7\xc2\xdbI\xee.\xed\xad \xb7\xb9\xf1\
+_\xc3\xedwU\xf1]\x9b\x13p\xd77\x17\xfa\xa7\xc3\
+\xad7C\xb1\xb3\xb7\x9a{\xbd^!\x85\xa0\x9ex\xff\
+\x002?\xab\xb2@\xea\x7f\x9d-s~\x11\xf1w\x86\
+|y\xe1\x8d\x07\xc6\x9e\x0d\xf1\x0e\x89\xe2\xbf\x09x\xab\
+J\xb0\xd7\xbc3\xe2o\x0d\xeaV\x9a\xce\x81\xaf\xe8z\
+\xad\xb4W\xba^\xaf\xa4j\xb6\x13\xdcYj:u\xfd\
+\x9c\xf0]Z^ZO%\xbd\xc4\x12\xa4\xb0\xc8\xf1\xba\
+\xb1\xfc<\xfd\xa5\xff\x00\xe0\xe4?\xf8%\xe7\xec\x95\xf1\
+\xe3\xe2o\xec\xdf\xf1\xa3\xe2'\xc4\xfd#\xe2\x87\xc2O\
+\x11\x1f\x0c\xf8\xc7O\xd1~\x0e\xf8\xc7_\xd3-uA\
+ae\xa8yV\x9a\xc5\x8d\xbb\xd9\xdf\xc7\xe4_D|\
+\xfbv1\x92J\x8eT\xd0U\xf4\xbfC\xf7\x9e\x8a\xfc\
+K\xbc\xff\x00\x83\x82\x7f\xe0\x99\xd6?\xb1\xa4\x9f\xb7=\
+\xc7\xc5\xdf\x11[|\x1a\xb9\xf8\x89\xe2\x1f\x84\xfe\x14\xd1\
+\xef|\x0b\xac\xd8|P\xf8\x83\xf1\x13\xc2\xfan\x8d\xab\
+\xeb\x1e\x1a\xf0O\x80\xaf\x85\xb6\xa1\xa95\xa5\x86\xbd\xa6\
+\xdc]kW\x93\xe9\xde\x1d\xd3\xa2\x9d%\xd5\xf5m>\
+\x19!\x92_\xc8\x0f\x0b\xff\x00\xc1\xe9\x9f\xb1\x1e\xa9\xf1\
+\x11\xb4_\x14~\xcb_\xb4\xd7\x85~\x19Kz\xb6\xd6\
+^>\xb7\x9f\xe1\xaf\x88|K\x14\x13\xc9\x1a\xc1\xa8k\
+\xbf\x0f\xed\xfcUcm\xa7[C\x134\xf7\xf0\xe8\x9e\
+6\xf1M\xfcQ+\x1b+=B\xe4-\x9c\x80\xb9\x97\
+u\xf7\xa3\xfb3\xa0\x9cu\xaf\x9c\x7feo\xda\xc7\xe0\
+'\xed\xa9\xf0o\xc3_\x1f\x7ff\xbf\x88\xba/\xc4\xdf\
+\x85\xde)\xf3\xa0\xb3\xd7t\x91ukw\xa6\xea\xd6i\
+\x0bj^\x1c\xf1&\x89\xa9Ai\xab\xf8o\xc4\xbaQ\
+\xb8\x84jZ\x16\xb1gk\x7fm\x1c\xd6\xb7F&\xb5\
+\xbd\xb5\x96O\x7f\xd5uM?D\xd2\xf5\x1dgV\xbe\
+\xb3\xd34\xad&\xc6\xefR\xd4\xf5-B\xe2\x1bK\x0d\
+?O\xb1\x82K\xab\xcb\xeb\xdb\xbb\x89\x22\x82\xd6\xd2\xd2\
+\xde)'\xb9\xb8\x9eH\xe1\x82\x18\xdeY\x1dQI\x00\
+\xcb\xc0\x83\xd2\x82@\xeb_\xcb/\xedU\xff\x00\x07q\
+\xff\x00\xc11\xff\x00g\xff\x00\x13\xeb^\x06\xf8Uc\
+\xf1\x83\xf6\xac\xf1\x1e\x8d=\xcd\x9c\x9a\xff\x00\xc2o\x0e\
+\xe8\x9a\x1f\xc2\x87\xd4l\xe5\x10\xdcZ\xc7\xe3\xdf\x1e\xf8\
+\x87\xc3\xfa\x96\xa7\x01`\xc2\xd7Y\xf0\x97\x83|W\xe1\
+\xeb\xe5Q5\x9e\xaf=\xbc\xb6\xf3O\xf2\x9f\xc3\x9f\xf8\
+=_\xf65\xd65\x16\xb7\xf8\xaf\xfb\x22~\xd2^\x04\
+\xd3L\xaa\x91j~\x07\xd6\xfe\x19\xfcL\x91\x11\x89\x02\
+{\xdd?Z\xd7\xbe\x17\xb4P\xa8\xc3Jl\xee5\x09\
+\x117\x94\x8aWD\x8e`\x978\xa7g%~\xc7\xf6\
+\x8fE|+\xfb\x0d\x7f\xc1H\xbfc\xef\xf8(\xd7\x80\
+uO\x88?\xb2g\xc5\xdd/\xe2\x1d\x97\x87.\xed4\
+\xff\x00\x19xf\xea\xc3S\xf0\xcf\x8f<\x0d\xa8\xdfC\
+4\xd66\xbe,\xf0v\xbfmc\xac\xe9\xf0\xea\x09k\
+vt\xbdb\x18.\xb4\x0dY\xac\xaf\xe2\xd2\xb5[\xd9\
+4\xfb\xc1\x17\xddT\x14\x14W\xe2o\xfc\x14;\xfe\x0b\
+\xff\x00\xff\x00\x04\xea\xff\x00\x82mx\xa3Q\xf8g\xf1\
+{\xc7\xde&\xf8\x8f\xf1\xb7K\x82\xda}O\xe0\x9f\xc0\
+\xcd\x02\xc7\xc7\x1e8\xd0\x92\xef\xec\xb2@\x9e+\xbe\xd5\
+u\xdf\x0a\xf8\x1b\xc2\x17\x92\xd9\xddG\xaaG\xa4x\x97\
+\xc6\x1a^\xbf.\x90\xd1\xea6\xdaE\xc4\x17V\x1fl\
+\xfcZ\xd1?\xe0\xf5\xef\xd9\x1a\x7f\x16=\x9f\x89\x7fc\
+o\xda7H\xf0/\x9a\xcb\x17\x894/\x14\xfc4\xf1\
+\x17\x8aZ\x1d\xc0G4\x9e\x0c\xd45\x1f\x0b\xe9Q9\
+C\xbd\xe1>:!O\xca\x93H\x03:\x04\xf3G\xba\
+?\xb5z+\xf3\xdf\xf6\x03\xff\x00\x82\xa0~\xc7\x1f\xf0\
+R\xef\x00\xea\xfe9\xfd\x94~(\xc7\xe2\xcb\x8f\x0aM\
+ek\xe3\xdf\x00\xf8\x87I\xbc\xf0\xa7\xc4\x9f\x00]\xea\
+\x11\xbc\x96)\xe2\x7f\x09j\x9b'[\x0b\xef*\xe2-\
+?\xc4:-\xc6\xb5\xe1}J\xea\xcfP\xb2\xd3\xf5\xdb\
+\xbb\xdd3Q\xb7\xb5\xfd\x06,B\x83\x8c\xe7\x1f\xafZ\
+\x0a\x17#8\xef\xe9K_\x87\xbf\xf0P\xaf\xf88C\
+\xfe\x09\xc5\xff\x00\x04\xe1\xf1\x96\xad\xf0\xab\xe2\xaf\x8e\xfc\
+[\xf1O\xe3~\x81\x1d\xac\x9a\xff\x00\xc1\xaf\x80\xfe\x1b\
+\xb1\xf1\x97\x8b|1\xf6\xf8\xe1\x96\xca\x0f\x16kZ\xf6\
+\xbf\xe1\x1f\x00\xf8n\xfeKk\x98u\x09t=G\xc6\
+\x09\xe2xt\xb9\x22\xbf\xff\x00\x84~Ho4\xdf\xb7\
+~5x{\xfe\x0fa\xfd\x91.\xbcR\xd6\x9e*\xfd\
+\x8c\xff\x00h\xfd\x17\xc1\x1e{\xa2x\x87\xc3\xfe)\xf8\
+e\xe2o\x15\x18\x81\xf9$\x7f\x07jZ\xaf\x84t\xa4\
+\x95\x867\xc4\xbe8uC\x90\xb3H\x06HK\x94c\
+\xf14\xbd_\xc8\xfe\xd5\xe8\xaf\xcfO\xf8'\xef\xfc\x15\
+\x17\xf64\xff\x00\x82\x99\xf8\x1fY\xf1\x9f\xec\xa9\xf1A\
+<M{\xe1Im`\xf1\xcf\xc3\xdf\x12i\x97^\x13\
+\xf8\x99\xe0Y\xefb\x8a[C\xe2O\x08\xea\x98\xb8}\
+6\xe9\xa4k{/\x13\xf8~\xe3^\xf0~\xa1y\x05\
+\xe6\x9f\xa7\xf8\x8a\xefQ\xd3\xb5+K?\xd0\xba\x0a?\
+\xc0\xde\x8a(\xae\x83\xcf\x0a(\xa2\x80\x0a(\xa2\x80\x0a\
+(\xa2\x80\x0a(\xa2\x80?o\xbf\xe0\x80\xdf\xf0Mo\
+\x81\x7f\xf0U?\xdbc\xc6\x1f\xb3o\xed\x09\xe2\xcf\x8b\
+^\x0d\xf0?\x87\xff\x00gO\x1c\xfc[\xb4\xd5~\x0d\
+k\xde\x0f\xf0\xf7\x8a\xe5\xf1\x1f\x86<y\xf0\xaf\xc3\x16\
+\x1677\xde5\xf0'\xc4-!\xf49\xac<q\xaa\
+Myl\x9a\x1a_\xbd\xed\xa6\x9f,\x1a\x95\xbc\x095\
+\xb4\xbf\xd8\xf7\xfcAy\xff\x00\x04\xb9\xff\x00\xa2\xf5\xfb\
+}\x7f\xe1\xd2\xfd\x9e\xbf\xfa\x16\xab\xf9\xeb\xff\x00\x835\
+\xbf\xe5+\x7f\x13\x7f\xec\xc8\xfe.\xff\x00\xea\xdf\xfd\x9e\
++\xfd@+9I\xa9h\xda\xb5\xb6\xf5\xbf\xf9\x1d4\
+\xa0\xb9#\xcd\x14\xda\xebk\xf6}\x7f\xaf\xbd\x9f\xc8\x9f\
+\xfcAy\xff\x00\x04\xb9\xff\x00\xa2\xf5\xfb}\x7f\xe1\xd2\
+\xfd\x9e\xbf\xfa\x16\xa8\xff\x00\x88/?\xe0\x97?\xf4^\
+\xbfo\xaf\xfc:_\xb3\xd7\xff\x00B\xd5\x7f]\x94T\
+\xf3K\xf9\xa5\xfd[\xcb\xc9\x1a\xf2C\xf9W\xdd\xfdv\
+\xfe\xae\xcf\xe4K\xfe \xbc\xff\x00\x82]v\xf8\xf5\xfb\
+|\xff\x00\xe1\xd2\xfd\x9e\xbf\xfa\x16\xc5~\xca\x7f\xc1,\
+\xff\x00\xe0\x90\x1f\xb3w\xfc\x12;\xc2\xff\x00\x17\xbc#\
+\xfb9x\xe7\xe3\x87\x8d\xf4\xcf\x8d\x1e \xf0\xbf\x89<\
+O?\xc6\xdf\x11\xf8\x0b\xc4w\xf6\x17\xbe\x12\xd3uM\
+/M\x87A\x97\xc0\x9f\x0d>\x1b\xc1ki,\x1a\xbd\
+\xd3\xde\xc7\xa8\xdbj\xd3K2\xc2\xd0\x5c[\x22\xc9\x1c\
+\xdf\xab4T\xeb\xeb\xe6\x0a)l\xb6\xf5\x0a(\xa64\
+\x88\xa7\x0c\xea\xa4\xf4\x04\x80NN\x063\xd7$\x801\
+\xdc\xe2\x82\x8f.\xf8\xe1\xf1w\xc0\xbf\x00~\x10\xfcI\
+\xf8\xe1\xf1;[\xb5\xf0\xe7\xc3\xdf\x84\xde\x08\xf1?\x8f\
+\xfcc\xad^K\xe5\xc3c\xe1\xff\x00\x0b\xe8\xf7\x9a\xbe\
+\xa2\xca\xb8g\xb8\xba\x9a\x0bF\xb6\xd3\xec\xad\xe2\x9e\xee\
+\xfbP\x9a\xd6\xce\xce\xde\xe2\xeaxa\x7f\xf2Y\xf8\x13\
+\xfb\x08~\xdd\xdf\xf0p?\xed\xb5\xfbF||\xf8_\
+\xe1{m\x1f\xc3\xff\x00\x10\xbe.\xf8\xab\xc7\x9f\x13~\
+3\xfc@\xba\xd5\xf4\xdf\x85\x1f\x0cb\xf1.\xa7s\xa8\
+x{\xc0\xb6\xda\xb2[\xea\xda\x9f\x88\xb5]\x0f\xc3_\
+\xd9\x1a>\x83\xe0\xbf\x0a\xdbkz\xbd\x86\x85g\xa4\xc9\
+\xa8\xa6\x95\xa1\x8f\xed(\xbf\xa0\x8f\xf88\xdb\xfe\x0a\xc5\
+q\xfbk|_\xf8\x7f\xff\x00\x04g\xfd\x88|[\x17\
+\x88\xad\xfc{\xf1\x97\xc1\x1f\x0e\xbfh\x1f\x88:\x16\xa3\
+\x14\xfe\x1a\xf1_\xc4=S\xc5\xda>\x8d\xe1\x1f\x83\xfa\
+n\xa1\xa5\xc9p\xba\x87\x85\xfc\x19\xe2\x9b\x9b_\x11|\
+I\xd4I6\xa7\xc4:>\x97\xa6F\xe5<;\xaa}\
+\xb3\xfb=\xfd\x87\xff\x00c\xbf\x84\xbf\xb0\x7f\xec\xbd\xf0\
+\x8b\xf6]\xf87\xa4\xdb\xd9xG\xe1\x8f\x85\xac\xf4\xcb\
+\xbdTZ[\xdbj~2\xf1]\xc2\x0b\xbf\x17x\xef\
+\xc4-nv\xdck\xfe/\xf1\x04\xd7\xfa\xde\xa2\xe0\xb4\
+V\xf2^\x0b\x1b?*\xc2\xd6\xd6\x08\x9e\xaa\xcfne\
+\xf3\xb6\x9f\xf0\x0c\xdaU\x1e\xb7\xb4]\xfc\x9b\xb2\xd3\xd2\
+\xcf_>\xdb\x9f\xca\xe7\xc1\xaf\xf82\x9b\xf6A\xd3t\
+r>?\xfe\xd8_\xb4\xa7\x8f\xf5\xc7\xb6\x81\x04\xff\x00\
+\x074\x8f\x86\x1f\x07\xb4\x98/\x039\xba\x97\xec\x9e4\
+\xf0\xc7\xc7;\xdb\xabych\x96\xde1\xa8YK\x13\
+#\xbc\xd2\xdcG(\x82?l\xff\x00\x88/?\xe0\x97\
+]\xbe<\xfe\xdf_\xf8t\xff\x00g\xa1\xff\x00\xbe\xb2\
+k\xfa\xeb\x00\x0c\xe0c''\xeb\xfeE-\x1c\xd2\xd7\
+Wg\xd3\xa7O\xf2+\x92\x0bh\xad<\xbd?\xc8\xff\
+\x001?\x8e\xbf\xf0MO\x81_\xf0J\xdf\xf88w\
+\xfe\x09\x9d\xfb9\xfe\xcf\xbe,\xf8\xb9\xe3\x1f\x05x\x83\
+\xc7_\xb2\xf7\xc5;\xbdS\xe3&\xbf\xe0\xff\x00\x11x\
+\xa2=\x7f\xc4\x7f\x1a<Y\xe1\xfb\xdb+k\xdf\x05x\
+\x0f\xe1\xe6\x92\x9a<6\x9e\x10\xd3\xa6\xb4\x82]\x0e{\
+\xd8\xeeg\xbeiu\x09\xe2\x9a\xda+\x1f\xf4\xeaO\xba\
+?\x1f\xe6k\xf8!\xff\x00\x82\xd2\xff\x00\xca\xd3\x9f\xf0\
+K/\xfb\x07~\xc7\xbf\x9f\xfc47\xc5pk\xfb\xde\
+O\xba?\x1f\xe6hi\xaby\xab\x8d$\xae\x92\xb6\xbd\
+=\x10\xea\xfeR?\xe0\xf1o\xf9D\xd7\x85\xf3\xff\x00\
+G\x85\xf0w\xa7_\xf9\x12>/t\xf7\xf4\xaf\xea\xde\
+\xbf\x94\xaf\xf8<S\xfeQ7\xe1\x7f\xfb<\x1f\x83\xff\
+\x00\xfa\x83|_\xa7\x0f\x89\x7f]\x09\xa9\xf0K\xd0\xfd\
+E\xff\x00\x82\x0dc\xfe\x1c\xf3\xff\x00\x04\xfa\xc7A\xfb\
+=\xf8x\x1fv]KWW?\x8b\x86\xaf\xd7\x0a\xfc\
+\x8c\xff\x00\x82\x0b\x7f\xca\x1e?\xe0\x9f\x9f\xf6@4O\
+\xfd<ku\xfa\xe7RR\xd9z/\xc8C\xfdG\xf3\
+\x15\xfe#\xbf\xf0S\x9f\xf9H\xf7\xed\xeb\xed\xfbb\xfe\
+\xd2c\xff\x003\x07\x8c\x0d\x7f\xb7\x11\xe9\xf8\x8f\xe6+\
+\xfcG?\xe0\xa7?\xf2\x91\xef\xdb\xdb\xfe\xcf\x1b\xf6\x93\
+\xff\x00\xd5\xc1\xe2\xfa\xb8|Fu\xbe\x07\xea\x8f\x86\x82\
+\x80F\x07\xf7\xbd\x7f\xba\xd5\xfe\xba?\xf0l?\xfc\xa1\
+[\xf6G\xff\x00\xae\xdf\x19?\xf5u\xf8\xfe\xbf\xc8\xbf\
+\xb8\xff\x00\x81\x7f\xe8\x0d_\xeb\xa1\xff\x00\x06\xc3\xff\x00\
+\xca\x15\xbfd\x7f\xfa\xed\xf1\x93\xff\x00W_\x8f\xea\xa7\
+\xb7\xcf\xf4fT>7\xfe\x17\xf9\xa3\xf7\xe2\x8a)\xac\
+\xca\xbfx\x81\xeez~'\xa0\xfck#\xa8u\x14\xd0\
+\xea\xd8\xc1\x07 \x11\xf49\xc7\xe7\x83\x8f`i\xd4\x01\
+\xfc\x9c\x7f\xc1\xd6\x7f\xf0T\x1f\xf8d\x7f\xd9\x12\xd7\xf6\
+?\xf8[\xaf\x0b\x0f\x8f?\xb5\xf6\x95\xabiZ\xf4\xd6\
+\x85\xce\xa3\xe0\xdf\xd9\xfa\xdac\xa6\xf8\xd3Y\x12\xc6\xc0\
+X\xde|@\xbb\xf3\xfc\x05\xa2\xbb\x114\xdajx\xd6\
+\xee\xd7\xca\xbb\xd2`\x90\x7f\x1e\xff\x00\xf0l>\x9c5\
+\x0f\xf8-o\xec\x8cLq\xb4z}\xaf\xc6}D\x8d\
+\xa4\xaa\x98~\x07\xfcE\x882\x86\x1dR{\x88\x98\x1e\
+9rx\xc8\x15\xfd\x8d\x7f\xc1\xd3\xff\x00\xf0J\xe3\xfb\
+d\xfe\xc9G\xf6\xb5\xf8[\xa2G?\xed\x05\xfb x\
+{Z\xd7o\xad\xacl%\xb9\xd5\xbe#|\x08\xdf&\
+\xab\xe3o\x09\x81k\xba[\xadC\xc1\x12\x9b\xaf\x88\x1e\
+\x1b\x8eU\x93d)\xe2\xed:\xd21y\xafDG\xf1\
+\xdb\xff\x00\x06\xc0\xea\x0bc\xff\x00\x05\xad\xfd\x93\x91\x82\
+\xa8\xd4,>6i\xc0\x03\xb4.\xff\x00\x82>=\xba\
+\xca\xa9\xf9\xca\xee\xb2E\x19\xdc@a\xbd\x99\xf2M\xc5\
+\xfb\xadk\xd5\xfc\xbb|\xcc'\x7fk\x07\xba\xbaK\xbe\
+\xbd}7\xbd\xcf\xf5\xc7\xa2\x90\x1e\xbf_\xe8)j\x0d\
+\xcf\x90\x7f\xe0\xa1\x1f\xf2`\xff\x00\xb6\xff\x00\xfd\x9a\x0f\
+\xed+\xff\x00\xaac\xc6\x95\xfc\xb5\x7f\xc1\x93\xdf\xf2g\
+\x7f\xb6O\xfd\x9c\xcf\x87\xbf\xf5U\xf8v\xbf\xa9_\xf8\
+(?\xfc\x98?\xed\xbf\xff\x00f\x85\xfbJ\x01\xf5?\
+\x06|h\x00\xfa\x93\xc0\x1d\xcf\x15\xfc3\x7f\xc1\xac\xff\
+\x00\xf0T\xff\x00\xd8/\xf6\x00\xfd\x99\xff\x00i\xbf\x03\
+~\xd6\xff\x00\x1f\xf4\x7f\x83\xde*\xf1\xdf\xc7m\x17\xc5\
+\xbe\x14\xd2u/\x0a\xf8\xfb_\x97W\xf0\xf5\xb7\xc3\xdd\
+\x1bG\x9fQ\x8e\x7f\x08\xf8[_\xb4\x824\xd4\xadg\
+\xb6\xf2\xae\xe6\x86\xe1\x997\x08\xbc\xa2\x8e]\x9b\xd9?\
+\xb8\x96\xec\xd5\xfb?\xd0\xff\x00Ez+\xf0\xcb\xfe\x22\
+L\xff\x00\x82,s\xff\x00\x19\xbb\xe1o\xfc6\x9f\x1b\
+?O\xf8\xb6\xf8\xa0\xff\x00\xc1\xc9\x7f\xf0E\x8d\xa4\xff\
+\x00\xc3ox_8\xce\x07\xc3_\x8d}\xb9\xc6?\xe1\
+Z\x92I\xe9\x81\x92O\x00\x1e\x94Y\xf6\x7fpsG\
+\xa4\xa2\xfd\x1a}\xbb?3\xf9E\xff\x00\x82\xa0\xff\x00\
+\xca\xdc\xff\x00\x02\xff\x00\xec\xb9\xfe\xc1?\xfa\x8a|6\
+\xaf\xf4\x86\xee>\x87\xf9\x8a\xff\x00/o\xda\x8f\xf6\xa4\
+\xf8\x13\xfbd\xff\x00\xc1\xd0\xbf\xb3W\xc7\xdf\xd9\xb7\xe2\
+\x05\xa7\xc4\xef\x84\xbe(\xfd\xa0\xbfb}3B\xf1\x85\
+\x86\x93\xafh\xb6\xba\x85\xef\x86t\x9f\x00hZ\xe4)\
+a\xe2M3G\xd5\x90\xd8\xea\xf67v\x8d$\xda|\
+QJ\xf1\x17\xb7i!*\xed\xfe\xa1T4\xd5\xaf\xd4\
+\x98;\xca\xa3_\xcc\x97\xdd\x15\xfea_\xcfg\xfc\x1d\
+)\xcf\xfc\x11;\xf6\xaa\x1f\xf5\x1e\xf8\x04H\xf6\xff\x00\
+\x85\xfb\xf0\xe3\xfc\x0f\xe6+\xfa\x13\xaf\xe7\xb3\xfe\x0e\x94\
+\xff\x00\x94'\xfe\xd5\x9f\xf6\x1d\xf8\x05\xff\x00\xab\xf3\xe1\
+\xcd\x22\xa7\xf0\xbf\x97\xe6\x8f\xf2J\xa3\xb1\xff\x00u\xbf\
+\xf4\x13E\x1d\x8f\xfb\xad\xff\x00\xa0\x9a\xe88O\xf52\
+\xff\x00\x83@\x7f\xe5\x11q\xff\x00\xd9\xcd|k\xff\x00\
+\xd1~\x12\xaf\xeaQ\xfa~\x7f\xc8\xd7\xf2\xd7\xff\x00\x06\
+\x80\xff\x00\xca\x22\xe3\xff\x00\xb3\x9a\xf8\xd7\xff\x00\xa2\xfc\
+%_\xd4\xa3t\xfc\xff\x00\xf4\x13X\xcf\xe2\x7f/\xc9\
+\x1d\xdfc\xfe\xdd\xfd\x0f\xc9_\xdbw\xfeJ\xdd\x87\xfd\
+\x89zo\xfe\x9c5\xaa\xf7\x9f\xd8C\xfeD\xdf\x19\xff\
+\x00\xd8\xcfm\xff\x00\xa6\xbbj\xf0o\xdbt\xe3\xe2\xdd\
+\x81\xff\x00\xa9/M\xff\x00\xd3\x86\xb5^\xf3\xfb\x08\x7f\
+\xc8\x9b\xe3?\xfb\x19\xed\xbf\xf4\xd7m_\xe3\xbf\x85\xdf\
+\xf2\xb2.8\xff\x00\xb1\x8f\x19i\xdb\xfe\x11i\x1f\xd7\
+\xfcU\xff\x00(\xd9\xc3\xde\x99O\xfe\xa7V>\xf3\xac\
+?\x12\xeb\x9aw\x85\xfc=\xaex\x9bX\x9e+M'\
+\xc3\xbaF\xa5\xae\xea\xb7s\xcb\x14\x10\xdbi\xbaE\x94\
+\xfa\x85\xf5\xc4\xd3\xce\xf1\xc3\x0cPZ\xdb\xcb,\x92\xcd\
+\x22E\x1a!w`\xa0\x9a\xdc\xaf\xc7\x9f\xf8/_\xed\
+*\xff\x00\xb2\xd7\xfc\x12w\xf6\xc9\xf1\xfd\x86\xa0\xdaw\
+\x89<O\xf0\xd2\xef\xe0\xe7\x83\xe6\x8eh\xa0\xb8\x1e#\
+\xf8\xc74\x1f\x0fb\x9e\xd0\xcfou\x14\xd2\xe9\xbao\
+\x885-a\xad\xde1\xe7\xc5\xa6M\x12\xc9\x1c\xae\x8c\
+?\xd8u\xabK\xbb?\x90\x8f\xf29\xfd\xaa\xbe4\xde\
+\xfe\xd1\xbf\xb4\xc7\xed\x03\xf1\xfbQY#\xb9\xf8\xc9\xf1\
+\x8f\xe27\xc4\xa6\x8axb\xb7\x96\xde\x0f\x18\xf8\xabU\
+\xd7m-e\x86\x09\xae \x8a[K;\xc8-\xa5\x8e\
+\x19\xe5\x8a9bx\xe2wEV?\xdd/\xfc\x14\x1b\
+\xf6\x14\xff\x00\x84c\xfe\x0d.\xfd\x99t\x8d;I\x9a\
+_\x14|\x06\xf0\x97\xec\xfd\xfbP\xeapZZGa\
+$7\x9f\x15\xf5\xa9.\xfc\x7f.\xado\xa91\xba\x0f\
+\xa7i\x1f\x19\xf5IuX \x92)\xaeu-&\x19\
+\x04\x11\xc7\x1f\x91_\xc1\xd7\xc0/\x85\x9a\xaf\xc7?\x8e\
+?\x06\xfe\x0bh\x91Eq\xac|Z\xf8\xa7\xe0\x0f\x86\
+\xfal3\xdc\x9bX\x1e\xef\xc6\xbe*\xd3<;\x02M\
+t|\xc6\xb7\x87}\xf8\xdfp\x15|\x94c#\x02@\
+\x15\xfe\xcf\x9f\xb7W\xec\xd9\xa5|`\xff\x00\x82t~\
+\xd3\x7f\xb2\xf6\x89\x02\xc7e\xe2o\xd9o\xe2\x07\xc3o\
+\x07\xa5\xdd\xa4\x9a\xcbY_i\xbf\x0f\xef-<\x17?\
+\xd9\x11\xe2\x9e\xfe\xefM\xd54\xcd\x1e\xea\xd9Q\xd2i\
+n\xed`1\x95p\xa2\xaeZry\x7f\xc0\xb9\x8d%\
+u'k&\xdd\xbd\x1fm\x7f5\xff\x00\x07\xfc\xa6\x7f\
+\xe0\x84\xbf\xb4\x92~\xcb\x1f\xf0U\xff\x00\xd8\xcf\xe2=\
+\xed\xef\xd8\xfc9\xe2\x0f\x8aZw\xc2?\x17K-\xdb\
+Y\xda/\x86~2\xdb\xcf\xf0\xea\xf2\xee\xf2U\xb7\xb9\
+\x96xt\xab\x9d\x7fN\xd7\x05\xa2\xa4k\x7f>\x99\x0d\
+\xb9\x9e\xdd]\xaek\xfd\x94\xe3 \xaeW\xa1'\x1d\x7f\
+>z\x83\xd4\x1e\x98#\x1cb\xbf\xc1OI\xd55_\
+\x0bx\x83K\xd6\xf4\xe9\xaet\xddw\xc3\xba\xcd\x8e\xad\
+a<O-\xad\xe6\x9f\xac\xe9\x17\xb0\xdeZ\xca\x92F\
+\xc95\xbd\xd5\x9d\xfd\xb4n\x1e6I\xa3\x9a-\xc8\xc2\
+@\x1a\xbf\xdc\x97\xf6D\xf8\xe1c\xfbK\xfe\xcb\x7f\xb3\
+\xdf\xed\x05\xa7\x04[_\x8c\xbf\x07>\x1d|G\xf2\xa3\
+VH\xad\xee|Y\xe1M+W\xbf\xb4\x8d\x1eI\xa4\
+T\xb4\xbf\xba\xb9\xb5\x0b,\x8d2\x98\x8a\xcc|\xd0\xf4\
+\xa7\xba\xf4\x1d'\xa3\x8b\xde.\xdeV\xb2\x7f\xa9\xfen\
+\x1f\xf0v/\xfc\x14\x13\xc6\xbf\xb4G\xed\xeb\xaa~\xc8\
+:\x0f\x88n\xed\xbe\x06\xfe\xc8\xb6\xdan\x89/\x86\xec\
+/u[}3\xc4\xdf\x1a\xbcE\xa2\xd9k~3\xf1\
+n\xbb\xa7\xdcI\x05\xad\xe5\xff\x00\x86\xb4\xddV\xc3\xc1\
+\x1e\x1d\x97\xec3\xae\x95\x0d\xaf\x89g\xd3\xf5\x07\x8b\xc5\
+\x17\xea\xdey\xff\x00\x04@\xff\x00\x83v5\xef\xf8*\
+\xef\xc2\xaf\x1e\xfe\xd0\xbf\x13~7_|\x0a\xf8+\xa1\
+x\xb6\xeb\xe1\xe7\x82\xdf\xc3\xbe\x10\x87\xc5\xbe0\xf1\xcf\
+\x8c4\xab;\x0b\xef\x11\xde\xc7\x1e\xab\xa8i\x1a&\x8d\
+\xe1\x8d\x0a-N\xc6\xcb\xedB}SR\xd5\xb5g\xba\
+\xb2[}:\x1d9\xe7\xd4\xbf\x16\xff\x00\xe0\xa2^8\
+\xff\x00\x85\x93\xfb}\xfe\xdb><[\x9b\xbb\xbb\x7f\x15\
+~\xd5\xdf\xb4\x06\xb1a5\xec\xad5\xc7\xf6]\xd7\xc5\
+?\x15\x7feC$\xaeY\x98Zi\xe9ok\x0ae\
+\x16(!\x8e4M\x80c\xfa\xbd\xff\x00\x82/\xff\x00\
+\xc1\xc8\xbf\xf0O\xef\xf8&\xff\x00\xfc\x13\xeb\xe1\x17\xec\
+\xb1\xf1S\xe1\x17\xedA\xad\xfcM\xf0\x9e\xb5\xf1\x1f_\
+\xf1\xc6\xb9\xf0\xcf\xc1?\x0b\xf5_\x08j\xda\xa7\x8b|\
+{\xaf\xebZm\xd5\x86\xa1\xe2O\x8c~\x15\xd6.e\
+\x8b\xc3\x17:\x15\x8d\xeb\x5chv\x81.\xac\xe4\x86!\
+<p\xa5\xcc\x95\xef(\xa4\xb7\xbfM{\x99\xc7\x92s\
+|\xd7\xb2]{\xa9/O\xebs\xf9\xdb\xff\x00\x82\xc6\
+\x7f\xc1,<q\xff\x00\x04\x97\xfd\xaa\xa3\xf8\x13\xad\xf8\
+\xc5\xfe(|?\xf1\x8f\x83t\xff\x00\x88\x9f\x09\xfe)\
+\x7f\xc25q\xe1s\xe2o\x0e]\xdf_i\x1a\xa6\x8f\
+\xab\xe9\x86\xebR\xd3\xac\xfcY\xe1]sL\xba\xb1\xd6\
+-4\xcd^\xfe\xda]:\xebA\xd6\xd54\xd8\xf5\xc8\
+4\xabO\xed\x1f\xfe\x0c\xef\xfd\xb9|c\xf1\xcf\xf6W\
+\xf8\xcb\xfb\x22\xfcI\xf14\xbe \xd6?eM{\xc3\
+\x1a\xaf\xc2\xd9\xb5]D\xddk0|\x1d\xf8\x93\x06\xaa\
+\xb0\xf8^\xd9nn\xe5\xbc\xba\xd1<\x0d\xe2\xaf\x0d\xea\
+\x09b\xfeA\x83E\xb0\xf1n\x91\xa2\xc5r,\xe3\xd3\
+\xac\xad?\x99\xdf\xf88\x93\xfe\x0a\xeb\xfb+\xff\x00\xc1\
+Z|g\xfb1x\xc3\xf6p\xf0?\xc6\xdf\x06\xdd\xfc\
+\x1b\xf0\xc7\xc4\x8f\x0dx\xbc\xfca\xf0\xf7\x82\xb4\x03\xa8\
+[x\xb3T\xf0\xbe\xa5\xa2\xff\x00`\xa7\x83\xfe!x\
+\xe5n\x05\xa4\x9a^\xa8\xd7\xa6\xf9\xb4\xed\x86[t\x80\
+L\xb2\xce\xf0\xfdc\xff\x00\x06dx\xbbP\xd2?\xe0\
+\xa3\xbf\x1d<\x1f\x0b\xa0\xd3\xfca\xfb'\xf8\x9a\xf2\xf9\
+|\xb5g2x[\xe2_\xc3\x99l\x99\x1fh1\x8d\
+\xda\xc5\xc3\x15S\x97\x18\xf32\xc4\x9a%\xf0k\xbe\x9f\
+~\x83\x8bQ\xaa\xd2\xd9\xa4\x96\xfd\x97\x7fC\xf3\xab\xfe\
+\x0eg\xff\x00\x94\xde\xfe\xdb\x9e\xd7\xdf\x03H\xe0\x1eG\
+\xec\xd5\xf0{\x1c\x10G\xf9\xe0\x83\xcd~Wx\x1b\xc6\
+?\xb4W\xc6\x0f\x87\xbe\x0b\xfd\x8b>\x16\xe9\x9e3\xf1\
+\xde\x83\xac\xfc`\xd5\xfe'xs\xe1\x17\xc3\xed\x1f]\
+\xd7\xb5\xdf\x1c|R\xd7\xfc/\xa0xF\x1dF\x7f\x0e\
+h\x9fl\x97\xc4W\xda\x17\x87<8\xd0x}SL\
+\xf3tX5\x7f\x13L'0\xeawo\x0f\xea\x87\xfc\
+\x1c\xcb\xff\x00)\xbc\xfd\xb6\xc9\xcf\xfc\x7f|\x0c?\x87\
+\xfc3W\xc1\xe3\x82~\x9dk\xf7\x8b\xfe\x0c\xaa\xfd\x9e\
+\xfe\x1e\xeb\xba\xaf\xed\xa3\xfbL\xeb^\x1f\xd2\xf5o\x88\
+\xde\x08\x93\xe1\xa7\xc2?\x04\xeb\x17\xfa}\xbd\xdd\xf7\x84\
+\xf4?\x16\xd8\xf8\x8f\xc4\xbe0\x9bD\xb9\x9c\xb8\xb0\xb9\
+\xf1\x0b\xe9\x1a\x15\x8e\xa1<\x11-\xd3Xi\xadf\x97\
+1\xda^\xdf[\xdd\xbb\xda)\xbe\xcb\xf2\x13M\xd5\x94\
+W]e\xfe\x1d\x1a\xff\x00#\xe7\x1f\xf87{\xfe\x09\
+\x11\xff\x00\x05%\xfd\x97\x7f\xe0\xa9\xff\x00\xb3\x7f\xed\x11\
+\xfbA\xfe\xc9\x1f\x12\xfe\x13\xfc\x1b\xf0\xcf\x87~7A\
+\xaf\xf8\xd3\xc5\xb2\xf8Z\xd2\x1d&\xe3\xc5\x1f\x04\xbe \
+x_@\x82\xf7F\x83\xc47\x1e\x22\x82]K^\xd5\
+\xb4\xed:\x15} m\x96\xea6\x98\xc7\x10i\x17\xe1\
+\xcf\xf8:\x1b\xfe\x0a\x0d\xe3?\xda\xe7\xfe\x0a1\xf1\x13\
+\xe0V\x95\xe2[\xc7\xf8\x09\xfb!\xea\xd3\xfc+\xf0W\
+\x86m5D\x9fC\xd4>#\xd9\xdaY\xaf\xc5o\x1c\
+^\xda\xd9\xbb\xdaK\xac\xb7\x88\xfe\xd5\xe0\xdbF\x9ek\
+\x99\xec4o\x0dD\xd1}\x86mGV\xb4?\xea\xd3\
+~\xfeE\x9d\xc4\xcaB\x18 \x9e`\xd88S\x1c2\
+>N9\xe0\xa8>\xf8\xc1\xceq_\xe1?\xfb@x\
+\xdb\x5c\xf8\x9d\xf1\xdf\xe3w\xc4\x7f\x14\x5cEw\xe2_\
+\x88_\x17\xbe&\xf8\xe7\xc47QD\xb0\xdb\xdck\xde\
+.\xf1\xa6\xb7\xaf\xea\xf7\x10\xc27,0\xcb\xa8_\xcf\
+$Q\x82\xdeTE\x10\x13\xb0TC\x7f\x97\xea\x8a\xa8\
+\xb9)\xda:+\xaf\xbbn\x8b\xd3}\xcf\xe8\x93\xfe\x08\
+\x87\xff\x00\x06\xe5j\xdf\xf0Uo\x82\xde4\xfd\xa4~\
+'\xfcs\xd4\xbe\x05|!\xd3<c\xa9\xfc<\xf0\x05\
+\xb7\x86\xbc\x19o\xe2\xaf\x15\xf8\xdf\xc4\x1a\x05\xae\x9fw\
+\xe2]i\xdfW\xd54\x8d'H\xf0\xce\x93&\xa5g\
+\xa4Z\xbc?\xda\xb7\xda\xae\xb0\xba\xac\x12\xa6\x90\xba.\
+5O\xca/\xf8*\xc7\xfc\x13\x83\xe2\x0f\xfc\x12\xd3\xf6\
+\xbe\xf1g\xec\xbf\xe3\x7f\x10\xc1\xe3\x9d hZ7\x8f\
+\xfe\x19|F\xb5\xd3\xbf\xb1\xa0\xf1\xef\xc3\x9f\x13M}\
+k\xa5ko\xa2\x1dCS}\x1bS\xb0\xd5\xb4]s\
+\xc3\xba\xce\x99%\xed\xda\xc1\xab\xe8\x97\x17vw\x13\xe9\
+\xf7VW\x17\x1f\xe9{\xff\x00\x06\xca\xe8:N\x91\xff\
+\x00\x04K\xfd\x8bn4\xeb\x18mf\xd7\xec\xfe4k\
+\xda\xb4\x88\x98k\xedZ_\xda\x07\xe2\xae\x9c\xf7\xf3\x1e\
+KM%\x86\x9de\x01bs\xe4\xc2\x91r\xab\x8a\xfe\
+k\xbf\xe0\xf6\xbf\x05\xad\x97\xc6\xcf\xd8'\xe2\x1a\xacj\
+|G\xf0\xbb\xe3g\x83_lj\xb2\xb1\xf0o\x8a\xbc\
+\x07\xad!v\x04\xb3*\x8f\x1c\x95\x8dO\xca\xb8}\xbc\
+1\xa1\xfc\x7f4\x13\x82\xf6wZY'\xeb\xb7\xaf\xf5\
+\xf7\x9fr\x7f\xc1\x9d\x7f\xb7\xaf\x8a~1|\x06\xf8\xd5\
+\xfb\x0d|E\xd6u\x0dn\xf7\xf6i\x97C\xf1\xdf\xc1\
+\xcb\xcdBv\xba\x92\xdf\xe1?\x8f5\x1dR\xd7]\xf0\
+z\xc9$_\xb8\xb2\xf0\x7f\x8c\xed\xa0\xbb\xd2c73\
+\xb7\xd8|m.\x9b\x1cV\x96\x1a\x1d\x90\x97\xf9\xc5\xff\
+\x00\x83\xa0\xff\x00m\xbf\x19~\xd4\xdf\xf0S\xef\x8a\xbf\
+\x09\x97\xc4\x17\xd3|\x1d\xfd\x92f\xb7\xf83\xf0\xfb\xc3\
++q:\xe90x\xb2\xcfK\xd3\xaf>+x\x9c\xd8\
+I\x1cI\x1e\xb9\xa8\xf8\xd6{\xef\x0d\xdc\xdf0\xb8\x92\
+}\x1b\xc2Z\x1f\x93p\x22H\xd1=\xc3\xfe\x0c\xfa\xf8\
+\x95\x1f\x83?\xe0\xabZ\xdf\x83\xa6\x8a\xe6e\xf8\xb9\xfb\
+/|W\xf0\x8d\xb7\x974\x89om\xa8x\x7f\x5c\xf0\
+'\xc4x\xefn!\x01\xa3\x94.\x9f\xe0\xadF\xc2\x22\
+\xc3to~\xce\xa0\x82T\xfc\x7f\xff\x00\x07&~\xca\
+^-\xfd\x98\x7f\xe0\xac\xff\x00\xb4v\xa5\xaa\xd8^\xff\
+\x00\xc2\x17\xfbE\xeb\x16\xdf\xb4G\xc3\x9dvh\xe5x\
+5\x8d?\xe2\x04\x09/\x8cl\xd2\xe0[\xc5k\xf6\xaf\
+\x0f|F\xb4\xf1n\x8e\xf6P<\xf3[i\x90\xe8\xf7\
+7N^\xfd\x19\xea\xdc\xb5\x1ao_\xce\xfa\xfe_\x88\
+\xa7)J\x8aqZ5\xad\xfam\x7f\xeb\xf2>\x9e\xff\
+\x00\x82!\xff\x00\xc1\xb8\xda\x87\xfc\x15g\xe0w\x8d\xbf\
+i\x8f\x89\xbf\x1f\xef\xfe\x05\xfc+\xd2\xfcw\xa8\xfc7\
+\xf0\x1e\x9b\xe1\x7f\x05[x\xb3\xc5\x9e1\xd74-;\
+K\xd4\xbcQ\xae]M\xab\xeb\x1a>\x97\xa0\xf8oI\
+msN\xd2\xf4\xaf\xb2\xc7\xad\xdd\xeb\xda\x92kBf\
+\xd0b\xd1me\xd6?0\xff\x00\xe0\xaf\x7f\xf0L\x7f\
+\x18\xff\x00\xc1)?k\xcdK\xf6p\xd7\xfcg\x17\xc4\
+\xcf\x0a\xeb\x1e\x0f\xd0\xfe$\xfc1\xf8\x88\x9a\x0c\x9e\x1b\
+\x9b\xc5>\x09\xd7\xae\xb5M-\x7f\xb5t_\xb6\xeaV\
+\xfa~\xbf\xa1\xeb\x9a&\xb3\xa2j\xb1Y\xeawv\xb7\
+\x0di\x06\xa7o4+\xa8\xfd\x82\xdb\xf4?\xfe\x08o\
+\xff\x00\x07\x0c\xf8\xb3\xfe\x09A\xe1o\x14~\xcf\xdf\x13\
+\xfe\x15\xdf|m\xfd\x99\xbc_\xe3;\xaf\x1e\xda\xdax\
+k[\xb2\xd0\xbe#|1\xf1^\xab\xa7i\xdaf\xbf\
+\x7f\xe1W\xd5\xade\xd1\xbcO\xa1k\xb6\xda&\x93-\
+\xef\x84u\x8b\xed\x06;]Z9u\x8d3\xc4V\xb2\
+\xddk\x16z\xc7\xf5\xdd\xe0/\xda\xb3\xfe\x0d\xd7\xff\x00\
+\x82\xe9|@\xf0>\xbb\xf1GL\xf8[\xe3?\xda\x1e\
+\xc7\xc20\xf8W\xc3\x1f\x0e?i\xd8\xf5\xcf\x85_\x14\
+\xectU\xd5\xaf\xf54\xf0\x8f\x87c\x1e)\xb3\xf0G\
+\x8d\xb5\x08\xb5-gP\xbe\x1aw\x81<M\xe2\xfdE\
+\xa2\x92\xf6\xe8\x99-lfk$\xa5%\xf1^\xde\x9f\
+\xd7\xf5\xf3\x0bS\x9cR\x8b\x5c\xd6\xb2\xbd\xfb\xaf\xc3\xa6\
+\x9f??\x96\xbf\xe0\xcd\x7f\xda\x8b\xc7?\x15\x7fco\
+\xda\x07\xf6o\xf1\x96\xad\xa8kZW\xec\xcf\xf1G@\
+\xbf\xf8kq\xaajw7\xd3h\xbe\x09\xf8\xbd\xa5\xea\
+\xda\xa5\xc7\x83l-\xa6\x8f\xca\xb1\xd0\xf4?\x15\xf8W\
+_\xd7\xac\x15&p.\xbca\xaa\xc5\x15\xb5\xad\xac\x10\
+\xa3\x7f\x1c\x1f\xf0_\xaf\xf9Lw\xed\xfd\xff\x00e\xb5\
+\x7f\xf5\x0c\xf0\xb5\x7f\xac\x07\xec\x9f\xfb\x02~\xc7\x1f\xb0\
+\xe5\xbf\x8d`\xfd\x92\xbe\x02\xf87\xe0\x8c\x1f\x11d\xd1\
+n<j\x9e\x11}m\xd3\xc4R\xf8u5\x08\xf49\
+o\x7f\xb6umS\x9d>=WP\x10\x1bs\x10+\
+u&\xff\x000\x15\xc7\xf9?\xff\x00\xc1~\xbf\xe51\
+\xdf\xb7\xf7\xfd\x96\xd5\xff\x00\xd43\xc2\xb57\xbc\x93\xf3\
+_\xa0T\x8c\xd54\xee\xaf\x1f\x96\xf6ZY\x7f\x91\x91\
+\xff\x00\x04\xb8\xff\x00\x82a~\xd6\x1f\xf0W\xcf\x88\x17\
+\x9f\x02>\x10\xf8\xcbC\xf0\xaf\xc3o\x81\x1a5\xef\x8d\
+<M\xe3\x0f\x89W~ \x9b\xe1\xf7\xc3\x84\xf1\xfe\xaf\
+\xa6\xd9\xcfm\xa2h\xfa\x15\x8d\xfd\xc5\xf7\x8d|y>\
+\x82\xd3\xc1\xa6\xc5\x1d\x82j\xb6\x1e\x0c\xba\x97R\xd6-\
+-\xb4\xbbB\x94\xbf\xe0\xab\xff\x00\xf0H\x0f\xda?\xfe\
+\x09!\xf1C\xc1>\x0a\xf8\xcf\xac\xf8O\xe2\x17\x82\xbe\
+)\xe9:\xce\xb1\xf0\xcf\xe2\xcf\x80\x8e\xaa\xbe\x1c\xf1\x13\
+xz\xfe+={\xc3\x9a\x9e\x9b\xaeY\xd9j\xda\x0f\
+\x8b\xb48/\xb4MGS\xd3%\x8e\xfbN\x92\xcb\x5c\
+\xb2\x9fH\xd75q\x06\xa7\xf6\x0f\xec\xa3\xfe\x0c\xb1\xf0\
+&\x8b\xa7~\xc5\x7f\xb5\x7f\xc4Ht\x9bh|K\xe3\
+/\xdacL\xf0\xa6\xa7\xad\xa9\x90\xdd\xea\x1e\x1f\xf0\x1f\
+\xc3/\x0d\xea^\x1f\xd2\xe6\x05\xcc1\xda\xe9\x1a\x9f\x8e\
+\xbcYsl\x12$\x92Iu\xbb\xd3;\xca\xa2\x00\x9d\
+/\xfc\x1e\x93\xe0\x8d\x17Q\xff\x00\x82}\xfe\xcd\x1e>\
+m\x1e\xdeo\x11\xf8G\xf6\xc2\xd1<;e\xad\x95\xff\
+\x00I\xd3|5\xe3O\x83\x7f\x16\xee\xbcA\xa7BL\
+\x81>\xcf\xab\xeb^\x13\xf0}\xc5\xd2\x18\x8b<\x9aM\
+\xab\xf9\xa8\xa9\x22\xca\xdf\xbd+'\xfdy\x04i\xa7J\
+=\xd2\xbb\xfe\xbf\xaf\xf2\xfc^\xff\x00\x83;\x7fl\xcd\
+\x7f\xe1\x8f\xed\xbb\xf1\x0b\xf64\xd5\xf5\xe9\xc7\xc3\xcf\xda\
+o\xe1\xee\xbb\xe2\xcf\x0b\xf8v\xe2\xe2\xee[[o\x8c\
+?\x08\xb4\xab\x8f\x13\xff\x00hi6\xc29\xed\xac\xae\
+\xb5\xaf\x86V~2\x1a\xf4\xcb\xf6?\xed\x18\xfc5\xe1\
+\xf8\xee%\xb9\x93J\xd3\xed\xdf\xf7{\xfe\x0f\x02\xfd\xab\
+\xbc{\xf07\xfe\x09\xff\x00\xf0\xdb\xe0\x8f\xc3\xfdj\xef\
+@o\xda\xaf\xe2\xc5\xcf\x84\xfc}\xa8i\xf7\xf7\x16w\
+\xda\x8f\xc2\xef\x03\xf8n\xe3\xc4>\x22\xf0\xb4f\xdc\xac\
+\x87O\xf1.\xbdw\xe1+mot\xbeE\xc6\x87o\
+\xa9h\xd7v\x97V\xda\xdc\xc2/\xe2?\xfe\x08#\xe2\
+mK\xc2\x9f\xf0X\x8f\xd8\x0bQ\xd2\xef\xee\xb4\xe9\xaf\
+~;i\xde\x1b\xba\x9a\xd2W\x8aI\xf4\xbf\x15\xe8\x1a\
+\xf7\x86\xb5k\x07h\xd9K\xdbj:v\xa9qew\
+\x09%'\xb6\x9aX\x99X>\xd3\xfe\xae\x9f\xb6'\xfc\
+\x13\xd7\xf67\xfd\xbe\xb4\xff\x00\x03\xe9\x1f\xb5\xef\xc1m\
+\x1f\xe36\x9d\xf0\xca\xf7\x5c\xd4\xfc\x17m\xacx\x83\xc6\
+\x1a\x14^\x1e\xbc\xf1%\xb6\x9fk\xad\x5cD\xde\x11\xf1\
+\x1f\x87\xe4\xb8k\xfbm\x1e\xc1$\x17\xedt\x8amC\
+A\xe5\x17p\xe4\x9d\xa7\x7f5\xfa\x15J\xf2\xa4\xbb\xbf\
+/$\x7f\x92\xc7\xfc\x12\x0f\xfe\x09\x99\xe2\xdf\xf8*\xef\
+\xed\x81\xa6~\xcc\xfa\x0f\x8d\xd3\xe1\x9f\x86t\x9f\x02\xf8\
+\x97\xe2\x97\xc5\x0f\x88#F\x8f\xc4\x97^\x15\xf0/\x86\
+.\xf4=\x13\xce\xd2\xbc=&\xab\xa0\xa6\xab\xaa\xeb^\
+)\xf1?\x86<1e\x1f\xf6\x9c\x11X\xb6\xb4\xfa\x9d\
+\xc43\xdaYMk7\xea\xf7\xfc\x16\xbf\xfe\x0d\xb2\x9f\
+\xfe\x09q\xfb9\xe8_\xb5'\xc2\x8f\xda\x03Z\xf8\xe1\
+\xf0\xee\xdb\xc6\xda'\x81\xbe$\xe8\x9e-\xf0=\xa7\x85\
+\xfcE\xe19\xfcT\xd7\x10xc\xc4\xfan\xa1\xa2j\
+\xda\xae\x97\x7f\xa0]\xea\xe9\x16\x81\xaa[\xdf\xc3\xa6\xdd\
+X\xeaZ\x9e\x8c\xd6\xb7\x17\xd1\xdd\xcf\x0d\x9f\xf5\xc8\xda\
+\xb7\xfc\x1b\xb5\xff\x00\x04.\xf8\xa3\xe2/\x1e\xf8s\xc4\
+\x7f\x03\xff\x00g?\x8ez\xff\x00\x825\x7f\x87\xbe#\
+\xf0\xcf\x81\xfcm\xf1+\xe3\x17\xc59|\x19u\xafx\
+s\xc4z\x86\x87\xac\xfc5\xd1\xfcC\xf1\x1fY\xf0\xe5\
+\xa6\xa1\xafxSB\xb8\xb7\xbf\xd6t-\x0d\xaf\xa7\xd1\
+\xa7\xb3\xb1\xd4%\x11_@\xbf\xcb\xaf\xfc\x17\xdf\xfe\x0e\
+;\xf8Y\xff\x00\x05\x1c\xf8\x07\x07\xec}\xfb'|:\
+\xf8\x8b\xe1\xff\x00\x84\xda\x97\x8f4_\x16|K\xf8\x97\
+\xf1J\xcfD\xd0u\x8f\x1b[\xf8'P:\x87\x85\xfc\
+9\xe1o\x08h\xfa\xaf\x88f\xb2\xf0\xfd\xc7\x88#\xb2\
+\xf1=\xd6\xb1\xae\xea\x96:\xcd\xc5\xc6\x8d\xa4i\xd2x\
+v\xc0I\xa8\xc7Uy7\xd6\xde\x9f\xf0\x1f\xf5\xd8\x97\
+\x18B\x9b\xbd\xb9\xda\xba\xb7Wu\xf3\xda\xdd\x0f\xcc?\
+\xf87S\xf6\xa3\xf1?\xec\xc1\xff\x00\x05m\xfd\x94%\
+\xd2u\x8df\xcf\xc2\xdf\x1d\xfcua\xfb8x\xf7C\
+\xd3\xa6\x90Yx\x9fK\xf8\xc74~\x15\xf0\xbd\xa6\xaf\
+dn\xad\xadn-\xf4_\x88\x97~\x0f\xf1\x18\x9a\xe8\
+\x5c}\x86]\x18]Ao,\xf1\x22\xb7\xfaR\xff\x00\
+\xc1k\x7fn}c\xfe\x09\xdf\xff\x00\x04\xe8\xf8\xfb\xfb\
+Fx;\xc9?\x14c\xd2\xf4\xaf\x87\x1f\x08V\xe4\xc2\
+a\xb5\xf8\x93\xf1#S\x8b\xc3:\x1f\x88\x0d\xbd\xcd\xad\
+\xed\xad\xe8\xf0=\x9d\xd6\xa5\xe3\xb94\xcb\xcb\x7f\xb2k\
+\x09\xe1\x93\xa5\x5cMo\x15\xe3O\x17\xf9O\xff\x00\xc1\
+%\xff\x00\xe5)\xbf\xf0N\x0c\x9d\xd8\xfd\xba\xbfe\x11\
+\x93\x83\x93\xff\x00\x0b\xd3\xc0\xc0\x9c\xf7\x0cy\xcf\xf1\x03\
+\xf3u5\xfd\xae\x7f\xc1\xec\x1f\x11\xf5]'\xf6Y\xfd\
+\x8a\xbe\x10[B\x83E\xf1\xcf\xc7\xff\x00\x1c\xfcF\xd4\
+\xaewbU\xbf\xf8[\xf0\xec\xf8kK\xb5Pxh\
+g\xb6\xf8\xbf\xab\xdcJ\xa7\xe5\xf3\xac\xed\x9c\x82@!\
+I^Iy\x7f\x98\xe9>Zroe'\xf9#\xf8\
+\x08\xf8y\xe0o\x8c_\xb5\xb7\xc7\xff\x00\x09|;\xf0\
+\xaak\x7f\x13\xbe:~\xd0\xbf\x13\xf4\xfd\x07N\x9bY\
+\xd5d\xbc\xd7|c\xf1\x17\xe2/\x88\x92)uM\x7f\
+\xc4:\xc5\xd6^mKX\xd4d\xd4\xb5\xef\x10kW\
+\xa2+h\xe4\xbf\xd5\xf5+\xb8\x84wW\xc7\xfa\x84\xfd\
+\xb6\xbf\xe0\xd2_\x8e\xdf\xb2O\xecW\xe3\x7f\xda\x7f\xc2\
+\xbf\xb4\xe7\x86>8|A\xf8;\xe0W\xf8\x91\xf1\x7f\
+\xe0\xee\x8d\xf0\xcfQ\xf0\xae\x9dk\xe1\x1d\x13H\x97Z\
+\xf1\xfd\xe7\x80<w\x7f\xe3=J\xe3\xc5sx\x1a\xc6\
+\xda\xefV\x8a\xdbY\xf0_\x85\xae\xbcW\xa1\xe9\xda\x95\
+\xf5\x9c\x1aF\xb6\x9a\x7f\x85\xf5/\xce_\xf86\x97\xc2\
+\x1aO\x8d\xbf\xe0\xb6\x7f\xb1\x16\x97\xadZE{e\xa6\
+\xeb_\x18\xfc]\x14SF\xb2\x08\xf5_\x04\xfe\xcf\x1f\
+\x16\xbc[\xa0\x5c\xa0n\x04\x96\x9a\xf6\x8f\xa6\x5c\xc6\xe3\
+\xe6\x8d\xe2\x0e\xa7+_\xeba\xf1C\xc0v\xdf\x13~\
+\x17\xfcG\xf8msq\x0d\x85\xbf\xc4O\x01\xf8\xbb\xc1\
+\x17\x17\xd3X\x8dJ+;\x7f\x16x{P\xd0d\xba\
+\x9bM76\xa3PKh\xf5\x06\x9a[#wl/\
+\x02\x18Z\xe2\x11'\x9a\xa4\xa4\xd3\xb2\xd3\xb8\xa9\xc1N\
+\x1c\xd2\xd5\xbd\xbf\x0fM7\xd3\xf5\xdb\xfcW\x7f\xe0\x9c\
+_\xb7\x07\xc4O\xf8'\x87\xed\x8b\xf0g\xf6\xa4\xf8}\
+\xa8j\xb1E\xe0\xaf\x12\xe9\xf6\x9f\x10\xfc;\xa7\x5cy\
+0|@\xf8O\xad]\xd9\xc1\xf1\x07\xc0\x9a\x9d\xa3\xcb\
+\x0d\xae\xa3o\xad\xe8\x02Y\xf4\xa1zL\x1a\x7f\x88\xec\
+t?\x10\xda4Z\x86\x93\xa7^\xc3\xfe\xaa_\xf0Z\
+\x7f\xf8(u\xbf\xecG\xff\x00\x04\xb7\xf8\xbd\xfbO\xfc\
+*\xf1-\x9bx\xef\xe2\x07\x86\xbc/\xe0o\xd9\xcf\xc4\
+\x16\x90\xdd^Ew\xe3o\x8cI\x0d\xaf\x87<_\xa4\
+\xec\xb7\x92\x01?\x84|!>\xbf\xf1;L\x1a\xbcq\
+\xe9\xf7r\xf8R\x0d>xn\xae\xafm\xf4\xbb\xcf\xe6\
+\x97\xfe }\x9cu\xff\x00\x82\x9dDH'$\xfe\xc6\
+R\x0d\xc4\x92rT~\xd5\x8c;\x90r\xceI\xcb\x16\
+\xcb\x1a\xf5\x1f\xf8;wN\x93\xe0\x1f\xfc\x13\x0b\xfe\x09\
+\xcd\xfb-O\xe2\xab\x9f\x13j>\x1d\xf8\x91\xe1m\x0a\
+\xe3_K\x03\xa2\xdb\xf8\xbe\xc3\xe0_\xc0[\xef\x05\xde\
+\xeb\xb7:!\xd45\x7f\xec\xd9/\xb5/\x14i:\x95\
+\xbe\x98\xda\xb6\xa4\xb6\x06y 7\xd7\x86\x11u){\
+\xb8\xf9o}5\x1cb\xe9\xc6w\xfb\xfb\xe8\xaf\xfdm\
+s\xf8^\xfd\x9e\xfe\x08|b\xfd\xb7\xbfi\xff\x00\x86\
+\xbf\x03|\x09=\xcf\x8b\xbe3~\xd1?\x13\xac\xb4+\
+mo\xc4\x9a\x86\xa1\xa8=\xde\xbf\xe2\xbdN[\xef\x11\
+x\xdb\xc6:\xc1\x1a\x9e\xaf.\x9f\xa5\xc3&\xa7\xe2\xdf\
+\x18\xeb\xd2\xc7\xa8_&\x9di\xaa\xea\xd7\x09u4s\
+\x07\xfe\xb2\xbfo\x9f\xf84F\xfb\xf6X\xfd\x8d>'\
+\xfe\xd1_\x06\xbfj\xcdw\xe3/\xc4\x7f\x82>\x07\xbe\
+\xf8\x8f\xe3/\x00k\xbf\x0a\xac\xfc%\xa4x\xb7\xc2\x9e\
+\x14\xb0}O\xc7\x13xF\xf3J\xf1o\x885\x1d+\
+R\xd2\xf4k}G[\xd2\xf4\xcb\xe8uu\xd4\xe0\xb0\
+\xfe\xc6\xfb]\x9c\xf7p\xdfC\xfc\xee\xff\x00\xc1\x1f\xbf\
+l/\x83\xbf\xb0W\xfc\x14'\xe0'\xed_\xf1\xd7\xc3\
+>7\xf1_\xc3\xbf\x84\xf2\xf8\xfa\xf3S\xd2>\x1di\
+\xba\x16\xb3\xe2\xf9\xb5\x1f\x11\xfc8\xf1w\x84\xb4[\x9d\
++O\xf1'\x89<)\xa38\xb3\xd4\xf5\xeb9n\xbe\
+\xd1\xad\xdam\xb2[\x99\x22\x8eY\xe2Hn?\xb5\xef\
+\x8c?\xf0w\xa7\xfc\x12\xd7\xe2\xc7\xc2_\x8a?\x0b5\
+\x1f\x81\x9f\xb6\xac\xda\x7f\xc4\xbf\x87^6\xf0\x05\xfcW\
+\x9f\x0e~\x0a\x0b9l\xfca\xe1\x8dO\xc3\xb71\xdd\
+\xb2\xfe\xd02\xc8-\xe4\xb7\xd4^)\x8aA3yl\
+\xdf\xbbn\x85\xc9\xca\xfa_n\xdf\xf0\x08\x87\xb2w\xe7\
+\xd1\xb6\xed{\xed\xa5\xba\xae\xaf\xd4\xfe\x1b?\xe0\x97\xff\
+\x00\xb6\xcf\x8d\xbf\xe0\x9f\x9f\xb7\x0f\xc0\x1f\xdaK\xc2Z\
+\xd6\xb1\xa7\xe8\xbe\x1b\xf1\xce\x89\xa3|U\xd0\xf4\xbb\xe6\
+\xb5\xb7\xf1\xc7\xc1\xef\x11j6\xba_\xc4o\x09j\xb6\
+\xb2\xcf\x16\x99\xa8\xc7w\xe1\xd9\xae\xb5\x0d\x155e{\
+M+\xc5Zf\x81\xe2+so\xa9\xe8\xda}\xd4\x1f\
+\xec\xd7\xff\x00\x0b\x87\xe1o\xfd\x0f\xfe\x1d\xff\x00\xc0\xab\
+o\xfe&\xbf\xc2Us\x81\x9c\x12\xd8\xdc\xa0\xed^\x19\
+[i89F+\x826\xb6\x09\x0e\x06Qk\xf7\xb3\
+\xfe\x1f\xcb\xfbb\x7f\xd1D\x87\xff\x00\x046\x7f\xfcj\
+\x87\x06\xdd\xee\x14\xea('t\xdd\xdd\xee\xbf\xe0\xfc\xff\
+\x00\xad\xbf\x04\xe8\xa2\x8a\xb3\x10\xa2\x8a(\x00\xa2\x8a(\
+\x00\xa2\x8a(\x00\xa2\x8a(\x03\xfa\xc8\xff\x00\x835\xbf\
+\xe5+\x7f\x13\x7f\xec\xc8\xfe.\xff\x00\xea\xdf\xfd\x9e+\
+\xfd@+\xfc\xbf\xff\x00\xe0\xcdo\xf9J\xdf\xc4\xdf\xfb\
+2?\x8b\xbf\xfa\xb7\xff\x00g\x8a\xff\x00P\x0a\xc6\x7f\
+\x13\xf9~H\xec\xa5\xf0/\xeb\xa2\x0a(\xa2\xa4\xd0\xf9\
+'\xf6\xca\xfd\xb9\xbfe\xef\xf8'\xff\x00\xc3\x0d#\xe3\
+?\xedm\xf1B\x1f\x84\x9f\x0c\xf5\xdf\x1bi?\x0et\
+\xbf\x13O\xe1/\x1ex\xc8]\xf8\xd3\x5c\xd1\xfcE\xe2\
+\x0d/DM+\xe1\xe7\x86<[\xad\xc6\xf7Z?\x84\
+\xf5\xfb\xc1{>\x99\x16\x99\x10\xd3\xcc7\x17\xb0\xcfq\
+i\x1c\xdf\x99\xdf\xf1\x13w\xfc\x11\x00\xf0?m\xeb!\
+\xdc\x96\xf8\x05\xfbR\x01\x8f\xc3\xe0\x91\xc9\xf6\xaf\x82\x7f\
+\xe0\xf3s\xff\x00\x1a\xb2\xf89\xef\xfbu|'\xff\x00\
+\xd5\x1d\xfbJ\x1f\xe9_\xe6)M&\xdf\xe6eR\xa3\
+\x83\xd2\xcfM\x9f}?C\xfd^\xfe,\x7f\xc1\xd8\x1f\
+\xf0G\x0f\x87\x1a|\xf7\x9e\x15\xf8\xbb\xf1O\xe3\x9d\xe4\
+V\xc6xt_\x85?\x03\xfcya\xa8]\xc8\x1d\x13\
+\xecq\xcf\xf1\x8a\xcb\xe1&\x8f\x0d\xc8\x0cf\xdfu\xaa\
+Cj\xd1#\x08\xee^|C_\xc9W\xfc\x15\x0b\xfe\
+\x0e\xa7\xfd\xae\xbfm\xcf\x0bx\x8b\xe0\xaf\xec\xdf\xe1\x94\
+\xfd\x90\xbe\x05x\x96\xc6M#\xc4\xf7z\x17\x88e\xf1\
+\x0f\xc7/\x1bi7\x1fi\x87Q\xd2\xb5/\x88V\xd6\
+\xfaM\x87\x83|;\xaa[Kmo\x7f\xa3\xf8'I\
+\xb7\xd7nE\xbd\xc5\x9d\xdf\x8d5\x1d\x0bV\xbe\xd1[\
+\xf9Y\xa2\xb5QK\xcf\xfa_\xe5\xfa\x18\xfby\xbb]\
+%\xe9\x7f//\xeb\xcfS\xf4\xff\x00\xfe\x08\xaf}g\
+c\xff\x00\x05g\xff\x00\x82}^\xea\xb7P\xc1l\x9f\
+\xb5'\xc3\x01%\xcd\xd5\xcc6\xc9\xf6\x9b\xbdv+k\
+m\xd3M\x88\xdaI\xafg\x816\x10\xf2\x5c;\x88\x80\
+\xdc\xe1\xd3\xfd\xa1\xa3\xe1\x17\xafN\xfc\x93\xeeOr{\
+\x93\xc9\xeaI'5\xfe\x0d_\x0f|s\xe2O\x86\x1e\
+?\xf07\xc4\xbf\x06\xea\x0f\xa4\xf8\xc3\xe1\xd7\x8c|3\
+\xe3\xcf\x09\xea\xb1\xaa\xb4\x9ao\x89|\x1f\xadYx\x8b\
+C\xd4\x13w\xf1\xd9jzm\xb5\xca\x81\xf31\x8b`\
+\x0d\xbbk\x7f\xb5\x0f\xfc\x13[\xf6\xf6\xf8[\xff\x00\x05\
+\x1c\xfd\x91\xbe\x15\xfe\xd2\xdf\x0d\xafla\xbc\xf1\x1e\x8f\
+o\xa5|J\xf0d:\x8d\xad\xe6\xa7\xf0\xdb\xe2\x96\x93\
+m\x0c>2\xf0N\xb3\x14S\xcb=\xbc\x96w\xe7\xfb\
+CD\x92\xeda\x9bW\xf0\xae\xa7\xa0\xeb\xf1B-5\
+X\x0dD\xd6\xa9\xdb\xa5\xbf\xe0\x1aQ\x95\xd3M\xed\xde\
+\xddl\x97\x9f\xf5\xe4}\xefE\x19\xa2\xa0\xdc\xfe~\x7f\
+n/\xf8\x22^\xa7\xfb\x5c\x7f\xc1T?d\xef\xf8)\
+N\x9b\xfbBX\xf8!\x7ff\xa3\xf0r\xdfP\xf8K\
+\x7f\xf0\xe6\xe3[>,\xb3\xf8Q\xf1\x13\xc5~?\x92\
+KO\x18A\xe3\x0d4\xe9\x17\x1a\xd2x\x95\xf4\xc4\x12\
+\xf8sQ\x8a\xc9\xad\x12\xe9\x9a\xe5%x\xa1\xfe\x80\xa2\
+b\xcb\x9ct$t\xc7\xf59\xf5\xc8\xe3\xb7PMI\
+E;\xbf\xb8\x02\xbf\x94\xaf\xf8<S\xfeQ7\xe1\x7f\
+\xfb<\x1f\x83\xff\x00\xfa\x83|_\xaf\xea\xd6\xbf\x94\xbf\
+\xf8<P\x1f\xf8t\xdf\x85\xbd\xff\x00l\x0f\x83\xe7\xff\
+\x00,_\x8c\x07\xfaS\x87\xc4\xbe\x7f\x91\x15>\x09z\
+\x1f\xa8?\xf0Ao\xf9C\xc7\xfc\x13\xf3\xfe\xc8\x06\x8b\
+\xff\x00\xa7\x9dn\xbf\x5c\xeb\xf23\xfe\x08,s\xff\x00\
+\x04w\xff\x00\x82}\x9f_\xd9\xff\x00C?\x9e\xb1\xad\
+\x9f\xeb_\xaeu%-\x97\xa2\xfc\x84=?\x11\xfc\xc5\
+\x7f\x88\xe7\xfc\x14\xe7\xfeR=\xfb{\x7f\xd9\xe3~\xd2\
+\x7f\xfa\xb8<__\xed\xc6z~#\xf9\x8a\xff\x00\x11\
+\xcf\xf8)\xcf\xfc\xa4{\xf6\xf6\xff\x00\xb3\xc6\xfd\xa4\xff\
+\x00\xf5px\xbe\xae\x1b\xfc\x8c\xeb|\x1f4|7\xdc\
+\x7f\xc0\xbf\xf4\x06\xaf\xf5\xd0\xff\x00\x83a\xff\x00\xe5\x0a\
+\xdf\xb2?\xfdv\xf8\xc9\xff\x00\xab\xaf\xc7\xf5\xfeE\xfd\
+\xc7\xfc\x0b\xff\x00@j\xff\x00]\x0f\xf86#\xfeP\
+\xad\xfb#\xff\x00\xd7o\x8c\x9f\xfa\xba\xfc\x7fU=\xbe\
+\x7f\xa32\xa1\xf1\xbf\xf0\xbf\xcd\x1f\xbf\x14\xc7P\xe0+\
+w={\x8e\x08\xe3 \xf5\x19_\x5c\x13\x8a}'\xa7\
+\xb1\xfe\x84\x7fZ\xc8\xea?\x1b\x7f\xe0\x91\xbf\xf0QK\
+_\xdb:/\xda\xd7\xe0\xa7\x8bu{Y\xfe7\xfe\xc6\
+\xbf\xb5\x07\xc5\xdf\x84\x1e*\xb4\x92U\x1a\x9e\xb7\xf0\xca\
+\x1f\x88>,\x83\xe1\x0f\x8d^\x16\x91\xa7\x9dnt-\
+.\xf7\xc2\x1a\x8d\xfc\x81\x8d\xde\xb7\xe1-F\xeew\x13\
+^\x8f7\xf6N\xbf\xc9\xf7\xf6Z\xff\x00\x82\x88\xdd\xff\
+\x00\xc16\x7f\xe0\xe0\x1f\xda\x13\xe3&\xb5\xaa\xdeY\xfc\
+\x1a\xf1\xa7\xedk\xf1\xeb\xe17\xc7\xeb(\xa6\x9f\xecr\
+|1\xf1\x8f\xc5\xedZ\x1b\x9f\x13]YD$\xfbd\
+\xdf\x0f5\x9b}7\xc6\xd6\xb1\xc7o=\xec\xb0h\xf7\
+\xba}\x82\x09\xb5\x19R\xe3\xfd[\xb4\x8dKO\xd5\xb4\
+\xdb\x1dSK\xbc\xb6\xd44\xcdN\xd6\xdfQ\xd3\xb5\x0b\
+9\xa3\xb8\xb3\xbe\xb1\xbd\x85.\xado-\xae#&9\
+\xed\xee`\x95&\x86d,\xb3F\xeb '}T\x95\
+\x9e\x9b;4L]\xd7v\xb7\xf2\xdb\x7f\xbd}\xe8\xbb\
+sm\x05\xe4\x13Z\xddE\x1c\xf6\xd7\x11\xc9\x0c\xf0J\
+\x8b$S\xc3*4rE,n\x19^7F*\xea\
+F\x18\x1c\x1c\x82A\xff\x004\xcf\xda\xdf\xf64\x8b\xfe\
+\x08{\xff\x00\x07\x09\xfe\xc9?\x1d\xbc%\xa4\xdd\xf8{\
+\xf6@\xf8\xd1\xfbDx{\xc7?\x0du\x1bmE\xa0\
+\xd2|#\xe1\xff\x00\x1ckV~\x0d\xf8\xcd\xf0\xe6\xfb\
+R\xb9I\x85\x9e\x9f\xf0\xf6o\x1c]j\x16\xd6\xd7\xac\
+K|>\xd4\xf4\x15\xfb|\xf7Q\xde\xc9\x0f\xfa]W\
+\xe5?\xfc\x16;\xfe\x09\xc7\xe1\xef\xf8)\xa7\xecK\xf1\
+\x17\xe0c\xbd\x9e\x95\xf1S\xc3\xd8\xf8\x97\xfb?\xf8\xc6\
+x\xd4\x5cxW\xe2\xf7\x86,\xaf\x9bC\x8b\xed\x81\xa1\
+\x9a\xcbG\xf1e\xbd\xc5\xd7\x84|C,3o\x87L\
+\xd5\xdbP\x8a)ot\xbb\x1d\xa96\xb6\x1bI\xda\xea\
+\xf6w^L\xfdT\x89\xb7\xa0pr\x1b\x04\x11\xceA\
+Q\xdf\xbf\xf8\xf0\x09\xebRW\xe2'\xfc\x10\xdb\xfe\x0a\
+Io\xfbp\xfe\xcb6\x9f\x0e\xbe-K7\x85\x7fm\
+?\xd9Y\xd3\xe0\xa7\xedM\xf0\xbf\xc4{4\xff\x00\x19\
+X\xf8\xaf\xc1$xj/\x1e\xdc\xe9\x13%\xb4\xeb\xa7\
+\xf8\xbc\xe9\xd2>\xa2\xf1C\xe5i\xde-\xb5\xf1\x06\x8e\
+\xd8[kY.\x7fn\xe9\x0c\xe3\xbe\x22x\x07\xc2\x9f\
+\x15\xfe\x1f\xf8\xeb\xe1w\x8f4\xb3\xad\xf8\x1b\xe2O\x83\
+\xbcM\xe0\x1f\x19\xe8\xcb}\xa8i\x8d\xab\xf8S\xc6\x1a\
+-\xef\x87\xbcC\xa6\x0dKI\xba\xb1\xd5t\xf3\x7f\xa4\
+j7\x96\xa2\xf7L\xbd\xb3\xd4-L\xbe}\x9d\xd5\xbd\
+\xc4q\xca\x9f\x86#\xfe\x0dw\xff\x00\x82\x1c\x80\x00\xfd\
+\x8c/\x00\x03\x1f\xf2r_\xb5st\xe0r\xdf\x1c\x18\
+\xf4\xc0\xeb\x8c\x0e\x99\xc9?\xbf\xf4SM\xad\x99.1\
+\x96\xe9;\x1f\x80_\xf1\x0b\xcf\xfc\x10\xef\xfe\x8c\xc6\xf7\
+\xff\x00\x12O\xf6\xb0\xff\x00\xe7\xe3I\xff\x00\x10\xbc\x7f\
+\xc1\x0e\xfa\x8f\xd8\xc6\xf7=A\xff\x00\x86\x91\xfd\xabI\
+\x07\xb1\x04\xfco$\x11\xfc,\x0e\xe5 \x15 \x80G\
+\xef\xf5\x14\xf9\xa5\xdd\xff\x00_\xd7\xf5\xa8\xbd\x9d?\xe4\
+_%n\xdd\xbd\x11\xfe]\x1f\xb4\x97\xec\x93\xf0\x03\xf6\
+!\xff\x00\x83\x9e\xff\x00f\x9f\xd9\xdb\xf6c\xf0,\x9f\
+\x0e>\x0f\xf8S\xf6\x85\xfd\x8b5}\x07\xc2rx\xa7\
+\xc6>3k\x1dC\xc5\x9a\x7f\x80\xfcE\xaf\xceu\xff\
+\x00\x1ex\x83\xc4\xfe%\xba\x17\xda\xc6\xa1yx\x22\xbc\
+\xd6.\x22\xb6\xf3\xbc\x8bD\x82\xd9#\x85?\xd4[<\
+\xe3\xd8\xff\x00O\xf1\xaf\xf3x\xff\x00\x82\xa1\x1f\xf8\xeb\
+\xa3\xe0P\xff\x00\xaa\xe7\xfb\x05~\x9e\x13\xf8l\x7f\xad\
+\x7f\xa4?\x7f\xa0<w\xe7\x14\x9bo}B\x0b\x95\xcd\
+%et\xd7\xfe\x02\xae-\x7f=\x9f\xf0t\xa7\xfc\xa1\
+?\xf6\xac\xff\x00\xb0\xef\xc0?\xfd_\x9f\x0e\x7f\xcf\xe1\
+_\xd0\x998\xec\x7f\x0a\xfe{?\xe0\xe9O\xf9Bw\
+\xedY\xff\x00a\xdf\x80\x5c\x7f\xdd|\xf8s\xfa\xfe\x94\
+\x87/\x85\xff\x00]O\xf2J\xa3\xb1\xff\x00u\xbf\xf4\
+\x13E\x1d\x8f\xfb\xad\xff\x00\xa0\x9a\xe88O\xf52\xff\
+\x00\x83@\x7f\xe5\x11q\xff\x00\xd9\xcd|k\xff\x00\xd1\
+~\x12\xaf\xeaQ\xfa~\x7f\xc8\xd7\xf2\xd7\xff\x00\x06\x80\
+\xff\x00\xca\x22\xe3\xff\x00\xb3\x9a\xf8\xd7\xff\x00\xa2\xfc%\
+_\xd4\xa3\xf4\xfc\xff\x00\x91\xacg\xf1?\x97\xe4\x8e\xef\
+\xb1\xff\x00n\xfe\x87\xe4\xaf\xed\xb9\xff\x00%n\xc3\xfe\
+\xc4\xbd7\xff\x00N\x1a\xd5{\xcf\xec!\xff\x00\x22o\
+\x8c\xff\x00\xecg\xb6\xff\x00\xd3e\xb5x7\xed\xb9\xff\
+\x00%n\xc3\xfe\xc4\xbd7\xff\x00N\x1a\xd5{\xcf\xec\
+!\xff\x00\x22o\x8c\xff\x00\xecg\xb6\xff\x00\xd3e\xb5\
+\x7f\x8f\x1e\x17_\xfe*E\xc7\x1d\xbf\xb4x\xca\xdf\xf8\
+e\xa5\xb9\xfd\x7f\xc5_\xf2\x8d\x9c=\xe9\x94\xff\x00\xea\
+uc\xef:\xfe$\x7f\xe0\xf5\x0f\xda\x1b\xfe\x11\xbf\xd9\
+\xbf\xf6K\xfd\x98t\xddJK{\xef\x8a\x9f\x16<S\
+\xf1g\xc4\xb6\x10\x9b\xc8\xcd\xdf\x86\xbe\x15xv\x1d\x07\
+I\x86\xe8\xc6\xcbc=\x94\xde\x22\xf8\x85\x1d\xe7\xd9\xe7\
+\xf3'[\xed\x1a\xc2\xe6\x04X\xe1\x9d\xd7\xfbm'\x18\
+\xcfs\x81\xef\xf4\xf7\xc0'\x1d\xf1_\xe5C\xff\x00\x07\
+e~\xd1)\xf1\xab\xfe\x0a\xd1\xe2\xff\x00\x87\xba|\xde\
+v\x8b\xfb4\xfc)\xf8y\xf0\x920\x17\xf7c\xc4:\
+\xb5\x84\x9f\x12\xfcG,o\x1d\xe5\xcc\x13H\xb3x\xda\
+\xd7L\xb9\x94Ai*M\xa6\x0b+\x98\xda[\x05s\
+\xfe\xc3\xc56\xd7\x93O\xf1?\x90$\xed\x17\xe7\xa1\xfc\
+\xe6|6\xf8\x91\xe3\xaf\x83\xde=\xf0\x87\xc5\x1f\x86>\
+'\xd4\xfc\x19\xf1\x0b\xc0:\xf5\x87\x8a<\x1b\xe2\xcd\x19\
+\xe2\x8fV\xf0\xef\x88t\xb9\x96\xe3N\xd5\xb4\xe9f\x8a\
+h\xa2\xbc\xb3\x99VX$h\x9fc\xaa\xb67*\x91\
+\xfaU/\xfc\x17K\xfe\x0a\xf72<S\x7f\xc1A?\
+h\xc9\x22\x91Z9#\x7f\x17DU\xd1\xd5\x91\x91\xbf\
+\xd03\x86V \xe0\x83\x82FpN\x7fL?\xe0\xd9\
+\x1f\xf8$\xbf\xec\xd9\xff\x00\x053\xf8\x8f\xfbRj\xff\
+\x00\xb5\x97\x835\xdf\x1a\xfc-\xf8;\xe0\xaf\x01\xe9\xbe\
+\x1e\xd34_\x14\xf8\xcb\xc1\x12\x7f\xc2\x7f\xe3\xadsS\
+\xbb\x8bP\x1e \xf0\xa6\xa3\xa5\x1b\xa4\xd2\xfc;\xe1]\
+N\xda\xe7G\xb8\xba\x9b\xe6\xd7\xaco\xcc\x09\xe4E)\
+\xfe\xc0\x8f\xfc\x1a\x9b\xff\x00\x04Y\xed\xfb=|A\x1f\
+\xf7p\x9f\x1aO\xfe\xee\x15\xa3q\xbaO_\xd3m\xff\
+\x00\xae\xe7<i\xd5\xb2jI+\xddF\xce\xff\x00\x9d\
+\xae\xd7\x7f\xd5\xdb\xfc\x9dn\xae\xae/\xae\xae/n\xa5\
+{\x8b\xab\xb9\xe5\xba\xb9\x9e\x5c3\xcdq4\x8d4\xd2\
+\xc9\x91\x86i$fw\x04m$\x91\x8cq_\xea\xaf\
+\xff\x00\x06\x9b\xfe\xd1m\xf1\xa7\xfe\x09)\xe0\xaf\x00j\
+:\x94Wz\xf7\xec\xd7\xf1K\xe2?\xc2\x1b\x9bs\xe4\
+-\xe5\xb7\x87\xefu\x1b\x7f\x89~\x15\x96h\xe3\x9aK\
+\x97\xb6}?\xc7s\xe9\xd6\x97\xb7\x89\x08\x9a]\x22\xee\
+\xd2\xd7\xcd\xb6\xb0Y+\xf8n\xff\x00\x83\x85?\xe0\x9e\
+_\x0a?\xe0\x9b\x9f\xf0P]C\xe0\xcf\xc0?\x0dk\
+\xde\x16\xf8#\xe2\xcf\x84\xdf\x0f\xfe%\xfc?\xd35\xff\
+\x00\x10j>(\x9e\x0f\xedT\xd4\xbc;\xe2\x8bh5\
+\xcdoQ\xd4u\xcb\xfbX\xfcK\xe1\x9dV\xe1\x1bT\
+\x9cM\x04\xd7rAj\x86\xca\xda\x07?\xb4\xbf\xf0e\
+\x97\xed%\x17\x87>?~\xd6\x9f\xb2\x9e\xad\xa8\xc7\x04\
+\x1f\x13\xbe\x1c\xf8c\xe3?\x84\xec\xe7\xba\x82/?\xc4\
+\x1f\x0c\xf5\x91\xe1o\x11[X\xda\xb4\x1e}\xdd\xe5\xf6\
+\x81\xe3\x9b\x1b\xe9\x9c\x5c\x88\xad,|9;\x18\x99\xae\
+\x15\xd1J\xcd]kn\xbf\xd7\xf5\xbfR\xa0\xa5\x1a\x8f\
+\x99\xee\xae\xf5Z\xbd\xbe\xfd\x97\x9f\xc8\xfeG\xff\x00l\
+\xbf\x0c\xdfx+\xf6\xbe\xfd\xaa\xfc\x1d\xa9F\xd0\xea>\
+\x16\xfd\xa4>8h\x17\xf19\xf9\x92\xefH\xf8\x9b\xe2\
+}>\xe1[\x19\xe5%\xb6t<\xff\x00\x08o\xe3\xe3\
+\xfa\xfc\xff\x00\x829\xff\x00\xc1\xb2\x7f\xb0\xd7\xfc\x14?\
+\xfe\x09\xe9\xf0/\xf6\xb5\xf8\xbf\xf1\x9f\xf6\xab\xf0\xaf\xc4\
+O\x89\xd7\x1f\x11\xe0\xd7\xf4\x0f\x86\x9e.\xf8C\xa6x\
+6\xc1\xbc\x1f\xf13\xc5\xfe\x0d\xd3\x86\x95c\xe2\x8f\x82\
+\x9e-\xd7!i\xf4\x9f\x0f\xd9]_}\xb3_\xbd\x0f\
+\x7f-\xcc\x96\xff\x00g\xb7x\xad\xa1\xfez\x7f\xe0\xbc\
+\x9f\xb3\xf6\xb5\xfb8\xff\x00\xc1Z?mo\x08\xeav\
+W\xf6\x9a\x7f\x8d\xbe0\xeb\xdf\x1b<-s\xa8\x00N\
+\xb1\xe1\xbf\x8dR\x9f\x88\x91\xea6R\xa11\xcdc\x16\
+\xaf\xaej\xdab\xedfk{\x9b\x0b\x9bI\xf6\xdd[\
+O\x1a\x7f`_\xf0h\xdf\xfc\x14/\xe0\x1b\xfe\xc4\xfe\
+*\xfd\x8d>\x22\xfcT\xf0w\x81>-\xfc\x1c\xf8\x9b\
+\xe3?\x17\xf8_\xc3\xbe:\xf1n\x91\xe1\xf9\xfc]\xf0\
+\xd3\xc7\x8b\x0f\x88\x9bS\xf0\x84Z\xdd\xd5\x8ajI\xe1\
+}~\x1f\x10\xc5\xe2[\x0d=\xae\xe5\xd2m\xee\xb4\xed\
+R\xe9`\xb5\xd5\x03\xa1)i\xee\xbdo\xd3\xfa\xf4\xfc\
+\xbb\x93N\x09\xcejkg\xa6\xb6\xed\xb5\xacz\x8f\xfc\
+Aq\xff\x00\x04\xd0\xff\x00\xa3\x87\xfd\xba?\xf0\xbd\xf8\
+\x03\xff\x00\xd0\xe3_\xa1\xff\x00\xf0L\xdf\xf87\x8f\xf6\
+;\xff\x00\x82W~\xd0Z\xbf\xed\x1d\xf0\x17\xe2\xb7\xed\
+-\xe3o\x1ak\x7f\x0d\xb5\xff\x00\x85\xd7ZO\xc5\xdf\
+\x14|/\xd6<1\x1e\x85\xe2-g\xc3\x9a\xed\xe5\xec\
+\x16\x9e\x0d\xf8G\xe0mUuhn\xbc/c\x15\xac\
+\xd2k\x12Y\xa5\xbc\xd7k-\x94\xd2<2\xc3\xfc_\
+\x7f\xc1\xd7_\xf0P\x9f\x83\xff\x00\xb6\x87\xed\xa9\xf0\xcb\
+\xe1\x87\xc0/\x1c\xf8\x7f\xe2_\xc3?\xd9{\xe1\xf6\xad\
+\xe1\x8dO\xc7\xde\x10\xd5\x06\xb5\xe1]\x7f\xe2w\x8e\xb5\
+\x98uO\x19i\xfa\x06\xafh\xf3h\xfa\xf6\x9d\xe1\xad\
+#F\xf0\xb6\x96u\xed\x0e\xea\xea\xc2\xe7Zmn\xc2\
+;\xb9F\x9f\xbd\xbfO?\xe0\xc9\x9f\x81Z\x90\xd4\xbf\
+n\x1f\xdab\xfe\xc7S\xb7\xd2\x8d\x87\xc3\x0f\x81\xfe\x15\
+\xd4\x5c*\xe9:\xbd\xd3\xddk\xbe9\xf1\xb4\x11\xe7\xf7\
+\x92\xdeh\x91\xdax\x0d\xf7\x8c\xc6\x91\xeb\x92\xc7\x92\xe1\
+\x80\x96\xee\xbe+\xf9[\xd0\xd1r)\xf2\xc6\x1bk\xcc\
+\x9e\xda/\xf3\xb1\xf8\x17\xff\x00\x073q\xff\x00\x05\xbc\
+\xfd\xb7\x7f\xeb\xfb\xe0o\xeb\xfb5|\x1f5\xfd.\x7f\
+\xc1\x92\x9f\xf2B?o\x8f\xfb+\xdf\x06\xff\x00\xf5\x0b\
+\xf1}\x7f4\x7f\xf0s9\xff\x00\x8d\xde~\xdb\xbf\xf5\
+\xfd\xf03\xf5\xfd\x9a\xbe\x0f\x0a\xfe\x97?\xe0\xc9C\x8f\
+\x81\x1f\xb7\xc7\xfd\x95\xff\x00\x83_\xaf\x82\xfc^*\x9f\
+\xc0\xbd\x10\xa1wZ~\x9f\xacO\xed\xe7X\x8b\xcf\xd2\
+u8rG\x9b\xa7\xdeG\x91\xc1\x1b\xed\xe4RG^\
+@9\x1c\x1eGC\xd2\xbf\xc1\xcf\xc7\x91\x08<q\xe3\
+(\x06H\x87\xc5^ \x8f$}\xed\x9a\xb5\xda\x93\xc8\
+\xe41\x19\x1cr\x0ek\xfd\xe6e\x01\x93k\x0c\xabe\
+J\xf6`T\x82\xa7 \xf0Fs\xd3\xdf\x8c\x83\xfe)\
+\xff\x00\xf0V\xef\xd9\xe6\xfb\xf6Z\xff\x00\x82\x96~\xda\
+\xbf\x05\xee\xf4\xb8t\x8b\x1d\x0f\xe3\xf7\x8f\xbcK\xe1;\
+\x0b{G\xb3\xb0\x8f\xc0?\x11\xf5Y>\x22\xf8\x09t\
+\xe8\x8e\x14XA\xe1/\x15h\xd0[\x98\xc8\x0c\xb0\x8d\
+\xb1\xa0\x05\x16i\xfck\xb7_B\xab|\x1f4\x7f\xa7\
+/\xfc\x1bT\xe5\xff\x00\xe0\x88\xdf\xb0\xa363\xff\x00\
+\x08\xc7\xc5\xf5\xe0`a?h\xbf\x8b\xe88\x1d\xf0\xa3\
+>\xa7&\xbf\x9cO\xf8=\xd7[\xb1\x9b\xc5\x7f\xf0N\
+\x9f\x0e$\xaa\xda\x95\x87\x87\xff\x00i\xcdr\xe2\x10A\
+e\xd3\xf5\x8dG\xe0f\x9fa1\x19\xce\xd9f\xd0\xaf\
+\xd0\x10\x02\xee\x85\x87Ps\xfa\x0d\xff\x00\x06\x9f\x7f\xc1\
+E\xfe\x01k\xdf\xf0O\x8d?\xf6E\xf8\x8b\xf1\x8b\xc0\
+~\x0c\xf8\xcb\xfb<x\xe3\xe2\x0a\xe8\xfe\x09\xf1\x97\x8a\
+to\x0b\xea\x9a\xff\x00\xc2\xbf\x18k\x97\xbf\x10t\xdf\
+\x12\xf8V\xdf[\xbb\xb1\x1a\xe6\x9d\xa6k\xda\xff\x00\x8a\
+t\xcd~=\x1d\xafd\xd0.-m\xee5\x18\xac\xac\
+5m&K\x8f\xe6\x9b\xfe\x0e\xa3\xfd\xbd\xbe\x11\xfe\xda\
+\xbf\xb7\xff\x00\x85<1\xf0\x1f\xc5\xda\x0f\xc4?\x86\x9f\
+\xb3?\xc2\xb8\xfe\x19\xcb\xe3\xdf\x0b\xde\xc1\xaa\xf8o\xc4\
+\xbf\x10u\xbf\x12j\x9e&\xf1\xa3xw\x5c\xb1\xbb\xbc\
+\xd3u\xfd\x0bG\x82_\x0e\xe8V\xfa\xc6\x9e\xe2\xce\xe7\
+X\xd3u\xf4\xb2\x96\xff\x00N\x8e\xca\xfet\xaf\xcdy\
+w\xd7\xf4\xfd<\x82RN\x93\xb3_\x08\xff\x00\xf84\
+\x8b\xc2Z\xe7\x88\xbf\xe0\xb0~\x0d\xd6\xb4\xab)n\xb4\
+\xef\x03|\x06\xf8\xe3\xe2O\x12\xdcG\xc2\xe9\xbaE\xfe\
+\x85a\xe0\xbbK\xb9\x0fR\x92x\x83\xc5:E\x87\xcb\
+\x82%\xbd\x84\xe7\x00\xe7\xfd\x19?\xe0\xa0\x1f\xf0M\x8f\
+\xd9C\xfe\x0a_\xf0t|\x1c\xfd\xa9<\x09&\xbde\
+\xa6]M\xaax#\xc7>\x1e\xbb\x87B\xf8\x93\xf0\xd7\
+[\xb8D\x8e\xe3X\xf07\x8a\xbe\xc7z\xfal\x97\xb0\
+\xc3\x04\x1a\xbe\x93\x7fg\xaaxw^\x82\xda\xd6\x1ds\
+F\xd4V\xce\xd3\xc8\xfe0?\xe0\xca\xdf\xd9\xb3\xc4W\
+\x9f\x17\xff\x00k\xdf\xda\xf2\xf7M\x9a\x0f\x09x\x7f\xe1\
+\xc7\x87\xbfg\x9f\x0dj\xb2-\xdaE\xabx\x8b\xc5\xfe\
+$\xd3>!x\xbe\xce\xc3\x16\xc6\xce\xe9\xb4\x1d3\xc1\
+>\x11\x93Uo\xb5\x0b\x8b'\xd7\xb4e\xfb<\x89{\
+\xbd?\x07\x7f\xe0\xb0\xff\x00\x1d\xff\x00k\xcf\x84\x1f\xf0\
+To\xdb\xb7\xc0\x0f\xf1\xe7\xf6\x81\xf0M\x9e\x95\xfbH\
+|F\xd4\xf4\x1f\x0dY|X\xf8\x87\xa2\xe9\xf6\x1e\x10\
+\xf1^\xac\xfe/\xf0T\x9a^\x99k\xaf\xc1gg\xa4\
+j\x1e\x10\xd7\xb4MKG\x8a\xd25\xb6\x1a]\xdd\x9b\
+B\x02\x10\x056\xdc\xaf\x1b\xb7ew\xfew\xf9\x13\x16\
+\xa1M&\xb4\xec\xef\xe5\xeb}\x7f\xc8\xfdl\xfd\xb6\xbf\
+\xe0\xce\x9f\xda\xff\x00\xe1L\x9a\x8f\x8a?b\x8f\x8a\x9e\
+\x0e\xfd\xa8|\x22\x93j3A\xf0\xff\x00\xc6\xb3\xe9\xdf\
+\x08\xbe1Y\xdb\x02%\xd2\xec,\xee\xf5[\xc9\xbe\x19\
+x\xbaq\x10\x9a\xd7Q\xd4\xee<M\xe0\x17{\xa5\xb6\
+\x9a\xc3\xc3\xb2\xc5s4V?\xc9\x9f\xc6\x1f\x83\x1f\x16\
+\xff\x00g\x7f\x89~#\xf8G\xf1\xaf\xe1\xff\x00\x8b\xfe\
+\x14\xfcR\xf0]\xf2Y\xf8\x97\xc1\x9e2\xd1\xae\xfc?\
+\xe2M&\xe5\xe0\x8a\xe6\xd5\xe4\xb4\xbbUimo,\
+f\xb6\xbf\xd3\xaf\xad\x9e{\x0dKO\xb9\x82\xf3N\xba\
+\xb8\xb6\xbb\x8ei?\xd47\xfe\x0d\xb7\xff\x00\x82\x96\xfc\
+\x02\xf8\xe5\xff\x00\x04\xe0\xf87\xf0\x97\xe2\x0f\xed\x03\xe1\
+h\xbfh\xff\x00\x81\x96\xde1\xf0\x8f\xc4\x8f\x0c|S\
+\xf8\x97g\xff\x00\x0b/\x5c\xd3\xe2\xf1\x86\xb1\xe2\x0d\x13\
+\xc7\xf1\x7f\xc2_\xa8\xdbk~$\xf0\xcd\xfe\x85\xe2\x0d\
+*\xc4\xebVGS\xb2\xd2\xaf\xec\xa7\xd1o/\xa2\x9e\
+\xd5\x22\xaf\xe5'\xfe\x0e\xd8\xfd\xa6\xff\x00f_\xdaC\
+\xf6\xfa\xf8Y\x07\xec\xf3\xe3\x0f\x03|J\xd4\xfe\x15|\
+\x0b\x87\xc1?\x16>\x22\xfc>\xd7\xb4\xef\x13h7\x9e\
+'\x97\xc6\xbe$\xd5t\xcf\x05I\xaeh\xd3]\xe8\xba\
+\x86\xa1\xe0\x8d>y\x9fP\x9a\xc2\xf6\xed\xedn\xbcC\
+>\x8b}$7Z/\xd9\xa1#w\xbe\xab\xcdu\xd2\
+\xdf\x87\xde)\xc6*<\xd1\xdd5g\x7fO\xf2Z~\
+\x07\xf4)\xff\x00\x06\x95\x7f\xc1N\xfe.~\xd6\x7f\x02\
+\xfe0\xfe\xc9\x7f\x1f\xfcg\xa9\xfcC\xf1\xe7\xec\xc5\x0f\
+\x855\xef\x86\xfe5\xf1N\xad\x1e\xa7\xe3\x1dk\xe0\xf7\
+\x8a\xe4\xd44\x9f\xf8Gu{\xab\xa9\x0e\xb3\xe2\x05\xf8\
+}\xe2\x1d.+{?\x10_\xcf\xa9\x5c\xc7\xa3x\xb3\
+B\xd0n\xae\xadm\xb4\xbd&\x07\xfe1\xbf\xe0\xbf_\
+\xf2\x98\xef\xdb\xfb\xfe\xcbj\xff\x00\xea\x19\xe1j\xfd\xd7\
+\xff\x00\x83*>\x12x\x93Q\xfd\xaa\xff\x00lO\x8e\
+\xe9\x98\xbc\x1f\xe0\xef\xd9\xf3\xc3\xdf\x08\xee\xf7\xdbN~\
+\xdb\xe2_\x89\x9f\x11\xbc?\xe3=?\xec\xd7\xaa\xa6\xc4\
+\x7fe\xe9\x7f\x09\xf5O\xb7[I1\xbaq\xabXM\
+m\x19\x88L\xe7\xf0\xa3\xfe\x0b\xf5\xff\x00)\x8e\xfd\xbf\
+\xbf\xec\xb6\xaf\xfe\xa1\x9e\x16\xa4\xd5\xa6\x92\xee\xbfAM\
+\xc9\xd2\x8b\xdd;]\xf7ZZ\xff\x003\xfb<\xff\x00\
+\x830u\x18\xae\xbf\xe0\x9d\xbf\xb4\x15\x82\xff\x00\xac\xd3\
+?k\x9f\x10,\xbcu\xfbg\xc2\x9f\x85\xf7\x11\xf3\xdf\
+\x1c\xf3\xf8v5\xd1\x7f\xc1\xe6\xda\xa4V?\xf0L?\
+\x83\x16.\xae\xcf\xad\xfe\xda\x9f\x0e\xec\xa2+\xc0\x8d\xed\
+\xbe\x0d\xfcx\xd4\xd9\x9d\xba*\x18\xec\x1d\x09\x1c\xe5\xc7\
+5\xf8/\xff\x00\x06\xa8\xff\x00\xc1Z~\x00\xfe\xc2\xde\
+1\xfd\xa1\x7fg\x1f\xda\xc7\xe2e\xb7\xc2\xcf\x84\xff\x00\
+\x1be\xf0\x9f\xc4?\x87\x9e:\xf1+^\x0f\x02\xf8S\
+\xe2W\x84m5m\x13\xc4\xdaV\xbb=\x8d\x85\xd7\xf6\
+$\x9e=\xf0\xc5\xe7\x87\xdd<C\xaa\xbd\xbe\x8f\x04\xfe\
+\x06\xd3t\xcb\x8b\x98n5+O3\xa6\xff\x00\x83\xac\
+\xff\x00\xe0\xae?\xb3\x9f\xed\xbdu\xfb;~\xcb\xff\x00\
+\xb2g\xc5\x1b/\x8b\xbf\x0e\xbe\x13k\x9a\xe7\xc5\xbf\x89\
+\xfe7\xf0\xbc\x97rx\x07U\xf8\x81\xab\xe8\xa7\xc3\x9e\
+\x06\xd1t+\xe9\xedm\x0e\xbf\x7f\xe1O\x0dj~/\
+\x9fR\xd64\xc9\xa6\xd1`o\x17\xc3\xa5\xdb\xdd^_\
+\xdb\xea\xb1i\xadE\xf3^\xda]\xff\x00_\x89i\xaf\
+b\x92z\xda\xdb\x9f\x86\x9f\xf0C\xabI/\x7f\xe0\xae\
+\xff\x00\xf0O[x\xfe\xf7\xfc4\xc7\x80\xee:\xe3\xe4\
+\xb1\x96\xea\xfa^\x7f\xeb\x95\xb3\x9f~\x9c\xe7\x07\xfbi\
+\xff\x00\x83\xae\xbf\xe0\xac?\x16\xbfc?\x85\xff\x00\x0a\
+?do\xd9\x9f\xc6\xfa\xaf\xc3\xaf\x8b\x9f\xb4n\x95\xe2\
+/\x18|I\xf1\xff\x00\x86&\xbc\xd3<c\xe0\xdf\x83\
+\x9a-\xec:\x0e\x9f\xa7\xf8g\xc4\x10\x98e\xd0\xf5?\
+\x88\xbe#m^\xc0\xebz<\xc7W\xd2\xf4\x7f\x08k\
+\x96i&\x9a\xfa\xed\x95\xd3\xff\x00,\xdf\xf0kW\xec\
+\xff\x00}\xf1\xbf\xfe\x0b\x09\xf03\xc4\xaf\xa6}\xbb\xc2\
+\xff\x00\xb3\xcf\x85\xbe%\xfcp\xf1T\xb2\x1b\xb8\xa3\xb3\
+m+\xc1\xda\x87\x83|\x17<s\xdb\xa3\xc4.b\xf8\
+\x87\xe3\x7f\x09]\xa4\x17RC\x14\xf6\xb6W\xe3\xf7\x8f\
+\x10\x86O\xba\x7f\xe0\xf3\xfd/V\x87\xfe\x0a\x0b\xfb8\
+kW\x11\xce4}W\xf6L\xd3,\xf4\xc9\xde9E\
+\xbb\xddi?\x15~$\xb6\xabm\x0c\xa5D-qm\
+\xfd\xa5\xa7\xc9q\x00s$\x10\xdfZ4\x88\xbeze\
+=g\xdd]~\x84B\xf1\xa0\xf4\xd7O>\x91?\x04\
+\xff\x00\xe0\x98_\xf0Mo\x8e\xff\x00\xf0U\x9f\xdan\
+\x1f\x80_\x07\xef\xf4\xaf\x0f\xc5g\xa2\xde\xf8\xeb\xe2\xaf\
+\xc5/\x17%\xf5\xe7\x87\xfc\x01\xe0\x8bmB\xd2\xc6\xfb\
+]\xd4\xa1\xb6\xdf}\xe2\x1dwS\xd5u;=3\xc3\
+\x9e\x1d\x86X.5\xbdf\xee7\xbb\xd4\xb4}\x22\xdb\
+Y\xd74\xef\xe9?\xfe\x0a\x91\xff\x00\x06\xe3~\xca\x1f\
+\xf0K\x8f\xf8$\xe7\xc7\x7f\xda\x16\xdb\xe2\x1f\xc4\x7f\x8f\
+\x7f\xb4\xae\x8d\xaf|\x19\xf0\xfe\x99\xe3\xdf\x14\xfd\x83\xc1\
+\xfe\x07\xf0\xb5\xbf\x8a\xfe6\xf8/H\xd6\xa5\xf0g\xc3\
+}\x09\xae\xe4\x8a\xea\xfb\xc3w\xf3\xe8W\xd7^/\xf1\
+o\x8db\x91no\xae\xf4\xdb}&k\xa5\x86\xd7\xc9\
+?\xe0\xce\xaf\xda\xb3\xe0o\xc0\xcf\xda\x97\xf6\xa1\xf8C\
+\xf1s\xc7^\x1b\xf8{\xe2\x1f\x8f\x9f\x0c\xbe\x1f\xcb\xf0\
+\xc7V\xf1\x86\xb5\xa5x{B\xf1\x06\xbb\xf0\xe3\xc4~\
+ :\xaf\x82\xec\xf5=V\xf2\xd2'\xf1V\xab\xa7\xf8\
+\xda=_C\xd2\xd5\x83jv^\x1f\xd6\xd2\x16{\xcb\
+{Kk\x8f\xd4\xaf\xf8;'\xfe\x0a\x8b\xfb2j\x7f\
+\xb1\xd7\xfc0g\xc2\x1f\x8a\x9e\x06\xf8\xb3\xf1\x93\xe2\x97\
+\xc4o\x06k\x7f\x12\xb4\xef\x01x\x83J\xf1u\x87\xc2\
+\xff\x00\x04\xfc5\xd7`\xf1jG\xe2\xbd[A\xd4\xae\
+,\xb4O\x17x\x83\xc5z_\x87\xadt\xbf\x0d\xcf4\
+\xba\xbah\x90k\x97\xda\xa5\x8e\x9b\x14\xba<\xd7\xd5\xaf\
+5\x96\xdf\x86\xcb\xfa\xff\x00\x87\x1cc\x1eK\xd9_G\
+}<\xaf\xd7\xfa\xba\xb1\xfcS\xff\x00\xc1%\xbf\xe5)\
+\x9f\xf0N\x01\xe9\xfbu~\xcaC\xdf\xe5\xf8\xe9\xe0|\
+d\xf7<rz\x9a\xfe\xc6\xff\x00\xe0\xf78f?\x0c\
+?\xe0\x9e\xf7\x02\x19\x1a\xde\x1f\x1e~\xd0\xf0\xcb2\xa3\
+yi5\xc7\x87~\x13\xbc14\x98*\xb2K\x1d\xb5\
+\xc3\xc6\x87\xe7u\x86WU1\xc5+\xc7\xfcq\x7f\xc1\
+%\xd8/\xfc\x15/\xfe\x09\xbe[\x8c\xfe\xdd\x7f\xb2\x82\
+\xfa\xf2\xdf\x1d<\x0c\x00\x1f\x89\x00\x008\xe0\x01\x8a\xff\
+\x00B/\xf8;\xd3\xf6\x7f\xd4\xfe/\xff\x00\xc1+\xed\
+>%\xe8VR\x5cj?\xb3G\xc7\xef\x87\x7f\x13\xf5\
+g\xb7\xb2[\xab\xb1\xe0\xef\x12\xd8x\x93\xe1&\xb7\x00\
+\x94\xdcFm\xac\x93Y\xf8\x81\xe1mn\xf6d\x82\xec\
+\x84\xd0\xa32\xc7\x0d\xb8\x9a\xea\x01\xbbM_\xb7\xf9\x84\
+\x15\xe9I-[\xbf\xdf\xa7\xe8\x7f\x1a\xdf\xf0k\xcc\xe9\
+\x0f\xfc\x17\x0b\xf63\xdeq\xe6\xd8\xfe\xd21\xaf\x07\x96\
+\xff\x00\x86T\xf8\xdd&\x07\xb9\x11\x9cg\x8a\xff\x00Z\
+\xff\x00\x11x\x83I\xf0\x97\x875\xdf\x15x\x82\xf1t\
+\xfd\x0b\xc3:.\xa7\xaf\xebw\xed\x0d\xc5\xca\xd8\xe9:\
+5\x8c\xfa\x8e\xa5vm\xed#\x9a\xea\xe0[Y\xdbM\
+1\x82\xda\x19n%\xd9\xe5\xc3\x1b\xc8\xca\xa7\xfcX?\
+\xe0\x93\x9f\xb5\x17\x87?c\x0f\xf8(\xe7\xec\x89\xfbJ\
+x\xcfQ\x97H\xf07\xc3\x8f\x8b\xbaR\xf8\xff\x00W\
+\x82\xde{\xc9t\x8f\x00x\xc6\xc3Q\xf0\x0f\x8e\xf5A\
+eimyy|\xbag\x84\xbcS\xac\xdf\xcdec\
+kq\x7fuoo,\x16\x11\xb5\xeb\xc0+\xfd??\
+\xe0\xab_\xf0U\xcf\xd9\x1f\xf6x\xff\x00\x82m|v\
+\xf8\xb7\xe1o\xda\x03\xe1'\x8f\xfcI\xf1g\xe0\xc7\x8e\
+|\x15\xfb;\xe8\xde\x02\xf1\xff\x00\x84\xfce\x7f\xf1\x0f\
+\xc7~=\xf0\xdd\xf7\x85\xbc5\xa8h6\x1a&\xb7=\
+\xd6\xa5\xe1\xaf\x0djZ\xcd\xbe\xbd\xe3\x1dV\x12\x90\xe9\
+\x1a\x1e\x95\x7f\xe7\xca\x9a\x9c\xb6\x16Ws$\xdc\xb6\xdf\
+\xfc\x97\xdd\xf3*\x8b\xb55{]t\xd3~\xdd\xbfC\
+\x19\x7f\xe0\xe5\x8f\xf8\x229\x1b\xcf\xed\xd1\xa0(\x7f\x99\
+\x7f\xe2\xca\xfe\xd2\xeav\xf4\xf9\x94\xfc\x18%[ \xf0\
+\xd8,\xbb\x5c\x0d\x8e\xac\xdf\x85\x1f\xf0ye\xe6\x91\xf1\
+g\xf6A\xff\x00\x82r\xfe\xd0^\x04\xd4\x7f\xb7>\x1b\
+\xeb\x7f\x10<o?\x87u\xc5\xb4\xbe\xb0M[H\xf8\
+\xb9\xf0\xbf\xc2\xfe3\xf0\x86\xa4,u[{\x1dN\xd0\
+jZ'\x83/.\xd2\xd6\xfe\xc2\xd2\xf6\xd9]\xa2\xbc\
+\xb7\xb7\x9c\x18\xeb\xf8\x11\xf0\x17\x81\xbc[\xf1;\xc7\x1e\
+\x0c\xf8i\xe0=\x1a\xeb\xc4\x9e7\xf1\xf7\x89\xbc?\xe0\
+\xbf\x08\xf8z\xc9\xe1\x17\x9a\xdf\x89|M\xa9Y\xe8\xda\
+\x1e\x93h\xd7\x0f\x04)q\xa8jw\x96\xd6q=\xcc\
+\x90@\x92N\xaf<\xb1B\xaf\x22\x7f\xa5\xb7\xfc\x1c\xf5\
+\xfb\x1a\xf8\x8d\xbf\xe0\x88\x7f\x09t\x7f\x0b@\xfe)\x7f\
+\xd8s\xc5\x1f\x00\xf5\x7f\x11\xde\xd8\xc6\xd0;\xf8+C\
+\xf06\xa3\xf0'[\xf1%\xae\x96\x82[\x99`\xb7\xbf\
+\xf1v\x85\xa9\xdf\xdb\xa7\x9a\xdaN\x845=^\xeeE\
+\xb3\xd2.\xee\x02ZI_MV\xff\x00\xd7\xfc0\x9c\
+\x9dHO\xdd\xdb\xb3\xde\xcd?\xf8?\x82\xb9\xfc-\xff\
+\x00\xc1\x1c\x7fb\x7f\x85\xff\x00\xf0P\xef\xf8(G\xc1\
+\x1f\xd9/\xe3/\x89|w\xe1\x1f\x87\xbf\x13->#\
+O\xac\xeb\xbf\x0du\x0f\x0fi^2\xb5\x97\xc1\xff\x00\
+\x0e<U\xe3\x0d6=&\xfb\xc5>\x1a\xf1~\x87\x17\
+\xdau=\x12\xce\x0b\xd5\xbc\xd0/\x19\xec\x1e\xe28\x0d\
+\xbd\xc4\xd0\x5cA\xfd\xc7\x7f\xc4\x17\x1f\xf0M\x0f\xfa8\
+\x7f\xdb\xa3\xff\x00\x0b\xdf\x80?\xfd\x0e5\xfc&\x7f\xc1\
+$\xff\x00j\xcf\x0d~\xc4\x7f\xf0Q\xcf\xd93\xf6\x96\
+\xf1\xccw-\xe0O\x87\xff\x00\x13\xed-<\x7f=\xa4\
+\x8e\x93\xe9^\x07\xf1\xb6\x91\xabx\x0b\xc5~ \x868\
+U\xcd\xf9\xf0\xb6\x87\xe2\x9b\xff\x00\x12\xa6\x96\xa1F\xad\
+\xfd\x964\xc14\x22\xe1n\x13\xfd9?\xe0\xac\xbf\xf0\
+V\xaf\xd9/\xf6l\xff\x00\x82t|f\xf8\xad\xe0\xcf\
+\xda+\xe1W\x8d\xbck\xf1o\xe1\x07\x8a\xfc%\xfb8\
+\xe8\x9f\x0d~\x22x[\xc5\x1e$\xf1\xef\x8c|{\xa0\
+\xdc\xf8k\xc3\xfe!\xf0\xb5\xbe\x85\xaa\xde\xdc7\x87\xfc\
+!6\xae\x9e,\xf1\x1f\x89B\x1d;D\xb0\xd2d\x82\
+I\xa4\xd5\xef4\x9d'S\xa9I\xdf\xddzzu\xfb\
+\xbc\xd14\xa3\x09G\xdeI\xbek+\xef\xb2\xfdO\xcc\
+\xef\xf8\x82\xe3\xfe\x09\xa1\xff\x00G\x0f\xfbt\x7f\xe1{\
+\xf0\x07\xff\x00\xa1\xc6\x93\xfe \xb7\xff\x00\x82g\xff\x00\
+\xd1\xc2\xfe\xdc\xff\x00\xf8^|\x01\xff\x00\xe8p\xaf\xf3\
+\x7f\xf81\xf0\xbf\xc4\xff\x00\x1b\xbe/|-\xf87\xe0\
+\x9d.\xeb[\xf1\x87\xc5o\x88~\x0d\xf8u\xe1\x8d\x22\
+\xcd\xa2\x8e\xe3Q\xd7|e\xe2\x1d?\xc3\xfam\xaaK\
+p\xd1\xdb\xc0%\xb9\xbf\x8c5\xcd\xcc\x91Z\xdb.g\
+\xb9\x9a\x18#\x92U\xff\x00h\x9f\xf8b\xef\x09\xff\x00\
+\xd0\xc5\xa9~C\xff\x00\x8d\xd3m\xa7\xf1~\x0b\xba\xff\
+\x00;\xfc\x8b\x8a\x84\xafh-4\xeb\xddy|\xcf\xf1\
++\xa2\x8a*\xceP\xa2\x8a(\x00\xa2\x8a(\x00\xa2\x8a\
+(\x00\xa2\x8a(\x03\xf6\xef\xfe\x08\x13\xff\x00\x05(\xf8\
+#\xff\x00\x04\xaf\xfd\xb5|a\xfbH|{\xf0\xaf\xc4\
+\xdf\x18x3\xc4?\xb3\xbf\x8e~\x12Y\xe9\x7f\x0a4\
+\x9f\x0dk>&\x8b\xc4^%\xf1\xdf\xc2\xdf\x13\xd8\xde\
+\xdcZ\xf8\xab\xc5\xde\x0d\xd2\xd3GK\x0f\x05j\x91]\
+\xce5I\xef\x12\xea[\x08\xe1\xb0h\xda[\x94\xfe\xc6\
+?\xe23\xcf\xf8&\x87\xfd\x10\xaf\xdb_\xff\x00\x08/\
+\x82\x9f\xfc\xfe\xab\xfc\xcb(\xa9qM\xdf_\xeb\xe4k\
+\x1a\xd2\x8aJ\xc9\xdb\xd7\xfa\xee\x7f\xa6\x9f\xfcFy\xff\
+\x00\x04\xd0\xff\x00\xa2\x15\xfbk\xff\x00\xe1\x05\xf0S\xff\
+\x00\x9f\xd5\x1f\xf1\x19\xe7\xfc\x13C\xfe\x88W\xed\xaf\xff\
+\x00\x84\x17\xc1O\xfe\x7fU\xfee\x94R\xe4^\x7f\xd7\
+\xc8\xafo.\xcb\xf1\xff\x00?_\xe9k\xfd\x87\x7f\xc1\
+\x7f\x7f\xe0\xe0\xbf\xd8\xfb\xfe\x0a\xad\xfb\x18x\x0f\xf6u\
+\xf8\x07\xf0\xd7\xf6\x89\xf0\x7f\x8c\xfc-\xfbHx'\xe3\
+\x05\xee\xa7\xf1c\xc2\xff\x00\x0e\xf4\x7f\x0d\xcb\xe1\xdf\x0d\
+\xfc:\xf8\xb7\xe0\xfb\xebKk\xaf\x09\xfcN\xf1\x8e\xa5\
+&\xb1&\xa1\xe3\xfd&{[i4\xb8,\xde\xce\xd7\
+Q\x92[\xf8\xa7\x8a\xd6\xde\xef\xf8\xf1\xa2\x8a\xa5\x1e]\
+\xaf\xa9\x94\xa6\xe6\xee\xd2\xf9|\xbf\xc8(\xa2\x8ad\x86\
+q\xcf\xf9\xf4\xfeU\xfa\x13\xff\x00\x04\xef\xff\x00\x82\x9e\
+\xfe\xd6\xdf\xf0L/\x8a\x97?\x13\x7fe\xff\x00\x1cE\
+\xa7Y\xf8\x80X[\xfcC\xf8c\xe2\x9bY\xb5\xdf\x86\
+?\x134\xcd0\xdc}\x8a\xcb\xc5\xbe\x1c\xfb]\xa3-\
+\xde\x9c.\xa6:/\x88\xf4;\xed#\xc4\xfa7\x9bu\
+m\xa7j\xb0i\xfa\x86\xa3i{\xf9\xedE\x1b\xee\x86\
+\x9bN\xea\xe9\xf9\x1f\xe8\xa7\xf0+\xfe\x0fU\xfd\x9bu\
+O\x0d\xe9i\xfbJ\xfe\xc8_\x1a\xbc\x13\xe3\x18\xb4\xff\
+\x00/\x5c\xb8\xf8+\xe2/\x04\xfcI\xf0\xb6\xa1\xaa@\
+\x90\xc6ot\x9bo\x1a\xea\xbf\x0c5\x8d\x22\xcbT\x97\
+\xed\x17k\xa5^\x5ck\x93\xe8\x91<6\x0d\xadk\xcf\
+\x1c\x9a\x8b\xfb\xf8\xff\x00\x83\xce\xff\x00\xe0\x99\xe3\xa7\xc0\
+\x9f\xdb\x5c\x7f\xdc\x85\xf0S\xff\x00\x9f\xd5\x7f\x99m\x15\
+.\x09\xf7^\x9f\xf0\xc6\x8a\xac\xd5\xb5\xbd\xbc\xb7?\xd3\
+O\xfe#<\xff\x00\x82h\x7f\xd1\x0a\xfd\xb5\xff\x00\xf0\
+\x82\xf8)\xff\x00\xcf\xea\x8f\xf8\x8c\xf3\xfe\x09\xa1\xff\x00\
+D+\xf6\xd7\xff\x00\xc2\x0b\xe0\xa7\xff\x00?\xaa\xff\x00\
+2\xca)r/?\xeb\xe4W\xb7\x97e\xf8\xff\x00\x9f\
+\xaf\xf4\xb5\xff\x00M?\xf8\x8c\xf3\xfe\x09\xa1\xff\x00D\
++\xf6\xd7\xff\x00\xc2\x0b\xe0\xa7\xff\x00?\xaa\xfcS\xff\
+\x00\x82\xf4\xff\x00\xc1\xc3\xbf\xb1\xcf\xfc\x15#\xf6\x22\xd1\
+\xbff\xcf\x80\xdf\x0d?h\xcf\x08\xf8\xdfN\xf8\xed\xe0\
+/\x89\xf2\xea\x9f\x15\xbc-\xf0\xe7G\xf0\xcbh^\x17\
+\xf0\xe7\x8f4}B\xd2+\xbf\x0a|Q\xf1v\xa4\xda\
+\xac\xf7\x1e'\xb1kH\x1fI[6\x86+\x97\x9a\xf6\
+\x16DG\xfe6(\xa6\xa2\x93\xbe\xbf\xd7\xc8\x99U\x94\
+\x93\x8bJ\xcf\xd7\xcb\xcf\xb9\xfd\xf6\x7f\xc13\xff\x00\xe0\
+\xea\x1f\xd8'\xf63\xfd\x83?e\xef\xd9o\xe2W\xc1\
+\xff\x00\xda\xbf]\xf1\xdf\xc1/\x86\x1ao\x82|O\xab\
+\xf8+\xc1\xdf\x0a5\x0f\x0aj\x1a\x9d\xa5\xf6\xa1u%\
+\xc6\x83{\xad\xfcb\xd05{\x8d=\x92\xee5\x89\xf5\
+\x0d\x1bN\xb9\x0c\xae\xafn\x02\x86o\xb9\xff\x00\xe23\
+\xcf\xf8&\x87\xfd\x10\xaf\xdb_\xff\x00\x08/\x82\x9f\xfc\
+\xfe\xab\xfc\xcb(\xa5\xc8\xbc\xff\x00\xaf\x90\xfd\xbc\x97\xd9\
+_\x8f\x97\x9f\xaf\xf4\xb5\xff\x00M#\xff\x00\x07\x9d\xff\
+\x00\xc14\x08\xc7\xfc(\xaf\xdb_\xff\x00\x08/\x82\x9e\
+\xbf\xf6^z\xfat\xff\x00y~\xf0\xff\x00;\xbf\xdb\
+\x0f\xe2\xf7\x86\xff\x00h\x1f\xda\xcf\xf6\x9a\xf8\xed\xe0\xeb\
+-gN\xf0\x97\xc6_\x8f\x9f\x17>(\xf8b\xc3\xc4\
+V\xf6\x96\x9a\xfd\x9f\x87\xfcy\xe3\xcd{\xc4\xfa=\xae\
+\xb5ka\x7f\xaaX\xdbj\xb0i\xfa\x9d\xbcW\xf0Y\
+\xea7\xd6\xd1]$\xa9\x05\xdd\xc4af\x7f\x9ch\xa6\
+\xa2\x93\xbe\xa4\xca\xac\xa6\xac\xd2\xf9\x5c>\xa0\x9fLp\
+\x7f_l\xd7\xf7\x85\xff\x00\x04f\xff\x00\x83\x94?\xe0\
+\x9f\x7f\xb0\x1f\xfc\x13\xb7\xe0?\xec\xad\xf1\xbf\xc3\x1f\xb4\
+\xae\xa5\xf1+\xe1\xb3\xfc@o\x10\xddx\x03\xe1\xc7\x82\
+\xb5\xdf\x0aK\xff\x00\x09G\xc4_\x14x\xa7N\x1af\
+\xa9\xac|P\xf0\xee\xa1q\xb3L\xd6,\xc5\xd1\x97H\
+\xb6\xf2\xef\x0c\xf1E\xe6\xc5\x10\x91\xff\x00\x83\xda)\xb5\
+}\x18\xa17\x07t\x97mO\xf5\x0a\xff\x00\x88\xc6\xbf\
+\xe0\x94\x1f\xf4#\xfe\xd8\xdf\xf8h\xfe\x1d\x7f\xf3\xea\xa4\
+?\xf0x\xd7\xfc\x12\x8b\x1f/\x82\x7fl`\x7f\xec\x91\
+\xfc:\xe9\xc9\xff\x00\xa2\xd61\xd0t\xc9\xed\x8c\x12G\
+\xf9{QS\xc8\xbc\xff\x00\xaf\x91\xa7\xb7\x97e\xf8\xff\
+\x00\x9f\xaf\xf4\xb5\xfa\x17\xf6\xb5\xf8\xa1\xe1\xaf\x8e?\xb5\
+G\xed\x1d\xf1\x97\xc2\x11jpxG\xe2\xbf\xc7/\x8a\
+\x1f\x11|5\x0e\xbbk\x0d\x96\xb1\x17\x87\xfcc\xe3]\
+c_\xd2\xa3\xd5\xec\xec\xee\xaf\xa0\xb4\xd4SO\xbe\x85\
+om\xed/oc\x86q$p]\x5c\x85Y_\xfa\
+\xef\xff\x00\x82a\x7f\xc1\xd9\xbe\x09\xfd\x91\xbfc\x0f\x84\
+\xbf\xb3_\xed=\xf0/\xe3\x17\xc6o\x1e|\x1c\xb0\xb8\
+\xf0N\x81\xf1\x07\xc1\x1a\xe7\x82\xadl\xf5?\x86\xfaT\
+\xaa\x9e\x05\xd3uX\xbcC}gz\xda\xc7\x86tV\
+\x8f\xc3-p\xa2x\xee\xf4\xcd'L\xba\x96\xe2[\xd9\
+\xae\x95?\x88\xba*\xac\xac\x95\xafc8\xd4\x94\x5c\x9a\
+\xfb[\xefm\x92\xef\xe5\xd6\xe7\xfa:\xff\x00\xc4k_\
+\xb1\xe7\xfd\x19\xcf\xed+\xff\x00\x85'\xc2\xef\xfe^P\
+\x7f\xe0\xf5\xbf\xd8\xf4\xae\xdf\xf8c\x9f\xdaT\x8e\x98>\
+#\xf8[\x8f\xc7\xfe'}=pA\xf4 \xe0\x8f\xf3\
+\x8a\xa2\xa7\x91y\xff\x00_\x22\xbd\xb4\xfb\xaf\xb9\x7f_\
+\xd7\xc8\xfd\xdd\xfd\xbf\xff\x00\xe0\xad\xde\x10\xf8\x89\xff\x00\
+\x05\x11\xd3?\xe0\xa3\x7f\xf0M\x0d'\xe3G\xec]\xf1\
+\x7f]\xf0\xec)\xf1U/\xaf\xfc!qg\xe2\x8f\x1c\
+\xc0\xa3M\xbc\xf1?\xf6f\x91s\xac\xf8w]\xd2\xfc\
+]\xe1\xc8\xf4\xdb?\x1ax[\xc5\x1a=\xde\x8b\xabj\
+\xba0\xd6.-o\xaf\xf5\x1b\x99\xab\xf6\xb3\xf6]\xff\
+\x00\x83\xd4>1xgF\xb2\xd0?l\x0f\xd9\x1b\xc2\
+\xbf\x15\xb5\x08R\xd2\x19>#\xfc\x13\xf1\xbc\xff\x00\x0c\
+\xb59\x22\xb7\xb7\xd9uq\xaa|;\xf16\x8b\xe3\x1d\
+\x0fW\xd5u\x0b\x9cN\xf3\xe9\x1e/\xf0^\x95f\x9e\
+dV\xfa;\x83\x1e\xdf\xe1\xda\x8a|\xaa\xd6\xb7\xcf\xa8\
+\xbd\xac\xef}\x0f\xf4s\x1f\xf0z\xd7\xec}\x81\x9f\xd8\
+\xdf\xf6\x95\x07\xbe<K\xf0\xb8\x81\xed\x9f\xed\xb0N:\
+gh\xcf\x5c\x0aw\xfcF\xb5\xfb\x1e\x7f\xd1\x9c\xfe\xd2\
+\xbf\xf8R|.\xff\x00\xe5\xe5\x7f\x9cU\x14\xb9\x17\x9f\
+\xf5\xf2\x1f\xb5\x9fu\xf7/\xeb\xfe\x1f\xd2\xdf\xe8\xeb\xff\
+\x00\x11\xad~\xc7\x9f\xf4g?\xb4\xaf\xfe\x14\x9f\x0b\xbf\
+\xf9yG\xfcF\xb3\xfb\x1e\xff\x00\xd1\x9c\xfe\xd2\xbe\x9c\
+\xf8\x93\xe1x\x1f\x89\x1a\xdb`z\x9d\xa7\x03\x9c\x1e\x95\
+\xfeqTQ\xc8\xbc\xff\x00\xaf\x90{Y\xf7\xfc\x17\xf5\
+\xff\x00\x0f\xe9o\xdd\xcf\xda\xe3\xfe\x0a\xcb\xf0\xbf\xf6\x8b\
+\xff\x00\x82\xd5|;\xff\x00\x82\xa0\xe8\x1f\x0b\xbcy\xe1\
+\xef\x86\xde\x0c\xf8\x85\xfb8x\xc6\xf3\xe1\xae\xaf}\xe1\
+\xf9|swi\xf0_E\xf0\x96\x9d\xadZ\xdb_Y\
+\xdd\xcb\xa0\xa4\xfa\xb4\xbe\x1f\xba:a\x96\xe1\xd28g\
+\x8f\xed-\x14\xa0W\xf53\xff\x00\x11\xad~\xc7\xbf\xf4\
+g?\xb4\xaf\xfe\x14\x9f\x0b\xbf\xf9y_\xe7\x15E\x1c\
+\x8b\xcf\xfa\xf9\x07\xb5\x9f}\xfc\x97\x97\xf9~g\xfa;\
+\x0f\xf8=k\xf6=\x07?\xf0\xc7?\xb4\xaf\xfe\x14\x9f\
+\x0b\xbf\xf9w_\x99\xff\x00\xf0W\xbf\xf89\xdf\xf6s\
+\xff\x00\x82\x8e\xfe\xc0\xff\x00\x18\xff\x00dO\x87\xff\x00\
+\xb3w\xc6\xef\x87\xde)\xf8\x97\x7f\xf0\xe6\xf3O\xf1_\
+\x8c5\xbf\x01]\xe8\x1ah\xf0O\xc4\x7f\x0a\xf8\xda\xed\
+o-\xf4}R\xe6\xfd\x8d\xe5\x9e\x81qena\x85\
+\xf6\xdc\xdcB\xf2l\x89\x1c\x9f\xe2\xe6\x8a9\x17\x9f\xf5\
+\xf2\x17\xb5\x9b\xdd\xa7\xf2\xff\x00 \xa3\xb1\xff\x00u\xbf\
+\xf4\x13E\x1d\x8f\xfb\xad\xff\x00\xa0\x9a\xb33\xfdL\xbf\
+\xe0\xd0\x1f\xf9D\x5c\x7f\xf6s_\x1a\xff\x00\xf4_\x84\
+\xab\xfa\x94n\x9f\x9f\xfe\x82k\xf9k\xff\x00\x83@\x7f\
+\xe5\x11q\xff\x00\xd9\xcd|k\xff\x00\xd1~\x12\xaf\xea\
+Q\xfa~\x7f\xc8\xd63\xf8\x9f\xcb\xf2Gw\xd8\xff\x00\
+\xb7\x7fC\xf2W\xf6\xdd\xe7\xe2\xdd\x80\xf5\xf0^\x9b\xff\
+\x00\xa7\x0dj\xbd\xe7\xf6\x10\xff\x00\x917\xc6\x7f\xf63\
+\xdb\x7f\xe9\xae\xda\xbc\x1b\xf6\xdd\xff\x00\x92\xb7a\xff\x00\
+b^\x9b\xff\x00\xa7\x0dj\xbd\xe7\xf6\x10\xff\x00\x917\
+\xc6\x7f\xf63\xdb\x7f\xe9\xae\xda\xbf\xc7\x7f\x0b\xbf\xe5d\
+\x5cq\xa7\xfc\xccx\xcb^\xff\x00\xf0\x8bL\xfe\xbf\xe2\
+\xaf\xf9F\xce\x1e\xf4\xca\x7f\xf5:\xb1\xf7e\xc7\x99\xe5\
+9\x89\x1aG\x0a\xe5QYT\xb9\x08\xdbWs\x90\x17\
+saCg\x00\x90X\x15\xdc\xa7\xfc\xc6\xff\x00l_\
+\xf86\xe3\xfe\x0bW\xfbT\xfe\xd5\xbf\xb4g\xed!\xa8\
+\xfc\x1c\xf8`%\xf8\xd7\xf1\x9f\xe2\x17\xc4[8/\xfe\
+=|.\x8a\xfa\xc7F\xf1'\x89u\x0dC\xc3\xdam\
+\xd2Z\xea\x8bj\xb7:V\x86\xfaf\x9f7\x93\x98\xa4\
+\x96\xd1\x9f,\x1c\xb9\xff\x00N\xba+\xfd\x87M\xadQ\
+\xfc\x81(\xa9+>\xf7?\x9d\x0f\xf86\xdf\xfe\x09}\
+\xf1\xd3\xfe\x09\x8f\xfb%\xfc`\xf0W\xed7\xe1\xbf\x0f\
+\xf8s\xe3?\xc5_\x8ew\xbe.\xbd\xb2\xf0\xcf\x8ct\
+\xef\x19\xe9\xdf\xf0\x82\xe8~\x0f\xf0\xd6\x85\xe0\xfd\xfa\x8e\
+\x8e\xcf\xa7\xc3}\xfd\xa5\xff\x00\x09l\xf2\xdb\xc33\xcc\
+m\xae,\xa4\xb8\x10\xccZ\xde?\xe8\xbe\x8a(n\xee\
+\xe3J\xc9%\xb2\xd0\xfeF?\xe0\xe6o\xf8\x22\xc7\xed\
+K\xff\x00\x052\xf1\x9f\xec\xb5\xf1[\xf6A\xf0\xbf\x82\
+\xfcI\xe3?\x86\xfe\x1d\xf8\x89\xe0/\x89V^&\xf1\
+V\x81\xe0\x8b\x8b\x8f\x0d\xea\xba\x87\x87u\xff\x00\x05\xdd\
+\xc5\xad\xeb\xda\x95\xacW\xf1iZ\x94^+\xb7M2\
+\x0bI\xa4\x85\xb5\x99.\x9ax\xd5\xb6?\xe5\xaf\xfc\x11\
+\x7f\xfe\x08)\xff\x00\x05t\xff\x00\x82|\x7f\xc1G\x7f\
+g\xbf\xda_\xe2\x17\xc2\x8f\x86\xf6\x9f\x0b<?\x7f\xe2\
+\x9f\x0a\xfcV}#\xe3\x9f\x825+\xc5\xf0\x07\x8e|\
+'\xacxoV\xba\x8fH\xd2\xf5\x16\xbc\xd6\xa4\xd2/\
+ot\xbd~\xd7JD\x90\x5c\xdf\xe8\xf6\x8d\xb5Z%\
+a\xfe\x864Q}-\xe7ry#\xcd\xcdk\xbf\xe9\
+\x9f\xcfG\xfc\x17W\xfe\x08Q\xe0\xff\x00\xf8+W\x81\
+\xfc5\xe3\x9f\x02x\x9bC\xf8W\xfbZ|+\xd2.\
+\xb4_\x01x\xeb^\xb5\xbf\x93\xc1\xde2\xf0\xad\xc5\xdc\
+\x9a\x9c\xbf\x0f>#\x0d%.\xb5;]&-J\xe2\
+\xf3R\xf0\xff\x00\x89\xb4\xbd;V\xd4\xfc5\xa9__\
+\x85\xd3u=;R\xbe\xb5o\xe0\x1f\xe2\xaf\xfc\x1b\x9d\
+\xff\x00\x05\x92\xf8Q\xae\xea\x1a-\xe7\xecW\xe3\x7f\x1c\
+\xdaY\xde=\xad\xbf\x88\xbe\x15\xf8\x87\xc0\xdf\x10\xf4-\
+V?\xbd\x15\xed\x83h>#\x97Y[9\x13d\x88\
+\xda\xbe\x8f\xa6\x5cE\xb8G{eeu\x08\xb7\x1f\xec\
+\x1fM\xd8>\x9dx\x1c\x0e~\x98\xe7\xbez\xfb\xd0\x9b\
+[\x0eP\x8c\xedu\xb7m/\xea\x7f\x93\x97\xec\xa5\xff\
+\x00\x06\xb4\xff\x00\xc1W\xff\x00h\x8f\x1a\xe9\x1a_\xc4\
+\x9f\x84zo\xec\xad\xf0\xf6Y`\x97^\xf8\x8d\xf1\x93\
+\xc4\x9e\x1a\xb8\xb9\xd3t\xe7!\xe7:/\xc3\xdf\x08k\
+\x9a\xdf\x8b\xf5\xfdp\xc3\xe6\xad\xa6\x99}i\xe1\xdd1\
+\xa7A\x16\xa9\xe2-\x19e\x8e\xe0\x7f\xa5\xdf\xfc\x13\xfb\
+\xf6\x1b\xf8A\xff\x00\x04\xec\xfd\x97\xbe\x1c\xfe\xcb\x7f\x05\
+l\xe5>\x1b\xf0U\xad\xc5\xee\xbf\xe2\x8dB\xda\xce\x0f\
+\x10|B\xf1\xc6\xb0c\x97\xc5\x1e<\xf1;Y\xe29\
+u\x8dr\xea\x18\x91\x22\x0d,z^\x8dg\xa4h\x96\
+\x92\xfd\x87K\xb6E\xfbL(\x5c\xe0\x01\x93\x93\x81\xf4\
+\xff\x00\x0aZ\x1bop\x8c\x14\x15\x97\xde\xed\x7f\xbd$\
+\x7f\x9e\xb7\xfc\x16\xcb\xfe\x0d\xe6\xff\x00\x82\x9b\xfe\xdb\x9f\
+\xf0S\x8f\xdak\xf6\x9d\xf8\x01\xf0\xcb\xe1\xee\xbb\xf0\x97\
+\xe2u\xe7\xc2\xf9|%\xab\xeb\x9f\x18<\x0f\xe1\x9dN\
+\xee?\x0b|\x17\xf8s\xe0\xad\x5c\xdehZ\xbd\xf4:\
+\x85\x88\x8b]\xf0\xe6\xad\x04\x22dW\x9e\x18\xe2\xb9P\
+!\x9237\xed/\xfc\x1b1\xff\x00\x04\xbc\xfd\xaf\xbf\
+\xe0\x99\x1f\x0b?j\xef\x0a\xfe\xd6\x9e\x12\xf0\xc7\x84\xf5\
+\x8f\x8b\x1f\x10~\x1b\xf8\x8b\xc1\x90x_\xc7>\x1e\xf1\
+\xbc7zg\x86\xbc3\xe2\x0d7U\x96\xf2\xe3@\xb8\
+\xb8\x8e\xc6X\xef5\x1bd\x8a\x19\xd9e\x99K\xc8\x8a\
+U2?\xa8J)\xb96\xad\xa6\x80\xa0\x94\x9c\xd5\xee\
+\xfb\xda\xdd<\xbc\x84#=k\xf9\x97\xff\x00\x82\xf7\xff\
+\x00\xc1\xbfZG\xfc\x15I<;\xf1\xdf\xe0O\x89\xfc\
+/\xf0\xaf\xf6\xb8\xf0\x16\x80|1&\xa1\xe2\xc8.\xe2\
+\xf0\x17\xc6_\x03\xd9\xad\xf5\xde\x8f\xe1/\x1a_\xe9\x16\
+\x9a\x96\xa9\xe1\xfd\x7f\xc3\x9a\x95\xd4\xcf\xe1o\x19\xda\xe9\
+Z\xca\xc3\xa7\xdf\xdfh\x1a\xce\x8f{ft]K\xc3\
+?\xd3M\x15#j\xea\xcfc\xfcv\xbe \x7f\xc1\xbc\
+_\xf0Y_\x87\x1a\xb5\xc6\x8f\xa9~\xc3?\x13|F\
+\xb0\x5c5\xac:\x9f\x805\x9f\x00|@\xd2n\x95U\
+\x7f{k{\xe1?\x16\xealmX7\xfa\xfb\xab{\
+0\xd2\x17S\x1a\xb2\x91_V~\xc9\x1f\xf0j\xcf\xfc\
+\x15[\xf6\x86\xf1\x9e\x95g\xf1o\xe1\xae\x8b\xfb(|\
+6\xfbM\xa4\xbe \xf1\xd7\xc5\xcf\x12\xf8sS\xd6\xa2\
+\xd2\xdaXZ\xe9<3\xf0\xfb\xc1\x1a\xe6\xbd\xe2=k\
+^kI$kKMu\xfc'\xa3\x99-\xde\x1dG\
+_\xd2\xe50F\xff\x00\xea\xeeW'9#\xb7o\x5c\
+\xf7\x07\x90y\x04b\x85P\xb8\x0b\x90\x07\xf0\xf5\x1f\x86\
+r@\x1d\x80 \x0fJwv\xb5\xf43T`\x9d\xf5\
+\xfc\xff\x00C\xe3\x0f\xd8+\xf6\x1c\xf8/\xff\x00\x04\xef\
+\xfd\x98\xbe\x1f\xfe\xcb\x9f\x024\xbb\x88|%\xe0\xbbk\
+\x9b\xbd[\xc4Z\xacv_\xf0\x94x\xf7\xc6Z\xbb\xad\
+\xcf\x89\xfcs\xe2\xeb\xbb\x18-\xe1\xbb\xd7u\xeb\xb4\x84\
+\x1d\x89\xe4\xe9\x9aU\x9e\x99\xa0\xe9\xcb\x16\x9b\xa4XE\
+\x1f\xe0_\xfc\x17\xf7\xfe\x0d\xd5\xd5\xbf\xe0\xa5~/\xb0\
+\xfd\xaa\xff\x00e\x8f\x15xK\xc0\xdf\xb4\xfe\x95\xe1\x8b\
+\x0f\x0bx\xd7\xc2^:\x92\xf3J\xf0O\xc6]\x0bA\
+\x0c\xbe\x1d\xb9\xff\x00\x84\x8fM\xb7\xd4\xe5\xf0\xb7\x8e\xf4\
++\x07\x93E\xb3\xbc\xbd\xd2n\xf4O\x11\xe9\xbf\xd9:\
+n\xad\xa8xq4h\xf5V\xfe\xb1zt\xa2\x84\xec\
+\xeeh\xd2j\xc7\xf8\xe9x\xe3\xfe\x0d\xe8\xff\x00\x82\xca\
+x\x0bR\xb8\xd3u_\xd8K\xe2\x96\xbab\xb8\x96\xd5\
+u\x0f\x04j\xbe\x03\xf1\xee\x9bu\xe56\xc347^\
+\x12\xf1n\xb0\xa6\xdaL\xe6\x19\xe6Kt\x92-\x85\x14\
+\xfc\xc6\xbe\x95\xfd\x97\xbf\xe0\xd6\xaf\xf8+\x87\xed\x07\xe2\
+\xbd?N\xf1\xcf\xc1\xfd\x13\xf6_\xf04\xb2Z>\xb1\
+\xe3\xff\x00\x8d\x9e.\xf0\xe6l\xf4\xf7\x904\xeb\xa5x\
+\x1f\xc1Z\xaf\x89\xfcc\xacj\xf1@\x1e[->\xf3\
+K\xd1t\xe6\xbb\x0bm\xa8\xeb\x9a \x94]\xb7\xfa\xca\
+\xf9k\xd7\x9c\xfa\xe7\xfc8\x03\xd4\x00\x01\xfe E(\
+]\xbd\xc9\xfa\xff\x00\xfa\xba\x0fA\xdf\x9e\xb4\xdc\xe5-\
+\x1b\xbf\xf5\xff\x00\x00\xcf\xd8\xc3\xb3\xfb\xcf\xcf\x0f\xf8&\
+O\xfc\x13s\xe0\x7f\xfc\x12\xef\xf6[\xf0\xf7\xec\xdb\xf0\
+i\xaf\xf5\xd9~\xdfs\xe2\xdf\x89\x7f\x11\xf5\xc8R\xdb\
+\xc4\x9f\x13\xfe\x22\xea\x96v6\x9a\xc7\x8a\xb5KH'\
+\xb8\xb6\xd2,\xa3\xb5\xd3\xac4\x7f\x0exv\xcay\xad\
+t\x1f\x0f\xe9\xb6\x16ow\xaajGS\xd6\xb5?\xf2\
+\xcb\xff\x00\x82\xfd\x7f\xcac\xbfo\xef\xfb-\xab\xff\x00\
+\xa8g\x85k\xfd\x91\x0fC\xf4?\xca\xbf\xc6\xef\xfe\x0b\
+\xf5\xff\x00)\x8e\xfd\xbf\xbf\xec\xb6\xaf\xfe\xa1\x9e\x16\xa4\
+\xb7^\xab\xf3\x0a\xaa\xd4\xa4\x96\x8bO\xfd)w>\xa9\
+\xfd\x81?\xe0\x84_\x10\x7f\xe0\xa7\x1f\xf0L\xef\x19\xfe\
+\xd2?\xb2\xf6\xad\xa5G\xfbN|#\xfd\xa2\xfco\xe0\
+mC\xe1\xef\x8bu\xef\xecO\x0d\xfc\x5c\xf8u\x1f\x80\
+<\x01\xe2\x1d3G\xd15\x9b\xef3H\xf0\xd7\x8et\
+MsS\xd4\x86\x98\xfa\xb3i\x9e\x1d\xf1\x1d\x9e\xb5q\
+i\xaek:;\xe9V7s|\xe9\xa0\xff\x00\xc1\xbc\
+\xbf\xf0YO\x10\xf8\xba?\x06C\xfb\x08\xfcP\xd2\xef\
+\xfe\xd3\x05\xac\xfa\xc6\xbf\xac\xfc<\xd0\xfc\x1f\x02\xce\xc8\
+\x86\xeeO\x17j^1\xb7\xf0\xe4\xb6\xd0\xb3\x89n[\
+O\xd5/\xda\x1f\x99\xbc\xb0#`\xff\x00\xd9\x7f\xfc\x19\
+\x987\x7f\xc16\xbe7\x83\x9c\x7f\xc3]\xf8\xaf\xa1 \
+\xf1\xf0\xc7\xe1ku\x1c\xfd}\xb8\xaf\xeb\xd7`=I\
+l\xfa\xe3\xf0\xe0\x008\xf7\x1f\x5c\xd5\xb9\xbb\xbd\x16\xff\
+\x00\xd7RaJ\x12\x8c[N\xedw?\x01?\xe0\x82\
+\x1f\xf0E\x8d3\xfe\x09-\xf0C\xc5z\x8f\xc4=k\
+B\xf1\xdf\xedM\xf1\xce=\x06\xe7\xe2\xdf\x89\xf4\x14k\
+\x9f\x0cx?D\xd0E\xec\xda\x1f\xc3\x0f\x01\xea\x17\xf6\
+6z\xb5\xd6\x89\xa6\xdejwz\x8f\x88u\x9b\x88\xac\
+\xbf\xe1'\xd6\xfe\xc91\xb0\x8a\xc3D\xd1\x84Z?\xf0\
+_o\xf8#\xd3\x7f\xc1Y\xff\x00f\x8f\x0c\xe9?\x0e\
+\xf5\x8d\x0f\xc2?\xb4\xaf\xc0}c\x5c\xf1O\xc1=\x7f\
+\xc4\xc5\xe0\xf0\xd6\xbdk\xe2;;\x0bo\x1a|5\xf1\
+.\xa3mi{\xa8i\x1aG\x8c\x06\x8b\xe1\xfb\xdbm\
+b\xd6\xde\xe3\xfb7\xc4\x1e\x1e\xd1\xa7\xb9\xb5\x9fO{\
+\xc5\xaf\xde\xd1\xc7\x1e\x94\x84db\xb3N\xda\x9b4\x9a\
+q\xb6\x8d[\xd3\xd3\xcc\xff\x00\x1c\xddc\xfe\x0d\xf2\xff\
+\x00\x82\xc9\xe8\xde,\xb8\xf0l\x9f\xb0g\xc5\xbb\xedF\
+\x19\xe4\x81um\x1a\xff\x00\xc0\x9a\xaf\x85.\x02\xcb$\
+iso\xe3\x1b/\x16\xcb\xe1\x81\x01\xd8]\x1e}R\
+#\xb7\xcb\x97lm\x22\xa8\xfd\xbf\xfd\x9a?\xe0\xd1\xaf\
+\xdaGR\xfd\x87\xbfi\xcf\x1c\xfe\xd0\x91xoA\xfd\
+\xb2<a\xe0]\x06\xdb\xf6T\xf83c\xe3\x1d*\xf2\
+\xc7\xc0z\xe6\x8b\xe3?\x0fx\xaf]\xd4\xbe&x\xb6\
+\xca\xe1\xbc'\x1f\x89\xfcu\xa0\xe8w\xde\x02\xd1\xb4\xdd\
+;V\xd6\xb4\x0f\x08h~&\xd5\xf5\x8df\xf2\xeb^\
+\xbd\xb7\xb3\xf0\xb7\xfa8\xf9c\x9e\xbc\xf5$\xe4\xfeg\
+?\x87q\xda\x9fW\xcf+\xfe\x84*P]\x1b\xf9\xb3\
+\xfc\xbb\xff\x00f\x9f\xf86c\xfe\x0bK\xfb?\xfe\xd1\
+_\x01>=X\xfc\x1a\xf8Q%\xe7\xc1_\x8c\xdf\x0b\
+\xfe,\xda\xc5\x0f\xc7\x7f\x86\x93O5\xc7\xc3\xcf\x1a\xe8\
+\x9e-H\xa1\xb7\x97Y\x86'\x96W\xd2vE\x14\x97\
+\x11D\xce\xca\xad$i\x92?\xd3\x1b\xe2\x97\xc2\xdf\x04\
+\xfcl\xf8i\xe3\x8f\x84\x7f\x14\xbc3e\xe2\xef\x87\x7f\
+\x13<!\xaex'\xc6\xfe\x15\xd5w=\x96\xb5\xe1\xbf\
+\x12\xe9\xd3\xe9z\xce\x99t\xd6\xd2\xc3<F\xe2\xca\xee\
+hR\xea\xc6\xe2\xde\xea\xd2B.,\xee \xb8\x86\xde\
+\xe1}*\x8a\x97&\xf7\xb1q\x8a\x8a\xb2[\xbb\xfe\x09\
+~\x87\xf9\x7f\x7f\xc1@\xbf\xe0\xd2\xdf\xdb\xd7\xe0/\xc4\
+?\x10k\x7f\xb1\x86\x95\xa7\xfe\xd6\x1f\x02u-_T\
+\xbb\xf0\x8d\x95\x8f\x88\xfc3\xe1/\x8c\xde\x0c\xd1\xe7\xbf\
+Y4\xaf\x0f\xf8\xd7\xc3\xde-\xd5<;\xa2\xf8\x9e\xf7\
+O\xb3\xba\x8e\xd1<S\xe0\xadV\xe5u\xd6\xd3.\xf5\
+=C\xc3>\x0e7V\xda]~b\xf8g\xfe\x0d\xfa\
+\xff\x00\x82\xc8\xf8\xabY:%\x87\xec\x15\xf1\x8fO\xb8\
+Y\xe2\xb7\x96\xef\xc4\x93\xf8+\xc2\x9aDa\xe5[\x7f\
+4k>\x22\xf1f\x97\xa5M\x04;\xcb\xc9\xf6[\xc9\
+\xe3H\xc38\x0f\x1ao\xaf\xf6:#8\xcf\xae~\xb4\
+\x81\x14c\x8e\x87#\xdb\xe9\x8e\xdc\xf4\xe9U\xce\xfc\xbf\
+\xaf\x99\x9f\xb1\x85\xdb\xd7W{-\x17\xe0\xbf[\xf9\x9f\
+\xc6_\xfc\x10\x87\xfe\x0d\x91\xd7\xbfb\xdf\x8a\xbe\x19\xfd\
+\xb1\xff\x00n\xadK\xc1^*\xf8\xe9\xe0\xd8\xa4\xbe\xf8\
+?\xf0c\xc27\x89\xe2\xaf\x08\xfc/\xd7\xef\xec<\x86\
+\xf1\x9f\x8d<Gqi\x16\x99\xe2/\x88Z\x14wW\
+6\xfe\x1b\xb2\xf0\xd47\xfe\x1a\xf0\xae\xa7\x10\xf1-\x8f\
+\x89\xbcA\xac&\x8fu\xa3\x7f^\xff\x00\x15~\x19x\
+#\xe3G\xc3o\x1c\xfc$\xf8\x97\xe1\xbd?\xc6\x1f\x0f\
+~%xW^\xf0G\x8d\xbc/\xaa\xab\x9d?^\xf0\
+\xbf\x89\xf4\xcb\x9d\x1b[\xd2\xee\x8cO\x15\xc4Iy\xa7\
+\xdeO\x08\x9e\xd6hn\xad\xdd\x92{y\xa2\x965u\
+\xef\xe8\xa9n\xee\xe6\x89$\xac\x95\x97c\xfc\xc7\xbf\xe0\
+\xa2\x9f\xf0i'\xed\xbb\xf0[\xe2'\x89\xfcO\xfb\x0b\
+i\xbaW\xed;\xf0\x13T\xd5\xeeo<'\xe1Y<\
+_\xa0\xf8o\xe3\x87\x82\xb4\xab\x99 xtO\x15i\
+\xbe/\x9f\xc3~\x19\xf1\x5cz|\x97/ce\xe2\x0f\
+\x0a\xeb\xd7Z\x8e\xa9k`\xfa\x86\xad\xe1\xed\x09\xe5\xd9\
+7\xe5?\x87\xbf\xe0\xdf\xcf\xf8,\x8f\x88u\xb3\xa1Z\
+~\xc0\xdf\x18\xec\xeeVu\x82[\xaf\x10\xcb\xe0\xaf\x0d\
+hQ\x87p\x8dr|A\xe2\x0f\x14\xd9\xe8\xd3A\x11\
+\x7f1\xde\xde\xf6u0\xc6\xa6! Dx\x7f\xd8\xe7\
+\xaf\x04dSv\x0f\x7f\xc7\x9cc<s\xd4rx9\
+\x1e\x82\x9cg(\xec\xed\xfd\x7f\xc0!\xd2\x84\x9d\xdd\xfe\
+Z#\xf8\xd7\xff\x00\x82\x0b\xff\x00\xc1\xb3\xbe\x22\xfd\x87\
+\xbe(\xe8?\xb6O\xed\xc1\xaax3\xc5?\x1e\xfc3\
+c\xe7\xfc\x1e\xf8;\xe1+\xa8\xfcM\xe1o\x84Z\xde\
+\xa9c}c\xa9x\xbf\xc5\xfe\x22\x9a\x0f\xec\xaf\x14|\
+C\xd3l\xee\xfe\xc9\xe1\xc8<6.\xbc5\xe1\x0b\xb3\
+u\xaf\xe9\xba\xdf\x88u\xdf\xec=C@\xfe\xc7\xbe\xce\
+\xfe\x96\xff\x00\xf7\xe8\xff\x00\x8d\x5c\xa2\x93ww.)\
+EY-\x0f\xf07\xa2\x9c\xea\xd1\xbb\xc6\xc3\x0e\x8cU\
+\x87\x07\x0c\xa4\xa9\x19\x19\x07\x04\x11\x90H\xf4\xa6\xd6\xe7\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00QE\x14\
+\x00QE\x14\x00QE\x14\x00QE\x14\x00Q\xd8\xff\
+\x00\xba\xdf\xfa\x09\xa2\x8e\xc7\xfd\xd6\xff\x00\xd0M\x00\x7f\
+\xa9\x97\xfc\x1a\x03\xff\x00(\x8b\x8f\xfe\xcek\xe3_\xfe\
+\x8b\xf0\x95\x7fR\x8f\xd3\xf3\xfeF\xbf\x96\xbf\xf84\x07\
+\xfeQ\x17\x1f\xfd\x9c\xd7\xc6\xbf\xfd\x17\xe1*\xfe\xa5\x1b\
+\xa7\xe7\xff\x00\xa0\x9a\xc6\x7f\x13\xf9~H\xee\xfb\x1f\xf6\
+\xef\xe8~J\xfe\xdb\xbf\xf2V\xec?\xecK\xd3\x7f\xf4\
+\xe1\xadW\xbc\xfe\xc2\x1f\xf2&\xf8\xcf\xfe\xc6{o\xfd\
+5\xdbW\x83~\xdb\xa7\x1f\x16\xec\x0f\xfdIzo\xfe\
+\x9c5\xaa\xf7\x9f\xd8G\x8f\x06\xf8\xcf\xfe\xc6{o\xd7\
+K\xb65\xfe;\xf8]\xff\x00+\x22\xe3\x8f\xfb\x18\xf1\
+\x96\x9d\xbf\xe1\x16\x91\xfd\x7f\xc5_\xf2\x8d\x9c=\xe9\x94\
+\xff\x00\xeauc\xef:(\xa2\xbf\xd8c\xf9\x08(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\x8a\x00(\xa2\
+\x8a\x00+\xf9\xd3\xfd\xab\x7f\xe0\xd8_\xf8'\x0f\xed\x91\
+\xfbD\xfcY\xfd\xa7~.\xeb\xdf\xb4\xb5\xb7\xc4\x8f\x8c\
+\xbe'\xff\x00\x84\xb3\xc5\xd0\xf87\xe2\x87\x854_\x0d\
+\xc5\xaa\x0d:\xc7K\x09\xa3\xe9W\xbf\x0c\xf5{\x8b;\
+Ak\xa7\xc1\x98\xee5\x1b\xc9L\x81\x98L\x032\x9f\
+\xe8\xb2\x8a\x00\xfc\xf7\xff\x00\x82r\x7f\xc14\xbfg\x8f\
+\xf8%\xdf\xc1\xdf\x12|\x0d\xfd\x9a\xef\xfe$j\x1e\x0a\
+\xf1W\x8f\xf5\x1f\x89\x1a\xa4\xbf\x13\xbcM\xa5\xf8\xa3\x5c\
+\x1e!\xd4\xf4]\x0fA\xb9K[\xed#\xc3~\x18\xb6\
+\x8bN\x16>\x1e\xd3\xccv\xcfa$\xc2\xe0\xdcH\xd7\
+L\xb2\x88\xd7\xf4\x22\x8a(\x04\xad\xb2\x0a(\xa2\x80\x0a\
+(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a(\xa2\x80\x0a\
+(\xa2\x80\x0a(\xa2\x80?\xff\xd9\
+"
+
+qt_resource_name = b"\
+\x00\x0e\
+\x05\x05\xca\xa7\
+\x00P\
+\x00a\x00r\x00k\x00e\x00r\x00L\x00o\x00g\x00o\x00.\x00j\x00p\x00g\
+\x00\x12\
+\x00\xb9\x5c\x07\
+\x00P\
+\x00a\x00r\x00k\x00e\x00r\x00L\x00o\x00g\x00o\x00_\x008\x000\x00p\x00.\x00j\x00p\
+\x00g\
+\x00\x12\
+\x02\xb9\x5c\x07\
+\x00P\
+\x00a\x00r\x00k\x00e\x00r\x00L\x00o\x00g\x00o\x00_\x006\x000\x00p\x00.\x00j\x00p\
+\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00~\x8b\
+\x00\x00\x01\x97\x17\x1f\xdep\
+\x00\x00\x00L\x00\x00\x00\x00\x00\x01\x00\x01:\x0a\
+\x00\x00\x01\x97\x17\x1d.\xf0\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x97\x16\xe4c\xe0\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,191 @@
+import os
+import numpy as np
+os.environ.setdefault("PYQTGRAPH_QT_LIB", "PySide2")  # the rest of the GUI uses PySide2 widgets
+import pyqtgraph as pg
+from PySide2.QtCore import Qt, Signal
+from PySide2.QtWidgets import QTabWidget
+
+# Native plots of the results table (pandas DataFrame returned by SaveMat) for the Results tab.
+# Both views are drawn by pyqtgraph with QPainter (no OpenGL) as a single item each, so 100k designs stay interactive.
+
+PEN_COLOR = (0, 120, 215)
+POINT_SIZE = 4
+DRAG_POINTS = 10000  # designs drawn while the 3D view is rotated, all of them are drawn again when the mouse is released
+
+
+def _normalize(values, lo=0.0, hi=1.0, bounds=None):
+    # scales every column to [lo, hi] (of its own range or of bounds=(vmin, vmax)), constant columns go to the middle
+    vmin, vmax = bounds if bounds is not None else (np.nanmin(values, axis=0), np.nanmax(values, axis=0))
+    span = vmax - vmin
+    span[span == 0] = np.inf
+    return lo + (hi - lo) * np.where(np.isfinite(span), (values - vmin) / span, 0.5)
+
+
+def _columns(table, coordvars):
+    missing = [name for name in coordvars if name not in table.columns]
+    if missing:
+        raise KeyError(f"Not in the results: {', '.join(missing)}")
+    return table[coordvars].to_numpy(dtype=float)
+
+
+class ParallelPlotWidget(pg.PlotWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent, background='w')
+        self.getPlotItem().hideAxis('left')
+        self.getPlotItem().setMenuEnabled(False)
+        self.curve = pg.PlotCurveItem(connect='finite', antialias=False)
+        self.addItem(self.curve)
+        self._decorations = []
+
+    def plot_table(self, table, coordvars):
+        values = _columns(table, coordvars)
+        n, k = values.shape
+        # all designs are one curve: k points per design followed by a NaN that breaks the line
+        y = np.full((n, k + 1), np.nan)
+        y[:, :k] = _normalize(values)
+        x = np.tile(np.append(np.arange(k, dtype=float), np.nan), n)
+        alpha = int(np.clip(2550 / max(n, 1) ** 0.5, 20, 255))  # fade the lines as the number of designs grows
+        self.curve.setData(x, y.ravel(), pen=pg.mkPen(PEN_COLOR + (alpha,), width=1))
+
+        # one vertical axis per variable, labelled with its range
+        for item in self._decorations:
+            self.removeItem(item)
+        self._decorations = []
+        vmin, vmax = np.nanmin(values, axis=0), np.nanmax(values, axis=0)
+        for i in range(k):
+            self._decorations.append(pg.InfiniteLine(pos=i, angle=90, pen=pg.mkPen('k')))
+            self._decorations.append(pg.TextItem(f"{vmax[i]:.4g}", color='k', anchor=(0.5, 1)))
+            self._decorations[-1].setPos(i, 1.0)
+            self._decorations.append(pg.TextItem(f"{vmin[i]:.4g}", color='k', anchor=(0.5, 0)))
+            self._decorations[-1].setPos(i, 0.0)
+        for item in self._decorations:
+            self.addItem(item)
+        self.getAxis('bottom').setTicks([list(enumerate(coordvars))])
+        self.setXRange(-0.5, k - 0.5, padding=0)
+        self.setYRange(-0.1, 1.1, padding=0)
+
+
+class Scatter3DWidget(pg.PlotWidget):
+    # orthographic view of the 3 variables, drag with the left mouse button to rotate
+    point_clicked = Signal(int)
+
+    EDGES = [((-1, -1, -1), (1, -1, -1)), ((-1, -1, -1), (-1, 1, -1)), ((-1, -1, -1), (-1, -1, 1))]
+
+    def __init__(self, parent=None):
+        super().__init__(parent, background='w')
+        self.setMouseEnabled(False, False)
+        self.setAspectLocked(True)
+        self.hideAxis('left')
+        self.hideAxis('bottom')
+        self.getPlotItem().setMenuEnabled(False)
+        self.azimuth, self.elevation = np.radians(-37.5), np.radians(30)  # same default view as MATLAB
+        self.points = np.zeros((0, 3))
+        self.values = np.zeros((0, 3))
+        self.bounds = (np.zeros(3), np.zeros(3))  # ranges the points are normalized to
+        self.coordvars = []
+        self._drag_start = None
+
+        self.scatter = pg.ScatterPlotItem(size=POINT_SIZE, pen=None, brush=pg.mkBrush(PEN_COLOR + (180,)))
+        self.scatter.sigClicked.connect(self._on_clicked)
+        self.addItem(self.scatter)
+        self.axes = [pg.PlotCurveItem(pen=pg.mkPen('k')) for _ in self.EDGES]
+        self.labels = [pg.TextItem(color='k', anchor=(0.5, 0.5)) for _ in self.EDGES]
+        self.tip = pg.TextItem(color='k', fill=pg.mkBrush(255, 255, 225), anchor=(0, 1))
+        for item in self.axes + self.labels + [self.tip]:
+            self.addItem(item)
+        self.tip.hide()
+        self.setRange(xRange=(-2.2, 2.2), yRange=(-2.2, 2.2), padding=0)
+
+    def plot_table(self, table, coordvars):
+        if len(coordvars) != 3:
+            raise ValueError("For 3D plots, select exactly 3 parameters.")
+        self.plot_values(_columns(table, coordvars), coordvars)
+
+    def plot_values(self, values, coordvars):
+        self.values = np.asarray(values, dtype=float).reshape(-1, 3)
+        self.bounds = (np.nanmin(self.values, axis=0), np.nanmax(self.values, axis=0)) if len(self.values) else (np.zeros(3), np.zeros(3))
+        self.points = _normalize(self.values, -1.0, 1.0, self.bounds)
+        self.coordvars = list(coordvars)
+        for label, name, lo, hi in zip(self.labels, self.coordvars, *self.bounds):
+            label.setText(f"{name}\n[{lo:.4g}, {hi:.4g}]")
+        self.tip.hide()
+        self._redraw()
+
+    def add_values(self, values):
+        """Draws more points without redrawing the others. Returns False (and adds nothing) if one is out of the axis ranges."""
+        values = np.asarray(values, dtype=float).reshape(-1, 3)
+        if not len(self.values) or np.any(values < self.bounds[0]) or np.any(values > self.bounds[1]):
+            return False
+        points = _normalize(values, -1.0, 1.0, self.bounds)
+        u, v = self._project(points)
+        self.scatter.addPoints(x=u, y=v, data=np.arange(len(self.values), len(self.values) + len(values)))
+        self.values = np.vstack([self.values, values])
+        self.points = np.vstack([self.points, points])
+        return True
+
+    def _project(self, xyz):
+        ca, sa = np.cos(self.azimuth), np.sin(self.azimuth)
+        ce, se = np.cos(self.elevation), np.sin(self.elevation)
+        x, y, z = np.asarray(xyz, dtype=float).T
+        depth = x * sa - y * ca
+        return x * ca + y * sa, z * ce - depth * se
+
+    def _redraw(self, dragging=False):
+        index = np.arange(len(self.points))
+        if dragging and len(index) > DRAG_POINTS:
+            index = index[::int(np.ceil(len(index) / DRAG_POINTS))]
+        u, v = self._project(self.points[index])
+        self.scatter.setData(u, v, data=index)
+        for curve, label, (start, end) in zip(self.axes, self.labels, self.EDGES):
+            u, v = self._project([start, end])
+            curve.setData(u, v)
+            label.setPos(u[1] + 0.125 * (u[1] - u[0]), v[1] + 0.125 * (v[1] - v[0]))  # just past the end of the axis
+
+    def _on_clicked(self, item, spots, *args):
+        if not len(spots):
+            return
+        index = int(spots[0].data())
+        text = [f"Motor {index + 1}"] + [f"{name}: {value:.6g}" for name, value in zip(self.coordvars, self.values[index])]
+        self.tip.setText("\n".join(text))
+        self.tip.setPos(spots[0].pos())
+        self.tip.show()
+        self.point_clicked.emit(index)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._drag_start = (event.pos(), self.azimuth, self.elevation)
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if self._drag_start is None:
+            return super().mouseMoveEvent(event)
+        pos, azimuth, elevation = self._drag_start
+        delta = event.pos() - pos
+        self.azimuth = azimuth - np.radians(delta.x() * 0.5)
+        self.elevation = np.clip(elevation + np.radians(delta.y() * 0.5), -np.pi / 2, np.pi / 2)
+        self.tip.hide()
+        self._redraw(dragging=True)
+
+    def mouseReleaseEvent(self, event):
+        if self._drag_start is not None and event.pos() != self._drag_start[0]:
+            self._redraw()
+        self._drag_start = None
+        super().mouseReleaseEvent(event)
+
+
+class ResultPlots(QTabWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.parallel_plot = ParallelPlotWidget(self)
+        self.scatter_3d = Scatter3DWidget(self)
+        self.addTab(self.parallel_plot, "Parallel Plot")
+        self.addTab(self.scatter_3d, "3D Plot")
+        self.setMinimumSize(480, 360)
+
+    def show_parallel(self, table, coordvars):
+        self.parallel_plot.plot_table(table, coordvars)
+        self.setCurrentWidget(self.parallel_plot)
+
+    def show_3d(self, table, coordvars):
+        self.scatter_3d.plot_table(table, coordvars)
+        self.setCurrentWidget(self.scatter_3d)
@@ -0,0 +1,119 @@
+import numpy as np
+from PySide2.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide2.QtWidgets import QTableView, QHeaderView
+
+# Table of the per generation statistics in the Simulation tab.
+# The rows are kept in a NumPy buffer that doubles when it is full, and the view only asks for the cells it draws,
+# so a run of 100k generations stays responsive. Rows appended while the user looks at older rows are stored but not
+# inserted into the view: they are fetched (canFetchMore / fetchMore) once the view is scrolled back to the bottom.
+
+INITIAL_ROWS = 1024
+
+
+def _number(value):
+    try:
+        return np.nan if value is None else float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _format(value, integer):
+    # same text as the former QTableWidgetItem cells
+    if np.isnan(value):
+        return "N/A"
+    if integer:
+        return str(int(value))
+    if abs(value) < 1e-3 and value != 0.0 or abs(value) > 1e4:
+        return f"{value:.3e}"
+    return f"{value:.4f}"
+
+
+class ResultsTableModel(QAbstractTableModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.headers = []
+        self.keys = []
+        self._values = np.empty((0, 0))
+        self._integer = np.zeros(0, dtype=bool)  # columns of integers (generation, evaluations, ...)
+        self._rows = 0   # rows in the buffer
+        self._shown = 0  # rows the views know about
+
+    def set_columns(self, headers, keys):
+        """Starts a new table, the rows of the previous one are dropped."""
+        self.beginResetModel()
+        self.headers = list(headers)
+        self.keys = list(keys)
+        self._values = np.full((INITIAL_ROWS, len(self.keys)), np.nan)
+        self._integer = np.zeros(len(self.keys), dtype=bool)
+        self._rows = self._shown = 0
+        self.endResetModel()
+
+    def append_rows(self, rows, show=True):
+        """Appends rows (dicts of data key: value) in one go. With show=False they wait for fetchMore."""
+        if not rows or not self.keys:
+            return
+        if self._rows + len(rows) > len(self._values):
+            grown = np.full((max(2 * len(self._values), self._rows + len(rows)), len(self.keys)), np.nan)
+            grown[:self._rows] = self._values[:self._rows]
+            self._values = grown
+        self._integer |= [isinstance(rows[0].get(key), (int, np.integer)) and not isinstance(rows[0].get(key), bool) for key in self.keys]
+        self._values[self._rows:self._rows + len(rows)] = [[_number(row.get(key)) for key in self.keys] for row in rows]
+        self._rows += len(rows)
+        if show:
+            self.fetchMore(QModelIndex())
+
+    def values(self):
+        """The rows of the table as an array, one column per data key."""
+        return self._values[:self._rows]
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._shown < self._rows
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self.beginInsertRows(QModelIndex(), self._shown, self._rows - 1)
+        self._shown = self._rows
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._shown
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.keys)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return _format(self._values[index.row(), index.column()], self._integer[index.column()])
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.headers[section] if section < len(self.headers) else None
+        return str(section + 1)
+
+
+class ResultsTableView(QTableView):
+    # follows the last row while it is scrolled to the bottom
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setModel(ResultsTableModel(self))
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)  # no per row height, however many rows
+
+    def set_columns(self, headers, keys):
+        self.model().set_columns(headers, keys)
+        self.resizeColumnsToContents()
+
+    def append_rows(self, rows):
+        bar = self.verticalScrollBar()
+        follow = bar.value() == bar.maximum()
+        self.model().append_rows(rows, show=follow)
+        if follow:
+            self.scrollToBottom()
+
+    def fit_rows_to_font(self):
+        # fixed row height for the current font, sizing every row to its contents would visit all the rows
+        self.ensurePolished()
+        self.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 8)
@@ -0,0 +1,93 @@
+'''
+This script reports what the GUI imports at start and how long it takes, so the cold start can be held to a budget.
+
+Usage:
+    python -m import_report --budget 1.0
+    python -m import_report --module batch_run --lazy
+
+Inputs:
+    --module,   module to import (default MainWindow, the GUI). It is imported in a new Python process with
+                -X importtime, so nothing is imported already
+    --repeat,   number of imports, the report is of the fastest one (default 3). The first import of a session also
+                reads the files from disk (or the network share), run with --repeat 1 to see that cost
+    --top,      number of slow modules listed (default 15)
+    --budget,   (optional) seconds the import may take
+    --lazy,     modules that must not be imported at start (default pymoo, pandas, scipy, matlab, pint and tkinter:
+                they are loaded on first use, and PySide6: the GUI uses PySide2 only). Give --lazy without names to
+                allow all of them
+
+Outputs:
+    The import time of the module, its slowest imports (own time and with their imports) and the lazy modules that
+    were imported anyway, with the module that imported them.
+    The exit code is the number of problems: over the budget and each lazy module imported.
+'''
+import argparse
+import os
+import subprocess
+import sys
+
+LAZY_MODULES = ["pymoo", "pandas", "scipy", "matlab", "pint", "tkinter", "PySide6"]
+
+
+def ImportTimes(module):
+    # [(name, depth, self seconds, cumulative seconds)] in the order -X importtime prints them (imports before importers)
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True,
+                          cwd=os.path.dirname(os.path.abspath(__file__)), env=env)
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    records = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        records.append((name.strip(), depth, int(own) / 1e6, int(cumulative) / 1e6))
+    return records
+
+
+def ImportedBy(records, index):
+    # the importer of records[index] is the next record one level up
+    depth = records[index][1]
+    for name, d, _, _ in records[index + 1:]:
+        if d < depth:
+            return name
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report the import time of the BLDC GUI.")
+    parser.add_argument("--module", default="MainWindow", help="module to import")
+    parser.add_argument("--repeat", type=int, default=3, help="imports, the fastest is reported")
+    parser.add_argument("--top", type=int, default=15, help="slow modules listed")
+    parser.add_argument("--budget", type=float, default=None, help="seconds the import may take")
+    parser.add_argument("--lazy", nargs="*", default=LAZY_MODULES, help="modules that must not be imported at start")
+    args = parser.parse_args(argv)
+
+    runs = [ImportTimes(args.module) for _ in range(max(args.repeat, 1))]
+    total = lambda records: next(c for name, d, _, c in records if name == args.module and d == 0)
+    records = min(runs, key=total)
+    seconds = total(records)
+
+    print(f"import {args.module}: {seconds:.3f} s (fastest of {len(runs)}, {len(records)} modules)")
+    print("Slowest modules (own time):")
+    for name, _, own, cumulative in sorted(records, key=lambda r: r[2], reverse=True)[:args.top]:
+        print(f"    {own:8.3f} s  {cumulative:8.3f} s with imports  {name}")
+
+    problems = 0
+    for index, (name, _, _, cumulative) in enumerate(records):
+        importer = ImportedBy(records, index) or "python"
+        if name.split(".")[0] in args.lazy and importer.split(".")[0] not in args.lazy:
+            problems += 1
+            print(f"Lazy module imported at start: {name} ({cumulative:.3f} s), imported by {importer}")
+    if args.budget is not None:
+        if seconds > args.budget:
+            problems += 1
+            print(f"Over budget: {seconds:.3f} s > {args.budget:.3f} s")
+        else:
+            print(f"Within budget: {seconds:.3f} s <= {args.budget:.3f} s")
+    return problems
+
+
+if __name__ == "__main__":
+    sys.exit(main())
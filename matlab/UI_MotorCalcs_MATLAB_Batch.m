@@ -0,0 +1,31 @@
+function [Outputs, MotorRecords] = UI_MotorCalcs_MATLAB_Batch(vars_name, vars_matrix, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess, NumObj_)
+% This function calculates the motor performance for a whole population of
+% designs in one call, so the optimizer crosses the Python/MATLAB bridge
+% once per generation instead of once per design.
+%
+% Inputs: 
+% vars_name: Names of the variable parameters (one per column of vars_matrix)
+% vars_matrix: N-by-nvars matrix of variable values, one row per design
+% consts_name:  Names of the constant parameters. 
+% consts_value: Values of the constant parameters. 
+% (remaining inputs are the same as UI_MotorCalcs_MATLAB_Vectorized)
+%
+% Outputs:
+% Outputs: N-by-(2*NumPts+6) matrix, one row of objective parameters per design.
+% MotorRecords: (optional) 1-by-N cell array with the post-processed Motor
+% struct of each design (see UI_MotorCalcs_MATLAB_Vectorized).
+%
+
+NumDesigns = size(vars_matrix, 1);
+NumPts = length(MinTor_Nm);
+Outputs = zeros(NumDesigns, 2*NumPts+6);
+MotorRecords = cell(1, NumDesigns);
+for n = 1:NumDesigns
+    vars_value = num2cell(vars_matrix(n, :));
+    if nargout > 1
+        [Outputs(n, :), MotorRecords{n}] = UI_MotorCalcs_MATLAB_Vectorized(vars_name, vars_value, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess, NumObj_);
+    else
+        Outputs(n, :) = UI_MotorCalcs_MATLAB_Vectorized(vars_name, vars_value, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess, NumObj_);
+    end
+end
+end
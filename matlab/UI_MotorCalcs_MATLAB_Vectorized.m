@@ -1,4 +1,4 @@
-function [Outputs] = UI_MotorCalcs_MATLAB_Vectorized(vars_name, vars_value, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess,NumObj_)
+function [Outputs, MotorRecord] = UI_MotorCalcs_MATLAB_Vectorized(vars_name, vars_value, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess,NumObj_)
 % This function calculate the motor performance for a given set of
 % parameters. This function is called by an optimizer. 
 %
@@ -11,6 +11,9 @@ function [Outputs] = UI_MotorCalcs_MATLAB_Vectorized(vars_name, vars_value, cons
 %
 % Outputs:
 % Outputs: The objective paraemters to be minimized. 
+% MotorRecord: (optional) the post-processed Motor struct of the design, the
+% same struct PostProcess = true returns. Designs rejected by the model only
+% have Motor.Params (with the ErrorMessage).
 %
   
 
@@ -98,16 +101,29 @@ if PostProcess == false
         Outputs = [double(1e6+0.5)*ones(1,2*length(MatMinTor_Nm)+6)];
         % Outputs = double(Motor.Params.ErrorMessage);
     end    
+    if nargout > 1
+        MotorRecord = PostProcessMotor(Motor, MatMinTor_Nm);
+    end
 else
-    Motor.Results.VDC = max(Motor.Results.VMag_VPhPkN)*sqrt(3);
-    Motor.Params = rmfield(Motor.Params,'MagnetBackIronInnerR_m'); % it is stored in the Motor.Results
-    Motor.Results.MeanEffMtr_Percent = 100*mean(Motor.Results.EffMtr_);
-    Motor.Results.MinEffMtr_Percent = 100*min(Motor.Results.EffMtr_);
-    TrqMargin = 100*(Motor.Results.TauShaft_Nm*Motor.Params.GearRatio - MatMinTor_Nm)./MatMinTor_Nm;
-    Motor.Results.MeanTrqMargin_Percent = mean(TrqMargin);
-    Motor.Results.MinTrqMargin_Percent = min(TrqMargin);
-    Outputs = Motor;
+    Outputs = PostProcessMotor(Motor, MatMinTor_Nm);
+end
+end
+
+
+function [Motor] = PostProcessMotor(Motor, MatMinTor_Nm)
+% Adds the summary fields to Motor.Results. Designs rejected by the model
+% have no Motor.Results and are returned unchanged.
+
+if ~isfield(Motor,'Results')
+    return;
 end
+Motor.Results.VDC = max(Motor.Results.VMag_VPhPkN)*sqrt(3);
+Motor.Params = rmfield(Motor.Params,'MagnetBackIronInnerR_m'); % it is stored in the Motor.Results
+Motor.Results.MeanEffMtr_Percent = 100*mean(Motor.Results.EffMtr_);
+Motor.Results.MinEffMtr_Percent = 100*min(Motor.Results.EffMtr_);
+TrqMargin = 100*(Motor.Results.TauShaft_Nm*Motor.Params.GearRatio - MatMinTor_Nm)./MatMinTor_Nm;
+Motor.Results.MeanTrqMargin_Percent = mean(TrqMargin);
+Motor.Results.MinTrqMargin_Percent = min(TrqMargin);
 end
 
 
@@ -224,9 +240,9 @@ FLUXM = MagnetBr_T * AMAG * (GR / (1 + GR));        % Flux generated in the airg
 
 FLUXC = FLUXM * 0.005; % Start with 0.5% of magnet flux
 
-% Iterative design process
-I = 0;
-while I < 10000
+% Design process. The first pass checks the geometry at the starting guess and
+%   solves for the coil flux, the second pass builds the geometry at the solution.
+for Pass = 1:2
 
     % STEP 3: Calculate the net flux that will be in each tooth. Note it is assumed
     %         that there is 2 phase on of a 3 phase, WYE, 6 state drive.
@@ -301,22 +317,30 @@ while I < 10000
     % AGAPAM=2.*PI*R_MtrLength_m*((RL1+R_MagnetOutR_m)/2.)/NP                  % TJH Change to include airgap 12-Apr-07
     % ACTFC=N*RatedCurrent6Step_A*VacMagneticPerm_H_m*AGAPAM/(AirgapRadialLength_m+R_MagnetRadialLength_m)                      % Actual coil flux
 
-    % STEP 9: This is the design convergance check. If the assumed coil flux is not within
-    %         .1% of the coil flux just calculated, the design is not valid. Adjust the
-    %         assumed coil flux and GOTO STEP #3 and recalculate the design. If it is
-    %         within .1%, the design is valid and drop to STEP 10.
-
-    res = abs((FLUXC - ACTFC) / FLUXC);
-    if res < 0.025
-        break;  % Converged
-    else
-        FLUXC = FLUXC + (ACTFC - FLUXC) / 2;            % Update coil flux
-    end
-
-    I = I + 1;  % Count the number of iterations
-    if I >= 9999
-        Motor.Params.ErrorMessage = 6%('Exiting - Stuck in convergence loop!');
-        return;
+    % STEP 9: Solve for the coil flux where the assumed coil flux equals the actual
+    %         coil flux, FLUXC = ACTFC. With S = FLUXM + 2*FLUXC the tooth width and the
+    %         backiron thickness are linear in S, so the slot area AS, and ACTFC with it,
+    %         is a quadratic in FLUXC. The fixed point is the smallest positive root of
+    %         k*AS(FLUXC) - FLUXC = 0, the point the old halving iteration converged to
+    %         within 2.5%.
+    if Pass == 1
+        t = real(NP) / (real(NumLamTeeth_) * R_MtrLength_m * PresentBLaminationToothIron_T);   % TW = t*S
+        b = 1 / (2 * R_MtrLength_m * PresentBLaminationBackIron_T);                             % RL3 = R_LaminatR_m - b*S
+        D = NP * NumElecPhase_;
+        a0 = pi * (R_LaminatR_m^2 - RL2^2) / D - 2 * LamSlotLinerThick_m * (R_LaminatR_m - RL2) - 2 * pi * LamSlotLinerThick_m * R_LaminatR_m / NumLamTeeth_;
+        a1 = (-2 * pi * R_LaminatR_m * b - NumLamTeeth_ * t * (R_LaminatR_m - RL2)) / D + 2 * LamSlotLinerThick_m * b + 2 * pi * LamSlotLinerThick_m * b / NumLamTeeth_ + LamSlotLinerThick_m * t;
+        a2 = (pi * b^2 + NumLamTeeth_ * t * b) / D;                                             % AS = a0 + a1*S + a2*S^2
+        k = FillFactor_ / (WIREA * 2) * RatedCurrent6Step_A * VacMagneticPerm_H_m * AMAG / (AirgapRadialLength_m + R_MagnetRadialLength_m);   % ACTFC = k*AS
+
+        q0 = k * (a0 + a1 * FLUXM + a2 * FLUXM^2);          % k*AS(FLUXM + 2*FLUXC) - FLUXC = q2*FLUXC^2 + q1*FLUXC + q0
+        q1 = 2 * k * (a1 + 2 * a2 * FLUXM) - 1;
+        q2 = 4 * k * a2;
+        disc = q1^2 - 4 * q2 * q0;
+        if disc < 0 || q0 <= 0 || (-q1 + sqrt(disc)) <= 0
+            Motor.Params.ErrorMessage = 6%('Exiting - no coil flux solution!');
+            return;
+        end
+        FLUXC = 2 * q0 / (-q1 + sqrt(disc));                % Smaller root, cancellation-free form
     end
 end
 
@@ -899,7 +923,7 @@ Taylor = TaylorA * TaylorB;
 TN1 = (2 * (1 + Airgapratio)^2) / (TaylorA * (1 + 0.5 * Airgapratio));
 TN2 = 0.11 * (Taylor^0.854) / TaylorA;
 TN3 = 0.476 * sqrt(TaylorB) / sqrt(TaylorA);
-TN4 = calcTurbFric(TN3, TaylorA, Airgapratio);  % Call to the auxiliary function
+TN4 = calcTurbFric(TaylorA, Airgapratio);  % Call to the auxiliary function
 
 % Determine the value based on Taylor number
 if Taylor < 41.3
@@ -917,52 +941,32 @@ fluidDragTorque = Value * pi * Lengthm * Density * ...
     (Radiusm^4) * (2 * pi * Spd)^2;
 end
 
-function fric = calcTurbFric(iVal, Tna, AgRatio)
+function fric = calcTurbFric(Tna, AgRatio)
 % This function is used by FluidDrag to calculate the turbulence friction coefficient.
-% iVal is the initial guess at the friction coefficient.
 % Tna is the "a" part of the Taylor number calculation.
 % AgRatio is the airgap over the rotor radius ratio.
-
-% Initialize variables
-iterateCount = 0;
-inc = 0.001;
-fric1 = iVal;
-fric2 = iVal * (1 + inc);
-
-while true
-    % Calculate Taylor numbers
-    CTF1 = exp(((1 + AgRatio) / (1.2 * sqrt(2 * fric1 * (1 + AgRatio / 2)))) - ...
-        log(sqrt(fric1 / 2) / (2 * (1 + AgRatio))) - 8.58);
-    CTF2 = exp(((1 + AgRatio) / (1.2 * sqrt(2 * fric2 * (1 + AgRatio / 2)))) - ...
-        log(sqrt(fric2 / 2) / (2 * (1 + AgRatio))) - 8.58);
-
-    error1 = (CTF1 - Tna);
-    error2 = (CTF2 - Tna);
-
-    % Check for convergence
-    if abs(error1) < 0.00001
+% Both can be vectors (element-wise).
+%
+% CTF(fric) = Tna is solved in v = -log(fric)/2, where it becomes
+%   h(v) = A*exp(v) + v + C = 0. h is increasing and convex, so Newton's
+%   method started right of the root converges monotonically and quadratically.
+
+A = (1 + AgRatio) ./ (1.2 * sqrt(2 * (1 + AgRatio / 2)));
+C = log(2 * sqrt(2) * (1 + AgRatio)) - 8.58 - log(Tna);
+valid = isfinite(C) & imag(C) == 0;     % Tna <= 0 has no solution
+C(~valid) = 0;
+
+% Upper bracket from log(u) >= 1 - 1/u, with u = exp(v): the positive root of A*u^2 + (1+C)*u - 1
+v = log(2 ./ ((1 + C) + sqrt((1 + C).^2 + 4 * A)));
+for iterateCount = 1:50
+    step = (A .* exp(v) + v + C) ./ (A .* exp(v) + 1);
+    v = v - step;
+    if all(abs(step) < 1e-12)
         break;  % Converged
     end
-
-    if abs(error1) < abs(error2)
-        % fric1 was a better guess
-        ratio = -error1 / error2;
-        fric1 = fric1 * (1 + (inc * ratio));
-        fric2 = fric1 * (1 + inc);
-    else
-        % fric2 was a better guess
-        ratio = -error1 / error2;
-        fric1 = fric1 * (1 - (inc * ratio));
-        fric2 = fric1 * (1 + inc);
-    end
-
-    iterateCount = iterateCount + 1;
-    if iterateCount > 1000000
-        fric1 = -1;  % Indicate failure to converge
-        break;
-    end
 end
 
 % Return the calculated friction coefficient
-fric = fric1;
+fric = exp(-2 * v);
+fric(~valid) = -1;  % Indicate no solution
 end
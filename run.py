@@ -1,2 +1,4 @@
 from MainWindow import run
-run()
\ No newline at end of file
+
+if __name__ == "__main__":  # island processes import this module again on Windows
+    run()
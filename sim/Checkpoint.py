@@ -0,0 +1,142 @@
+'''
+This script writes the state of a running optimization to disk so a run that was interrupted (crash, engine death,
+window closed) can be continued instead of started again.
+
+Inputs:
+    path,       checkpoint file
+    key,        fingerprint of the inputs of the run (CheckpointKey). A checkpoint is only resumed by a run with the same key
+    every_gen,  a checkpoint is written every `every_gen` generations ...
+    every_min,  ... or when `every_min` minutes passed since the last one, whichever comes first
+    callback,   (optional) the progress callback of the run, it is called every generation before the checkpoint
+
+Outputs:
+    checkpoint, a pymoo Callback that is passed to minimize in place of `callback`.
+                LoadCheckpoint(path, key) returns the saved algorithm, ready to be run again, or None.
+                CheckpointGeneration(path, key) returns the generation it would resume from, without loading it
+
+The checkpoint holds the algorithm without its problem and callback: population, current optimum (with the Motor
+records), evaluation counter, termination state and generation counter, plus the state of the random number
+generators. MotorOpt gives the restored termination the limits of the new run, so a run can resume with more ngens. The state is serialized in the generation loop with pickle (a few milliseconds, the population must
+not change while it is copied; dill is used for objects pickle cannot handle) and written to disk by a background
+thread, replacing the previous file at once so a crash while writing never leaves a broken checkpoint behind.
+The file starts with a small header (key and generation), so CheckpointGeneration does not unpickle the algorithm.
+Evaluated designs are kept by EvalCache (pass `path=` to keep them on disk too).
+'''
+import copy
+import hashlib
+import os
+import pickle
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+import dill
+import numpy as np
+from pymoo.core.callback import Callback
+
+# settings that can change between the interrupted run and the resumed one
+RESUMABLE_SETTINGS = ("ngens", "nprocesses", "BatchEval", "Checkpoint", "CheckpointEvery", "CheckpointMinutes", "Resume")
+
+
+def CheckpointKey(params, OptimizationConf, *args):
+    # variables by their bounds, constants and settings by value, plus any other inputs of the run (e.g. materials)
+    params = sorted((key, getattr(value, "bounds", getattr(value, "options", value))) for key, value in params.items())
+    conf = sorted((key, value) for key, value in OptimizationConf.items() if key not in RESUMABLE_SETTINGS)
+    record = (params, conf, args)
+    return hashlib.sha1(repr(record).encode()).hexdigest()
+
+
+class Checkpoint(Callback):
+
+    def __init__(self, path, key, every_gen=10, every_min=5.0, callback=None):
+        super().__init__()
+        self.path = path
+        self.key = key
+        self.every_gen = every_gen
+        self.every_min = every_min
+        self.callback = callback
+        self._last_gen = 0
+        self._last_time = time.time()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def notify(self, algorithm):
+        if self.callback is not None:
+            self.callback(algorithm)
+        if algorithm.n_iter - self._last_gen >= self.every_gen or time.time() - self._last_time >= 60 * self.every_min:
+            start = time.perf_counter()
+            self.save(algorithm)
+            if getattr(algorithm, "timings", None) is not None:
+                algorithm.timings.add("checkpoint", time.perf_counter() - start)
+
+    def save(self, algorithm):
+        self._last_gen = algorithm.n_iter
+        self._last_time = time.time()
+
+        state = copy.copy(algorithm)
+        state.problem = None   # holds the engine, it is given again on resume
+        state.callback = None
+        state.off = None       # the offspring of the next generation are made from the population
+        state.n_iter = algorithm.n_iter + 1  # the callback runs before pymoo moves to the next generation
+        header = pickle.dumps({"key": self.key, "n_iter": state.n_iter}, protocol=pickle.HIGHEST_PROTOCOL)
+        record = {"algorithm": state,
+                  "np_random": np.random.get_state(),
+                  "random": random.getstate()}
+        try:
+            data = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            try:
+                data = dill.dumps(record)  # much slower, only used when pickle cannot handle the state
+            except Exception as e:
+                print(f"Checkpoint not written: {e}")
+                return
+        self._executor.submit(self._write, header + data)
+
+    def _write(self, data):
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Checkpoint not written: {e}")
+
+    def close(self):
+        # waits for the last checkpoint to be on disk
+        self._executor.shutdown(wait=True)
+
+
+def _read_header(f):
+    # {"key", "n_iter"}, the file is left at the start of the state
+    return pickle.load(f)
+
+
+def LoadCheckpoint(path, key):
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        if _read_header(f)["key"] != key:
+            print(f"Checkpoint {path} was written for different inputs, starting a new run.")
+            return None
+        data = dill.load(f)
+    np.random.set_state(data["np_random"])
+    random.setstate(data["random"])
+    algorithm = data["algorithm"]
+    print(f"Resuming from checkpoint {path} at generation {algorithm.n_iter} ({algorithm.evaluator.n_eval} evaluations).")
+    return algorithm
+
+
+def CheckpointGeneration(path, key):
+    # generation a run with these inputs would resume from, None if there is nothing to resume
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            header = _read_header(f)
+    except Exception as e:
+        print(f"Checkpoint {path} cannot be read: {e}")
+        return None
+    return header["n_iter"] if header["key"] == key else None
+
+
+def RemoveCheckpoint(path):
+    if path and os.path.exists(path):
+        os.remove(path)
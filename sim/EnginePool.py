@@ -0,0 +1,107 @@
+'''
+This script spreads motor model evaluations across several engines (MATLAB engines or NumpyEngine).
+MATLAB runs each engine in its own process and releases the GIL while it computes, so a thread per engine
+is enough to keep N engines busy.
+
+Inputs:
+    engine_factory, a function without arguments that returns a new engine (e.g. start_matlab_engine, NumpyEngine)
+    n,              number of engines in the pool
+    engines,        already running engines to reuse. The pool starts n - len(engines) more in the background
+                    and never quits the engines it was given
+
+Outputs:
+    pool,           an object with the same entry points as the engine, `engine_type` is the class of its engines. A batch call is split into one chunk per
+                    engine and the rows come back in the input order. `starmap` can be used as a pymoo
+                    elementwise runner so a generation's designs are spread over the engines
+'''
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+
+class EnginePool:
+
+    def __init__(self, engine_factory, n, engines=()):
+        self.size = max(int(n), len(engines), 1)
+        self._idle = queue.Queue()
+        self._owned = []
+        self._lock = threading.Lock()
+        self._alive = len(engines)
+        self._closed = False
+        self._pending = self.size - len(engines)
+        # all the engines come from the same factory, engine_factory is the class itself for NumpyEngine
+        self.engine_type = type(engines[0]) if engines else engine_factory
+        for eng in engines:
+            self._idle.put(eng)
+
+        # start the missing engines in the background, they join the pool as soon as they are ready
+        for i in range(self._pending):
+            threading.Thread(target=self._start_engine, args=(engine_factory,), daemon=True).start()
+        self._executor = ThreadPoolExecutor(max_workers=self.size)
+
+    def _start_engine(self, engine_factory):
+        try:
+            eng = engine_factory()
+        except Exception as e:
+            print(f"EnginePool: could not start an engine: {e}")
+            with self._lock:
+                self._pending -= 1
+            return
+        with self._lock:
+            self._pending -= 1
+            closed = self._closed
+            if not closed:
+                self._alive += 1
+                self._owned.append(eng)
+        if closed:
+            eng.quit()  # the pool was shut down while this engine was starting
+        else:
+            self._idle.put(eng)
+
+    def _acquire(self):
+        while True:
+            try:
+                return self._idle.get(timeout=0.5)
+            except queue.Empty:
+                with self._lock:
+                    if self._alive == 0 and self._pending == 0:
+                        raise RuntimeError("EnginePool: no engine could be started")
+
+    def _call(self, name, *args, **kwargs):
+        eng = self._acquire()
+        try:
+            return getattr(eng, name)(*args, **kwargs)
+        finally:
+            self._idle.put(eng)
+
+    def UI_MotorCalcs_MATLAB_Vectorized(self, *args, **kwargs):
+        return self._call("UI_MotorCalcs_MATLAB_Vectorized", *args, **kwargs)
+
+    def UI_MotorCalcs_MATLAB_Batch(self, vars_name, vars_matrix, *args, **kwargs):
+        vars_matrix = np.asarray(vars_matrix, dtype=float)
+        chunks = [c for c in np.array_split(vars_matrix, min(self.size, len(vars_matrix))) if len(c)]
+        results = list(self._executor.map(lambda c: self._call("UI_MotorCalcs_MATLAB_Batch", vars_name, c, *args, **kwargs), chunks))
+        if kwargs.get("nargout", 1) > 1:
+            # (Outputs, MotorRecords) per chunk
+            Outputs = np.vstack([np.asarray(r[0], dtype=float).reshape(len(c), -1) for r, c in zip(results, chunks)])
+            return Outputs, [Motor for r in results for Motor in r[1]]
+        return np.vstack([np.asarray(r, dtype=float).reshape(len(c), -1) for r, c in zip(results, chunks)])
+
+    def starmap(self, f, iterable):
+        # pymoo's StarmapParallelization interface, results are returned in the input order
+        return list(self._executor.map(lambda args: f(*args), iterable))
+
+    def addpath(self, *args, **kwargs):
+        pass
+
+    def quit(self):
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            self._closed = True
+            owned, self._owned = self._owned, []
+        for eng in owned:
+            try:
+                eng.quit()
+            except Exception as e:
+                print(f"EnginePool: could not stop an engine: {e}")
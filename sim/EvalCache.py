@@ -0,0 +1,141 @@
+'''
+This script caches motor model evaluations so a design that was already evaluated never reaches the engine again.
+It wraps an engine (MATLAB engine, NumpyEngine or EnginePool) and exposes the same entry points.
+
+Inputs:
+    engine,     the engine that evaluates cache misses. Can be swapped with `cache.engine = ...`
+    maxsize,    number of designs kept in the in-memory LRU
+    path,       optional file name of an on-disk store (shelve) that survives between runs
+    digits,     significant digits the design variables are quantized to before hashing
+
+Outputs:
+    cache,      an object with the same entry points as the engine. `hits` and `misses` count lookups,
+                `stats()` returns them as a dictionary
+
+The key is a SHA-1 of the quantized design variables, the model constants (names starting with R_ or I_),
+the torque/speed requirement points and the three material properties, plus the engine class (of the engines of an
+EnginePool) and MODEL_VERSION. So an on-disk store shared by NumPy and MATLAB runs keeps their results apart and
+results of an older model are not used. Requirements that only enter the
+constraints (MinEff_, MaxWeight, VDC) are not part of the key, so runs that only change them reuse results.
+With nargout=2 the Motor record of each design is cached with its output row. PostProcess=True calls are
+passed through to the engine.
+'''
+import hashlib
+import shelve
+import threading
+from collections import OrderedDict
+import numpy as np
+from sim.MotorModel import PlainMotor
+from sim.MotorDesign import MODEL_VERSION
+from sim.EnginePool import EnginePool
+
+
+class EvalCache:
+
+    def __init__(self, engine, maxsize=100000, path=None, digits=12):
+        self.engine = engine
+        self.maxsize = maxsize
+        self.digits = digits
+        self.hits = 0
+        self.misses = 0
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self._store = shelve.open(path) if path else None
+
+    def __getattr__(self, name):
+        # everything that is not cached (addpath, starmap, plotting functions, ...) goes to the engine
+        if name == "engine":
+            raise AttributeError(name)
+        return getattr(self.engine, name)
+
+    def _quantize(self, value):
+        return float(f"{float(value):.{self.digits}g}")
+
+    def _backend(self):
+        # class of the engine, read from the class: a MATLAB engine returns a function for any attribute name
+        engine_type = self.engine.engine_type if isinstance(self.engine, EnginePool) else type(self.engine)
+        return f"{engine_type.__module__}.{engine_type.__qualname__}/{MODEL_VERSION}"
+
+    def _key(self, vars_name, vars_value, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, backend=None):
+        design = sorted((name, self._quantize(value)) for name, value in zip(vars_name, vars_value))
+        consts = sorted((name, self._quantize(value)) for name, value in zip(consts_name, consts_value) if name.startswith(("R_", "I_")))
+        record = (backend or self._backend(), design, consts,
+                  [self._quantize(v) for v in MinTor_Nm], [self._quantize(v) for v in SpeedReq_rpm],
+                  self._quantize(MagnetBr), self._quantize(MaxBMagnetIron), self._quantize(PresentBLaminationBackIron))
+        return hashlib.sha1(repr(record).encode()).hexdigest()
+
+    def _get(self, key, need_motor=False):
+        # entries are (output row, Motor record or None), an entry without a record is a miss if one is needed
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is None and self._store is not None and key in self._store:
+                entry = self._store[key]
+                self._put_memory(key, entry)
+            if entry is None or (need_motor and entry[1] is None):
+                self.misses += 1
+                return None
+            self._lru.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def _put_memory(self, key, entry):
+        self._lru[key] = entry
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.maxsize:
+            self._lru.popitem(last=False)
+
+    def _put(self, key, entry):
+        with self._lock:
+            self._put_memory(key, entry)
+            if self._store is not None:
+                self._store[key] = entry
+
+    def UI_MotorCalcs_MATLAB_Vectorized(self, vars_name, vars_value, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess, NumObj_, nargout=1):
+        if PostProcess:
+            return self.engine.UI_MotorCalcs_MATLAB_Vectorized(vars_name, vars_value, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess, NumObj_, nargout=nargout)
+
+        key = self._key(vars_name, vars_value, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm)
+        entry = self._get(key, nargout > 1)
+        if entry is None:
+            out = self.engine.UI_MotorCalcs_MATLAB_Vectorized(vars_name, vars_value, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess, NumObj_, nargout=nargout)
+            Mtr_res, Motor = out if nargout > 1 else (out, None)
+            entry = (np.asarray(Mtr_res, dtype=float).ravel(), PlainMotor(Motor))
+            self._put(key, entry)
+        if nargout > 1:
+            return [entry[0].tolist()], entry[1]
+        return [entry[0].tolist()]
+
+    def UI_MotorCalcs_MATLAB_Batch(self, vars_name, vars_matrix, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess, NumObj_, nargout=1):
+        vars_matrix = np.asarray(vars_matrix, dtype=float)
+        if PostProcess:
+            return self.engine.UI_MotorCalcs_MATLAB_Batch(vars_name, vars_matrix, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess, NumObj_, nargout=nargout)
+
+        backend = self._backend()
+        keys = [self._key(vars_name, x, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, backend) for x in vars_matrix]
+        entries = [self._get(key, nargout > 1) for key in keys]
+
+        # only the designs that are not cached go to the engine, in one call
+        miss = [i for i, entry in enumerate(entries) if entry is None]
+        if miss:
+            out = self.engine.UI_MotorCalcs_MATLAB_Batch(vars_name, vars_matrix[miss], consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess, NumObj_, nargout=nargout)
+            Mtr_res, Motors = out if nargout > 1 else (out, [None] * len(miss))
+            Mtr_res = np.asarray(Mtr_res, dtype=float).reshape(len(miss), -1)
+            for i, row, Motor in zip(miss, Mtr_res, Motors):
+                entries[i] = (row, PlainMotor(Motor))
+                self._put(keys[i], entries[i])
+        Outputs = np.vstack([entry[0] for entry in entries])
+        if nargout > 1:
+            return Outputs, [entry[1] for entry in entries]
+        return Outputs
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._lru)}
+
+    def close(self):
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def quit(self):
+        # the cache does not own its engine, only the on-disk store is closed
+        self.close()
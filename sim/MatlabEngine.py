@@ -0,0 +1,50 @@
+'''
+This script starts MATLAB engines with the motor model on their path.
+
+Inputs:
+    N/A
+
+Outputs:
+    eng,           MATLAB engine with the `matlab` folder of this project added to the path.
+                   start_matlab_engine_async returns a concurrent.futures.Future of it instead, so the caller
+                   (e.g. the GUI) is not blocked while MATLAB boots.
+                   get_shared_engine returns one engine per process, started on first use, so helpers such as the
+                   plotting functions do not start an extra MATLAB. set_shared_engine registers an engine that is
+                   already running (e.g. the one owned by MainWindow).
+'''
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+MATLAB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'matlab')
+
+_shared_engine = None
+_shared_engine_lock = threading.Lock()
+
+
+def start_matlab_engine():
+    import matlab.engine  # imported here so the NumPy model works without a MATLAB installation
+    eng = matlab.engine.start_matlab()
+    eng.addpath(MATLAB_PATH, nargout=0)
+    return eng
+
+
+def start_matlab_engine_async():
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(start_matlab_engine)
+    executor.shutdown(wait=False)  # the thread ends once the engine is up
+    return future
+
+
+def set_shared_engine(eng):
+    global _shared_engine
+    with _shared_engine_lock:
+        _shared_engine = eng
+
+
+def get_shared_engine():
+    global _shared_engine
+    with _shared_engine_lock:
+        if _shared_engine is None:
+            _shared_engine = start_matlab_engine()
+        return _shared_engine
@@ -0,0 +1,594 @@
+'''
+This script is a NumPy port of the MATLAB motor model, UI_MotorCalcs_MATLAB_Vectorized.m (Func_DesignMotor).
+The whole population is evaluated in one call: every per-design quantity is an array with one entry per design,
+and every per-operating-point quantity is a 2-D array with one row per design and one column per speed point.
+
+Inputs:
+    vars_name,     names of the optimization variables (same names as the MATLAB model)
+    vars_value,    values of the optimization variables. Each entry is a scalar or an array with one value per design
+    consts_name,   names of the constants
+    consts_value,  values of the constants
+    MinTor_Nm,     minimum torque requirement at each speed point
+    MagnetBr,      magnet Br (T)
+    MaxBMagnetIron,               maximum B in magnet assembly iron (T)
+    PresentBLaminationBackIron,   present B in lamination back iron (T)
+    SpeedReq_rpm,  speed requirement points (rpm)
+    PostProcess,   if False return the objective matrix, if True return the full Motor record
+
+Outputs:
+    Outputs,       (N, 2*NumPts+6) array, one row per design, same layout as the MATLAB model.
+                   Designs rejected by the model return the 1e6+0.5 penalty row.
+                   With PostProcess=True a Motor dict {"Params": {...}, "Results": {...}} of arrays is returned instead.
+                   With nargout=2 both are returned, (Outputs, Motor), like the second output of the MATLAB model.
+
+Note: the MATLAB entry point always runs with FLAGIT=false, CON=false, ASFLAG=0 and NumLamTeeth_ = 3*NP,
+      so only that path of Func_DesignMotor is ported (QTURNR = 1 and one winding per pole, NWP = 1).
+'''
+import numpy as np
+
+PENALTY = 1e6 + 0.5
+# version of the model results, part of the EvalCache key. Increase it when a change of this port or of the MATLAB
+# files gives other results for some designs (e.g. designs accepted that were rejected before)
+MODEL_VERSION = 2
+
+# Motor.Params.ErrorMessage codes of Func_DesignMotor
+ERROR_MESSAGES = {
+    1: "rotor/stator aspect ratio <> 20",
+    2: "rotor larger than stator",
+    3: "RL3 < RL2",
+    4: "slot area negative",
+    5: "slot opening negative",
+    6: "no coil flux solution",
+    7: "MagnetBackIronInnerR_m less than zero",
+    8: "magnet backiron flux density too high",
+    11: "stator L/D aspect ratio <> 10",  # the MATLAB model exits without setting a code for this one
+}
+
+
+def _set_error(ErrorMessage, mask, code):
+    # only the first failing check of a design is recorded, like the early returns in MATLAB
+    ErrorMessage[(ErrorMessage == 0) & mask] = code
+
+
+def BuildMotorParams(vars_name, vars_value, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm):
+    """Mirror of the Motor.Params set up in UI_MotorCalcs_MATLAB_Vectorized, broadcast over the population."""
+    values = dict(zip(consts_name, consts_value))
+    values.update(zip(vars_name, vars_value))
+    N = max([np.size(v) for v in vars_value] + [1])
+
+    def col(name):
+        return np.broadcast_to(np.asarray(values[name], dtype=float), (N,)).copy()
+
+    MatMinTor_Nm = np.asarray(MinTor_Nm, dtype=float)
+    CurrentMultiple = MatMinTor_Nm / np.max(MatMinTor_Nm)
+
+    P = dict()
+    P["VacMagneticPerm_H_m"] = 1e-6                      # Magnetic perm of a vacuum (H/m)
+    P["SCL"] = 0.0254                                    # Scale Factor, inches to meter
+    P["MagneticLossCoef1"] = col("R_MagneticLossCoef1")  # Magnetic loss coeff, a1
+    P["MagneticLossCoef2"] = col("R_MagneticLossCoef2")  # Magnetic loss coeff, a2
+    P["MagneticLossCoef3"] = col("R_MagneticLossCoef3")  # Magnetic loss coeff, a3
+    P["FLDGAP"] = col("R_AirgapRadialLength")            # Fluid gap, (m)
+    P["KINVSC"] = col("R_FluidKinVisc")                  # Fluid Kinematic Viscosity (cSt)
+    P["SPGRAV"] = col("R_FluidSpecificGrav")             # Fluid Specific gravity (-)
+    P["FDENSTY"] = P["SPGRAV"] * 998                     # Fluid density (kg/m^3)
+    P["ASFLAG"] = 0
+    P["GearRatio"] = col("R_GearRatio")                  # Gear Ratio (-)
+
+    P["R_MtrLength_m"] = col("R_MtrLength")                                      # Motor length (m)
+    P["R_LaminatR_m"] = col("R_LaminatR")                                        # Lamination radius (m)
+    P["R_LaminatToothWedgeThickness_m"] = col("R_LaminatToothWedgeThickness")    # Lamination tooth tip and wedge thickness (m)
+    P["R_MagnetOutR_m"] = col("R_MagnetOutR")                                    # Magnet outer radius (m)
+    P["AirgapRadialLength_m"] = col("R_AirgapRadialLength")                      # Radial length of airgap (m)
+    P["R_MagnetRadialLength_m"] = col("R_MagnetRadialLength")                    # Radial length of magnet (m)
+    P["MagnetBackIronInnerR_m"] = col("R_MagnetBackIronInnerR")                  # Magnet assembly backiron inner radius (m)
+    P["MagnetBr_T"] = float(MagnetBr)                                            # Magnet Br (T)
+    P["PresentBLaminationBackIron_T"] = float(PresentBLaminationBackIron)        # Present B in lamination back iron (T)
+    P["PresentBLaminationToothIron_T"] = float(PresentBLaminationBackIron)       # Present B in lamination tooth iron (T)
+    P["MaxBMagnetIron_T"] = float(MaxBMagnetIron)                                # Maximum B in magnet assembly iron (T)
+    P["WIRER"] = col("R_WireCopperR")                                            # wire copper radius (m)
+    P["InsulThick_m"] = col("R_InsulThick")
+    P["FillFactor_"] = col("R_FillFactor")                                       # Fill factor (-)
+    P["LamSlotLinerThick_m"] = col("R_LamSlotLinerThick")                        # Lamination slot liner thickness (m)
+    P["RatedCurrent6Step_A"] = col("R_PhaseCurrentAmp") * np.sqrt(3) / 2         # Rated current, 6-step (A)
+    P["NP"] = np.round(col("I_PolePair")) * 2                                    # # of magnet assembly poles (-)
+    P["NumLamTeeth_"] = np.round(col("I_PolePair")) * 2 * 3                      # # of lamination teeth (-)
+    P["NumElecPhase_"] = np.round(col("I_NumElecPhase"))                         # # of electrical phases (-)
+    P["LoadInertia_ozin_s2"] = 1385.43 * col("R_LoadInertia")                    # Load inertia reflected to motor (oz-in/sec^2)
+
+    # Power points for motor loss calcs, one row per design and one column per speed point
+    P["OperCurrent_A"] = P["RatedCurrent6Step_A"][:, None] * CurrentMultiple[None, :]                          # Current points (A)
+    P["MtrSpeed_rpm"] = P["GearRatio"][:, None] * np.asarray(SpeedReq_rpm, dtype=float)[None, :]              # Speed points (rpm)
+    P["DUTCY"] = 100 * np.ones((N, len(MatMinTor_Nm)))                                                         # Duty cycle points (%)
+    return P
+
+
+def CoilGeometry(FLUXC, FLUXM, P):
+    """STEP 3 to STEP 8 of the design loop: geometry, turns and actual coil flux for an assumed coil flux."""
+    L = P["R_MtrLength_m"]
+    NP = P["NP"]
+    NumLamTeeth_ = P["NumLamTeeth_"]
+    RL1 = P["R_MagnetOutR_m"] + P["AirgapRadialLength_m"]
+    RL2 = RL1 + P["R_LaminatToothWedgeThickness_m"]
+
+    G = dict()
+    FLUXMT = (FLUXM + (2 * FLUXC)) / (NumLamTeeth_ / NP)                                    # Maximum total flux per tooth
+    G["TW"] = FLUXMT / (L * P["PresentBLaminationToothIron_T"])                              # Tooth width
+    G["BTL"] = (FLUXM + (2 * FLUXC)) / (2 * L * P["PresentBLaminationBackIron_T"])           # Lamination backiron thickness
+    G["BTM"] = (FLUXM + (2 * FLUXC)) / (2 * L * P["MaxBMagnetIron_T"])                       # Magnet assembly backiron thickness
+    G["RL3"] = P["R_LaminatR_m"] - G["BTL"]                                                  # ID of lamination backiron
+    G["ASL"] = ((np.pi * (G["RL3"]**2 - RL2**2)) - (G["TW"] * (G["RL3"] - RL2) * NumLamTeeth_)) / (NP * P["NumElecPhase_"])   # Lamination slot area
+    G["AS"] = G["ASL"] - (2 * (G["RL3"] - RL2) * P["LamSlotLinerThick_m"]) - (((2 * np.pi * G["RL3"] / NumLamTeeth_) - G["TW"]) * P["LamSlotLinerThick_m"])  # Winding Slot area
+    G["CIRCUM"] = 2 * np.pi * RL1                                                            # Arc length of lamination ID
+    G["SPAN"] = G["CIRCUM"] / NumLamTeeth_                                                   # Arc length of one tooth pitch
+    G["SW"] = G["SPAN"] - G["TW"]                                                            # Approx width of slot opening
+    G["WireWInsR"] = P["WIRER"] + P["InsulThick_m"] / 2                                      # Wire radius, heavy insulation
+    G["WIREA"] = np.pi * (G["WireWInsR"]**2)                                                 # Wire area
+    G["N"] = G["AS"] * P["FillFactor_"] / (G["WIREA"] * 2)                                   # Turns in available area
+    AMAG = 2 * np.pi * L * (P["R_MagnetOutR_m"] - P["R_MagnetRadialLength_m"] / 2) / NP
+    G["ACTFC"] = G["N"] * P["RatedCurrent6Step_A"] * P["VacMagneticPerm_H_m"] * AMAG / (P["AirgapRadialLength_m"] + P["R_MagnetRadialLength_m"])  # Actual coil flux
+    return G
+
+
+def SolveCoilFlux(FLUXM, P, ErrorMessage):
+    """Coil flux of Func_DesignMotor, FLUXC = ACTFC(FLUXC), solved in closed form for all designs at once.
+
+    With S = FLUXM + 2*FLUXC the tooth width and backiron thickness are linear in S, so the winding slot area AS
+    (and ACTFC = k*AS) is a quadratic in FLUXC. The fixed point is the smallest positive root of
+    k*AS(FLUXC) - FLUXC = 0, which is the point the original halving iteration converges to.
+    """
+    L = P["R_MtrLength_m"]
+    NP = P["NP"]
+    NumLamTeeth_ = P["NumLamTeeth_"]
+    lt = P["LamSlotLinerThick_m"]
+    R = P["R_LaminatR_m"]
+    RL2 = P["R_MagnetOutR_m"] + P["AirgapRadialLength_m"] + P["R_LaminatToothWedgeThickness_m"]
+    active = ErrorMessage == 0
+
+    # Check the geometry at the starting guess of the original loop (0.5% of magnet flux)
+    G = CoilGeometry(FLUXM * 0.005, FLUXM, P)
+    for code, bad in ((3, G["RL3"] <= RL2), (4, G["AS"] <= 0), (5, G["SW"] <= 0)):
+        _set_error(ErrorMessage, active & bad, code)
+        active &= ~bad
+
+    # TW = t*S, RL3 = R - b*S and AS = a0 + a1*S + a2*S^2
+    t = NP / (NumLamTeeth_ * L * P["PresentBLaminationToothIron_T"])
+    b = 1 / (2 * L * P["PresentBLaminationBackIron_T"])
+    D = NP * P["NumElecPhase_"]
+    a0 = np.pi * (R**2 - RL2**2) / D - 2 * lt * (R - RL2) - 2 * np.pi * lt * R / NumLamTeeth_
+    a1 = (-2 * np.pi * R * b - NumLamTeeth_ * t * (R - RL2)) / D + 2 * lt * b + 2 * np.pi * lt * b / NumLamTeeth_ + lt * t
+    a2 = (np.pi * b**2 + NumLamTeeth_ * t * b) / D
+
+    # ACTFC = k*AS
+    AMAG = 2 * np.pi * L * (P["R_MagnetOutR_m"] - P["R_MagnetRadialLength_m"] / 2) / NP
+    WIREA = np.pi * (P["WIRER"] + P["InsulThick_m"] / 2)**2
+    k = P["FillFactor_"] / (WIREA * 2) * P["RatedCurrent6Step_A"] * P["VacMagneticPerm_H_m"] * AMAG / (P["AirgapRadialLength_m"] + P["R_MagnetRadialLength_m"])
+
+    # k*AS(FLUXM + 2*FLUXC) - FLUXC = q2*FLUXC^2 + q1*FLUXC + q0
+    q0 = k * (a0 + a1 * FLUXM + a2 * FLUXM**2)
+    q1 = 2 * k * (a1 + 2 * a2 * FLUXM) - 1
+    q2 = 4 * k * a2
+    disc = q1**2 - 4 * q2 * q0
+    den = -q1 + np.sqrt(np.maximum(disc, 0))
+    noroot = (disc < 0) | (q0 <= 0) | (den <= 0)   # no positive fixed point, the iteration could not converge
+    _set_error(ErrorMessage, active & noroot, 6)
+    active &= ~noroot
+    with np.errstate(divide="ignore", invalid="ignore"):
+        FLUXC = np.where(active, 2 * q0 / den, FLUXM * 0.005)  # smaller root, cancellation-free form
+
+    # Check for valid dimensions, slot area and slot opening at the solution
+    G = CoilGeometry(FLUXC, FLUXM, P)
+    for code, bad in ((3, G["RL3"] <= RL2), (4, G["AS"] <= 0), (5, G["SW"] <= 0)):
+        _set_error(ErrorMessage, active & bad, code)
+        active &= ~bad
+    return FLUXC
+
+
+def LimitChecks(P, ErrorMessage):
+    """Limit checks at the start of Func_DesignMotor: stator L/D aspect ratio, rotor/stator aspect ratio and rotor larger than stator."""
+    L = P["R_MtrLength_m"]
+    _set_error(ErrorMessage, (P["R_LaminatR_m"] > 10 * L) | (P["R_LaminatR_m"] < 0.1 * L), 11)
+    _set_error(ErrorMessage, (P["R_MagnetOutR_m"] > 20 * L) | (P["R_MagnetOutR_m"] < 0.05 * L), 1)
+    _set_error(ErrorMessage, P["R_MagnetOutR_m"] >= P["R_LaminatR_m"], 2)
+
+
+def MagnetFlux(P):
+    """STEP 1 of Func_DesignMotor: flux generated by the magnet in the airgap."""
+    GR = P["R_MagnetRadialLength_m"] / P["AirgapRadialLength_m"]                                          # Gap ratio
+    AMAG = 2 * np.pi * P["R_MtrLength_m"] * (P["R_MagnetOutR_m"] - P["R_MagnetRadialLength_m"] / 2) / P["NP"]  # Average magnet area
+    return P["MagnetBr_T"] * AMAG * (GR / (1 + GR))
+
+
+def MagnetBackIron(FLUXM, FLUXC, BTM, P, ErrorMessage):
+    """STEP 10 of Func_DesignMotor: magnet assembly backiron inner radius, its flux density and actual thickness."""
+    RM3 = P["R_MagnetOutR_m"] - P["R_MagnetRadialLength_m"]                                  # Magnet assembly backiron outer radius
+    MagnetBackIronInnerR_m = P["MagnetBackIronInnerR_m"].copy()
+    calcRM4 = MagnetBackIronInnerR_m <= 0
+    ARB = np.where(calcRM4, P["MaxBMagnetIron_T"], (FLUXM + (2 * FLUXC)) / (2 * P["R_MtrLength_m"] * (RM3 - MagnetBackIronInnerR_m)))
+    ACTRM4 = np.where(calcRM4, 0.0, RM3 - MagnetBackIronInnerR_m)                           # Actual backiron thickness
+    MagnetBackIronInnerR_m = np.where(calcRM4, RM3 - BTM, MagnetBackIronInnerR_m)
+    _set_error(ErrorMessage, calcRM4 & (MagnetBackIronInnerR_m < 0), 7)
+    MagnetBackIronInnerR_m = np.where(calcRM4 & (MagnetBackIronInnerR_m < 0), 0.0, MagnetBackIronInnerR_m)
+    _set_error(ErrorMessage, ~calcRM4 & (ARB > P["MaxBMagnetIron_T"]), 8)
+    return MagnetBackIronInnerR_m, ARB, ACTRM4
+
+
+def GeometryErrors(P):
+    """ErrorMessage of the checks Func_DesignMotor makes on the geometry alone (codes 11, 1, 2, 3 to 6 of the coil flux and 7, 8 of the backiron).
+
+    They are cheap, so designs that would be rejected can be found before they are sent to an engine.
+    """
+    ErrorMessage = np.zeros(P["R_MtrLength_m"].shape, dtype=int)
+    with np.errstate(all="ignore"):
+        LimitChecks(P, ErrorMessage)
+        FLUXM = MagnetFlux(P)
+        FLUXC = SolveCoilFlux(FLUXM, P, ErrorMessage)
+        MagnetBackIron(FLUXM, FLUXC, CoilGeometry(FLUXC, FLUXM, P)["BTM"], P, ErrorMessage)
+    return ErrorMessage
+
+
+def calcTurbFric(Tna, AgRatio):
+    """Turbulence friction coefficient used by fluidDrag, solved for arrays of Taylor numbers.
+
+    CTF(fric) = Tna is written in v = -ln(fric)/2 as h(v) = A*exp(v) + v + C = 0, which is increasing and convex,
+    so Newton's method started right of the root converges monotonically and quadratically. Entries with no
+    solution (Tna <= 0) return -1, like the original solver did when it failed to converge.
+    """
+    Tna, AgRatio = np.broadcast_arrays(np.asarray(Tna, dtype=float), np.asarray(AgRatio, dtype=float))
+    A = (1 + AgRatio) / (1.2 * np.sqrt(2 * (1 + AgRatio / 2)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        C = np.log(2 * np.sqrt(2) * (1 + AgRatio)) - 8.58 - np.log(Tna)
+    valid = np.isfinite(C)
+    C = np.where(valid, C, 0.0)
+
+    # Upper bracket from ln(u) >= 1 - 1/u, with u = exp(v): the positive root of A*u^2 + (1+C)*u - 1
+    v = np.log(2 / ((1 + C) + np.sqrt((1 + C)**2 + 4 * A)))
+    for iterateCount in range(50):
+        step = (A * np.exp(v) + v + C) / (A * np.exp(v) + 1)
+        v = v - step
+        if np.all(np.abs(step) < 1e-12):
+            break  # Converged
+    return np.where(valid, np.exp(-2 * v), -1.0)
+
+
+class TurbFricTable:
+    """
+    Precomputed calcTurbFric over (TaylorA, airgap ratio), built once per run and interpolated
+    bilinearly in (ln TaylorA, airgap ratio) on ln(fric). Points outside the grid are solved directly.
+    """
+
+    def __init__(self, TaylorA=(1e0, 1e9), AgRatio=(1e-4, 0.2), NumTaylorA=400, NumAgRatio=60):
+        self.lnTaylorA = np.linspace(np.log(TaylorA[0]), np.log(TaylorA[1]), NumTaylorA)
+        self.AgRatio = np.linspace(AgRatio[0], AgRatio[1], NumAgRatio)
+        self.lnFric = np.log(calcTurbFric(np.exp(self.lnTaylorA)[:, None], self.AgRatio[None, :]))
+
+    def __call__(self, Tna, AgRatio):
+        Tna, AgRatio = np.broadcast_arrays(np.asarray(Tna, dtype=float), np.asarray(AgRatio, dtype=float))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = np.log(Tna)
+        y = AgRatio
+        inside = (x >= self.lnTaylorA[0]) & (x <= self.lnTaylorA[-1]) & (y >= self.AgRatio[0]) & (y <= self.AgRatio[-1])
+
+        fric = np.empty(Tna.shape)
+        xi, yi = x[inside], y[inside]
+        i = np.clip(np.searchsorted(self.lnTaylorA, xi) - 1, 0, len(self.lnTaylorA) - 2)
+        j = np.clip(np.searchsorted(self.AgRatio, yi) - 1, 0, len(self.AgRatio) - 2)
+        tx = (xi - self.lnTaylorA[i]) / (self.lnTaylorA[i + 1] - self.lnTaylorA[i])
+        ty = (yi - self.AgRatio[j]) / (self.AgRatio[j + 1] - self.AgRatio[j])
+        F = self.lnFric
+        fric[inside] = np.exp((1 - tx) * (1 - ty) * F[i, j] + tx * (1 - ty) * F[i + 1, j] + (1 - tx) * ty * F[i, j + 1] + tx * ty * F[i + 1, j + 1])
+        fric[~inside] = calcTurbFric(Tna[~inside], AgRatio[~inside])
+        return fric
+
+
+def fluidDrag(Speed, Density, DynVisc, Radius, Length, airgap, FricTable=None):
+    """Fluid drag torque in the air gap (N-m), GE model. Speed in rpm; all inputs broadcast together.
+    If a TurbFricTable is given as FricTable the turbulence friction coefficient is interpolated from it."""
+    Spd = Speed / 60  # Convert rpm to revolutions per second
+    Airgapratio = airgap / Radius
+
+    # Taylor number components
+    TaylorA = Density * 2 * np.pi * Spd * Radius * airgap / DynVisc
+    TaylorB = np.sqrt(airgap / Radius)
+    Taylor = TaylorA * TaylorB
+
+    TN1 = (2 * (1 + Airgapratio)**2) / (TaylorA * (1 + 0.5 * Airgapratio))
+    TN2 = 0.11 * (Taylor**0.854) / TaylorA
+    TN3 = 0.476 * np.sqrt(TaylorB) / np.sqrt(TaylorA)
+    TN4 = calcTurbFric(TaylorA, Airgapratio) if FricTable is None else FricTable(TaylorA, Airgapratio)
+
+    # Determine the value based on Taylor number
+    Value = np.where(Taylor < 41.3, TN1, np.where(Taylor < 63.0, TN2, np.where(TN3 > TN4, TN3, TN4)))
+
+    return Value * np.pi * Length * Density * (Radius**4) * (2 * np.pi * Spd)**2
+
+
+def Func_DesignMotor(P, FricTable=None):
+    """Vectorized Func_DesignMotor. Returns (Results, ErrorMessage); rows with ErrorMessage != 0 are not valid designs."""
+    eps = np.finfo(float).eps
+    VacMagneticPerm_H_m = P["VacMagneticPerm_H_m"]
+    SCL = P["SCL"]
+    R_MtrLength_m = P["R_MtrLength_m"]
+    R_LaminatR_m = P["R_LaminatR_m"]
+    R_MagnetOutR_m = P["R_MagnetOutR_m"]
+    AirgapRadialLength_m = P["AirgapRadialLength_m"]
+    R_MagnetRadialLength_m = P["R_MagnetRadialLength_m"]
+    MagnetBr_T = P["MagnetBr_T"]
+    PresentBLaminationBackIron_T = P["PresentBLaminationBackIron_T"]
+    PresentBLaminationToothIron_T = P["PresentBLaminationToothIron_T"]
+    MaxBMagnetIron_T = P["MaxBMagnetIron_T"]
+    WIRER = P["WIRER"]
+    InsulThick_m = P["InsulThick_m"]
+    RatedCurrent6Step_A = P["RatedCurrent6Step_A"]
+    NP = P["NP"]
+    NumLamTeeth_ = P["NumLamTeeth_"]
+    NumElecPhase_ = P["NumElecPhase_"]
+
+    # per design columns broadcast against the operating points
+    c = lambda v: np.asarray(v)[..., None] if np.ndim(v) else v
+    OperCurrent_A = P["OperCurrent_A"]
+    MtrSpeed_rpm = P["MtrSpeed_rpm"]
+
+    ErrorMessage = np.zeros(R_MtrLength_m.shape, dtype=int)
+
+    with np.errstate(all="ignore"):
+        # Calculated values
+        RL1 = R_MagnetOutR_m + AirgapRadialLength_m                            # Lamination tooth tip diameter
+        RL2 = RL1 + P["R_LaminatToothWedgeThickness_m"]                        # Lamination slot ID
+        GR = R_MagnetRadialLength_m / AirgapRadialLength_m                     # Gap ratio
+        RM2 = R_MagnetOutR_m - R_MagnetRadialLength_m                          # Magnet inner radius
+        RM3 = RM2                                                              # Magnet assembly backiron outer radius
+        VOLUMN = R_MtrLength_m * np.pi * (R_LaminatR_m**2)                     # Volume
+        MVOL = R_MtrLength_m * np.pi * (R_MagnetOutR_m**2 - RM2**2)            # Magnet volume
+
+        # Limit checks
+        LimitChecks(P, ErrorMessage)
+
+        # STEP 1: magnet area and flux generated by the magnet
+        FLUXM = MagnetFlux(P)
+
+        # STEP 2 - STEP 9: converge the coil flux
+        FLUXC = SolveCoilFlux(FLUXM, P, ErrorMessage)
+        G = CoilGeometry(FLUXC, FLUXM, P)
+        TW, BTL, BTM, RL3 = G["TW"], G["BTL"], G["BTM"], G["RL3"]
+        N, ACTFC = G["N"], G["ACTFC"]
+
+        # STEP 10: magnet assembly backiron
+        MagnetBackIronInnerR_m, ARB, ACTRM4 = MagnetBackIron(FLUXM, FLUXC, BTM, P, ErrorMessage)
+
+        # Torque Total Machine (QTURNR = 1)
+        TOR = (MagnetBr_T * NP * R_MagnetRadialLength_m * N * RatedCurrent6Step_A * (R_MagnetOutR_m + RM2) * R_MtrLength_m) / (R_MagnetRadialLength_m + AirgapRadialLength_m)
+        KT = TOR / RatedCurrent6Step_A          # Newton-meters/amp
+        KB = KT                                 # In metric Kt=Kb
+
+        # Resistance per phase
+        RPM = 1.8e-8 / (np.pi * WIRER**2)       # Resistance per meter of current wire size
+        RSAVE = (RL3 + RL3 + RL2) / 3           # Average radius of the lamination coil area
+        NWP = NumLamTeeth_ / (3 * NP)           # Not 1 for multi-teared windings
+        DCORD = np.where(NP == 2, 2 * RSAVE, 2 * (RSAVE * np.sin((2 * np.pi) / NP / 2)))
+        WireAxialOverhang = 1 * SCL             # wire axial overhang over stator stack length
+        LengthOneTurn = 2 * NWP * NP * (R_MtrLength_m + WireAxialOverhang) + 2 * RSAVE * (2 * np.pi / NP) * NP * NWP  # equation VII-32
+        RES = RPM * N * LengthOneTurn
+
+        # Endturn length (regular # of slots)
+        ETL = NP * N * (np.pi * DCORD / 2) * NumElecPhase_                  # Wire length of endturns for all phases
+        VET = ETL * (np.pi * (WIRER + InsulThick_m / 2)**2) / 0.375         # Endturn volume required at 37.5% fill
+        ETA = np.pi * (((R_LaminatR_m + RL3) / 2)**2 - RL2**2)              # Area available for endturns
+        ETD = VET / ETA                                                     # Height of endturn volume
+        ZETD = R_MtrLength_m + (2 * ETD)                                    # Total Length including endturns
+
+        # Inductance per phase (SRP method). Each of the NumLamTeeth_/NP teeth of a pole carries N turns
+        TeethPerPole = NumLamTeeth_ / NP
+        LGE = AirgapRadialLength_m
+        PC = R_MagnetRadialLength_m / AirgapRadialLength_m                  # Permeance coefficient
+        RMAVE = (R_MagnetOutR_m + RM2) / 2                                  # Average magnet radius
+        Rtooth = (LGE + PC * LGE) * NumLamTeeth_ / (VacMagneticPerm_H_m * 2 * np.pi * RMAVE * R_MtrLength_m)
+        Lgap = TeethPerPole * N**2 / Rtooth
+        Rend = np.pi / (2 * VacMagneticPerm_H_m * TW)
+        Lend = TeethPerPole * 2 * N**2 / Rend
+        arg1 = np.abs(RL3 - TW * NumLamTeeth_ / (2 * np.pi))
+        arg2 = np.abs(RL2 - TW * NumLamTeeth_ / (2 * np.pi))
+        Rcs = 2 * np.pi / (VacMagneticPerm_H_m * R_MtrLength_m * NumLamTeeth_ * (np.log(arg1) - np.log(arg2)))
+        PHI_CS = 2 * N * RatedCurrent6Step_A / Rcs
+        Lcs = 2 * N * PHI_CS / RatedCurrent6Step_A
+        INDP = NP * (Lgap + Lend + Lcs)
+        Minduct = 0.33 * INDP
+        ind_ln2ln = 2 * (INDP + Minduct)
+
+        # Inertia
+        JR = 0.5 * 7250 * np.pi * R_MtrLength_m * (R_MagnetOutR_m**4) / 9.807   # Kg-m-sec^2
+
+        # Stator volume, weight and surface area
+        VOL1 = np.pi * (R_LaminatR_m**2 - RL3**2) * R_MtrLength_m           # Backiron volume
+        VOL2 = NumLamTeeth_ * TW * (RL3 - RL1) * R_MtrLength_m              # Tooth volume
+        WHT1 = VOL1 * 7650                                                  # Backiron weight
+        WHT2 = VOL2 * 7650                                                  # Tooth weight
+        FeWHT = WHT1 + WHT2                                                 # Lamination weight
+        STAREA = R_MtrLength_m * (2 * np.pi * R_LaminatR_m) + 2 * (np.pi * R_LaminatR_m**2)  # Stator Surface Area
+        CuWHT = RES / RPM * (np.pi * WIRER**2) * NumElecPhase_ * 8906       # Copper weight
+        RWHT = R_MtrLength_m * np.pi * (R_MagnetOutR_m**2) * 7250           # Rotor weight
+        WHT = FeWHT + CuWHT + RWHT                                          # Total Weight
+
+        # Losses at each of the speed/current points
+        WATR = 2 * (OperCurrent_A**2) * c(RES)                              # I^2R Losses
+        FREQ = MtrSpeed_rpm / 60 * c(NP / 2)                                # Magnetic frequency in Hertz
+        a1, a2, a3 = c(P["MagneticLossCoef1"]), c(P["MagneticLossCoef2"]), c(P["MagneticLossCoef3"])
+        WATMB = c(WHT1 * 2.2) * a1 * (PresentBLaminationBackIron_T**a2) * (FREQ**a3)   # Backiron losses
+        WATMT = c(WHT2 * 2.2) * a1 * (PresentBLaminationToothIron_T**a2) * (FREQ**a3)  # Tooth losses
+        WATM = WATMB + WATMT
+        FreqElec_rad_s = FREQ * 2 * np.pi
+        FreqMech_rad_s = MtrSpeed_rpm / 60 * 2 * np.pi                      # Shaft Speed radians/sec
+        DYNVISC = 0.000001 * P["FDENSTY"] * P["KINVSC"]                     # Dynamic Viscosity
+        BFTORQ = np.zeros(MtrSpeed_rpm.shape)
+        spinning = (MtrSpeed_rpm > 0) & c(ErrorMessage == 0)
+        if spinning.any():
+            rows = np.nonzero(spinning)[0]
+            BFTORQ[spinning] = fluidDrag(MtrSpeed_rpm[spinning], P["FDENSTY"][rows], DYNVISC[rows], R_MagnetOutR_m[rows], R_MtrLength_m[rows], P["FLDGAP"][rows], FricTable)
+        WATF = 0.000739 * (141.6 * BFTORQ) * MtrSpeed_rpm                   # Fluid damping power losses, Watts
+        WATT = WATR + WATM + WATF                                           # Total losses
+
+        TauEM_Nm = c(KT) * OperCurrent_A                                    # EM Torque
+        TauShaft_Nm = TauEM_Nm - (WATM + WATF) / (FreqMech_rad_s + 10 * eps)
+        PwrShaft_W = TauShaft_Nm * FreqMech_rad_s
+        EffMtr_ = PwrShaft_W / (PwrShaft_W + WATT + 10 * eps)               # Motor Efficiency
+
+        # Voltage (Id = 0)
+        Iq_APkN = OperCurrent_A * 2 / np.sqrt(3)
+        Vq_VPhPkN = Iq_APkN * c(RES) + FreqMech_rad_s * c(KB) / np.sqrt(3)
+        Vd_VPhPkN = -FreqElec_rad_s * c(INDP) * Iq_APkN
+        VMag_VPhPkN = np.sqrt(Vq_VPhPkN**2 + Vd_VPhPkN**2)
+        PwrElec_W = 3 / 2 * (Vq_VPhPkN * Iq_APkN)
+
+        # Voltage, different calculation
+        VsixstepL2LReal = OperCurrent_A * 2 * c(RES) + FreqMech_rad_s * c(KB)
+        VsixstepL2LImag = c(ind_ln2ln) * FreqElec_rad_s * OperCurrent_A
+        VsixstepL2LMag = np.sqrt(VsixstepL2LReal**2 + VsixstepL2LImag**2)
+
+        # Totals
+        WATRT = np.sum(WATR / 4, axis=1)        # Total resistive losses
+        WATMT = np.sum(WATM / 4, axis=1)        # Total magnetic losses
+        WATFT = np.sum(WATF / 4, axis=1)        # Total fluid losses
+        WATGT = np.sum(WATT / 4, axis=1)        # Grand total losses
+        WATFMT = WATFT + WATMT                  # Fluid and magnetic losses
+
+        # FOM's (Figure of Merit)
+        ACCL = TOR / (JR + P["LoadInertia_ozin_s2"])                     # Torque/inertia
+        TPSW = TOR / np.sqrt((RatedCurrent6Step_A**2) * RES)             # Torque/sqrt(watt)
+        CDEN = RatedCurrent6Step_A / (np.pi * (WIRER**2))                # Current density
+
+    Results = {
+        "LamTTipR_m": RL1,
+        "LamSlotR_m": RL2,
+        "MagInR_m": RM2,
+        "MagBackIranOutR_m": RM3,
+        "MagBackIronInR_m": MagnetBackIronInnerR_m,
+        "ActualBackIronThick_m": ACTRM4,
+        "ToothWidth_m": TW,
+        "GapRatio": GR,
+        "BackIronThickLam_m": BTL,
+        "BackIronThickMag_m": BTM,
+        "LamSlotOutR_m": RL3,
+        "LamSlotA_m2": G["ASL"],
+        "WindSlotA_m2": G["AS"],
+        "ArcLamID_m": G["CIRCUM"],
+        "ArcToothPitch_m": G["SPAN"],
+        "SlotOpenWidth_m": G["SW"],
+        "WireWInsR_m": G["WireWInsR"],
+        "WIREA_m2": G["WIREA"],
+        "NumTurn": N,
+        "ActualFluxDens": ARB,
+        "ActualCoilFlux": ACTFC,
+        "RateTrqPPhase_Nm": TOR,
+        "KT_Nm_A": KT,
+        "KB_VLLPkNs_rad": KB,
+        "InducPh_H": INDP,
+        "ResisPh_ohm": RES,
+        "Inertia_Nms2": JR,
+        "TrqPerInertia_1_s2": ACCL,
+        "TPSW": TPSW,
+        "Volume_m3": VOLUMN,
+        "MagVol_m3": MVOL,
+        "StatorSurfA_m2": STAREA,
+        "Weight_kg": WHT,
+        "FeWeight_kg": FeWHT,
+        "CuWeight_kg": CuWHT,
+        "RotWeight_kg": RWHT,
+        "CurrDens_A_m2": CDEN,
+        "ZETD": ZETD,
+        "ZTOTAL": ZETD,
+        "ResLoss_W": WATR,
+        "BackIronLoss_W": WATM,
+        "FluidLoss_W": WATF,
+        "MeanResLoss_W": WATRT,
+        "MeanBackIronLoss_W": WATMT,
+        "MeanFluidLoss_W": WATFT,
+        "MeanWATFMT": WATFMT,
+        "MeanTotalLoss_W": WATGT,
+        "EffMtr_": EffMtr_,
+        "PwrShaft_W": PwrShaft_W,
+        "TauShaft_Nm": TauShaft_Nm,
+        "VMag_VPhPkN": VMag_VPhPkN,
+        "PwrElec_W": PwrElec_W,
+        "VsixstepL2LMag": VsixstepL2LMag,
+        "VsixstepL2LReal": VsixstepL2LReal,
+        "VsixstepL2LImag": VsixstepL2LImag,
+        "Iq_APkN": Iq_APkN,
+        "MaxTotalLoss_W": np.max(WATT, axis=1),
+    }
+    return Results, ErrorMessage
+
+
+def UI_MotorCalcs_Numpy(vars_name, vars_value, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess, NumObj_=None, FricTable=None, nargout=1):
+    P = BuildMotorParams(vars_name, vars_value, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm)
+    Results, ErrorMessage = Func_DesignMotor(P, FricTable)
+    P["ErrorMessage"] = ErrorMessage
+    ok = ErrorMessage == 0
+    MatMinTor_Nm = np.asarray(MinTor_Nm, dtype=float)
+
+    with np.errstate(all="ignore"):
+        VDC = np.max(Results["VMag_VPhPkN"], axis=1) * np.sqrt(3)
+        Outputs = np.column_stack([
+            -1 * Results["TauShaft_Nm"] * P["GearRatio"][:, None],
+            -1 * Results["EffMtr_"],
+            Results["Weight_kg"],
+            Results["MagVol_m3"],
+            VDC,
+            Results["NumTurn"],
+            P["R_MtrLength_m"],
+            P["R_LaminatR_m"],
+        ])
+        Outputs[~ok] = PENALTY
+        if not PostProcess and nargout < 2:
+            return Outputs
+
+        Results["VDC"] = VDC
+        Results["MeanEffMtr_Percent"] = 100 * np.mean(Results["EffMtr_"], axis=1)
+        Results["MinEffMtr_Percent"] = 100 * np.min(Results["EffMtr_"], axis=1)
+        TrqMargin = 100 * (Results["TauShaft_Nm"] * P["GearRatio"][:, None] - MatMinTor_Nm) / MatMinTor_Nm
+        Results["MeanTrqMargin_Percent"] = np.mean(TrqMargin, axis=1)
+        Results["MinTrqMargin_Percent"] = np.min(TrqMargin, axis=1)
+    P.pop("MagnetBackIronInnerR_m")  # it is stored in the Motor.Results
+    for key, value in Results.items():
+        Results[key] = np.where(ok if np.ndim(value) == 1 else ok[:, None], value, np.nan)
+    Motor = {"Params": P, "Results": Results}
+    if PostProcess:
+        return Motor
+    return Outputs, Motor
+
+
+def MotorRecords(Motor):
+    """Split a population Motor dict of arrays into one Motor dict per design (scalars and per speed point lists, like the MATLAB struct)."""
+    N = len(Motor["Params"]["ErrorMessage"])
+    return [{part: {key: (value[i].tolist() if np.ndim(value) else value) for key, value in fields.items()} for part, fields in Motor.items()} for i in range(N)]
+
+
+class NumpyEngine:
+    """
+    Stand-in for the MATLAB engine backed by the NumPy model. It exposes the same entry point name,
+    so MotorCalcs_Vectorized and SaveMat can use it unchanged, and it needs no MATLAB license.
+    With FricTable=True a TurbFricTable is built once for the engine and used for the fluid drag.
+    """
+
+    def __init__(self, FricTable=None):
+        self.FricTable = TurbFricTable() if FricTable is True else FricTable
+
+    def UI_MotorCalcs_MATLAB_Vectorized(self, vars_name, vars_value, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess, NumObj_, nargout=1):
+        out = UI_MotorCalcs_Numpy(vars_name, vars_value, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess, NumObj_, self.FricTable, nargout)
+        if PostProcess:
+            return MotorRecords(out)[0]  # one design -> dict like the MATLAB struct
+        if nargout > 1:
+            return out[0].tolist(), MotorRecords(out[1])[0]
+        return out.tolist()  # one design -> [[...]], indexed like the matlab.double row
+
+    def UI_MotorCalcs_MATLAB_Batch(self, vars_name, vars_matrix, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess, NumObj_, nargout=1):
+        vars_value = list(np.asarray(vars_matrix, dtype=float).T)  # one column per variable
+        out = UI_MotorCalcs_Numpy(vars_name, vars_value, consts_name, consts_value, MinTor_Nm, MagnetBr, MaxBMagnetIron, PresentBLaminationBackIron, SpeedReq_rpm, PostProcess, NumObj_, self.FricTable, nargout)
+        if nargout > 1:
+            return out[0], MotorRecords(out[1])  # one Motor dict per design, like the MATLAB cell array
+        return out
+
+    def addpath(self, *args, **kwargs):
+        pass
+
+    def quit(self):
+        pass
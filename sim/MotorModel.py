@@ -12,8 +12,29 @@ Inputs:
 Outputs:
     Mtr_res,       objectives as a list of NumPy array with length of NumObj_. Note: The objectives are minimized. Implement a mathematical operand to convert all maximized objectives into minimized objectives.
     [g1,g2,g3],    constraints with a length of NumInEqConst_.
+    Motor,         the full post-processed Motor record (Params and Results) of the design, so the results can be
+                   exported without evaluating the design again
 
+MotorCalcs_Batch takes the whole population (a list of `vars` dictionaries) and crosses into the engine once,
+through UI_MotorCalcs_MATLAB_Batch. It returns F and G as 2-D arrays with one row per design, and a list
+with the Motor record of each design.
+
+Before a design is sent to the engine its geometry is checked in Python (GeometryErrors, the aspect ratio, rotor/stator,
+slot area, slot opening and magnet backiron checks of Func_DesignMotor). A design that fails them gets the penalty row the engine would
+return, without an engine call, and no Motor record (None). Set variables["PreCheck"] = False to send every design.
 '''
+import numpy as np
+from sim.MotorDesign import BuildMotorParams, GeometryErrors, PENALTY
+
+
+def PlainMotor(Motor):
+    # MATLAB structs come back with matlab.double values, keep plain floats and lists so records can be pickled and cached
+    if Motor is None:
+        return None
+    return {part: {key: (value if np.isscalar(value) or isinstance(value, str) else np.asarray(value, dtype=float).ravel().tolist())
+                   for key, value in fields.items()} for part, fields in Motor.items()}
+
+
 def MotorCalcs_Vectorized(vars, consts, MinEffReq_, MinTor_Nm, MaxWeight_kg, VDC, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm, eng, variables, NumObj_, **kwargs):
     assert isinstance(vars, dict)
     assert isinstance(consts, dict)
@@ -40,53 +61,86 @@ def MotorCalcs_Vectorized(vars, consts, MinEffReq_, MinTor_Nm, MaxWeight_kg, VDC
     # print(MinTor_Nm)
     # print(type(MinTor_Nm))
     # print(vars.get("R_GearRatio_"))
-    Mtr_res = eng.UI_MotorCalcs_MATLAB_Vectorized(list(vars.keys()),list(vars.values()),list(consts.keys()),list(consts.values()), (MinTor_Nm), MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, (SpeedReq_rpm), PostProcess,NumObj_,  nargout=1)
+    NumPts = len(SpeedReq_rpm)
+    if variables.get("PreCheck", True) and Rejected(list(vars.keys()), [list(vars.values())], consts, MinTor_Nm, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm)[0]:
+        Mtr_res, Motor = np.full((1, 2*NumPts+6), PENALTY), None  # the engine would reject it
+    else:
+        Mtr_res, Motor = eng.UI_MotorCalcs_MATLAB_Vectorized(list(vars.keys()),list(vars.values()),list(consts.keys()),list(consts.values()), (MinTor_Nm), MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, (SpeedReq_rpm), PostProcess,NumObj_,  nargout=2)
     
     # print(Mtr_res[0])
-    F = []
-    g = []
-    NumPts = len(SpeedReq_rpm)
-    EfficienciesPerf = list(Mtr_res[0][NumPts:NumPts*2])
-    MinEffPerf_ = max(EfficienciesPerf)  # reported efficiencies have (-1)
-    MaxEffPerf_ = min(EfficienciesPerf)  # reported efficiencies have (-1)
-
-    if consts.get("TorqueOpt") == True: 
-        for i in range(NumPts):
-            F.append(Mtr_res[0][i])
-            
-    if consts.get("Efficinecy_minOpt") == True: 
-        min_index = EfficienciesPerf.index(MinEffPerf_)
-        F.append(Mtr_res[0][NumPts+min_index])
-        
-    if consts.get("Efficinecy_maxOpt") == True: 
-        max_index = EfficienciesPerf.index(MaxEffPerf_)
-        F.append(Mtr_res[0][NumPts+max_index])
-        
-    if consts.get("WeightOpt") == True:     
-        F.append(Mtr_res[0][2*NumPts])
-        
-    if consts.get("MagWeightOpt") == True:     
-        F.append(Mtr_res[0][2*NumPts+1])   
-        
-    if consts.get("VoltageOpt") == True:     
-        F.append(Mtr_res[0][2*NumPts+2])      
-
-    if consts.get("MtrLengthOpt") == True:     
-        F.append(Mtr_res[0][2*NumPts+3])   
-
-    if consts.get("MtrRadiusOpt") == True:     
-        F.append(Mtr_res[0][2*NumPts+4])   
-
-    for i in range(NumPts):
-        g.append(MinTor_Nm[i] + Mtr_res[0][i])   # Requirement - torque <0
-    g.append(MinEffReq_ + MinEffPerf_)           # Requirement - efficiency <0 
-    g.append(Mtr_res[0][2*NumPts] - MaxWeight_kg) # Weight - Requirement <0 
-    g.append(Mtr_res[0][2*NumPts+2] - VDC) # Voltage - Requirement <0
-    g.append(abs(round(Mtr_res[0][2*NumPts+3])-Mtr_res[0][2*NumPts+3]) - NumTurnThreshold) # force the number of turns to be close to an integer number
-    g.append( 1 - NumTurnThreshold - Mtr_res[0][2*NumPts+3]) # to get at least 1 turn
+    F, g = ObjectivesAndConstraints(Mtr_res, consts, MinEffReq_, MinTor_Nm, MaxWeight_kg, VDC, NumPts, NumTurnThreshold)
 
     # print('g')
     # print(g)
-    # The function return statement should always be in the form of [f1, f2, ...] , [g1, g2, ...]
+    # The function return statement should always be in the form of [f1, f2, ...] , [g1, g2, ...], Motor
     # If no constrains are defined, use [] instead of [g1, g2, ...]
-    return [F], [g]
\ No newline at end of file
+    return F, g, PlainMotor(Motor)
+
+
+def ObjectivesAndConstraints(Mtr_res, consts, MinEffReq_, MinTor_Nm, MaxWeight_kg, VDC, NumPts, NumTurnThreshold=0.03):
+    # Unpack the engine outputs (one row per design) into objectives F and constraints G
+    Mtr_res = np.atleast_2d(np.asarray(Mtr_res, dtype=float))
+    F = []
+    g = []
+    EfficienciesPerf = Mtr_res[:, NumPts:NumPts*2]
+    MinEffPerf_ = np.max(EfficienciesPerf, axis=1)  # reported efficiencies have (-1)
+    MaxEffPerf_ = np.min(EfficienciesPerf, axis=1)  # reported efficiencies have (-1)
+
+    if consts.get("TorqueOpt") == True:
+        F.append(Mtr_res[:, 0:NumPts])
+    if consts.get("Efficinecy_minOpt") == True:
+        F.append(MinEffPerf_)
+    if consts.get("Efficinecy_maxOpt") == True:
+        F.append(MaxEffPerf_)
+    if consts.get("WeightOpt") == True:
+        F.append(Mtr_res[:, 2*NumPts])
+    if consts.get("MagWeightOpt") == True:
+        F.append(Mtr_res[:, 2*NumPts+1])
+    if consts.get("VoltageOpt") == True:
+        F.append(Mtr_res[:, 2*NumPts+2])
+    if consts.get("MtrLengthOpt") == True:
+        F.append(Mtr_res[:, 2*NumPts+3])
+    if consts.get("MtrRadiusOpt") == True:
+        F.append(Mtr_res[:, 2*NumPts+4])
+
+    NumTurn = Mtr_res[:, 2*NumPts+3]
+    g.append(np.asarray(MinTor_Nm, dtype=float)[None, :] + Mtr_res[:, 0:NumPts])   # Requirement - torque <0
+    g.append(MinEffReq_ + MinEffPerf_)                     # Requirement - efficiency <0
+    g.append(Mtr_res[:, 2*NumPts] - MaxWeight_kg)          # Weight - Requirement <0
+    g.append(Mtr_res[:, 2*NumPts+2] - VDC)                 # Voltage - Requirement <0
+    g.append(np.abs(np.round(NumTurn) - NumTurn) - NumTurnThreshold)  # force the number of turns to be close to an integer number
+    g.append(1 - NumTurnThreshold - NumTurn)               # to get at least 1 turn
+
+    return np.column_stack(F), np.column_stack(g)
+
+
+def MotorCalcs_Batch(X, consts, MinEffReq_, MinTor_Nm, MaxWeight_kg, VDC, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm, eng, variables, NumObj_, **kwargs):
+    NumTurnThreshold = 0.03 # force the number of turns to be an integer +/-0.03
+    PostProcess = False
+    X = list(X)
+    vars_name = list(X[0].keys())
+    vars_matrix = np.array([[x[name] for name in vars_name] for x in X], dtype=float)  # one row per design
+
+    NumPts = len(SpeedReq_rpm)
+
+    # only the designs that pass the geometry checks go to the engine, the others get the penalty row
+    send = np.ones(len(X), dtype=bool)
+    if variables.get("PreCheck", True):
+        send = ~Rejected(vars_name, vars_matrix, consts, MinTor_Nm, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm)
+    Mtr_res = np.full((len(X), 2*NumPts+6), PENALTY)
+    Motors = [None] * len(X)
+    if np.any(send):
+        res, records = eng.UI_MotorCalcs_MATLAB_Batch(vars_name, vars_matrix[send], list(consts.keys()), list(consts.values()), (MinTor_Nm), MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, (SpeedReq_rpm), PostProcess, NumObj_, nargout=2)
+        Mtr_res[send] = np.asarray(res, dtype=float).reshape(int(np.sum(send)), -1)
+        for i, Motor in zip(np.flatnonzero(send), records):
+            Motors[i] = PlainMotor(Motor)
+
+    F, g = ObjectivesAndConstraints(Mtr_res, consts, MinEffReq_, MinTor_Nm, MaxWeight_kg, VDC, NumPts, NumTurnThreshold)
+    return F, g, Motors
+
+
+def Rejected(vars_name, vars_matrix, consts, MinTor_Nm, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm):
+    # designs (rows of vars_matrix) that Func_DesignMotor rejects on their geometry alone
+    vars_value = list(np.asarray(vars_matrix, dtype=float).T)
+    P = BuildMotorParams(vars_name, vars_value, list(consts.keys()), list(consts.values()), MinTor_Nm, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm)
+    return GeometryErrors(P) != 0
@@ -14,26 +14,65 @@ Inputs:
     Integer,       A class from Pymoo that defines integer OptimizationConf with specified bounds
     Choice,        A class from Pymoo that allows selection from a predefined set of options
     Binary,        A class from Pymoo that defines binary OptimizationConf (0 or 1)
+    OptimizationConf["BatchEval"], if True (default) the whole population is evaluated in one engine call
+                   per generation through MotorCalcs_Batch, otherwise MotorCalcs is called once per design
+    The Motor record of every evaluated design is stored with the individual (pymoo auxiliary output "Motor"),
+    read it with res.opt.get("Motor") so exporting the results does not need the engine.
+    If `eng` is an EnginePool (or an EvalCache around one), batch calls are split across its engines and per-design calls are run
+    through its `starmap`, so OptimizationConf["nprocesses"] engines work on each generation.
+    OptimizationConf["Checkpoint"], (optional) checkpoint file. The state of the run is written to it every
+                   OptimizationConf["CheckpointEvery"] generations (default 10) or OptimizationConf["CheckpointMinutes"]
+                   minutes (default 5). With OptimizationConf["Resume"] a run with the same inputs continues
+                   from the checkpoint, see sim/Checkpoint.py
+    OptimizationConf["Islands"], (optional) number of islands K. With K > 1 the population is split into K
+                   independent GAs (npop designs each), each in its own process with its own engine made by
+                   `engine_factory` (default NumpyEngine). Every OptimizationConf["MigrationInterval"] generations
+                   (default 5) each island sends OptimizationConf["Migrants"] (default 2) of its best designs to its
+                   neighbours, OptimizationConf["Topology"] = "ring" (to the next island, default) or "all" (to
+                   every island). The non-dominated designs of all the islands are returned as one result.
+                   Checkpoints are not written in island mode and `eng` (with its EvalCache) is not used.
+    OptimizationConf["Surrogate"], (optional) if True the offspring are screened by a surrogate of the motor model:
+                   OptimizationConf["SurrogateFactor"] (default 5) times more candidates are made every generation
+                   and only the most promising npop are evaluated by the engine, see sim/Surrogate.py
+    OptimizationConf["Repair"], if True (default) designs that fail the geometry checks of the model are moved to a
+                   close valid design before they are evaluated, see sim/Repair.py
+    OptimizationConf["Verbose"], print the progress of every generation (default True)
+    The time spent in evaluation, mating and survival is recorded in res.algorithm.timings (see sim/Timings.py),
+    the progress callback reads the figures of every generation from algorithm.timings.
     
 Outputs:
     res,           Optimization results
 '''
 
-from pymoo.core.problem import ElementwiseProblem
+import multiprocessing
+import time
+from types import SimpleNamespace
+from pymoo.core.problem import ElementwiseProblem, Problem, StarmapParallelization
+from pymoo.core.callback import Callback
+from pymoo.core.population import Population
+from pymoo.core.result import Result
+from pymoo.util.optimum import filter_optimum
 from pymoo.optimize import minimize
-from pymoo.core.mixed import MixedVariableGA
+from pymoo.core.mixed import MixedVariableGA, MixedVariableMating, MixedVariableDuplicateElimination
 from pymoo.termination.default import DefaultMultiObjectiveTermination
 from pymoo.operators.survival.rank_and_crowding import RankAndCrowding
 from pymoo.operators.mutation.pm import PolynomialMutation
 from pymoo.termination import get_termination
 # from pymoo.termination import MultiObjectiveTermination
 import numpy as np
+from sim.MotorModel import MotorCalcs_Batch
+from sim.MotorDesign import NumpyEngine
+from sim.EnginePool import EnginePool
+from sim.Checkpoint import Checkpoint, CheckpointKey, LoadCheckpoint
+from sim.Surrogate import SurrogateMating
+from sim.Repair import GeometryRepair
+from sim.Timings import StageTimings, TimeStages
 
 
 
 # Setup the optimizer 
 # Now accepts optional "callback_instance" (for progress bar)
-def MotorOpt(MotorCalcs, params, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, eng, Real, Integer, Choice, Binary, OptimizationConf, callback_instance=None):
+def MotorOpt(MotorCalcs, params, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, eng, Real, Integer, Choice, Binary, OptimizationConf, callback_instance=None, engine_factory=None):
     MinEff_ = OptimizationConf.get("MinEff_")
     MaxWeight_kg = OptimizationConf.get("MaxWeight")
     VDC = OptimizationConf.get("VDC")
@@ -74,6 +113,7 @@ def MotorOpt(MotorCalcs, params, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminatio
     print(f"Calculated Number of Objectives (NumObj_): {NumObj_}")
     if NumObj_ <= 0:
         raise ValueError("Optimization requires at least one objective function to be selected in OptimizationConf. NumObj_ is currently 0.")
+    timings = StageTimings()
 
     class Optimizer(ElementwiseProblem):
     
@@ -106,10 +146,43 @@ def MotorOpt(MotorCalcs, params, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminatio
         #############################
         def _evaluate(self, x, out, *args, **kwargs):
 
-            out["F"], out["G"] = MotorCalcs(x, OptimizationConf, MinEff_, MinTor_Nm, MaxWeight_kg, VDC, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm, eng,OptimizationConf,NumObj_)
+            start = time.perf_counter()
+            out["F"], out["G"], out["Motor"] = MotorCalcs(x, OptimizationConf, MinEff_, MinTor_Nm, MaxWeight_kg, VDC, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm, eng,OptimizationConf,NumObj_)
+            timings.add("eval", time.perf_counter() - start)
+
+    class BatchOptimizer(Problem):
+        # Same problem as `Optimizer`, but `_evaluate` receives the whole population at once
+        # so the engine is called once per generation instead of once per design
+
+        def __init__(self, params, NumObj_, NumEqConst_, NumInEqConst_, OptimizationConf, verbose=False, **kwargs):
+            self.verbose = verbose
+
+            # break `params` into `vars` and `consts`
+            #############################
+            self.vars = dict()
+            self.consts = dict()
+            for key, value in params.items():
+                if type(value) in [Real, Integer, Binary, Choice]:
+                    self.vars[key]=value
+                else:
+                    self.consts[key]=value
+
+            super().__init__(vars=self.vars,
+                             n_obj=NumObj_,
+                             n_ieq_constr=NumInEqConst_,
+                             n_eq_constr=NumEqConst_,
+                             **kwargs)
+
+        # X is an array of `vars` dictionaries, one per design. F and G are returned with one row per design
+        #############################
+        def _evaluate(self, X, out, *args, **kwargs):
+
+            start = time.perf_counter()
+            out["F"], out["G"], out["Motor"] = MotorCalcs_Batch(X, OptimizationConf, MinEff_, MinTor_Nm, MaxWeight_kg, VDC, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm, eng,OptimizationConf,NumObj_)
+            timings.add("eval", time.perf_counter() - start, len(X))
+
     npop = OptimizationConf.get("npop")
     ngens = OptimizationConf.get("ngens")
-    nprocesses = OptimizationConf.get("nprocesses")
     DisMut = OptimizationConf.get("DisMut")
     ProbMut = OptimizationConf.get("ProbMut")
             
@@ -121,11 +194,20 @@ def MotorOpt(MotorCalcs, params, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminatio
     
     mutation = PolynomialMutation(prob=ProbMut, eta=DisMut)    
     
+    # designs the model would reject on their geometry are repaired before they are evaluated (initial population and offspring)
+    repair = None
+    if OptimizationConf.get("Repair", True):
+        repair = GeometryRepair(OptimizationConf, MinTor_Nm, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm)
+
     algorithm = MixedVariableGA(
         pop_size=npop, 
         survival=RankAndCrowding(crowding_func="cd"),
+        mating=MixedVariableMating(eliminate_duplicates=MixedVariableDuplicateElimination(), repair=repair),
+        repair=repair,
         mutation=mutation
     )
+    if OptimizationConf.get("Surrogate"):
+        algorithm.mating = SurrogateMating(algorithm.mating, OptimizationConf.get("SurrogateFactor", 5), verbose=OptimizationConf.get("Verbose", True))
     
     termination = DefaultMultiObjectiveTermination(
         xtol=1e-3,
@@ -135,21 +217,206 @@ def MotorOpt(MotorCalcs, params, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminatio
         n_max_evals=50000
     )
     
-    problem = Optimizer(params,NumObj_,NumEqConst_,NumInEqConst_,OptimizationConf)
+    if OptimizationConf.get("BatchEval", True):
+        problem = BatchOptimizer(params,NumObj_,NumEqConst_,NumInEqConst_,OptimizationConf)
+    elif isinstance(getattr(eng, "engine", eng), EnginePool):
+        # spread the designs of a generation over the engines of the pool (also through an EvalCache). Not hasattr:
+        # a MATLAB engine returns a function for any name, starmap included
+        problem = Optimizer(params,NumObj_,NumEqConst_,NumInEqConst_,OptimizationConf, elementwise_runner=StarmapParallelization(eng.starmap))
+    else:
+        problem = Optimizer(params,NumObj_,NumEqConst_,NumInEqConst_,OptimizationConf)
     
+    if OptimizationConf.get("Islands", 1) > 1:
+        # the islands evaluate with their own engines (engine_factory) in their own processes
+        if OptimizationConf.get("Checkpoint"):
+            print("Warning: island runs are not checkpointed, OptimizationConf[\"Checkpoint\"] is ignored")
+        args = (MotorCalcs, params, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, engine_factory or NumpyEngine, Real, Integer, Choice, Binary)
+        return MotorOptIslands(args, OptimizationConf, problem, callback_instance)
+
+    checkpoint = None
+    CheckpointPath = OptimizationConf.get("Checkpoint")
+    if CheckpointPath:
+        key = CheckpointKey(params, OptimizationConf, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T)
+        checkpoint = Checkpoint(CheckpointPath, key, OptimizationConf.get("CheckpointEvery", 10), OptimizationConf.get("CheckpointMinutes", 5.0), callback_instance)
+        callback_instance = checkpoint
+        if OptimizationConf.get("Resume"):
+            resumed = LoadCheckpoint(CheckpointPath, key)
+            if resumed is not None:
+                # minimize skips the setup of an algorithm that already has a problem, so it keeps the termination
+                # of the interrupted run (with the history of its tolerances): only the limits of this run are
+                # applied (ngens can change, see RESUMABLE_SETTINGS)
+                resumed.problem = problem
+                resumed.callback = checkpoint
+                resumed.termination.max_gen.n_max_gen = termination.max_gen.n_max_gen
+                resumed.termination.max_evals.n_max_evals = termination.max_evals.n_max_evals
+                algorithm = resumed
+    TimeStages(algorithm, timings)
+
+    # pymoo replaces its default callback with whatever is passed, so only pass one when given
+    kwargs = dict()
+    if callback_instance is not None:
+        kwargs["callback"] = callback_instance
+
     # Run optimizer (objective function minimizer)
-    res = minimize(
-        problem,
-        algorithm,
-        termination,
-        n_processes=nprocesses,
-        verbose=True,
-        save_history=False,
-        callback=callback_instance
-    )
+    try:
+        res = minimize(
+            problem,
+            algorithm,
+            termination,
+            copy_algorithm=False,
+            verbose=OptimizationConf.get("Verbose", True),
+            save_history=False,
+            **kwargs
+        )
+    finally:
+        if checkpoint:
+            checkpoint.close()
     
+    if OptimizationConf.get("Verbose", True):
+        print(f"Timings: {timings.summary()}")
+
     # check if there is no feasible solution
     if res.F is None:
         print("There is no solution. Consider relaxing the constraints")
     
-    return res
\ No newline at end of file
+    return res
+
+
+class MigrationCallback(Callback):
+    # runs inside an island: every `interval` generations it sends some of the best designs to the main process
+    # and adds the designs it gets back from the other islands to the population
+
+    def __init__(self, conn, interval, n_migrants):
+        super().__init__()
+        self.conn = conn
+        self.interval = interval
+        self.n_migrants = n_migrants
+        self.n_iter = 0  # last generation, sent with "done" (the counter of the algorithm is one ahead after the run)
+
+    def notify(self, algorithm):
+        self.n_iter = algorithm.n_iter
+        if algorithm.n_iter % self.interval != 0 or algorithm.termination.has_terminated():
+            return
+        opt = algorithm.opt
+        pick = np.random.choice(len(opt), min(self.n_migrants, len(opt)), replace=False)
+        self.conn.send(("migrate", algorithm.n_iter, algorithm.evaluator.n_eval, opt, algorithm.pop, opt[pick]))
+        immigrants = self.conn.recv()
+        if immigrants is None:
+            # the run was stopped
+            algorithm.termination.terminate()
+            algorithm.termination.update(algorithm)
+        elif len(immigrants) > 0:
+            # the immigrants compete with the population like offspring do
+            pop = Population.merge(algorithm.pop, immigrants)
+            algorithm.pop = algorithm.survival.do(algorithm.problem, pop, n_survive=algorithm.pop_size, algorithm=algorithm)
+
+
+def _IslandWorker(conn, seed, args, OptimizationConf):
+    MotorCalcs, params, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, engine_factory, Real, Integer, Choice, Binary = args
+    np.random.seed(seed)
+    try:
+        # no None values: OptimizationConf also goes to the engine with the constants, which MATLAB cannot marshal
+        conf = dict(OptimizationConf, Islands=1, Verbose=False)
+        conf.pop("Checkpoint", None)
+        callback = MigrationCallback(conn, OptimizationConf.get("MigrationInterval", 5), OptimizationConf.get("Migrants", 2))
+        res = MotorOpt(MotorCalcs, params, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, engine_factory(), Real, Integer, Choice, Binary, conf, callback_instance=callback)
+        conn.send(("done", callback.n_iter, res.algorithm.evaluator.n_eval, res.algorithm.opt, res.algorithm.pop))
+    except Exception as e:
+        conn.send(("error", repr(e)))
+    finally:
+        conn.close()
+
+
+def _IslandsSummary(last, problem):
+    # progress of the islands together, from their last messages, for the progress callback (GUI)
+    return SimpleNamespace(n_gen=max(msg[1] for msg in last),
+                           evaluator=SimpleNamespace(n_eval=sum(msg[2] for msg in last)),
+                           opt=filter_optimum(Population.merge(Population.empty(), *[msg[3] for msg in last]), least_infeasible=True),
+                           pop=Population.merge(Population.empty(), *[msg[4] for msg in last]),
+                           problem=problem, termination=None, state_if_terminated=False)
+
+
+def MotorOptIslands(args, OptimizationConf, problem, callback_instance=None):
+    K = OptimizationConf.get("Islands")
+    topology = OptimizationConf.get("Topology", "ring")
+    start_time = time.time()
+    print(f"Running {K} islands, migration every {OptimizationConf.get('MigrationInterval', 5)} generations ({topology})")
+
+    ctx = multiprocessing.get_context()
+    conns, procs = [], []
+    for seed in np.random.randint(0, 2**31 - 1, size=K):
+        parent_conn, child_conn = ctx.Pipe()
+        proc = ctx.Process(target=_IslandWorker, args=(child_conn, int(seed), args, OptimizationConf), daemon=True)
+        proc.start()
+        child_conn.close()
+        conns.append(parent_conn)
+        procs.append(proc)
+
+    # the islands run in parallel and meet at every migration, messages are (kind, n_gen, n_eval, opt, pop[, migrants])
+    last = [None] * K
+    done = [False] * K
+    stop = False
+    reported = None  # generation of the last summary
+    try:
+        while not all(done):
+            waiting = dict()
+            for i, conn in enumerate(conns):
+                if done[i]:
+                    continue
+                msg = conn.recv()
+                if msg[0] == "error":
+                    raise RuntimeError(f"Island {i + 1} failed: {msg[1]}")
+                last[i] = msg
+                if msg[0] == "done":
+                    done[i] = True
+                else:
+                    waiting[i] = msg[5]
+            if not waiting:
+                break
+
+            summary = _IslandsSummary(last, problem)
+            reported = summary.n_gen
+            print(f"Islands: generation {summary.n_gen}, {summary.evaluator.n_eval} evaluations")
+            if callback_instance is not None:
+                callback_instance(summary)
+                stop = stop or summary.state_if_terminated  # set by the stop button of the GUI
+
+            # route the migrants: ring sends to the next island, all sends to every other island
+            for i in waiting:
+                if topology == "all":
+                    sources = [j for j in waiting if j != i]
+                else:
+                    sources = [j for j in [(i - 1) % K] if j in waiting and j != i]
+                immigrants = Population.merge(Population.empty(), *[waiting[j] for j in sources]) if sources else Population.empty()
+                conns[i].send(None if stop else immigrants)
+    finally:
+        for conn in conns:
+            conn.close()
+        for proc in procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+
+    # the islands send "done" instead of migrants in their last generation, report it too
+    summary = _IslandsSummary(last, problem)
+    if summary.n_gen != reported and not stop:
+        print(f"Islands: generation {summary.n_gen}, {summary.evaluator.n_eval} evaluations")
+        if callback_instance is not None:
+            callback_instance(summary)
+
+    # one non-dominated set from the final populations of all the islands
+    res = Result()
+    res.start_time, res.end_time = start_time, time.time()
+    res.exec_time = res.end_time - start_time
+    res.pop = Population.merge(Population.empty(), *[msg[4] for msg in last])
+    res.opt = filter_optimum(Population.merge(Population.empty(), *[msg[3] for msg in last]), least_infeasible=True)
+    if res.opt is not None and not np.any(res.opt.get("feasible")):
+        res.opt = None
+    if res.opt is None:
+        print("There is no solution. Consider relaxing the constraints")
+    else:
+        res.X, res.F, res.CV, res.G, res.H = res.opt.get("X", "F", "CV", "G", "H")
+        if problem.n_obj == 1 and len(res.X) == 1:
+            res.X, res.F, res.CV, res.G, res.H = res.X[0], res.F[0], res.CV[0], res.G[0], res.H[0]
+    res.problem = problem
+    return res
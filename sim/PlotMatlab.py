@@ -2,24 +2,37 @@
 This script plot the objectives in MATLAB
 
 Input:
-    eng,  Matlab engine
-    F,    optimized objectives
+    coordvars,   names of the columns to plot
+    excel_file,  results file written by SaveMat
+    eng,         (optional) Matlab engine. If not given, the shared engine of the process is used (started on first use)
     
 Output:
     N/A
+
+Nothing is started at import: the MATLAB engine is acquired when a plot is made and tkinter is only
+imported by the PlotMat window.
 '''
+from sim.MatlabEngine import get_shared_engine
+
+
+def ParallelPlot(coordvars, excel_file, eng=None):
+    eng = eng if eng is not None else get_shared_engine()
+    eng.UI_ParallelPlot_MATLAB(coordvars, excel_file, nargout=0)
+
+
+def ThreeDPlot(coordvars, excel_file, eng=None):
+    eng = eng if eng is not None else get_shared_engine()
+    eng.UI_3DPlot_MATLAB(coordvars, excel_file, nargout=0)
 
-import matlab.engine 
-eng = matlab.engine.start_matlab()
-#def PlotMat(eng,F,G):
-    
-import tkinter as tk
-from tkinter import messagebox 
-from tkinter import ttk  # Import ttk for Combobox
 
 class PlotMat:
-    def __init__(self, root):
+    def __init__(self, root, excel_file=None, eng=None):
+        import tkinter as tk
+        from tkinter import ttk  # Import ttk for Combobox
+
         self.root = root
+        self.excel_file = excel_file
+        self.eng = eng
         self.root.title("Select Signals for Plotting")
         self.root.geometry("350x400")  # Set the window size wxh
 
@@ -187,7 +200,7 @@ class PlotMat:
         if selected_dropdown3 in dropdown_strings:
             coordvars.append(dropdown_strings[selected_dropdown3])
 
-        tsunami = eng.UI_ParallelPlot_MATLAB(coordvars,ExcelFileName,nargout=1)
+        ParallelPlot(coordvars, self.excel_file, self.eng)
         
     def threeD_submit_selection(self):
         coordvars = [option for var, option in self.checkboxes if var.get()]  # Collect associated strings of checked boxe     
@@ -247,6 +260,7 @@ class PlotMat:
             coordvars.append(dropdown_strings[selected_dropdown3])
 
         if len(coordvars) !=3:
+            from tkinter import messagebox
             messagebox.showinfo("Selections Submitted", "For 3D plots, select 3 parameters.")
         else:
-            tsunami = eng.UI_3DPlot_MATLAB(coordvars,ExcelFileName,nargout=1)
\ No newline at end of file
+            ThreeDPlot(coordvars, self.excel_file, self.eng)
\ No newline at end of file
@@ -0,0 +1,95 @@
+'''
+This script repairs designs the motor model would reject on their geometry, before they are evaluated.
+
+Inputs:
+    OptimizationConf,  the constants of the model (passed to the engine like in MotorCalcs_Batch)
+    MinTor_Nm, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm,  requirements and materials
+    n_steps,           bisection steps of the line search (default 20)
+
+Outputs:
+    GeometryRepair,    a pymoo Repair, passed to MixedVariableMating (offspring) and MixedVariableGA (initial population).
+                       Every design that fails the geometry checks of Func_DesignMotor (GeometryErrors) is moved,
+                       within the variable bounds, to a close design that passes them:
+                       1. the lamination radius is brought within 0.1-10 times the motor length and the magnet outer
+                          radius within 0.05-20 times the motor length and below the lamination radius
+                       2. designs that still fail (slot area, slot opening, backiron) are moved along the line to the
+                          nearest valid design of the population (or of the batch), to the valid point closest to
+                          the original design found by bisection
+                       Designs with no valid design to move to are left as they are.
+'''
+import numpy as np
+from pymoo.core.repair import Repair
+from pymoo.core.variable import Real, Integer
+from sim.MotorModel import Rejected
+
+
+class GeometryRepair(Repair):
+
+    def __init__(self, OptimizationConf, MinTor_Nm, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm, n_steps=20):
+        super().__init__()
+        self.OptimizationConf = OptimizationConf
+        self.requirements = (MinTor_Nm, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm)
+        self.n_steps = n_steps
+
+    def _rejected(self, names, M):
+        return Rejected(names, M, self.OptimizationConf, *self.requirements)
+
+    def _do(self, problem, X, algorithm=None, **kwargs):
+        if len(X) == 0:
+            return X
+        names = list(problem.vars.keys())
+        movable = np.array([isinstance(problem.vars[name], (Real, Integer)) for name in names])
+        integer = np.array([isinstance(problem.vars[name], Integer) for name in names])
+        lo = np.array([problem.vars[name].bounds[0] if movable[j] else -np.inf for j, name in enumerate(names)], dtype=float)
+        hi = np.array([problem.vars[name].bounds[1] if movable[j] else np.inf for j, name in enumerate(names)], dtype=float)
+        M = np.array([[x[name] for name in names] for x in X], dtype=float)
+
+        bad = self._rejected(names, M)
+        if not np.any(bad):
+            return X
+        M[bad] = np.clip(self._limits(names, M[bad]), lo, hi)
+        bad = self._rejected(names, M)
+
+        # line search towards the nearest valid design, in variables scaled by their bounds
+        anchors = M[~bad]
+        if algorithm is not None and getattr(algorithm, "pop", None) is not None and len(algorithm.pop) > 0:
+            pop = np.array([[x[name] for name in names] for x in algorithm.pop.get("X")], dtype=float)
+            anchors = np.vstack([anchors, pop[~self._rejected(names, pop)]])
+        if np.any(bad) and len(anchors) > 0:
+            span = np.where(movable & (hi > lo), hi - lo, 1.0)
+            start = M[bad]
+            distance = np.sum(((start[:, None, :] - anchors[None, :, :]) / span)[:, :, movable] ** 2, axis=2)
+            end = np.where(movable, anchors[np.argmin(distance, axis=1)], start)
+            t_bad, t_ok = np.zeros(len(start)), np.ones(len(start))  # rejected at t_bad, valid at t_ok
+            for _ in range(self.n_steps):
+                t = (t_bad + t_ok) / 2
+                ok = ~self._rejected(names, self._point(start, end, t, integer))
+                t_ok = np.where(ok, t, t_ok)
+                t_bad = np.where(ok, t_bad, t)
+            M[bad] = self._point(start, end, t_ok, integer)
+
+        repaired = []
+        for x, row in zip(X, M):
+            x = dict(x)
+            for j, name in enumerate(names):
+                if movable[j]:
+                    x[name] = int(round(row[j])) if integer[j] else float(row[j])
+            repaired.append(x)
+        return np.array(repaired, dtype=object)
+
+    @staticmethod
+    def _point(start, end, t, integer):
+        M = start + t[:, None] * (end - start)
+        M[:, integer] = np.round(M[:, integer])
+        return M
+
+    @staticmethod
+    def _limits(names, M):
+        # limit checks of Func_DesignMotor: 0.1 L <= R_LaminatR <= 10 L, 0.05 L <= R_MagnetOutR <= 20 L and R_MagnetOutR < R_LaminatR
+        if not all(name in names for name in ("R_MtrLength", "R_LaminatR", "R_MagnetOutR")):
+            return M
+        M = M.copy()
+        L, RL, RM = (names.index(name) for name in ("R_MtrLength", "R_LaminatR", "R_MagnetOutR"))
+        M[:, RL] = np.clip(M[:, RL], 0.1 * M[:, L], 10 * M[:, L])
+        M[:, RM] = np.clip(M[:, RM], 0.05 * M[:, L], np.minimum(20 * M[:, L], M[:, RL] * (1 - 1e-6)))
+        return M
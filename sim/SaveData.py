@@ -1,14 +1,22 @@
 '''
-This script saves the optimized objectives and corresponding parameters in an Excel file.
+This script saves the optimized objectives and corresponding parameters in a table with one row per design.
+Values given per speed point (e.g. EffMtr_) are written as one column per point, EffMtr__1, EffMtr__2, ...
+The format follows the extension of file_path: .xlsx, .parquet, .feather or .csv.
 
 Input:
     X,      optimized motor parameters
     F,      optimized objectives
-    file_path,  The full path (including filename) to save the Excel file to.
+    file_path,  The full path (including filename) to save the Excel file to. None only builds the table.
+    Motors, (optional) Motor records kept by the optimizer for each design, res.opt.get("Motor").
+            Only designs without a record are evaluated again with the engine.
+    progress_callback,  (optional) called as progress_callback(done, total) after each design and after the file is
+                        written (total counts the designs and the file)
+    cancel_checker,     (optional) returns True to stop the export, checked before each design and before the file is
+                        written
     ... other parameters
    
 Output:
-    N/A
+    df_all,     the table that was written (pandas DataFrame), None if the export was cancelled (no file is written)
 '''
 import numpy as np
 import pandas as pd
@@ -18,7 +26,7 @@ import os
 
 
 # Add 'file_path' as the last argument
-def SaveMat(eng, X, F, G, variables, params, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, file_path):
+def SaveMat(eng, X, F, G, variables, params, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, file_path, Motors=None, progress_callback=None, cancel_checker=None):
 
     consts = dict()
     for key, value in params.items():
@@ -54,51 +62,59 @@ def SaveMat(eng, X, F, G, variables, params, MagnetBr_T, MaxBMagnetIron_T, Prese
         'VDCReq' : VDC,
     }
 
-    temp_data_file1 = 'temp_data_1.xlsx'
-    temp_data_file2 = 'temp_data_2.xlsx'
-    
-    df_X = pd.DataFrame(list(X))
-    df_data1 = pd.DataFrame([data1])
-    df_updated = pd.concat([df_data1, df_X], axis=1)
-    
-    df_updated.to_excel(temp_data_file1, index=False)
-    
     PostProcess = True
-    i = 0
-    Mtr_res = eng.UI_MotorCalcs_MATLAB_Vectorized(
-        list(X[i].keys()),
-        list(X[i].values()),
-        list(consts.keys()),
-        list(consts.values()),
-        MinTor_Nm,
-        MagnetBr_T,
-        MaxBMagnetIron_T,
-        PresentBLaminationBackIron_T,
-        SpeedReq_rpm, PostProcess, NumObj_, nargout=1
-    )
-    a = list(Mtr_res.values())
-    df_a0 = pd.DataFrame(a[0])
-    df_a1 = pd.DataFrame(a[1])
-    a_row = pd.concat([df_a0, df_a1], axis=1)
-    df_exis = pd.DataFrame(a_row)
-    for i in range(1, len(X)):
-        Mtr_res = eng.UI_MotorCalcs_MATLAB_Vectorized(list(X[i].keys()),list(X[i].values()),list(consts.keys()),list(consts.values()), MinTor_Nm, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm, PostProcess,NumObj_,  nargout=1)
-        a = list(Mtr_res.values())
-        df_a0 = pd.DataFrame(a[0])
-        df_a1 = pd.DataFrame(a[1])
-        a_row = pd.concat([df_a0, df_a1], axis=1)
-        df_new_row = pd.DataFrame(a_row)
-        df_exis = pd.concat([df_exis, df_new_row], axis=0)
-    df_exis.to_excel(temp_data_file2, index=False)
-
-    df_1 = pd.read_excel(temp_data_file1)
-    df_2 = pd.read_excel(temp_data_file2)
-    df_all = pd.concat([df_1, df_2], axis=1)
+    if isinstance(X, dict):
+        X = [X]  # single objective: pymoo returns the best design itself
+    if Motors is None:
+        Motors = [None] * len(X)
+    total = len(X) + (1 if file_path else 0)
 
+    # one row per design: requirements, design variables, Motor.Params and Motor.Results
+    rows = []
+    for i in range(len(X)):
+        if cancel_checker and cancel_checker():
+            return None
+        Mtr_res = Motors[i]
+        if Mtr_res is None or "Results" not in Mtr_res:
+            # no record from the optimizer, evaluate the design again
+            Mtr_res = eng.UI_MotorCalcs_MATLAB_Vectorized(list(X[i].keys()),list(X[i].values()),list(consts.keys()),list(consts.values()), MinTor_Nm, MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T, SpeedReq_rpm, PostProcess,NumObj_,  nargout=1)
+        row = dict()
+        _add_columns(row, data1)
+        _add_columns(row, X[i])
+        for part in Mtr_res.values():
+            _add_columns(row, part)
+        rows.append(row)
+        if progress_callback:
+            progress_callback(i + 1, total)
+    df_all = pd.DataFrame(rows)
 
     # Use the file_path passed from the Qt dialog
-    df_all.to_excel(file_path, index=False)
-    
-    # Clean up temporary files
-    os.remove(temp_data_file1)
-    os.remove(temp_data_file2)
\ No newline at end of file
+    if file_path:
+        if cancel_checker and cancel_checker():
+            return None
+        WriteTable(df_all, file_path)
+        if progress_callback:
+            progress_callback(total, total)
+    return df_all
+
+
+def _add_columns(row, fields):
+    # scalars become one column, per speed point values one column per point (name_1, name_2, ...)
+    for key, value in fields.items():
+        if np.ndim(value) == 0:
+            row.setdefault(key, value)
+        else:
+            for k, v in enumerate(np.asarray(value).ravel(), start=1):
+                row.setdefault(f"{key}_{k}", v)
+
+
+def WriteTable(df, file_path):
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext == ".parquet":
+        df.to_parquet(file_path, index=False)
+    elif ext == ".feather":
+        df.to_feather(file_path)
+    elif ext == ".csv":
+        df.to_csv(file_path, index=False)
+    else:
+        df.to_excel(file_path, index=False)
@@ -0,0 +1,156 @@
+'''
+This script screens the offspring of the GA with a surrogate of the motor model, so only the most promising designs
+are sent to the engine.
+
+Inputs:
+    mating,     the mating of the GA (algorithm.mating), it makes the candidate designs
+    factor,     number of candidates made per offspring that is evaluated (default 5)
+    min_points, the surrogate is used once this many designs are evaluated, before that the offspring are not screened
+    verbose,    print the prediction error of every generation
+
+Outputs:
+    SurrogateMating, a pymoo infill criterion that replaces algorithm.mating. Every generation it makes factor x
+                     n_offsprings candidates, predicts their objectives and constraints and keeps the n_offsprings
+                     the survival of the GA (rank and crowding, feasible designs first) prefers. The engine only
+                     evaluates those.
+    errors,          prediction error of every generation: the offspring chosen by the surrogate are compared with
+                     their true F and G once the engine has evaluated them. RMSE over the standard deviation of the
+                     evaluated designs, 0 is a perfect prediction and 1 is no better than guessing the mean, plus the
+                     share of the offspring the engine rejected
+
+The surrogate is a radial basis function (RBF) interpolator, fitted again every generation on all the designs
+evaluated so far (the population plus the offspring of the previous generations). The design variables are scaled
+to [0, 1] by their bounds (Choice variables by the index of the option), F and G are scaled to zero mean and unit
+deviation. Designs rejected by the engine (penalty row) are left out of the fit; a candidate is predicted to be
+rejected when most of its NEIGHBORS closest evaluated designs were, and is then ranked with the penalty row.
+The fit uses the MAX_POINTS designs evaluated last (the current population is always part of them), so it
+stays fast in long runs and follows the region the GA is working in.
+'''
+import numpy as np
+from scipy.interpolate import RBFInterpolator
+from scipy.spatial import cKDTree
+from pymoo.core.infill import InfillCriterion
+from pymoo.core.population import Population
+from pymoo.core.variable import Real, Integer, Choice
+from sim.MotorDesign import PENALTY
+
+MAX_POINTS = 1000
+NEIGHBORS = 5
+
+
+def _encode(X, variables):
+    # mixed variable designs (dictionaries) to rows of numbers in [0, 1]
+    columns = []
+    for name, var in variables.items():
+        values = [x[name] for x in X]
+        if isinstance(var, (Real, Integer)):
+            lo, hi = var.bounds
+            columns.append((np.asarray(values, dtype=float) - lo) / (hi - lo if hi > lo else 1.0))
+        elif isinstance(var, Choice):
+            options = list(var.options)
+            columns.append(np.array([options.index(v) for v in values], dtype=float) / max(len(options) - 1, 1))
+        else:
+            columns.append(np.asarray(values, dtype=float))
+    return np.column_stack(columns)
+
+
+class SurrogateMating(InfillCriterion):
+
+    def __init__(self, mating, factor=5, min_points=None, verbose=True, **kwargs):
+        super().__init__(**kwargs)
+        self.mating = mating
+        self.factor = factor
+        self.min_points = min_points
+        self.verbose = verbose
+        self.archive = dict()  # evaluated designs by their encoded variables
+        self.errors = []
+        self._chosen = None    # offspring of the previous generation and what the surrogate predicted for them
+
+    def do(self, problem, pop, n_offsprings, algorithm=None, **kwargs):
+        self._update(problem, pop)
+        model = self._fit(problem)
+        if model is None:
+            return self.mating.do(problem, pop, n_offsprings, algorithm=algorithm, **kwargs)
+
+        candidates = self.mating.do(problem, pop, self.factor * n_offsprings, algorithm=algorithm, **kwargs)
+        if len(candidates) <= n_offsprings:
+            return candidates
+        predicted = model(_encode(candidates.get("X"), problem.vars))
+
+        # rank the candidates by their predicted F and G, with the survival of the GA
+        n_obj = problem.n_obj
+        ranking = Population.new("index", np.arange(len(candidates)), "F", predicted[:, :n_obj], "G", predicted[:, n_obj:])
+        survival = algorithm.survival if algorithm is not None else None
+        if survival is not None:
+            chosen = survival.do(problem, ranking, n_survive=n_offsprings, algorithm=algorithm).get("index")
+        else:
+            chosen = np.argsort(ranking.get("CV").ravel())[:n_offsprings]
+        off = candidates[chosen]
+        self._chosen = (off, predicted[chosen])
+        return off
+
+    def _update(self, problem, pop):
+        # the offspring chosen last generation are evaluated by now, they join the archive with the population
+        evaluated = list(pop)
+        if self._chosen is not None:
+            off, predicted = self._chosen
+            evaluated += list(off)
+            self._report(problem, off, predicted)
+            self._chosen = None
+        evaluated = [ind for ind in evaluated if ind.F is not None and len(ind.F) > 0]
+        if not evaluated:
+            return
+        X = _encode([ind.X for ind in evaluated], problem.vars)
+        Y = np.column_stack([np.array([ind.F for ind in evaluated], dtype=float),
+                             np.array([ind.G for ind in evaluated], dtype=float).reshape(len(evaluated), -1)])
+        for x, y in zip(X, Y):
+            if np.all(np.isfinite(y)):
+                self.archive.pop(x.tobytes(), None)  # most recent last
+                self.archive[x.tobytes()] = (x, y)
+
+    def _fit(self, problem):
+        min_points = self.min_points or 2 * len(problem.vars) + 2
+        points = list(self.archive.values())[-MAX_POINTS:]
+        X = np.array([x for x, _ in points])
+        Y = np.array([y for _, y in points])
+        rejected = np.all(Y[:, :problem.n_obj] == PENALTY, axis=1) if len(points) else np.zeros(0, dtype=bool)
+        if np.sum(~rejected) < min_points:
+            return None
+
+        # objectives and constraints are fitted on the designs the engine accepted, the penalty rows only tell
+        # the nearest neighbours of a candidate whether it is likely to be rejected too
+        valid = Y[~rejected]
+        self.mean = valid.mean(axis=0)
+        self.std = valid.std(axis=0)
+        self.std[self.std == 0] = 1.0
+        varies = np.ptp(X, axis=0) > 0  # variables that are the same in every design (fixed bounds) are left out
+        try:
+            rbf = RBFInterpolator(X[~rejected][:, varies], (valid - self.mean) / self.std, kernel="thin_plate_spline", smoothing=1e-6)
+        except np.linalg.LinAlgError as e:
+            print(f"Surrogate not fitted, the candidates are not screened: {e}")
+            return None
+        tree = cKDTree(X[:, varies])
+        penalty_row = Y[rejected][0] if np.any(rejected) else None
+
+        def model(X_new):
+            predicted = rbf(X_new[:, varies]) * self.std + self.mean
+            if penalty_row is not None:
+                _, nearest = tree.query(X_new[:, varies], k=min(NEIGHBORS, len(X)))
+                predicted[np.mean(rejected[nearest.reshape(len(X_new), -1)], axis=1) > 0.5] = penalty_row
+            return predicted
+        return model
+
+    def _report(self, problem, off, predicted):
+        n_obj = problem.n_obj
+        true = np.column_stack([off.get("F"), off.get("G")]).astype(float)
+        rejected = np.all(true[:, :n_obj] == PENALTY, axis=1)
+        keep = ~rejected & ~np.all(predicted[:, :n_obj] == PENALTY, axis=1) & np.all(np.isfinite(true), axis=1)
+        if not np.any(keep):
+            return
+        rmse = np.sqrt(np.mean(((predicted[keep] - true[keep]) / self.std) ** 2, axis=0))
+        error = {"designs": len(self.archive), "F": float(np.mean(rmse[:n_obj])), "G": float(np.mean(rmse[n_obj:])),
+                 "rejected": float(np.mean(rejected))}
+        self.errors.append(error)
+        if self.verbose:
+            print(f"Surrogate: {error['designs']} designs, prediction error F {error['F']:.3f}, G {error['G']:.3f}, "
+                  f"{100 * error['rejected']:.0f}% of the offspring rejected by the engine")
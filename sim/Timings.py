@@ -0,0 +1,96 @@
+'''
+This script times the stages of a GA run, so a slow run shows where the time goes.
+
+Inputs:
+    StageTimings(),       one per run, created by MotorOpt. The problem adds the time of every evaluation call to it
+                          and TimeStages wraps the mating and survival of the algorithm so their calls are timed too
+    timings.add(stage, seconds, n=1), records `seconds` spent in `stage` for `n` designs
+
+Outputs:
+    algorithm.timings,    the StageTimings of the run, read by the progress callback
+    timings.generation(), the figures of the generation since the last call, as a dictionary:
+                          eval_mean_s, eval_p95_s, eval_max_s   evaluation time per design (p95 and max are nan
+                                                                with BatchEval, see below)
+                          eval_s                                evaluation time of the generation
+                          mating_s, survival_s, callback_s      time spent in mating, survival and the callback
+                          checkpoint_s                          time spent writing checkpoints (see sim/Checkpoint.py)
+    timings.summary(),    the totals of the whole run as one line of text
+
+With BatchEval the whole generation is evaluated in one call, so the time per design is the time of the call over
+its number of designs: only the mean is known, the spread (p95, max) comes from the calls of single designs. A stage called from inside another one (e.g. the survival used by the surrogate to rank
+candidates during mating) is counted in the outer stage only.
+'''
+import time
+import numpy as np
+
+
+class StageTimings:
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.totals = dict()
+        self.designs = 0
+        self._generation = []  # (stage, seconds, n) since the last call of generation()
+        self._depth = 0
+
+    def add(self, stage, seconds, n=1):
+        self._generation.append((stage, seconds, n))
+        self.totals[stage] = self.totals.get(stage, 0.0) + seconds
+        if stage == "eval":
+            self.designs += n
+
+    def generation(self):
+        records, self._generation = self._generation, []
+        figures = {f"{stage}_s": sum(seconds for name, seconds, _ in records if name == stage) for stage in ("eval", "mating", "survival", "callback", "checkpoint")}
+        evals = [(seconds, n) for stage, seconds, n in records if stage == "eval"]
+        designs = sum(n for _, n in evals)
+        figures["eval_mean_s"] = figures["eval_s"] / designs if designs else np.nan
+        # a batch call only gives the mean of its designs, the spread needs the time of every design
+        if evals and all(n == 1 for _, n in evals):
+            figures["eval_p95_s"] = float(np.percentile([seconds for seconds, _ in evals], 95))
+            figures["eval_max_s"] = float(max(seconds for seconds, _ in evals))
+        else:
+            figures["eval_p95_s"] = figures["eval_max_s"] = np.nan
+        return figures
+
+    def summary(self):
+        total = time.perf_counter() - self.start
+        stages = ", ".join(f"{stage} {seconds:.2f} s" for stage, seconds in self.totals.items())
+        other = total - sum(self.totals.values())
+        per_design = self.totals.get("eval", 0.0) / self.designs if self.designs else np.nan
+        return f"{total:.2f} s in total: {stages}, other {other:.2f} s ({self.designs} designs, {1000 * per_design:.3f} ms per design)"
+
+
+class TimedStage:
+    # wraps a pymoo operator (mating, survival) and times its `do`, everything else is passed to the operator
+
+    def __init__(self, stage, timings, name):
+        self.stage = stage
+        self.timings = timings
+        self.name = name
+
+    def __getattr__(self, name):
+        if name == "stage":  # not set yet while unpickling
+            raise AttributeError(name)
+        return getattr(self.stage, name)
+
+    def do(self, *args, **kwargs):
+        timings = self.timings
+        timings._depth += 1
+        start = time.perf_counter()
+        try:
+            return self.stage.do(*args, **kwargs)
+        finally:
+            timings._depth -= 1
+            if timings._depth == 0:
+                timings.add(self.name, time.perf_counter() - start)
+
+
+def TimeStages(algorithm, timings):
+    # also used on an algorithm loaded from a checkpoint, its stages are timed by the new StageTimings
+    algorithm.timings = timings
+    for name in ("mating", "survival"):
+        stage = getattr(algorithm, name)
+        if isinstance(stage, TimedStage):
+            stage = stage.stage
+        setattr(algorithm, name, TimedStage(stage, timings, name))
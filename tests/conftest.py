@@ -0,0 +1,37 @@
+import json
+import os
+import sys
+import numpy as np
+import pytest
+
+# the tests import the modules of the repository (sim, utils) like the scripts at its root do
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+STATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "state.json")
+
+
+@pytest.fixture
+def inputs():
+    """Inputs of a small run (tests/data/state.json): parameters, OptimizationConf and material properties."""
+    from utils import input_parser, material_manager
+    with open(STATE) as f:
+        state = json.load(f)
+    params = input_parser.create_pymoo_parameters_from_state(state)
+    conf = input_parser.read_opt_config_from_state(state)
+    conf["Verbose"] = False
+    return params, conf, material_manager.get_material_properties_from_state(state)
+
+
+@pytest.fixture
+def batch(inputs):
+    """Random designs within the bounds and the other arguments of UI_MotorCalcs_MATLAB_Batch: (names, X, args)."""
+    from pymoo.core.variable import Real, Integer, Choice, Binary
+    params, conf, (mag_br, max_b_mag, pres_b_lam) = inputs
+    rng = np.random.default_rng(0)
+    names = [name for name, value in params.items() if isinstance(value, (Real, Integer))]
+    consts = {name: value for name, value in params.items() if not isinstance(value, (Real, Integer, Choice, Binary))}
+    X = np.array([[rng.uniform(*params[name].bounds) for name in names] for _ in range(10)])
+    MinTor_Nm = [float(v) for v in conf["MinTor"].split(",")]
+    SpeedReq_rpm = [float(v) for v in conf["SpeedReq"].split(",")]
+    args = (list(consts.keys()), list(consts.values()), MinTor_Nm, mag_br, max_b_mag, pres_b_lam, SpeedReq_rpm, False, 2)
+    return names, X, args
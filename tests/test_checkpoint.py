@@ -0,0 +1,63 @@
+import pickle
+import pytest
+from pymoo.core.callback import Callback
+from pymoo.core.variable import Real, Integer, Choice, Binary
+from sim.Checkpoint import CheckpointGeneration, CheckpointKey, LoadCheckpoint
+from sim.MotorDesign import NumpyEngine
+from sim.MotorModel import MotorCalcs_Vectorized
+from sim.MotorOptimizer import MotorOpt
+
+
+class Crash(Callback):
+    # stands in for a crash of the GUI at generation `at`
+    def __init__(self, at):
+        super().__init__()
+        self.at = at
+
+    def notify(self, algorithm):
+        if algorithm.n_gen >= self.at:
+            raise KeyboardInterrupt
+
+
+def _run(inputs, path, ngens, resume=False, callback=None):
+    params, conf, materials = inputs
+    conf = dict(conf, ngens=ngens, Checkpoint=path, CheckpointEvery=1, Resume=resume)
+    res = MotorOpt(MotorCalcs_Vectorized, params, *materials, NumpyEngine(), Real, Integer, Choice, Binary, conf, callback_instance=callback)
+    return res, CheckpointKey(params, conf, *materials)
+
+
+@pytest.mark.parametrize("ngens", [4, 7])
+def test_resume_runs_to_the_new_ngens(tmp_path, inputs, ngens):
+    path = str(tmp_path / "run.ckpt")
+    with pytest.raises(KeyboardInterrupt):
+        _run(inputs, path, 4, callback=Crash(at=3))
+    res, key = _run(inputs, path, ngens, resume=True)
+    assert CheckpointGeneration(path, key) is not None
+    uninterrupted, _ = _run(inputs, str(tmp_path / "other.ckpt"), ngens)
+    assert res.algorithm.n_gen == uninterrupted.algorithm.n_gen
+
+
+def test_resume_keeps_the_termination_history(tmp_path, inputs):
+    # the tolerances (ftol, xtol, cvtol) look at the last generations, including those before the crash
+    path = str(tmp_path / "run.ckpt")
+    with pytest.raises(KeyboardInterrupt):
+        _run(inputs, path, 4, callback=Crash(at=3))
+    res, _ = _run(inputs, path, 7, resume=True)
+    uninterrupted, _ = _run(inputs, str(tmp_path / "other.ckpt"), 7)
+    history = lambda algorithm: [len(c.history) for c in algorithm.termination.criteria if hasattr(c, "history")]
+    assert history(res.algorithm) == history(uninterrupted.algorithm) != []
+
+
+def test_generation_is_read_from_the_header(tmp_path, inputs):
+    path = str(tmp_path / "run.ckpt")
+    with pytest.raises(KeyboardInterrupt):
+        _run(inputs, path, 4, callback=Crash(at=3))
+    params, conf, materials = inputs
+    key = CheckpointKey(params, conf, *materials)  # the settings of _run are in RESUMABLE_SETTINGS
+    generation = LoadCheckpoint(path, key).n_iter
+    # the algorithm after the header is not unpickled to read the generation
+    with open(path, "r+b") as f:
+        pickle.load(f)
+        f.truncate(f.tell() + 1)
+    assert CheckpointGeneration(path, key) == generation
+    assert CheckpointGeneration(path, "other inputs") is None
@@ -0,0 +1,61 @@
+import random
+import time
+import numpy as np
+import pytest
+from pymoo.core.problem import StarmapParallelization
+from pymoo.core.variable import Real, Integer, Choice, Binary
+from sim.EnginePool import EnginePool
+from sim.EvalCache import EvalCache
+from sim.MotorDesign import NumpyEngine
+from sim.MotorModel import MotorCalcs_Vectorized
+from sim.MotorOptimizer import MotorOpt
+
+
+class MatlabLikeEngine(NumpyEngine):
+    # resolves every name like matlab.engine.MatlabEngine: unknown names are MATLAB functions that do not exist
+    def __getattr__(self, name):
+        def undefined(*args, **kwargs):
+            raise RuntimeError(f"Undefined function '{name}'")
+        return undefined
+
+
+@pytest.fixture
+def pool():
+    pool = EnginePool(NumpyEngine, 3)
+    yield pool
+    pool.quit()
+
+
+def test_batch_rows_keep_input_order(pool, batch):
+    names, X, args = batch
+    expected = np.asarray(NumpyEngine().UI_MotorCalcs_MATLAB_Batch(names, X, *args, nargout=1), dtype=float)
+    rows = pool.UI_MotorCalcs_MATLAB_Batch(names, X, *args, nargout=1)
+    np.testing.assert_array_equal(rows, expected)
+    rows, motors = pool.UI_MotorCalcs_MATLAB_Batch(names, X, *args, nargout=2)
+    np.testing.assert_array_equal(rows, expected)
+    assert len(motors) == len(X)
+
+
+def test_starmap_keeps_input_order(pool):
+    def slow(i):
+        time.sleep(random.uniform(0, 0.01))  # finish out of order
+        return i
+    assert pool.starmap(slow, [(i,) for i in range(50)]) == list(range(50))
+
+
+@pytest.mark.parametrize("engine", ["pool", "cached pool", "matlab", "cached matlab"])
+def test_elementwise_evaluation(engine, inputs):
+    params, conf, (mag_br, max_b_mag, pres_b_lam) = inputs
+    conf["BatchEval"] = False
+    pool = EnginePool(NumpyEngine, 3) if "pool" in engine else None
+    eng = pool or MatlabLikeEngine()
+    if engine.startswith("cached"):
+        eng = EvalCache(eng)
+    try:
+        res = MotorOpt(MotorCalcs_Vectorized, params, mag_br, max_b_mag, pres_b_lam, eng, Real, Integer, Choice, Binary, conf)
+    finally:
+        if pool:
+            pool.quit()
+    # only a pool spreads the designs over its engines, other engines evaluate them one by one
+    assert isinstance(res.problem.elementwise_runner, StarmapParallelization) == (pool is not None)
+    assert res.algorithm.evaluator.n_eval > 0
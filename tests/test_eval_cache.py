@@ -0,0 +1,43 @@
+import sim.EvalCache
+from sim.EnginePool import EnginePool
+from sim.EvalCache import EvalCache
+from sim.MotorDesign import NumpyEngine
+
+
+class OtherEngine(NumpyEngine):
+    # another backend with the same results, e.g. MATLAB
+    pass
+
+
+def _lookups(batch, path, engine):
+    names, X, args = batch
+    cache = EvalCache(engine, path=path)
+    try:
+        cache.UI_MotorCalcs_MATLAB_Batch(names, X, *args)
+        return cache.stats()
+    finally:
+        cache.close()
+
+
+def test_store_is_reused_by_the_same_backend(tmp_path, batch):
+    path = str(tmp_path / "cache")
+    assert _lookups(batch, path, NumpyEngine())["misses"] == 10
+    assert _lookups(batch, path, NumpyEngine())["hits"] == 10
+
+
+def test_store_is_not_shared_between_backends(tmp_path, batch):
+    path = str(tmp_path / "cache")
+    _lookups(batch, path, NumpyEngine())
+    assert _lookups(batch, path, OtherEngine())["misses"] == 10
+    pool = EnginePool(NumpyEngine, 2)
+    try:
+        assert _lookups(batch, path, pool)["hits"] == 10  # the engines of the pool are NumpyEngines
+    finally:
+        pool.quit()
+
+
+def test_store_of_an_older_model_is_not_used(tmp_path, batch, monkeypatch):
+    path = str(tmp_path / "cache")
+    _lookups(batch, path, NumpyEngine())
+    monkeypatch.setattr(sim.EvalCache, "MODEL_VERSION", sim.EvalCache.MODEL_VERSION + 1)
+    assert _lookups(batch, path, NumpyEngine())["misses"] == 10
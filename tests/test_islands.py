@@ -0,0 +1,51 @@
+import numbers
+from pymoo.core.callback import Callback
+from pymoo.core.variable import Real, Integer, Choice, Binary
+from sim.MotorDesign import NumpyEngine
+from sim.MotorModel import MotorCalcs_Vectorized
+from sim.MotorOptimizer import MotorOpt
+
+
+def _marshallable(value):
+    # the types matlab.engine passes to MATLAB, None and other objects raise a TypeError
+    if isinstance(value, (list, tuple)):
+        return all(_marshallable(v) for v in value)
+    return isinstance(value, (numbers.Number, str))
+
+
+class MatlabTypesEngine(NumpyEngine):
+    # NumpyEngine that rejects constants the MATLAB engine cannot marshal
+    def UI_MotorCalcs_MATLAB_Batch(self, vars_name, vars_matrix, consts_name, consts_value, *args, **kwargs):
+        for name, value in zip(consts_name, consts_value):
+            if not _marshallable(value):
+                raise TypeError(f"unsupported Python data type: {type(value).__name__} ({name})")
+        return super().UI_MotorCalcs_MATLAB_Batch(vars_name, vars_matrix, consts_name, consts_value, *args, **kwargs)
+
+
+class Generations(Callback):
+    def __init__(self):
+        super().__init__()
+        self.n_gen = []
+        self.opt = None
+
+    def notify(self, algorithm):
+        self.n_gen.append(algorithm.n_gen)
+        self.opt = algorithm.opt
+
+
+def _run(inputs, callback=None, **settings):
+    params, conf, materials = inputs
+    conf = dict(conf, ngens=3, **settings)
+    return MotorOpt(MotorCalcs_Vectorized, params, *materials, MatlabTypesEngine(), Real, Integer, Choice, Binary, conf,
+                    callback_instance=callback, engine_factory=MatlabTypesEngine)
+
+
+def test_islands_report_every_generation(inputs, tmp_path):
+    # like a run without islands, the callback gets every generation up to ngens and the final front
+    single = Generations()
+    _run(inputs, single)
+    callback = Generations()
+    res = _run(inputs, callback, Islands=2, MigrationInterval=1, Checkpoint=str(tmp_path / "run.ckpt"))
+    assert callback.n_gen == single.n_gen == [1, 2, 3]
+    assert callback.opt is not None and len(callback.opt) > 0
+    assert res.pop is not None and len(res.pop) > 0
@@ -0,0 +1,50 @@
+import json
+import os
+import numpy as np
+import pytest
+from sim.MotorDesign import ERROR_MESSAGES, PENALTY, NumpyEngine
+
+# output rows and Motor fields of fixed designs (the inputs of tests/data/state.json), see "source" for the model
+# they were recorded from. Record them again when MODEL_VERSION changes
+DESIGNS = os.path.join(os.path.dirname(__file__), "data", "motor_designs.json")
+
+
+@pytest.fixture(scope="module")
+def recorded():
+    with open(DESIGNS) as f:
+        return json.load(f)
+
+
+def _evaluate(recorded, batch, designs):
+    _, _, args = batch
+    X = np.array([design["x"] for design in designs])
+    return NumpyEngine().UI_MotorCalcs_MATLAB_Batch(recorded["names"], X, *args, nargout=2)
+
+
+def test_outputs_and_motor_fields(recorded, batch):
+    designs = [design for design in recorded["designs"] if design["error"] == 0]
+    assert designs
+    outputs, motors = _evaluate(recorded, batch, designs)
+    for design, row, motor in zip(designs, outputs, motors):
+        np.testing.assert_allclose(row, design["outputs"], rtol=1e-9)
+        assert motor["Params"]["ErrorMessage"] == 0
+        for field, value in design["results"].items():
+            np.testing.assert_allclose(motor["Results"][field], value, rtol=1e-9, err_msg=field)
+
+
+def test_geometry_failure_gives_the_penalty_row(recorded, batch):
+    designs = [design for design in recorded["designs"] if design["error"] != 0]
+    assert designs
+    outputs, motors = _evaluate(recorded, batch, designs)
+    for design, row, motor in zip(designs, outputs, motors):
+        assert design["error"] in ERROR_MESSAGES
+        assert motor["Params"]["ErrorMessage"] == design["error"]
+        assert np.all(row == PENALTY) and row.tolist() == design["outputs"]
+        assert np.isnan(motor["Results"]["Weight_kg"])
+
+
+def test_single_design_matches_its_batch_row(recorded, batch):
+    _, _, (consts_name, consts_value, *args) = batch
+    design = recorded["designs"][0]
+    row = NumpyEngine().UI_MotorCalcs_MATLAB_Vectorized(recorded["names"], design["x"], consts_name, consts_value, *args)
+    np.testing.assert_allclose(row[0], design["outputs"], rtol=1e-9)
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from pymoo.core.variable import Real, Integer
+from sim.MotorDesign import PENALTY, NumpyEngine
+from sim.MotorModel import MotorCalcs_Batch, Rejected
+
+
+class CountingEngine(NumpyEngine):
+    # keeps the designs it was asked to evaluate
+    def __init__(self):
+        super().__init__()
+        self.received = []
+
+    def UI_MotorCalcs_MATLAB_Batch(self, vars_name, vars_matrix, *args, **kwargs):
+        self.received.extend(np.asarray(vars_matrix, dtype=float).tolist())
+        return super().UI_MotorCalcs_MATLAB_Batch(vars_name, vars_matrix, *args, **kwargs)
+
+
+@pytest.fixture
+def designs(inputs):
+    # designs within the bounds (like the batch fixture, more of them) and the arguments of MotorCalcs_Batch
+    params, conf, (mag_br, max_b_mag, pres_b_lam) = inputs
+    names = [name for name, value in params.items() if isinstance(value, (Real, Integer))]
+    integer = [isinstance(params[name], Integer) for name in names]
+    rng = np.random.default_rng(1)
+    M = np.array([[rng.uniform(*params[name].bounds) for name in names] for _ in range(200)])
+    M[:, integer] = np.round(M[:, integer])
+    MinTor_Nm = [float(v) for v in conf["MinTor"].split(",")]
+    SpeedReq_rpm = [float(v) for v in conf["SpeedReq"].split(",")]
+    return names, M, conf, (MinTor_Nm, mag_br, max_b_mag, pres_b_lam, SpeedReq_rpm)
+
+
+def _batch(names, M, conf, requirements, eng, PreCheck):
+    MinTor_Nm, mag_br, max_b_mag, pres_b_lam, SpeedReq_rpm = requirements
+    X = [dict(zip(names, row)) for row in M]
+    return MotorCalcs_Batch(X, conf, conf.get("MinEff_"), MinTor_Nm, conf.get("MaxWeight"), conf.get("VDC"), mag_br, max_b_mag, pres_b_lam, SpeedReq_rpm, eng, dict(conf, PreCheck=PreCheck), 2)
+
+
+def test_rejected_designs_get_the_penalty_row(designs):
+    names, M, conf, (MinTor_Nm, mag_br, max_b_mag, pres_b_lam, SpeedReq_rpm) = designs
+    bad = Rejected(names, M, conf, MinTor_Nm, mag_br, max_b_mag, pres_b_lam, SpeedReq_rpm)
+    assert np.any(bad) and not np.all(bad)
+    rows = NumpyEngine().UI_MotorCalcs_MATLAB_Batch(names, M, list(conf.keys()), list(conf.values()), MinTor_Nm, mag_br, max_b_mag, pres_b_lam, SpeedReq_rpm, False, 2)
+    assert np.all(rows[bad] == PENALTY)
+
+
+def test_rejected_designs_never_reach_the_engine(designs):
+    names, M, conf, requirements = designs
+    MinTor_Nm, mag_br, max_b_mag, pres_b_lam, SpeedReq_rpm = requirements
+    bad = Rejected(names, M, conf, MinTor_Nm, mag_br, max_b_mag, pres_b_lam, SpeedReq_rpm)
+    checked, unchecked = CountingEngine(), CountingEngine()
+    F, g, _ = _batch(names, M, conf, requirements, checked, PreCheck=True)
+    F_all, g_all, _ = _batch(names, M, conf, requirements, unchecked, PreCheck=False)
+    assert checked.received == M[~bad].tolist()
+    assert len(unchecked.received) == len(M)
+    # skipping them does not change the objectives and constraints
+    np.testing.assert_array_equal(F, F_all)
+    np.testing.assert_array_equal(g, g_all)
@@ -0,0 +1,48 @@
+import types
+import numpy as np
+import pytest
+from pymoo.core.variable import Real, Integer, Choice, Binary
+from sim.MotorModel import Rejected
+from sim.Repair import GeometryRepair
+
+
+@pytest.fixture
+def setup(inputs):
+    # the repair and the arguments of Rejected as MotorOpt sets them up, and designs within the bounds
+    params, conf, materials = inputs
+    variables = {name: value for name, value in params.items() if isinstance(value, (Real, Integer, Choice, Binary))}
+    MinTor_Nm = [float(v) for v in conf["MinTor"].split(",")]
+    SpeedReq_rpm = [float(v) for v in conf["SpeedReq"].split(",")]
+    requirements = (conf, MinTor_Nm, *materials, SpeedReq_rpm)
+    rng = np.random.default_rng(0)
+    X = np.array([{name: int(rng.integers(var.bounds[0], var.bounds[1] + 1)) if isinstance(var, Integer) else float(rng.uniform(*var.bounds))
+                   for name, var in variables.items()} for _ in range(50)])
+    return GeometryRepair(*requirements), types.SimpleNamespace(vars=variables), requirements, X
+
+
+def _rejected(X, requirements):
+    names = list(X[0].keys())
+    return Rejected(names, np.array([[x[name] for name in names] for x in X], dtype=float), *requirements)
+
+
+def test_repaired_designs_pass_the_geometry_checks(setup):
+    repair, problem, requirements, X = setup
+    bad = _rejected(X, requirements)
+    assert np.any(bad) and not np.all(bad)
+    repaired = repair._do(problem, X)
+    assert not np.any(_rejected(repaired, requirements))
+    for x in repaired:
+        for name, var in problem.vars.items():
+            assert var.bounds[0] <= x[name] <= var.bounds[1], name
+            if isinstance(var, Integer):
+                assert isinstance(x[name], int), name
+
+
+def test_valid_designs_are_unchanged(setup):
+    repair, problem, requirements, X = setup
+    bad = _rejected(X, requirements)
+    repaired = repair._do(problem, X)
+    for x, y in zip(X[~bad], repaired[~bad]):
+        assert x == y
+    valid = X[~bad]
+    assert repair._do(problem, valid) is valid  # nothing to repair
@@ -0,0 +1,21 @@
+import numpy as np
+from sim.Timings import StageTimings
+
+
+def test_batch_generation_has_no_spread():
+    timings = StageTimings()
+    timings.add("eval", 2.0, 10)
+    figures = timings.generation()
+    assert figures["eval_s"] == 2.0 and figures["eval_mean_s"] == 0.2
+    assert np.isnan(figures["eval_p95_s"]) and np.isnan(figures["eval_max_s"])
+
+
+def test_elementwise_generation_spread():
+    timings = StageTimings()
+    for seconds in [0.1] * 9 + [1.0]:
+        timings.add("eval", seconds)
+    timings.add("survival", 0.5)
+    figures = timings.generation()
+    assert np.isclose(figures["eval_mean_s"], 0.19) and figures["eval_max_s"] == 1.0
+    assert 0.1 < figures["eval_p95_s"] < 1.0 and figures["survival_s"] == 0.5
+    assert np.isnan(timings.generation()["eval_mean_s"])  # nothing since the last call
@@ -1,6 +1,7 @@
+import threading
 import traceback
-import pint       # For unit conversion
-from pymoo.core.variable import Real, Integer, Choice, Binary
+import numpy as np
+# pint and pymoo are imported on first use, so the GUI starts without them
 
 # These could also be moved to a central config if they are used by more than just this parser
 UI_TO_PINT_MAP = {
@@ -37,25 +38,114 @@ BASE_NAME_TO_SI_UNIT = {
     'R_FillFactor': '', 'R_GearRatio': '', 'R_FluidSpecificGrav': '', # Dimensionless
 }
 
+VAR_BASE_NAMES = list(BASE_NAME_TO_SI_UNIT.keys()) + ['I_PolePair', 'I_NumElecPhase']
+
+# Tab 2 widgets, read into the optimization config under the same names
+OPT_CONFIG_NAMES = [
+    'npop', 'ngens', 'nprocesses', 'DisMut', 'ProbMut',
+    'SpeedReq', 'MinTor', 'MinEff_', 'MaxWeight', 'VDC',
+    'TorqueOpt', 'Efficinecy_minOpt', 'Efficinecy_maxOpt', 'WeightOpt',
+    'MagWeightOpt', 'VoltageOpt', 'MtrLengthOpt', 'MtrRadiusOpt',
+]
+
+
+def _widget_value(widget):
+    """Value of a widget, as state_manager.save_ui_state stores it (duck typed, so this module needs no Qt)."""
+    if hasattr(widget, 'isChecked'):
+        return widget.isChecked()
+    if hasattr(widget, 'currentText'):
+        return widget.currentText()
+    if hasattr(widget, 'value'):
+        return widget.value()
+    return widget.text()
+
+
+def _state_from_ui(ui, object_names):
+    """{objectName: value} of the given widgets, widgets missing from the UI are left out."""
+    state = {}
+    for object_name in object_names:
+        widget = getattr(ui, object_name, None)
+        if widget is not None:
+            state[object_name] = _widget_value(widget)
+    return state
+
+
+_ureg = None
+_factors = None
+_lock = threading.RLock() # the GUI builds the factors in the background, see MainWindow
+
+
+def get_unit_registry():
+    """The pint UnitRegistry of the process, created on first use (creating one takes a noticeable part of a second)."""
+    global _ureg
+    with _lock:
+        if _ureg is None:
+            import pint
+            _ureg = pint.UnitRegistry()
+        return _ureg
+
+
+def get_conversion_factors():
+    """
+    {(UI unit text, base name): factor} for every UI_TO_PINT_MAP x BASE_NAME_TO_SI_UNIT pair, built once per process.
+    A value in the UI unit times the factor is the value in the unit of BASE_NAME_TO_SI_UNIT (RMS currents are
+    converted to peak currents). Pairs of different dimensions, units pint does not know and dimensionless variables
+    are left out.
+    """
+    global _factors
+    with _lock:
+        if _factors is None:
+            import pint
+            ureg = get_unit_registry()
+            factors = {}
+            for unit_text, pint_unit_str in UI_TO_PINT_MAP.items():
+                try:
+                    ui_unit = ureg(pint_unit_str)
+                except pint.UndefinedUnitError:
+                    continue
+                for base_name, target_si_unit_str in BASE_NAME_TO_SI_UNIT.items():
+                    if not target_si_unit_str:
+                        continue
+                    target_si_unit = ureg(target_si_unit_str)
+                    if ui_unit.dimensionality != target_si_unit.dimensionality:
+                        continue
+                    factor = ui_unit.to(target_si_unit).magnitude / target_si_unit.magnitude
+                    if base_name == 'R_PhaseCurrentAmp' and unit_text == 'Arms':
+                        factor *= 2 ** 0.5  # RMS to peak current (assuming sinusoidal)
+                    factors[unit_text, base_name] = float(factor)
+            _factors = factors
+    return _factors
+
+
 def create_pymoo_parameters_from_ui(main_window_instance):
     """
     Reads Tab 1, CONVERTS UNITS for relevant Real variables to SI,
     creates pymoo variables, and returns params dict.
     """
-    parameters = {}
-    ureg = main_window_instance.ureg # Access pint UnitRegistry from main window
+    names = [base_name + suffix for base_name in VAR_BASE_NAMES for suffix in ('_1', '_2', '_unit')]
+    state = _state_from_ui(main_window_instance.ui, names)
+    return create_pymoo_parameters_from_state(state)
 
-    var_base_names = list(BASE_NAME_TO_SI_UNIT.keys())
-    var_base_names.extend(['I_PolePair', 'I_NumElecPhase'])
 
-    for base_name in var_base_names:
+def create_pymoo_parameters_from_state(state):
+    """
+    Same as create_pymoo_parameters_from_ui, but reads the values from a UI state dict
+    ({objectName: value}, as written by state_manager.save_ui_state), so it can run without Qt.
+    The bounds of all the Real variables are converted to SI in one pass, with the factors of get_conversion_factors.
+    """
+    from pymoo.core.variable import Real, Integer
+    parameters = {}
+    real_names, real_bounds, real_factors = [], [], []
+
+    for base_name in VAR_BASE_NAMES:
         try:
-            widget1 = getattr(main_window_instance.ui, base_name + '_1')
-            widget2 = getattr(main_window_instance.ui, base_name + '_2', None)
-            unit_widget = getattr(main_window_instance.ui, base_name + '_unit', None)
+            if base_name + '_1' not in state:
+                raise ValueError(f"No value for '{base_name}_1'")
+            has_upper = base_name + '_2' in state
+            selected_unit_text = state.get(base_name + '_unit')
 
-            val1 = widget1.value()
-            val2 = widget2.value() if widget2 else val1
+            val1 = state[base_name + '_1']
+            val2 = state[base_name + '_2'] if has_upper else val1
 
             if base_name.startswith('I_'):
                 int_bounds = (int(val1), int(val2))
@@ -66,93 +156,55 @@ def create_pymoo_parameters_from_ui(main_window_instance):
 
             elif base_name.startswith('R_'):
                 target_si_unit_str = BASE_NAME_TO_SI_UNIT.get(base_name)
-                
-                if unit_widget and target_si_unit_str: # Unit conversion needed
-                    selected_unit_text = unit_widget.currentText()
+                factor = 1.0
+
+                if selected_unit_text is not None and target_si_unit_str: # Unit conversion needed
                     pint_ui_unit_str = UI_TO_PINT_MAP.get(selected_unit_text)
-                    
+
                     if not pint_ui_unit_str:
                         raise ValueError(f"Unit '{selected_unit_text}' for '{base_name}' not in UI_TO_PINT_MAP.")
 
-                    ui_unit = ureg(pint_ui_unit_str)
-                    target_si_unit = ureg(target_si_unit_str)
+                    factor = get_conversion_factors().get((selected_unit_text, base_name))
+                    if factor is None:
+                        raise ValueError(f"Unit conversion error for '{base_name}' from '{pint_ui_unit_str}' to '{target_si_unit_str}': no conversion (units of different dimensions or unknown to pint)")
+
+                elif target_si_unit_str: # No unit widget, assume values are already in target SI
+                    print(f"Warning: No unit widget for {base_name}, assuming values [{val1}, {val2}] are in expected SI ({target_si_unit_str}).")
+
+                parameters[base_name] = None # converted below, keeps the order of VAR_BASE_NAMES
+                real_names.append(base_name)
+                real_bounds.append((float(val1), float(val2)))
+                real_factors.append(factor)
 
-                    # Special handling for 'Arms' to 'ampere' conversion if needed
-                    if base_name == 'R_PhaseCurrentAmp' and selected_unit_text == 'Arms':
-                        # Convert RMS current to peak current (assuming sinusoidal)
-                        val1_si = (val1 * ui_unit * (2 ** 0.5)).to(target_si_unit).magnitude
-                        val2_si = (val2 * ui_unit * (2 ** 0.5)).to(target_si_unit).magnitude if widget2 else val1_si
-                    # Special handling for viscosity: UI might be cSt, but calculation needs m^2/s
-                    elif base_name == 'R_FluidKinVisc' and pint_ui_unit_str == 'cSt' and target_si_unit_str == 'meter**2 / second':
-                        # 1 cSt = 1 mm^2/s = 1e-6 m^2/s
-                        val1_si = (val1 * ureg.mm**2 / ureg.second).to(target_si_unit).magnitude
-                        val2_si = (val2 * ureg.mm**2 / ureg.second).to(target_si_unit).magnitude if widget2 else val1_si
-                    elif base_name == 'R_FluidKinVisc' and pint_ui_unit_str == 'cSt' and target_si_unit_str == 'cSt':
-                        # If the target is already cSt, no conversion needed beyond fetching value.
-                        # This branch is for if the optimization problem *itself* expects cSt.
-                        # However, the original code implies conversion to a standard SI m^2/s for most physics.
-                        # Let's assume for now the problem takes cSt directly if target_si_unit_str IS 'cSt'.
-                        val1_si = val1
-                        val2_si = val2 if widget2 else val1
-                    else:
-                        val1_si = (val1 * ui_unit).to(target_si_unit).magnitude
-                        val2_si = (val2 * ui_unit).to(target_si_unit).magnitude if widget2 else val1_si
-                    
-                    float_bounds_si = (float(val1_si), float(val2_si))
-                
-                elif not target_si_unit_str: # Dimensionless or no unit conversion specified
-                    float_bounds_si = (float(val1), float(val2))
-                
-                else: # No unit widget, assume values are already in target SI if target_si_unit is defined
-                      # Or, if target_si_unit is not defined for a R_ variable (should not happen with current map)
-                    print(f"Warning: No unit widget for {base_name}, assuming values [{val1}, {val2}] are in expected SI ({target_si_unit_str or 'dimensionless'}).")
-                    float_bounds_si = (float(val1), float(val2))
-
-                if float_bounds_si[0] > float_bounds_si[1]:
-                    raise ValueError(f"Lower bound ({float_bounds_si[0]}) > Upper bound ({float_bounds_si[1]}) for {base_name} in SI units")
-                parameters[base_name] = Real(bounds=float_bounds_si)
-
-        except AttributeError as e:
-            raise AttributeError(f"UI element not found for '{base_name}'. Check UI file/names. Error: {e}")
         except ValueError as e:
             raise ValueError(f"Input or Unit error for '{base_name}': {e}")
-        except pint.UndefinedUnitError as e:
-            raise pint.UndefinedUnitError(f"Unit error for '{base_name}': {e}")
-        except pint.DimensionalityError as e:
-            # Construct a more informative error message for dimensionality issues
-            source_unit_display = pint_ui_unit_str if 'pint_ui_unit_str' in locals() else "unknown source unit"
-            target_unit_display = target_si_unit_str if 'target_si_unit_str' in locals() else "unknown target unit"
-            raise pint.DimensionalityError(f"Unit conversion error for '{base_name}' from '{source_unit_display}' to '{target_unit_display}': {e}")
         except Exception as e:
             raise ValueError(f"Unexpected error processing UI variable '{base_name}': {e}\n{traceback.format_exc()}")
+
+    bounds_si = np.array(real_bounds, dtype=float).reshape(-1, 2) * np.array(real_factors, dtype=float)[:, None]
+    for base_name, (lower, upper) in zip(real_names, bounds_si):
+        if lower > upper:
+            raise ValueError(f"Input or Unit error for '{base_name}': Lower bound ({lower}) > Upper bound ({upper}) for {base_name} in SI units")
+        parameters[base_name] = Real(bounds=(float(lower), float(upper)))
     return parameters
 
 
 def read_opt_config_from_ui(main_window_instance):
     """Reads Tab 2 configuration."""
+    return read_opt_config_from_state(_state_from_ui(main_window_instance.ui, OPT_CONFIG_NAMES))
+
+
+def read_opt_config_from_state(state):
+    """Reads Tab 2 configuration from a UI state dict (see create_pymoo_parameters_from_state)."""
     conf = {}
-    ui = main_window_instance.ui
     try:
-        conf['npop'] = ui.npop.value()
-        conf['ngens'] = ui.ngens.value()
-        conf['nprocesses'] = ui.nprocesses.value()
-        conf['DisMut'] = ui.DisMut.value()
-        conf['ProbMut'] = ui.ProbMut.value()
-
-        conf['SpeedReq'] = ui.SpeedReq.text() # Consider converting to float/int with units if applicable
-        conf['MinTor'] = ui.MinTor.text()     # Consider converting to float/int with units
-        conf['MinEff_'] = ui.MinEff_.value()
-        conf['MaxWeight'] = ui.MaxWeight.value()
-        conf['VDC'] = ui.VDC.value()
-
-        conf['TorqueOpt'] = ui.TorqueOpt.isChecked()
-        conf['Efficinecy_minOpt'] = ui.Efficinecy_minOpt.isChecked()
-        conf['Efficinecy_maxOpt'] = ui.Efficinecy_maxOpt.isChecked()
-        conf['WeightOpt'] = ui.WeightOpt.isChecked()
-        conf['MagWeightOpt'] = ui.MagWeightOpt.isChecked()
-        conf['VoltageOpt'] = ui.VoltageOpt.isChecked()
-        conf['MtrLengthOpt'] = ui.MtrLengthOpt.isChecked()
-        conf['MtrRadiusOpt'] = ui.MtrRadiusOpt.isChecked()
+        for name in OPT_CONFIG_NAMES:
+            conf[name] = state[name]
+        conf['npop'] = int(conf['npop'])
+        conf['ngens'] = int(conf['ngens'])
+        conf['nprocesses'] = int(conf['nprocesses'])
+        conf['SpeedReq'] = str(conf['SpeedReq']) # Consider converting to float/int with units if applicable
+        conf['MinTor'] = str(conf['MinTor'])     # Consider converting to float/int with units
 
         if not any(v for k, v in conf.items() if k.endswith('Opt')):
             raise ValueError("No optimization objectives selected in Tab 2!")
@@ -165,7 +217,7 @@ def read_opt_config_from_ui(main_window_instance):
         #     raise ValueError("Speed Requirement and Minimum Torque must be valid numbers.")
 
 
-    except AttributeError as e:
+    except KeyError as e:
         raise ValueError(f"Error accessing UI element in Tab 2 (check names): {e}")
     except Exception as e:
         raise ValueError(f"Error reading configuration from Tab 2: {e}")
@@ -174,16 +226,18 @@ def read_opt_config_from_ui(main_window_instance):
 
 def get_other_opt_args(main_window_instance):
     """Gets fixed args: material props, engine, pymoo types."""
+    from pymoo.core.variable import Real, Integer, Choice, Binary
     # Ensure current material properties are fetched/updated from MainWindow instance
     # These properties (MagnetBr_T, etc.) should have been set on main_window_instance
     # by calling the update_..._property functions from material_manager.py
     # before this function is called.
 
-    if not main_window_instance.matlab_engine:
-        raise ValueError("MATLAB Engine not available!")
+    if not main_window_instance.model_engine:
+        raise ValueError("Motor model engine not available!")
 
+    # Evaluations go through the cache, which forwards misses to the engine pool (nprocesses > 1) or the model engine
     return (main_window_instance.MagnetBr_T,
             main_window_instance.MaxBMagnetIron_T,
             main_window_instance.PresentBLaminationBackIron_T,
-            main_window_instance.matlab_engine,
+            main_window_instance.eval_cache,
             Real, Integer, Choice, Binary)
\ No newline at end of file
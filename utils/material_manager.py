@@ -14,6 +14,10 @@ IRON_BR_VALUES = {
 LAMINATION_BR_VALUES = {
     "M19": 1.75, "Hiperco 50": 2.3,
 }
+# Used when the selected material is not in the tables above
+DEFAULT_MAGNET_BR = 1.1
+DEFAULT_IRON_BR = 1.5
+DEFAULT_LAMINATION_BR = 1.75
 
 # Unit mapping for get_unit, could be expanded or moved if it becomes more complex
 UNIT_MAP = {
@@ -41,21 +45,27 @@ UNIT_MAP = {
 def update_magnet_br_property(main_window_instance):
     """Updates MagnetBr_T on the main_window_instance based on UI selection."""
     selected_material = main_window_instance.ui.Magnet_Material.currentText()
-    main_window_instance.MagnetBr_T = MAGNET_BR_VALUES.get(selected_material, 1.1) # Default if needed
+    main_window_instance.MagnetBr_T = MAGNET_BR_VALUES.get(selected_material, DEFAULT_MAGNET_BR)
     # print(f"Updated MagnetBr_T: {main_window_instance.MagnetBr_T}")
 
 def update_max_b_magnet_iron_property(main_window_instance):
     """Updates MaxBMagnetIron_T on the main_window_instance based on UI selection."""
     selected_option = main_window_instance.ui.Iron_Material.currentText()
-    main_window_instance.MaxBMagnetIron_T = IRON_BR_VALUES.get(selected_option, 1.5)
+    main_window_instance.MaxBMagnetIron_T = IRON_BR_VALUES.get(selected_option, DEFAULT_IRON_BR)
     # print(f"Updated MaxBMagnetIron_T: {main_window_instance.MaxBMagnetIron_T}")
 
 def update_present_b_lamination_property(main_window_instance):
     """Updates PresentBLaminationBackIron_T on the main_window_instance based on UI selection."""
     selected_option = main_window_instance.ui.Lamination_Material.currentText()
-    main_window_instance.PresentBLaminationBackIron_T = LAMINATION_BR_VALUES.get(selected_option, 1.75)
+    main_window_instance.PresentBLaminationBackIron_T = LAMINATION_BR_VALUES.get(selected_option, DEFAULT_LAMINATION_BR)
     # print(f"Updated PresentBLaminationBackIron_T: {main_window_instance.PresentBLaminationBackIron_T}")
 
+def get_material_properties_from_state(ui_state):
+    """MagnetBr_T, MaxBMagnetIron_T, PresentBLaminationBackIron_T for the materials selected in a saved UI state."""
+    return (MAGNET_BR_VALUES.get(ui_state.get("Magnet_Material"), DEFAULT_MAGNET_BR),
+            IRON_BR_VALUES.get(ui_state.get("Iron_Material"), DEFAULT_IRON_BR),
+            LAMINATION_BR_VALUES.get(ui_state.get("Lamination_Material"), DEFAULT_LAMINATION_BR))
+
 def get_unit_for_variable(variable_name):
     """Return the unit corresponding to the variable name."""
     return UNIT_MAP.get(variable_name, 'meter') # Default to 'meter' or raise error
\ No newline at end of file